@@ -0,0 +1,663 @@
+"""sessions: monthly range partitions on started_at with a hot/cold split.
+
+Revision ID: core_202
+Revises: core_201
+Create Date: 2026-10-18 00:00:00.000000
+
+Motivation
+----------
+Each butler's ``sessions`` table is append-only and never pruned.  The
+dashboard spend/session read paths (``sessions_summary``, ``sessions_daily``,
+``top_sessions``, ``schedule_costs``) all filter by a ``started_at`` window,
+but against one monolithic heap every range aggregation and every index
+insert pays for the whole history.
+
+What this revision does (in the schema being migrated)
+------------------------------------------------------
+1. ``sessions`` becomes ``PARTITION BY RANGE (started_at)`` with one
+   partition per UTC calendar month, named ``sessions_YYYYMM``.  Rows are
+   copied across in one statement; column set, defaults, CHECK constraints,
+   the non-unique indexes, outbound FKs, grants, and every view selecting from
+   the table (e.g. ``public.v_qa_recent_failures``) are carried over.
+   A ``sessions_default`` DEFAULT partition catches any row whose month
+   partition does not exist yet, so an insert never fails on a missed
+   maintenance run.
+2. The primary key becomes ``(id, started_at)`` — Postgres requires the
+   partition key in every unique constraint.  Inbound FKs onto ``sessions(id)``
+   (``session_process_logs``, both ``corrections`` columns, switchboard's
+   ``routing_verdict_log``) cannot target a partitioned table without the
+   partition key, and the referencing tables do not carry ``started_at``, so
+   each FK is replaced by a pair of triggers that keep its semantics:
+
+   - ``sessions_reference_check(column)`` on the referencing table, named
+     after the dropped constraint, rejects an INSERT/UPDATE whose session
+     does not exist with SQLSTATE 23503 (``foreign_key_violation``), taking
+     ``FOR KEY SHARE`` on the session row as the FK check would;
+   - ``sessions_release_references`` on ``sessions`` runs after a DELETE (or
+     an ``id`` change) and cascades to ``session_process_logs`` / rejects the
+     delete while ``corrections`` or ``routing_verdict_log`` still point at
+     the session, as ``ON DELETE CASCADE`` / ``NO ACTION`` did.
+3. ``ix_sessions_started_at`` is replaced by partition-local indexes: a B-tree
+   on ``started_at`` for hot partitions, swapped for a much smaller BRIN index
+   once a month goes cold (see ``sessions_compact_partitions`` below).  The
+   partial ``ix_sessions_in_flight`` index keeps the startup orphan sweep
+   (``completed_at IS NULL``, no partition key to prune on) to an index probe
+   per partition.
+4. Hot/cold payload split: each partition is created with
+   ``toast_tuple_target = 128``, so the large ``tool_calls`` / ``result``
+   payloads are moved out of line into the partition's TOAST relation instead
+   of widening the heap.  Range aggregations read only the narrow heap tuples;
+   the payloads are fetched only when a query selects those columns
+   (``sessions_get`` and the detail read models).
+
+Partition maintenance functions
+-------------------------------
+Both are ``SECURITY DEFINER`` with a pinned ``search_path`` (the runtime role
+does not own ``sessions``; see core_135 for the precedent):
+
+``sessions_ensure_partition(reference_ts)``
+    Creates the partition for ``reference_ts``'s month AND the next month
+    (proactive), each with its hot B-tree index.  Rows the DEFAULT partition
+    already holds for such a month are moved into it (the default is detached
+    for the move, so no row trigger sees it as a delete + insert).
+    Idempotent and serialised by an advisory lock.  Called by the
+    ``sessions_partition_maintenance`` scheduled job and at daemon startup.
+
+``sessions_compact_partitions(hot_months)``
+    For every partition older than the newest ``hot_months`` months, builds a
+    BRIN index on ``started_at`` and drops the B-tree.  Returns the number of
+    partitions compacted.
+
+Downgrade
+---------
+Copies the rows back into an unpartitioned ``sessions`` with ``PRIMARY KEY
+(id)``, restores ``ix_sessions_started_at``, swaps the reference triggers back
+for the inbound FKs (``NOT VALID``) where their tables exist, and drops the
+functions.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "core_202"
+down_revision = "core_201"
+branch_labels = None
+depends_on = None
+
+# Months kept on B-tree indexes by the initial compaction pass (current + previous).
+_HOT_MONTHS = 2
+
+# Serialises the table swap across concurrent per-schema upgrades: views in
+# ``public`` union every butler schema's sessions table.
+_SWAP_LOCK_KEY = "butlers.core_202.sessions_partitioning"
+
+# Inbound FKs replaced by reference triggers on upgrade and restored
+# (NOT VALID) by downgrade: (table, constraint, column, on delete cascade).
+_INBOUND_FKS = (
+    ("session_process_logs", "session_process_logs_session_id_fkey", "session_id", True),
+    ("corrections", "corrections_target_session_id_fkey", "target_session_id", False),
+    ("corrections", "corrections_correcting_session_id_fkey", "correcting_session_id", False),
+    ("routing_verdict_log", "routing_verdict_log_session_id_fkey", "session_id", False),
+)
+
+_DEFAULT_PARTITION = "sessions_default"
+
+
+def _quote_ident(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _current_schema() -> str:
+    bind = op.get_bind()
+    schema = bind.exec_driver_sql("SELECT current_schema()").scalar_one()
+    assert isinstance(schema, str)
+    return schema
+
+
+def _ensure_partition_function(schema: str) -> str:
+    s = _quote_literal(schema)
+    return f"""
+        CREATE OR REPLACE FUNCTION {_quote_ident(schema)}.sessions_ensure_partition(
+            reference_ts TIMESTAMPTZ DEFAULT now()
+        ) RETURNS TEXT
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = {_quote_ident(schema)}, pg_temp
+        AS $$
+        DECLARE
+            base_month     TIMESTAMP := date_trunc('month', reference_ts AT TIME ZONE 'UTC');
+            month_start    TIMESTAMPTZ;
+            month_end      TIMESTAMPTZ;
+            partition_name TEXT;
+            first_name     TEXT;
+            has_strays     BOOLEAN;
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext({s} || '.sessions_ensure_partition'));
+
+            -- Requested month, then the next month (proactive).
+            FOR i IN 0..1 LOOP
+                month_start    := (base_month + make_interval(months => i)) AT TIME ZONE 'UTC';
+                month_end      := (base_month + make_interval(months => i + 1)) AT TIME ZONE 'UTC';
+                partition_name := 'sessions_' || to_char(base_month + make_interval(months => i),
+                                                         'YYYYMM');
+
+                IF to_regclass(format('%I.%I', {s}, partition_name)) IS NULL THEN
+                    has_strays := false;
+                    IF to_regclass(format('%I.%I', {s}, {_quote_literal(_DEFAULT_PARTITION)}))
+                       IS NOT NULL THEN
+                        EXECUTE format(
+                            'SELECT EXISTS (SELECT 1 FROM %I.%I '
+                            'WHERE started_at >= %L AND started_at < %L)',
+                            {s}, {_quote_literal(_DEFAULT_PARTITION)}, month_start, month_end
+                        ) INTO has_strays;
+                    END IF;
+
+                    IF NOT has_strays THEN
+                        EXECUTE format(
+                            'CREATE TABLE %I.%I PARTITION OF %I.sessions '
+                            'FOR VALUES FROM (%L) TO (%L) '
+                            'WITH (toast_tuple_target = 128)',
+                            {s}, partition_name, {s}, month_start, month_end
+                        );
+                    ELSE
+                        -- The default partition holds rows for this month, which
+                        -- would make the new partition's bound fail.  Move them
+                        -- with the default detached (detaching drops its cloned
+                        -- row triggers, so the rollup and reference triggers do
+                        -- not see the move) and attach both afterwards.
+                        EXECUTE format(
+                            'ALTER TABLE %I.sessions DETACH PARTITION %I.%I',
+                            {s}, {s}, {_quote_literal(_DEFAULT_PARTITION)}
+                        );
+                        EXECUTE format(
+                            'CREATE TABLE %I.%I (LIKE %I.sessions INCLUDING DEFAULTS '
+                            'INCLUDING CONSTRAINTS INCLUDING STORAGE) '
+                            'WITH (toast_tuple_target = 128)',
+                            {s}, partition_name, {s}
+                        );
+                        EXECUTE format(
+                            'INSERT INTO %I.%I SELECT * FROM %I.%I '
+                            'WHERE started_at >= %L AND started_at < %L',
+                            {s}, partition_name, {s}, {_quote_literal(_DEFAULT_PARTITION)},
+                            month_start, month_end
+                        );
+                        EXECUTE format(
+                            'DELETE FROM %I.%I WHERE started_at >= %L AND started_at < %L',
+                            {s}, {_quote_literal(_DEFAULT_PARTITION)}, month_start, month_end
+                        );
+                        EXECUTE format(
+                            'ALTER TABLE %I.sessions ATTACH PARTITION %I.%I '
+                            'FOR VALUES FROM (%L) TO (%L)',
+                            {s}, {s}, partition_name, month_start, month_end
+                        );
+                        EXECUTE format(
+                            'ALTER TABLE %I.sessions ATTACH PARTITION %I.%I DEFAULT',
+                            {s}, {s}, {_quote_literal(_DEFAULT_PARTITION)}
+                        );
+                    END IF;
+                    EXECUTE format(
+                        'CREATE INDEX %I ON %I.%I (started_at DESC)',
+                        partition_name || '_started_at_idx', {s}, partition_name
+                    );
+                END IF;
+
+                first_name := COALESCE(first_name, partition_name);
+            END LOOP;
+
+            RETURN first_name;
+        END;
+        $$
+    """
+
+
+def _compact_partitions_function(schema: str) -> str:
+    s = _quote_literal(schema)
+    return f"""
+        CREATE OR REPLACE FUNCTION {_quote_ident(schema)}.sessions_compact_partitions(
+            hot_months INTEGER DEFAULT {_HOT_MONTHS}
+        ) RETURNS INTEGER
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = {_quote_ident(schema)}, pg_temp
+        AS $$
+        DECLARE
+            -- First month that stays hot; every partition before it is cold.
+            hot_from  DATE := (date_trunc('month', now() AT TIME ZONE 'UTC')
+                               - make_interval(months => GREATEST(hot_months, 1) - 1))::date;
+            part      RECORD;
+            compacted INTEGER := 0;
+        BEGIN
+            FOR part IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = format('%I.sessions', {s})::regclass
+                  AND c.relname ~ '^sessions_[0-9]{{6}}$'
+                  AND to_date(right(c.relname, 6), 'YYYYMM') < hot_from
+                  AND to_regclass(format('%I.%I', {s}, c.relname || '_started_at_idx'))
+                      IS NOT NULL
+                ORDER BY c.relname
+            LOOP
+                EXECUTE format(
+                    'CREATE INDEX IF NOT EXISTS %I ON %I.%I USING brin (started_at)',
+                    part.relname || '_started_at_brin', {s}, part.relname
+                );
+                EXECUTE format('DROP INDEX %I.%I', {s}, part.relname || '_started_at_idx');
+                compacted := compacted + 1;
+            END LOOP;
+
+            RETURN compacted;
+        END;
+        $$
+    """
+
+
+def _swap_sessions_sql(schema: str, *, to_partitioned: bool) -> str:
+    """Return a DO block that rebuilds ``sessions`` in the other layout.
+
+    Non-unique indexes, outbound FKs, grants, and dependent views are captured
+    from the old table as replayable statements, the rows are copied into the
+    new table, the old table is dropped, and the statements are replayed.
+    """
+    s = _quote_literal(schema)
+    if to_partitioned:
+        skip_if = "(SELECT relkind FROM pg_class WHERE oid = old_rel) = 'p'"
+        create_new = f"""
+            EXECUTE format(
+                'CREATE TABLE %I.sessions (LIKE %I.sessions_previous INCLUDING DEFAULTS '
+                'INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS) '
+                'PARTITION BY RANGE (started_at)',
+                {s}, {s}
+            );
+            EXECUTE format('ALTER TABLE %I.sessions OWNER TO %I', {s}, owner_name);
+
+            EXECUTE format(
+                'SELECT date_trunc(''month'', min(started_at) AT TIME ZONE ''UTC''), '
+                '       GREATEST(max(started_at), now()) '
+                'FROM %I.sessions_previous',
+                {s}
+            ) INTO first_month, last_ts;
+            month_cursor := COALESCE(first_month, date_trunc('month', now() AT TIME ZONE 'UTC'));
+            WHILE (month_cursor AT TIME ZONE 'UTC') <= COALESCE(last_ts, now()) LOOP
+                PERFORM sessions_ensure_partition(month_cursor AT TIME ZONE 'UTC');
+                month_cursor := month_cursor + INTERVAL '1 month';
+            END LOOP;
+            PERFORM sessions_ensure_partition(now());
+            EXECUTE format(
+                'CREATE TABLE %I.%I PARTITION OF %I.sessions DEFAULT '
+                'WITH (toast_tuple_target = 128)',
+                {s}, {_quote_literal(_DEFAULT_PARTITION)}, {s}
+            );
+            EXECUTE format(
+                'CREATE INDEX %I ON %I.%I (started_at DESC)',
+                {_quote_literal(_DEFAULT_PARTITION + "_started_at_idx")}, {s},
+                {_quote_literal(_DEFAULT_PARTITION)}
+            );
+        """
+        primary_key = "(id, started_at)"
+        # Replaced by the partition-local hot B-tree / cold BRIN indexes.
+        skip_index = "ix_sessions_started_at"
+        post_swap = ""
+    else:
+        skip_if = "(SELECT relkind FROM pg_class WHERE oid = old_rel) <> 'p'"
+        create_new = f"""
+            EXECUTE format(
+                'CREATE TABLE %I.sessions (LIKE %I.sessions_previous INCLUDING DEFAULTS '
+                'INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS)',
+                {s}, {s}
+            );
+            EXECUTE format('ALTER TABLE %I.sessions OWNER TO %I', {s}, owner_name);
+        """
+        primary_key = "(id)"
+        skip_index = ""
+        post_swap = f"""
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS ix_sessions_started_at '
+                'ON %I.sessions (started_at DESC)',
+                {s}
+            );
+        """
+
+    return f"""
+        DO $$
+        DECLARE
+            old_rel      REGCLASS := to_regclass(format('%I.sessions', {s}));
+            owner_name   TEXT;
+            replay       TEXT[] := ARRAY[]::TEXT[];
+            stmt         TEXT;
+            dep          RECORD;
+            first_month  TIMESTAMP;
+            last_ts      TIMESTAMPTZ;
+            month_cursor TIMESTAMP;
+        BEGIN
+            IF old_rel IS NULL OR {skip_if} THEN
+                RETURN;
+            END IF;
+
+            PERFORM pg_advisory_xact_lock(hashtext({_quote_literal(_SWAP_LOCK_KEY)}));
+
+            SELECT pg_get_userbyid(relowner) INTO owner_name FROM pg_class WHERE oid = old_rel;
+
+            -- 1. Capture everything that must survive the swap, as statements.
+            SELECT replay || COALESCE(array_agg(
+                       replace(pg_get_indexdef(i.indexrelid), ' ON ONLY ', ' ON ')
+                       ORDER BY c.relname), ARRAY[]::TEXT[])
+              INTO replay
+              FROM pg_index i
+              JOIN pg_class c ON c.oid = i.indexrelid
+             WHERE i.indrelid = old_rel
+               AND NOT i.indisunique
+               AND c.relname <> {_quote_literal(skip_index)};
+
+            SELECT replay || COALESCE(array_agg(
+                       format('ALTER TABLE %I.sessions ADD CONSTRAINT %I %s',
+                              {s}, conname, pg_get_constraintdef(oid))
+                       ORDER BY conname), ARRAY[]::TEXT[])
+              INTO replay
+              FROM pg_constraint
+             WHERE conrelid = old_rel AND contype = 'f';
+
+            SELECT replay || COALESCE(array_agg(
+                       format('GRANT %s ON %I.sessions TO %s', a.privilege_type, {s},
+                              CASE WHEN a.grantee = 0 THEN 'PUBLIC'
+                                   ELSE quote_ident(pg_get_userbyid(a.grantee)) END)
+                   ), ARRAY[]::TEXT[])
+              INTO replay
+              FROM pg_class c, aclexplode(c.relacl) a
+             WHERE c.oid = old_rel AND a.grantee <> c.relowner;
+
+            FOR dep IN
+                SELECT DISTINCT v.oid,
+                       format('%I.%I', n.nspname, v.relname) AS fqn,
+                       pg_get_viewdef(v.oid) AS def,
+                       pg_get_userbyid(v.relowner) AS owner
+                  FROM pg_depend d
+                  JOIN pg_rewrite r ON r.oid = d.objid
+                  JOIN pg_class v ON v.oid = r.ev_class
+                  JOIN pg_namespace n ON n.oid = v.relnamespace
+                 WHERE d.classid = 'pg_rewrite'::regclass
+                   AND d.refobjid = old_rel
+                   AND v.oid <> old_rel
+            LOOP
+                replay := replay
+                    || format('CREATE VIEW %s AS %s', dep.fqn, dep.def)
+                    || format('ALTER VIEW %s OWNER TO %I', dep.fqn, dep.owner);
+                SELECT replay || COALESCE(array_agg(
+                           format('GRANT %s ON %s TO %s', a.privilege_type, dep.fqn,
+                                  CASE WHEN a.grantee = 0 THEN 'PUBLIC'
+                                       ELSE quote_ident(pg_get_userbyid(a.grantee)) END)
+                       ), ARRAY[]::TEXT[])
+                  INTO replay
+                  FROM pg_class c, aclexplode(c.relacl) a
+                 WHERE c.oid = dep.oid AND a.grantee <> c.relowner;
+                EXECUTE format('DROP VIEW %s', dep.fqn);
+            END LOOP;
+
+            -- 2. Inbound FKs cannot follow the swap; upgrade() replaces them
+            --    with reference triggers (see module docstring).
+            FOR dep IN
+                SELECT conrelid::regclass AS tbl, conname
+                  FROM pg_constraint
+                 WHERE confrelid = old_rel AND contype = 'f'
+            LOOP
+                EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', dep.tbl, dep.conname);
+            END LOOP;
+
+            -- 3. Build the new table and move the rows.
+            EXECUTE format('ALTER TABLE %I.sessions RENAME TO sessions_previous', {s});
+            {create_new}
+            EXECUTE format(
+                'INSERT INTO %I.sessions SELECT * FROM %I.sessions_previous', {s}, {s}
+            );
+            EXECUTE format('DROP TABLE %I.sessions_previous', {s});
+
+            -- 4. Restore keys, indexes, FKs, grants and views.
+            EXECUTE format(
+                'ALTER TABLE %I.sessions ADD CONSTRAINT sessions_pkey PRIMARY KEY {primary_key}',
+                {s}
+            );
+            FOREACH stmt IN ARRAY replay LOOP
+                EXECUTE stmt;
+            END LOOP;
+            {post_swap}
+        END
+        $$;
+    """
+
+
+def _reference_check_function(schema: str) -> str:
+    """Child-side half of a replaced FK: the referenced session must exist."""
+    return f"""
+        CREATE OR REPLACE FUNCTION {_quote_ident(schema)}.sessions_reference_check()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = {_quote_ident(schema)}, pg_temp
+        AS $$
+        DECLARE
+            column_name TEXT := TG_ARGV[0];
+            ref_id      UUID;
+        BEGIN
+            EXECUTE format('SELECT ($1).%I', column_name) INTO ref_id USING NEW;
+            IF ref_id IS NULL THEN
+                RETURN NEW;
+            END IF;
+
+            PERFORM 1 FROM sessions WHERE id = ref_id FOR KEY SHARE;
+            IF NOT FOUND THEN
+                RAISE EXCEPTION
+                    'insert or update on table "%" violates foreign key constraint "%"',
+                    TG_TABLE_NAME, TG_NAME
+                    USING ERRCODE = 'foreign_key_violation',
+                          DETAIL = format('Key (%s)=(%s) is not present in table "sessions".',
+                                          column_name, ref_id),
+                          SCHEMA = TG_TABLE_SCHEMA,
+                          TABLE = TG_TABLE_NAME,
+                          CONSTRAINT = TG_NAME;
+            END IF;
+            RETURN NEW;
+        END;
+        $$
+    """
+
+
+def _release_references_function(schema: str) -> str:
+    """Parent-side half of the replaced FKs: cascade or reject a session delete."""
+    s = _quote_literal(schema)
+    references = ",\n                    ".join(
+        f"({_quote_literal(table)}, {_quote_literal(constraint)}, "
+        f"{_quote_literal(column)}, {'true' if cascade else 'false'})"
+        for table, constraint, column, cascade in _INBOUND_FKS
+    )
+    return f"""
+        CREATE OR REPLACE FUNCTION {_quote_ident(schema)}.sessions_release_references()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = {_quote_ident(schema)}, pg_temp
+        AS $$
+        DECLARE
+            ref        RECORD;
+            referenced BOOLEAN;
+        BEGIN
+            IF TG_OP = 'UPDATE' AND NEW.id = OLD.id THEN
+                RETURN NULL;
+            END IF;
+            -- A cross-partition UPDATE runs as DELETE + INSERT; the session
+            -- still exists, so nothing references a missing row.
+            IF EXISTS (SELECT 1 FROM sessions WHERE id = OLD.id) THEN
+                RETURN NULL;
+            END IF;
+
+            FOR ref IN
+                SELECT * FROM (VALUES
+                    {references}
+                ) AS r(table_name, constraint_name, column_name, on_delete_cascade)
+            LOOP
+                -- routing_verdict_log only exists in the switchboard schema.
+                CONTINUE WHEN to_regclass(format('%I.%I', {s}, ref.table_name)) IS NULL;
+
+                IF ref.on_delete_cascade THEN
+                    EXECUTE format('DELETE FROM %I.%I WHERE %I = $1',
+                                   {s}, ref.table_name, ref.column_name)
+                        USING OLD.id;
+                ELSE
+                    EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I.%I WHERE %I = $1)',
+                                   {s}, ref.table_name, ref.column_name)
+                        INTO referenced USING OLD.id;
+                    IF referenced THEN
+                        RAISE EXCEPTION USING
+                            MESSAGE = format(
+                                'update or delete on table "sessions" violates foreign key '
+                                'constraint "%s" on table "%s"',
+                                ref.constraint_name, ref.table_name),
+                            ERRCODE = 'foreign_key_violation',
+                            DETAIL = format('Key (id)=(%s) is still referenced from table "%s".',
+                                            OLD.id, ref.table_name),
+                            SCHEMA = {s},
+                            TABLE = 'sessions',
+                            CONSTRAINT = ref.constraint_name;
+                    END IF;
+                END IF;
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$
+    """
+
+
+def _create_reference_trigger_sql(table: str, constraint: str, column: str) -> str:
+    """Return a DO block installing one FK-replacing trigger if *table* has *column*."""
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_attribute
+                WHERE attrelid = to_regclass({_quote_literal(table)})
+                  AND attname = {_quote_literal(column)}
+                  AND NOT attisdropped
+            ) THEN
+                CREATE OR REPLACE TRIGGER {_quote_ident(constraint)}
+                    BEFORE INSERT OR UPDATE OF {_quote_ident(column)} ON {_quote_ident(table)}
+                    FOR EACH ROW
+                    EXECUTE FUNCTION sessions_reference_check({_quote_literal(column)});
+            END IF;
+        END
+        $$;
+    """
+
+
+def _grant_execute_to_runtime_role(signature: str) -> None:
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            target_schema TEXT := current_schema();
+            runtime_role TEXT := 'butler_' || target_schema || '_rw';
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = runtime_role) THEN
+                EXECUTE format(
+                    'GRANT EXECUTE ON FUNCTION %I.{signature} TO %I',
+                    target_schema,
+                    runtime_role
+                );
+            END IF;
+        EXCEPTION
+            WHEN insufficient_privilege THEN NULL;
+            WHEN undefined_object THEN NULL;
+            WHEN undefined_function THEN NULL;
+            WHEN invalid_schema_name THEN NULL;
+        END
+        $$;
+        """
+    )
+
+
+def upgrade() -> None:
+    schema = _current_schema()
+
+    op.execute(_ensure_partition_function(schema))
+    op.execute(_compact_partitions_function(schema))
+    _grant_execute_to_runtime_role("sessions_ensure_partition(timestamptz)")
+    _grant_execute_to_runtime_role("sessions_compact_partitions(integer)")
+
+    op.execute(_swap_sessions_sql(schema, to_partitioned=True))
+
+    # Referential integrity for the dropped inbound FKs (module docstring, 2.).
+    op.execute(_reference_check_function(schema))
+    op.execute(_release_references_function(schema))
+    op.execute(
+        """
+        CREATE OR REPLACE TRIGGER sessions_release_references
+            AFTER DELETE OR UPDATE OF id ON sessions
+            FOR EACH ROW EXECUTE FUNCTION sessions_release_references()
+        """
+    )
+    for table, constraint, column, _cascade in _INBOUND_FKS:
+        op.execute(_create_reference_trigger_sql(table, constraint, column))
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_sessions_in_flight ON sessions (started_at) "
+        "WHERE completed_at IS NULL"
+    )
+
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF (SELECT relkind FROM pg_class
+                WHERE oid = to_regclass({_quote_literal(schema + ".sessions")})) = 'p' THEN
+                PERFORM sessions_compact_partitions({_HOT_MONTHS});
+            END IF;
+        END
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    schema = _current_schema()
+
+    op.execute("DROP INDEX IF EXISTS ix_sessions_in_flight")
+    op.execute(_swap_sessions_sql(schema, to_partitioned=False))
+
+    for table, constraint, column, cascade in _INBOUND_FKS:
+        on_delete = " ON DELETE CASCADE" if cascade else ""
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass({_quote_literal(table)}) IS NOT NULL THEN
+                    DROP TRIGGER IF EXISTS {_quote_ident(constraint)} ON {_quote_ident(table)};
+                END IF;
+                IF EXISTS (
+                       SELECT 1 FROM pg_attribute
+                       WHERE attrelid = to_regclass({_quote_literal(table)})
+                         AND attname = {_quote_literal(column)}
+                         AND NOT attisdropped
+                   )
+                   AND NOT EXISTS (
+                       SELECT 1 FROM pg_constraint
+                       WHERE conrelid = to_regclass({_quote_literal(table)})
+                         AND conname = {_quote_literal(constraint)}
+                   ) THEN
+                    ALTER TABLE {_quote_ident(table)}
+                        ADD CONSTRAINT {_quote_ident(constraint)}
+                        FOREIGN KEY ({_quote_ident(column)}) REFERENCES sessions(id){on_delete}
+                        NOT VALID;
+                END IF;
+            END
+            $$;
+            """
+        )
+
+    op.execute("DROP FUNCTION IF EXISTS sessions_release_references()")
+    op.execute("DROP FUNCTION IF EXISTS sessions_reference_check()")
+    op.execute("DROP FUNCTION IF EXISTS sessions_compact_partitions(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS sessions_ensure_partition(TIMESTAMPTZ)")
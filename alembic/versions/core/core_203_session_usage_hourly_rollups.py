@@ -0,0 +1,361 @@
+"""session_usage_hourly_rollups: pre-aggregated hourly usage for spend/sessions dashboards.
+
+Revision ID: core_203
+Revises: core_202
+Create Date: 2026-10-18 00:00:00.000000
+
+``sessions_summary`` / ``sessions_daily`` / ``schedule_costs`` and the Spend
+router's ledger queries re-aggregated raw ``sessions`` and
+``public.token_usage_ledger`` rows on every dashboard request, fanned out
+across every butler pool.  This migration adds two incrementally maintained
+hourly rollups the readers aggregate instead:
+
+``<schema>.session_usage_hourly``
+    One row per ``(bucket_start, trigger_source, model)`` in each butler
+    schema -- the schema itself is the butler key, exactly like ``sessions``.
+    ``schedule_name`` is a stored generated column (``schedule:<name>``
+    trigger sources) so ``schedule_costs`` joins ``scheduled_tasks`` on an
+    index instead of string-building per row.  A NULL ``sessions.model`` is
+    folded into ``''``.
+
+``public.token_usage_hourly``
+    One row per ``(bucket_start, butler_name, purpose, catalog_entry_id)``
+    over the shared ledger.  A NULL ``purpose`` is folded into ``'unknown'``,
+    the label every ledger reader already coalesces it to.
+
+Both are maintained by AFTER row triggers that apply the delta between OLD
+and NEW in the writing transaction (INSERT adds, DELETE -- including
+``ON DELETE CASCADE`` from ``model_catalog`` -- subtracts, UPDATE does both),
+so a rollup is never stale and equals the raw aggregation at every commit
+without a catch-up job or watermark.  The sessions UPDATE trigger is limited
+to the aggregated columns, so ``session_complete`` pays one upsert and the
+healing-fingerprint update pays nothing.  TRUNCATE of a source clears its
+rollup.  ``bucket_start`` is ``date_trunc('hour', ts, 'UTC')``, so every
+day- or month-aligned UTC range maps onto whole buckets.
+
+Ledger partitions dropped by pg_partman retention do not fire row triggers:
+``token_usage_hourly`` deliberately keeps spend history beyond the ledger's
+90-day raw retention.
+
+The trigger functions are SECURITY DEFINER with a pinned ``search_path`` so
+every writer of the source tables (spawner, discretion dispatcher, QA) can
+maintain the rollup without holding DML on it.  The per-schema rollup is
+rebuilt from the raw rows under a SHARE lock on every upgrade; the shared
+``token_usage_hourly`` is backfilled only by the first schema run, the one
+that installs its triggers.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "core_203"
+down_revision = "core_202"
+branch_labels = None
+depends_on = None
+
+# The public rollup is created by whichever butler schema's chain run gets
+# there first; the others must wait and then see it.
+_PUBLIC_LOCK_KEY = "butlers.core_203.token_usage_hourly"
+
+_READ_ROLES = (
+    "butler_chronicler_rw",
+    "butler_education_rw",
+    "butler_finance_rw",
+    "butler_general_rw",
+    "butler_health_rw",
+    "butler_home_rw",
+    "butler_lifestyle_rw",
+    "butler_messenger_rw",
+    "butler_qa_rw",
+    "butler_relationship_rw",
+    "butler_switchboard_rw",
+    "butler_travel_rw",
+)
+
+_SESSION_TOKEN_COLUMNS = (
+    "input_tokens",
+    "output_tokens",
+    "cached_input_tokens",
+    "cache_creation_tokens",
+)
+
+
+def _quote_ident(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _current_schema() -> str:
+    return op.get_bind().exec_driver_sql("SELECT current_schema()").scalar_one()
+
+
+def _grant_select_best_effort(table_fqn: str, role: str) -> None:
+    """GRANT SELECT ON table TO role; tolerates missing role/table."""
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{table_fqn}') IS NOT NULL
+               AND EXISTS (SELECT 1 FROM pg_roles WHERE rolname = '{role}')
+            THEN
+                EXECUTE 'GRANT SELECT ON TABLE {table_fqn} TO "{role}"';
+            END IF;
+        EXCEPTION
+            WHEN insufficient_privilege THEN NULL;
+            WHEN undefined_object THEN NULL;
+            WHEN undefined_table THEN NULL;
+            WHEN invalid_schema_name THEN NULL;
+        END
+        $$;
+        """
+    )
+
+
+def _upsert_delta(table: str, keys: dict[str, str], counter: str, sign: str, row: str) -> str:
+    """Return an upsert that adds ``sign`` × the row's contribution to its bucket."""
+    key_cols = ", ".join(keys)
+    key_vals = ", ".join(expr.format(row=row) for expr in keys.values())
+    value_cols = ", ".join(_SESSION_TOKEN_COLUMNS)
+    value_vals = ", ".join(f"{sign}COALESCE({row}.{col}, 0)" for col in _SESSION_TOKEN_COLUMNS)
+    updates = ",\n                    ".join(
+        f"{col} = h.{col} + EXCLUDED.{col}" for col in (counter, *_SESSION_TOKEN_COLUMNS)
+    )
+    return f"""
+                INSERT INTO {table} AS h ({key_cols}, {counter}, {value_cols})
+                VALUES ({key_vals}, {sign}1, {value_vals})
+                ON CONFLICT ({key_cols}) DO UPDATE SET
+                    {updates};"""
+
+
+_SESSION_KEYS = {
+    "bucket_start": "date_trunc('hour', {row}.started_at, 'UTC')",
+    "trigger_source": "{row}.trigger_source",
+    "model": "COALESCE({row}.model, '')",
+}
+
+_LEDGER_KEYS = {
+    "bucket_start": "date_trunc('hour', {row}.recorded_at, 'UTC')",
+    "butler_name": "{row}.butler_name",
+    "purpose": "COALESCE({row}.purpose, 'unknown')",
+    "catalog_entry_id": "{row}.catalog_entry_id",
+}
+
+
+def _apply_function_sql(
+    function_fqn: str, search_path: str, table: str, keys: dict[str, str], counter: str
+) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION {function_fqn}()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = {search_path}, pg_temp
+        AS $fn$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN{_upsert_delta(table, keys, counter, "-", "OLD")}
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN{_upsert_delta(table, keys, counter, "", "NEW")}
+            END IF;
+            RETURN NULL;
+        END
+        $fn$;
+    """
+
+
+def _truncate_function_sql(function_fqn: str, search_path: str, table: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION {function_fqn}()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = {search_path}, pg_temp
+        AS $fn$
+        BEGIN
+            DELETE FROM {table};
+            RETURN NULL;
+        END
+        $fn$;
+    """
+
+
+def _create_triggers(source: str, prefix: str, apply_fn: str, truncate_fn: str, cols: str) -> None:
+    changed = " OR ".join(f"OLD.{c} IS DISTINCT FROM NEW.{c}" for c in cols.split(", "))
+    for suffix in ("ins_del", "upd", "truncate"):
+        op.execute(f"DROP TRIGGER IF EXISTS {prefix}_{suffix} ON {source}")
+    op.execute(f"""
+        CREATE TRIGGER {prefix}_ins_del
+            AFTER INSERT OR DELETE ON {source}
+            FOR EACH ROW EXECUTE FUNCTION {apply_fn}()
+    """)
+    op.execute(f"""
+        CREATE TRIGGER {prefix}_upd
+            AFTER UPDATE OF {cols} ON {source}
+            FOR EACH ROW WHEN ({changed})
+            EXECUTE FUNCTION {apply_fn}()
+    """)
+    op.execute(f"""
+        CREATE TRIGGER {prefix}_truncate
+            AFTER TRUNCATE ON {source}
+            FOR EACH STATEMENT EXECUTE FUNCTION {truncate_fn}()
+    """)
+
+
+def _upgrade_session_rollup(schema: str) -> None:
+    s = _quote_ident(schema)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS session_usage_hourly (
+            bucket_start          TIMESTAMPTZ NOT NULL,
+            trigger_source        TEXT NOT NULL,
+            model                 TEXT NOT NULL DEFAULT '',
+            schedule_name         TEXT GENERATED ALWAYS AS (
+                CASE WHEN trigger_source LIKE 'schedule:%' THEN substr(trigger_source, 10) END
+            ) STORED,
+            sessions              BIGINT NOT NULL DEFAULT 0,
+            input_tokens          BIGINT NOT NULL DEFAULT 0,
+            output_tokens         BIGINT NOT NULL DEFAULT 0,
+            cached_input_tokens   BIGINT NOT NULL DEFAULT 0,
+            cache_creation_tokens BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_start, trigger_source, model)
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_session_usage_hourly_schedule
+            ON session_usage_hourly (schedule_name, bucket_start)
+            WHERE schedule_name IS NOT NULL
+    """)
+    op.execute(
+        _apply_function_sql(
+            f"{s}.session_usage_hourly_apply",
+            s,
+            f"{s}.session_usage_hourly",
+            _SESSION_KEYS,
+            "sessions",
+        )
+    )
+    op.execute(
+        _truncate_function_sql(f"{s}.session_usage_hourly_reset", s, f"{s}.session_usage_hourly")
+    )
+    op.execute(f"""
+        LOCK TABLE {s}.sessions IN SHARE MODE;
+        DELETE FROM {s}.session_usage_hourly;
+        INSERT INTO {s}.session_usage_hourly
+            (bucket_start, trigger_source, model, sessions,
+             input_tokens, output_tokens, cached_input_tokens, cache_creation_tokens)
+        SELECT
+            date_trunc('hour', started_at, 'UTC'),
+            trigger_source,
+            COALESCE(model, ''),
+            COUNT(*),
+            COALESCE(SUM(input_tokens), 0),
+            COALESCE(SUM(output_tokens), 0),
+            COALESCE(SUM(cached_input_tokens), 0),
+            COALESCE(SUM(cache_creation_tokens), 0)
+        FROM {s}.sessions
+        GROUP BY 1, 2, 3
+    """)
+    _create_triggers(
+        f"{s}.sessions",
+        "trg_session_usage_hourly",
+        f"{s}.session_usage_hourly_apply",
+        f"{s}.session_usage_hourly_reset",
+        "started_at, trigger_source, model, " + ", ".join(_SESSION_TOKEN_COLUMNS),
+    )
+    _grant_select_best_effort(f"{schema}.session_usage_hourly", f"butler_{schema}_rw")
+
+
+def _upgrade_ledger_rollup() -> None:
+    op.execute(f"SELECT pg_advisory_xact_lock(hashtext('{_PUBLIC_LOCK_KEY}'))")
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS public.token_usage_hourly (
+            bucket_start          TIMESTAMPTZ NOT NULL,
+            butler_name           TEXT NOT NULL,
+            purpose               TEXT NOT NULL DEFAULT 'unknown',
+            catalog_entry_id      UUID NOT NULL,
+            calls                 BIGINT NOT NULL DEFAULT 0,
+            input_tokens          BIGINT NOT NULL DEFAULT 0,
+            output_tokens         BIGINT NOT NULL DEFAULT 0,
+            cached_input_tokens   BIGINT NOT NULL DEFAULT 0,
+            cache_creation_tokens BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_start, butler_name, purpose, catalog_entry_id)
+        )
+    """)
+    op.execute(
+        _apply_function_sql(
+            "public.token_usage_hourly_apply",
+            "public",
+            "public.token_usage_hourly",
+            _LEDGER_KEYS,
+            "calls",
+        )
+    )
+    op.execute(
+        _truncate_function_sql(
+            "public.token_usage_hourly_reset", "public", "public.token_usage_hourly"
+        )
+    )
+    for role in _READ_ROLES:
+        _grant_select_best_effort("public.token_usage_hourly", role)
+
+    # Every butler schema's chain run reaches this point; only the first one
+    # (under the advisory lock) backfills and installs the triggers.
+    already_installed = (
+        op.get_bind()
+        .exec_driver_sql(
+            "SELECT EXISTS (SELECT 1 FROM pg_trigger "
+            "WHERE tgname = 'trg_token_usage_hourly_ins_del' "
+            "AND tgrelid = 'public.token_usage_ledger'::regclass)"
+        )
+        .scalar_one()
+    )
+    if already_installed:
+        return
+    op.execute("""
+        LOCK TABLE public.token_usage_ledger IN SHARE MODE;
+        DELETE FROM public.token_usage_hourly;
+        INSERT INTO public.token_usage_hourly
+            (bucket_start, butler_name, purpose, catalog_entry_id, calls,
+             input_tokens, output_tokens, cached_input_tokens, cache_creation_tokens)
+        SELECT
+            date_trunc('hour', recorded_at, 'UTC'),
+            butler_name,
+            COALESCE(purpose, 'unknown'),
+            catalog_entry_id,
+            COUNT(*),
+            COALESCE(SUM(input_tokens), 0),
+            COALESCE(SUM(output_tokens), 0),
+            COALESCE(SUM(cached_input_tokens), 0),
+            COALESCE(SUM(cache_creation_tokens), 0)
+        FROM public.token_usage_ledger
+        GROUP BY 1, 2, 3, 4
+    """)
+    _create_triggers(
+        "public.token_usage_ledger",
+        "trg_token_usage_hourly",
+        "public.token_usage_hourly_apply",
+        "public.token_usage_hourly_reset",
+        "recorded_at, butler_name, purpose, catalog_entry_id, " + ", ".join(_SESSION_TOKEN_COLUMNS),
+    )
+
+
+def upgrade() -> None:
+    _upgrade_session_rollup(_current_schema())
+    _upgrade_ledger_rollup()
+
+
+def downgrade() -> None:
+    s = _quote_ident(_current_schema())
+    for suffix in ("ins_del", "upd", "truncate"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_session_usage_hourly_{suffix} ON {s}.sessions")
+    op.execute(f"DROP FUNCTION IF EXISTS {s}.session_usage_hourly_apply()")
+    op.execute(f"DROP FUNCTION IF EXISTS {s}.session_usage_hourly_reset()")
+    op.execute(f"DROP TABLE IF EXISTS {s}.session_usage_hourly")
+
+    op.execute(f"SELECT pg_advisory_xact_lock(hashtext('{_PUBLIC_LOCK_KEY}'))")
+    for suffix in ("ins_del", "upd", "truncate"):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_token_usage_hourly_{suffix} ON public.token_usage_ledger"
+        )
+    op.execute("DROP FUNCTION IF EXISTS public.token_usage_hourly_apply()")
+    op.execute("DROP FUNCTION IF EXISTS public.token_usage_hourly_reset()")
+    op.execute("DROP TABLE IF EXISTS public.token_usage_hourly")
@@ -0,0 +1,65 @@
+"""core_204 — NOTIFY identity-cache invalidations when entity roles or names change.
+
+Revision ID: core_204
+Revises: core_203
+Create Date: 2026-10-18 00:00:00.000000
+
+``butlers.identity_cache`` keeps a process-local cache of channel → entity
+resolutions (``resolve_contact_by_channel``).  A cached hit carries the
+entity's ``canonical_name`` and ``roles``, so any change to either — or the
+entity's deletion — must reach every process holding the entry.
+
+This migration installs ``public.entities_notify_identity()`` and an AFTER
+UPDATE OF roles, canonical_name OR DELETE row trigger on ``public.entities``
+that sends ``pg_notify('butlers_identity_changed', {"entity_ids": [id]})``.
+The sibling relationship migration ``rel_034`` covers the channel facts in
+``relationship.entity_facts``; the two form one logical change split by chain
+ownership.
+
+``public.entities`` is shared, so every butler schema's chain run reaches this
+migration: the function and trigger are replaced under an advisory lock,
+which keeps concurrent and repeated runs idempotent.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "core_204"
+down_revision = "core_203"
+branch_labels = None
+depends_on = None
+
+_PUBLIC_LOCK_KEY = "butlers.core_204.entities_identity_notify"
+_CHANNEL = "butlers_identity_changed"
+
+
+def upgrade() -> None:
+    op.execute(f"SELECT pg_advisory_xact_lock(hashtext('{_PUBLIC_LOCK_KEY}'))")
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION public.entities_notify_identity()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM pg_notify(
+                '{_CHANNEL}',
+                json_build_object('entity_ids', json_build_array(OLD.id))::text
+            );
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE TRIGGER trg_entities_identity_notify
+        AFTER UPDATE OF roles, canonical_name OR DELETE ON public.entities
+        FOR EACH ROW
+        EXECUTE FUNCTION public.entities_notify_identity()
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"SELECT pg_advisory_xact_lock(hashtext('{_PUBLIC_LOCK_KEY}'))")
+    op.execute("DROP TRIGGER IF EXISTS trg_entities_identity_notify ON public.entities")
+    op.execute("DROP FUNCTION IF EXISTS public.entities_notify_identity()")
@@ -0,0 +1,240 @@
+"""home_assistant_history: monthly range partitions and a 5-minute rollup table.
+
+Revision ID: core_205
+Revises: core_204
+Create Date: 2026-10-19 00:00:00.000000
+
+Motivation
+----------
+``connectors.home_assistant_history`` (core_084) is a single unpartitioned
+heap that is never pruned.  The connector now writes it in ``COPY`` batches
+(``butlers.connectors.home_assistant_history.HAHistoryWriter``), and old
+numeric samples can be rolled up, so the table is split by time.
+
+What this revision does
+-----------------------
+1. ``connectors.home_assistant_history`` becomes ``PARTITION BY RANGE
+   (recorded_at)`` with one partition per UTC calendar month, named
+   ``home_assistant_history_YYYYMM``.  Rows are copied across in one
+   statement; the column set, defaults, both indexes and the grants are
+   recreated.  The primary key becomes ``(id, recorded_at)`` — Postgres
+   requires the partition key in every unique constraint.  Nothing references
+   ``home_assistant_history(id)``, and Chronicler's watermark is
+   ``recorded_at``, so no reader changes.
+2. ``connectors.home_assistant_history_ensure_partition(reference_ts)`` creates
+   the month partition for ``reference_ts`` and the next month (proactive).
+   ``SECURITY DEFINER`` with a pinned ``search_path`` because
+   ``connector_writer`` does not own the table (see core_135).
+3. ``connectors.home_assistant_history_5m`` holds per-entity 5-minute
+   min/max/mean buckets of numeric states that the optional downsampling job
+   moved out of the raw table.
+
+Core migrations run once per butler schema; every step is idempotent and the
+table swap is serialised by an advisory lock and skipped once the table is
+already partitioned.
+
+Downgrade
+---------
+Copies the rows back into an unpartitioned table with ``PRIMARY KEY (id)``
+and drops the function and the rollup table (rolled-up buckets are lost).
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "core_205"
+down_revision = "core_204"
+branch_labels = None
+depends_on = None
+
+_CONNECTOR_ROLE = "connector_writer"
+_CHRONICLER_ROLE = "butler_chronicler_rw"
+_TABLE = "connectors.home_assistant_history"
+_ROLLUP_TABLE = "connectors.home_assistant_history_5m"
+
+_SWAP_LOCK_KEY = "butlers.core_205.home_assistant_history_partitioning"
+
+_COLUMNS = """
+    id              UUID NOT NULL DEFAULT gen_random_uuid(),
+    entity_id       TEXT NOT NULL,
+    state           TEXT,
+    attributes      JSONB,
+    recorded_at     TIMESTAMPTZ NOT NULL
+"""
+
+_INDEXES = (
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_home_assistant_history_entity_recorded_at
+        ON {_TABLE} (entity_id, recorded_at DESC)
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_home_assistant_history_recorded_at_id
+        ON {_TABLE} (recorded_at ASC, id ASC)
+    """,
+)
+
+_ENSURE_PARTITION_FUNCTION = """
+    CREATE OR REPLACE FUNCTION connectors.home_assistant_history_ensure_partition(
+        reference_ts TIMESTAMPTZ DEFAULT now()
+    ) RETURNS TEXT
+    LANGUAGE plpgsql
+    SECURITY DEFINER
+    SET search_path = connectors, pg_temp
+    AS $$
+    DECLARE
+        base_month     TIMESTAMP := date_trunc('month', reference_ts AT TIME ZONE 'UTC');
+        month_start    TIMESTAMPTZ;
+        month_end      TIMESTAMPTZ;
+        partition_name TEXT;
+        first_name     TEXT;
+    BEGIN
+        -- Requested month, then the next month (proactive).
+        FOR i IN 0..1 LOOP
+            month_start    := (base_month + make_interval(months => i)) AT TIME ZONE 'UTC';
+            month_end      := (base_month + make_interval(months => i + 1)) AT TIME ZONE 'UTC';
+            partition_name := 'home_assistant_history_'
+                              || to_char(base_month + make_interval(months => i), 'YYYYMM');
+
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS connectors.%I '
+                'PARTITION OF connectors.home_assistant_history '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, month_end
+            );
+
+            first_name := COALESCE(first_name, partition_name);
+        END LOOP;
+
+        RETURN first_name;
+    END;
+    $$
+"""
+
+
+def _quote_ident(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _swap_sql(*, to_partitioned: bool) -> str:
+    """Return a DO block that rebuilds the history table in the other layout."""
+    if to_partitioned:
+        skip_if = "relkind = 'p'"
+        create_new = f"""
+            CREATE TABLE {_TABLE} ({_COLUMNS}) PARTITION BY RANGE (recorded_at);
+
+            SELECT date_trunc('month', min(recorded_at) AT TIME ZONE 'UTC'),
+                   GREATEST(max(recorded_at), now())
+              INTO first_month, last_ts
+              FROM connectors.home_assistant_history_previous;
+            month_cursor := COALESCE(first_month, date_trunc('month', now() AT TIME ZONE 'UTC'));
+            WHILE (month_cursor AT TIME ZONE 'UTC') <= last_ts LOOP
+                PERFORM connectors.home_assistant_history_ensure_partition(
+                    month_cursor AT TIME ZONE 'UTC'
+                );
+                month_cursor := month_cursor + INTERVAL '1 month';
+            END LOOP;
+        """
+        primary_key = "(id, recorded_at)"
+    else:
+        skip_if = "relkind <> 'p'"
+        create_new = f"CREATE TABLE {_TABLE} ({_COLUMNS});"
+        primary_key = "(id)"
+
+    return f"""
+        DO $$
+        DECLARE
+            old_rel      REGCLASS;
+            first_month  TIMESTAMP;
+            last_ts      TIMESTAMPTZ;
+            month_cursor TIMESTAMP;
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext({_quote_literal(_SWAP_LOCK_KEY)}));
+
+            old_rel := to_regclass('{_TABLE}');
+            IF old_rel IS NULL OR (SELECT {skip_if} FROM pg_class WHERE oid = old_rel) THEN
+                RETURN;
+            END IF;
+
+            ALTER TABLE {_TABLE} RENAME TO home_assistant_history_previous;
+            ALTER TABLE connectors.home_assistant_history_previous
+                RENAME CONSTRAINT home_assistant_history_pkey
+                TO home_assistant_history_previous_pkey;
+            DROP INDEX IF EXISTS connectors.ix_home_assistant_history_entity_recorded_at;
+            DROP INDEX IF EXISTS connectors.ix_home_assistant_history_recorded_at_id;
+
+            {create_new}
+
+            INSERT INTO {_TABLE} (id, entity_id, state, attributes, recorded_at)
+            SELECT id, entity_id, state, attributes, recorded_at
+              FROM connectors.home_assistant_history_previous;
+            DROP TABLE connectors.home_assistant_history_previous CASCADE;
+
+            ALTER TABLE {_TABLE}
+                ADD CONSTRAINT home_assistant_history_pkey PRIMARY KEY {primary_key};
+        END
+        $$;
+    """
+
+
+def _execute_best_effort(statement: str, *, role_name: str) -> None:
+    """Execute a GRANT only when the role exists (non-prod DBs may lack it)."""
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = {_quote_literal(role_name)}) THEN
+                {statement};
+            END IF;
+        END;
+        $$
+        """
+    )
+
+
+def _grant_table(table: str) -> None:
+    _execute_best_effort(
+        f"GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE {table} TO {_quote_ident(_CONNECTOR_ROLE)}",
+        role_name=_CONNECTOR_ROLE,
+    )
+    _execute_best_effort(
+        f"GRANT SELECT ON TABLE {table} TO {_quote_ident(_CHRONICLER_ROLE)}",
+        role_name=_CHRONICLER_ROLE,
+    )
+
+
+def upgrade() -> None:
+    op.execute(_ENSURE_PARTITION_FUNCTION)
+    op.execute(_swap_sql(to_partitioned=True))
+    for statement in _INDEXES:
+        op.execute(statement)
+    _grant_table(_TABLE)
+
+    op.execute(f"""
+        CREATE TABLE IF NOT EXISTS {_ROLLUP_TABLE} (
+            entity_id       TEXT NOT NULL,
+            bucket_start    TIMESTAMPTZ NOT NULL,
+            min_value       DOUBLE PRECISION NOT NULL,
+            max_value       DOUBLE PRECISION NOT NULL,
+            mean_value      DOUBLE PRECISION NOT NULL,
+            sample_count    INTEGER NOT NULL,
+            PRIMARY KEY (entity_id, bucket_start)
+        )
+    """)
+    _grant_table(_ROLLUP_TABLE)
+
+
+def downgrade() -> None:
+    op.execute(f"DROP TABLE IF EXISTS {_ROLLUP_TABLE}")
+    op.execute(_swap_sql(to_partitioned=False))
+    for statement in _INDEXES:
+        op.execute(statement)
+    _grant_table(_TABLE)
+    op.execute(
+        "DROP FUNCTION IF EXISTS connectors.home_assistant_history_ensure_partition(TIMESTAMPTZ)"
+    )
@@ -0,0 +1,377 @@
+"""search_documents: shared full-text + trigram index behind the dashboard search.
+
+Revision ID: core_206
+Revises: core_205
+Create Date: 2026-10-19 00:00:00.000000
+
+Motivation
+----------
+``GET /api/search`` (``api/read_models/search_v1``) fans ``ILIKE '%q%'``
+queries out to every butler schema and merges the results in Python, so each
+keystroke touches every pool and the latency grows with butlers x table size.
+
+What this revision does
+-----------------------
+1. Creates ``public.search_documents``: one row per searchable source row,
+   keyed by ``(doc_kind, source_schema, source_id)``.  ``title`` and ``body``
+   are the indexed text (``body`` holds at most the first
+   ``_BODY_MAX_CHARS`` characters of long payloads such as session results);
+   ``snippet`` is an optional precomputed display line.  Two generated
+   columns back the indexes:
+
+   - ``search_vector`` — ``'simple'`` tsvector, title weighted ``A`` and body
+     ``B``, with a GIN index (prefix/word matches, ``ts_rank_cd`` ranking);
+   - ``search_text`` — ``lower(title || ' ' || body)`` with a GIN
+     ``gin_trgm_ops`` index (substring ``LIKE`` matches and ``similarity``).
+     ``pg_trgm`` must be pre-installed by a superuser (see core_001); without
+     it the trigram index is skipped and the API keeps the v1 fan-out.
+
+2. Keeps the table current with ``SECURITY DEFINER`` row triggers (butler
+   roles are granted nothing on the table — it spans every schema, and only
+   the dashboard API reads it):
+
+   - ``public.entities`` → ``entity`` docs, plus ``contact`` docs for person
+     entities whose body carries the ``has-*`` channel literals from
+     ``relationship.entity_facts`` (rel_035 refreshes them on fact writes);
+   - per butler schema: ``sessions`` → ``session``, ``state`` → ``state``,
+     ``calendar_events`` → ``calendar_event`` (cancelled events are dropped).
+
+   The memory (``facts``, mem_011) and finance (``transactions``,
+   finance_013) chains attach their own triggers.
+
+3. Backfills the documents for the schema being migrated and, once, for
+   ``public.entities``.
+
+Core migrations run once per butler schema; the shared objects are created
+under an advisory lock and every step is idempotent.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "core_206"
+down_revision = "core_205"
+branch_labels = None
+depends_on = None
+
+_PUBLIC_LOCK_KEY = "butlers.core_206.search_documents"
+
+_TITLE_MAX_CHARS = 200
+_BODY_MAX_CHARS = 2000
+
+_UPSERT_CONFLICT = """
+    ON CONFLICT (doc_kind, source_schema, source_id) DO UPDATE
+    SET title      = EXCLUDED.title,
+        body       = EXCLUDED.body,
+        snippet    = EXCLUDED.snippet,
+        sort_at    = EXCLUDED.sort_at,
+        updated_at = now()
+"""
+
+# Per-schema sources: doc kind -> (table, trigger columns, projection).  The
+# projection expressions use ``{row}`` for the source row (NEW in the trigger,
+# the table alias in the backfill).
+_SCHEMA_SOURCES: dict[str, dict[str, str]] = {
+    "session": {
+        "table": "sessions",
+        "columns": "prompt, result",
+        "source_id": "{row}.id::text",
+        "title": "left({row}.prompt, 120)",
+        "body": "concat_ws(E'\\n', {row}.prompt, {row}.result)",
+        "snippet": "NULL",
+        "sort_at": "{row}.started_at",
+        "keep": "true",
+    },
+    "state": {
+        "table": "state",
+        "columns": "key, value",
+        "source_id": "{row}.key",
+        "title": "{row}.key",
+        "body": "{row}.value::text",
+        "snippet": "NULL",
+        "sort_at": "{row}.updated_at",
+        "keep": "true",
+    },
+    "calendar_event": {
+        "table": "calendar_events",
+        "columns": "title, description, location, starts_at, status",
+        "source_id": "{row}.id::text",
+        "title": "{row}.title",
+        "body": "concat_ws(' ', {row}.description, {row}.location)",
+        "snippet": "NULL",
+        "sort_at": "{row}.starts_at",
+        "keep": "{row}.status <> 'cancelled'",
+    },
+}
+
+
+def _values(source: dict[str, str], *, row: str, schema: str) -> str:
+    """Return the INSERT column values projecting one source row."""
+    return f"""
+        {source["source_id"].format(row=row)},
+        {schema},
+        left(COALESCE({source["title"].format(row=row)}, ''), {_TITLE_MAX_CHARS}),
+        left(COALESCE({source["body"].format(row=row)}, ''), {_BODY_MAX_CHARS}),
+        {source["snippet"].format(row=row)},
+        {source["sort_at"].format(row=row)}
+    """
+
+
+def _sync_function_sql(kind: str, source: dict[str, str]) -> str:
+    """Return the shared trigger function keeping *kind* documents current."""
+    old_id = source["source_id"].format(row="OLD")
+    new_id = source["source_id"].format(row="NEW")
+    return f"""
+        CREATE OR REPLACE FUNCTION public.search_documents_sync_{kind}()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = pg_catalog, public
+        AS $$
+        BEGIN
+            IF TG_OP = 'DELETE'
+               OR (TG_OP = 'UPDATE' AND {old_id} IS DISTINCT FROM {new_id}) THEN
+                DELETE FROM public.search_documents
+                 WHERE doc_kind = '{kind}'
+                   AND source_schema = TG_TABLE_SCHEMA
+                   AND source_id = {old_id};
+            END IF;
+            IF TG_OP = 'DELETE' THEN
+                RETURN NULL;
+            END IF;
+            IF NOT ({source["keep"].format(row="NEW")}) THEN
+                DELETE FROM public.search_documents
+                 WHERE doc_kind = '{kind}'
+                   AND source_schema = TG_TABLE_SCHEMA
+                   AND source_id = {new_id};
+                RETURN NULL;
+            END IF;
+            INSERT INTO public.search_documents
+                (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+            VALUES ('{kind}', {_values(source, row="NEW", schema="TG_TABLE_SCHEMA")})
+            {_UPSERT_CONFLICT};
+            RETURN NULL;
+        END;
+        $$
+    """
+
+
+_REFRESH_ENTITY_FUNCTION = f"""
+    CREATE OR REPLACE FUNCTION public.search_documents_refresh_entity(p_entity_id UUID)
+    RETURNS void
+    LANGUAGE plpgsql
+    SECURITY DEFINER
+    SET search_path = pg_catalog, public
+    AS $$
+    DECLARE
+        e        public.entities%ROWTYPE;
+        channels TEXT;
+        email    TEXT;
+        phone    TEXT;
+    BEGIN
+        SELECT * INTO e FROM public.entities WHERE id = p_entity_id;
+        IF NOT FOUND
+           OR (e.metadata ->> 'merged_into') IS NOT NULL
+           OR (e.metadata ->> 'deleted_at') IS NOT NULL THEN
+            DELETE FROM public.search_documents
+             WHERE doc_kind IN ('entity', 'contact')
+               AND source_schema = 'public'
+               AND source_id = p_entity_id::text;
+            RETURN;
+        END IF;
+
+        INSERT INTO public.search_documents
+            (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+        VALUES (
+            'entity', e.id::text, 'public',
+            left(e.canonical_name, {_TITLE_MAX_CHARS}),
+            left(array_to_string(e.aliases, ' '), {_BODY_MAX_CHARS}),
+            concat_ws(' · ', e.entity_type, NULLIF(array_to_string(e.aliases[1:3], ', '), '')),
+            e.updated_at
+        )
+        {_UPSERT_CONFLICT};
+
+        IF e.entity_type <> 'person' THEN
+            DELETE FROM public.search_documents
+             WHERE doc_kind = 'contact' AND source_schema = 'public'
+               AND source_id = e.id::text;
+            RETURN;
+        END IF;
+
+        -- Channel literals live in the relationship chain, which may not be
+        -- installed (yet); rel_035 refreshes contacts once it is.
+        IF to_regclass('relationship.entity_facts') IS NOT NULL THEN
+            EXECUTE $q$
+                SELECT string_agg(ef.object, ' '),
+                       (array_agg(ef.object ORDER BY ef."primary" DESC NULLS LAST, ef.created_at)
+                            FILTER (WHERE ef.predicate = 'has-email'))[1],
+                       (array_agg(ef.object ORDER BY ef."primary" DESC NULLS LAST, ef.created_at)
+                            FILTER (WHERE ef.predicate = 'has-phone'))[1]
+                  FROM relationship.entity_facts ef
+                 WHERE ef.subject = $1
+                   AND ef.predicate LIKE 'has-%'
+                   AND ef.validity = 'active'
+                   AND ef.object_kind = 'literal'
+            $q$
+            INTO channels, email, phone
+            USING e.id;
+        END IF;
+
+        INSERT INTO public.search_documents
+            (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+        VALUES (
+            'contact', e.id::text, 'public',
+            left(e.canonical_name, {_TITLE_MAX_CHARS}),
+            left(concat_ws(' ', array_to_string(e.aliases, ' '), channels), {_BODY_MAX_CHARS}),
+            NULLIF(concat_ws(' · ', email, phone), ''),
+            e.updated_at
+        )
+        {_UPSERT_CONFLICT};
+    END;
+    $$
+"""
+
+_SYNC_ENTITY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION public.search_documents_sync_entity()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            PERFORM public.search_documents_refresh_entity(OLD.id);
+        ELSE
+            PERFORM public.search_documents_refresh_entity(NEW.id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+"""
+
+
+def _create_shared_objects() -> None:
+    op.execute(f"""
+        CREATE TABLE IF NOT EXISTS public.search_documents (
+            doc_kind        TEXT NOT NULL,
+            source_schema   TEXT NOT NULL,
+            source_id       TEXT NOT NULL,
+            title           TEXT NOT NULL DEFAULT '',
+            body            TEXT NOT NULL DEFAULT '',
+            snippet         TEXT,
+            sort_at         TIMESTAMPTZ,
+            updated_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+            search_vector   tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', title), 'A')
+                || setweight(to_tsvector('simple', body), 'B')
+            ) STORED,
+            search_text     TEXT GENERATED ALWAYS AS (lower(title || ' ' || body)) STORED,
+            PRIMARY KEY (doc_kind, source_schema, source_id),
+            CONSTRAINT search_documents_body_length_check
+                CHECK (length(body) <= {_BODY_MAX_CHARS})
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_search_documents_search_vector
+        ON public.search_documents USING gin (search_vector)
+    """)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1
+                FROM pg_opclass oc
+                JOIN pg_am am ON am.oid = oc.opcmethod
+                WHERE am.amname = 'gin'
+                  AND oc.opcname = 'gin_trgm_ops'
+            ) THEN
+                EXECUTE
+                    'CREATE INDEX IF NOT EXISTS ix_search_documents_search_text_trgm '
+                    'ON public.search_documents USING gin (search_text gin_trgm_ops)';
+            END IF;
+        END
+        $$;
+    """)
+
+    op.execute(_REFRESH_ENTITY_FUNCTION)
+    op.execute(_SYNC_ENTITY_FUNCTION)
+    op.execute("""
+        CREATE OR REPLACE TRIGGER trg_entities_search_documents
+        AFTER INSERT OR UPDATE OF canonical_name, entity_type, aliases, metadata OR DELETE
+        ON public.entities
+        FOR EACH ROW
+        EXECUTE FUNCTION public.search_documents_sync_entity()
+    """)
+    # Entities backfill once: later runs only pick up rows without a document
+    # (merged/deleted entities are re-checked and stay absent).
+    op.execute("""
+        SELECT public.search_documents_refresh_entity(e.id)
+          FROM public.entities e
+         WHERE NOT EXISTS (
+               SELECT 1 FROM public.search_documents d
+                WHERE d.doc_kind = 'entity'
+                  AND d.source_schema = 'public'
+                  AND d.source_id = e.id::text
+         )
+    """)
+
+    for kind, source in _SCHEMA_SOURCES.items():
+        op.execute(_sync_function_sql(kind, source))
+
+
+def upgrade() -> None:
+    op.execute(f"SELECT pg_advisory_xact_lock(hashtext('{_PUBLIC_LOCK_KEY}'))")
+    _create_shared_objects()
+
+    # Per butler schema: attach triggers and backfill the existing rows.
+    for kind, source in _SCHEMA_SOURCES.items():
+        table = source["table"]
+        op.execute(f"""
+            CREATE OR REPLACE TRIGGER trg_{table}_search_documents
+            AFTER INSERT OR UPDATE OF {source["columns"]} OR DELETE ON {table}
+            FOR EACH ROW
+            EXECUTE FUNCTION public.search_documents_sync_{kind}()
+        """)
+        op.execute(f"""
+            INSERT INTO public.search_documents
+                (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+            SELECT '{kind}', {_values(source, row="src", schema="current_schema()")}
+              FROM {table} src
+             WHERE {source["keep"].format(row="src")}
+            {_UPSERT_CONFLICT}
+        """)
+
+
+def downgrade() -> None:
+    op.execute(f"SELECT pg_advisory_xact_lock(hashtext('{_PUBLIC_LOCK_KEY}'))")
+    for kind, source in _SCHEMA_SOURCES.items():
+        table = source["table"]
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_search_documents ON {table}")
+        op.execute(
+            "DELETE FROM public.search_documents"
+            f" WHERE doc_kind = '{kind}' AND source_schema = current_schema()"
+        )
+    # Shared objects go with the last schema whose triggers still feed the
+    # table (including the memory/finance/relationship triggers).
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1
+                  FROM pg_trigger t
+                  JOIN pg_proc p ON p.oid = t.tgfoid
+                 WHERE p.proname LIKE '%search_document%'
+                   AND t.tgrelid <> 'public.entities'::regclass
+                   AND NOT t.tgisinternal
+            ) THEN
+                DROP TRIGGER IF EXISTS trg_entities_search_documents ON public.entities;
+                DROP FUNCTION IF EXISTS public.search_documents_sync_entity();
+                DROP FUNCTION IF EXISTS public.search_documents_refresh_entity(UUID);
+                DROP FUNCTION IF EXISTS public.search_documents_sync_session();
+                DROP FUNCTION IF EXISTS public.search_documents_sync_state();
+                DROP FUNCTION IF EXISTS public.search_documents_sync_calendar_event();
+                DROP TABLE IF EXISTS public.search_documents;
+            END IF;
+        END
+        $$;
+    """)
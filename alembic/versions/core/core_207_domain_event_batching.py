@@ -0,0 +1,88 @@
+"""domain_events: subscriber-declared batch delivery for the event bus.
+
+Revision ID: core_207
+Revises: core_206
+Create Date: 2026-10-19 00:00:00.000000
+
+Motivation
+----------
+``fan_out_event`` (``src/butlers/core_tools/_domain_events.py``) dispatches
+every event to every subscriber individually: one ``route()`` call, one
+delivery-ledger insert and one outcome update per (event, subscriber) pair.
+A burst -- a finance import emitting hundreds of transaction events, a
+contacts sync touching thousands of rows -- pays that cost per event.
+
+What this revision does
+-----------------------
+1. ``public.butler_subscriptions`` gains ``batch_max_events`` and
+   ``batch_max_latency_ms``.  A subscriber that sets both opts into
+   receiving up to ``batch_max_events`` events of that type in one
+   ``receive_domain_events`` call, and tolerates a publisher holding an
+   event for up to ``batch_max_latency_ms`` to coalesce it with others.
+   Both NULL (the default, and every existing row) keeps per-event
+   delivery.
+2. ``public.domain_event_deliveries`` gains ``batch_id``: the coalesced
+   dispatch a delivery row was claimed under.  A batched row that ends up
+   ``failed``/``failed_permanent`` is a dead letter of that batch -- the
+   reconciliation sweep retries it individually through the per-event path.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "core_207"
+down_revision = "core_206"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE public.butler_subscriptions
+        ADD COLUMN IF NOT EXISTS batch_max_events INT,
+        ADD COLUMN IF NOT EXISTS batch_max_latency_ms INT
+    """)
+    op.execute("""
+        ALTER TABLE public.butler_subscriptions
+        DROP CONSTRAINT IF EXISTS chk_butler_subscriptions_batching
+    """)
+    op.execute("""
+        ALTER TABLE public.butler_subscriptions
+        ADD CONSTRAINT chk_butler_subscriptions_batching
+        CHECK (
+            (batch_max_events IS NULL AND batch_max_latency_ms IS NULL)
+            OR (
+                batch_max_events BETWEEN 2 AND 1000
+                AND batch_max_latency_ms BETWEEN 0 AND 60000
+            )
+        )
+    """)
+
+    op.execute("""
+        ALTER TABLE public.domain_event_deliveries
+        ADD COLUMN IF NOT EXISTS batch_id UUID
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_domain_event_deliveries_batch_id
+        ON public.domain_event_deliveries (batch_id)
+        WHERE batch_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_domain_event_deliveries_batch_id")
+    op.execute("""
+        ALTER TABLE public.domain_event_deliveries
+        DROP COLUMN IF EXISTS batch_id
+    """)
+    op.execute("""
+        ALTER TABLE public.butler_subscriptions
+        DROP CONSTRAINT IF EXISTS chk_butler_subscriptions_batching
+    """)
+    op.execute("""
+        ALTER TABLE public.butler_subscriptions
+        DROP COLUMN IF EXISTS batch_max_latency_ms,
+        DROP COLUMN IF EXISTS batch_max_events
+    """)
@@ -1881,13 +1881,20 @@ export interface SearchResult {
   url: string;
 }
 
-/** Grouped search results keyed by category. */
+/**
+ * Grouped search results keyed by category. `facts`, `transactions`, and
+ * `calendar_events` are only filled when the backend serves from the shared
+ * search index; `next_cursor` pages the categories that have more matches.
+ */
 export interface SearchResults {
   entities: SearchResult[];
   contacts: SearchResult[];
   sessions: SearchResult[];
   state: SearchResult[];
-  [key: string]: SearchResult[];
+  facts?: SearchResult[];
+  transactions?: SearchResult[];
+  calendar_events?: SearchResult[];
+  next_cursor?: string | null;
 }
 
 // ---------------------------------------------------------------------------
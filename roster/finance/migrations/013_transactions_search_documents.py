@@ -0,0 +1,106 @@
+"""transactions_search_documents
+
+Revision ID: finance_013
+Revises: finance_012
+Create Date: 2026-10-19 00:00:00.000000
+
+``core_206`` builds ``public.search_documents``, the single index behind
+``GET /api/search``.  This attaches ``transactions`` to it: a ``SECURITY
+DEFINER`` row trigger upserts a ``transaction`` document (title: merchant,
+body: merchant, description, category and payment method, snippet: amount,
+category and posting date) for every live transaction and removes it once the
+row is soft-deleted (``deleted_at``) or deleted.  Existing live transactions
+are backfilled.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "finance_013"
+down_revision = "finance_012"
+branch_labels = None
+depends_on = None
+
+_TITLE_MAX_CHARS = 200
+_BODY_MAX_CHARS = 2000
+
+_UPSERT_CONFLICT = """
+    ON CONFLICT (doc_kind, source_schema, source_id) DO UPDATE
+    SET title      = EXCLUDED.title,
+        body       = EXCLUDED.body,
+        snippet    = EXCLUDED.snippet,
+        sort_at    = EXCLUDED.sort_at,
+        updated_at = now()
+"""
+
+
+def _values(row: str, schema: str) -> str:
+    return f"""
+        'transaction',
+        {row}.id::text,
+        {schema},
+        left({row}.merchant, {_TITLE_MAX_CHARS}),
+        left(
+            concat_ws(' ', {row}.merchant, {row}.description, {row}.category, {row}.payment_method),
+            {_BODY_MAX_CHARS}
+        ),
+        concat_ws(
+            ' · ',
+            {row}.amount::text || ' ' || {row}.currency,
+            {row}.category,
+            to_char({row}.posted_at AT TIME ZONE 'UTC', 'YYYY-MM-DD')
+        ),
+        {row}.posted_at
+    """
+
+
+def upgrade() -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION transactions_sync_search_document()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = pg_catalog, public
+        AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' OR NEW.deleted_at IS NOT NULL THEN
+                DELETE FROM public.search_documents
+                 WHERE doc_kind = 'transaction'
+                   AND source_schema = TG_TABLE_SCHEMA
+                   AND source_id = COALESCE(NEW.id, OLD.id)::text;
+                RETURN NULL;
+            END IF;
+            INSERT INTO public.search_documents
+                (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+            VALUES ({_values("NEW", "TG_TABLE_SCHEMA")})
+            {_UPSERT_CONFLICT};
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE TRIGGER trg_transactions_search_documents
+        AFTER INSERT OR UPDATE OF merchant, description, category, payment_method, amount,
+            currency, posted_at, deleted_at OR DELETE ON transactions
+        FOR EACH ROW
+        EXECUTE FUNCTION transactions_sync_search_document()
+    """)
+    op.execute(f"""
+        INSERT INTO public.search_documents
+            (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+        SELECT {_values("t", "current_schema()")}
+          FROM transactions t
+         WHERE t.deleted_at IS NULL
+        {_UPSERT_CONFLICT}
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_transactions_search_documents ON transactions")
+    op.execute("DROP FUNCTION IF EXISTS transactions_sync_search_document()")
+    op.execute(
+        "DELETE FROM public.search_documents"
+        " WHERE doc_kind = 'transaction' AND source_schema = current_schema()"
+    )
@@ -0,0 +1,78 @@
+"""entity_facts identity NOTIFY for the channel-identity cache.
+
+Revision ID: rel_034
+Revises: rel_033
+Create Date: 2026-10-18 00:00:00.000000
+
+``butlers.identity_cache`` memoises channel → entity resolutions (including
+misses) in every daemon and dashboard process.  Resolution reads the
+``has-handle`` / ``has-email`` / ``has-phone`` / ``has-website`` literals in
+``relationship.entity_facts``, so any insert, update or delete of such a fact
+must invalidate the caches.
+
+This installs ``relationship.entity_facts_notify_identity()`` and a row
+trigger that sends ``pg_notify('butlers_identity_changed', payload)`` with::
+
+    {"entity_ids": [<OLD.subject>, <NEW.subject>],
+     "facts": [[<predicate>, <object>], ...]}
+
+carrying both the old and new row for updates (a merge re-points
+``subject``; a retraction flips ``validity``).  Rows for other predicates are
+filtered inside the function, so fact writes unrelated to identity stay
+silent.  ``core_204`` covers role and name changes on ``public.entities``.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "rel_034"
+down_revision = "rel_033"
+branch_labels = None
+depends_on = None
+
+_CHANNEL = "butlers_identity_changed"
+_PREDICATES = "('has-handle', 'has-email', 'has-phone', 'has-website')"
+
+
+def upgrade() -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION relationship.entity_facts_notify_identity()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            ids   jsonb := '[]'::jsonb;
+            facts jsonb := '[]'::jsonb;
+        BEGIN
+            IF TG_OP <> 'INSERT' AND OLD.predicate IN {_PREDICATES} THEN
+                ids := ids || to_jsonb(OLD.subject);
+                facts := facts || jsonb_build_array(jsonb_build_array(OLD.predicate, OLD.object));
+            END IF;
+            IF TG_OP <> 'DELETE' AND NEW.predicate IN {_PREDICATES} THEN
+                ids := ids || to_jsonb(NEW.subject);
+                facts := facts || jsonb_build_array(jsonb_build_array(NEW.predicate, NEW.object));
+            END IF;
+            IF jsonb_array_length(facts) > 0 THEN
+                PERFORM pg_notify(
+                    '{_CHANNEL}',
+                    jsonb_build_object('entity_ids', ids, 'facts', facts)::text
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE TRIGGER trg_entity_facts_identity_notify
+        AFTER INSERT OR UPDATE OR DELETE ON relationship.entity_facts
+        FOR EACH ROW
+        EXECUTE FUNCTION relationship.entity_facts_notify_identity()
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_entity_facts_identity_notify ON relationship.entity_facts"
+    )
+    op.execute("DROP FUNCTION IF EXISTS relationship.entity_facts_notify_identity()")
@@ -0,0 +1,71 @@
+"""entity_facts refresh of contact documents in the dashboard search index.
+
+Revision ID: rel_035
+Revises: rel_034
+Create Date: 2026-10-19 00:00:00.000000
+
+``core_206`` builds ``public.search_documents`` and indexes person entities as
+``contact`` documents whose body carries their ``has-*`` channel literals
+(email, phone, handles) from ``relationship.entity_facts``.  This installs
+``relationship.entity_facts_sync_search_document()`` and a row trigger that
+calls ``public.search_documents_refresh_entity(subject)`` whenever such a
+fact is inserted, updated or deleted — for both the old and new subject, so
+a merge that re-points ``subject`` refreshes both contacts.  Rows for other
+predicates are filtered inside the function.
+
+The contacts backfilled by core_206 before this chain existed carry no
+channel literals, so every subject with a channel fact is refreshed once.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "rel_035"
+down_revision = "rel_034"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION relationship.entity_facts_sync_search_document()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            refreshed UUID;
+        BEGIN
+            IF TG_OP <> 'INSERT' AND OLD.predicate LIKE 'has-%' THEN
+                PERFORM public.search_documents_refresh_entity(OLD.subject);
+                refreshed := OLD.subject;
+            END IF;
+            IF TG_OP <> 'DELETE' AND NEW.predicate LIKE 'has-%'
+               AND NEW.subject IS DISTINCT FROM refreshed THEN
+                PERFORM public.search_documents_refresh_entity(NEW.subject);
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE TRIGGER trg_entity_facts_search_documents
+        AFTER INSERT OR UPDATE OR DELETE ON relationship.entity_facts
+        FOR EACH ROW
+        EXECUTE FUNCTION relationship.entity_facts_sync_search_document()
+    """)
+    op.execute("""
+        SELECT public.search_documents_refresh_entity(s.subject)
+          FROM (
+              SELECT DISTINCT ef.subject
+                FROM relationship.entity_facts ef
+               WHERE ef.predicate LIKE 'has-%'
+          ) s
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS trg_entity_facts_search_documents ON relationship.entity_facts"
+    )
+    op.execute("DROP FUNCTION IF EXISTS relationship.entity_facts_sync_search_document()")
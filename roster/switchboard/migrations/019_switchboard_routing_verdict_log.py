@@ -41,6 +41,10 @@ Table design notes:
     sibling ``rule_promotion_suggestions`` design (bead 2) and keeps history
     intact even if a referenced rule/session/event is later pruned; nothing
     in this bead deletes rows from those tables.
+  - Once core_202 has partitioned ``sessions`` (fresh installs run the core
+    chain first), ``sessions(id)`` is no longer unique on its own and cannot
+    be an FK target; ``session_id`` then gets core_202's
+    ``sessions_reference_check`` trigger under the FK's name instead.
 """
 
 from __future__ import annotations
@@ -66,7 +70,7 @@ def upgrade() -> None:
             verdict_action     TEXT NOT NULL,
             verdict_target     TEXT,
             matched_rule_id    UUID REFERENCES ingestion_rules(id),
-            session_id         UUID REFERENCES sessions(id),
+            session_id         UUID,
             decided_at         TIMESTAMPTZ NOT NULL DEFAULT now(),
 
             CONSTRAINT chk_routing_verdict_log_verdict_source
@@ -79,6 +83,28 @@ def upgrade() -> None:
         """
     )
 
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('sessions')) = 'p' THEN
+                CREATE OR REPLACE TRIGGER routing_verdict_log_session_id_fkey
+                    BEFORE INSERT OR UPDATE OF session_id ON routing_verdict_log
+                    FOR EACH ROW EXECUTE FUNCTION sessions_reference_check('session_id');
+            ELSIF NOT EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conrelid = to_regclass('routing_verdict_log')
+                  AND conname = 'routing_verdict_log_session_id_fkey'
+            ) THEN
+                ALTER TABLE routing_verdict_log
+                    ADD CONSTRAINT routing_verdict_log_session_id_fkey
+                    FOREIGN KEY (session_id) REFERENCES sessions(id);
+            END IF;
+        END
+        $$;
+        """
+    )
+
     # Promotion-trigger scan (bead 3): "give me the last N LLM verdicts for
     # this sender/channel, most recent first".
     op.execute(
@@ -0,0 +1,58 @@
+"""Stored ``source_thread_identity`` column on message_inbox for history loads.
+
+Revision ID: sw_031
+Revises: sw_030
+Create Date: 2026-10-19 00:00:00.000000
+
+Every routed real-time message loads its thread's recent history
+(``butlers.modules.pipeline._load_realtime_history``).  The filter was written
+against ``request_context ->> 'source_thread_identity'``, including a
+``LIKE '<chat_id>:%'`` prefix match for Telegram chats; the sw_013b expression
+index cannot serve the prefix match, and the OR across both forms degraded to
+a scan of the accepted-message partitions as the inbox grew.
+
+This revision adds ``source_thread_identity`` as a ``GENERATED ALWAYS ...
+STORED`` column (so every writer keeps populating it without change) and a
+``(source_thread_identity text_pattern_ops, received_at DESC)`` index.
+``text_pattern_ops`` lets one index serve both the equality lookups and the
+byte-wise ``~>=~`` / ``~<~`` prefix range the history query uses for Telegram
+chat grouping.
+
+Adding a stored generated column rewrites every ``message_inbox`` partition
+once, under an ACCESS EXCLUSIVE lock; run it in a maintenance window on large
+inboxes.  The sw_013b / sw_016 expression indexes stay: other readers
+(calendar prep, the relationship butler's inbox queries) still use the JSONB
+expression.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "sw_031"
+down_revision = "sw_030"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE message_inbox
+        ADD COLUMN IF NOT EXISTS source_thread_identity TEXT
+        GENERATED ALWAYS AS (request_context ->> 'source_thread_identity') STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_message_inbox_source_thread_identity_received_at
+        ON message_inbox (source_thread_identity text_pattern_ops, received_at DESC)
+        WHERE source_thread_identity IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_message_inbox_source_thread_identity_received_at")
+    op.execute("ALTER TABLE message_inbox DROP COLUMN IF EXISTS source_thread_identity")
@@ -47,6 +47,9 @@ from opentelemetry import metrics as otel_metrics
 from pydantic import BaseModel, ConfigDict
 
 from butlers.core.metrics import ButlerMetrics
+from butlers.core.thread_history_cache import get_thread_history_cache
+from butlers.db_profiler import profiled
+from butlers.db_statements import register_statement
 from butlers.ingestion_policy import (
     IngestionEnvelope,
     IngestionPolicyEvaluator,
@@ -63,6 +66,88 @@ from butlers.tools.switchboard.triage.thread_affinity import (
 
 logger = logging.getLogger(__name__)
 
+# Statements executed for every accepted submission, pre-prepared on new
+# switchboard pool connections.
+_ENSURE_PARTITION_SQL = register_statement(
+    "switchboard.ingest.ensure_partition",
+    "SELECT switchboard_message_inbox_ensure_partition($1)",
+    relations=("switchboard.message_inbox",),
+)
+_ADVISORY_LOCK_SQL = register_statement(
+    "switchboard.ingest.advisory_lock",
+    "SELECT pg_advisory_xact_lock(hashtext($1))",
+    relations=(),
+)
+_FIND_BY_DEDUPE_KEY_SQL = register_statement(
+    "switchboard.ingest.find_by_dedupe_key",
+    """
+    SELECT (request_context ->> 'request_id')::uuid AS request_id
+    FROM switchboard.message_inbox
+    WHERE request_context ->> 'dedupe_key' = $1
+    ORDER BY received_at DESC
+    LIMIT 1
+    """,
+    relations=("switchboard.message_inbox",),
+)
+_FIND_BY_CONTENT_HASH_SQL = register_statement(
+    "switchboard.ingest.find_by_content_hash",
+    """
+    SELECT (request_context ->> 'request_id')::uuid AS request_id
+    FROM switchboard.message_inbox
+    WHERE request_context ->> 'content_hash_key' = $1
+    ORDER BY received_at DESC
+    LIMIT 1
+    """,
+    relations=("switchboard.message_inbox",),
+)
+_INSERT_MESSAGE_INBOX_SQL = register_statement(
+    "switchboard.ingest.insert_message_inbox",
+    """
+    INSERT INTO switchboard.message_inbox (
+        id,
+        received_at,
+        request_context,
+        raw_payload,
+        normalized_text,
+        attachments,
+        lifecycle_state,
+        schema_version,
+        processing_metadata,
+        created_at,
+        updated_at
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6,
+        $7, 'message_inbox.v2', '{}'::jsonb, $2, $2
+    )
+    """,
+    relations=("switchboard.message_inbox",),
+)
+_INSERT_INGESTION_EVENT_SQL = register_statement(
+    "switchboard.ingest.insert_ingestion_event",
+    """
+    INSERT INTO public.ingestion_events (
+        id,
+        received_at,
+        source_channel,
+        source_provider,
+        source_endpoint_identity,
+        source_sender_identity,
+        source_sender_display_name,
+        source_thread_identity,
+        external_event_id,
+        dedupe_key,
+        dedupe_strategy,
+        ingestion_tier,
+        policy_tier,
+        triage_decision,
+        triage_target
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
+    )
+    """,
+    relations=("public.ingestion_events",),
+)
+
 
 def _strip_null_bytes(value: Any) -> Any:
     """Recursively strip PostgreSQL-invalid Unicode scalars from payloads.
@@ -303,13 +388,7 @@ async def _find_request_by_dedupe_key(pool: asyncpg.Pool, dedupe_key: str) -> as
     created by migration sw_010 for efficient lookup.
     """
     return await pool.fetchrow(
-        """
-        SELECT (request_context ->> 'request_id')::uuid AS request_id
-        FROM switchboard.message_inbox
-        WHERE request_context ->> 'dedupe_key' = $1
-        ORDER BY received_at DESC
-        LIMIT 1
-        """,
+        _FIND_BY_DEDUPE_KEY_SQL,
         dedupe_key,
     )
 
@@ -323,13 +402,7 @@ async def _find_request_by_content_hash(
     by different connectors with different primary idempotency keys.
     """
     return await pool.fetchrow(
-        """
-        SELECT (request_context ->> 'request_id')::uuid AS request_id
-        FROM switchboard.message_inbox
-        WHERE request_context ->> 'content_hash_key' = $1
-        ORDER BY received_at DESC
-        LIMIT 1
-        """,
+        _FIND_BY_CONTENT_HASH_SQL,
         content_hash_key,
     )
 
@@ -591,6 +664,7 @@ def _run_policy_evaluation(
         )
 
 
+@profiled("switchboard.ingest")
 async def ingest_v1(
     pool: asyncpg.Pool,
     payload: Mapping[str, Any],
@@ -884,7 +958,7 @@ async def ingest_v1(
     # regardless of what happens later in the dedup transaction.
     try:
         await pool.execute(
-            "SELECT switchboard_message_inbox_ensure_partition($1)",
+            _ENSURE_PARTITION_SQL,
             received_at,
         )
     except Exception as exc:
@@ -911,7 +985,7 @@ async def ingest_v1(
         async with pool.acquire() as conn:
             async with conn.transaction():
                 # Serialise concurrent inserts for the same dedupe_key
-                await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", dedupe_key)
+                await conn.execute(_ADVISORY_LOCK_SQL, dedupe_key)
 
                 # Also lock on content-hash key to serialize cross-connector races
                 inner_content_hash_key = (
@@ -920,33 +994,18 @@ async def ingest_v1(
                     else None
                 )
                 if inner_content_hash_key:
-                    await conn.execute(
-                        "SELECT pg_advisory_xact_lock(hashtext($1))",
-                        inner_content_hash_key,
-                    )
+                    await conn.execute(_ADVISORY_LOCK_SQL, inner_content_hash_key)
 
                 # Re-check inside lock — another insert may have committed
                 # between the optimistic check (step 3) and acquiring the lock
                 existing = await conn.fetchrow(
-                    """
-                    SELECT (request_context ->> 'request_id')::uuid AS request_id
-                    FROM switchboard.message_inbox
-                    WHERE request_context ->> 'dedupe_key' = $1
-                    ORDER BY received_at DESC
-                    LIMIT 1
-                    """,
+                    _FIND_BY_DEDUPE_KEY_SQL,
                     dedupe_key,
                 )
                 # Cross-connector re-check inside lock
                 if not existing and inner_content_hash_key:
                     existing = await conn.fetchrow(
-                        """
-                        SELECT (request_context ->> 'request_id')::uuid AS request_id
-                        FROM switchboard.message_inbox
-                        WHERE request_context ->> 'content_hash_key' = $1
-                        ORDER BY received_at DESC
-                        LIMIT 1
-                        """,
+                        _FIND_BY_CONTENT_HASH_SQL,
                         inner_content_hash_key,
                     )
                 if existing:
@@ -967,24 +1026,7 @@ async def ingest_v1(
 
                 # Insert into message_inbox lifecycle store
                 await conn.execute(
-                    """
-                    INSERT INTO switchboard.message_inbox (
-                        id,
-                        received_at,
-                        request_context,
-                        raw_payload,
-                        normalized_text,
-                        attachments,
-                        lifecycle_state,
-                        schema_version,
-                        processing_metadata,
-                        created_at,
-                        updated_at
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6,
-                        $7, 'message_inbox.v2', '{}'::jsonb, $2, $2
-                    )
-                    """,
+                    _INSERT_MESSAGE_INBOX_SQL,
                     request_id,
                     received_at,
                     request_context,
@@ -998,27 +1040,7 @@ async def ingest_v1(
                 # This row is the durable, normalised first-class record of every
                 # accepted ingest; downstream sessions reference it via FK.
                 await conn.execute(
-                    """
-                    INSERT INTO public.ingestion_events (
-                        id,
-                        received_at,
-                        source_channel,
-                        source_provider,
-                        source_endpoint_identity,
-                        source_sender_identity,
-                        source_sender_display_name,
-                        source_thread_identity,
-                        external_event_id,
-                        dedupe_key,
-                        dedupe_strategy,
-                        ingestion_tier,
-                        policy_tier,
-                        triage_decision,
-                        triage_target
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
-                    )
-                    """,
+                    _INSERT_INGESTION_EVENT_SQL,
                     request_id,
                     received_at,
                     _strip_null_bytes(envelope.source.channel),
@@ -1053,6 +1075,17 @@ async def ingest_v1(
         triage_decision.action if triage_decision else "n/a",
     )
 
+    # Keep the routing pipeline's warm thread history in step with the row
+    # just committed, so the history load for this message can skip the DB.
+    get_thread_history_cache().record(
+        source_thread_identity=request_context.get("source_thread_identity"),
+        source_channel=request_context.get("source_channel"),
+        received_at=received_at,
+        raw_content=normalized_text,
+        sender_id=request_context.get("source_sender_identity"),
+        raw_metadata=raw_payload.get("metadata"),
+    )
+
     # Fan an "ingestion" event onto the multiplexed fleet event bus (bu-86c4c.8,
     # move 5; wired in bu-h8ioq). This is the single choke point where every
     # new public.ingestion_events row is committed (the transaction above), so
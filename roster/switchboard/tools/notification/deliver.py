@@ -12,6 +12,7 @@ import asyncpg
 from opentelemetry import trace
 from pydantic import ValidationError
 
+from butlers.core.thread_history_cache import get_thread_history_cache
 from butlers.core.tool_call_capture import get_current_runtime_session_id
 from butlers.tools.switchboard.notification.log import log_notification
 from butlers.tools.switchboard.routing.contracts import (
@@ -225,6 +226,15 @@ async def _write_outbound_message_inbox(
             raw_payload,
             message_text,
         )
+        get_thread_history_cache().record(
+            source_thread_identity=thread_identity,
+            source_channel=source_channel,
+            received_at=delivered_at,
+            raw_content=message_text,
+            sender_id=origin_butler,
+            raw_metadata=raw_payload["metadata"],
+            direction="outbound",
+        )
     except Exception:
         logger.exception(
             "Failed to write outbound message to message_inbox",
@@ -35,7 +35,11 @@ from butlers.api.deps import (
     wire_db_dependencies,
 )
 from butlers.api.lifespan_supervisor import supervise_lifespan_loop
-from butlers.api.middleware import ApiKeyMiddleware, register_error_handlers
+from butlers.api.middleware import (
+    ApiKeyMiddleware,
+    DbProfileMiddleware,
+    register_error_handlers,
+)
 from butlers.api.router_discovery import discover_butler_routers
 from butlers.api.routers.activity_feed import router as activity_feed_router
 from butlers.api.routers.approvals import router as approvals_router
@@ -138,6 +142,7 @@ from butlers.db import (
     has_insecure_infra_defaults,
     is_grafana_anon_outside_dev,
 )
+from butlers.db_profiler import profiling_enabled
 from butlers.jobs.calendar_sync_deadman import (
     DEFAULT_CALENDAR_DEADMAN_CHECK_INTERVAL_S,
     run_calendar_sync_deadman_loop,
@@ -253,7 +258,10 @@ async def lifespan(app: FastAPI):
     migration_drift_task: asyncio.Task | None = None
     calendar_deadman_task: asyncio.Task | None = None
     external_deadman_task: asyncio.Task | None = None
+    notification_hub_task: asyncio.Task | None = None
     fleet_events_bridge_task: asyncio.Task | None = None
+    identity_cache_task: asyncio.Task | None = None
+    credential_cache_task: asyncio.Task | None = None
     model_verify_task: asyncio.Task | None = None
     try:
         await init_db_manager(butler_configs)
@@ -332,6 +340,24 @@ async def lifespan(app: FastAPI):
             )
         )
 
+        # Process LISTEN hub (butlers.notification_hub): the fleet-events
+        # bridge and the cache-invalidation listeners below subscribe to it
+        # and share its single dedicated connection instead of holding one
+        # each.  Subscriptions made before it connects start listening (after
+        # a reported gap) once it does.
+        try:
+            from butlers.notification_hub import notification_hub
+
+            notification_hub_task = _track_background_task(
+                supervise_lifespan_loop("notification_hub", notification_hub().run)
+            )
+        except Exception:
+            logger.warning(
+                "Failed to start the notification hub; NOTIFY-driven live events and "
+                "cache invalidation are unavailable",
+                exc_info=True,
+            )
+
         # Fleet-events NOTIFY bridge (bu-01r64.1): daemon processes publish
         # session/spend/notification/approval/ingestion events via Postgres NOTIFY
         # (butlers.fleet_events.publish_fleet_event) because they run in a
@@ -358,6 +384,43 @@ async def lifespan(app: FastAPI):
                 exc_info=True,
             )
 
+        # Channel identity cache invalidation (butlers.identity_cache): the
+        # ingestion timeline resolves every page's senders through
+        # resolve_contacts_by_channel_bulk; the cache only serves those reads
+        # while this LISTEN connection is up.
+        try:
+            from butlers.identity_cache import run_identity_cache_listener
+
+            identity_cache_task = _track_background_task(
+                supervise_lifespan_loop(
+                    "identity_cache_listener",
+                    run_identity_cache_listener,
+                )
+            )
+        except Exception:
+            logger.warning(
+                "Failed to start identity-cache listener; identity lookups stay uncached",
+                exc_info=True,
+            )
+
+        # Credential cache invalidation (butlers.credential_cache): without
+        # this listener, secrets written by daemons reach this process's
+        # CredentialStore.resolve() only after the cache TTL.
+        try:
+            from butlers.credential_cache import run_credential_cache_listener
+
+            credential_cache_task = _track_background_task(
+                supervise_lifespan_loop(
+                    "credential_cache_listener",
+                    run_credential_cache_listener,
+                )
+            )
+        except Exception:
+            logger.warning(
+                "Failed to start credential-cache listener; cached secrets expire by TTL only",
+                exc_info=True,
+            )
+
         # Settings Console live updates (bu-3quv8): fans header_delta /
         # attention_add / attention_remove onto the unified fleet event bus
         # (WS /api/events/stream) -- see run_settings_console_delta_loop's
@@ -504,6 +567,18 @@ async def lifespan(app: FastAPI):
         fleet_events_bridge_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await fleet_events_bridge_task
+    if identity_cache_task is not None:
+        identity_cache_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await identity_cache_task
+    if credential_cache_task is not None:
+        credential_cache_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await credential_cache_task
+    if notification_hub_task is not None:
+        notification_hub_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await notification_hub_task
     if settings_console_delta_task is not None:
         settings_console_delta_task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
@@ -611,6 +686,10 @@ def create_app(
         _effective_api_key = api_key
     app.add_middleware(ApiKeyMiddleware, api_key=_effective_api_key)
 
+    # Per-request DB round-trip profiling (opt-in via BUTLERS_DB_PROFILE).
+    if profiling_enabled():
+        app.add_middleware(DbProfileMiddleware)
+
     register_error_handlers(app)
 
     # --- Auto-discovered Butler Routers ---
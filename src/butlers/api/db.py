@@ -18,6 +18,8 @@ from butlers.db import (
     schema_search_path,
     should_retry_with_ssl_disable,
 )
+from butlers.db_profiler import profiled, profiled_connection_class
+from butlers.db_statements import statement_cache_size_from_env
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +97,8 @@ class DatabaseManager:
             "min_size": self._min_pool_size,
             "max_size": self._max_pool_size,
             "init": register_jsonb_codec,
+            "connection_class": profiled_connection_class(),
+            "statement_cache_size": statement_cache_size_from_env(),
         }
         search_path = schema_search_path(schema)
         if search_path is not None:
@@ -373,6 +377,7 @@ class DatabaseManager:
         """
         self._role_enforcement_disabled = disabled
 
+    @profiled("dashboard.fan_out")
     async def fan_out_with_status(
         self,
         query: str,
@@ -7,13 +7,14 @@ process) back into the real, in-process fleet event bus
 ``WS /api/events/stream`` consumer keeps working unchanged regardless of
 which process originated the event.
 
+The LISTEN itself runs on the process :mod:`butlers.notification_hub`
+connection, shared with the other NOTIFY consumers of the dashboard API.
+
 See RFC 0022 (``about/legends-and-lore/rfcs/0022-cross-process-event-transport.md``).
 """
 
 from __future__ import annotations
 
-import asyncio
-import contextlib
 import json
 import logging
 from collections.abc import Awaitable, Callable
@@ -21,49 +22,22 @@ from typing import Any
 
 import asyncpg
 
-from butlers.db import database_name_from_env, db_params_from_env, should_retry_with_ssl_disable
+from butlers import json_codec
 from butlers.fleet_events import FLEET_EVENTS_CHANNEL
+from butlers.notification_hub import (
+    Notification,
+    NotificationGap,
+    NotificationHub,
+    consume_channel,
+)
 
 logger = logging.getLogger(__name__)
 
-#: How long to wait before reconnecting after the LISTEN connection drops
-#: (server restart, network blip) or a connect attempt fails.
+#: Reconnect timings of a private hub (``connect=`` injection, tests only).
 _RECONNECT_BACKOFF_S = 5.0
-
-#: How often to poll connection liveness while idle-listening.
 _HEALTH_POLL_INTERVAL_S = 5.0
 
 
-async def _connect_listener() -> asyncpg.Connection:
-    """Open a dedicated (non-pooled) connection for LISTEN.
-
-    LISTEN registrations are connection-scoped in Postgres, so this
-    connection must be held for the lifetime of the listener rather than
-    borrowed from a pool that recycles/closes connections underneath it.
-    Uses the same canonical database-target resolver and env-derived
-    host/auth/SSL params as the daemon publisher pools, without depending on
-    ``DatabaseManager``'s per-butler,
-    schema-scoped pools (LISTEN/NOTIFY is database-scoped, not
-    schema-scoped, so any single connection to the shared database sees
-    every schema's NOTIFYs).
-    """
-    params = db_params_from_env()
-    database = database_name_from_env("butlers")
-    connect_kwargs: dict[str, Any] = {**params, "database": database}
-    try:
-        return await asyncpg.connect(**connect_kwargs)
-    except Exception as exc:
-        ssl = connect_kwargs.get("ssl")
-        if not should_retry_with_ssl_disable(exc, ssl):
-            raise
-        retry_kwargs = dict(connect_kwargs)
-        retry_kwargs["ssl"] = "disable"
-        logger.info(
-            "Retrying fleet-events LISTEN connection with ssl=disable after SSL upgrade loss"
-        )
-        return await asyncpg.connect(**retry_kwargs)
-
-
 def _bridge_to_event_bus(event_type: str, data: dict[str, Any]) -> None:
     """Re-publish a bridged NOTIFY payload onto the real in-process event bus.
 
@@ -76,12 +50,12 @@ def _bridge_to_event_bus(event_type: str, data: dict[str, Any]) -> None:
     emit_event(event_type, data)
 
 
-def _on_notify(_conn: asyncpg.Connection, _pid: int, channel: str, payload: str) -> None:
-    """asyncpg ``add_listener`` callback: parse and bridge one NOTIFY payload."""
+def _on_notify(channel: str, payload: str) -> None:
+    """Parse and bridge one fleet-events NOTIFY payload."""
     if channel != FLEET_EVENTS_CHANNEL:
         return
     try:
-        envelope = json.loads(payload)
+        envelope = json_codec.loads(payload)
     except (json.JSONDecodeError, TypeError):
         logger.warning(
             "fleet_events_bridge: malformed NOTIFY payload on %r, dropping",
@@ -106,51 +80,42 @@ def _on_notify(_conn: asyncpg.Connection, _pid: int, channel: str, payload: str)
 async def run_fleet_events_listener(
     connect: Callable[[], Awaitable[asyncpg.Connection]] | None = None,
     *,
-    on_notify: Callable[[asyncpg.Connection, int, str, str], None] | None = None,
+    hub: NotificationHub | None = None,
+    on_notify: Callable[[str, str], None] | None = None,
     reconnect_backoff_s: float = _RECONNECT_BACKOFF_S,
     health_poll_interval_s: float = _HEALTH_POLL_INTERVAL_S,
 ) -> None:
-    """Background task: LISTEN on the fleet-events channel and bridge events.
+    """Background task: subscribe to the fleet-events channel and bridge events.
 
-    Runs until cancelled. Reconnects with a fixed backoff whenever the
-    connection is lost or cannot be established — a listener that
+    Runs until cancelled on the process notification hub (or *hub*), which
+    reconnects whenever its LISTEN connection is lost — a listener that
     permanently exits after one connection blip would silently recreate the
     exact failure mode this bridge exists to fix (the Live indicator stays
-    green while events stop arriving).
+    green while events stop arriving).  Events published during a gap are
+    not replayed; the gap is logged.
 
-    Parameters are injectable for testing: pass ``connect`` to target a
-    specific database (e.g. a testcontainers instance) instead of the
-    process environment, and ``on_notify`` to observe/override the bridge
-    callback.
+    Parameters are injectable for testing: pass ``connect`` to run a private
+    hub on a specific database (e.g. a testcontainers instance) instead of
+    the process environment, and ``on_notify`` to observe/override the
+    bridge callback.
     """
-    connect_fn = connect or _connect_listener
     notify_cb = on_notify or _on_notify
 
-    while True:
-        conn: asyncpg.Connection | None = None
-        try:
-            conn = await connect_fn()
-            await conn.add_listener(FLEET_EVENTS_CHANNEL, notify_cb)
-            logger.info("fleet_events_bridge: LISTEN active on channel %r", FLEET_EVENTS_CHANNEL)
-            while not conn.is_closed():
-                await asyncio.sleep(health_poll_interval_s)
-            logger.warning("fleet_events_bridge: LISTEN connection closed; reconnecting")
-        except asyncio.CancelledError:
-            raise
-        except Exception:
+    def _handle(item: Notification | NotificationGap) -> None:
+        if isinstance(item, NotificationGap):
             logger.warning(
-                "fleet_events_bridge: LISTEN connection error; reconnecting", exc_info=True
+                "fleet_events_bridge: missed fleet events (%s, %d dropped)",
+                item.reason,
+                item.dropped,
             )
-        finally:
-            # Defensive on every step, not just close(): a connection object
-            # in an unexpected state (e.g. a pool-acquired proxy that was
-            # already released/detached) can raise from is_closed() itself,
-            # not just from close(). Any such failure here must still let
-            # the reconnect loop continue rather than propagate and kill the
-            # whole listener task -- that would silently and permanently
-            # stop the bridge, exactly the failure mode it exists to avoid.
-            with contextlib.suppress(Exception):
-                if conn is not None and not conn.is_closed():
-                    await conn.close()
-
-        await asyncio.sleep(reconnect_backoff_s)
+            return
+        notify_cb(item.channel, item.payload)
+
+    await consume_channel(
+        FLEET_EVENTS_CHANNEL,
+        _handle,
+        hub=hub,
+        connect=connect,
+        reconnect_backoff_s=reconnect_backoff_s,
+        health_poll_interval_s=health_poll_interval_s,
+    )
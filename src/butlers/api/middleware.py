@@ -20,7 +20,9 @@ as 500 responses with a stack trace in the server logs.  This prevents endpoint
 bugs from silently masquerading as butler-routing errors.
 
 Also provides ``ApiKeyMiddleware`` for optional API-key authentication on all
-``/api/*`` routes (excluding health endpoints).
+``/api/*`` routes (excluding health endpoints), and ``DbProfileMiddleware``,
+which reports per-request database round trips when ``BUTLERS_DB_PROFILE`` is
+set.
 
 Security doctrine (``about/heart-and-soul/security.md``, RFC-0008): the PRIMARY
 trust boundary is **network isolation** — all host ports bind to ``127.0.0.1``
@@ -49,6 +51,7 @@ from butlers.api.deps import ButlerNotFoundError, ButlerUnreachableError
 from butlers.api.models import ErrorDetail, ErrorResponse
 from butlers.api.routers.audit import AuditTableNotAvailableError
 from butlers.core.approval_callbacks import APPROVAL_CALLBACK_CONNECTOR_TOKEN_HEADER
+from butlers.db_profiler import profile_operation
 
 logger = logging.getLogger(__name__)
 
@@ -277,6 +280,35 @@ class ApiKeyMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+class DbProfileMiddleware(BaseHTTPMiddleware):
+    """Profile the database round trips of every ``/api/*`` request.
+
+    Registered by ``create_app()`` only when ``BUTLERS_DB_PROFILE`` is set.
+    Each request is one :func:`~butlers.db_profiler.profile_operation` named
+    after its method and route template (``GET /api/butlers/{name}``), so
+    fan-outs and helper calls are attributed to the page that caused them.
+    The totals are returned in a ``Server-Timing`` header, which the browser's
+    network panel shows next to the request.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if not request.url.path.startswith("/api/"):
+            return await call_next(request)
+
+        with profile_operation(f"{request.method} unmatched") as profile:
+            response = await call_next(request)
+            if profile is None:
+                return response
+            route = request.scope.get("route")
+            template = getattr(route, "path", None)
+            if template:
+                profile.operation = f"{request.method} {template}"
+        response.headers["Server-Timing"] = (
+            f'db;dur={profile.db_time_s * 1000:.1f};desc="{profile.queries} queries"'
+        )
+        return response
+
+
 def register_error_handlers(app: FastAPI) -> None:
     """Attach all exception handlers to the FastAPI application.
 
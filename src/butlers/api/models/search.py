@@ -1,8 +1,9 @@
 """Search-specific Pydantic models.
 
 Provides ``SearchResult`` and ``SearchResponse`` for the cross-butler
-fan-out search endpoint that queries sessions, state, entities, and
-contacts across butler databases and the shared schema.
+search endpoint that queries sessions, state, entities, and contacts across
+butler databases and the shared schema — and, when the shared search index
+is installed, facts, transactions, and calendar events too.
 """
 
 from __future__ import annotations
@@ -38,13 +39,22 @@ class SearchResult(BaseModel):
 
 
 class SearchResponse(BaseModel):
-    """Grouped search results from a cross-butler fan-out search.
+    """Grouped search results from a cross-butler search.
 
     Results are grouped by category: entities, contacts, sessions, and
-    state entries.
+    state entries.  ``facts``, ``transactions``, and ``calendar_events`` are
+    only populated from the shared search index (``search_v2``); the fan-out
+    fallback leaves them empty.
+
+    ``next_cursor`` is set when any category has more results; pass it back
+    as ``cursor`` (with the same ``q``) for the next page of those categories.
     """
 
     entities: list[SearchResult] = Field(default_factory=list)
     contacts: list[SearchResult] = Field(default_factory=list)
     sessions: list[SearchResult] = Field(default_factory=list)
     state: list[SearchResult] = Field(default_factory=list)
+    facts: list[SearchResult] = Field(default_factory=list)
+    transactions: list[SearchResult] = Field(default_factory=list)
+    calendar_events: list[SearchResult] = Field(default_factory=list)
+    next_cursor: str | None = None
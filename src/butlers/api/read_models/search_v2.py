@@ -0,0 +1,311 @@
+"""Search read-model v2 — one ranked query over ``public.search_documents``.
+
+``search_v1`` fans ILIKE queries out to every butler schema.  v2 reads the
+shared index built by core_206 (plus mem_011, finance_013 and rel_035), which
+triggers keep current for entities, contacts, facts, sessions, state,
+transactions and calendar events.  A single statement matches documents by
+prefix full-text (``search_vector @@ 'word:*'``) or substring trigram
+(``search_text LIKE '%q%'``), ranks them by ``ts_rank_cd + similarity``, and
+returns the top ``limit`` per document kind after an optional keyset cursor.
+
+The index is optional: :func:`search_index_available` reports whether the
+table and ``pg_trgm`` exist, and the endpoint falls back to ``search_v1``
+otherwise (pre-migration DBs, legacy pools without a schema, a failing index
+query).
+
+Public surface
+--------------
+Constants:
+    DOC_KINDS
+
+Row DTO / page:
+    SearchDocumentRow
+    SearchDocumentPage
+
+Functions:
+    search_index_available(pool) -> bool
+    schema_owners(db) -> dict[str, str] | None
+    encode_search_cursor(q, after) -> str
+    decode_search_cursor(cursor, q) -> dict[str, tuple[float, str, str]]
+    query_search_documents(pool, q, limit, schemas, *, after=None)
+        -> SearchDocumentPage
+
+Version marker:
+    READ_MODEL_VERSION
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import asyncpg
+
+from butlers.api.db import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+#: Stability contract — bump to ``search_v3`` for breaking changes.
+READ_MODEL_VERSION = "search_v2"
+
+#: Document kinds written to ``public.search_documents``.
+DOC_KINDS: tuple[str, ...] = (
+    "entity",
+    "contact",
+    "fact",
+    "session",
+    "state",
+    "transaction",
+    "calendar_event",
+)
+
+#: ``source_schema`` of the shared-schema documents (entities, contacts).
+SHARED_SCHEMA = "public"
+
+_INDEX_PROBE_SQL = (
+    "SELECT to_regclass('public.search_documents') IS NOT NULL"
+    " AND EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+)
+
+# $1 lowered query, $2 prefix tsquery text (NULL when q has no word
+# characters), $3 visible schemas, $4 LIKE pattern, $5..$8 per-kind keyset
+# (NULL rank = first page for that kind), $9 rows per kind.
+_SEARCH_SQL = """
+WITH page AS (
+    SELECT c.kind, c.after_rank, c.after_schema, c.after_id
+    FROM unnest($5::text[], $6::float8[], $7::text[], $8::text[])
+        AS c(kind, after_rank, after_schema, after_id)
+),
+hits AS (
+    SELECT d.doc_kind, d.source_schema, d.source_id, d.title, d.body, d.snippet, d.sort_at,
+           (COALESCE(ts_rank_cd(d.search_vector, to_tsquery('simple', $2)), 0)
+            + similarity(d.search_text, $1))::float8 AS rank
+    FROM public.search_documents d
+    WHERE d.source_schema = ANY($3::text[])
+      AND (d.search_vector @@ to_tsquery('simple', $2) OR d.search_text LIKE $4)
+),
+ranked AS (
+    SELECT h.*,
+           row_number() OVER (
+               PARTITION BY h.doc_kind
+               ORDER BY h.rank DESC, h.source_schema, h.source_id
+           ) AS kind_position
+    FROM hits h
+    JOIN page p ON p.kind = h.doc_kind
+    WHERE p.after_rank IS NULL
+       OR h.rank < p.after_rank
+       OR (h.rank = p.after_rank AND (h.source_schema, h.source_id) > (p.after_schema, p.after_id))
+)
+SELECT doc_kind, source_schema, source_id, title, body, snippet, sort_at, rank
+FROM ranked
+WHERE kind_position <= $9
+ORDER BY doc_kind, kind_position
+"""
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# Positive probe result; the index never disappears under a running API.
+_index_available = False
+
+
+@dataclass
+class SearchDocumentRow:
+    """Typed DTO for one ``public.search_documents`` hit (v2)."""
+
+    doc_kind: str
+    source_schema: str
+    source_id: str
+    title: str
+    body: str
+    snippet: str | None
+    sort_at: datetime | None
+    rank: float
+
+
+@dataclass
+class SearchDocumentPage:
+    """Hits grouped by document kind, plus the keyset for the next page.
+
+    ``after`` maps each kind that has more hits to the ``(rank, source_schema,
+    source_id)`` of its last returned row; it is empty on the last page.
+    """
+
+    rows: dict[str, list[SearchDocumentRow]] = field(default_factory=dict)
+    after: dict[str, tuple[float, str, str]] = field(default_factory=dict)
+
+
+def row_to_document(row: asyncpg.Record) -> SearchDocumentRow:
+    """Convert an asyncpg Record to a :class:`SearchDocumentRow`."""
+    return SearchDocumentRow(
+        doc_kind=row["doc_kind"],
+        source_schema=row["source_schema"],
+        source_id=row["source_id"],
+        title=row["title"],
+        body=row["body"],
+        snippet=row["snippet"],
+        sort_at=row["sort_at"],
+        rank=float(row["rank"]),
+    )
+
+
+def reset_search_index_probe_for_tests() -> None:
+    """Test helper to forget a positive :func:`search_index_available` probe."""
+    global _index_available
+    _index_available = False
+
+
+async def search_index_available(pool: asyncpg.Pool) -> bool:
+    """Return whether ``public.search_documents`` and ``pg_trgm`` are installed.
+
+    Only a positive answer is cached, so the endpoint switches to the index
+    as soon as the migration lands.  Any probe error reads as unavailable.
+    """
+    global _index_available
+    if _index_available:
+        return True
+    try:
+        available = await pool.fetchval(_INDEX_PROBE_SQL)
+    except Exception:
+        logger.debug("Search index probe failed; using the fan-out search", exc_info=True)
+        return False
+    _index_available = available is True
+    return _index_available
+
+
+def schema_owners(db: DatabaseManager) -> dict[str, str] | None:
+    """Map each registered butler schema (domain and memory) to its butler.
+
+    Returns ``None`` when any butler runs on a legacy pool without a schema:
+    its documents cannot be attributed, so the caller must use the fan-out.
+    The first butler registered for a shared memory schema owns its facts.
+    """
+    owners: dict[str, str] = {}
+    for name in db.butler_names:
+        schema = db.schema_for_butler(name)
+        if schema is None:
+            return None
+        owners.setdefault(schema, name)
+        memory_schema = db.memory_schema_for_butler(name)
+        if memory_schema is not None:
+            owners.setdefault(memory_schema, name)
+    return owners
+
+
+def encode_search_cursor(q: str, after: dict[str, tuple[float, str, str]]) -> str:
+    """Encode the per-kind keyset of a page into an opaque cursor string.
+
+    The query text is embedded so a cursor cannot be replayed against a
+    different search.
+    """
+    payload = {"q": q, "after": {kind: list(key) for kind, key in after.items()}}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_search_cursor(cursor: str, q: str) -> dict[str, tuple[float, str, str]]:
+    """Decode a cursor from :func:`encode_search_cursor` for query *q*.
+
+    Raises
+    ------
+    ValueError
+        If the cursor is malformed, names an unknown kind, or was issued for a
+        different query.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["q"] != q:
+            raise ValueError("cursor was issued for a different query")
+        after = {
+            str(kind): (float(rank), str(schema), str(source_id))
+            for kind, (rank, schema, source_id) in payload["after"].items()
+        }
+    except (KeyError, ValueError, TypeError, AttributeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid search cursor: {exc}") from exc
+    unknown = set(after) - set(DOC_KINDS)
+    if unknown:
+        raise ValueError(f"Invalid search cursor: unknown kinds {sorted(unknown)}")
+    return after
+
+
+def prefix_tsquery(q: str) -> str | None:
+    """Return a ``'simple'`` tsquery matching every word of *q* as a prefix.
+
+    ``"ali smi"`` → ``"ali:* & smi:*"``; ``None`` when *q* has no word
+    characters (the substring match alone then applies).
+    """
+    words = _WORD_RE.findall(q.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def like_pattern(q: str) -> str:
+    """Return a ``LIKE`` substring pattern for lowered *q* with wildcards escaped."""
+    escaped = q.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def query_search_documents(
+    pool: asyncpg.Pool,
+    q: str,
+    limit: int,
+    schemas: list[str],
+    *,
+    after: dict[str, tuple[float, str, str]] | None = None,
+) -> SearchDocumentPage:
+    """Run the ranked index search and return up to *limit* hits per kind.
+
+    Parameters
+    ----------
+    pool:
+        Any asyncpg pool (``public.search_documents`` is shared).
+    q:
+        Raw search text.
+    limit:
+        Maximum hits per document kind.
+    schemas:
+        ``source_schema`` values visible to this dashboard (the registered
+        butler schemas); the shared schema is always included.
+    after:
+        Per-kind keyset from the previous page (:func:`decode_search_cursor`).
+        Kinds missing from it are exhausted and skipped; ``None`` starts at
+        the first page of every kind.
+
+    Errors propagate: the endpoint falls back to the fan-out on failure.
+    """
+    if after is None:
+        keyset: dict[str, tuple[float | None, str | None, str | None]] = {
+            kind: (None, None, None) for kind in DOC_KINDS
+        }
+    else:
+        keyset = dict(after)
+    page = SearchDocumentPage()
+    if not keyset:
+        return page
+
+    kinds = list(keyset)
+    args: tuple[Any, ...] = (
+        q.lower(),
+        prefix_tsquery(q),
+        sorted({*schemas, SHARED_SCHEMA}),
+        like_pattern(q),
+        kinds,
+        [keyset[kind][0] for kind in kinds],
+        [keyset[kind][1] for kind in kinds],
+        [keyset[kind][2] for kind in kinds],
+        limit + 1,
+    )
+    records = await pool.fetch(_SEARCH_SQL, *args)
+
+    for record in records:
+        page.rows.setdefault(record["doc_kind"], []).append(row_to_document(record))
+    for kind, rows in page.rows.items():
+        if len(rows) > limit:
+            del rows[limit:]
+            last = rows[-1]
+            page.after[kind] = (last.rank, last.source_schema, last.source_id)
+    return page
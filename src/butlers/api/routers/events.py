@@ -38,7 +38,6 @@ from __future__ import annotations
 import asyncio
 import collections
 import hmac
-import json
 import logging
 import os
 import time
@@ -46,6 +45,8 @@ from typing import Any
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
+from butlers import json_codec
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/events", tags=["events"])
@@ -180,18 +181,18 @@ async def events_stream(
     try:
         snapshot = {"type": "snapshot", "ts": time.time(), "events": list(_events_ring)}
         try:
-            await websocket.send_text(json.dumps(snapshot))
+            await websocket.send_text(json_codec.dumps(snapshot))
         except WebSocketDisconnect:
             return
 
         while True:
             try:
                 event = await asyncio.wait_for(queue.get(), timeout=_EVENTS_HEARTBEAT_INTERVAL_S)
-                await websocket.send_text(json.dumps(event))
+                await websocket.send_text(json_codec.dumps(event))
             except TimeoutError:
                 try:
                     await websocket.send_text(
-                        json.dumps({"type": "heartbeat", "ts": time.time(), "data": {}})
+                        json_codec.dumps({"type": "heartbeat", "ts": time.time(), "data": {}})
                     )
                 except WebSocketDisconnect:
                     break
@@ -1,11 +1,14 @@
-"""Search endpoint — cross-butler fan-out ILIKE search.
+"""Search endpoint — cross-butler search over the shared index or a fan-out.
 
 Provides:
 
 - ``router`` — search endpoint at ``GET /api/search``
 
-Searches sessions (prompt, result) and state (key, value::text) across all
-butler databases using the ``search_v1`` read-model boundary.  Also searches
+When ``public.search_documents`` (core_206) is installed, the endpoint runs one
+ranked, keyset-paginated query through the ``search_v2`` read model covering
+entities, contacts, facts, sessions, state, transactions, and calendar events.
+Otherwise it falls back to the ``search_v1`` fan-out: sessions (prompt,
+result) and state (key, value::text) across all butler databases, plus
 entities and contacts (person entities) in the shared schema.  Returns grouped
 results with id, butler name, type, title, snippet, and navigation URL.
 """
@@ -14,7 +17,7 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from butlers.api.db import DatabaseManager
 from butlers.api.models import ApiMeta, ApiResponse
@@ -25,6 +28,15 @@ from butlers.api.read_models.search_v1 import (
     query_session_search,
     query_state_search,
 )
+from butlers.api.read_models.search_v2 import (
+    SHARED_SCHEMA,
+    SearchDocumentRow,
+    decode_search_cursor,
+    encode_search_cursor,
+    query_search_documents,
+    schema_owners,
+    search_index_available,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +99,85 @@ def _extract_snippet(text: str, query: str, max_len: int = 200) -> str:
 
 
 # ---------------------------------------------------------------------------
-# GET /api/search — cross-butler fan-out search
+# Search index (search_v2) path
+# ---------------------------------------------------------------------------
+
+# Doc kind -> SearchResponse group.
+_KIND_GROUPS = {
+    "entity": "entities",
+    "contact": "contacts",
+    "fact": "facts",
+    "session": "sessions",
+    "state": "state",
+    "transaction": "transactions",
+    "calendar_event": "calendar_events",
+}
+
+# Butler label of the shared-schema documents (matches the fan-out path).
+_SHARED_KIND_BUTLERS = {"entity": "memory", "contact": "relationship"}
+
+
+def _document_to_result(doc: SearchDocumentRow, butler: str, query: str) -> SearchResult:
+    """Render one index hit the way the fan-out path renders its category."""
+    kind = doc.doc_kind
+    urls = {
+        "entity": f"/entities/{doc.source_id}",
+        "contact": f"/contacts/{doc.source_id}",
+        "fact": f"/memory/facts/{doc.source_id}",
+        "session": f"/sessions/{doc.source_id}",
+        "state": f"/butlers/{butler}",
+        "transaction": f"/butlers/{butler}",
+        "calendar_event": "/calendar",
+    }
+    fallback_titles = {"contact": "Unnamed", "session": "Session"}
+    return SearchResult(
+        id=f"{butler}:{doc.source_id}" if kind == "state" else doc.source_id,
+        butler=butler,
+        type=kind,
+        title=doc.title or fallback_titles.get(kind, ""),
+        snippet=doc.snippet if doc.snippet is not None else _extract_snippet(doc.body, query),
+        url=urls[kind],
+    )
+
+
+async def _index_search(
+    db: DatabaseManager,
+    pool: object,
+    q: str,
+    limit: int,
+    after: dict[str, tuple[float, str, str]] | None,
+) -> SearchResponse | None:
+    """Serve the search from ``public.search_documents``.
+
+    Returns ``None`` when the index is not installed, a butler has no schema
+    to attribute its documents to, or the index query fails — the caller then
+    uses the fan-out.
+    """
+    if not await search_index_available(pool):
+        return None
+    owners = schema_owners(db)
+    if owners is None:
+        return None
+    try:
+        page = await query_search_documents(pool, q, limit, list(owners), after=after)
+    except Exception:
+        logger.warning("Search index query failed; falling back to the fan-out", exc_info=True)
+        return None
+
+    groups: dict[str, list[SearchResult]] = {group: [] for group in _KIND_GROUPS.values()}
+    for kind, docs in page.rows.items():
+        for doc in docs:
+            if doc.source_schema == SHARED_SCHEMA:
+                butler = _SHARED_KIND_BUTLERS.get(kind, SHARED_SCHEMA)
+            else:
+                butler = owners[doc.source_schema]
+            groups[_KIND_GROUPS[kind]].append(_document_to_result(doc, butler, q))
+    next_cursor = encode_search_cursor(q, page.after) if page.after else None
+    return SearchResponse(**groups, next_cursor=next_cursor)
+
+
+# ---------------------------------------------------------------------------
+# GET /api/search — cross-butler search
 # ---------------------------------------------------------------------------
 
 
@@ -95,11 +185,24 @@ def _extract_snippet(text: str, query: str, max_len: int = 200) -> str:
 async def search(
     q: str = Query("", description="Search query (ILIKE pattern)"),
     limit: int = Query(20, ge=1, le=100, description="Max results per category"),
+    cursor: str | None = Query(
+        None,
+        description=(
+            "Opaque cursor from the previous page's ``next_cursor`` field (same ``q``). "
+            "Omit to fetch the first page."
+        ),
+    ),
     db: DatabaseManager = Depends(_get_db_manager),
 ) -> ApiResponse[SearchResponse]:
     """Search across butler databases and shared schema.
 
-    Searches:
+    With the shared search index installed, one ranked query returns the
+    best ``limit`` matches per category (prefix full-text or substring),
+    including **facts**, **transactions**, and **calendar_events**, and a
+    ``next_cursor`` for categories with more matches.  Otherwise the
+    fan-out below runs (no pagination).
+
+    Fan-out searches:
     - **entities** — canonical name and aliases in ``public.entities``
     - **contacts** — person entities by canonical name, email, and phone via
       ``public.entities`` / ``relationship.entity_facts``
@@ -111,6 +214,14 @@ async def search(
     if not q.strip():
         return ApiResponse[SearchResponse](data=SearchResponse())
 
+    # Validate the cursor early so a malformed value is a clean 422.
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_search_cursor(cursor, q)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=f"Invalid cursor: {exc}") from exc
+
     pattern = f"%{q}%"
     entity_results: list[SearchResult] = []
     contact_results: list[SearchResult] = []
@@ -136,6 +247,15 @@ async def search(
         entity_degraded = ["entities"]
         contact_degraded = ["contacts"]
 
+    if pool is not None:
+        indexed = await _index_search(db, pool, q, limit, after)
+        if indexed is not None:
+            return ApiResponse[SearchResponse](data=indexed)
+    if after is not None:
+        # Cursors are only issued by the index path; without the index there
+        # is no further page to serve.
+        return ApiResponse[SearchResponse](data=SearchResponse())
+
     if pool is not None:
         entity_rows, entity_degraded = await query_entity_search(pool, pattern, limit)
         for entity_row in entity_rows:
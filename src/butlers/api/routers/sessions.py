@@ -824,20 +824,22 @@ async def get_butler_daily_activity(
 # Butler-scoped analytics: GET /api/butlers/{name}/analytics/hourly-activity
 # ---------------------------------------------------------------------------
 
+# Query-budget: reads the session_usage_hourly rollup (core_203) -- at most
+# window_hours x (trigger_source, model) rows, independent of session volume.
+# Hours are UTC-aligned to match the rollup's buckets.
 _HOURLY_ACTIVITY_SQL = """
 WITH hours AS (
   SELECT generate_series(
-    DATE_TRUNC('hour', NOW()) - (($1 - 1) * INTERVAL '1 hour'),
-    DATE_TRUNC('hour', NOW()),
+    DATE_TRUNC('hour', NOW(), 'UTC') - (($1 - 1) * INTERVAL '1 hour'),
+    DATE_TRUNC('hour', NOW(), 'UTC'),
     '1 hour'
   ) AS hour_start
 )
 SELECT
   h.hour_start,
-  COUNT(s.id) AS sessions_count
+  COALESCE(SUM(u.sessions), 0)::bigint AS sessions_count
 FROM hours h
-LEFT JOIN sessions s ON s.started_at >= h.hour_start
-                    AND s.started_at < h.hour_start + INTERVAL '1 hour'
+LEFT JOIN session_usage_hourly u ON u.bucket_start = h.hour_start
 GROUP BY 1
 ORDER BY 1 DESC
 """
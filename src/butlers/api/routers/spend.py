@@ -129,25 +129,28 @@ def _get_db_manager() -> DatabaseManager | None:
 # The Spend dashboard's dollar-bearing aggregate surfaces share this single
 # ledger spine. `sessions.model` describes the model requested for a session,
 # not necessarily the catalog entry that actually executed it, so it is only
-# suitable for diagnostics below -- never for pricing.
+# suitable for diagnostics below -- never for pricing. The spine is read from
+# `public.token_usage_hourly` (core_203), the trigger-maintained hourly rollup
+# of the ledger; UTC-day bounds always cover whole buckets.
 _LEDGER_USAGE_BY_DAY_SQL = """
 SELECT
-    (tul.recorded_at AT TIME ZONE 'UTC')::date AS day,
-    tul.butler_name AS butler_name,
-    COALESCE(tul.purpose, 'unknown') AS purpose,
+    (tuh.bucket_start AT TIME ZONE 'UTC')::date AS day,
+    tuh.butler_name AS butler_name,
+    tuh.purpose AS purpose,
     mc.model_id AS model_id,
-    COUNT(*)::bigint AS calls,
-    COALESCE(SUM(tul.input_tokens), 0)::bigint AS input_tokens,
-    COALESCE(SUM(tul.output_tokens), 0)::bigint AS output_tokens,
-    COALESCE(SUM(tul.cached_input_tokens), 0)::bigint AS cached_input_tokens,
-    COALESCE(SUM(tul.cache_creation_tokens), 0)::bigint AS cache_creation_tokens
-FROM public.token_usage_ledger tul
-JOIN public.model_catalog mc ON mc.id = tul.catalog_entry_id
-WHERE tul.recorded_at >= $1
-  AND tul.recorded_at < $2
-  AND ($3::text IS NULL OR tul.butler_name = $3)
-GROUP BY day, tul.butler_name, COALESCE(tul.purpose, 'unknown'), mc.model_id
-ORDER BY day, tul.butler_name, purpose, mc.model_id
+    SUM(tuh.calls)::bigint AS calls,
+    SUM(tuh.input_tokens)::bigint AS input_tokens,
+    SUM(tuh.output_tokens)::bigint AS output_tokens,
+    SUM(tuh.cached_input_tokens)::bigint AS cached_input_tokens,
+    SUM(tuh.cache_creation_tokens)::bigint AS cache_creation_tokens
+FROM public.token_usage_hourly tuh
+JOIN public.model_catalog mc ON mc.id = tuh.catalog_entry_id
+WHERE tuh.bucket_start >= $1
+  AND tuh.bucket_start < $2
+  AND ($3::text IS NULL OR tuh.butler_name = $3)
+GROUP BY day, tuh.butler_name, tuh.purpose, mc.model_id
+HAVING SUM(tuh.calls) > 0
+ORDER BY day, tuh.butler_name, purpose, mc.model_id
 """
 
 _HISTORICAL_MODEL_ATTRIBUTION_CUTOFF = date(2026, 7, 10)
@@ -1358,25 +1361,26 @@ async def get_costs_by_schedule(
     return ApiResponse[list[ScheduleCost]](data=all_costs, meta=meta)
 
 
-# Aggregate current-month token usage per (purpose, model_id) directly from the
-# shared cross-butler ledger (bu-qvnce.12/core_156).  Unlike butler/model/feature,
-# this dimension is not a per-butler fan-out -- ``purpose`` lives on
+# Aggregate current-month token usage per (purpose, model_id) from the hourly
+# rollup of the shared cross-butler ledger (bu-qvnce.12/core_156, core_203).
+# Unlike butler/model/feature, this dimension is not a per-butler fan-out -- ``purpose`` lives on
 # ``public.token_usage_ledger`` itself, so a single query against any pool that can
 # see ``public`` (the "switchboard" pool, matching ``spend_rules``/``spend_ceiling``
 # elsewhere in this router) answers it for the whole fleet.  Mirrors
 # ``model_routing._MTD_USAGE_BY_MODEL_SQL`` with an added ``purpose`` grouping key.
 _MTD_USAGE_BY_PURPOSE_SQL = """
 SELECT
-    COALESCE(tul.purpose, 'unknown') AS purpose,
+    tuh.purpose AS purpose,
     mc.model_id AS model_id,
-    COALESCE(SUM(tul.input_tokens), 0)  AS input_tokens,
-    COALESCE(SUM(tul.output_tokens), 0) AS output_tokens,
-    COALESCE(SUM(tul.cached_input_tokens), 0)   AS cached_input_tokens,
-    COALESCE(SUM(tul.cache_creation_tokens), 0) AS cache_creation_tokens
-FROM public.token_usage_ledger tul
-JOIN public.model_catalog mc ON mc.id = tul.catalog_entry_id
-WHERE tul.recorded_at >= date_trunc('month', now() AT TIME ZONE 'UTC')
-GROUP BY COALESCE(tul.purpose, 'unknown'), mc.model_id
+    SUM(tuh.input_tokens)::bigint  AS input_tokens,
+    SUM(tuh.output_tokens)::bigint AS output_tokens,
+    SUM(tuh.cached_input_tokens)::bigint   AS cached_input_tokens,
+    SUM(tuh.cache_creation_tokens)::bigint AS cache_creation_tokens
+FROM public.token_usage_hourly tuh
+JOIN public.model_catalog mc ON mc.id = tuh.catalog_entry_id
+WHERE tuh.bucket_start >= date_trunc('month', now() AT TIME ZONE 'UTC')
+GROUP BY tuh.purpose, mc.model_id
+HAVING SUM(tuh.calls) > 0
 """
 
 
@@ -6,7 +6,6 @@ Streams butler status changes and session lifecycle events.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 from collections.abc import AsyncGenerator
@@ -15,6 +14,8 @@ from fastapi import APIRouter
 from starlette.requests import Request
 from starlette.responses import StreamingResponse
 
+from butlers import json_codec
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["sse"])
@@ -49,7 +50,7 @@ async def _event_generator(request: Request) -> AsyncGenerator[str, None]:
     _subscribers.append(queue)
     try:
         # Send initial connected event
-        yield f"event: connected\ndata: {json.dumps({'status': 'ok'})}\n\n"
+        yield f"event: connected\ndata: {json_codec.dumps({'status': 'ok'})}\n\n"
 
         while True:
             if await request.is_disconnected():
@@ -58,7 +59,7 @@ async def _event_generator(request: Request) -> AsyncGenerator[str, None]:
                 event = await asyncio.wait_for(queue.get(), timeout=30.0)
                 if event is _SHUTDOWN:
                     break
-                yield f"event: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+                yield f"event: {event['type']}\ndata: {json_codec.dumps(event['data'])}\n\n"
             except TimeoutError:
                 # Send keepalive comment every 30s to prevent connection timeout
                 yield ": keepalive\n\n"
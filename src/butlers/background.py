@@ -16,12 +16,18 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
 
 from butlers.core.memory_hooks import bind_memory_maintenance_dispatch
 from butlers.core.model_routing import Complexity
+from butlers.core.scheduler_wheel import (
+    SchedulerWheel,
+    register_scheduler_wheel,
+    unregister_scheduler_wheel,
+)
 from butlers.core.tool_call_capture import (
     reset_current_approval_push_runtime,
     reset_current_codex_auth_authority,
@@ -201,6 +207,7 @@ async def scheduler_loop(
     completion_hooks: dict[str, Any] | None = None,
     get_eligibility_pool: Callable[[], Any] | None = None,
     default_timezone: str = "UTC",
+    timing_wheel_resync_s: float | None = None,
 ) -> None:
     """Periodically call tick() to dispatch due scheduled tasks.
 
@@ -252,6 +259,12 @@ async def scheduler_loop(
         ``timezone`` column is the default ``'UTC'`` sentinel (e.g. TOML
         schedules).  Forwarded to ``tick_fn`` so hour-pinned crons fire in the
         owner's local time.  Defaults to ``"UTC"``.
+    timing_wheel_resync_s:
+        When set, the loop keeps a :class:`~butlers.core.scheduler_wheel.
+        SchedulerWheel` (fully resynced from the DB every this many seconds)
+        and passes it to ``tick_fn`` as ``wheel=`` so idle ticks issue no
+        queries.  The initial load is fail-soft: if it raises, the loop logs a
+        warning and ticks without a wheel.  ``None`` (the default) disables it.
     """
 
     async def _scheduler_notify_fn(envelope: dict) -> None:
@@ -298,6 +311,21 @@ async def scheduler_loop(
         butler_name,
     )
 
+    wheel = None
+    if timing_wheel_resync_s is not None:
+        wheel = SchedulerWheel(resync_interval_s=timing_wheel_resync_s)
+        try:
+            await wheel.sync(pool, datetime.now(UTC))
+        except Exception:
+            logger.warning(
+                "Scheduler loop: timing wheel load failed for butler %s; ticking without it",
+                butler_name,
+                exc_info=True,
+            )
+            wheel = None
+        else:
+            register_scheduler_wheel(pool, wheel)
+
     try:
         while True:
             await asyncio.sleep(interval)
@@ -312,6 +340,7 @@ async def scheduler_loop(
                     completion_hooks=completion_hooks,
                     eligibility_pool=eligibility_pool,
                     default_timezone=default_timezone,
+                    wheel=wheel,
                 )
             )
             try:
@@ -339,6 +368,9 @@ async def scheduler_loop(
                 )
     except asyncio.CancelledError:
         logger.info("Scheduler loop cancelled for butler %s", butler_name)
+    finally:
+        if wheel is not None:
+            unregister_scheduler_wheel(pool)
 
 
 # ---------------------------------------------------------------------------
@@ -83,8 +83,20 @@ def cli() -> None:
     default=DEFAULT_BUTLERS_DIR,
     help="Directory containing butler configs",
 )
-def up(only: tuple[str, ...], butlers_dir: Path) -> None:
+@click.option(
+    "--shared-db-pool",
+    "shared_db_pool",
+    is_flag=True,
+    default=False,
+    help=(
+        "Serve every butler from one process-wide PostgreSQL pool routed per schema "
+        "(same as BUTLERS_DB_SHARED_POOL=1)"
+    ),
+)
+def up(only: tuple[str, ...], butlers_dir: Path, shared_db_pool: bool) -> None:
     """Start all butler daemons (or filtered by --only)."""
+    if shared_db_pool:
+        os.environ["BUTLERS_DB_SHARED_POOL"] = "1"
     # Flatten: support both --only a --only b and --only a,b
     only = tuple(name.strip() for entry in only for name in entry.split(",") if name.strip())
 
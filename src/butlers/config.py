@@ -219,11 +219,18 @@ class SchedulerConfig:
 
     Also controls the liveness reporter loop that periodically sends HTTP POST
     to the Switchboard's /api/switchboard/heartbeat endpoint.
+
+    ``timing_wheel`` enables the in-memory due index
+    (:mod:`butlers.core.scheduler_wheel`) that lets idle ticks skip the DB
+    entirely; ``timing_wheel_resync_seconds`` bounds how long a write made by
+    another process (e.g. the dashboard API) can go unnoticed by it.
     """
 
     tick_interval_seconds: int = 60
     heartbeat_interval_seconds: int = 120
     switchboard_url: str = "http://localhost:41200"
+    timing_wheel: bool = True
+    timing_wheel_resync_seconds: int = 600
 
 
 @dataclass
@@ -839,6 +846,14 @@ def load_config(config_dir: Path) -> ButlerConfig:
             f"Invalid butler.scheduler.heartbeat_interval_seconds: {heartbeat_interval_seconds!r}. "
             "Must be a positive integer."
         )
+    timing_wheel = bool(scheduler_section.get("timing_wheel", True))
+    raw_wheel_resync = scheduler_section.get("timing_wheel_resync_seconds", 600)
+    timing_wheel_resync_seconds = int(raw_wheel_resync)
+    if timing_wheel_resync_seconds <= 0:
+        raise ConfigError(
+            "Invalid butler.scheduler.timing_wheel_resync_seconds: "
+            f"{timing_wheel_resync_seconds!r}. Must be a positive integer."
+        )
     # Switchboard URL for liveness reporter: env var > toml > default
     _default_sb_url = os.environ.get("BUTLERS_SWITCHBOARD_URL", "http://localhost:41200")
     switchboard_liveness_url = scheduler_section.get("switchboard_url", _default_sb_url)
@@ -846,6 +861,8 @@ def load_config(config_dir: Path) -> ButlerConfig:
         tick_interval_seconds=tick_interval_seconds,
         heartbeat_interval_seconds=heartbeat_interval_seconds,
         switchboard_url=switchboard_liveness_url,
+        timing_wheel=timing_wheel,
+        timing_wheel_resync_seconds=timing_wheel_resync_seconds,
     )
 
     # --- [buffer] top-level section ---
@@ -27,6 +27,16 @@ Key behaviors:
   ``aw-watcher-web`` event by timestamp and derives a hostname-only
   ``browser_domain`` sub-bucket. Raw web URLs and tab titles stay in the
   sensitive evidence JSON and never enter the ingest envelope.
+- AFK and web buckets are parsed once per poll into sorted timelines
+  (``AfkTimeline`` / ``BrowserDomainTimeline``) and the time-ordered window
+  events are correlated against them with ``bisect`` lookups, so a long
+  backfill costs O(events log intervals) rather than O(events x intervals)
+- Consecutive window events with the same app, title, AFK status and browser
+  domain, separated by at most ``ACTIVITYWATCH_EPISODE_MAX_GAP_S``, are
+  coalesced into one episode before envelopes are built (one ``ingest`` call
+  and one evidence row per episode). The trailing episode is only sent once
+  it is closed — by a different event or by the gap elapsing — so a window
+  that is still focused is never ingested with a truncated duration
 - Bounded first-run backfill (``ACTIVITYWATCH_MAX_BACKFILL_DAYS``, default 30)
   so a long-running local AW install does not flood the system on first
   connect (RFC per "first poll baseline" connector obligation)
@@ -67,7 +77,10 @@ Environment variables:
 - ACTIVITYWATCH_MAX_BACKFILL_DAYS (optional, default 30): bound on how far
   back the very first poll (no checkpoint yet) looks for history.
 - ACTIVITYWATCH_MIN_EVENT_DURATION_S (optional, default 0): skip window
-  events shorter than this many seconds (noise reduction).
+  episodes shorter than this many seconds (noise reduction).
+- ACTIVITYWATCH_EPISODE_MAX_GAP_S (optional, default 5): largest gap between
+  two identical consecutive window events that still coalesces them into
+  one episode.
 - ACTIVITYWATCH_RETENTION_DAYS (optional, default 14): data retention in
   days for connectors.activitywatch_events. Rows older than this are
   purged every 6 hours. Defaults shorter than OwnTracks' 30-day location
@@ -90,6 +103,8 @@ Security requirements:
 from __future__ import annotations
 
 import asyncio
+import bisect
+import itertools
 import logging
 import os
 import signal
@@ -142,6 +157,7 @@ _DEFAULT_POLL_INTERVAL_S = 60
 _DEFAULT_HEALTH_PORT = 40092
 _DEFAULT_MAX_BACKFILL_DAYS = 30
 _DEFAULT_MIN_EVENT_DURATION_S = 0.0
+_DEFAULT_EPISODE_MAX_GAP_S = 5.0
 _DEFAULT_EVENT_LIMIT = 2000
 
 # Retention (bu-il04h): connectors.activitywatch_events durably stores
@@ -291,6 +307,7 @@ class ActivityWatchConnectorConfig:
     poll_interval_s: int = _DEFAULT_POLL_INTERVAL_S
     max_backfill_days: int = _DEFAULT_MAX_BACKFILL_DAYS
     min_event_duration_s: float = _DEFAULT_MIN_EVENT_DURATION_S
+    episode_max_gap_s: float = _DEFAULT_EPISODE_MAX_GAP_S
     ingestion_tier: Literal["metadata", "full"] = _TIER_METADATA
     retention_days: int = _DEFAULT_RETENTION_DAYS
 
@@ -361,6 +378,7 @@ class ActivityWatchConnectorConfig:
             min_event_duration_s=_float(
                 "ACTIVITYWATCH_MIN_EVENT_DURATION_S", _DEFAULT_MIN_EVENT_DURATION_S
             ),
+            episode_max_gap_s=_float("ACTIVITYWATCH_EPISODE_MAX_GAP_S", _DEFAULT_EPISODE_MAX_GAP_S),
             ingestion_tier=ingestion_tier,
             retention_days=retention_days,
             health_port=_int("CONNECTOR_HEALTH_PORT", _DEFAULT_HEALTH_PORT),
@@ -720,6 +738,59 @@ def _to_utc_instant(timestamp: datetime) -> datetime | None:
     return timestamp.astimezone(UTC)
 
 
+class BrowserDomainTimeline:
+    """Web-watcher events parsed once and indexed by start instant.
+
+    Entries are kept in ``(start, domain)`` order, so the latest-start match
+    for an instant is the first entry, scanning back from the last start at or
+    before it, whose end is still after it.  ``_reach[i]`` (the latest end
+    among the first ``i + 1`` entries) bounds that scan: once it is at or
+    before the instant no earlier entry can match.
+    """
+
+    def __init__(self, web_events: list[dict[str, Any]]) -> None:
+        entries: list[tuple[datetime, str, int, datetime, dict[str, Any]]] = []
+        for index, event in enumerate(web_events):
+            try:
+                raw_timestamp = event["timestamp"]
+                if not isinstance(raw_timestamp, str):
+                    continue
+                start = _to_utc_instant(_parse_aw_timestamp(raw_timestamp))
+                duration_seconds = float(event.get("duration", 0.0))
+                data = event.get("data")
+                raw_url = data.get("url") if isinstance(data, dict) else None
+                domain = _normalize_browser_hostname(raw_url)
+                if start is None or domain is None or duration_seconds <= 0:
+                    continue
+                end = start + timedelta(seconds=duration_seconds)
+            except (KeyError, OverflowError, TypeError, ValueError):
+                continue
+            # -index: among equal (start, domain) the earliest event wins,
+            # as with max() over the events in their original order.
+            entries.append((start, domain, -index, end, event))
+        entries.sort(key=lambda entry: entry[:3])
+
+        self._starts = [entry[0] for entry in entries]
+        self._domains = [entry[1] for entry in entries]
+        self._ends = [entry[3] for entry in entries]
+        self._events = [entry[4] for entry in entries]
+        self._reach = list(itertools.accumulate(self._ends, max))
+
+    def match(self, window_ts: datetime) -> BrowserDomainMatch | None:
+        """Return the web event covering *window_ts*; see :func:`match_browser_domain`."""
+        instant = _to_utc_instant(window_ts)
+        if instant is None:
+            return None
+        index = bisect.bisect_right(self._starts, instant) - 1
+        while index >= 0 and self._reach[index] > instant:
+            if self._ends[index] > instant:
+                return BrowserDomainMatch(
+                    domain=self._domains[index], raw_event=self._events[index]
+                )
+            index -= 1
+        return None
+
+
 def match_browser_domain(
     window_ts: datetime,
     web_events: list[dict[str, Any]],
@@ -732,37 +803,12 @@ def match_browser_domain(
     breaks deterministically by hostname. All comparisons use UTC instants;
     offset-free ActivityWatch timestamps are UTC by protocol, while malformed
     source data is ignored.
-    """
-
-    instant = _to_utc_instant(window_ts)
-    if instant is None:
-        return None
-
-    candidates: list[tuple[datetime, str, dict[str, Any]]] = []
-    for event in web_events:
-        try:
-            raw_timestamp = event["timestamp"]
-            if not isinstance(raw_timestamp, str):
-                continue
-            start = _to_utc_instant(_parse_aw_timestamp(raw_timestamp))
-            duration_seconds = float(event.get("duration", 0.0))
-            data = event.get("data")
-            raw_url = data.get("url") if isinstance(data, dict) else None
-            domain = _normalize_browser_hostname(raw_url)
-            if start is None or domain is None or duration_seconds <= 0:
-                continue
-            end = start + timedelta(seconds=duration_seconds)
-        except (KeyError, OverflowError, TypeError, ValueError):
-            continue
-
-        if start <= instant < end:
-            candidates.append((start, domain, event))
 
-    if not candidates:
-        return None
+    For many lookups against the same events, build a
+    :class:`BrowserDomainTimeline` once and call its ``match``.
+    """
 
-    _, domain, raw_event = max(candidates, key=lambda candidate: (candidate[0], candidate[1]))
-    return BrowserDomainMatch(domain=domain, raw_event=raw_event)
+    return BrowserDomainTimeline(web_events).match(window_ts)
 
 
 async def fetch_buckets(client: httpx.AsyncClient) -> dict[str, dict[str, Any]]:
@@ -843,6 +889,30 @@ def build_afk_intervals(
     return intervals
 
 
+class AfkTimeline:
+    """AFK intervals indexed for ``O(log n)`` point lookups.
+
+    The earliest-starting interval with ``start <= ts <= end`` decides, even
+    when intervals overlap.  ``_reach[i]`` is the latest end among the first
+    ``i + 1`` intervals; it never decreases, so the first ``i`` with
+    ``_reach[i] >= ts`` is the only candidate — every earlier interval ends
+    before ``ts`` and every later one starts no earlier than interval ``i``.
+    """
+
+    def __init__(self, intervals: list[tuple[datetime, datetime, str]]) -> None:
+        ordered = sorted(intervals, key=lambda t: t[0])
+        self._starts = [start for start, _end, _status in ordered]
+        self._is_afk = [status == "afk" for _start, _end, status in ordered]
+        self._reach = list(itertools.accumulate((end for _start, end, _status in ordered), max))
+
+    def status_at(self, ts: datetime) -> bool | None:
+        """Return the AFK status at *ts*; see :func:`lookup_afk_status`."""
+        index = bisect.bisect_left(self._reach, ts)
+        if index == len(self._starts) or self._starts[index] > ts:
+            return None
+        return self._is_afk[index]
+
+
 def lookup_afk_status(
     intervals: list[tuple[datetime, datetime, str]],
     ts: datetime,
@@ -850,12 +920,72 @@ def lookup_afk_status(
     """Return True if *ts* falls within an ``"afk"`` interval, False if ``"not-afk"``.
 
     Returns ``None`` if no AFK bucket data covers *ts* (AFK watcher not
-    installed, or gap in AFK data).
+    installed, or gap in AFK data).  For many lookups against the same
+    intervals, build an :class:`AfkTimeline` once and call ``status_at``.
     """
-    for start, end, status in intervals:
-        if start <= ts <= end:
-            return status == "afk"
-    return None
+    return AfkTimeline(intervals).status_at(ts)
+
+
+@dataclass
+class WindowEpisode:
+    """One or more consecutive, identical window-focus events.
+
+    ``raw_event`` is the first source event; ``event_count`` and ``end``
+    grow as identical successors are coalesced into it.
+    """
+
+    ts: datetime
+    end: datetime
+    app: str
+    window_title: str | None
+    is_afk: bool | None
+    browser_match: BrowserDomainMatch | None
+    raw_event: dict[str, Any]
+    event_count: int = 1
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end - self.ts).total_seconds()
+
+    def continues_with(self, other: WindowEpisode, max_gap_s: float) -> bool:
+        """Whether *other* repeats this episode's window after a short gap."""
+        return (
+            other.app == self.app
+            and other.window_title == self.window_title
+            and other.is_afk == self.is_afk
+            and _match_domain(other.browser_match) == _match_domain(self.browser_match)
+            and other.ts >= self.ts
+            and (other.ts - self.end).total_seconds() <= max_gap_s
+        )
+
+    def evidence_event(self) -> dict[str, Any]:
+        """The raw event to persist: the first source event, widened when coalesced."""
+        if self.event_count == 1:
+            return self.raw_event
+        return {
+            **self.raw_event,
+            "duration": self.duration_seconds,
+            "coalesced_event_count": self.event_count,
+        }
+
+
+def _match_domain(match: BrowserDomainMatch | None) -> str | None:
+    return match.domain if match is not None else None
+
+
+def coalesce_window_episodes(
+    episodes: list[WindowEpisode], *, max_gap_s: float
+) -> list[WindowEpisode]:
+    """Merge time-ordered single-event episodes into maximal identical runs."""
+    merged: list[WindowEpisode] = []
+    for episode in episodes:
+        if merged and merged[-1].continues_with(episode, max_gap_s):
+            current = merged[-1]
+            current.end = max(current.end, episode.end)
+            current.event_count += episode.event_count
+        else:
+            merged.append(episode)
+    return merged
 
 
 # ---------------------------------------------------------------------------
@@ -1269,7 +1399,12 @@ class ActivityWatchConnector:
             self._events_today = 0
             self._events_today_date = now_date
 
-        latest_ts = since
+        # Window events arrive time-ordered (fetch_events sorts them), so one
+        # forward pass correlates each against the AFK/web timelines, and the
+        # identical runs are coalesced into episodes before anything is sent.
+        afk_timeline = AfkTimeline(afk_intervals)
+        web_timeline = BrowserDomainTimeline(web_events)
+        singles: list[WindowEpisode] = []
         for event in window_events:
             try:
                 ts = _parse_aw_timestamp(event["timestamp"])
@@ -1278,50 +1413,78 @@ class ActivityWatchConnector:
                 app = str(data.get("app") or "unknown")
                 window_title = data.get("title")
                 window_title = str(window_title) if window_title else None
-            except (KeyError, TypeError, ValueError) as exc:
+                end = ts + timedelta(seconds=duration_seconds)
+            except (KeyError, OverflowError, TypeError, ValueError) as exc:
                 logger.warning("ActivityWatchConnector: skipping malformed event: %s", exc)
                 continue
 
-            if latest_ts is None or ts > latest_ts:
-                latest_ts = ts
-
-            if duration_seconds < self._config.min_event_duration_s:
-                continue
-
             app_class = classify_app(app)
-            is_afk = lookup_afk_status(afk_intervals, ts)
-            browser_match = match_browser_domain(ts, web_events) if app_class == "browser" else None
-
             activitywatch_events_received_total.labels(
                 endpoint_identity=self._endpoint_identity, app_class=app_class
             ).inc()
-
-            try:
-                await self._process_window_event(
-                    bucket_id=window_bucket_id,
+            singles.append(
+                WindowEpisode(
                     ts=ts,
-                    duration_seconds=duration_seconds,
+                    end=end,
                     app=app,
                     window_title=window_title,
-                    app_class=app_class,
-                    is_afk=is_afk,
+                    is_afk=afk_timeline.status_at(ts),
+                    browser_match=web_timeline.match(ts) if app_class == "browser" else None,
                     raw_event=event,
+                )
+            )
+
+        episodes = coalesce_window_episodes(singles, max_gap_s=self._config.episode_max_gap_s)
+        # The trailing episode is still open while the window keeps focus or a
+        # continuation can still arrive within the gap: ActivityWatch extends
+        # it in place and its start timestamp (hence its idempotency key) never
+        # changes, so sending it now would dedupe every later, longer version
+        # away. Hold it back and leave the checkpoint at its start so the next
+        # poll rebuilds it until a later event (or the gap elapsing) closes it.
+        open_episode: WindowEpisode | None = None
+        if episodes and (datetime.now(UTC) - episodes[-1].end).total_seconds() <= (
+            self._config.episode_max_gap_s
+        ):
+            open_episode = episodes.pop()
+
+        for episode in episodes:
+            if episode.duration_seconds < self._config.min_event_duration_s:
+                continue
+
+            browser_match = episode.browser_match
+            try:
+                await self._process_window_event(
+                    bucket_id=window_bucket_id,
+                    ts=episode.ts,
+                    duration_seconds=episode.duration_seconds,
+                    app=episode.app,
+                    window_title=episode.window_title,
+                    app_class=classify_app(episode.app),
+                    is_afk=episode.is_afk,
+                    raw_event=episode.evidence_event(),
                     browser_domain=(browser_match.domain if browser_match is not None else None),
                     raw_web_event=(browser_match.raw_event if browser_match is not None else None),
                 )
                 self._last_event_at = datetime.now(UTC)
                 self._events_today += 1
             except Exception:
-                # Log and continue — a single bad event should not block the
+                # Log and continue — a single bad episode should not block the
                 # rest of the batch or wedge the checkpoint on a transient
-                # per-event failure. The event's idempotency_key means a
+                # per-event failure. The episode's idempotency_key means a
                 # future retry (if the checkpoint is re-run) stays safe.
                 logger.warning(
                     "ActivityWatchConnector: failed to process event at %s (non-fatal)",
-                    ts.isoformat(),
+                    episode.ts.isoformat(),
                     exc_info=True,
                 )
 
+        # Checkpoint at the start of the held-back open episode so the next
+        # poll re-fetches all of it; once every episode is closed, at the
+        # start of the last one (re-fetching it only rebuilds the same key).
+        if open_episode is not None:
+            latest_ts: datetime | None = open_episode.ts
+        else:
+            latest_ts = episodes[-1].ts if episodes else None
         if latest_ts is not None and (
             self._last_checkpoint_ts is None or latest_ts > self._last_checkpoint_ts
         ):
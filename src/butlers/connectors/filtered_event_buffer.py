@@ -343,11 +343,16 @@ class FilteredEventBuffer:
         )
 
     async def flush(self, pool: asyncpg.Pool) -> None:
-        """Batch-INSERT all buffered events then clear the buffer.
+        """Take all buffered events and batch-INSERT them.
 
         A single ``executemany`` call is issued so there is exactly one network
         round-trip per flush regardless of buffer size.
 
+        The buffer is swapped out before the first ``await``, so concurrent
+        flushes (one buffer shared by several chats' flush tasks) each write a
+        disjoint batch, and events recorded while a flush is in flight stay
+        buffered for the next one.
+
         If the buffer is empty the call is a no-op (no SQL executed).
 
         Before inserting, ensures the monthly partition for the current
@@ -366,7 +371,7 @@ class FilteredEventBuffer:
         if not self._rows:
             return
 
-        rows_to_flush = list(self._rows)
+        rows_to_flush, self._rows = self._rows, []
 
         try:
             # Ensure the monthly partition exists before inserting.  Must run on
@@ -388,10 +393,8 @@ class FilteredEventBuffer:
                 self._endpoint_identity,
                 exc_info=True,
             )
-            self._rows.clear()
             return
 
-        self._rows.clear()
         logger.debug(
             "Flushed %d filtered events: connector_type=%s, endpoint=%s",
             len(rows_to_flush),
@@ -39,6 +39,10 @@ Environment variables:
 - HA_WS_PONG_TIMEOUT_S (default: 10): WebSocket pong wait timeout
 - HA_DISCRETION_TIMEOUT_S (default: 5): discretion evaluator timeout
 - HA_EVENT_QUEUE_MAX (default: 100): max queued events before dropping oldest
+- HA_HISTORY_FLUSH_ROWS (default: 500): buffered history rows that trigger a COPY
+- HA_HISTORY_FLUSH_INTERVAL_S (default: 5): max seconds a history row stays buffered
+- HA_HISTORY_DOWNSAMPLE_AFTER_DAYS (default: 0 = off): roll numeric history rows
+  older than this into 5-minute buckets (``connectors.home_assistant_history_5m``)
 
 Metrics exported (HA-specific, in addition to standard ConnectorMetrics):
   Counters:
@@ -86,7 +90,7 @@ from butlers.connectors.metrics import ConnectorMetrics
 from butlers.ingestion_policy import IngestionEnvelope, IngestionPolicyEvaluator
 
 if TYPE_CHECKING:
-    pass
+    from butlers.connectors.home_assistant_history import HAHistoryWriter
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +109,8 @@ _DEFAULT_WS_PING_INTERVAL_S = 30
 _DEFAULT_WS_PONG_TIMEOUT_S = 10
 _DEFAULT_DISCRETION_TIMEOUT_S = 5
 _DEFAULT_EVENT_QUEUE_MAX = 100
+_DEFAULT_HISTORY_FLUSH_ROWS = 500
+_DEFAULT_HISTORY_FLUSH_INTERVAL_S = 5
 # Wall-clock window an event is held in the reorder buffer before it becomes
 # eligible for submission. HA-internal batching delivers out-of-order events
 # within the same WebSocket burst (sub-second), so a short window is enough to
@@ -1107,6 +1113,9 @@ class HAConnectorConfig:
     ws_pong_timeout_s: int = _DEFAULT_WS_PONG_TIMEOUT_S
     discretion_timeout_s: int = _DEFAULT_DISCRETION_TIMEOUT_S
     event_queue_max: int = _DEFAULT_EVENT_QUEUE_MAX
+    history_flush_rows: int = _DEFAULT_HISTORY_FLUSH_ROWS
+    history_flush_interval_s: int = _DEFAULT_HISTORY_FLUSH_INTERVAL_S
+    history_downsample_after_days: int = 0
     domain_allowlist: frozenset[str] = field(
         default_factory=lambda: frozenset(_DEFAULT_DOMAIN_ALLOWLIST)
     )
@@ -1168,6 +1177,11 @@ class HAConnectorConfig:
             ws_pong_timeout_s=_int("HA_WS_PONG_TIMEOUT_S", _DEFAULT_WS_PONG_TIMEOUT_S),
             discretion_timeout_s=_int("HA_DISCRETION_TIMEOUT_S", _DEFAULT_DISCRETION_TIMEOUT_S),
             event_queue_max=_int("HA_EVENT_QUEUE_MAX", _DEFAULT_EVENT_QUEUE_MAX),
+            history_flush_rows=_int("HA_HISTORY_FLUSH_ROWS", _DEFAULT_HISTORY_FLUSH_ROWS),
+            history_flush_interval_s=_int(
+                "HA_HISTORY_FLUSH_INTERVAL_S", _DEFAULT_HISTORY_FLUSH_INTERVAL_S
+            ),
+            history_downsample_after_days=_int("HA_HISTORY_DOWNSAMPLE_AFTER_DAYS", 0),
             domain_allowlist=domain_allowlist,
             wellness_promotion_enabled=_bool("HA_WELLNESS_PROMOTION_ENABLED", True),
             wellness_rules_extra=wellness_rules_extra,
@@ -1602,6 +1616,10 @@ async def persist_ha_history(
 ) -> bool:
     """Insert one row into ``connectors.home_assistant_history``.
 
+    The connector process batches these writes through
+    :class:`~butlers.connectors.home_assistant_history.HAHistoryWriter`; this
+    single-row helper remains for one-off writes.
+
     Idempotency: the table has no unique constraint on (entity_id, recorded_at)
     by design — each HA event produces a distinct row because ``recorded_at``
     carries millisecond precision from ``time_fired``.  Duplicate suppression
@@ -1759,6 +1777,7 @@ async def _main() -> None:
 
     from butlers.connectors.home_assistant_checkpoint import load_ha_checkpoint
     from butlers.connectors.home_assistant_filter import HAFilterPersistence
+    from butlers.connectors.home_assistant_history import HAHistoryWriter, run_downsample_loop
     from butlers.connectors.home_assistant_pipeline import HAFilterPipeline, HAFilterPipelineConfig
     from butlers.core.logging import configure_logging
     from butlers.credential_store import resolve_owner_entity_info, shared_db_name_from_env
@@ -1894,6 +1913,17 @@ async def _main() -> None:
     global_ingestion_policy = IngestionPolicyEvaluator(scope="global", db_pool=db_pool)
     await global_ingestion_policy.ensure_loaded()
 
+    # History rows are COPY-batched; the writer also owns checkpoint saves so
+    # the checkpoint never advances past a row that is still buffered.
+    history_writer: HAHistoryWriter | None = None
+    if db_pool is not None:
+        history_writer = HAHistoryWriter(
+            db_pool,
+            endpoint_identity=endpoint_identity,
+            flush_rows=config.history_flush_rows,
+            flush_interval_s=config.history_flush_interval_s,
+        )
+
     # ------------------------------------------------------------------
     # Tasks 3.1–3.6 + 5–9: Real event dispatch (WS + REST fallback share it)
     # ------------------------------------------------------------------
@@ -1908,6 +1938,7 @@ async def _main() -> None:
         resume_ts=resume_ts,
         ha_filter_persistence=ha_filter_persistence,
         global_ingestion_policy=global_ingestion_policy,
+        history_writer=history_writer,
     )
 
     # Reorder buffer: HA can deliver events slightly out of time_fired order
@@ -1978,6 +2009,19 @@ async def _main() -> None:
     # Run the WS client; stop when a signal arrives
     ws_task = asyncio.create_task(ws_client.run())
     flush_task = asyncio.create_task(_reorder_flush_loop())
+    background_tasks: list[asyncio.Task[None]] = []
+    if history_writer is not None:
+        background_tasks.append(asyncio.create_task(history_writer.run(stop_event)))
+    if db_pool is not None and config.history_downsample_after_days > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                run_downsample_loop(
+                    db_pool,
+                    stop_event,
+                    older_than_days=config.history_downsample_after_days,
+                )
+            )
+        )
     await stop_event.wait()
 
     logger.info("HAConnector: shutting down")
@@ -1998,6 +2042,15 @@ async def _main() -> None:
         await reorder_buffer.flush_all()
     except Exception:
         logger.warning("ha-connector: error draining reorder buffer on shutdown", exc_info=True)
+    # The history loop does a final flush once stop_event is set; wait for it
+    # (after the reorder drain above, which may still have added rows).
+    for task in background_tasks:
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+    if history_writer is not None:
+        await history_writer.flush()
     await connector.stop_heartbeat()
 
     if db_pool is not None:
@@ -2015,6 +2068,7 @@ def _make_event_dispatcher(
     resume_ts: Any,
     ha_filter_persistence: Any,
     global_ingestion_policy: IngestionPolicyEvaluator | None = None,
+    history_writer: HAHistoryWriter | None = None,
 ) -> _EventDispatch:
     """Build the HA event dispatcher shared by the WS client and REST poller.
 
@@ -2023,6 +2077,11 @@ def _make_event_dispatcher(
     three-layer filter pipeline, submits surviving events to the Switchboard,
     and advances the checkpoint with the transport currently in use
     (``"websocket"`` or ``"rest_fallback"``).
+
+    With a ``history_writer``, history rows are buffered and checkpoint
+    advances are deferred to the writer, which saves them after the buffered
+    rows are flushed.  Without one, each row and checkpoint is written
+    directly.
     """
     from butlers.connectors.home_assistant_checkpoint import save_ha_checkpoint
     from butlers.connectors.home_assistant_envelope import (
@@ -2035,6 +2094,12 @@ def _make_event_dispatcher(
     # Tracked entity count for metrics
     _tracked_entities: set[str] = set()
 
+    async def _advance_checkpoint(event_ts: Any, entity_id: str, transport: str) -> None:
+        if history_writer is not None:
+            history_writer.note_checkpoint(event_ts, entity_id, transport)
+        elif db_pool is not None:
+            await save_ha_checkpoint(db_pool, endpoint_identity, event_ts, entity_id, transport)
+
     def _resolve_transport(transport: str | None) -> str:
         """Checkpoint transport literal for this dispatch.
 
@@ -2144,10 +2209,7 @@ def _make_event_dispatcher(
                 return
 
             connector.on_event_received(passed_all_filters=True)
-            if db_pool is not None:
-                await save_ha_checkpoint(
-                    db_pool, endpoint_identity, event_ts, entity_id, active_transport
-                )
+            await _advance_checkpoint(event_ts, entity_id, active_transport)
             return
 
         # state_changed: extract old/new state and run filter pipeline
@@ -2317,7 +2379,14 @@ def _make_event_dispatcher(
             return
 
         # Persist person.* state-change events to the history evidence table
-        if domain == "person" and db_pool is not None:
+        if domain == "person" and history_writer is not None:
+            await history_writer.add(
+                entity_id=entity_id,
+                state=new_state_str,
+                attributes=new_attrs or None,
+                recorded_at=event_ts,
+            )
+        elif domain == "person" and db_pool is not None:
             await persist_ha_history(
                 db_pool,
                 entity_id=entity_id,
@@ -2327,10 +2396,7 @@ def _make_event_dispatcher(
             )
 
         # Update checkpoint after successful Switchboard submission
-        if db_pool is not None:
-            await save_ha_checkpoint(
-                db_pool, endpoint_identity, event_ts, entity_id, active_transport
-            )
+        await _advance_checkpoint(event_ts, entity_id, active_transport)
 
         # Flush filtered event buffer and drain replay queue
         await ha_filter_persistence.flush()
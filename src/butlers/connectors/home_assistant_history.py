@@ -0,0 +1,314 @@
+"""Buffered COPY writer and downsampling for ``connectors.home_assistant_history``.
+
+The Home Assistant connector used to issue one ``INSERT`` per persisted state
+change (see :func:`butlers.connectors.home_assistant.persist_ha_history`).
+:class:`HAHistoryWriter` instead accumulates rows in memory and writes them
+with a single ``COPY`` (``copy_records_to_table``) once ``flush_rows`` rows
+are buffered or ``flush_interval_s`` seconds have passed, whichever comes
+first.
+
+Restart safety
+--------------
+Buffered rows are not yet durable, so the HA checkpoint must not move past
+them: an event behind the checkpoint is skipped on restart.  While a writer is
+wired, the dispatcher hands every checkpoint advance to
+:meth:`HAHistoryWriter.note_checkpoint` instead of saving it directly.  Only
+the latest noted checkpoint is kept, and it is saved through
+:func:`~butlers.connectors.home_assistant_checkpoint.save_ha_checkpoint` right
+after the ``COPY`` commits.  A crash therefore replays every event whose row
+was still buffered (the Switchboard dedupes the ingest side), and checkpoint
+writes drop from one per event to one per flush.
+
+A failed ``COPY`` keeps the rows and the pending checkpoint for the next
+attempt.  Rows are never dropped: once ``max_buffered_rows`` are retained,
+:meth:`HAHistoryWriter.add` applies backpressure, retrying the flush every
+``flush_interval_s`` before it returns.  The dispatcher notes the event's
+checkpoint only after ``add`` returns, so the HA stream stalls instead of the
+checkpoint moving past rows that were never written.
+
+Partitions
+----------
+The table is ``PARTITION BY RANGE (recorded_at)`` with one partition per UTC
+month (core_205).  Before each ``COPY`` the writer calls
+``connectors.home_assistant_history_ensure_partition`` once for every month in
+the batch it has not already ensured.
+
+Downsampling
+------------
+:func:`downsample_ha_history` moves numeric-state rows older than a cutoff
+into ``connectors.home_assistant_history_5m`` as per-entity 5-minute
+min/max/mean buckets, in one statement.  Non-numeric states (``person.*``
+presence such as ``home`` / ``not_home``) are never touched — Chronicler
+projects episodes from them.  The connector runs it periodically only when
+``HA_HISTORY_DOWNSAMPLE_AFTER_DAYS`` is set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = "connectors"
+_TABLE = "home_assistant_history"
+_COLUMNS = ("entity_id", "state", "attributes", "recorded_at")
+
+DEFAULT_FLUSH_ROWS = 500
+DEFAULT_FLUSH_INTERVAL_S = 5.0
+# Retained rows when the database is unreachable: ~20 flushes' worth.
+DEFAULT_MAX_BUFFERED_ROWS = 10_000
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+_ENSURE_PARTITION_SQL = "SELECT connectors.home_assistant_history_ensure_partition($1)"
+
+# Numeric HA states: integers, decimals and exponent notation.  Anything else
+# (``on``/``off``, ``home``, ``unavailable``) stays in the raw table.
+_NUMERIC_STATE_PATTERN = r"^[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?$"
+
+_DOWNSAMPLE_SQL = """\
+WITH moved AS (
+    DELETE FROM connectors.home_assistant_history
+    WHERE recorded_at < $1
+      AND state ~ $2
+    RETURNING entity_id, state::double precision AS value, recorded_at
+)
+INSERT INTO connectors.home_assistant_history_5m AS b (
+    entity_id, bucket_start, min_value, max_value, mean_value, sample_count
+)
+SELECT entity_id,
+       date_bin('5 minutes', recorded_at, TIMESTAMPTZ '2000-01-01 00:00:00+00'),
+       min(value),
+       max(value),
+       avg(value),
+       count(*)
+FROM moved
+GROUP BY 1, 2
+ON CONFLICT (entity_id, bucket_start) DO UPDATE SET
+    min_value = LEAST(b.min_value, EXCLUDED.min_value),
+    max_value = GREATEST(b.max_value, EXCLUDED.max_value),
+    mean_value = (b.mean_value * b.sample_count + EXCLUDED.mean_value * EXCLUDED.sample_count)
+                 / (b.sample_count + EXCLUDED.sample_count),
+    sample_count = b.sample_count + EXCLUDED.sample_count
+"""
+
+
+def _month_start(ts: datetime) -> datetime:
+    ts = ts.astimezone(UTC)
+    return ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+# ---------------------------------------------------------------------------
+# HAHistoryWriter
+# ---------------------------------------------------------------------------
+
+
+class HAHistoryWriter:
+    """Buffer ``home_assistant_history`` rows and flush them with ``COPY``.
+
+    Args:
+        pool: asyncpg pool (``connector_writer`` role) with the JSONB codec
+            registered.
+        endpoint_identity: HA endpoint the pending checkpoint belongs to.
+        flush_rows: Buffered row count that triggers an immediate flush.
+        flush_interval_s: Period of :meth:`run`'s time-based flush.
+        max_buffered_rows: Retained rows at which :meth:`add` blocks until a
+            flush succeeds.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        *,
+        endpoint_identity: str,
+        flush_rows: int = DEFAULT_FLUSH_ROWS,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_buffered_rows: int = DEFAULT_MAX_BUFFERED_ROWS,
+    ) -> None:
+        self._pool = pool
+        self._endpoint_identity = endpoint_identity
+        self._flush_rows = max(1, flush_rows)
+        self._flush_interval_s = flush_interval_s
+        self._max_buffered_rows = max(self._flush_rows, max_buffered_rows)
+        self._rows: list[tuple[str, str | None, dict[str, Any] | None, datetime]] = []
+        self._pending_checkpoint: tuple[datetime, str, str] | None = None
+        self._ensured_months: set[datetime] = set()
+        self._lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def flush_interval_s(self) -> float:
+        """Seconds between time-based flushes in :meth:`run`."""
+        return self._flush_interval_s
+
+    async def add(
+        self,
+        *,
+        entity_id: str,
+        state: str | None,
+        attributes: dict[str, Any] | None,
+        recorded_at: datetime,
+    ) -> None:
+        """Buffer one history row, flushing when ``flush_rows`` is reached.
+
+        While the database is unreachable and ``max_buffered_rows`` are
+        retained, this retries the flush every ``flush_interval_s`` and only
+        returns once the buffer has been written.
+        """
+        self._rows.append((entity_id, state, attributes, recorded_at))
+        if len(self._rows) >= self._flush_rows:
+            await self.flush()
+        while len(self._rows) >= self._max_buffered_rows:
+            logger.warning(
+                "ha-connector: history buffer holds %d rows; pausing events until a flush succeeds",
+                len(self._rows),
+            )
+            await asyncio.sleep(self._flush_interval_s)
+            await self.flush()
+
+    def note_checkpoint(self, event_ts: datetime, entity_id: str, transport: str) -> None:
+        """Record the checkpoint to save once the buffered rows are durable.
+
+        Only the latest call is kept; events reach the dispatcher in
+        ``time_fired`` order.
+        """
+        self._pending_checkpoint = (event_ts, entity_id, transport)
+
+    async def flush(self) -> bool:
+        """Write buffered rows with one ``COPY``, then save the pending checkpoint.
+
+        Never raises.  Returns ``True`` when everything buffered at call time
+        was written (or nothing was buffered), ``False`` when the ``COPY``
+        failed and the rows were kept for the next attempt.
+        """
+        async with self._lock:
+            rows = self._rows
+            checkpoint = self._pending_checkpoint
+            if not rows and checkpoint is None:
+                return True
+            self._rows = []
+            self._pending_checkpoint = None
+
+            if rows:
+                started = asyncio.get_running_loop().time()
+                try:
+                    await self._ensure_partitions(rows)
+                    async with self._pool.acquire() as conn:
+                        await conn.copy_records_to_table(
+                            _TABLE, schema_name=_SCHEMA, columns=_COLUMNS, records=rows
+                        )
+                except Exception:
+                    self._retain(rows, checkpoint)
+                    logger.warning(
+                        "ha-connector: failed to flush %d history rows; retaining %d for retry",
+                        len(rows),
+                        len(self._rows),
+                        exc_info=True,
+                    )
+                    return False
+                logger.debug(
+                    "ha-connector: flushed %d history rows in %.1f ms",
+                    len(rows),
+                    (asyncio.get_running_loop().time() - started) * 1000,
+                )
+
+            if checkpoint is not None:
+                # Looked up at call time so tests can patch the checkpoint module.
+                from butlers.connectors import home_assistant_checkpoint
+
+                event_ts, entity_id, transport = checkpoint
+                await home_assistant_checkpoint.save_ha_checkpoint(
+                    self._pool, self._endpoint_identity, event_ts, entity_id, transport
+                )
+            return True
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Flush every ``flush_interval_s`` until *stop_event* is set, then once more."""
+        try:
+            while not stop_event.is_set():
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self._flush_interval_s)
+                except TimeoutError:
+                    pass
+                await self.flush()
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            logger.warning("ha-connector: history flush loop error", exc_info=True)
+
+    def __len__(self) -> int:
+        """Return the number of buffered (not yet flushed) rows."""
+        return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _ensure_partitions(self, rows: list[tuple[Any, ...]]) -> None:
+        # Autocommit (pool.execute) so the DDL survives a failing COPY.
+        for month in sorted({_month_start(row[3]) for row in rows} - self._ensured_months):
+            await self._pool.execute(_ENSURE_PARTITION_SQL, month)
+            self._ensured_months.add(month)
+
+    def _retain(self, rows: list[tuple[Any, ...]], checkpoint: tuple[Any, ...] | None) -> None:
+        # Rows added while the COPY was in flight are newer; keep them last.
+        # Nothing is dropped: the checkpoint may only cover written rows, and
+        # add() holds back new events once the buffer is full.
+        self._rows = rows + self._rows
+        if self._pending_checkpoint is None:
+            self._pending_checkpoint = checkpoint  # type: ignore[assignment]
+
+
+# ---------------------------------------------------------------------------
+# Downsampling
+# ---------------------------------------------------------------------------
+
+
+async def downsample_ha_history(pool: Any, *, older_than_days: int) -> int:
+    """Roll numeric raw rows older than *older_than_days* into 5-minute buckets.
+
+    Rows are deleted from ``connectors.home_assistant_history`` and merged into
+    ``connectors.home_assistant_history_5m`` in one statement, so a bucket that
+    already exists (from an earlier run straddling the cutoff) is combined
+    rather than duplicated.
+
+    Returns:
+        The number of buckets inserted or updated.
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=older_than_days)
+    status = await pool.execute(_DOWNSAMPLE_SQL, cutoff, _NUMERIC_STATE_PATTERN)
+    # asyncpg returns the command tag, e.g. "INSERT 0 42".
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def run_downsample_loop(
+    pool: Any,
+    stop_event: asyncio.Event,
+    *,
+    older_than_days: int,
+    interval_s: float = 3600.0,
+) -> None:
+    """Call :func:`downsample_ha_history` every *interval_s* until stopped."""
+    while not stop_event.is_set():
+        try:
+            buckets = await downsample_ha_history(pool, older_than_days=older_than_days)
+            if buckets:
+                logger.info("ha-connector: downsampled history into %d 5-minute buckets", buckets)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            logger.warning("ha-connector: history downsampling failed", exc_info=True)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval_s)
+        except TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            return
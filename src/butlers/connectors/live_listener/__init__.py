@@ -67,7 +67,11 @@ from butlers.connectors.live_listener.transcription import (
     WyomingTranscriptionClient,
     create_transcription_client,
 )
-from butlers.connectors.live_listener.vad import VadStateMachine
+from butlers.connectors.live_listener.vad import (
+    BatchedSileroVad,
+    BatchedVadDriver,
+    VadStateMachine,
+)
 
 __all__ = [
     # connector entrypoint
@@ -75,6 +79,8 @@ __all__ = [
     # audio/vad/config/metrics (original)
     "MicPipeline",
     "VadStateMachine",
+    "BatchedSileroVad",
+    "BatchedVadDriver",
     "LiveListenerConfig",
     "LiveListenerMetrics",
     # transcription
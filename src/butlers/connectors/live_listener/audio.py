@@ -1,7 +1,8 @@
 """Audio capture pipeline for the live-listener connector.
 
 Implements:
-- Lock-free ring buffer (``RingBuffer``) for PCM audio frames
+- Lock-free ring buffer (``RingBuffer``) for PCM audio frames, preallocated
+  once and read without per-frame allocation
 - ``MicPipeline``: sounddevice.InputStream → ring buffer → asyncio consumer
 - Device enumeration and validation against PortAudio device list
 - Device reconnection with exponential backoff
@@ -50,6 +51,11 @@ class RingBuffer:
 
     All reads / writes operate on fixed-size *chunks* of ``chunk_bytes`` bytes.
 
+    Storage is a single preallocated buffer.  ``read_view()`` copies the next
+    frame into a preallocated scratch frame and hands out a view of that, so
+    the consumer decodes frames without any per-frame allocation and without
+    racing the producer for the slot.
+
     Implementation notes:
         - ``_write_pos`` is updated only by the producer.
         - ``_read_pos`` is updated only by the consumer.
@@ -87,6 +93,10 @@ class RingBuffer:
 
         # Pre-allocate storage as a flat bytearray; each slot is chunk_bytes long.
         self._buf = bytearray(cap * chunk_bytes)
+        self._view = memoryview(self._buf)
+
+        # read_view() target: one frame the producer never writes to.
+        self._scratch = memoryview(bytearray(chunk_bytes))
 
         # Monotonically increasing positions (never wrap to keep logic simple)
         self._write_pos: int = 0
@@ -96,7 +106,7 @@ class RingBuffer:
     # Producer side (called from PortAudio C callback thread)
     # ------------------------------------------------------------------
 
-    def write(self, data: bytes | bytearray) -> None:
+    def write(self, data: bytes | bytearray | memoryview) -> None:
         """Write a single frame to the buffer.
 
         If the buffer is full, the oldest unread frame is silently overwritten.
@@ -112,7 +122,7 @@ class RingBuffer:
                 data = data[: self._chunk_bytes]
 
         slot = (self._write_pos & self._mask) * self._chunk_bytes
-        self._buf[slot : slot + self._chunk_bytes] = data
+        self._view[slot : slot + self._chunk_bytes] = data
         self._write_pos += 1
 
         # If the buffer was full, advance read_pos to drop the oldest frame
@@ -132,10 +142,33 @@ class RingBuffer:
         if self._read_pos >= self._write_pos:
             return None
         slot = (self._read_pos & self._mask) * self._chunk_bytes
-        frame = bytes(self._buf[slot : slot + self._chunk_bytes])
+        frame = bytes(self._view[slot : slot + self._chunk_bytes])
         self._read_pos += 1
         return frame
 
+    def read_view(self) -> memoryview | None:
+        """Read the next available frame without allocating.
+
+        The frame is copied out of its slot into the ring's scratch frame: once
+        the ring is full the slot just read is the producer's next write
+        target, so a view into the storage itself could be overwritten (torn)
+        while the consumer is still scoring it with the GIL released.  The
+        copy is a single memmove under the GIL, atomic with respect to
+        :meth:`write`.
+
+        The returned view aliases the scratch frame and is valid until the
+        next ``read_view()`` call.
+
+        Returns:
+            A memoryview of the frame, or ``None`` if the buffer is empty.
+        """
+        if self._read_pos >= self._write_pos:
+            return None
+        slot = (self._read_pos & self._mask) * self._chunk_bytes
+        self._scratch[:] = self._view[slot : slot + self._chunk_bytes]
+        self._read_pos += 1
+        return self._scratch
+
     @property
     def available(self) -> int:
         """Number of unread frames currently in the buffer."""
@@ -332,6 +365,8 @@ class MicPipeline:
         config: LiveListenerConfig,
         on_frame: Callable[[bytes], None] | None = None,
         _ring_buffer: RingBuffer | None = None,
+        *,
+        consume: bool = True,
     ) -> None:
         """Initialise the MicPipeline.
 
@@ -343,10 +378,14 @@ class MicPipeline:
                 silently discarded.  The callback runs in the asyncio event
                 loop (not in the PortAudio callback thread).
             _ring_buffer: Override the ring buffer (for testing).
+            consume: When ``False`` the pipeline keeps the stream open but does
+                not drain its ring buffer; an external driver (the batched
+                multi-mic VAD) pulls frames via :meth:`read_frame` instead.
         """
         self._spec = spec
         self._config = config
         self._on_frame = on_frame
+        self._consume = consume
         self._state = MicPipelineState()
 
         # ring_buffer_seconds * 1000 ms / 30 ms per frame
@@ -407,6 +446,17 @@ class MicPipeline:
     async def __aexit__(self, *args: Any) -> None:
         await self.stop()
 
+    def read_frame(self) -> memoryview | None:
+        """Pull the next frame as an allocation-free view (for ``consume=False`` pipelines).
+
+        Returns ``None`` when no frame is buffered.  See
+        :meth:`RingBuffer.read_view` for the view's lifetime.
+        """
+        frame = self._ring.read_view()
+        if frame is not None:
+            self._state.frames_read += 1
+        return frame
+
     # ------------------------------------------------------------------
     # Async frame iterator (convenience)
     # ------------------------------------------------------------------
@@ -507,9 +557,9 @@ class MicPipeline:
                     self._spec.name,
                     status,
                 )
-            # indata shape: (frames, 1) — mono channel, dtype=int16
-            # Flatten and convert to bytes
-            raw = bytes(indata.tobytes())
+            # indata shape: (frames, 1) — mono channel, dtype=int16.
+            # View it as flat bytes; the ring buffer copies each frame once.
+            raw = memoryview(indata).cast("B")
             # Write frame-by-frame into the ring buffer
             for offset in range(0, len(raw), FRAME_BYTES):
                 chunk = raw[offset : offset + FRAME_BYTES]
@@ -537,6 +587,13 @@ class MicPipeline:
 
     async def _consume_loop(self) -> None:
         """Drain the ring buffer and dispatch frames to the on_frame callback."""
+        if not self._consume:
+            # Frames are pulled externally via read_frame(); just hold the
+            # stream open until stopped.
+            while self._running:
+                await asyncio.sleep(0.5)
+            return
+
         while self._running:
             frame = self._ring.read()
             if frame is not None:
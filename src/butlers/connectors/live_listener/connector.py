@@ -88,10 +88,10 @@ from butlers.connectors.live_listener.transcription import (
     create_transcription_client,
 )
 from butlers.connectors.live_listener.vad import (
-    SileroVad,
+    BatchedSileroVad,
+    BatchedVadDriver,
     SpeechSegment,
     VadConfig,
-    VadStateMachine,
 )
 from butlers.connectors.mcp_client import CachedMCPClient
 from butlers.connectors.metrics import ConnectorMetrics
@@ -193,6 +193,12 @@ class LiveListenerConnector:
         # Pipeline tasks (one per mic)
         self._pipeline_tasks: dict[str, asyncio.Task] = {}
 
+        # Shared VAD: one Silero session scores every mic's frames in a single
+        # batched ONNX call per tick (per-mic LSTM state lives in its slot).
+        self._vad_model = BatchedSileroVad(model_path=config.vad_model_path or None)
+        self._vad_driver = BatchedVadDriver(self._vad_model)
+        self._vad_task: asyncio.Task | None = None
+
         # Background segment-processing tasks (fire-and-forget; held to prevent GC)
         self._background_tasks: set[asyncio.Task] = set()
 
@@ -290,7 +296,9 @@ class LiveListenerConnector:
         # Start health server
         self._start_health_server()
 
-        # Start per-mic pipelines
+        # Start the shared VAD driver, then per-mic pipelines (which register with it)
+        self._vad_model.load()
+        self._vad_task = asyncio.create_task(self._vad_driver.run(), name="live-listener-vad")
         for spec in self._config.devices:
             task = asyncio.create_task(
                 self._run_mic_pipeline(spec),
@@ -319,6 +327,14 @@ class LiveListenerConnector:
                 logger.exception("live-listener: error stopping pipeline for mic=%s", mic)
         self._pipeline_tasks.clear()
 
+        if self._vad_task is not None:
+            self._vad_task.cancel()
+            try:
+                await self._vad_task
+            except asyncio.CancelledError:
+                pass
+            self._vad_task = None
+
         # Disconnect transcription clients
         for mic, client in self._transcription_clients.items():
             try:
@@ -404,8 +420,9 @@ class LiveListenerConnector:
     async def _pipeline_once(self, spec: MicDeviceSpec) -> None:
         """Run the pipeline for one mic until sounddevice raises or is cancelled.
 
-        Opens a MicPipeline (uses sounddevice under the hood) and feeds frames
-        through VAD → transcription → filter gate → discretion → ingest.
+        Opens a MicPipeline (uses sounddevice under the hood) and registers it
+        with the shared batched VAD driver, which feeds frames through
+        VAD → transcription → filter gate → discretion → ingest.
         """
         from butlers.connectors.live_listener.audio import MicPipeline
 
@@ -422,10 +439,6 @@ class LiveListenerConnector:
             min_segment_ms=self._config.min_segment_ms,
             max_segment_ms=self._config.max_segment_ms,
         )
-        silero = SileroVad(model_path=self._config.vad_model_path or None)
-        vad = VadStateMachine(config=vad_config, model=silero, mic_name=mic)
-        vad.load()
-
         # Build filter evaluator (fail-open if no DB)
         filter_evaluator = create_filter_evaluator(
             device_name=spec.name,
@@ -439,18 +452,8 @@ class LiveListenerConnector:
 
         logger.info("live-listener: opening mic pipeline for mic=%s", mic)
 
-        # Capture the running event loop here (safe: we're inside an async method).
-        # The PortAudio callback thread has no event loop of its own; using
-        # get_running_loop() in the async context avoids the deprecated
-        # get_event_loop() call and ensures we always target the correct loop.
-        loop = asyncio.get_running_loop()
-
-        def on_frame(frame: bytes) -> None:
-            """Synchronous frame callback; dispatches to VAD and queues segments."""
-            vad_start = time.monotonic()
-            offset_ts = time.monotonic()
-            segments = vad.process_frame(frame, offset_ts=offset_ts)
-            vad_elapsed = time.monotonic() - vad_start
+        def on_vad_result(segments: list[SpeechSegment], vad_elapsed: float) -> None:
+            """Per-frame VAD result from the batched driver; queues completed segments."""
             ll_metrics.observe_stage_latency("vad", vad_elapsed)
 
             for seg in segments:
@@ -460,18 +463,22 @@ class LiveListenerConnector:
                     seg.duration_ms,
                     seg.forced_split,
                 )
-                # Schedule async processing without blocking the PortAudio callback thread
-                loop.call_soon_threadsafe(self._schedule_segment, spec, seg, filter_evaluator)
+                # The driver runs on the event loop, so schedule directly.
+                self._schedule_segment(spec, seg, filter_evaluator)
 
-        mic_pipeline = MicPipeline(spec=spec, config=self._config, on_frame=on_frame)
+        mic_pipeline = MicPipeline(spec=spec, config=self._config, consume=False)
+        self._vad_driver.add_source(mic, vad_config, mic_pipeline.read_frame, on_vad_result)
 
-        async with mic_pipeline:
-            mic_state.connected = True
-            mic_state.last_error = None
-            logger.info("live-listener: mic=%s pipeline running", mic)
-            # Keep running until cancelled
-            while True:
-                await asyncio.sleep(1.0)
+        try:
+            async with mic_pipeline:
+                mic_state.connected = True
+                mic_state.last_error = None
+                logger.info("live-listener: mic=%s pipeline running", mic)
+                # Keep running until cancelled
+                while True:
+                    await asyncio.sleep(1.0)
+        finally:
+            self._vad_driver.remove_source(mic)
 
         mic_state.connected = False
 
@@ -520,7 +527,8 @@ class LiveListenerConnector:
 
         t_start = time.monotonic()
         try:
-            result = await transcription_client.transcribe(segment.audio_bytes)
+            # The clients take bytes; one copy per segment, not per frame.
+            result = await transcription_client.transcribe(bytes(segment.audio_bytes))
         except Exception as exc:
             ll_metrics.inc_transcription_failure(type(exc).__name__.lower())
             ll_metrics.inc_segments("transcription_failed")
@@ -5,6 +5,8 @@ Implements:
 - Two-state machine: SILENCE ↔ SPEAKING
 - Configurable onset/offset thresholds and frame counts
 - Segment duration bounds (min discard, max force-split)
+- Batched multi-mic scoring: one ONNX call per tick across all mics, with
+  per-mic LSTM state (``BatchedSileroVad`` / ``BatchedVadDriver``)
 
 Spec reference:
   openspec/changes/connector-live-listener/specs/connector-live-listener/spec.md
@@ -13,14 +15,12 @@ Spec reference:
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import logging
-import struct
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    pass
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +34,43 @@ FRAME_BYTES = FRAME_SAMPLES * BYTES_PER_SAMPLE  # 960 bytes per 30 ms frame
 # Optional Silero/ONNX import — connector still operates without it (tests use mock)
 try:
     import numpy as np
-    import onnxruntime as ort
-
-    ONNX_AVAILABLE = True
 except ImportError:
     np = None  # type: ignore[assignment]
+
+try:
+    import onnxruntime as ort
+except ImportError:
     ort = None  # type: ignore[assignment]
-    ONNX_AVAILABLE = False
+
+ONNX_AVAILABLE = np is not None and ort is not None
+
+
+def _create_session(model_path: str) -> object | None:
+    """Create a single-threaded ONNX session for the Silero model, or ``None`` on failure."""
+    try:
+        opts = ort.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        session = ort.InferenceSession(model_path, sess_options=opts)
+    except Exception:
+        logger.exception("Failed to load Silero VAD ONNX model from %s", model_path)
+        return None
+    logger.info("Loaded Silero VAD model from %s", model_path)
+    return session
+
+
+def _pcm_to_float(frame_bytes: bytes | memoryview, out: object | None = None) -> object:
+    """Decode 16-bit little-endian PCM into float32 samples in [-1, 1].
+
+    ``np.frombuffer`` views the frame without copying; the only copy is the
+    int16 → float32 conversion, written into ``out`` when supplied.
+    """
+    samples = np.frombuffer(frame_bytes, dtype="<i2")
+    if out is None:
+        out = np.empty(samples.shape, dtype=np.float32)
+    out[...] = samples
+    out *= 1.0 / 32768.0
+    return out
 
 
 class VadState(enum.Enum):
@@ -55,7 +85,10 @@ class SpeechSegment:
     """A completed speech segment ready for transcription.
 
     Attributes:
-        audio_bytes: Raw 16-bit signed PCM at 16 kHz, mono.
+        audio_bytes: Raw 16-bit signed PCM at 16 kHz, mono.  A zero-copy
+            ``memoryview`` over the segment buffer the state machine filled;
+            ownership passes to the segment, so it stays valid indefinitely.
+            The connector hands the transcription clients ``bytes(audio_bytes)``.
         mic_name: Originating microphone name.
         onset_frame_index: Frame index when speech onset was detected.
         offset_ts: ``time.monotonic()`` timestamp when speech offset was detected.
@@ -63,7 +96,7 @@ class SpeechSegment:
         forced_split: True when the segment was force-split at max duration.
     """
 
-    audio_bytes: bytes
+    audio_bytes: bytes | memoryview
     mic_name: str
     onset_frame_index: int
     offset_ts: float
@@ -142,15 +175,9 @@ class SileroVad:
             )
             return
 
-        try:
-            opts = ort.SessionOptions()
-            opts.inter_op_num_threads = 1
-            opts.intra_op_num_threads = 1
-            self._session = ort.InferenceSession(self._model_path, sess_options=opts)
+        self._session = _create_session(self._model_path)
+        if self._session is not None:
             self._reset_state()
-            logger.info("Loaded Silero VAD model from %s", self._model_path)
-        except Exception:
-            logger.exception("Failed to load Silero VAD ONNX model from %s", self._model_path)
 
     def reset_state(self) -> None:
         """Reset LSTM hidden state between segments."""
@@ -163,7 +190,7 @@ class SileroVad:
         self._c = np.zeros((2, 1, 64), dtype=np.float32)
         self._sr_tensor = np.array([SAMPLE_RATE], dtype=np.int64)
 
-    def score(self, frame_bytes: bytes) -> float:
+    def score(self, frame_bytes: bytes | memoryview) -> float:
         """Compute speech probability for a single 30 ms PCM frame.
 
         Args:
@@ -185,11 +212,8 @@ class SileroVad:
             )
             return 0.0
 
-        # Decode PCM int16 → float32 in [-1, 1]
-        n_samples = FRAME_SAMPLES
-        samples = struct.unpack(f"<{n_samples}h", frame_bytes)
-        audio = np.array(samples, dtype=np.float32) / 32768.0
-        audio = audio[np.newaxis, :]  # shape: (1, 480)
+        # Decode PCM int16 → float32 in [-1, 1] straight from the frame buffer
+        audio = _pcm_to_float(frame_bytes)[np.newaxis, :]  # shape: (1, 480)
 
         ort_inputs = {
             "input": audio,
@@ -201,6 +225,164 @@ class SileroVad:
         return float(out[0, 0])
 
 
+class SileroVadSlot:
+    """Per-mic view onto a :class:`BatchedSileroVad`.
+
+    Holds the mic's own LSTM ``h``/``c`` state so several mics can share one
+    ONNX session without their recurrent state bleeding into each other.
+    Exposes the same ``load`` / ``reset_state`` / ``score`` surface as
+    :class:`SileroVad`, so a :class:`VadStateMachine` can drive it directly.
+    """
+
+    def __init__(self, parent: BatchedSileroVad, mic_name: str) -> None:
+        self._parent = parent
+        self.mic_name = mic_name
+        self._h: object | None = None
+        self._c: object | None = None
+
+    def load(self) -> None:
+        """Load the shared ONNX session (idempotent)."""
+        self._parent.load()
+
+    def reset_state(self) -> None:
+        """Reset this mic's LSTM hidden state between segments."""
+        self._h = None
+        self._c = None
+
+    def score(self, frame_bytes: bytes | memoryview) -> float:
+        """Score a single frame for this mic (a batch of one)."""
+        return self._parent.score_batch([self], [frame_bytes])[0]
+
+
+class BatchedSileroVad:
+    """One Silero VAD ONNX session shared by every configured mic.
+
+    Silero's ONNX graph accepts a batch dimension on both the audio input
+    ``(batch, samples)`` and the LSTM state ``(2, batch, 64)``.  Each tick the
+    :class:`BatchedVadDriver` gathers at most one frame per mic and scores the
+    whole batch with a single ``session.run`` call; per-mic state is gathered
+    from, and scattered back to, each :class:`SileroVadSlot`.
+
+    Degrades exactly like :class:`SileroVad`: without ``onnxruntime`` or a
+    model path every frame scores 0.0 (silence).
+    """
+
+    def __init__(self, model_path: str | None = None) -> None:
+        self._model_path = model_path
+        self._session: object | None = None
+        self._warned_unavailable = False
+        self._sr_tensor: object | None = None
+        self._slots: dict[str, SileroVadSlot] = {}
+        # Reusable (max_batch, FRAME_SAMPLES) float32 input; grown on demand.
+        self._input: object | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """True once the ONNX session has been created."""
+        return self._session is not None
+
+    def load(self) -> None:
+        """Load the ONNX session.  Safe to call multiple times."""
+        if self._session is not None:
+            return
+        if not ONNX_AVAILABLE:
+            if not self._warned_unavailable:
+                logger.warning(
+                    "onnxruntime / numpy not installed — VAD will return 0.0 for all frames. "
+                    "Install with: uv pip install onnxruntime numpy"
+                )
+                self._warned_unavailable = True
+            return
+
+        if self._model_path is None:
+            if not self._warned_unavailable:
+                logger.warning(
+                    "No Silero VAD model path configured — VAD will return 0.0 for all frames."
+                )
+                self._warned_unavailable = True
+            return
+
+        self._session = _create_session(self._model_path)
+        if self._session is not None:
+            self._sr_tensor = np.array([SAMPLE_RATE], dtype=np.int64)
+
+    def slot(self, mic_name: str) -> SileroVadSlot:
+        """Return the state slot for *mic_name*, creating it on first use."""
+        slot = self._slots.get(mic_name)
+        if slot is None:
+            slot = SileroVadSlot(self, mic_name)
+            self._slots[mic_name] = slot
+        return slot
+
+    def score_batch(
+        self,
+        slots: Sequence[SileroVadSlot],
+        frames: Sequence[bytes | memoryview],
+    ) -> list[float]:
+        """Score one frame per slot in a single ONNX call.
+
+        Args:
+            slots: Per-mic state slots; each may appear at most once because
+                a mic's frames depend on its previous LSTM state.
+            frames: One 30 ms PCM frame per slot, in the same order.
+
+        Returns:
+            Speech probabilities in the order of *slots*.  Frames of the wrong
+            size (and every frame when the model is not loaded) score 0.0.
+        """
+        probs = [0.0] * len(slots)
+        if self._session is None:
+            return probs
+
+        rows: list[int] = []
+        for i, frame in enumerate(frames):
+            if len(frame) == FRAME_BYTES:
+                rows.append(i)
+            else:
+                logger.debug(
+                    "VAD[%s]: unexpected frame size %d (expected %d) — returning 0.0",
+                    slots[i].mic_name,
+                    len(frame),
+                    FRAME_BYTES,
+                )
+        if not rows:
+            return probs
+
+        batch = len(rows)
+        if self._input is None or self._input.shape[0] < batch:
+            self._input = np.empty((batch, FRAME_SAMPLES), dtype=np.float32)
+        audio = self._input[:batch]
+
+        zeros = None
+        h_parts = []
+        c_parts = []
+        for row, i in enumerate(rows):
+            _pcm_to_float(frames[i], out=audio[row])
+            slot = slots[i]
+            if slot._h is None:
+                if zeros is None:
+                    zeros = np.zeros((2, 1, 64), dtype=np.float32)
+                slot._h = zeros
+                slot._c = zeros
+            h_parts.append(slot._h)
+            c_parts.append(slot._c)
+
+        ort_inputs = {
+            "input": audio,
+            "sr": self._sr_tensor,
+            "h": np.concatenate(h_parts, axis=1),
+            "c": np.concatenate(c_parts, axis=1),
+        }
+        out, h_out, c_out = self._session.run(None, ort_inputs)
+
+        for row, i in enumerate(rows):
+            slot = slots[i]
+            slot._h = h_out[:, row : row + 1, :]
+            slot._c = c_out[:, row : row + 1, :]
+            probs[i] = float(out[row, 0])
+        return probs
+
+
 @dataclass
 class _VadStateMachineState:
     """Mutable state used internally by VadStateMachine."""
@@ -210,8 +392,12 @@ class _VadStateMachineState:
     """Consecutive frames with speech probability above onset_threshold."""
     offset_count: int = 0
     """Consecutive frames with speech probability below offset_threshold."""
-    segment_frames: list[bytes] = field(default_factory=list)
-    """Accumulated PCM frames for the current speaking segment."""
+    segment_buf: bytearray | None = None
+    """Preallocated PCM buffer for the current speaking segment (lazily allocated)."""
+    segment_len: int = 0
+    """Bytes of ``segment_buf`` filled so far."""
+    segment_frame_count: int = 0
+    """Frames accumulated in the current speaking segment."""
     frame_index: int = 0
     """Global frame counter (incremented for each frame processed)."""
     speech_onset_frame_index: int = 0
@@ -240,13 +426,17 @@ class VadStateMachine:
     def __init__(
         self,
         config: VadConfig,
-        model: SileroVad,
+        model: SileroVad | SileroVadSlot,
         mic_name: str,
     ) -> None:
         self._config = config
         self._model = model
         self._mic_name = mic_name
         self._st = _VadStateMachineState()
+        # A segment is force-split as soon as it reaches max_segment_ms, so a
+        # buffer of that many frames (rounded up) never needs to grow.
+        max_frames = -(-config.max_segment_ms // FRAME_MS)
+        self._segment_capacity = max(max_frames, 1) * FRAME_BYTES
 
     def load(self) -> None:
         """Load the underlying ONNX model (idempotent)."""
@@ -265,20 +455,32 @@ class VadStateMachine:
     @property
     def current_segment_bytes(self) -> bytes:
         """PCM bytes accumulated in the current speaking segment (may be empty)."""
-        return b"".join(self._st.segment_frames)
+        st = self._st
+        if st.segment_buf is None:
+            return b""
+        return bytes(st.segment_buf[: st.segment_len])
 
     def reset(self) -> None:
         """Reset all state (used after device reconnection)."""
         self._st = _VadStateMachineState()
         self._model.reset_state()
 
-    def process_frame(self, frame_bytes: bytes, offset_ts: float) -> list[SpeechSegment]:
+    def process_frame(
+        self,
+        frame_bytes: bytes | memoryview,
+        offset_ts: float,
+        prob: float | None = None,
+    ) -> list[SpeechSegment]:
         """Process a single 30 ms PCM frame.
 
         Args:
             frame_bytes: Exactly ``FRAME_BYTES`` bytes of 16-bit signed PCM.
+                May be a transient view (e.g. into a ring buffer); the frame
+                is copied into the segment buffer before this call returns.
             offset_ts: ``time.monotonic()`` timestamp for this frame (used as
                 segment offset_ts when speech ends).
+            prob: Speech probability already computed for this frame (by a
+                batched scorer).  When ``None`` the model scores the frame.
 
         Returns:
             A list of :class:`SpeechSegment` objects completed in this call.
@@ -286,7 +488,8 @@ class VadStateMachine:
             force-split occurs (both halves are returned).
         """
         self._st.frame_index += 1
-        prob = self._model.score(frame_bytes)
+        if prob is None:
+            prob = self._model.score(frame_bytes)
         completed: list[SpeechSegment] = []
 
         if self._st.state == VadState.SILENCE:
@@ -300,7 +503,7 @@ class VadStateMachine:
     # State handlers
     # ------------------------------------------------------------------
 
-    def _handle_silence(self, frame_bytes: bytes, prob: float) -> list[SpeechSegment]:
+    def _handle_silence(self, frame_bytes: bytes | memoryview, prob: float) -> list[SpeechSegment]:
         """Process a frame while in SILENCE state."""
         cfg = self._config
         st = self._st
@@ -324,13 +527,15 @@ class VadStateMachine:
             st.speech_onset_frame_index = st.frame_index
             # Include the onset frames that triggered the transition.
             # We have only the current frame in hand; pre-roll is not implemented.
-            st.segment_frames = [frame_bytes]
+            st.segment_len = 0
+            st.segment_frame_count = 0
+            self._append_frame(frame_bytes)
 
         return []
 
     def _handle_speaking(
         self,
-        frame_bytes: bytes,
+        frame_bytes: bytes | memoryview,
         prob: float,
         offset_ts: float,
     ) -> list[SpeechSegment]:
@@ -340,10 +545,10 @@ class VadStateMachine:
         completed: list[SpeechSegment] = []
 
         # Accumulate frame regardless of probability (we need the audio)
-        st.segment_frames.append(frame_bytes)
+        self._append_frame(frame_bytes)
 
         # Check for force-split (max segment duration exceeded)
-        current_ms = len(st.segment_frames) * FRAME_MS
+        current_ms = st.segment_frame_count * FRAME_MS
         if current_ms >= cfg.max_segment_ms:
             logger.debug(
                 "VAD[%s]: force-split at %d ms (frame %d)",
@@ -379,6 +584,19 @@ class VadStateMachine:
 
         return completed
 
+    def _append_frame(self, frame_bytes: bytes | memoryview) -> None:
+        """Copy a frame into the preallocated segment buffer."""
+        st = self._st
+        if st.segment_buf is None:
+            st.segment_buf = bytearray(self._segment_capacity)
+        end = st.segment_len + len(frame_bytes)
+        if end > len(st.segment_buf):
+            # Only reachable with oversized frames; keep correctness over speed.
+            st.segment_buf.extend(bytes(end - len(st.segment_buf)))
+        st.segment_buf[st.segment_len : end] = frame_bytes
+        st.segment_len = end
+        st.segment_frame_count += 1
+
     def _emit_segment(self, offset_ts: float, *, forced_split: bool) -> SpeechSegment | None:
         """Finalise the current segment buffer and return a SpeechSegment.
 
@@ -386,16 +604,22 @@ class VadStateMachine:
         On a natural offset, transitions to SILENCE. On a force-split, the state
         machine remains in SPEAKING so the second half of the utterance is captured
         without requiring a new onset transition.
+
+        An emitted segment takes ownership of the segment buffer (its audio is a
+        memoryview over it, no join/copy); the next segment allocates a fresh
+        one.  A discarded segment leaves the buffer in place for reuse.
         """
         st = self._st
         cfg = self._config
 
-        audio_bytes = b"".join(st.segment_frames)
-        duration_ms = len(st.segment_frames) * FRAME_MS
+        duration_ms = st.segment_frame_count * FRAME_MS
         onset_frame_index = st.speech_onset_frame_index
+        segment_buf = st.segment_buf
+        segment_len = st.segment_len
 
         # Reset segment buffer for the next segment (or force-split continuation).
-        st.segment_frames = []
+        st.segment_len = 0
+        st.segment_frame_count = 0
         self._model.reset_state()
 
         # On natural speech offset, transition to SILENCE.
@@ -414,6 +638,11 @@ class VadStateMachine:
             )
             return None
 
+        st.segment_buf = None
+        if segment_buf is None:
+            audio_bytes: bytes | memoryview = b""
+        else:
+            audio_bytes = memoryview(segment_buf)[:segment_len]
         return SpeechSegment(
             audio_bytes=audio_bytes,
             mic_name=self._mic_name,
@@ -422,3 +651,135 @@ class VadStateMachine:
             duration_ms=duration_ms,
             forced_split=forced_split,
         )
+
+
+# ---------------------------------------------------------------------------
+# Batched multi-mic driver
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _VadSource:
+    """A mic registered with :class:`BatchedVadDriver`."""
+
+    slot: SileroVadSlot
+    machine: VadStateMachine
+    read_frame: Callable[[], bytes | memoryview | None]
+    on_result: Callable[[list[SpeechSegment], float], None]
+
+
+class BatchedVadDriver:
+    """Drives every mic's :class:`VadStateMachine` from one loop.
+
+    Each tick pulls at most one frame from every registered mic, scores the
+    whole batch with a single :meth:`BatchedSileroVad.score_batch` call, then
+    feeds the probabilities through each mic's state machine.  Only one frame
+    per mic fits in a batch (the LSTM state is sequential), so a backlog is
+    drained in consecutive ticks rather than one large call.
+
+    Usage::
+
+        model = BatchedSileroVad(model_path)
+        model.load()
+        driver = BatchedVadDriver(model)
+        driver.add_source("kitchen", vad_config, pipeline.read_frame, on_result)
+        task = asyncio.create_task(driver.run())
+
+    Thread safety:
+        Not thread-safe.  Runs as a single asyncio task; frame sources must be
+        safe to read from the event loop (``RingBuffer`` is).
+    """
+
+    def __init__(self, model: BatchedSileroVad, poll_interval_s: float = 0.005) -> None:
+        self._model = model
+        self._poll_interval_s = poll_interval_s
+        self._sources: dict[str, _VadSource] = {}
+
+    @property
+    def mic_names(self) -> list[str]:
+        """Names of the currently registered mics."""
+        return list(self._sources)
+
+    def add_source(
+        self,
+        mic_name: str,
+        config: VadConfig,
+        read_frame: Callable[[], bytes | memoryview | None],
+        on_result: Callable[[list[SpeechSegment], float], None],
+    ) -> VadStateMachine:
+        """Register a mic and return its (fresh) state machine.
+
+        Args:
+            mic_name: Microphone name; replaces any existing registration.
+            config: VAD thresholds and segment bounds for this mic.
+            read_frame: Returns the next buffered frame, or ``None`` when the
+                mic has nothing new.  The frame only needs to stay valid until
+                the current tick finishes.
+            on_result: Called for every processed frame with the segments it
+                completed (usually empty) and the tick's VAD wall time in
+                seconds, shared across the batch.
+        """
+        slot = self._model.slot(mic_name)
+        slot.reset_state()
+        machine = VadStateMachine(config=config, model=slot, mic_name=mic_name)
+        self._sources[mic_name] = _VadSource(
+            slot=slot, machine=machine, read_frame=read_frame, on_result=on_result
+        )
+        return machine
+
+    def remove_source(self, mic_name: str) -> None:
+        """Unregister a mic (no-op when absent)."""
+        self._sources.pop(mic_name, None)
+
+    def tick(self, offset_ts: float | None = None) -> int:
+        """Process one batch of frames.
+
+        Args:
+            offset_ts: ``time.monotonic()`` timestamp for the batch; defaults
+                to now.
+
+        Returns:
+            Number of frames processed (0 when every mic was idle).
+        """
+        batch: list[tuple[_VadSource, bytes | memoryview]] = []
+        for source in list(self._sources.values()):
+            frame = source.read_frame()
+            if frame is not None:
+                batch.append((source, frame))
+        if not batch:
+            return 0
+
+        if offset_ts is None:
+            offset_ts = time.monotonic()
+
+        vad_start = time.monotonic()
+        try:
+            probs = self._model.score_batch(
+                [source.slot for source, _ in batch], [frame for _, frame in batch]
+            )
+        except Exception:
+            logger.exception(
+                "VAD: batched scoring failed — treating %d frame(s) as silence", len(batch)
+            )
+            probs = [0.0] * len(batch)
+
+        results: list[tuple[_VadSource, list[SpeechSegment]]] = []
+        for (source, frame), prob in zip(batch, probs):
+            results.append((source, source.machine.process_frame(frame, offset_ts, prob=prob)))
+        vad_elapsed = time.monotonic() - vad_start
+
+        for source, segments in results:
+            try:
+                source.on_result(segments, vad_elapsed)
+            except Exception:
+                logger.exception("VAD[%s]: on_result callback raised", source.slot.mic_name)
+        return len(batch)
+
+    async def run(self) -> None:
+        """Tick until cancelled, sleeping briefly whenever every mic is idle."""
+        while True:
+            if self.tick() == 0:
+                await asyncio.sleep(self._poll_interval_s)
+            else:
+                # Yield between batches so a backlog never starves the loop.
+                await asyncio.sleep(0)
@@ -6,6 +6,8 @@ Metrics exported:
 - connector_ingest_submissions_total: Counter of ingest API submission attempts
 - connector_ingest_latency_seconds: Histogram of ingest API latency
 - connector_source_api_calls_total: Counter of source API calls
+- connector_source_api_calls_avoided_total: Counter of source API calls answered locally
+- connector_flush_latency_seconds: Histogram of batch flush latency
 - connector_checkpoint_saves_total: Counter of checkpoint save operations
 - connector_errors_total: Counter of errors by type
 
@@ -48,6 +50,20 @@ source_api_calls_total = get_or_create_counter(
     labelnames=["connector_type", "endpoint_identity", "api_method", "status"],
 )
 
+source_api_calls_avoided_total = get_or_create_counter(
+    "connector_source_api_calls_avoided_total",
+    "Total number of source API calls avoided by serving from local state",
+    labelnames=["connector_type", "endpoint_identity", "api_method", "reason"],
+)
+
+# Batch flush metrics
+flush_latency_seconds = get_or_create_histogram(
+    "connector_flush_latency_seconds",
+    "Latency of a buffered-batch flush (context lookups through ingest submit) in seconds",
+    labelnames=["connector_type", "endpoint_identity"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
 # Checkpoint save metrics
 checkpoint_saves_total = get_or_create_counter(
     "connector_checkpoint_saves_total",
@@ -179,6 +195,39 @@ class ConnectorMetrics:
             status=status,
         ).inc()
 
+    def record_source_api_calls_avoided(
+        self,
+        api_method: str,
+        reason: str,
+        count: int = 1,
+    ) -> None:
+        """Record source API calls that were not made because local state answered them.
+
+        Args:
+            api_method: API method that was skipped (e.g., "get_messages")
+            reason: Why it was skipped (e.g., "history_ring", "reply_batched")
+            count: Number of calls avoided
+        """
+        if count <= 0:
+            return
+        source_api_calls_avoided_total.labels(
+            connector_type=self._connector_type,
+            endpoint_identity=self._endpoint_identity,
+            api_method=api_method,
+            reason=reason,
+        ).inc(count)
+
+    def record_flush_latency(self, latency: float) -> None:
+        """Record the wall-clock latency of one buffered-batch flush.
+
+        Args:
+            latency: Flush latency in seconds
+        """
+        flush_latency_seconds.labels(
+            connector_type=self._connector_type,
+            endpoint_identity=self._endpoint_identity,
+        ).observe(latency)
+
     def record_checkpoint_save(self, status: str) -> None:
         """Record a checkpoint save operation.
 
@@ -15,6 +15,7 @@ Key behaviors:
 - Idempotent submission to Switchboard MCP server via ingest tool
 - Privacy/consent safeguards and scope controls
 - Bounded in-flight requests with graceful degradation
+- Bounded flush concurrency; MTProto lookups pause for the duration of a FloodWait
 
 Environment variables (see `docs/connectors/telegram_user_client.md` section 4):
 - SWITCHBOARD_MCP_URL (required)
@@ -33,6 +34,9 @@ Environment variables (see `docs/connectors/telegram_user_client.md` section 4):
 - TELEGRAM_USER_HISTORY_MAX_MESSAGES (optional, default 50): history fetch limit per flush
 - TELEGRAM_USER_HISTORY_TIME_WINDOW_M (optional, default 30): history lookback window (minutes)
 - TELEGRAM_USER_BUFFER_MAX_MESSAGES (optional, default 200): per-chat buffer cap before force-flush
+- TELEGRAM_USER_HISTORY_RING_SIZE (optional, default 200): recently seen messages kept per chat
+  to serve history and reply-to lookups without an MTProto call
+- TELEGRAM_USER_FLUSH_CONCURRENCY (optional, default 4): chats flushed at the same time
 - TELEGRAM_USER_DISCRETION_WINDOW_SIZE (optional, default 10): discretion context window size
 - TELEGRAM_USER_DISCRETION_WINDOW_SECONDS (optional, default 300): discretion context window age cap
 - TELEGRAM_USER_DISCRETION_WEIGHT_BYPASS (optional, default 1.0): weight threshold to skip LLM
@@ -57,6 +61,7 @@ import logging
 import os
 import socket
 import time
+from collections import deque
 from collections.abc import Iterable
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
@@ -92,6 +97,7 @@ from butlers.ingestion_policy import IngestionEnvelope, IngestionPolicyEvaluator
 try:
     from telethon import TelegramClient, events
     from telethon import functions as tl_functions
+    from telethon.errors import FloodWaitError
     from telethon.sessions import StringSession
     from telethon.tl.types import Message as TelegramMessage
     from telethon.tl.types.updates import State as TelethonUpdateState
@@ -102,6 +108,7 @@ except ImportError:
     TelegramClient = None
     events = None
     tl_functions = None
+    FloodWaitError = None
     StringSession = None
     TelegramMessage = None
     TelethonUpdateState = None
@@ -152,6 +159,8 @@ def _detect_addressed_in_batch(
 # ---------------------------------------------------------------------------
 
 _FLUSH_SCANNER_INTERVAL_S = 60  # How often the flush scanner wakes up
+_DEFAULT_HISTORY_RING_SIZE = 200  # Recently seen messages kept per chat
+_DEFAULT_FLUSH_CONCURRENCY = 4  # Chats flushed at the same time
 
 
 @dataclass
@@ -165,12 +174,17 @@ class ChatBuffer:
                         the same chat.
         chat_title:     Human-readable chat title (groups/channels), or None for
                         DMs and chats where the title is unavailable.
+        recent:         Ring of the most recent messages seen live in this chat
+                        (kept across flushes, updated on edits and deletions).
+                        Serves history and reply-to lookups without an MTProto
+                        call when it covers them.
     """
 
     messages: list[Any] = field(default_factory=list)
     last_flush_ts: float = field(default_factory=time.monotonic)
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     chat_title: str | None = None
+    recent: deque[Any] = field(default_factory=lambda: deque(maxlen=_DEFAULT_HISTORY_RING_SIZE))
 
 
 @dataclass
@@ -204,6 +218,8 @@ class TelegramUserClientConnectorConfig:
     history_max_messages: int = 50
     history_time_window_m: int = 35
     buffer_max_messages: int = 200
+    history_ring_size: int = _DEFAULT_HISTORY_RING_SIZE
+    flush_concurrency: int = _DEFAULT_FLUSH_CONCURRENCY
 
     # Discretion layer config
     discretion_window_size: int = 10
@@ -267,6 +283,8 @@ class TelegramUserClientConnectorConfig:
         discretion_group_size_bypass_max = _int(
             "TELEGRAM_USER_DISCRETION_GROUP_SIZE_BYPASS_MAX", 20
         )
+        history_ring_size = _int("TELEGRAM_USER_HISTORY_RING_SIZE", _DEFAULT_HISTORY_RING_SIZE)
+        flush_concurrency = _int("TELEGRAM_USER_FLUSH_CONCURRENCY", _DEFAULT_FLUSH_CONCURRENCY)
         health_port = _int("CONNECTOR_HEALTH_PORT", _DEFAULT_HEALTH_PORT)
         # Address keywords (comma-separated, case-insensitive)
         _raw_keywords = os.environ.get("CONNECTOR_ADDRESS_KEYWORDS", "").strip()
@@ -293,6 +311,8 @@ class TelegramUserClientConnectorConfig:
             history_max_messages=history_max_messages,
             history_time_window_m=history_time_window_m,
             buffer_max_messages=buffer_max_messages,
+            history_ring_size=history_ring_size,
+            flush_concurrency=flush_concurrency,
             discretion_window_size=discretion_window_size,
             discretion_window_seconds=discretion_window_seconds,
             discretion_weight_bypass=discretion_weight_bypass,
@@ -407,6 +427,13 @@ class TelegramUserClientConnector:
         # Background flush scanner task (started in start(), cancelled in stop()).
         self._flush_scanner_task: asyncio.Task[None] | None = None
 
+        # Flush limiter: at most flush_concurrency chats run the flush pipeline
+        # at once.  After a FloodWaitError no flush issues MTProto lookups
+        # (history, reply-tos, get_entity) until the wait has elapsed; flushes
+        # keep running from each chat's ring of recent messages meanwhile.
+        self._flush_slots = asyncio.Semaphore(max(1, config.flush_concurrency))
+        self._flood_wait_until: float = 0.0
+
         # Participant count cache: chat_id → (participant_count, cache_timestamp_monotonic).
         # TTL: 1 hour. Avoids hitting the Telethon API on every message.
         self._participant_count_cache: dict[str, tuple[int, float]] = {}
@@ -484,6 +511,16 @@ class TelegramUserClientConnector:
                 await self._record_owner_outbound_if_applicable(event.message)
                 await self._buffer_message(event.message)
 
+            # Keep the per-chat rings of recent messages in step with edits and
+            # deletions so locally served history matches what the API returns.
+            @self._telegram_client.on(events.MessageEdited)
+            async def handle_message_edited(event: events.MessageEdited.Event) -> None:
+                self._remember_edit(event.message)
+
+            @self._telegram_client.on(events.MessageDeleted)
+            async def handle_message_deleted(event: events.MessageDeleted.Event) -> None:
+                self._forget_deleted(event.chat_id, event.deleted_ids)
+
             # Sync Telethon update state so the client can receive real-time
             # NewMessage events.
             #
@@ -711,11 +748,14 @@ class TelegramUserClientConnector:
             return
 
         if chat_id not in self._chat_buffers:
-            self._chat_buffers[chat_id] = ChatBuffer()
+            self._chat_buffers[chat_id] = ChatBuffer(
+                recent=deque(maxlen=max(1, self._config.history_ring_size))
+            )
 
         buf = self._chat_buffers[chat_id]
         async with buf.lock:
             buf.messages.append(message)
+            self._remember_message(buf, message)
             msg_count = len(buf.messages)
             # Opportunistically capture chat_title from message.chat (groups/channels
             # expose a `title` attribute; DMs expose `first_name` or have no title).
@@ -741,6 +781,74 @@ class TelegramUserClientConnector:
             )
             await self._flush_chat_buffer(chat_id)
 
+    @staticmethod
+    def _replace_in_ring(buf: ChatBuffer, message: Any) -> bool:
+        """Swap the ring copy of *message* (matched by ID) in place; False if absent."""
+        msg_id = getattr(message, "id", None)
+        for i, seen in enumerate(buf.recent):
+            if getattr(seen, "id", None) == msg_id:
+                buf.recent[i] = message
+                return True
+        return False
+
+    def _remember_message(self, buf: ChatBuffer, message: Any) -> None:
+        """Add *message* to the chat's ring, replacing an earlier copy with the same ID.
+
+        ``catch_up()`` replays can deliver a message ID the ring already holds;
+        replacing in place keeps one (the latest) copy per ID.
+        """
+        if not self._replace_in_ring(buf, message):
+            buf.recent.append(message)
+
+    def _remember_edit(self, message: Any) -> None:
+        """Refresh the ring copy of an edited message (no-op if not in a ring)."""
+        chat_id = self._extract_chat_id(message)
+        buf = self._chat_buffers.get(chat_id) if chat_id is not None else None
+        if buf is not None:
+            self._replace_in_ring(buf, message)
+
+    def _forget_deleted(self, chat_id: Any, deleted_ids: Iterable[int]) -> None:
+        """Drop deleted messages from the ring(s).
+
+        Telegram omits the chat for deletions outside channels (message IDs are
+        then unique per account), so a ``None`` *chat_id* checks every ring.
+        """
+        ids = set(deleted_ids or ())
+        if not ids:
+            return
+        if chat_id is None:
+            buffers = list(self._chat_buffers.values())
+        else:
+            buf = self._chat_buffers.get(str(chat_id))
+            buffers = [buf] if buf is not None else []
+        for buf in buffers:
+            kept = [m for m in buf.recent if getattr(m, "id", None) not in ids]
+            if len(kept) != len(buf.recent):
+                buf.recent.clear()
+                buf.recent.extend(kept)
+
+    # -------------------------------------------------------------------------
+    # Internal: MTProto lookup gating (FloodWait backoff)
+    # -------------------------------------------------------------------------
+
+    def _flood_wait_active(self) -> bool:
+        """True while a FloodWaitError's wait has not yet elapsed."""
+        return time.monotonic() < self._flood_wait_until
+
+    def _note_api_failure(self, api_method: str, exc: BaseException) -> None:
+        """Record a failed MTProto lookup; a FloodWaitError starts the backoff window."""
+        if FloodWaitError is not None and isinstance(exc, FloodWaitError):
+            wait_s = float(getattr(exc, "seconds", 0) or 0)
+            self._flood_wait_until = max(self._flood_wait_until, time.monotonic() + wait_s)
+            self._metrics.record_source_api_call(api_method, "rate_limited")
+            logger.warning(
+                "Telegram FloodWait on %s: pausing flush lookups for %.0fs",
+                api_method,
+                wait_s,
+            )
+            return
+        self._metrics.record_source_api_call(api_method, "error")
+
     async def _load_flush_interval_from_db(self) -> int | None:
         """Read ``flush_interval_s`` from ``connector_registry.settings`` JSONB.
 
@@ -801,6 +909,7 @@ class TelegramUserClientConnector:
         if flush_interval_s is None:
             flush_interval_s = self._config.flush_interval_s
         now = time.monotonic()
+        due: list[str] = []
         # Snapshot keys to avoid mutation during iteration
         chat_ids = list(self._chat_buffers.keys())
         for chat_id in chat_ids:
@@ -817,10 +926,15 @@ class TelegramUserClientConnector:
                     chat_id,
                     elapsed,
                 )
-                await self._flush_chat_buffer(chat_id)
+                due.append(chat_id)
+        # Due chats flush concurrently; _flush_chat_buffer bounds how many at once.
+        await asyncio.gather(*(self._flush_chat_buffer(chat_id) for chat_id in due))
 
     async def _flush_all_buffers(self, reason: str = "force") -> None:
-        """Force-flush all non-empty chat buffers (called on shutdown)."""
+        """Force-flush all non-empty chat buffers (called on shutdown).
+
+        Chats flush concurrently, at most ``flush_concurrency`` at a time.
+        """
         chat_ids = list(self._chat_buffers.keys())
         if not chat_ids:
             return
@@ -873,8 +987,20 @@ class TelegramUserClientConnector:
         )
 
     async def _flush_chat_buffer(self, chat_id: str) -> None:
+        """Flush a single chat's buffer, holding one of the ``flush_concurrency`` slots.
+
+        Records the flush latency for every flush that had messages to send.
+        """
+        async with self._flush_slots:
+            started = time.perf_counter()
+            if await self._run_chat_flush(chat_id):
+                self._metrics.record_flush_latency(time.perf_counter() - started)
+
+    async def _run_chat_flush(self, chat_id: str) -> bool:
         """Flush a single chat's buffer through the full batch pipeline.
 
+        Returns ``False`` when the buffer was empty (nothing flushed).
+
         Pipeline:
         a. Atomically swap buffer (take messages, reset list).
         b. Fetch surrounding conversation history.
@@ -888,11 +1014,11 @@ class TelegramUserClientConnector:
         """
         buf = self._chat_buffers.get(chat_id)
         if buf is None:
-            return
+            return False
 
         async with buf.lock:
             if not buf.messages:
-                return
+                return False
             # a. Atomically swap: take the accumulated messages and reset the list.
             buffered_messages = buf.messages
             buf.messages = []
@@ -959,7 +1085,7 @@ class TelegramUserClientConnector:
                     ),
                 )
                 await self._flush_and_drain()
-                return
+                return True
 
             # e (continued). Evaluate global ingestion policy (skip/metadata_only/...).
             _gp_decision = self._global_ingestion_policy.evaluate(_ip_envelope)
@@ -979,7 +1105,7 @@ class TelegramUserClientConnector:
                     ),
                 )
                 await self._flush_and_drain()
-                return
+                return True
 
             # f. Evaluate discretion on concatenated normalized_text of new messages only.
             normalized_text: str = envelope["payload"]["normalized_text"]
@@ -1022,7 +1148,7 @@ class TelegramUserClientConnector:
                         subject_or_preview=normalized_text[:200] if normalized_text else None,
                     )
                     await self._flush_and_drain()
-                    return
+                    return True
 
             # g. Submit via _submit_to_ingest().
             await self._submit_to_ingest(envelope)
@@ -1054,6 +1180,7 @@ class TelegramUserClientConnector:
                 error_detail=str(exc),
             )
             await self._flush_and_drain()
+        return True
 
     def _build_batch_envelope(
         self,
@@ -1690,6 +1817,9 @@ class TelegramUserClientConnector:
                 return count
 
             # Fallback: fetch full entity via Telethon to get participants_count.
+            if self._flood_wait_active():
+                self._metrics.record_source_api_calls_avoided("get_entity", "flood_backoff")
+                return 0
             try:
                 full_entity = await self._telegram_client.get_entity(int(chat_id))
             except (ValueError, TypeError):
@@ -1702,6 +1832,7 @@ class TelegramUserClientConnector:
                 return count
 
         except Exception as exc:
+            self._note_api_failure("get_entity", exc)
             logger.debug(
                 "Failed to get participant count for chat %s (non-fatal): %s",
                 chat_id,
@@ -1722,10 +1853,17 @@ class TelegramUserClientConnector:
         ``self._history_time_window_m`` (default 30) minutes before the oldest
         buffered message.
 
-        The returned list is the union of fetched history and the buffered messages,
+        The chat's ring of recently seen messages answers the lookup without an
+        API call when it already holds ``history_max`` messages from before the
+        look-back window (the ring is fed by every live message, so those are
+        exactly what ``get_messages()`` would return).  Otherwise
+        ``get_messages()`` is called, unless a ``FloodWaitError`` backoff is
+        active, in which case whatever the ring holds is used instead.
+
+        The returned list is the union of the history and the buffered messages,
         deduplicated by message ID and sorted ascending by ID.  If the Telethon
         ``get_messages()`` call fails (including ``FloodWaitError``), the method
-        logs a warning and returns only the buffered messages (fail-open).
+        logs a warning and falls back to the ring's partial history (fail-open).
 
         Args:
             chat_id: Telethon-compatible chat entity (string, int, or peer).
@@ -1753,6 +1891,25 @@ class TelegramUserClientConnector:
         else:
             offset_date = datetime.now(UTC) - timedelta(minutes=history_window_m)
 
+        # get_messages(offset_date=...) returns messages strictly older than it.
+        buf = self._chat_buffers.get(str(chat_id))
+        ring_history: list[Any] = []
+        if buf is not None:
+            ring_history = sorted(
+                (
+                    m
+                    for m in buf.recent
+                    if getattr(m, "date", None) is not None and m.date < offset_date
+                ),
+                key=lambda m: getattr(m, "id", 0),
+            )[-history_max:]
+        if len(ring_history) >= history_max:
+            self._metrics.record_source_api_calls_avoided("get_messages", "history_ring")
+            return self._merge_context(ring_history, buffered_messages)
+        if self._flood_wait_active():
+            self._metrics.record_source_api_calls_avoided("get_messages", "flood_backoff")
+            return self._merge_context(ring_history, buffered_messages)
+
         try:
             history: list[Any] = await self._telegram_client.get_messages(
                 chat_id,
@@ -1760,18 +1917,24 @@ class TelegramUserClientConnector:
                 offset_date=offset_date,
             )
         except Exception as exc:
-            # FloodWaitError and all other errors: fail-open, proceed without history.
+            # FloodWaitError and all other errors: fail-open with what the ring holds.
+            self._note_api_failure("get_messages", exc)
             logger.warning(
                 "Failed to fetch conversation history for chat %s, proceeding without context: %s",
                 chat_id,
                 exc,
             )
-            return list(buffered_messages)
+            return self._merge_context(ring_history, buffered_messages)
+
+        self._metrics.record_source_api_call("get_messages", "success")
+        return self._merge_context(history, buffered_messages)
 
-        # Merge and deduplicate by message ID.
+    @staticmethod
+    def _merge_context(history: Iterable[Any], buffered_messages: Iterable[Any]) -> list[Any]:
+        """Union *history* and *buffered_messages*, deduplicated and sorted by message ID."""
         seen: set[int] = set()
         merged: list[Any] = []
-        for msg in list(history) + list(buffered_messages):
+        for msg in [*history, *buffered_messages]:
             msg_id = getattr(msg, "id", None)
             if msg_id is None or msg_id in seen:
                 continue
@@ -1791,14 +1954,15 @@ class TelegramUserClientConnector:
         """Fetch replied-to messages not already present in the context window.
 
         For each buffered message that has ``reply_to_msg_id`` set, this method
-        checks whether the referenced message is already in ``context_messages``.
-        If not, it fetches it via ``client.get_messages(chat, ids=mid)`` and
-        appends it to the returned list.
+        checks whether the referenced message is already in ``context_messages``
+        or in the chat's ring of recently seen messages.  The remaining IDs are
+        fetched together in one ``client.get_messages(chat, ids=[...])`` call
+        (skipped while a ``FloodWaitError`` backoff is active) and appended to
+        the returned list.
 
         Only single-level resolution is performed — no recursive chain following.
 
-        Fetch errors for individual reply-to messages are logged at DEBUG level
-        and skipped (fail-open).
+        Fetch errors are logged at DEBUG level and skipped (fail-open).
 
         Args:
             chat_id: Telethon-compatible chat entity.
@@ -1830,22 +1994,44 @@ class TelegramUserClientConnector:
             return list(context_messages)
 
         result: list[Any] = list(context_messages)
-        for mid in missing_ids:
+        buf = self._chat_buffers.get(str(chat_id))
+        if buf is not None:
+            ring_hits = [m for m in buf.recent if getattr(m, "id", None) in missing_ids]
+            if ring_hits:
+                result.extend(ring_hits)
+                missing_ids -= {m.id for m in ring_hits}
+                self._metrics.record_source_api_calls_avoided(
+                    "get_messages", "reply_ring", len(ring_hits)
+                )
+
+        if missing_ids and self._flood_wait_active():
+            self._metrics.record_source_api_calls_avoided(
+                "get_messages", "flood_backoff", len(missing_ids)
+            )
+            missing_ids = set()
+
+        if missing_ids:
+            ids = sorted(missing_ids)
             try:
-                reply_msg = await self._telegram_client.get_messages(chat_id, ids=mid)
-                if reply_msg is not None:
-                    # get_messages(ids=...) may return a list or a single message.
-                    if isinstance(reply_msg, list):
-                        result.extend(m for m in reply_msg if m is not None)
-                    else:
-                        result.append(reply_msg)
+                reply_msgs = await self._telegram_client.get_messages(chat_id, ids=ids)
             except Exception as exc:
+                self._note_api_failure("get_messages", exc)
                 logger.debug(
-                    "Failed to fetch reply-to message %s in chat %s: %s",
-                    mid,
+                    "Failed to fetch reply-to messages %s in chat %s: %s",
+                    ids,
                     chat_id,
                     exc,
                 )
+            else:
+                self._metrics.record_source_api_call("get_messages", "success")
+                self._metrics.record_source_api_calls_avoided(
+                    "get_messages", "reply_batched", len(ids) - 1
+                )
+                # get_messages(ids=[...]) returns a list with None for missing IDs.
+                if isinstance(reply_msgs, list):
+                    result.extend(m for m in reply_msgs if m is not None)
+                elif reply_msgs is not None:
+                    result.append(reply_msgs)
 
         # Sort ascending by message ID.
         result.sort(key=lambda m: getattr(m, "id", 0))
@@ -244,9 +244,10 @@ async def _check_rate_limit(
 def _is_session_not_found_error(error_msg: str) -> bool:
     """Return True if *error_msg* is a 'session not found' precondition failure.
 
-    When the target session does not exist the corrections table's FK constraint
-    (target_session_id REFERENCES sessions) will reject any INSERT.  Handlers
-    must skip the audit record in that case.
+    When the target session does not exist the corrections table's reference
+    check on target_session_id (the ``corrections_target_session_id_fkey``
+    trigger that replaced the FK when ``sessions`` was partitioned, core_202)
+    will reject any INSERT.  Handlers must skip the audit record in that case.
     """
     msg_lower = error_msg.lower()
     return "does not exist" in msg_lower or ("not found" in msg_lower and "session" in msg_lower)
@@ -699,8 +700,8 @@ async def handle_data_correction(
         schema=target_schema,
     )
     if precond_error:
-        # Skip audit record when target session doesn't exist: the FK constraint
-        # (corrections.target_session_id REFERENCES sessions) would reject the INSERT.
+        # Skip audit record when target session doesn't exist: the reference check
+        # on corrections.target_session_id (core_202 trigger) would reject the INSERT.
         if not _is_session_not_found_error(precond_error):
             cid = await create_correction(
                 pool,
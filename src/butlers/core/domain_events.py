@@ -44,6 +44,18 @@ once a route error is classified permanent (e.g. the subscriber lacks the
 ``domain_events`` core group) or the retry bound is reached, so a delivery
 that can never succeed is surfaced honestly instead of retried forever or
 silently dropped.
+
+Coalesced fan-out
+-----------------
+A subscription may opt into batch delivery (``batch_max_events`` /
+``batch_max_latency_ms``, core_207). Bursty producers publish through
+``publish_domain_events`` / ``DomainEventCoalescer`` in ``core_tools/
+_domain_events.py``: :func:`record_events` appends the whole burst with one
+multi-row insert, :func:`claim_deliveries` claims a subscriber's share of it
+in one statement, and :func:`mark_deliveries_delivered` /
+:func:`mark_deliveries_failed` settle it in one statement each.  The
+per-pair idempotence boundary is the same ``UNIQUE (event_id,
+subscriber_butler)`` claim -- a batch is only a cheaper way to reach it.
 """
 
 from __future__ import annotations
@@ -51,6 +63,7 @@ from __future__ import annotations
 import json
 import re
 import uuid
+from collections.abc import Mapping, Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -111,6 +124,36 @@ async def record_event(
     return str(event_id)
 
 
+async def record_events(
+    pool: asyncpg.Pool | asyncpg.Connection,
+    events: Sequence[Mapping[str, Any]],
+) -> list[str]:
+    """Insert many ``public.domain_events`` rows in one statement.
+
+    Each entry carries ``event_type``, ``source_butler`` and an optional
+    ``payload``.  Ids are minted client-side so the returned list lines up
+    with *events* without relying on ``RETURNING`` order.  Like
+    :func:`record_event`, a failure propagates: either the whole burst is
+    recorded or none of it is.
+    """
+    if not events:
+        return []
+    event_ids = [uuid.uuid4() for _ in events]
+    await pool.execute(
+        """
+        INSERT INTO public.domain_events (id, event_type, source_butler, payload)
+        SELECT e.id, e.event_type, e.source_butler, e.payload::jsonb
+        FROM unnest($1::uuid[], $2::text[], $3::text[], $4::text[])
+             AS e(id, event_type, source_butler, payload)
+        """,
+        event_ids,
+        [event["event_type"] for event in events],
+        [event["source_butler"] for event in events],
+        [_dumps_payload(event.get("payload")) for event in events],
+    )
+    return [str(event_id) for event_id in event_ids]
+
+
 async def get_event(pool: asyncpg.Pool, event_id: uuid.UUID | str) -> dict[str, Any] | None:
     """Return a single domain-event row by id, or ``None`` if it does not exist."""
     row = await pool.fetchrow(
@@ -177,18 +220,32 @@ async def upsert_subscription(
     *,
     subscriber_butler: str,
     event_type: str,
+    batch_max_events: int | None = None,
+    batch_max_latency_ms: int | None = None,
 ) -> dict[str, Any]:
-    """Create or reactivate a standing subscription; idempotent."""
+    """Create or reactivate a standing subscription; idempotent.
+
+    ``batch_max_events``/``batch_max_latency_ms`` opt the subscription into
+    coalesced delivery (both set) or back out of it (both ``None``); the
+    core_207 check constraint rejects anything in between.
+    """
     row = await pool.fetchrow(
         """
-        INSERT INTO public.butler_subscriptions (subscriber_butler, event_type, active)
-        VALUES ($1, $2, true)
+        INSERT INTO public.butler_subscriptions
+            (subscriber_butler, event_type, active, batch_max_events, batch_max_latency_ms)
+        VALUES ($1, $2, true, $3, $4)
         ON CONFLICT (subscriber_butler, event_type)
-        DO UPDATE SET active = true, updated_at = now()
-        RETURNING id, subscriber_butler, event_type, active, created_at, updated_at
+        DO UPDATE SET active = true,
+                      batch_max_events = EXCLUDED.batch_max_events,
+                      batch_max_latency_ms = EXCLUDED.batch_max_latency_ms,
+                      updated_at = now()
+        RETURNING id, subscriber_butler, event_type, active, batch_max_events,
+                  batch_max_latency_ms, created_at, updated_at
         """,
         subscriber_butler,
         event_type,
+        batch_max_events,
+        batch_max_latency_ms,
     )
     return _row_to_dict(row)
 
@@ -242,7 +299,8 @@ async def list_subscriptions(
     where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
     rows = await pool.fetch(
         f"""
-        SELECT id, subscriber_butler, event_type, active, created_at, updated_at
+        SELECT id, subscriber_butler, event_type, active, batch_max_events,
+               batch_max_latency_ms, created_at, updated_at
         FROM public.butler_subscriptions{where}
         ORDER BY updated_at DESC
         """,
@@ -265,6 +323,26 @@ async def get_active_subscribers(pool: asyncpg.Pool, event_type: str) -> list[st
     return [r["subscriber_butler"] for r in rows]
 
 
+async def get_active_subscriptions(
+    pool: asyncpg.Pool, event_types: Sequence[str]
+) -> list[dict[str, Any]]:
+    """Return every active subscription to any of *event_types*, with its batch settings.
+
+    The coalesced fan-out's single subscription read for a whole burst;
+    ``batch_max_events`` is ``None`` for a per-event subscriber.
+    """
+    rows = await pool.fetch(
+        """
+        SELECT event_type, subscriber_butler, batch_max_events, batch_max_latency_ms
+        FROM public.butler_subscriptions
+        WHERE event_type = ANY($1::text[]) AND active
+        ORDER BY event_type, subscriber_butler
+        """,
+        sorted(set(event_types)),
+    )
+    return [_row_to_dict(r) for r in rows]
+
+
 # ---------------------------------------------------------------------------
 # Delivery ledger: atomic per-subscriber fan-out claim/outcome
 # ---------------------------------------------------------------------------
@@ -447,6 +525,149 @@ async def mark_delivery_failed(
     )
 
 
+_CLAIM_COLUMNS = """id, event_id, subscriber_butler, status, task_id, task_name,
+               error_message, delivered_at, created_at, updated_at"""
+
+
+async def claim_deliveries(
+    pool: asyncpg.Pool | asyncpg.Connection,
+    *,
+    event_ids: Sequence[uuid.UUID | str],
+    subscriber_butler: str,
+    batch_id: uuid.UUID | str | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Claim (or re-observe) one subscriber's delivery rows for many events at once.
+
+    The set form of :func:`claim_delivery`: fresh pairs come back as new
+    ``pending`` rows tagged with *batch_id*, existing pairs come back as
+    whatever row is already there, and callers branch on ``status`` exactly
+    as they would for a single claim.  Returns ``{event_id: row}``.
+
+    The insert and the re-read share one statement; a pair a concurrent
+    claimer inserted after that statement's snapshot is neither inserted
+    nor visible to it, so any id still missing is re-read once more.
+    """
+    wanted = [uuid.UUID(str(event_id)) for event_id in event_ids]
+    if not wanted:
+        return {}
+    rows = await pool.fetch(
+        f"""
+        WITH inserted AS (
+            INSERT INTO public.domain_event_deliveries
+                (event_id, subscriber_butler, status, batch_id)
+            SELECT e, $2, 'pending', $3 FROM unnest($1::uuid[]) AS e
+            ON CONFLICT (event_id, subscriber_butler) DO NOTHING
+            RETURNING {_CLAIM_COLUMNS}
+        )
+        SELECT {_CLAIM_COLUMNS} FROM inserted
+        UNION ALL
+        SELECT {_CLAIM_COLUMNS}
+        FROM public.domain_event_deliveries
+        WHERE event_id = ANY($1::uuid[]) AND subscriber_butler = $2
+        """,
+        wanted,
+        subscriber_butler,
+        uuid.UUID(str(batch_id)) if batch_id is not None else None,
+    )
+    claimed = {str(row["event_id"]): _row_to_dict(row) for row in rows}
+    missing = [event_id for event_id in wanted if str(event_id) not in claimed]
+    if missing:
+        raced = await pool.fetch(
+            f"""
+            SELECT {_CLAIM_COLUMNS}
+            FROM public.domain_event_deliveries
+            WHERE event_id = ANY($1::uuid[]) AND subscriber_butler = $2
+            """,
+            missing,
+            subscriber_butler,
+        )
+        claimed.update({str(row["event_id"]): _row_to_dict(row) for row in raced})
+    if len(claimed) != len(set(wanted)):
+        raise RuntimeError(
+            f"claim_deliveries: {len(set(wanted)) - len(claimed)} claimed pair(s) for "
+            f"subscriber_butler={subscriber_butler!r} could not be re-read."
+        )
+    return claimed
+
+
+async def mark_deliveries_delivered(
+    pool: asyncpg.Pool | asyncpg.Connection,
+    settlements: Sequence[tuple[uuid.UUID | str, uuid.UUID | str, str]],
+) -> dict[str, str | None]:
+    """Persist many successful dispatches in one statement.
+
+    *settlements* are ``(delivery_id, task_id, task_name)`` triples.  Same
+    fence as :func:`mark_delivery_delivered` -- a terminal row is never
+    overwritten -- and rows that lost the fence are re-observed in one
+    follow-up read.  Returns ``{delivery_id: observed_status}`` (``None``
+    for a row that no longer exists).
+    """
+    if not settlements:
+        return {}
+    delivery_ids = [uuid.UUID(str(delivery_id)) for delivery_id, _, _ in settlements]
+    rows = await pool.fetch(
+        """
+        UPDATE public.domain_event_deliveries AS d
+        SET status = 'delivered', task_id = s.task_id, task_name = s.task_name,
+            delivered_at = now(), updated_at = now()
+        FROM unnest($1::uuid[], $2::uuid[], $3::text[]) AS s(id, task_id, task_name)
+        WHERE d.id = s.id AND d.status NOT IN ('delivered', 'failed_permanent')
+        RETURNING d.id, d.status
+        """,
+        delivery_ids,
+        [uuid.UUID(str(task_id)) for _, task_id, _ in settlements],
+        [task_name for _, _, task_name in settlements],
+    )
+    observed: dict[str, str | None] = {str(row["id"]): str(row["status"]) for row in rows}
+    fenced = [delivery_id for delivery_id in delivery_ids if str(delivery_id) not in observed]
+    if fenced:
+        observed.update({str(delivery_id): None for delivery_id in fenced})
+        rows = await pool.fetch(
+            "SELECT id, status FROM public.domain_event_deliveries WHERE id = ANY($1::uuid[])",
+            fenced,
+        )
+        observed.update({str(row["id"]): str(row["status"]) for row in rows})
+    return observed
+
+
+async def mark_deliveries_failed(
+    pool: asyncpg.Pool | asyncpg.Connection,
+    failures: Sequence[tuple[uuid.UUID | str, str, bool]],
+    *,
+    max_attempts: int | None = None,
+) -> dict[str, str]:
+    """Record many dispatch failures in one statement.
+
+    *failures* are ``(delivery_id, error_message, retryable)`` triples with
+    the same per-row semantics as :func:`mark_delivery_failed`.  Returns
+    ``{delivery_id: resulting_status}`` for the rows actually updated; a
+    terminal row is skipped and absent from the result.
+    """
+    if not failures:
+        return {}
+    rows = await pool.fetch(
+        """
+        UPDATE public.domain_event_deliveries AS d
+        SET status = CASE
+                WHEN NOT f.retryable THEN 'failed_permanent'
+                WHEN $4::int IS NOT NULL AND d.attempt_count + 1 >= $4 THEN 'failed_permanent'
+                ELSE 'failed'
+            END,
+            attempt_count = d.attempt_count + 1,
+            error_message = f.error_message,
+            updated_at = now()
+        FROM unnest($1::uuid[], $2::text[], $3::bool[]) AS f(id, error_message, retryable)
+        WHERE d.id = f.id AND d.status NOT IN ('delivered', 'failed_permanent')
+        RETURNING d.id, d.status
+        """,
+        [uuid.UUID(str(delivery_id)) for delivery_id, _, _ in failures],
+        [error_message for _, error_message, _ in failures],
+        [retryable for _, _, retryable in failures],
+        max_attempts,
+    )
+    return {str(row["id"]): str(row["status"]) for row in rows}
+
+
 async def list_deliveries_for_event(
     pool: asyncpg.Pool, event_id: uuid.UUID | str
 ) -> list[dict[str, Any]]:
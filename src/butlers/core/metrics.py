@@ -93,6 +93,49 @@ Domain events (emitted from core_tools/_domain_events.py):
       (labels: source_butler, destination_butler, reason=non_retryable|attempts_exhausted)
       Durable domain-event delivery transitions that can no longer be retried.
 
+  butlers.domain_event.batch_size     Histogram (labels: source_butler, destination_butler)
+      Events carried by one coalesced receive_domain_events dispatch.
+
+  butlers.domain_event.batch_dead_lettered_total Counter
+      (labels: source_butler, destination_butler)
+      Batch members that failed and were handed to the per-event retry path.
+
+Credentials (emitted from credential_cache.py):
+
+  butlers.credentials.cache_lookups_total Counter (labels: layer, outcome)
+      CredentialStore.resolve() cache lookups per layer (local, shared,
+      compat_N), tagged hit|negative_hit|miss.  Keys and values are never
+      metric attributes.
+
+Notifications (emitted from notification_hub.py):
+
+  butlers.notifications.subscribers   UpDownCounter (label: channel)
+      Live subscriptions on the process LISTEN hub per NOTIFY channel.
+
+  butlers.notifications.queue_depth   UpDownCounter (label: channel)
+      Notifications delivered to subscription queues but not yet consumed.
+
+  butlers.notifications.dropped_total Counter (label: channel)
+      Notifications dropped because a subscriber's bounded queue was full.
+
+  butlers.notifications.gaps_total    Counter (labels: channel, reason)
+      Missed-notification gaps reported to subscribers
+      (reason=disconnected|overflow).
+
+Database profiling (emitted from db_profiler.py when BUTLERS_DB_PROFILE is set):
+
+  butlers.db.operation_queries        Histogram (label: operation)
+      Round trips issued by one logical operation (tick, spawn, request, ...).
+
+  butlers.db.operation_rows           Histogram (label: operation)
+      Rows returned or affected by those round trips.
+
+  butlers.db.operation_time_ms        Histogram (label: operation)
+      Summed query wall time of the operation in milliseconds.
+
+  butlers.db.query_budget_exceeded_total Counter (label: operation)
+      Operations that issued more round trips than BUTLERS_DB_QUERY_BUDGET.
+
 Failover (emitted from spawner.py same-tier failover loop):
 
   butlers.spawner.failover_attempts_total   Counter (labels: butler, from_model, to_model, reason)
@@ -257,6 +300,18 @@ def _spawner_session_duration_ms() -> metrics.Histogram:
     )
 
 
+def _spawner_setup_duration_ms() -> metrics.Histogram:
+    """Histogram: time from session start to the first runtime invocation."""
+    return get_meter().create_histogram(
+        name="butlers.spawner.setup_duration_ms",
+        description=(
+            "Pre-invoke setup time per session (prompt, context, env and MCP config) "
+            "in milliseconds"
+        ),
+        unit="ms",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Buffer instruments
 # ---------------------------------------------------------------------------
@@ -440,6 +495,184 @@ def record_domain_event_delivery_failed_permanent(
     )
 
 
+def _domain_event_batch_size() -> metrics.Histogram:
+    """Histogram: events per coalesced fan-out dispatch."""
+    return get_meter().create_histogram(
+        name="butlers.domain_event.batch_size",
+        description="Domain events carried by one coalesced receive_domain_events dispatch",
+        unit="events",
+    )
+
+
+def _domain_event_batch_dead_lettered_total() -> metrics.Counter:
+    """Counter: batch members handed to the per-event retry path."""
+    return get_meter().create_counter(
+        name="butlers.domain_event.batch_dead_lettered_total",
+        description="Coalesced domain-event batch members dead-lettered to per-event retry",
+        unit="deliveries",
+    )
+
+
+def record_domain_event_batch(
+    *,
+    source_butler: str,
+    destination_butler: str,
+    size: int,
+    dead_lettered: int = 0,
+) -> None:
+    """Record one coalesced dispatch and how many of its members were dead-lettered."""
+    attrs = {"source_butler": source_butler, "destination_butler": destination_butler}
+    _domain_event_batch_size().record(size, attrs)
+    if dead_lettered:
+        _domain_event_batch_dead_lettered_total().add(dead_lettered, attrs)
+
+
+_CREDENTIAL_CACHE_OUTCOMES = frozenset({"hit", "negative_hit", "miss"})
+
+
+def _credentials_cache_lookups_total() -> metrics.Counter:
+    """Counter: credential cache lookups (labels: layer, outcome)."""
+    return get_meter().create_counter(
+        name="butlers.credentials.cache_lookups_total",
+        description="CredentialStore.resolve() cache lookups by layer and outcome",
+        unit="lookups",
+    )
+
+
+def record_credential_cache_lookup(*, layer: str, outcome: str) -> None:
+    """Record one credential cache lookup.
+
+    Only the layer label and the outcome are recorded; secret keys and values
+    never become metric attributes.
+    """
+    if outcome not in _CREDENTIAL_CACHE_OUTCOMES:
+        raise ValueError(f"unsupported credential cache outcome: {outcome!r}")
+    _credentials_cache_lookups_total().add(1, {"layer": layer, "outcome": outcome})
+
+
+# ---------------------------------------------------------------------------
+# Notification hub instruments
+# ---------------------------------------------------------------------------
+
+
+def _notification_subscribers() -> metrics.UpDownCounter:
+    """UpDownCounter: live LISTEN hub subscriptions per channel."""
+    return get_meter().create_up_down_counter(
+        name="butlers.notifications.subscribers",
+        description="Live subscriptions on the process LISTEN hub",
+        unit="subscriptions",
+    )
+
+
+def _notification_queue_depth() -> metrics.UpDownCounter:
+    """UpDownCounter: notifications queued for subscribers, not yet consumed."""
+    return get_meter().create_up_down_counter(
+        name="butlers.notifications.queue_depth",
+        description="Notifications waiting in LISTEN hub subscription queues",
+        unit="notifications",
+    )
+
+
+def _notification_dropped_total() -> metrics.Counter:
+    """Counter: notifications dropped on a full subscription queue."""
+    return get_meter().create_counter(
+        name="butlers.notifications.dropped_total",
+        description="Notifications dropped because a subscription queue was full",
+        unit="notifications",
+    )
+
+
+def _notification_gaps_total() -> metrics.Counter:
+    """Counter: missed-notification gaps reported to subscribers."""
+    return get_meter().create_counter(
+        name="butlers.notifications.gaps_total",
+        description="Missed-notification gaps reported to LISTEN hub subscribers",
+        unit="gaps",
+    )
+
+
+def record_notification_subscribers(*, channel: str, delta: int) -> None:
+    """Adjust the live subscription count for *channel*."""
+    _notification_subscribers().add(delta, {"channel": channel})
+
+
+def record_notification_queue_depth(*, channel: str, delta: int) -> None:
+    """Adjust the queued-notification count for *channel*."""
+    _notification_queue_depth().add(delta, {"channel": channel})
+
+
+def record_notification_dropped(*, channel: str) -> None:
+    """Record one notification dropped on a full subscription queue."""
+    _notification_dropped_total().add(1, {"channel": channel})
+
+
+def record_notification_gap(*, channel: str, reason: str) -> None:
+    """Record one missed-notification gap reported to a subscriber."""
+    _notification_gaps_total().add(1, {"channel": channel, "reason": reason})
+
+
+# ---------------------------------------------------------------------------
+# Database profiling instruments
+# ---------------------------------------------------------------------------
+
+
+def _db_operation_queries() -> metrics.Histogram:
+    """Histogram: round trips per logical operation."""
+    return get_meter().create_histogram(
+        name="butlers.db.operation_queries",
+        description="Database round trips issued by one logical operation",
+        unit="queries",
+    )
+
+
+def _db_operation_rows() -> metrics.Histogram:
+    """Histogram: rows returned or affected per logical operation."""
+    return get_meter().create_histogram(
+        name="butlers.db.operation_rows",
+        description="Rows returned or affected by one logical operation's queries",
+        unit="rows",
+    )
+
+
+def _db_operation_time_ms() -> metrics.Histogram:
+    """Histogram: summed query time per logical operation."""
+    return get_meter().create_histogram(
+        name="butlers.db.operation_time_ms",
+        description="Summed database query wall time of one logical operation",
+        unit="ms",
+    )
+
+
+def _db_query_budget_exceeded_total() -> metrics.Counter:
+    """Counter: operations over the configured query budget."""
+    return get_meter().create_counter(
+        name="butlers.db.query_budget_exceeded_total",
+        description="Logical operations that exceeded the database query budget",
+        unit="operations",
+    )
+
+
+def record_db_operation_profile(
+    *,
+    operation: str,
+    queries: int,
+    rows: int,
+    db_time_ms: float,
+    over_budget: bool,
+) -> None:
+    """Record one finished database operation profile.
+
+    ``operation`` is a code-defined name (function or route template); request
+    ids, SQL text and arguments are never metric attributes.
+    """
+    attrs = {"operation": operation}
+    _db_operation_queries().record(queries, attrs)
+    _db_operation_rows().record(rows, attrs)
+    _db_operation_time_ms().record(db_time_ms, attrs)
+    if over_budget:
+        _db_query_budget_exceeded_total().add(1, attrs)
+
+
 # ---------------------------------------------------------------------------
 # Recovery instruments
 # ---------------------------------------------------------------------------
@@ -559,6 +792,7 @@ class ButlerMetrics:
         self.__spawner_queued: metrics.UpDownCounter | None = None
         self.__spawner_global_queue_depth: metrics.UpDownCounter | None = None
         self.__spawner_duration: metrics.Histogram | None = None
+        self.__spawner_setup_duration: metrics.Histogram | None = None
         self.__spawner_input_tokens: metrics.Counter | None = None
         self.__spawner_output_tokens: metrics.Counter | None = None
         self.__buf_depth: metrics.UpDownCounter | None = None
@@ -606,6 +840,12 @@ class ButlerMetrics:
             self.__spawner_duration = _spawner_session_duration_ms()
         return self.__spawner_duration
 
+    @property
+    def _spawner_setup_duration(self) -> metrics.Histogram:
+        if self.__spawner_setup_duration is None:
+            self.__spawner_setup_duration = _spawner_setup_duration_ms()
+        return self.__spawner_setup_duration
+
     @property
     def _spawner_input_tokens(self) -> metrics.Counter:
         if self.__spawner_input_tokens is None:
@@ -770,6 +1010,16 @@ class ButlerMetrics:
         """Record the end-to-end duration of a completed session."""
         self._spawner_duration.record(duration_ms, self._attrs)
 
+    def record_spawn_setup_duration(self, duration_ms: int, *, trigger_source: str) -> None:
+        """Record pre-invoke setup time for a session.
+
+        ``schedule:<name>``-style sources are reduced to their prefix to keep
+        label cardinality bounded.
+        """
+        self._spawner_setup_duration.record(
+            duration_ms, {**self._attrs, "trigger_source": trigger_source.split(":", 1)[0]}
+        )
+
     # -- buffer recording helpers -------------------------------------------
 
     def buffer_queue_depth_inc(self) -> None:
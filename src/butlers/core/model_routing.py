@@ -1144,22 +1144,24 @@ _CEILING_SELECT_SQL = """
 SELECT monthly_usd FROM public.spend_ceiling WHERE id = 1
 """
 
-# Aggregate current-month token usage per model_id from the ledger.  Grouped by
-# model_id so the caller can apply per-model pricing in Python (pricing config is
-# not represented in the DB).  Scoped to ledger rows recorded since the start of
-# the current UTC month (date_trunc('month', now())).
+# Aggregate current-month token usage per model_id from the ledger's hourly
+# rollup (public.token_usage_hourly, core_203).  Grouped by model_id so the caller
+# can apply per-model pricing in Python (pricing config is not represented in the
+# DB).  Scoped to buckets since the start of the current UTC month
+# (date_trunc('month', now())), which is always a bucket boundary.
 _MTD_USAGE_BY_MODEL_SQL = """
 SELECT
     mc.model_id AS model_id,
-    COUNT(*) AS calls,
-    COALESCE(SUM(tul.input_tokens), 0)  AS input_tokens,
-    COALESCE(SUM(tul.output_tokens), 0) AS output_tokens,
-    COALESCE(SUM(tul.cached_input_tokens), 0)   AS cached_input_tokens,
-    COALESCE(SUM(tul.cache_creation_tokens), 0) AS cache_creation_tokens
-FROM public.token_usage_ledger tul
-JOIN public.model_catalog mc ON mc.id = tul.catalog_entry_id
-WHERE tul.recorded_at >= date_trunc('month', now() AT TIME ZONE 'UTC')
+    SUM(tuh.calls)::bigint AS calls,
+    SUM(tuh.input_tokens)::bigint  AS input_tokens,
+    SUM(tuh.output_tokens)::bigint AS output_tokens,
+    SUM(tuh.cached_input_tokens)::bigint   AS cached_input_tokens,
+    SUM(tuh.cache_creation_tokens)::bigint AS cache_creation_tokens
+FROM public.token_usage_hourly tuh
+JOIN public.model_catalog mc ON mc.id = tuh.catalog_entry_id
+WHERE tuh.bucket_start >= date_trunc('month', now() AT TIME ZONE 'UTC')
 GROUP BY mc.model_id
+HAVING SUM(tuh.calls) > 0
 """
 
 # Load all spend routing rules in evaluation order (top-to-bottom = position ASC).
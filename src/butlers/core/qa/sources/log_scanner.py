@@ -13,6 +13,21 @@ Log root structure (relative to BUTLERS_LOG_ROOT or ``logs/``)::
 
 Findings are aggregated by fingerprint within a single scan cycle.
 
+Incremental tailing
+-------------------
+Each file keeps a ``(device, inode, offset)`` checkpoint across scans, so a
+patrol reads only the bytes appended since the previous one.  A file seen for
+the first time is entered at the start of the lookback window, located by
+stepping back from EOF a chunk at a time.  An inode change (weekly rotation)
+or a file shorter than its checkpoint restarts that file at offset 0.
+
+Lines are pre-filtered with a byte-level scan for an error / critical /
+warning ``level`` before any JSON decoding, and qualifying entries are
+retained per file until they fall out of the lookback window, so every scan
+still reports the whole window.  When the line or wall-clock caps stop a
+read, the unread lines stay behind the checkpoint and are picked up by the
+next scan instead of being dropped.  Reading runs in a worker thread.
+
 Structured evidence
 -------------------
 Each aggregated finding carries a ``structured_evidence`` dict populated from
@@ -37,15 +52,19 @@ openspec/changes/qa-staffer/specs/qa-investigation-dispatch/spec.md
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import random
 import re
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
 
 from butlers.core.healing.anonymizer import anonymize
 from butlers.core.healing.fingerprint import (
@@ -68,7 +87,7 @@ DEFAULT_MAX_ENTRIES_PER_SCAN = 10_000
 #: Default maximum number of unique findings per scan.
 DEFAULT_MAX_FINDINGS_PER_SCAN = 100
 
-#: Default hard cap on total lines parsed (including benign INFO/DEBUG lines) per scan.
+#: Default hard cap on new lines read (including benign INFO/DEBUG lines) per scan.
 #: Prevents unbounded CPU/latency under extremely noisy-but-benign log traffic.
 DEFAULT_MAX_TOTAL_LINES = 200_000
 
@@ -103,9 +122,21 @@ _LOG_ROOT_ENV = "BUTLERS_LOG_ROOT"
 #: Default log root (relative to CWD if not absolute).
 _DEFAULT_LOG_ROOT = "logs"
 
-#: Bytes to read from the end of a log file per chunk when scanning backwards.
+#: Bytes read per chunk, both when tailing forwards and when locating the
+#: start of the lookback window on a file seen for the first time.
 _TAIL_CHUNK_SIZE = 64 * 1024  # 64 KiB
 
+#: Cheap byte-level pre-filter: only lines that mention an error, critical or
+#: warning level are JSON-decoded.  Deliberately a superset of what
+#: ``_should_include_entry`` accepts — the decoded entry has the final say.
+_LEVEL_PREFILTER_RE = re.compile(
+    rb'"(?:log_)?level"\s*:\s*"(?:error|critical|warn(?:ing)?)"',
+    re.IGNORECASE,
+)
+
+#: Timestamp peek used to locate the lookback window without ``json.loads``.
+_TIMESTAMP_PEEK_RE = re.compile(rb'"(?:timestamp|ts|time)"\s*:\s*"([^"]+)"')
+
 # Switchboard message classification is intentionally capped at a short
 # timeout and falls back to General when the routing LLM does not return.
 # Those timeout records are degradation telemetry, not actionable runtime bugs
@@ -138,6 +169,38 @@ class LogEntry:
     raw: dict = field(default_factory=dict, repr=False)
 
 
+@dataclass(frozen=True)
+class _Candidate:
+    """A qualifying log entry with its finding fields already derived.
+
+    Computed once when the line is first read, so re-aggregating the
+    lookback window on later patrols costs no parsing, sanitizing or hashing.
+    """
+
+    fingerprint: str
+    timestamp: datetime
+    butler_name: str
+    level: str
+    severity: int
+    exception_type: str
+    call_site: str
+    event_summary: str
+    trigger_source: str | None
+
+
+@dataclass
+class _TailState:
+    """Per-file tail checkpoint kept across ``discover()`` calls.
+
+    ``file_id`` is ``(st_dev, st_ino)``; a change means the path was rotated
+    to a new file.  ``offset`` always sits at a line boundary.
+    """
+
+    file_id: tuple[int, int]
+    offset: int
+    candidates: deque[_Candidate]
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -369,79 +432,38 @@ def _level_to_severity(level: str, exception_type: str, call_site: str) -> int:
     return 1  # SEVERITY_HIGH
 
 
-def _read_file_tail(log_file: Path, cutoff: datetime) -> list[str]:
-    """Read lines from *log_file* starting from lines within the cutoff window.
-
-    Reads the file from the end in chunks, stopping once we encounter entries
-    older than *cutoff*.  Only scans the active ``.log`` file (not rotated
-    files like ``.log.1``).
-
-    Returns a list of raw line strings (newest-first order is reversed to
-    oldest-first before returning).
-    """
-    lines: list[str] = []
-    try:
-        file_size = log_file.stat().st_size
-    except OSError:
-        return lines
-
-    if file_size == 0:
-        return lines
-
-    # Read in chunks from the end
-    offset = file_size
-    leftover = b""
-    found_old = False
-
-    try:
-        with log_file.open("rb") as fh:
-            while offset > 0 and not found_old:
-                chunk_size = min(_TAIL_CHUNK_SIZE, offset)
-                offset -= chunk_size
-                fh.seek(offset)
-                chunk = fh.read(chunk_size)
-                # Prepend any leftover bytes from the previous chunk boundary
-                data = chunk + leftover
-                raw_lines = data.split(b"\n")
-                # The first element may be an incomplete line at the chunk boundary
-                leftover = raw_lines[0]
-                complete_lines = raw_lines[1:]
-
-                for raw_line in reversed(complete_lines):
-                    line_str = raw_line.decode("utf-8", errors="replace").strip()
-                    if not line_str:
-                        continue
-                    # Quick timestamp check to stop reading if we've gone past the window
-                    # (only parse JSON when necessary to estimate boundary)
-                    try:
-                        data_peek = json.loads(line_str)
-                        ts_str = (
-                            data_peek.get("timestamp")
-                            or data_peek.get("ts")
-                            or data_peek.get("time")
-                            or ""
-                        )
-                        ts = _parse_timestamp(ts_str)
-                        if ts is not None and ts < cutoff:
-                            found_old = True
-                            break
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-                    lines.append(line_str)
+def _peek_timestamp(raw_line: bytes) -> datetime | None:
+    """Pull the timestamp out of a raw JSON log line without decoding it."""
+    match = _TIMESTAMP_PEEK_RE.search(raw_line)
+    if match is None:
+        return None
+    return _parse_timestamp(match.group(1).decode("ascii", errors="replace"))
 
-            # Handle any remaining leftover bytes (beginning of file)
-            if leftover:
-                line_str = leftover.decode("utf-8", errors="replace").strip()
-                if line_str:
-                    lines.append(line_str)
 
-    except OSError as exc:
-        logger.debug("LogScannerSource: could not read %s: %s", log_file, exc)
-        return []
+def _window_start_offset(fh: BinaryIO, file_size: int, cutoff: datetime) -> int:
+    """Return a line-aligned byte offset at or before the first entry >= *cutoff*.
 
-    # Lines were collected newest-first; reverse to oldest-first
-    lines.reverse()
-    return lines
+    Steps backwards from EOF one chunk at a time and peeks only at the first
+    complete line of each chunk; the first chunk whose leading line predates
+    *cutoff* bounds the window.  The result may start a little early — the
+    forward read drops anything older than *cutoff* — but never late.
+    """
+    pos = file_size
+    while pos > 0:
+        pos = max(0, pos - _TAIL_CHUNK_SIZE)
+        if pos == 0:
+            return 0
+        fh.seek(pos)
+        chunk = fh.read(_TAIL_CHUNK_SIZE)
+        line_start = chunk.find(b"\n") + 1
+        line_end = chunk.find(b"\n", line_start)
+        if line_start == 0 or line_end < 0:
+            # No complete line inside this chunk; keep stepping back.
+            continue
+        ts = _peek_timestamp(chunk[line_start:line_end])
+        if ts is not None and ts < cutoff:
+            return pos + line_start
+    return 0
 
 
 def _extract_call_site(entry: LogEntry) -> str:
@@ -470,7 +492,9 @@ class LogScannerSource:
     Reads structured JSON log files from ``logs/butlers/``,
     ``logs/connectors/``, and ``logs/uvicorn/`` within the configured
     lookback window.  Produces aggregated ``QaFinding`` objects for each
-    unique fingerprint seen.
+    unique fingerprint seen.  Instances are stateful: they hold each file's
+    tail checkpoint and the qualifying entries still inside the window, so
+    one instance should be reused across patrols.
 
     Parameters
     ----------
@@ -488,12 +512,15 @@ class LogScannerSource:
     max_findings_per_scan:
         Hard cap on unique findings produced per ``discover()`` call.
     max_total_lines:
-        Hard cap on total lines parsed (including benign INFO/DEBUG lines) per
+        Hard cap on new lines read (including benign INFO/DEBUG lines) per
         ``discover()`` call.  Bounds CPU and latency under extremely
-        noisy-but-benign log traffic.  Default ``200_000``.
+        noisy-but-benign log traffic; lines beyond the cap are read by the
+        next call.  Default ``200_000``.
     max_scan_seconds:
-        Wall-clock cap in seconds for a single ``discover()`` call.  Scan
-        stops gracefully and returns findings collected so far.  Default 30.
+        Wall-clock cap in seconds for reading new lines in a single
+        ``discover()`` call.  Reading stops gracefully, findings collected so
+        far are returned, and the next call resumes where it stopped.
+        Default 30.
     suppress_session_duplicate_timeouts:
         When ``True``, spawner timeout logs already covered by the
         session_records source are skipped to avoid duplicate QA findings.
@@ -532,6 +559,11 @@ class LogScannerSource:
         self.last_truncated: datetime | None = None
         self.last_truncated_reason: str | None = None
 
+        # Per-file tail checkpoints; only touched from the worker thread that
+        # runs _scan(), serialised by _scan_lock.
+        self._tails: dict[Path, _TailState] = {}
+        self._scan_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         """Source identifier: ``"log_scanner"``."""
@@ -540,6 +572,11 @@ class LogScannerSource:
     async def discover(self, lookback_minutes: int) -> list[QaFinding]:
         """Scan log files and return aggregated findings.
 
+        Only bytes appended since the previous call are read; qualifying
+        entries are retained per file for the lookback window, so every call
+        still reports the whole window.  File I/O and parsing run in a worker
+        thread.
+
         Parameters
         ----------
         lookback_minutes:
@@ -552,20 +589,17 @@ class LogScannerSource:
         """
         now = datetime.now(UTC)
         cutoff = now - timedelta(minutes=lookback_minutes)
-        log_root = _get_log_root(self._log_root)
         scan_start = time.monotonic()
+        return await asyncio.to_thread(self._scan, now, cutoff, scan_start)
 
-        # fingerprint -> aggregation state
-        aggregated: dict[str, _FindingAccumulator] = {}
+    def _scan(self, now: datetime, cutoff: datetime, scan_start: float) -> list[QaFinding]:
+        with self._scan_lock:
+            return self._scan_locked(now, cutoff, scan_start)
 
-        total_lines_parsed = 0
-        entries_processed = 0
-        malformed_count = 0
-        truncated_entries = False
-        truncated_findings = False
-        truncated_total_lines = False
-        truncated_time = False
+    def _scan_locked(self, now: datetime, cutoff: datetime, scan_start: float) -> list[QaFinding]:
+        log_root = _get_log_root(self._log_root)
 
+        log_files: list[Path] = []
         for subdir_name in _LOG_SUBDIRS:
             subdir = log_root / subdir_name
             if not subdir.exists():
@@ -574,134 +608,103 @@ class LogScannerSource:
 
             # Shuffle file order to avoid deterministic starvation of later
             # files/subdirectories under sustained benign load.
-            log_files = list(subdir.glob("*.log"))
-            random.shuffle(log_files)
+            subdir_files = [
+                log_file for log_file in subdir.glob("*.log") if log_file.name != _QA_LOG_EXCLUDE
+            ]
+            random.shuffle(subdir_files)
+            log_files.extend(subdir_files)
+
+        # Forget files that no longer exist.
+        present = set(log_files)
+        for stale in [path for path in self._tails if path not in present]:
+            del self._tails[stale]
+
+        # Phase 1: tail new bytes.  The line caps bound this patrol's read
+        # work; unread bytes stay behind the checkpoint for the next patrol.
+        total_lines_parsed = 0
+        malformed_count = 0
+        read_truncation: str | None = None
+        for log_file in log_files:
+            lines_read, malformed, read_truncation = self._read_new_lines(
+                log_file,
+                cutoff,
+                scan_start,
+                lines_budget=self._max_total_lines - total_lines_parsed,
+            )
+            total_lines_parsed += lines_read
+            malformed_count += malformed
+            if read_truncation is not None:
+                break
 
-            for log_file in log_files:
-                # Exclude QA staffer's own log
-                if log_file.name == _QA_LOG_EXCLUDE:
-                    continue
+        # Phase 2: aggregate every retained candidate inside the window.
+        aggregated: dict[str, _FindingAccumulator] = {}
+        entries_processed = 0
+        truncated_entries = False
+        truncated_findings = False
+        for log_file in log_files:
+            state = self._tails.get(log_file)
+            if state is None:
+                continue
+            while state.candidates and state.candidates[0].timestamp < cutoff:
+                state.candidates.popleft()
 
-                butler_name = _butler_name_from_filename(log_file)
-                raw_lines = _read_file_tail(log_file, cutoff)
-
-                for line in raw_lines:
-                    # Wall-clock cap — checked on every line to bound latency.
-                    if time.monotonic() - scan_start >= self._max_scan_seconds:
-                        truncated_time = True
-                        break
-
-                    # Total-lines cap — counts every parsed line regardless of level.
-                    if total_lines_parsed >= self._max_total_lines:
-                        truncated_total_lines = True
-                        break
-
-                    # Candidate-entries cap — counts only temporally-valid entries.
-                    if entries_processed >= self._max_entries:
-                        truncated_entries = True
-                        break
-
-                    if len(aggregated) >= self._max_findings:
-                        truncated_findings = True
-                        break
-
-                    total_lines_parsed += 1
-
-                    entry = _parse_log_line(line, butler_name)
-                    if entry is None:
-                        malformed_count += 1
-                        continue
-
-                    # Temporal filter
-                    if entry.timestamp < cutoff:
-                        continue
-
-                    # Budget only covers candidate error/warning entries;
-                    # benign entries are skipped without consuming quota.
-                    if not _should_include_entry(
-                        entry,
-                        suppress_session_duplicate_timeouts=(
-                            self._suppress_session_duplicate_timeouts
-                        ),
-                    ):
-                        continue
-
-                    entries_processed += 1
-
-                    # Build finding fields
-                    exception_type = entry.exception or "unknown"
-                    call_site = _extract_call_site(entry)
-
-                    # Fingerprint on the full sanitized event (up to fingerprint.py's 500-char
-                    # internal cap) so this source stays compatible with canonical paths.
-                    # Store a shorter anonymized summary for display/storage only.
-                    sanitized_event_for_fp = _sanitize_message(entry.event)
-                    raw_summary = entry.event[:_MAX_SUMMARY_LEN]
-                    sanitized_summary = _sanitize_message(raw_summary)
-                    anon_summary = anonymize(sanitized_summary, self._repo_root)
-
-                    fingerprint = _compute_hash(exception_type, call_site, sanitized_event_for_fp)
-
-                    if fingerprint not in aggregated:
-                        if len(aggregated) >= self._max_findings:
-                            truncated_findings = True
-                            break
-                        severity = _level_to_severity(entry.level, exception_type, call_site)
-                        # Extract trigger_source from raw log JSON for structured evidence
-                        entry_trigger_source = entry.raw.get("trigger_source") or None
-                        aggregated[fingerprint] = _FindingAccumulator(
-                            fingerprint=fingerprint,
-                            source_butler=entry.butler_name,
-                            severity=severity,
-                            exception_type=exception_type,
-                            event_summary=anon_summary,
-                            call_site=call_site,
-                            source_file=log_file.name,
-                            first_seen=entry.timestamp,
-                            last_seen=entry.timestamp,
-                            log_level=entry.level,
-                            trigger_source=entry_trigger_source,
-                        )
-                    else:
-                        acc = aggregated[fingerprint]
-                        acc.occurrence_count += 1
-                        if entry.timestamp < acc.first_seen:
-                            acc.first_seen = entry.timestamp
-                        if entry.timestamp > acc.last_seen:
-                            acc.last_seen = entry.timestamp
-                            # Always take trigger_source from the most recent log entry,
-                            # even when it is None, so recency semantics remain consistent.
-                            acc.trigger_source = entry.trigger_source
-
-                hit_cap = (
-                    truncated_entries
-                    or truncated_findings
-                    or truncated_total_lines
-                    or truncated_time
-                )
-                if hit_cap:
+            for candidate in state.candidates:
+                if candidate.timestamp < cutoff:
+                    continue
+                # Candidate-entries cap — counts only temporally-valid entries.
+                if entries_processed >= self._max_entries:
+                    truncated_entries = True
                     break
-            if truncated_entries or truncated_findings or truncated_total_lines or truncated_time:
+                if len(aggregated) >= self._max_findings:
+                    truncated_findings = True
+                    break
+
+                entries_processed += 1
+                acc = aggregated.get(candidate.fingerprint)
+                if acc is None:
+                    aggregated[candidate.fingerprint] = _FindingAccumulator(
+                        fingerprint=candidate.fingerprint,
+                        source_butler=candidate.butler_name,
+                        severity=candidate.severity,
+                        exception_type=candidate.exception_type,
+                        event_summary=candidate.event_summary,
+                        call_site=candidate.call_site,
+                        source_file=log_file.name,
+                        first_seen=candidate.timestamp,
+                        last_seen=candidate.timestamp,
+                        log_level=candidate.level,
+                        trigger_source=candidate.trigger_source,
+                    )
+                else:
+                    acc.occurrence_count += 1
+                    if candidate.timestamp < acc.first_seen:
+                        acc.first_seen = candidate.timestamp
+                    if candidate.timestamp > acc.last_seen:
+                        acc.last_seen = candidate.timestamp
+                        # Always take trigger_source from the most recent log entry,
+                        # even when it is None, so recency semantics remain consistent.
+                        acc.trigger_source = candidate.trigger_source
+
+            if truncated_entries or truncated_findings:
                 break
 
         if malformed_count > 0:
             logger.debug("LogScannerSource: skipped %d malformed JSON lines", malformed_count)
-        if truncated_time:
+        if read_truncation == "max_scan_seconds":
             logger.warning(
                 "LogScannerSource: scan wall-clock limit reached after %.1fs"
-                " (max_scan_seconds=%.1f); %d lines parsed, %d candidate entries,"
-                " returning partial results",
+                " (max_scan_seconds=%.1f); %d lines parsed, remaining lines"
+                " deferred to the next scan",
                 time.monotonic() - scan_start,
                 self._max_scan_seconds,
                 total_lines_parsed,
-                entries_processed,
             )
             self.last_truncated = now
             self.last_truncated_reason = "max_scan_seconds"
-        elif truncated_total_lines:
+        elif read_truncation == "max_total_lines":
             logger.warning(
                 "LogScannerSource: total-lines cap reached (%d lines;"
-                " max_total_lines=%d); returning partial results",
+                " max_total_lines=%d); remaining lines deferred to the next scan",
                 total_lines_parsed,
                 self._max_total_lines,
             )
@@ -726,6 +729,116 @@ class LogScannerSource:
         findings = [acc.to_finding(now) for acc in aggregated.values()]
         return findings
 
+    def _read_new_lines(
+        self,
+        log_file: Path,
+        cutoff: datetime,
+        scan_start: float,
+        *,
+        lines_budget: int,
+    ) -> tuple[int, int, str | None]:
+        """Read complete lines appended to *log_file* since its checkpoint.
+
+        Qualifying entries are appended to the file's retained candidates and
+        the checkpoint advances line by line, so a cap stops the read without
+        losing anything.  A trailing partial line is left for the next call.
+
+        Returns ``(lines_read, malformed_count, truncation_reason)`` where the
+        reason is ``"max_scan_seconds"``, ``"max_total_lines"`` or ``None``.
+        """
+        try:
+            stat = log_file.stat()
+        except OSError:
+            self._tails.pop(log_file, None)
+            return 0, 0, None
+        file_id = (stat.st_dev, stat.st_ino)
+
+        lines_read = 0
+        malformed = 0
+        butler_name = _butler_name_from_filename(log_file)
+        try:
+            with log_file.open("rb") as fh:
+                state = self._tails.get(log_file)
+                if state is None:
+                    state = _TailState(
+                        file_id=file_id,
+                        offset=_window_start_offset(fh, stat.st_size, cutoff),
+                        # One past the candidate budget: enough to report
+                        # max_entries_per_scan truncation, bounded memory.
+                        candidates=deque(maxlen=self._max_entries + 1),
+                    )
+                    self._tails[log_file] = state
+                elif state.file_id != file_id or stat.st_size < state.offset:
+                    # Rotated to a new file or truncated in place: everything
+                    # in it is new.  Retained candidates stay — they are still
+                    # this butler's entries inside the window.
+                    state.file_id = file_id
+                    state.offset = 0
+
+                fh.seek(state.offset)
+                pending = b""
+                while chunk := fh.read(_TAIL_CHUNK_SIZE):
+                    *raw_lines, pending = (pending + chunk).split(b"\n")
+                    for raw_line in raw_lines:
+                        if not raw_line.strip():
+                            state.offset += len(raw_line) + 1
+                            continue
+                        # Wall-clock cap — checked on every line to bound latency.
+                        if time.monotonic() - scan_start >= self._max_scan_seconds:
+                            return lines_read, malformed, "max_scan_seconds"
+                        # Total-lines cap — counts every line read regardless of level.
+                        if lines_read >= lines_budget:
+                            return lines_read, malformed, "max_total_lines"
+
+                        lines_read += 1
+                        state.offset += len(raw_line) + 1
+                        if not _LEVEL_PREFILTER_RE.search(raw_line):
+                            continue
+
+                        entry = _parse_log_line(
+                            raw_line.decode("utf-8", errors="replace"), butler_name
+                        )
+                        if entry is None:
+                            malformed += 1
+                            continue
+                        if entry.timestamp < cutoff:
+                            continue
+                        if not _should_include_entry(
+                            entry,
+                            suppress_session_duplicate_timeouts=(
+                                self._suppress_session_duplicate_timeouts
+                            ),
+                        ):
+                            continue
+                        state.candidates.append(self._to_candidate(entry))
+        except OSError as exc:
+            logger.debug("LogScannerSource: could not read %s: %s", log_file, exc)
+        return lines_read, malformed, None
+
+    def _to_candidate(self, entry: LogEntry) -> _Candidate:
+        exception_type = entry.exception or "unknown"
+        call_site = _extract_call_site(entry)
+
+        # Fingerprint on the full sanitized event (up to fingerprint.py's 500-char
+        # internal cap) so this source stays compatible with canonical paths.
+        # Store a shorter anonymized summary for display/storage only.
+        sanitized_event_for_fp = _sanitize_message(entry.event)
+        raw_summary = entry.event[:_MAX_SUMMARY_LEN]
+        sanitized_summary = _sanitize_message(raw_summary)
+
+        return _Candidate(
+            fingerprint=_compute_hash(exception_type, call_site, sanitized_event_for_fp),
+            timestamp=entry.timestamp,
+            butler_name=entry.butler_name,
+            level=entry.level,
+            severity=_level_to_severity(entry.level, exception_type, call_site),
+            exception_type=exception_type,
+            call_site=call_site,
+            event_summary=anonymize(sanitized_summary, self._repo_root),
+            # trigger_source from the raw log JSON for structured evidence
+            trigger_source=entry.raw.get("trigger_source") or None,
+        )
+
 
 # ---------------------------------------------------------------------------
 # Internal accumulator
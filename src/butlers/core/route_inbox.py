@@ -16,6 +16,18 @@ the row before it invokes a runtime, renews that lease while work is live, and
 may settle the row only while it still owns the same claim.  That prevents a
 second daemon from replaying a healthy dashboard route just because a startup
 scanner observed it.
+
+Backlogs drain in batches: :func:`route_inbox_claim_batch` leases up to *n*
+eligible rows in one ``FOR UPDATE SKIP LOCKED`` statement (concurrent workers
+never block on, or double-claim, each other's rows), and
+:func:`route_inbox_mark_processed_batch` / :func:`route_inbox_mark_errored_batch`
+settle a batch's outcomes with one fenced statement each.
+:func:`route_inbox_drain` runs workers that size each claim from the backlog
+depth the previous claim observed.  Only short handlers belong there, since
+a leased row is not heartbeated while it waits its turn; startup recovery
+drains reclaimed dashboard turns this way.  Runtime replays stay on
+:func:`route_inbox_recovery_sweep`, which claims each row just before it
+dispatches it.
 """
 
 from __future__ import annotations
@@ -23,14 +35,18 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
 import uuid
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 import asyncpg
 
+from butlers.db_statements import register_statement
+
 logger = logging.getLogger(__name__)
 
 # Lifecycle states
@@ -43,12 +59,162 @@ STATE_ERRORED = "errored"
 _DEFAULT_RECOVERY_GRACE_S = 10
 # Default scanner batch size
 _DEFAULT_RECOVERY_BATCH = 50
+# Default upper bound on rows leased by one batched claim
+_DEFAULT_MAX_CLAIM_BATCH = 100
 # Keep a claim fresh well inside the default recovery grace interval.  The
 # lease is a crash detector, not a runtime deadline: a healthy long-running
 # session keeps renewing it until it settles.
 _DEFAULT_PROCESSING_HEARTBEAT_S = 3
 
 
+# Hot-path claim and settle statements, pre-prepared on new pool connections.
+_CLAIM_PROCESSING_SQL = register_statement(
+    "route_inbox.claim_processing",
+    """
+    UPDATE route_inbox
+    SET lifecycle_state = $1,
+        processing_claim_id = $2,
+        processing_claimed_at = now()
+    WHERE id = $3
+      AND (
+          lifecycle_state = $4
+          OR (
+              $5::boolean
+              AND lifecycle_state = $1
+              AND (
+                  processing_claimed_at IS NULL
+                  OR processing_claimed_at < now() - ($6 * interval '1 second')
+              )
+          )
+      )
+    RETURNING processing_claim_id
+    """,
+    relations=("route_inbox",),
+)
+_MARK_PROCESSED_SQL = register_statement(
+    "route_inbox.mark_processed",
+    """
+    UPDATE route_inbox
+    SET lifecycle_state = $1,
+        processed_at = now(),
+        session_id = $2,
+        processing_claim_id = NULL,
+        processing_claimed_at = NULL
+    WHERE id = $3
+      AND lifecycle_state = $5
+      AND ($4::uuid IS NULL OR processing_claim_id = $4)
+    RETURNING id
+    """,
+    relations=("route_inbox",),
+)
+_MARK_ERRORED_SQL = register_statement(
+    "route_inbox.mark_errored",
+    """
+    UPDATE route_inbox
+    SET lifecycle_state = $1,
+        processed_at = now(),
+        error = $2,
+        processing_claim_id = NULL,
+        processing_claimed_at = NULL
+    WHERE id = $3
+      AND lifecycle_state = $5
+      AND ($4::uuid IS NULL OR processing_claim_id = $4)
+    RETURNING id
+    """,
+    relations=("route_inbox",),
+)
+
+# Rows a batch worker may lease: accepted rows at least $3 seconds old (unless
+# $7 excludes them), and processing rows whose lease has not been renewed for
+# $4 seconds; $8 optionally narrows both to envelopes matching a jsonpath.
+_CLAIMABLE_PREDICATE = """
+          (
+              (
+                  $7
+                  AND lifecycle_state = $2
+                  AND received_at <= now() - ($3 * interval '1 second')
+              )
+              OR (
+                  lifecycle_state = $1
+                  AND (
+                      processing_claimed_at IS NULL
+                      OR processing_claimed_at < now() - ($4 * interval '1 second')
+                  )
+              )
+          )
+          AND ($8::jsonpath IS NULL OR route_envelope @@ $8::jsonpath)"""
+_CLAIM_BATCH_SQL = register_statement(
+    "route_inbox.claim_batch",
+    f"""
+    WITH candidates AS (
+        SELECT id, lifecycle_state AS previous_state
+        FROM route_inbox
+        WHERE {_CLAIMABLE_PREDICATE}
+        ORDER BY coalesce(processing_claimed_at, received_at)
+        LIMIT $5
+        FOR UPDATE SKIP LOCKED
+    ),
+    depth AS (
+        SELECT count(*) AS backlog
+        FROM (
+            SELECT 1
+            FROM route_inbox
+            WHERE {_CLAIMABLE_PREDICATE}
+            LIMIT $6
+        ) AS claimable
+    )
+    UPDATE route_inbox AS r
+    SET lifecycle_state = $1,
+        processing_claim_id = gen_random_uuid(),
+        processing_claimed_at = now()
+    FROM candidates AS c
+    CROSS JOIN depth AS d
+    WHERE r.id = c.id
+    RETURNING r.id, r.received_at, r.route_envelope, r.processing_claim_id,
+              c.previous_state, d.backlog
+    """,
+    relations=("route_inbox",),
+)
+_MARK_PROCESSED_BATCH_SQL = register_statement(
+    "route_inbox.mark_processed_batch",
+    """
+    UPDATE route_inbox AS r
+    SET lifecycle_state = $1,
+        processed_at = now(),
+        session_id = s.session_id,
+        processing_claim_id = NULL,
+        processing_claimed_at = NULL
+    FROM unnest($2::uuid[], $3::uuid[], $4::uuid[]) AS s(id, claim_id, session_id)
+    WHERE r.id = s.id
+      AND r.lifecycle_state = $5
+      AND r.processing_claim_id = s.claim_id
+    RETURNING r.id
+    """,
+    relations=("route_inbox",),
+)
+_MARK_ERRORED_BATCH_SQL = register_statement(
+    "route_inbox.mark_errored_batch",
+    """
+    UPDATE route_inbox AS r
+    SET lifecycle_state = $1,
+        processed_at = now(),
+        error = s.error,
+        processing_claim_id = NULL,
+        processing_claimed_at = NULL
+    FROM unnest($2::uuid[], $3::uuid[], $4::text[]) AS s(id, claim_id, error)
+    WHERE r.id = s.id
+      AND r.lifecycle_state = $5
+      AND r.processing_claim_id = s.claim_id
+    RETURNING r.id
+    """,
+    relations=("route_inbox",),
+)
+
+
+class RouteInboxRowRejected(Exception):
+    """Raised by a :func:`route_inbox_drain` handler to error its row with this message."""
+
+
 class RouteInboxLeaseLost(RuntimeError):
     """Raised after a live invocation is cancelled because its queue lease was lost."""
 
@@ -120,25 +286,7 @@ async def route_inbox_claim_processing(
     claim_id = uuid.uuid4()
     async with pool.acquire() as conn:
         claimed = await conn.fetchval(
-            """
-            UPDATE route_inbox
-            SET lifecycle_state = $1,
-                processing_claim_id = $2,
-                processing_claimed_at = now()
-            WHERE id = $3
-              AND (
-                  lifecycle_state = $4
-                  OR (
-                      $5::boolean
-                      AND lifecycle_state = $1
-                      AND (
-                          processing_claimed_at IS NULL
-                          OR processing_claimed_at < now() - ($6 * interval '1 second')
-                      )
-                  )
-              )
-            RETURNING processing_claim_id
-            """,
+            _CLAIM_PROCESSING_SQL,
             STATE_PROCESSING,
             claim_id,
             row_id,
@@ -159,6 +307,120 @@ async def route_inbox_mark_processing(
     return await route_inbox_claim_processing(pool, row_id) is not None
 
 
+@dataclass(frozen=True)
+class RouteInboxClaim:
+    """One row leased by :func:`route_inbox_claim_batch`."""
+
+    id: uuid.UUID
+    received_at: datetime
+    route_envelope: dict[str, Any]
+    processing_claim_id: uuid.UUID
+    recovery_from_processing: bool
+
+
+@dataclass(frozen=True)
+class RouteInboxClaimBatch:
+    """Rows leased by one batched claim.
+
+    ``backlog`` is the number of claimable rows the claim observed, including
+    the ones it leased, capped at the claim's ``depth_cap``.
+    """
+
+    claims: list[RouteInboxClaim]
+    backlog: int
+
+
+@dataclass
+class RouteInboxDrainStats:
+    """Outcome counts of :func:`route_inbox_drain`."""
+
+    processed: int = 0
+    errored: int = 0
+    lost: int = 0
+    batches: int = 0
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def route_inbox_claim_batch_size(
+    backlog: int,
+    workers: int,
+    *,
+    max_batch: int = _DEFAULT_MAX_CLAIM_BATCH,
+) -> int:
+    """Size the next claim so *workers* split a *backlog* evenly.
+
+    Small backlogs claim one row at a time, so a second worker is not left
+    idle behind a batch it could have shared; deep ones claim up to
+    *max_batch* rows per round trip.
+    """
+    return max(1, min(max_batch, math.ceil(backlog / max(1, workers))))
+
+
+async def route_inbox_claim_batch(
+    pool: asyncpg.Pool,
+    n: int,
+    *,
+    min_age_s: int = _DEFAULT_RECOVERY_GRACE_S,
+    stale_after_s: int = _DEFAULT_RECOVERY_GRACE_S,
+    depth_cap: int | None = None,
+    include_accepted: bool = True,
+    envelope_match: str | None = None,
+) -> RouteInboxClaimBatch:
+    """Lease up to *n* claimable rows with one ``UPDATE ... RETURNING``.
+
+    Candidates are locked ``FOR UPDATE SKIP LOCKED``, so concurrent workers
+    partition the backlog instead of queueing on each other's rows.  Each
+    leased row gets its own processing claim id, which fences its heartbeat
+    and terminal write exactly like :func:`route_inbox_claim_processing`.
+
+    Parameters
+    ----------
+    n:
+        Maximum rows to lease.
+    min_age_s:
+        Accepted rows younger than this are left to their hot-path task.
+    stale_after_s:
+        Processing rows whose lease is older than this may be taken over.
+    depth_cap:
+        Upper bound on the reported ``backlog`` (default ``10 * n``); it
+        bounds the extra index scan the depth estimate costs.
+    include_accepted:
+        ``False`` leases only stale ``processing`` rows.
+    envelope_match:
+        Optional jsonpath predicate the ``route_envelope`` must satisfy.
+    """
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            _CLAIM_BATCH_SQL,
+            STATE_PROCESSING,
+            STATE_ACCEPTED,
+            min_age_s,
+            stale_after_s,
+            n,
+            depth_cap if depth_cap is not None else 10 * n,
+            include_accepted,
+            envelope_match,
+        )
+    claims = [
+        RouteInboxClaim(
+            id=_as_uuid(row["id"]),
+            received_at=row["received_at"],
+            route_envelope=json.loads(row["route_envelope"])
+            if isinstance(row["route_envelope"], str)
+            else dict(row["route_envelope"]),
+            processing_claim_id=_as_uuid(row["processing_claim_id"]),
+            recovery_from_processing=row["previous_state"] == STATE_PROCESSING,
+        )
+        for row in rows
+    ]
+    backlog = int(rows[0]["backlog"]) if rows else 0
+    logger.debug("route_inbox: claimed %d row(s) of backlog %d", len(claims), backlog)
+    return RouteInboxClaimBatch(claims=claims, backlog=backlog)
+
+
 async def route_inbox_renew_processing_claim(
     pool: asyncpg.Pool,
     row_id: uuid.UUID,
@@ -362,18 +624,7 @@ async def route_inbox_mark_processed(
     """
     async with pool.acquire() as conn:
         settled = await conn.fetchval(
-            """
-        UPDATE route_inbox
-        SET lifecycle_state = $1,
-            processed_at = now(),
-            session_id = $2,
-            processing_claim_id = NULL,
-            processing_claimed_at = NULL
-        WHERE id = $3
-          AND lifecycle_state = $5
-          AND ($4::uuid IS NULL OR processing_claim_id = $4)
-        RETURNING id
-        """,
+            _MARK_PROCESSED_SQL,
             STATE_PROCESSED,
             session_id,
             row_id,
@@ -399,18 +650,7 @@ async def route_inbox_mark_errored(
     """
     async with pool.acquire() as conn:
         settled = await conn.fetchval(
-            """
-        UPDATE route_inbox
-        SET lifecycle_state = $1,
-            processed_at = now(),
-            error = $2,
-            processing_claim_id = NULL,
-            processing_claimed_at = NULL
-        WHERE id = $3
-          AND lifecycle_state = $5
-          AND ($4::uuid IS NULL OR processing_claim_id = $4)
-        RETURNING id
-        """,
+            _MARK_ERRORED_SQL,
             STATE_ERRORED,
             error,
             row_id,
@@ -422,6 +662,139 @@ async def route_inbox_mark_errored(
     return settled is not None
 
 
+async def route_inbox_mark_processed_batch(
+    pool: asyncpg.Pool,
+    settlements: Iterable[tuple[uuid.UUID, uuid.UUID, uuid.UUID | None]],
+) -> set[uuid.UUID]:
+    """Mark many leased rows processed with one statement.
+
+    *settlements* holds ``(row_id, processing_claim_id, session_id)``
+    triples.  Only rows still owned by the given claim are settled; the
+    returned set holds their ids, so a missing id means its lease was lost.
+    """
+    batch = list(settlements)
+    if not batch:
+        return set()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            _MARK_PROCESSED_BATCH_SQL,
+            STATE_PROCESSED,
+            [row_id for row_id, _, _ in batch],
+            [claim_id for _, claim_id, _ in batch],
+            [session_id for _, _, session_id in batch],
+            STATE_PROCESSING,
+        )
+    logger.debug("route_inbox: processed %d/%d row(s)", len(rows), len(batch))
+    return {_as_uuid(row["id"]) for row in rows}
+
+
+async def route_inbox_mark_errored_batch(
+    pool: asyncpg.Pool,
+    failures: Iterable[tuple[uuid.UUID, uuid.UUID, str]],
+) -> set[uuid.UUID]:
+    """Mark many leased rows errored with one statement.
+
+    *failures* holds ``(row_id, processing_claim_id, error)`` triples; the
+    claim fences each row as in :func:`route_inbox_mark_processed_batch`.
+    """
+    batch = list(failures)
+    if not batch:
+        return set()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            _MARK_ERRORED_BATCH_SQL,
+            STATE_ERRORED,
+            [row_id for row_id, _, _ in batch],
+            [claim_id for _, claim_id, _ in batch],
+            [error for _, _, error in batch],
+            STATE_PROCESSING,
+        )
+    for row_id, _, error in batch:
+        logger.warning("route_inbox: errored id=%s error=%s", row_id, error[:200])
+    return {_as_uuid(row["id"]) for row in rows}
+
+
+async def route_inbox_drain(
+    pool: asyncpg.Pool,
+    process_fn: Callable[[RouteInboxClaim], Awaitable[uuid.UUID | None]],
+    *,
+    workers: int = 1,
+    max_batch: int = _DEFAULT_MAX_CLAIM_BATCH,
+    min_age_s: int = _DEFAULT_RECOVERY_GRACE_S,
+    stale_after_s: int = _DEFAULT_RECOVERY_GRACE_S,
+    include_accepted: bool = True,
+    envelope_match: str | None = None,
+) -> RouteInboxDrainStats:
+    """Drain the claimable backlog with *workers* concurrent batch workers.
+
+    Each worker claims a batch, awaits ``process_fn(claim)`` for its rows in
+    order (the returned session id, or ``None``, marks a row processed; an
+    exception marks it errored, with the bare message for
+    :class:`RouteInboxRowRejected`) and settles the batch with at most two
+    statements.  The next claim is sized by
+    :func:`route_inbox_claim_batch_size` from the backlog the previous claim
+    observed.  Workers stop once a claim comes back empty.
+    *include_accepted* and *envelope_match* narrow the claimed rows as in
+    :func:`route_inbox_claim_batch`.
+
+    Rows in one batch are not heartbeated while they wait their turn, so
+    *process_fn* must finish well inside *stale_after_s* per batch; long
+    runtimes belong on the per-row lease path
+    (:func:`route_inbox_processing_lease_heartbeat`).
+    """
+    stats = RouteInboxDrainStats()
+
+    async def _worker() -> None:
+        size = route_inbox_claim_batch_size(max_batch, workers, max_batch=max_batch)
+        while True:
+            batch = await route_inbox_claim_batch(
+                pool,
+                size,
+                min_age_s=min_age_s,
+                stale_after_s=stale_after_s,
+                depth_cap=max_batch * workers,
+                include_accepted=include_accepted,
+                envelope_match=envelope_match,
+            )
+            if not batch.claims:
+                return
+            stats.batches += 1
+            processed: list[tuple[uuid.UUID, uuid.UUID, uuid.UUID | None]] = []
+            errored: list[tuple[uuid.UUID, uuid.UUID, str]] = []
+            for claim in batch.claims:
+                try:
+                    session_id = await process_fn(claim)
+                except asyncio.CancelledError:
+                    raise
+                except RouteInboxRowRejected as exc:
+                    errored.append((claim.id, claim.processing_claim_id, str(exc)))
+                except Exception as exc:
+                    errored.append(
+                        (claim.id, claim.processing_claim_id, f"{type(exc).__name__}: {exc}")
+                    )
+                else:
+                    processed.append((claim.id, claim.processing_claim_id, session_id))
+            settled_ok = await route_inbox_mark_processed_batch(pool, processed)
+            settled_err = await route_inbox_mark_errored_batch(pool, errored)
+            stats.processed += len(settled_ok)
+            stats.errored += len(settled_err)
+            stats.lost += len(batch.claims) - len(settled_ok) - len(settled_err)
+            size = route_inbox_claim_batch_size(
+                batch.backlog - len(batch.claims), workers, max_batch=max_batch
+            )
+
+    await asyncio.gather(*(_worker() for _ in range(max(1, workers))))
+    if stats.batches:
+        logger.info(
+            "route_inbox drain: processed=%d errored=%d lost=%d in %d batch(es)",
+            stats.processed,
+            stats.errored,
+            stats.lost,
+            stats.batches,
+        )
+    return stats
+
+
 async def route_inbox_scan_unprocessed(
     pool: asyncpg.Pool,
     *,
@@ -506,6 +879,9 @@ async def route_inbox_recovery_sweep(
     Called on startup (and optionally periodically) to process rows that were
     accepted but never processed due to a crash or restart.
 
+    Each row is claimed just before it is dispatched, so rows queued behind a
+    long-running session never sit on a lease nobody renews.
+
     Parameters
     ----------
     pool:
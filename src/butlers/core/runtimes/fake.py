@@ -0,0 +1,199 @@
+"""FakeAdapter — deterministic scripted RuntimeAdapter for load and latency testing.
+
+No subprocess, no network, no model: ``invoke()`` sleeps for a latency drawn
+from a seeded :class:`LatencyDistribution` and returns a scripted
+:class:`FakeTurn` (result text plus tool calls).  Scripted tool calls are
+reported in the runtime's ``tool_calls`` list exactly as a CLI adapter would
+report them; when a ``tool_executor`` is supplied each call is also executed
+(in-process) and its return value attached as the call's ``result`` — this is
+how :mod:`butlers.testing.load_harness` turns a scripted ``route_to_butler``
+into a real downstream dispatch.
+
+Registered as runtime type ``"fake"`` only when this module is imported: it is
+deliberately not imported by :mod:`butlers.core.runtimes`, so production
+registries never offer it.  A bare instance (as built by
+:func:`~butlers.core.runtimes.base.create_adapter`) answers every prompt with
+``"ok"`` after the latency given by ``BUTLERS_FAKE_RUNTIME_LATENCY`` (a
+:meth:`LatencyDistribution.parse` spec; default ``constant:0``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from butlers.core.runtimes.base import RuntimeAdapter, register_adapter
+
+_ENV_LATENCY = "BUTLERS_FAKE_RUNTIME_LATENCY"
+
+# Rough chars-per-token ratio used to report plausible usage numbers.
+_CHARS_PER_TOKEN = 4
+
+ToolExecutor = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Invocation latency model, in seconds.
+
+    - ``constant``: always ``a``;
+    - ``uniform``: uniform on ``[a, b]``;
+    - ``lognormal``: median ``a``, shape ``b`` (sigma of the underlying normal)
+      — the long right tail real model calls show.
+    """
+
+    kind: str = "constant"
+    a: float = 0.0
+    b: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.kind not in ("constant", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {self.kind!r}")
+        if self.a < 0 or self.b < 0:
+            raise ValueError("Latency parameters must be non-negative")
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyDistribution:
+        """Parse ``"constant:0.05"``, ``"uniform:0.02,0.2"`` or ``"lognormal:0.8,0.5"``."""
+        kind, _, params = spec.strip().partition(":")
+        values = [float(v) for v in params.split(",") if v.strip()] if params else []
+        if len(values) > 2:
+            raise ValueError(f"Too many latency parameters in {spec!r}")
+        return cls(kind, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return 0.0 if self.a == 0 else rng.lognormvariate(math.log(self.a), self.b)
+        return self.a
+
+
+@dataclass(frozen=True)
+class FakeTurn:
+    """One scripted runtime answer.
+
+    ``tool_calls`` entries are ``{"name": ..., "input": {...}}`` dicts.
+    """
+
+    text: str | None = "ok"
+    tool_calls: tuple[dict[str, Any], ...] = field(default_factory=tuple)
+
+
+#: A fixed turn, or a function of ``(prompt, system_prompt)`` returning one.
+FakeScript = FakeTurn | Callable[[str, str], FakeTurn]
+
+
+class FakeAdapter(RuntimeAdapter):
+    """Scripted, latency-modelled runtime with no external dependencies.
+
+    Parameters
+    ----------
+    script:
+        Turn to return, or a callable choosing one per prompt.
+    latency:
+        Latency model; defaults to ``BUTLERS_FAKE_RUNTIME_LATENCY``.
+    seed:
+        Seed for latency sampling, so runs are reproducible.
+    tool_executor:
+        Optional coroutine ``(name, input) -> result`` that executes each
+        scripted tool call; its return value becomes the call's ``result``.
+    butler_name:
+        Identity label; unused except for ``create_adapter`` compatibility.
+    """
+
+    def __init__(
+        self,
+        *,
+        script: FakeScript | None = None,
+        latency: LatencyDistribution | None = None,
+        seed: int = 0,
+        tool_executor: ToolExecutor | None = None,
+        butler_name: str | None = None,
+    ) -> None:
+        self._script: FakeScript = script if script is not None else FakeTurn()
+        if latency is None:
+            latency = LatencyDistribution.parse(os.environ.get(_ENV_LATENCY) or "constant:0")
+        self._latency = latency
+        self._rng = random.Random(seed)
+        self._tool_executor = tool_executor
+        self._butler_name = butler_name
+        self._call_ids = itertools.count(1)
+        self._last_process_info: dict[str, Any] | None = None
+        self.invocations = 0
+
+    @property
+    def binary_name(self) -> str:
+        return "fake"
+
+    @property
+    def last_process_info(self) -> dict[str, Any] | None:
+        return self._last_process_info
+
+    async def invoke(
+        self,
+        prompt: str,
+        system_prompt: str,
+        mcp_servers: dict[str, Any],
+        env: dict[str, str],
+        max_turns: int = 20,
+        model: str | None = None,
+        runtime_args: list[str] | None = None,
+        cwd: Path | None = None,
+        timeout: int | None = None,
+    ) -> tuple[str | None, list[dict[str, Any]], dict[str, Any] | None]:
+        self.invocations += 1
+        turn = self._script(prompt, system_prompt) if callable(self._script) else self._script
+        delay = self._latency.sample(self._rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        tool_calls: list[dict[str, Any]] = []
+        for scripted in turn.tool_calls:
+            call = {
+                "id": f"fake-{next(self._call_ids)}",
+                "name": scripted["name"],
+                "input": dict(scripted.get("input") or {}),
+            }
+            if self._tool_executor is not None:
+                call["result"] = await self._tool_executor(call["name"], call["input"])
+            tool_calls.append(call)
+
+        self._last_process_info = {
+            "pid": None,
+            "exit_code": 0,
+            "command": "fake",
+            "stderr": "",
+            "runtime_type": "fake",
+        }
+        usage = {
+            "input_tokens": (len(prompt) + len(system_prompt)) // _CHARS_PER_TOKEN,
+            "output_tokens": len(turn.text or "") // _CHARS_PER_TOKEN,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+        }
+        return turn.text, tool_calls, usage
+
+    def build_config_file(self, mcp_servers: dict[str, Any], tmp_dir: Path) -> Path:
+        """Write the MCP config the way the Claude adapter does (never read back)."""
+        path = tmp_dir / "fake-mcp.json"
+        path.write_text(json.dumps({"mcpServers": mcp_servers}))
+        return path
+
+    def parse_system_prompt_file(self, config_dir: Path) -> str:
+        """Reuse the CLAUDE.md convention; empty string when absent."""
+        claude_md = config_dir / "CLAUDE.md"
+        if claude_md.exists():
+            return claude_md.read_text()
+        return ""
+
+
+register_adapter("fake", FakeAdapter)
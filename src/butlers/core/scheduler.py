@@ -8,6 +8,7 @@ croniter and dispatches due task prompts to the LLM CLI spawner serially.
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import logging
 import re
@@ -23,6 +24,17 @@ from opentelemetry import trace
 
 from butlers.core.metrics import ButlerMetrics
 from butlers.core.model_routing import Complexity, coerce_complexity_tier
+from butlers.core.scheduler_wheel import (
+    KIND_CRON,
+    KIND_DEADLINE,
+    KIND_DEFERRED,
+    DueWork,
+    SchedulerWheel,
+    invalidate_scheduler_wheel,
+    next_utc_midnight,
+)
+from butlers.db_profiler import profile_operation
+from butlers.db_statements import register_statement
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +48,75 @@ _ALLOWED_DISPATCH_MODES = {_DISPATCH_MODE_PROMPT, _DISPATCH_MODE_JOB}
 _ALLOWED_COMPLEXITY_VALUES = {c.value for c in Complexity}
 _DEFAULT_COMPLEXITY = Complexity.WORKHORSE.value
 
+_DEADLINE_DUE_SQL = register_statement(
+    "scheduler.deadline_due",
+    """
+    SELECT id, name, prompt, dispatch_mode, task_type,
+           target_date, lead_time_days, alert_thresholds,
+           deadline_status, fired_thresholds, depends_on, complexity
+    FROM scheduled_tasks
+    WHERE enabled = true AND task_type = 'deadline'
+    ORDER BY target_date
+    """,
+    relations=("scheduled_tasks",),
+)
+_DEADLINE_DUE_BY_ID_SQL = register_statement(
+    "scheduler.deadline_due_by_id",
+    """
+    SELECT id, name, prompt, dispatch_mode, task_type,
+           target_date, lead_time_days, alert_thresholds,
+           deadline_status, fired_thresholds, depends_on, complexity
+    FROM scheduled_tasks
+    WHERE enabled = true AND task_type = 'deadline'
+      AND id = ANY($1::uuid[])
+    ORDER BY target_date
+    """,
+    relations=("scheduled_tasks",),
+)
+
+
+def _build_cron_due_statements() -> dict[tuple[bool, bool, bool, bool], str]:
+    """Register every schema/wheel variant of the cron due-row select.
+
+    Keyed by ``(has_task_type, has_max_token_budget, has_until_at,
+    wheel_driven)``.  Each variant declares the columns it selects on, so a
+    connection only pre-prepares the two (polling and wheel-driven) its
+    schema uses.
+    """
+    statements: dict[tuple[bool, bool, bool, bool], str] = {}
+    for variant in itertools.product((False, True), repeat=4):
+        has_task_type, has_budget, has_until_at, wheel_driven = variant
+        # Legacy schemas without task_type treat every row as cron; otherwise
+        # deadline tasks are handled by the deadline pass.
+        cron_filter = "AND COALESCE(task_type, 'cron') = 'cron'" if has_task_type else ""
+        budget_select = ", max_token_budget" if has_budget else ""
+        until_at_select = ", until_at" if has_until_at else ", NULL::timestamptz AS until_at"
+        # A wheel-driven tick reads only the rows the wheel says are due.
+        due_filter = "AND id = ANY($2::uuid[])" if wheel_driven else ""
+        statements[variant] = register_statement(
+            "scheduler.cron_due." + "".join("1" if v else "0" for v in variant),
+            f"""
+            SELECT id, name, cron, dispatch_mode, prompt, job_name, job_args,
+                   complexity, timezone, next_run_at{until_at_select}{budget_select}
+            FROM scheduled_tasks
+            WHERE enabled = true
+              {cron_filter}
+              AND next_run_at <= $1
+              {due_filter}
+            ORDER BY next_run_at
+            """,
+            relations=("scheduled_tasks",),
+            columns={
+                "scheduled_tasks.task_type": has_task_type,
+                "scheduled_tasks.max_token_budget": has_budget,
+                "scheduled_tasks.until_at": has_until_at,
+            },
+        )
+    return statements
+
+
+_CRON_DUE_SQL = _build_cron_due_statements()
+
 # Pattern to find candidate skill names in prompt text (kebab-case words).
 _SKILL_NAME_PATTERN = re.compile(r"\b([a-z][a-z0-9]*(?:-[a-z0-9]+)+)\b")
 
@@ -1057,6 +1138,8 @@ async def _tick_deadline_pass(
     max_stagger_seconds: int = _DEFAULT_MAX_STAGGER_SECONDS,
     metrics: ButlerMetrics | None = None,
     active_seasons: list[dict[str, Any]] | None = None,
+    task_ids: list[uuid.UUID] | None = None,
+    wheel: SchedulerWheel | None = None,
 ) -> tuple[int, int]:
     """Evaluate deadline tasks: fire due thresholds and handle expiry.
 
@@ -1068,6 +1151,12 @@ async def _tick_deadline_pass(
     Args:
         has_task_type_col: Optional pre-computed result from _has_column() check.
             Pass this from tick() to avoid redundant schema round-trips.
+        task_ids: When given (by a wheel-driven tick), only these deadline
+            tasks are evaluated and the deadline-column probe is skipped (the
+            wheel only indexes deadlines once those columns exist).
+        wheel: Scheduler wheel to re-arm: evaluated deadlines come due again at
+            the next UTC midnight, failed dispatches on the next tick, and any
+            status change requests an event-chain pass.
 
     Returns:
         (deadlines_evaluated, deadlines_dispatched) counts.
@@ -1093,23 +1182,21 @@ async def _tick_deadline_pass(
         "fired_thresholds",
         "depends_on",
     }
-    if has_task_type_col is None:
-        has_task_type_col = await _has_column(pool, "scheduled_tasks", "task_type")
-    if not has_task_type_col or not await _has_columns(
-        pool, "scheduled_tasks", required_deadline_columns
-    ):
-        return 0, 0
-
-    deadline_rows = await pool.fetch(
-        """
-        SELECT id, name, prompt, dispatch_mode, task_type,
-               target_date, lead_time_days, alert_thresholds,
-               deadline_status, fired_thresholds, depends_on, complexity
-        FROM scheduled_tasks
-        WHERE enabled = true AND task_type = 'deadline'
-        ORDER BY target_date
-        """,
-    )
+    if task_ids is not None:
+        if not task_ids:
+            return 0, 0
+        deadline_rows = await pool.fetch(_DEADLINE_DUE_BY_ID_SQL, task_ids)
+    else:
+        if has_task_type_col is None:
+            has_task_type_col = await _has_column(pool, "scheduled_tasks", "task_type")
+        if not has_task_type_col or not await _has_columns(
+            pool, "scheduled_tasks", required_deadline_columns
+        ):
+            return 0, 0
+
+        deadline_rows = await pool.fetch(_DEADLINE_DUE_SQL)
+
+    next_evaluation_at = next_utc_midnight(now)
 
     evaluated = 0
     dispatched = 0
@@ -1151,8 +1238,16 @@ async def _tick_deadline_pass(
                 new_status,
             )
             logger.info("Deadline task %s expired (target_date=%s); disabled", name, target_date)
+            if wheel is not None:
+                # Dependents may now be unblocked and chains may now fire.
+                wheel.invalidate(KIND_DEADLINE)
             continue
 
+        # Every remaining outcome re-arms the deadline for the next day
+        # boundary; a failed dispatch below overrides this with an immediate retry.
+        if wheel is not None:
+            wheel.schedule(KIND_DEADLINE, task_id, next_evaluation_at)
+
         # Step 2: skip if blocked by incomplete dependencies
         if depends_on:
             # Fetch dependency statuses
@@ -1215,6 +1310,8 @@ async def _tick_deadline_pass(
                     outcome="failure",
                 )
             # Skip threshold recording on dispatch failure to preserve retry semantics
+            if wheel is not None:
+                wheel.schedule(KIND_DEADLINE, task_id, now)
             continue
 
         # Step 5: record the fired threshold and update status
@@ -1239,6 +1336,8 @@ async def _tick_deadline_pass(
             _list_to_jsonb(new_fired),
             now,
         )
+        if wheel is not None:
+            wheel.invalidate(KIND_DEADLINE)
 
     return evaluated, dispatched
 
@@ -1311,6 +1410,8 @@ async def _tick_event_chain_pass(
     pool: asyncpg.Pool,
     dispatch_fn,
     now: datetime,
+    *,
+    wheel: SchedulerWheel | None = None,
 ) -> int:
     """Detect event chain triggers and materialize actions.
 
@@ -1319,6 +1420,9 @@ async def _tick_event_chain_pass(
     - deadline_passed: deadline tasks that transitioned to 'expired' or 'completed'
     - deadline_threshold: deadline tasks where a matching severity threshold has fired
 
+    When *wheel* is given, its cached schema probes replace the per-call
+    information_schema lookups.
+
     Returns the number of chains fired.
     """
     import json as _json
@@ -1330,18 +1434,24 @@ async def _tick_event_chain_pass(
     # event_chains is a prerequisite for every trigger in this pass.  Bail out
     # early so we avoid unnecessary schema probes for calendar_projection and
     # scheduled_tasks when the core table is missing.
-    has_event_chains_table = await _has_table(pool, "event_chains")
+    if wheel is not None:
+        has_event_chains_table = wheel.event_chains_ready
+    else:
+        has_event_chains_table = await _has_table(pool, "event_chains")
     if not has_event_chains_table:
         return 0
 
     # --- Trigger: calendar_event_end ---
     # Only evaluated when the optional calendar_projection table exists with
     # the legacy projection columns this pass reads.
-    calendar_projection_ready = await _has_columns(
-        pool,
-        "calendar_projection",
-        {"event_id", "butler_name", "end_at", "chain_triggered"},
-    )
+    if wheel is not None:
+        calendar_projection_ready = wheel.calendar_projection_ready
+    else:
+        calendar_projection_ready = await _has_columns(
+            pool,
+            "calendar_projection",
+            {"event_id", "butler_name", "end_at", "chain_triggered"},
+        )
 
     if calendar_projection_ready:
         # Find calendar events that ended before now and haven't triggered chains yet
@@ -1407,7 +1517,10 @@ async def _tick_event_chain_pass(
     # (_tick_deadline_pass) earlier in the same tick() call.
     #
     # Guard: skip if scheduled_tasks lacks deadline columns (pre-migration schema).
-    has_deadline_status_col = await _has_column(pool, "scheduled_tasks", "deadline_status")
+    if wheel is not None:
+        has_deadline_status_col = "deadline_status" in wheel.scheduled_task_columns
+    else:
+        has_deadline_status_col = await _has_column(pool, "scheduled_tasks", "deadline_status")
     if has_deadline_status_col:
         # Fetch deadline chains without casting trigger_reference in SQL.
         # trigger_reference is user-authored text, and malformed rows must not
@@ -1557,6 +1670,9 @@ async def _tick_event_chain_pass(
             )
             chains_fired += 1
 
+    if wheel is not None and chains_fired:
+        # Fired chains materialize new cron rows into scheduled_tasks.
+        wheel.invalidate(KIND_CRON)
     return chains_fired
 
 
@@ -1653,6 +1769,8 @@ async def _tick_deferred_notification_pass(
     now: datetime,
     *,
     notify_fn=None,
+    notification_ids: list[uuid.UUID] | None = None,
+    wheel: SchedulerWheel | None = None,
 ) -> int:
     """Flush deferred notifications: expire old ones and deliver due ones.
 
@@ -1686,22 +1804,32 @@ async def _tick_deferred_notification_pass(
     successfully delivered row can never be re-sent — the row's own status
     transition is the guard, same as the pre-existing single-item path.
 
+    Wheel-driven ticks pass ``notification_ids`` (the rows the wheel says are
+    due) and ``wheel``: only those rows are fetched, the table-existence probe
+    is skipped (the wheel only indexes rows once the table exists), and rows
+    left pending — no ``notify_fn`` or a failed send — are re-armed for the
+    next tick so retry semantics match the full-scan path.
+
     Returns the number of underlying notifications delivered (a composed
     digest of N rows counts as N, not 1 — it reflects candidates consumed,
     not ``notify_fn`` calls made).
     """
-    # Check if deferred_notifications table exists
-    table_exists = await pool.fetchval(
-        """
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.tables
-            WHERE table_schema = current_schema()
-              AND table_name = 'deferred_notifications'
+    if notification_ids is not None:
+        if not notification_ids:
+            return 0
+    else:
+        # Check if deferred_notifications table exists
+        table_exists = await pool.fetchval(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.tables
+                WHERE table_schema = current_schema()
+                  AND table_name = 'deferred_notifications'
+            )
+            """
         )
-        """
-    )
-    if not table_exists:
-        return 0
+        if not table_exists:
+            return 0
 
     import json as _json
 
@@ -1717,20 +1845,39 @@ async def _tick_deferred_notification_pass(
     )
 
     # Fetch due notifications (pending, deliver_at <= now)
-    due_rows = await pool.fetch(
-        """
-        SELECT id, butler_name, channel, message, priority, envelope
-        FROM deferred_notifications
-        WHERE status = 'pending' AND deliver_at <= $1
-        ORDER BY deliver_at
-        """,
-        now,
-    )
+    if notification_ids is not None:
+        due_rows = await pool.fetch(
+            """
+            SELECT id, butler_name, channel, message, priority, envelope
+            FROM deferred_notifications
+            WHERE status = 'pending' AND deliver_at <= $1
+              AND id = ANY($2::uuid[])
+            ORDER BY deliver_at
+            """,
+            now,
+            notification_ids,
+        )
+    else:
+        due_rows = await pool.fetch(
+            """
+            SELECT id, butler_name, channel, message, priority, envelope
+            FROM deferred_notifications
+            WHERE status = 'pending' AND deliver_at <= $1
+            ORDER BY deliver_at
+            """,
+            now,
+        )
 
     if not due_rows:
         return 0
 
+    def _retry_next_tick(ids: list[uuid.UUID]) -> None:
+        if wheel is not None:
+            for notif_id in ids:
+                wheel.schedule(KIND_DEFERRED, notif_id, now)
+
     if notify_fn is None:
+        _retry_next_tick([row["id"] for row in due_rows])
         # No delivery callable wired — leave rows pending for next tick.
         logger.warning(
             "_tick_deferred_notification_pass: %d due notification(s) skipped"
@@ -1784,6 +1931,7 @@ async def _tick_deferred_notification_pass(
             except Exception:
                 logger.exception("Failed to deliver deferred notification %s", notif_id)
                 # Keep status=pending for next-tick retry
+                _retry_next_tick([notif_id])
             continue
 
         # Same-window coalescing: >1 due row shares one delivery target —
@@ -1825,6 +1973,7 @@ async def _tick_deferred_notification_pass(
             # Keep the whole group status=pending for next-tick retry — a
             # partial send (some delivered, some not) would defeat the point
             # of a single composed message and complicate the retry story.
+            _retry_next_tick(group_ids)
 
     return delivered
 
@@ -1893,6 +2042,7 @@ async def tick(
     completion_hooks: dict[str, Any] | None = None,
     eligibility_pool: asyncpg.Pool | None = None,
     default_timezone: str = _DEFAULT_SCHEDULE_TIMEZONE,
+    wheel: SchedulerWheel | None = None,
 ) -> int:
     """Evaluate due tasks and dispatch them.
 
@@ -1961,6 +2111,14 @@ async def tick(
             schedule resumes naturally on the next eligible tick.  When ``None``
             (e.g. unit tests, or a context without a registry), no gating is
             applied and all passes run as before.
+        wheel: Optional per-daemon :class:`~butlers.core.scheduler_wheel.
+            SchedulerWheel`.  When given, the tick asks the wheel which rows
+            are due instead of scanning: each pass only runs (and only reads
+            the due ids) when it has work, schema probes come from the wheel's
+            cache, and seasons/eligibility are only consulted when a deadline
+            or cron dispatch is due.  A tick with nothing due issues no
+            queries.  When ``None`` (MCP ``tick`` tool, force-tick API, unit
+            tests), every pass does its full scan as before.
 
     Returns:
         The number of tasks successfully dispatched (cron + deadline).
@@ -1968,15 +2126,30 @@ async def tick(
     from butlers.core.seasonal import get_active_seasons as _get_active_seasons
 
     tracer = trace.get_tracer("butlers")
-    with tracer.start_as_current_span("butler.tick") as span:
+    with (
+        tracer.start_as_current_span("butler.tick") as span,
+        profile_operation("scheduler.tick"),
+    ):
         now = datetime.now(UTC)
 
-        # Hoist schema probes: deadline and cron dispatch share these results.
-        scheduled_task_columns = await _existing_columns(
-            pool,
-            "scheduled_tasks",
-            {"task_type", "max_token_budget", "until_at"},
-        )
+        due: DueWork | None = None
+        if wheel is not None:
+            await wheel.sync(pool, now)
+            due = wheel.take_due(now)
+            span.set_attribute("wheel_entries", len(wheel))
+            if not due and not wheel.chains_pending:
+                span.set_attribute("wheel_idle", True)
+                return 0
+            span.set_attribute("wheel_idle", False)
+            scheduled_task_columns = wheel.scheduled_task_columns
+        else:
+            # Hoist schema probes: deadline and cron dispatch share these results.
+            scheduled_task_columns = await _existing_columns(
+                pool,
+                "scheduled_tasks",
+                {"task_type", "max_token_budget", "until_at"},
+            )
+        dispatch_due = due is None or due.dispatch_due
         _has_task_type_col = "task_type" in scheduled_task_columns
         _has_budget_col = "max_token_budget" in scheduled_task_columns
         _has_until_at_col = "until_at" in scheduled_task_columns
@@ -1992,7 +2165,7 @@ async def tick(
         # that deadline dispatches receive the same seasonal prefix as cron tasks.
         # ------------------------------------------------------------------
         active_seasons: list[dict[str, Any]] = []
-        if butler_name:
+        if butler_name and dispatch_due:
             try:
                 active_seasons = await _get_active_seasons(pool, butler_name)
             except Exception:
@@ -2012,7 +2185,9 @@ async def tick(
         # un-paused.  Event-chain bookkeeping (Pass 3) and deferred-notification
         # flush (Pass 4) still run — neither spawns the gated butler.
         # ------------------------------------------------------------------
-        dispatch_gate_reason = await _butler_dispatch_gated(eligibility_pool, butler_name)
+        dispatch_gate_reason = (
+            await _butler_dispatch_gated(eligibility_pool, butler_name) if dispatch_due else None
+        )
         span.set_attribute("dispatch_gated", dispatch_gate_reason is not None)
 
         if dispatch_gate_reason is not None:
@@ -2021,6 +2196,13 @@ async def tick(
                 butler_name,
                 dispatch_gate_reason,
             )
+            if wheel is not None and due is not None:
+                # Nothing was claimed; keep the due rows due so the schedule
+                # resumes on the first eligible tick.
+                for task_id in due.cron:
+                    wheel.schedule(KIND_CRON, task_id, now)
+                for task_id in due.deadline:
+                    wheel.schedule(KIND_DEADLINE, task_id, now)
             deadlines_evaluated = 0
             deadline_dispatched = 0
             span.set_attribute("deadlines_evaluated", 0)
@@ -2036,6 +2218,8 @@ async def tick(
                 max_stagger_seconds=max_stagger_seconds,
                 metrics=metrics,
                 active_seasons=active_seasons,
+                task_ids=due.deadline if due is not None else None,
+                wheel=wheel,
             )
             span.set_attribute("deadlines_evaluated", deadlines_evaluated)
             span.set_attribute("deadline_dispatched", deadline_dispatched)
@@ -2046,27 +2230,19 @@ async def tick(
         # When the butler is gated (paused/quarantined/stale), skip the cron
         # fetch entirely so no rows are dispatched and next_run_at is preserved.
         rows: list[asyncpg.Record] = []
-        if dispatch_gate_reason is None:
-            if _has_task_type_col:
-                cron_filter = "AND COALESCE(task_type, 'cron') = 'cron'"
-            else:
-                cron_filter = ""
-            _budget_col_select = ", max_token_budget" if _has_budget_col else ""
-            _until_at_select = (
-                ", until_at" if _has_until_at_col else ", NULL::timestamptz AS until_at"
-            )
+        if dispatch_gate_reason is None and (due is None or due.cron):
+            _due_args = (due.cron,) if due is not None else ()
             rows = await pool.fetch(
-                f"""
-                SELECT id, name, cron, dispatch_mode, prompt, job_name, job_args,
-                       complexity, timezone, next_run_at{_until_at_select}{_budget_col_select}
-                FROM scheduled_tasks
-                WHERE enabled = true
-                  {cron_filter}
-                  AND next_run_at <= $1
-                ORDER BY next_run_at
-                """,
+                _CRON_DUE_SQL[
+                    _has_task_type_col, _has_budget_col, _has_until_at_col, due is not None
+                ],
                 now,
+                *_due_args,
             )
+            if wheel is not None and due is not None and len(rows) < len(due.cron):
+                # Some due entries were stale (rescheduled, disabled or deleted
+                # elsewhere); reload the cron index from the DB next tick.
+                wheel.invalidate(KIND_CRON)
 
         tasks_due = len(rows)
         span.set_attribute("tasks_due", tasks_due)
@@ -2137,8 +2313,13 @@ async def tick(
                     "Scheduled task %r already claimed by a concurrent tick; skipping",
                     name,
                 )
+                if wheel is not None:
+                    wheel.invalidate(KIND_CRON)
                 continue
 
+            if wheel is not None and not should_auto_disable:
+                wheel.schedule(KIND_CRON, task_id, next_run_at)
+
             if should_auto_disable:
                 logger.info(
                     "Scheduled task %s has passed until_at (%s); auto-disabling", name, until_at
@@ -2220,11 +2401,23 @@ async def tick(
         span.set_attribute("tasks_run", dispatched)
 
         # --- Pass 3: Event chain trigger detection (after cron/deadline dispatch) ---
-        chains_fired = await _tick_event_chain_pass(pool, dispatch_fn, now)
+        chains_fired = 0
+        if wheel is None or due.calendar_end or wheel.chains_pending:
+            chains_fired = await _tick_event_chain_pass(pool, dispatch_fn, now, wheel=wheel)
+            if wheel is not None:
+                wheel.chain_pass_done()
         span.set_attribute("chains_fired", chains_fired)
 
         # --- Pass 4: Deferred notification flush (after chain detection) ---
-        deferred_flushed = await _tick_deferred_notification_pass(pool, now, notify_fn=notify_fn)
+        deferred_flushed = 0
+        if due is None or due.deferred:
+            deferred_flushed = await _tick_deferred_notification_pass(
+                pool,
+                now,
+                notify_fn=notify_fn,
+                notification_ids=due.deferred if due is not None else None,
+                wheel=wheel,
+            )
         span.set_attribute("deferred_flushed", deferred_flushed)
 
         return dispatched + deadline_dispatched
@@ -2444,6 +2637,7 @@ async def schedule_create(
         )
     except asyncpg.UniqueViolationError:
         raise ValueError(f"Task name {name!r} already exists")
+    invalidate_scheduler_wheel(pool, KIND_CRON)
     logger.info("Created runtime schedule: %s (%s)", name, task_id)
     return task_id
 
@@ -2649,6 +2843,7 @@ async def schedule_update(
     # Single atomic UPDATE statement
     query = f"UPDATE scheduled_tasks SET {', '.join(set_clauses)} WHERE id = $1"
     await pool.execute(query, *params)
+    invalidate_scheduler_wheel(pool, KIND_CRON)
 
     logger.info("Updated schedule %s: %s", task_id, list(normalized_fields.keys()))
 
@@ -2672,4 +2867,5 @@ async def schedule_delete(pool: asyncpg.Pool, task_id: uuid.UUID) -> None:
         raise ValueError(f"Cannot delete TOML-sourced task {task_id}; disable it instead")
 
     await pool.execute("DELETE FROM scheduled_tasks WHERE id = $1", task_id)
+    invalidate_scheduler_wheel(pool, KIND_CRON)
     logger.info("Deleted runtime schedule: %s", task_id)
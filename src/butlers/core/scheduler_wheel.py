@@ -0,0 +1,329 @@
+"""Per-daemon due index for the scheduler tick, backed by a timing wheel.
+
+Without an index, every :func:`butlers.core.scheduler.tick` re-probes the
+schema and re-scans ``scheduled_tasks``, ``event_chains``,
+``calendar_projection`` and ``deferred_notifications`` even when nothing is
+due. :class:`SchedulerWheel` loads "when does each row next need attention"
+from the DB once, keeps it in a :class:`~butlers.core.timing_wheel.
+HierarchicalTimingWheel`, and hands ``tick()`` exactly the ids that are due.
+An idle tick therefore issues no queries at all, and the cost of a busy tick
+tracks the number of due rows rather than the table sizes.
+
+What each kind indexes (keys are ``(kind, id)``):
+
+- ``cron`` — enabled cron tasks at their ``next_run_at``.
+- ``deadline`` — enabled deadline tasks. ``days_remaining`` only changes at
+  a UTC date boundary, so after an evaluation a deadline is re-armed for the
+  next UTC midnight (or for the next tick when its dispatch failed).
+- ``calendar_end`` — un-triggered ``calendar_projection`` rows at ``end_at``.
+- ``deferred`` — pending ``deferred_notifications`` at ``deliver_at``.
+
+``deadline_passed`` / ``deadline_threshold`` event chains have no time of
+their own: they fire when a deadline's status changes, which only happens in
+the deadline pass or through a deadline/event-chain write. Those set a
+"chain pass pending" flag instead of a wheel entry.
+
+The DB stays the source of truth. The wheel is rebuilt from it at startup
+(crash recovery), write paths in this process mark the affected kind dirty
+via :func:`invalidate_scheduler_wheel` (reloaded on the next tick with one
+query; the calendar module does so for every event time or status change),
+and a periodic full resync covers writes made by other processes (the
+dashboard API, migrations) that cannot reach this process's wheel.
+A stale entry is harmless: passes re-check every due id against the DB.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from butlers.core.timing_wheel import HierarchicalTimingWheel
+
+logger = logging.getLogger(__name__)
+
+KIND_CRON = "cron"
+KIND_DEADLINE = "deadline"
+KIND_CALENDAR_END = "calendar_end"
+KIND_DEFERRED = "deferred"
+# Not a wheel kind: invalidating it only requests an event-chain pass.
+KIND_CHAIN = "chain"
+
+WHEEL_KINDS: tuple[str, ...] = (KIND_CRON, KIND_DEADLINE, KIND_CALENDAR_END, KIND_DEFERRED)
+
+_DEFAULT_RESYNC_INTERVAL_S = 600.0
+
+# Columns the deadline pass needs; mirrors _tick_deadline_pass's guard.
+DEADLINE_COLUMNS = frozenset(
+    {
+        "task_type",
+        "target_date",
+        "lead_time_days",
+        "alert_thresholds",
+        "deadline_status",
+        "fired_thresholds",
+        "depends_on",
+    }
+)
+_OPTIONAL_TASK_COLUMNS = frozenset({"task_type", "max_token_budget", "until_at"})
+
+
+def next_utc_midnight(now: datetime) -> datetime:
+    """Return the first UTC midnight strictly after *now*."""
+    day = now.astimezone(UTC).date() + timedelta(days=1)
+    return datetime(day.year, day.month, day.day, tzinfo=UTC)
+
+
+@dataclass
+class DueWork:
+    """Ids due in one tick, grouped by kind."""
+
+    cron: list[uuid.UUID] = field(default_factory=list)
+    deadline: list[uuid.UUID] = field(default_factory=list)
+    calendar_end: list[tuple[Any, Any]] = field(default_factory=list)
+    deferred: list[uuid.UUID] = field(default_factory=list)
+
+    @property
+    def dispatch_due(self) -> bool:
+        """True when the cron or deadline pass has work (needs gating/seasons)."""
+        return bool(self.cron or self.deadline)
+
+    def __bool__(self) -> bool:
+        return bool(self.cron or self.deadline or self.calendar_end or self.deferred)
+
+
+class SchedulerWheel:
+    """In-memory due index for one butler daemon's scheduler.
+
+    Also caches the schema probes ``tick()`` used to repeat every tick; they
+    are refreshed on each full resync (i.e. after migrations land).
+    """
+
+    def __init__(
+        self,
+        *,
+        resync_interval_s: float = _DEFAULT_RESYNC_INTERVAL_S,
+        resolution_s: float = 1.0,
+    ) -> None:
+        self._resync_interval_s = resync_interval_s
+        self._resolution_s = resolution_s
+        self._wheel: HierarchicalTimingWheel[tuple[str, Any]] | None = None
+        self._dirty: set[str] = set(WHEEL_KINDS)
+        self._chains_pending = True
+        self._last_full_sync: float | None = None
+
+        # Cached schema probes (populated by a full sync).
+        self.scheduled_task_columns: set[str] = set()
+        self.deadline_columns_ready = False
+        self.event_chains_ready = False
+        self.calendar_projection_ready = False
+        self.deferred_table_ready = False
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def loaded(self) -> bool:
+        """True once a full load from the DB has completed."""
+        return self._last_full_sync is not None
+
+    @property
+    def chains_pending(self) -> bool:
+        """True when the event-chain pass must run on the next tick."""
+        return self._chains_pending
+
+    def __len__(self) -> int:
+        return len(self._wheel) if self._wheel is not None else 0
+
+    def invalidate(self, *kinds: str) -> None:
+        """Mark *kinds* (all kinds when none given) for reload on the next tick."""
+        targets = kinds or (*WHEEL_KINDS, KIND_CHAIN)
+        for kind in targets:
+            if kind in WHEEL_KINDS:
+                self._dirty.add(kind)
+            # Deadline state and event-chain definitions both feed the
+            # deadline_passed / deadline_threshold triggers.
+            if kind in (KIND_DEADLINE, KIND_CHAIN, KIND_CALENDAR_END):
+                self._chains_pending = True
+
+    def request_chain_pass(self) -> None:
+        """Ask for an event-chain pass on the next tick."""
+        self._chains_pending = True
+
+    def chain_pass_done(self) -> None:
+        """Clear the pending flag after the event-chain pass ran."""
+        self._chains_pending = False
+
+    def schedule(self, kind: str, ident: Any, due_at: datetime) -> None:
+        """(Re-)arm one row to come due at *due_at*."""
+        if self._wheel is not None:
+            self._wheel.schedule((kind, ident), due_at)
+
+    def cancel(self, kind: str, ident: Any) -> None:
+        """Drop one row from the index."""
+        if self._wheel is not None:
+            self._wheel.cancel((kind, ident))
+
+    def take_due(self, now: datetime) -> DueWork:
+        """Advance the wheel to *now* and return (and remove) everything due."""
+        due = DueWork()
+        if self._wheel is None:
+            return due
+        for kind, ident in self._wheel.advance(now):
+            getattr(due, kind).append(ident)
+        return due
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def sync(self, pool: Any, now: datetime) -> None:
+        """Bring the index up to date: a full load when due, else dirty kinds only.
+
+        Issues no queries when nothing is dirty and the resync interval has
+        not elapsed.
+        """
+        full = (
+            self._wheel is None
+            or self._last_full_sync is None
+            or time.monotonic() - self._last_full_sync >= self._resync_interval_s
+        )
+        if full:
+            await self._probe_schema(pool)
+            self._wheel = HierarchicalTimingWheel(now=now, resolution_s=self._resolution_s)
+            self._dirty = set(WHEEL_KINDS)
+            self._chains_pending = True
+
+        for kind in sorted(self._dirty):
+            self._drop_kind(kind)
+            await self._load_kind(pool, kind, now)
+        self._dirty.clear()
+
+        if full:
+            self._last_full_sync = time.monotonic()
+            logger.debug("SchedulerWheel: full resync loaded %d entries", len(self))
+
+    async def _probe_schema(self, pool: Any) -> None:
+        from butlers.core.scheduler import _existing_columns, _has_columns, _has_table
+
+        self.scheduled_task_columns = await _existing_columns(
+            pool, "scheduled_tasks", set(_OPTIONAL_TASK_COLUMNS | DEADLINE_COLUMNS)
+        )
+        self.deadline_columns_ready = DEADLINE_COLUMNS.issubset(self.scheduled_task_columns)
+        self.event_chains_ready = await _has_table(pool, "event_chains")
+        self.calendar_projection_ready = self.event_chains_ready and await _has_columns(
+            pool,
+            "calendar_projection",
+            {"event_id", "butler_name", "end_at", "chain_triggered"},
+        )
+        self.deferred_table_ready = await _has_table(pool, "deferred_notifications")
+
+    def _drop_kind(self, kind: str) -> None:
+        if self._wheel is None:
+            return
+        for key in self._wheel:
+            if key[0] == kind:
+                self._wheel.cancel(key)
+
+    async def _load_kind(self, pool: Any, kind: str, now: datetime) -> None:
+        if kind == KIND_CRON:
+            cron_filter = (
+                "AND COALESCE(task_type, 'cron') = 'cron'"
+                if "task_type" in self.scheduled_task_columns
+                else ""
+            )
+            rows = await pool.fetch(
+                f"""
+                SELECT id, next_run_at
+                FROM scheduled_tasks
+                WHERE enabled = true
+                  {cron_filter}
+                  AND next_run_at IS NOT NULL
+                """
+            )
+            self._schedule_rows(KIND_CRON, ((r["id"], r["next_run_at"]) for r in rows))
+        elif kind == KIND_DEADLINE:
+            if not self.deadline_columns_ready:
+                return
+            rows = await pool.fetch(
+                """
+                SELECT id
+                FROM scheduled_tasks
+                WHERE enabled = true AND task_type = 'deadline'
+                """
+            )
+            # Freshly (re)loaded deadlines are evaluated on the next tick.
+            self._schedule_rows(KIND_DEADLINE, ((r["id"], now) for r in rows))
+        elif kind == KIND_CALENDAR_END:
+            if not self.calendar_projection_ready:
+                return
+            rows = await pool.fetch(
+                """
+                SELECT event_id, butler_name, end_at
+                FROM calendar_projection
+                WHERE chain_triggered = false AND end_at IS NOT NULL
+                """
+            )
+            self._schedule_rows(
+                KIND_CALENDAR_END,
+                (((r["event_id"], r["butler_name"]), r["end_at"]) for r in rows),
+            )
+        elif kind == KIND_DEFERRED:
+            if not self.deferred_table_ready:
+                return
+            rows = await pool.fetch(
+                """
+                SELECT id, deliver_at
+                FROM deferred_notifications
+                WHERE status = 'pending'
+                """
+            )
+            self._schedule_rows(KIND_DEFERRED, ((r["id"], r["deliver_at"]) for r in rows))
+
+    def _schedule_rows(self, kind: str, rows: Iterable[tuple[Any, datetime | None]]) -> None:
+        assert self._wheel is not None
+        for ident, due_at in rows:
+            if due_at is not None:
+                self._wheel.schedule((kind, ident), due_at)
+
+
+# ---------------------------------------------------------------------------
+# Write-path invalidation
+# ---------------------------------------------------------------------------
+
+# Keyed by id(pool): write paths only hold the pool they write through.  The
+# scheduler loop registers its wheel against the daemon's pool and
+# unregisters it on exit, so a recycled id() never aliases a live wheel.  A
+# write through any other pool object (a lease, a module-owned pool) cannot be
+# attributed to one wheel and invalidates all of them.
+_WHEELS: dict[int, SchedulerWheel] = {}
+
+
+def register_scheduler_wheel(pool: Any, wheel: SchedulerWheel) -> None:
+    """Attach *wheel* to *pool* so writes through that pool invalidate it."""
+    _WHEELS[id(pool)] = wheel
+
+
+def unregister_scheduler_wheel(pool: Any) -> None:
+    """Detach whatever wheel is registered for *pool* (no-op when none)."""
+    _WHEELS.pop(id(pool), None)
+
+
+def invalidate_scheduler_wheel(pool: Any, *kinds: str) -> None:
+    """Mark *kinds* dirty on the wheel registered for *pool*.
+
+    Called by scheduler-relevant write paths (schedules, deadlines, event
+    chains, calendar events, deferred notifications).  When no wheel is
+    registered for *pool* itself, every wheel in this process is marked,
+    which costs each one reload query per kind on its next tick.  A no-op
+    when no scheduler loop runs here, e.g. in the dashboard API process or in
+    unit tests.
+    """
+    wheel = _WHEELS.get(id(pool))
+    for target in (wheel,) if wheel is not None else tuple(_WHEELS.values()):
+        target.invalidate(*kinds)
@@ -0,0 +1,94 @@
+"""Monthly partition maintenance for the ``sessions`` table.
+
+Migration ``core_202`` turns ``sessions`` into a table range-partitioned by
+``started_at`` (one partition per UTC month) and installs two SECURITY
+DEFINER helpers in each butler schema:
+
+- ``sessions_ensure_partition(ts)`` creates the partition covering *ts* and
+  the following month, each with a partition-local B-tree on ``started_at``.
+- ``sessions_compact_partitions(hot_months)`` swaps the B-tree for a BRIN
+  index on partitions older than the hot window.  Old partitions are
+  append-only and physically ordered by ``started_at``, so BRIN keeps range
+  scans cheap at a fraction of the B-tree's size.
+
+This module is the runtime side: the daemon calls
+:func:`ensure_session_partitions` at startup, and the deterministic
+``sessions_partition_maintenance`` schedule runs
+:func:`run_sessions_partition_maintenance` nightly so next month's partition
+always exists before the first session of the month is inserted.  Should a
+run be missed, the row lands in the ``sessions_default`` partition and is
+moved into its month by the next ``sessions_ensure_partition`` call.
+
+Every helper is a no-op on a schema that has not been migrated yet.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+SESSIONS_PARTITION_JOB_NAME = "sessions_partition_maintenance"
+SESSIONS_PARTITION_JOB_CRON = "17 3 * * *"
+DEFAULT_HOT_MONTHS = 2
+
+
+async def _function_exists(pool: asyncpg.Pool, signature: str) -> bool:
+    return bool(await pool.fetchval("SELECT to_regprocedure($1) IS NOT NULL", signature))
+
+
+async def ensure_session_partitions(
+    pool: asyncpg.Pool, reference_ts: datetime | None = None
+) -> str | None:
+    """Create the partitions covering *reference_ts* (default: now) and the next month.
+
+    Returns the name of the partition covering *reference_ts*, or ``None``
+    when the schema has no ``sessions_ensure_partition`` helper (pre-core_202).
+    """
+    if not await _function_exists(pool, "sessions_ensure_partition(timestamptz)"):
+        return None
+    return await pool.fetchval(
+        "SELECT sessions_ensure_partition(COALESCE($1::timestamptz, now()))", reference_ts
+    )
+
+
+async def compact_session_partitions(
+    pool: asyncpg.Pool, hot_months: int = DEFAULT_HOT_MONTHS
+) -> int:
+    """Move partitions older than *hot_months* from B-tree to BRIN indexing.
+
+    Returns the number of partitions converted on this call (0 when the
+    schema has no ``sessions_compact_partitions`` helper).
+    """
+    if hot_months < 1:
+        raise ValueError(f"hot_months must be >= 1, got {hot_months}")
+    if not await _function_exists(pool, "sessions_compact_partitions(integer)"):
+        return 0
+    return int(await pool.fetchval("SELECT sessions_compact_partitions($1)", hot_months) or 0)
+
+
+async def run_sessions_partition_maintenance(
+    pool: asyncpg.Pool, job_args: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Deterministic job: ensure upcoming partitions, then compact cold ones.
+
+    ``job_args`` may carry ``hot_months`` (default 2).
+    """
+    args = job_args or {}
+    hot_months = int(args.get("hot_months", DEFAULT_HOT_MONTHS))
+
+    current = await ensure_session_partitions(pool)
+    if current is None:
+        return {"skipped": True, "reason": "sessions table is not partitioned"}
+    compacted = await compact_session_partitions(pool, hot_months)
+    logger.info(
+        "sessions partition maintenance: current=%s compacted=%d hot_months=%d",
+        current,
+        compacted,
+        hot_months,
+    )
+    return {"current_partition": current, "compacted": compacted, "hot_months": hot_months}
@@ -11,12 +11,15 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from collections import OrderedDict
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 import asyncpg
 from croniter import CroniterBadDateError, croniter
 
+from butlers.db_statements import register_statement
+
 logger = logging.getLogger(__name__)
 
 # Valid trigger_source base values.
@@ -26,6 +29,60 @@ TRIGGER_SOURCES = frozenset(
     {"tick", "classification", "external", "trigger", "route", "healing", "dashboard", "qa"}
 )
 
+_SESSION_CREATE_SQL = register_statement(
+    "sessions.create",
+    """
+    INSERT INTO sessions
+        (prompt, trigger_source, trace_id, model, request_id, ingestion_event_id,
+         complexity, resolution_source, started_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    RETURNING id
+    """,
+    relations=("sessions",),
+)
+
+_SESSION_COMPLETE_SET = """
+    UPDATE sessions
+    SET result        = $2,
+        tool_calls    = $3,
+        duration_ms   = $4,
+        cost          = $5,
+        success       = $6,
+        error         = $7,
+        input_tokens  = $8,
+        output_tokens = $9,
+        cached_input_tokens   = $10,
+        cache_creation_tokens = $11,
+        completed_at  = now()
+"""
+# sessions is range-partitioned on started_at (core_202): an UPDATE keyed by
+# id alone probes every partition, so the keyed variant also names the
+# partition key and prunes to one.  The id-only variant covers sessions this
+# process did not create.
+_SESSION_COMPLETE_SQL = register_statement(
+    "sessions.complete",
+    _SESSION_COMPLETE_SET + "    WHERE id = $1 AND started_at = $12\n    RETURNING id\n",
+    relations=("sessions",),
+)
+_SESSION_COMPLETE_BY_ID_SQL = register_statement(
+    "sessions.complete_by_id",
+    _SESSION_COMPLETE_SET + "    WHERE id = $1\n    RETURNING id\n",
+    relations=("sessions",),
+)
+
+# started_at of sessions created by this process, so the follow-up UPDATEs
+# (completion, healing fingerprint) can prune to the session's partition.
+# Bounded: only in-flight and recently finished sessions need an entry.
+_STARTED_AT_CACHE_SIZE = 4096
+_session_started_at: OrderedDict[uuid.UUID, datetime] = OrderedDict()
+
+
+def _remember_started_at(session_id: uuid.UUID, started_at: datetime) -> None:
+    _session_started_at[session_id] = started_at
+    _session_started_at.move_to_end(session_id)
+    while len(_session_started_at) > _STARTED_AT_CACHE_SIZE:
+        _session_started_at.popitem(last=False)
+
 
 def _strip_null_bytes(value: str | None) -> str | None:
     """Strip NUL characters that PostgreSQL text columns cannot store."""
@@ -172,16 +229,16 @@ async def session_create(
 
     # Sanitize once up front so the retry path does not redo the work.
     sanitized_prompt = _strip_untranslatable_chars(prompt)
+    # Stamped client-side (instead of the column's now() default) so the
+    # partition key of the new row is known without reading it back.
+    started_at = datetime.now(UTC)
 
     async def _insert(resolved_ingestion_event_id: str | None) -> uuid.UUID:
+        # No missing-partition retry is needed: core_202 gives sessions a
+        # DEFAULT partition, and sessions_ensure_partition moves any rows it
+        # caught into the month's partition once that is created.
         return await pool.fetchval(
-            """
-            INSERT INTO sessions
-                (prompt, trigger_source, trace_id, model, request_id, ingestion_event_id,
-                 complexity, resolution_source)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            RETURNING id
-            """,
+            _SESSION_CREATE_SQL,
             sanitized_prompt,
             trigger_source,
             trace_id,
@@ -190,6 +247,7 @@ async def session_create(
             resolved_ingestion_event_id,
             complexity,
             resolution_source,
+            started_at,
         )
 
     try:
@@ -208,6 +266,8 @@ async def session_create(
             ingestion_event_id,
         )
         session_id = await _insert(None)
+    if isinstance(session_id, uuid.UUID):
+        _remember_started_at(session_id, started_at)
     logger.info("Session created: %s (trigger=%s, model=%s)", session_id, trigger_source, model)
 
     # Fan a "session started" event onto the multiplexed fleet event bus
@@ -279,23 +339,7 @@ async def session_complete(
     safe_tool_calls = _sanitize_json_value(tool_calls)
     safe_cost = _sanitize_json_value(cost) if cost is not None else None
 
-    row = await pool.fetchval(
-        """
-        UPDATE sessions
-        SET result        = $2,
-            tool_calls    = $3,
-            duration_ms   = $4,
-            cost          = $5,
-            success       = $6,
-            error         = $7,
-            input_tokens  = $8,
-            output_tokens = $9,
-            cached_input_tokens   = $10,
-            cache_creation_tokens = $11,
-            completed_at  = now()
-        WHERE id = $1
-        RETURNING id
-        """,
+    args = (
         session_id,
         safe_output,
         safe_tool_calls,
@@ -308,6 +352,11 @@ async def session_complete(
         cached_input_tokens,
         cache_creation_tokens,
     )
+    started_at = _session_started_at.get(session_id)
+    if started_at is not None:
+        row = await pool.fetchval(_SESSION_COMPLETE_SQL, *args, started_at)
+    else:
+        row = await pool.fetchval(_SESSION_COMPLETE_BY_ID_SQL, *args)
     if row is None:
         raise ValueError(f"Session {session_id} not found")
     logger.info(
@@ -405,6 +454,19 @@ async def session_set_healing_fingerprint(
         session_id: UUID of the session to update.
         fingerprint: 64-character hex SHA-256 fingerprint string.
     """
+    started_at = _session_started_at.get(session_id)
+    if started_at is not None:
+        await pool.execute(
+            """
+            UPDATE sessions
+            SET healing_fingerprint = $2
+            WHERE id = $1 AND started_at = $3
+            """,
+            session_id,
+            fingerprint,
+            started_at,
+        )
+        return
     await pool.execute(
         """
         UPDATE sessions
@@ -711,69 +773,86 @@ def _estimate_monthly_runs(cron: str, *, reference: datetime = _CADENCE_ANCHOR)
     return count / cycle_days * AVERAGE_MONTH_DAYS
 
 
+# Aggregate readers below read ``session_usage_hourly`` (core_203), the
+# trigger-maintained hourly rollup of ``sessions`` keyed by (UTC hour,
+# trigger_source, model). It is updated in the writing transaction, so it is
+# never stale; only a range edge that is not hour-aligned touches raw rows.
+_USAGE_SUM_COLUMNS = """
+            COALESCE(SUM(sessions), 0)::bigint AS sessions,
+            COALESCE(SUM(input_tokens), 0)::bigint AS input_tokens,
+            COALESCE(SUM(output_tokens), 0)::bigint AS output_tokens,
+            COALESCE(SUM(cached_input_tokens), 0)::bigint AS cached_input_tokens,
+            COALESCE(SUM(cache_creation_tokens), 0)::bigint AS cache_creation_tokens"""
+
+
+def _token_buckets(row: asyncpg.Record) -> dict[str, int]:
+    return {
+        "input_tokens": int(row["input_tokens"]),
+        "output_tokens": int(row["output_tokens"]),
+        "cached_input_tokens": int(row["cached_input_tokens"]),
+        "cache_creation_tokens": int(row["cache_creation_tokens"]),
+    }
+
+
+def _next_hour_boundary(ts: datetime) -> datetime:
+    """Return *ts* when it is on a UTC hour boundary, else the next boundary."""
+    floor = ts.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    return floor if floor == ts else floor + timedelta(hours=1)
+
+
 async def sessions_summary(pool: asyncpg.Pool, period: str = "today") -> dict[str, Any]:
     """Return aggregate session/token stats grouped by model for a period."""
     if period not in _SUMMARY_PERIODS:
         raise ValueError(f"Invalid period {period!r}; must be one of {sorted(_SUMMARY_PERIODS)}")
 
     since = _period_start(period)
-    totals = await pool.fetchrow(
-        """
-        SELECT
-            COUNT(*)::bigint AS total_sessions,
-            COALESCE(SUM(input_tokens), 0)::bigint AS total_input_tokens,
-            COALESCE(SUM(output_tokens), 0)::bigint AS total_output_tokens,
-            COALESCE(SUM(cached_input_tokens), 0)::bigint AS total_cached_input_tokens,
-            COALESCE(SUM(cache_creation_tokens), 0)::bigint AS total_cache_creation_tokens
-        FROM sessions
-        WHERE started_at >= $1
-        """,
-        since,
-    )
-
-    by_model_rows = await pool.fetch(
-        """
-        SELECT
-            model,
-            COALESCE(SUM(input_tokens), 0)::bigint AS input_tokens,
-            COALESCE(SUM(output_tokens), 0)::bigint AS output_tokens,
-            COALESCE(SUM(cached_input_tokens), 0)::bigint AS cached_input_tokens,
-            COALESCE(SUM(cache_creation_tokens), 0)::bigint AS cache_creation_tokens
-        FROM sessions
-        WHERE started_at >= $1 AND model IS NOT NULL AND model <> ''
-        GROUP BY model
-        ORDER BY model
+    # Whole hours come from the rollup; the sub-hour head of a rolling
+    # "7d"/"30d" window is read from raw sessions so the totals stay exact.
+    rollup_from = _next_hour_boundary(since)
+    rows = await pool.fetch(
+        f"""
+        WITH usage AS (
+            SELECT model, sessions, input_tokens, output_tokens,
+                   cached_input_tokens, cache_creation_tokens
+            FROM session_usage_hourly
+            WHERE bucket_start >= $2
+            UNION ALL
+            SELECT COALESCE(model, ''), 1, COALESCE(input_tokens, 0),
+                   COALESCE(output_tokens, 0), COALESCE(cached_input_tokens, 0),
+                   COALESCE(cache_creation_tokens, 0)
+            FROM sessions
+            WHERE started_at >= $1 AND started_at < $2
+        )
+        SELECT model, GROUPING(model) = 1 AS is_total,{_USAGE_SUM_COLUMNS}
+        FROM usage
+        GROUP BY GROUPING SETS ((), (model))
+        ORDER BY is_total DESC, model
         """,
         since,
+        rollup_from,
     )
 
+    totals: dict[str, int] = {
+        "sessions": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cached_input_tokens": 0,
+        "cache_creation_tokens": 0,
+    }
     by_model: dict[str, dict[str, int]] = {}
-    for row in by_model_rows:
-        by_model[str(row["model"])] = {
-            "input_tokens": int(row["input_tokens"]),
-            "output_tokens": int(row["output_tokens"]),
-            "cached_input_tokens": int(row["cached_input_tokens"]),
-            "cache_creation_tokens": int(row["cache_creation_tokens"]),
-        }
-
-    if totals is None:
-        return {
-            "period": period,
-            "total_sessions": 0,
-            "total_input_tokens": 0,
-            "total_output_tokens": 0,
-            "total_cached_input_tokens": 0,
-            "total_cache_creation_tokens": 0,
-            "by_model": by_model,
-        }
+    for row in rows:
+        if row["is_total"]:
+            totals = {"sessions": int(row["sessions"]), **_token_buckets(row)}
+        elif row["model"] and row["sessions"] > 0:
+            by_model[str(row["model"])] = _token_buckets(row)
 
     return {
         "period": period,
-        "total_sessions": int(totals["total_sessions"]),
-        "total_input_tokens": int(totals["total_input_tokens"]),
-        "total_output_tokens": int(totals["total_output_tokens"]),
-        "total_cached_input_tokens": int(totals["total_cached_input_tokens"]),
-        "total_cache_creation_tokens": int(totals["total_cache_creation_tokens"]),
+        "total_sessions": totals["sessions"],
+        "total_input_tokens": totals["input_tokens"],
+        "total_output_tokens": totals["output_tokens"],
+        "total_cached_input_tokens": totals["cached_input_tokens"],
+        "total_cache_creation_tokens": totals["cache_creation_tokens"],
         "by_model": by_model,
     }
 
@@ -792,69 +871,38 @@ async def sessions_daily(
     start_at = datetime.combine(from_day, datetime.min.time(), tzinfo=UTC)
     end_exclusive = datetime.combine(to_day + timedelta(days=1), datetime.min.time(), tzinfo=UTC)
 
-    daily_rows = await pool.fetch(
-        """
-        SELECT
-            (started_at AT TIME ZONE 'UTC')::date AS day,
-            COUNT(*)::bigint AS sessions,
-            COALESCE(SUM(input_tokens), 0)::bigint AS input_tokens,
-            COALESCE(SUM(output_tokens), 0)::bigint AS output_tokens,
-            COALESCE(SUM(cached_input_tokens), 0)::bigint AS cached_input_tokens,
-            COALESCE(SUM(cache_creation_tokens), 0)::bigint AS cache_creation_tokens
-        FROM sessions
-        WHERE started_at >= $1 AND started_at < $2
-        GROUP BY day
-        ORDER BY day
-        """,
-        start_at,
-        end_exclusive,
-    )
-
-    by_model_rows = await pool.fetch(
-        """
+    # UTC days are whole rollup buckets, so one grouping-sets scan of the
+    # rollup yields both the day totals and the per-model split.
+    rows = await pool.fetch(
+        f"""
         SELECT
-            (started_at AT TIME ZONE 'UTC')::date AS day,
+            (bucket_start AT TIME ZONE 'UTC')::date AS day,
             model,
-            COALESCE(SUM(input_tokens), 0)::bigint AS input_tokens,
-            COALESCE(SUM(output_tokens), 0)::bigint AS output_tokens,
-            COALESCE(SUM(cached_input_tokens), 0)::bigint AS cached_input_tokens,
-            COALESCE(SUM(cache_creation_tokens), 0)::bigint AS cache_creation_tokens
-        FROM sessions
-        WHERE started_at >= $1
-          AND started_at < $2
-          AND model IS NOT NULL
-          AND model <> ''
-        GROUP BY day, model
-        ORDER BY day, model
+            GROUPING(model) = 1 AS is_day_total,{_USAGE_SUM_COLUMNS}
+        FROM session_usage_hourly
+        WHERE bucket_start >= $1 AND bucket_start < $2
+        GROUP BY GROUPING SETS ((day), (day, model))
+        HAVING SUM(sessions) > 0
+        ORDER BY day, is_day_total DESC, model
         """,
         start_at,
         end_exclusive,
     )
 
-    by_day_model: dict[str, dict[str, dict[str, int]]] = {}
-    for row in by_model_rows:
-        day_key = row["day"].isoformat()
-        by_day_model.setdefault(day_key, {})[str(row["model"])] = {
-            "input_tokens": int(row["input_tokens"]),
-            "output_tokens": int(row["output_tokens"]),
-            "cached_input_tokens": int(row["cached_input_tokens"]),
-            "cache_creation_tokens": int(row["cache_creation_tokens"]),
-        }
-
     days: list[dict[str, Any]] = []
-    for row in daily_rows:
+    for row in rows:
         day_key = row["day"].isoformat()
-        days.append(
-            {
-                "date": day_key,
-                "sessions": int(row["sessions"]),
-                "input_tokens": int(row["input_tokens"]),
-                "output_tokens": int(row["output_tokens"]),
-                "cached_input_tokens": int(row["cached_input_tokens"]),
-                "cache_creation_tokens": int(row["cache_creation_tokens"]),
-                "by_model": by_day_model.get(day_key, {}),
-            }
-        )
+        if row["is_day_total"]:
+            days.append(
+                {
+                    "date": day_key,
+                    "sessions": int(row["sessions"]),
+                    **_token_buckets(row),
+                    "by_model": {},
+                }
+            )
+        elif row["model"]:
+            days[-1]["by_model"][str(row["model"])] = _token_buckets(row)
 
     return {"days": days}
 
@@ -885,8 +933,8 @@ async def top_sessions(
             started_at
         FROM sessions
         WHERE completed_at IS NOT NULL
-          AND ($2::timestamptz IS NULL OR started_at >= $2)
-          AND ($3::timestamptz IS NULL OR started_at < $3)
+          AND started_at >= COALESCE($2::timestamptz, '-infinity')
+          AND started_at < COALESCE($3::timestamptz, 'infinity')
         ORDER BY (COALESCE(input_tokens, 0) + COALESCE(output_tokens, 0)) DESC, started_at DESC
         LIMIT $1
         """,
@@ -931,24 +979,38 @@ async def schedule_costs(
     a constant and does not vary by schedule.
     """
     start_at, end_exclusive = _resolve_optional_range(from_date, to_date)
+    # Runs come from the session_usage_hourly rollup via its indexed
+    # schedule_name column; every range here is UTC-day aligned. A NULL and an
+    # empty session model share the rollup's '' bucket (both render as "").
     rows = await pool.fetch(
         """
         SELECT
             st.name,
             st.cron,
-            s.model,
-            COUNT(s.id)::bigint AS total_runs,
-            COALESCE(SUM(s.input_tokens), 0)::bigint AS total_input_tokens,
-            COALESCE(SUM(s.output_tokens), 0)::bigint AS total_output_tokens,
-            COALESCE(SUM(s.cached_input_tokens), 0)::bigint AS total_cached_input_tokens,
-            COALESCE(SUM(s.cache_creation_tokens), 0)::bigint AS total_cache_creation_tokens
+            u.model,
+            COALESCE(u.total_runs, 0)::bigint AS total_runs,
+            COALESCE(u.total_input_tokens, 0)::bigint AS total_input_tokens,
+            COALESCE(u.total_output_tokens, 0)::bigint AS total_output_tokens,
+            COALESCE(u.total_cached_input_tokens, 0)::bigint AS total_cached_input_tokens,
+            COALESCE(u.total_cache_creation_tokens, 0)::bigint AS total_cache_creation_tokens
         FROM scheduled_tasks AS st
-        LEFT JOIN sessions AS s
-            ON s.trigger_source = ('schedule:' || st.name)
-            AND ($1::timestamptz IS NULL OR s.started_at >= $1)
-            AND ($2::timestamptz IS NULL OR s.started_at < $2)
-        GROUP BY st.name, st.cron, s.model
-        ORDER BY st.name, s.model
+        LEFT JOIN (
+            SELECT
+                schedule_name,
+                model,
+                SUM(sessions) AS total_runs,
+                SUM(input_tokens) AS total_input_tokens,
+                SUM(output_tokens) AS total_output_tokens,
+                SUM(cached_input_tokens) AS total_cached_input_tokens,
+                SUM(cache_creation_tokens) AS total_cache_creation_tokens
+            FROM session_usage_hourly
+            WHERE schedule_name IS NOT NULL
+              AND bucket_start >= COALESCE($1::timestamptz, '-infinity')
+              AND bucket_start < COALESCE($2::timestamptz, 'infinity')
+            GROUP BY schedule_name, model
+            HAVING SUM(sessions) > 0
+        ) AS u ON u.schedule_name = st.name
+        ORDER BY st.name, u.model
         """,
         start_at,
         end_exclusive,
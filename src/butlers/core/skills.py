@@ -60,6 +60,7 @@ def _resolve_includes(
     roster_dir: Path,
     base_dir: Path | None = None,
     _seen: set[Path] | None = None,
+    sources: list[Path] | None = None,
 ) -> str:
     """Replace supported include directives with file contents.
 
@@ -69,6 +70,9 @@ def _resolve_includes(
     ``AGENTS.md``. HTML includes remain non-recursive for backward
     compatibility; bare includes recurse with cycle protection so existing
     ``CLAUDE.md -> AGENTS.md -> ../shared/AGENTS.md`` chains expand fully.
+
+    Every include target consulted (found or not) is appended to *sources*
+    when given, so callers can tell when the expansion would change.
     """
     roster_root = roster_dir.resolve()
     bare_base_dir = (base_dir or roster_dir).resolve()
@@ -84,6 +88,8 @@ def _resolve_includes(
                 out.append(line)
                 continue
             target = roster_dir / rel_path
+            if sources is not None:
+                sources.append(target)
             if not target.is_file():
                 logger.warning("Include file not found, preserving directive: %s", target)
                 out.append(line)
@@ -107,6 +113,8 @@ def _resolve_includes(
             logger.warning("Bare include cycle detected, skipping: %s", target)
             out.append(line)
             continue
+        if sources is not None:
+            sources.append(target)
         if not target.is_file():
             logger.warning("Include file not found, preserving directive: %s", target)
             out.append(line)
@@ -117,14 +125,19 @@ def _resolve_includes(
             roster_dir,
             base_dir=target.parent,
             _seen={*seen, target},
+            sources=sources,
         )
         out.append(included)
     return "\n".join(out)
 
 
-def _append_shared_markdown(content: str, roster_dir: Path, filename: str) -> str:
+def _append_shared_markdown(
+    content: str, roster_dir: Path, filename: str, sources: list[Path] | None = None
+) -> str:
     """Append ``shared/<filename>`` contents if the file exists and is non-empty."""
     shared_file = roster_dir / "shared" / filename
+    if sources is not None:
+        sources.append(shared_file)
     if not shared_file.is_file():
         return content
 
@@ -135,18 +148,20 @@ def _append_shared_markdown(content: str, roster_dir: Path, filename: str) -> st
     return content + "\n\n" + shared_content
 
 
-def _append_shared_files(content: str, roster_dir: Path) -> str:
+def _append_shared_files(content: str, roster_dir: Path, sources: list[Path] | None = None) -> str:
     """Append shared prompt snippets after include resolution.
 
     Order is intentional and stable:
     1. ``BUTLER_SKILLS.md``
     2. ``MCP_LOGGING.md``
     """
-    content = _append_shared_markdown(content, roster_dir, "BUTLER_SKILLS.md")
-    return _append_shared_markdown(content, roster_dir, "MCP_LOGGING.md")
+    content = _append_shared_markdown(content, roster_dir, "BUTLER_SKILLS.md", sources)
+    return _append_shared_markdown(content, roster_dir, "MCP_LOGGING.md", sources)
 
 
-def process_system_prompt_base(base_content: str, config_dir: Path) -> str:
+def process_system_prompt_base(
+    base_content: str, config_dir: Path, sources: list[Path] | None = None
+) -> str:
     """Resolve includes and append shared snippets for a raw base prompt.
 
     *base_content* is the raw system-prompt body (either the on-disk
@@ -157,16 +172,19 @@ def process_system_prompt_base(base_content: str, config_dir: Path) -> str:
 
     This keeps the include/shared-file processing identical regardless of
     whether the base prompt comes from disk or the database.
+
+    Files consulted are appended to *sources* when given.
     """
     roster_dir = config_dir.parent
-    content = _resolve_includes(base_content, roster_dir, base_dir=config_dir)
-    return _append_shared_files(content, roster_dir)
+    content = _resolve_includes(base_content, roster_dir, base_dir=config_dir, sources=sources)
+    return _append_shared_files(content, roster_dir, sources)
 
 
 def read_system_prompt(
     config_dir: Path,
     butler_name: str,
     db_override: str | None = None,
+    sources: list[Path] | None = None,
 ) -> str:
     """Resolve the system prompt for a butler.
 
@@ -182,17 +200,22 @@ def read_system_prompt(
     In cases 1 and 2 the base content is passed through
     :func:`process_system_prompt_base` so ``@include`` directives and shared
     snippets (``BUTLER_SKILLS.md``, ``MCP_LOGGING.md``) are applied uniformly.
+
+    When *sources* is given, every file consulted (including missing ones whose
+    creation would change the result) is appended to it.
     """
     if db_override is not None:
         base = db_override.strip()
         if base:
-            return process_system_prompt_base(base, config_dir)
+            return process_system_prompt_base(base, config_dir, sources)
 
     claude_md = config_dir / "CLAUDE.md"
+    if sources is not None:
+        sources.append(claude_md)
     if claude_md.is_file():
         content = claude_md.read_text(encoding="utf-8").strip()
         if content:
-            return process_system_prompt_base(content, config_dir)
+            return process_system_prompt_base(content, config_dir, sources)
     default = _DEFAULT_PROMPT_TEMPLATE.format(butler_name=butler_name)
     logger.debug("CLAUDE.md missing or empty in %s — using default prompt", config_dir)
     return default
@@ -86,7 +86,7 @@ from butlers.core.runtimes.base import RuntimeAdapter, validated_session_timeout
 from butlers.core.runtimes.codex import MCPToolDiscoveryError
 from butlers.core.session_process_logs import write as session_process_log_write
 from butlers.core.sessions import session_complete, session_create
-from butlers.core.skills import read_system_prompt
+from butlers.core.spawner_artifacts import SystemPromptArtifacts
 
 # ---------------------------------------------------------------------------
 # Seam imports — functions extracted to focused sub-modules.
@@ -141,6 +141,7 @@ from butlers.core.tool_call_capture import (
 )
 from butlers.core.utils import generate_uuid7_string
 from butlers.credential_store import CredentialStore
+from butlers.db_profiler import annotate_span, profiled
 from butlers.routing_guidance import _INTERACTIVE_ROUTE_CHANNELS
 
 logger = logging.getLogger(__name__)
@@ -487,6 +488,8 @@ class Spawner:
         self._dashboard_cancel_settled_events: dict[str, asyncio.Event] = {}
         self._metrics = ButlerMetrics(butler_name=config.name)
         self._metrics.ensure_registered()
+        # Expanded system prompts, reused until a roster source file changes.
+        self._prompt_artifacts = SystemPromptArtifacts()
         self._mcp_warmup_lock = asyncio.Lock()
         self._warmed_mcp_urls: set[str] = set()
         # Self-healing module reference — wired by the daemon after module startup.
@@ -1198,6 +1201,7 @@ class Spawner:
 
         asyncio.create_task(_prewarm())
 
+    @profiled("spawner.run")
     async def _run(
         self,
         prompt: str,
@@ -1884,9 +1888,9 @@ class Spawner:
             prompt_override = await fetch_system_prompt_override(
                 shared_pool or self._pool, self._config.name
             )
-            system_prompt = read_system_prompt(
+            system_prompt = self._prompt_artifacts.get(
                 self._config_dir, self._config.name, db_override=prompt_override
-            )
+            ).prompt
 
             # Fetch situational context preamble (fail-open)
             context_preamble_ctx = await fetch_situational_context_preamble(
@@ -2031,6 +2035,10 @@ class Spawner:
                 # entry this iteration invoked, not the whole failover chain —
                 # necessary for per-model evidence (bu-ep4ks.13).
                 _attempt_t0 = time.monotonic()
+                if _attempt_count == 1:
+                    self._metrics.record_spawn_setup_duration(
+                        int((_attempt_t0 - t0) * 1000), trigger_source=trigger_source
+                    )
 
                 # Build per-attempt invoke kwargs using current (possibly updated) model.
                 invoke_kwargs: dict[str, Any] = {
@@ -3302,6 +3310,7 @@ class Spawner:
             # Clear session context before ending span so tool handlers
             # arriving after this point don't attach to a finished span.
             clear_active_session_context()
+            annotate_span(span)
             # End span and detach context
             span.end()
             trace.context_api.detach(token)
@@ -0,0 +1,133 @@
+"""Spawner — reusable per-butler spawn artifacts.
+
+Every spawn used to rebuild the system prompt from disk: read ``CLAUDE.md``,
+expand its ``@include`` chain and append the shared snippets.  Those inputs
+only change when someone edits the roster, so :class:`SystemPromptArtifacts`
+materialises the expanded prompt once per ``(config dir, butler, DB override)``
+and reuses it until one of the files it was built from changes.
+
+Invalidation is by file signature ``(st_ino, st_mtime_ns, st_size)``: every
+lookup re-stats the recorded sources (a handful of ``stat`` calls instead of
+reads and include expansion) and rebuilds on any difference, including a
+previously missing include appearing.  File timestamps are coarse, so a
+prompt built from a file modified within the last :data:`_RACY_WINDOW_NS`
+(including one edited while it was being read) is served once but not
+trusted, and is rebuilt on next use.
+
+Not cached here, deliberately:
+
+- the per-spawn MCP config — its URL carries the runtime session id, so no two
+  spawns share one;
+- the credential env — :class:`butlers.credential_cache.CredentialCache`
+  already memoises ``CredentialStore.resolve`` with NOTIFY invalidation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from butlers.core.skills import read_system_prompt
+
+logger = logging.getLogger(__name__)
+
+#: ``(st_ino, st_mtime_ns, st_size)``, or ``None`` for a missing file.
+_Signature = tuple[int, int, int] | None
+
+_DEFAULT_MAXSIZE = 64
+
+#: Sources modified this recently may be rewritten within the same mtime tick.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class SystemPromptArtifact(NamedTuple):
+    """An expanded system prompt and what it was built from."""
+
+    prompt: str
+    digest: str
+    sources: tuple[tuple[Path, _Signature], ...]
+    settled: bool
+
+
+def _signature(path: Path) -> _Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _is_current(artifact: SystemPromptArtifact) -> bool:
+    return artifact.settled and all(_signature(path) == sig for path, sig in artifact.sources)
+
+
+class SystemPromptArtifacts:
+    """Cache of expanded system prompts, invalidated by source-file signatures."""
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: dict[tuple[str, str, str], SystemPromptArtifact] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, config_dir: Path, butler_name: str, db_override: str | None = None
+    ) -> SystemPromptArtifact:
+        """Return the current expanded prompt, rebuilding it if any source changed."""
+        override_digest = hashlib.sha256((db_override or "").encode()).hexdigest()
+        key = (str(config_dir), butler_name, override_digest)
+        with self._lock:
+            artifact = self._entries.get(key)
+        if artifact is not None and _is_current(artifact):
+            self.hits += 1
+            return artifact
+        self.misses += 1
+        artifact = self._build(config_dir, butler_name, db_override)
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self._maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = artifact
+        return artifact
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def _build(config_dir: Path, butler_name: str, db_override: str | None) -> SystemPromptArtifact:
+        started_ns = time.time_ns()
+        consulted: list[Path] = []
+        prompt = read_system_prompt(
+            config_dir, butler_name, db_override=db_override, sources=consulted
+        )
+        # Stat after reading: an edit during the read leaves a recent mtime,
+        # which marks the artifact unsettled instead of caching torn content.
+        signatures = tuple((path, _signature(path)) for path in dict.fromkeys(consulted))
+        settled = all(
+            sig is None or sig[1] < started_ns - _RACY_WINDOW_NS for _path, sig in signatures
+        )
+        logger.debug(
+            "Built system prompt for %s from %d source(s) (settled=%s)",
+            butler_name,
+            len(signatures),
+            settled,
+        )
+        return SystemPromptArtifact(
+            prompt=prompt,
+            digest=hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+            sources=signatures,
+            settled=settled,
+        )
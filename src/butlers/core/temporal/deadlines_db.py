@@ -26,6 +26,8 @@ from typing import Any
 
 import asyncpg
 
+from butlers.core.scheduler_wheel import KIND_DEADLINE, invalidate_scheduler_wheel
+
 logger = logging.getLogger(__name__)
 
 
@@ -169,6 +171,7 @@ async def deadline_create(
     except asyncpg.UniqueViolationError:
         raise ValueError(f"Deadline name {name!r} already exists")
 
+    invalidate_scheduler_wheel(pool, KIND_DEADLINE)
     logger.info("Created deadline task: %s (%s)", name, task_id)
     return task_id
 
@@ -298,6 +301,7 @@ async def deadline_update(
     set_clauses.append("updated_at = now()")
     sql = f"UPDATE scheduled_tasks SET {', '.join(set_clauses)} WHERE id = $1"
     await pool.execute(sql, *params)
+    invalidate_scheduler_wheel(pool, KIND_DEADLINE)
     logger.info("Updated deadline task: %s", task_id)
 
 
@@ -382,6 +386,7 @@ async def deadline_delete(
             "Remove it from butler.toml instead."
         )
     await pool.execute("DELETE FROM scheduled_tasks WHERE id = $1", task_id)
+    invalidate_scheduler_wheel(pool, KIND_DEADLINE)
     logger.info("Deleted deadline task: %s", task_id)
 
 
@@ -21,6 +21,8 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import asyncpg
 
+from butlers.core.scheduler_wheel import KIND_DEFERRED, invalidate_scheduler_wheel
+
 _VALID_PRIORITIES = frozenset({"high", "medium", "low"})
 _VALID_STATUSES = frozenset({"pending", "delivered", "expired", "cancelled"})
 
@@ -237,6 +239,7 @@ async def insert_deferred_notification(
         deliver_at,
         deferred_at,
     )
+    invalidate_scheduler_wheel(pool, KIND_DEFERRED)
     return str(notif_id)
 
 
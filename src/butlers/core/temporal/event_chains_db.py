@@ -22,6 +22,7 @@ from typing import Any
 
 import asyncpg
 
+from butlers.core.scheduler_wheel import KIND_CHAIN, invalidate_scheduler_wheel
 from butlers.core.temporal.event_chains import validate_chain_actions
 
 _VALID_TRIGGER_TYPES = frozenset(
@@ -116,6 +117,7 @@ async def event_chain_create(
     except asyncpg.UniqueViolationError:
         raise ValueError(f"An event chain named {name!r} already exists for butler {butler_name!r}")
     assert row is not None
+    invalidate_scheduler_wheel(pool, KIND_CHAIN)
     return _row_to_dict(row)
 
 
@@ -228,6 +230,7 @@ async def event_chain_update(
     except asyncpg.UniqueViolationError:
         raise ValueError(f"An event chain named {name!r} already exists for butler {butler_name!r}")
     assert row is not None
+    invalidate_scheduler_wheel(pool, KIND_CHAIN)
     return _row_to_dict(row)
 
 
@@ -0,0 +1,312 @@
+"""In-process cache of recent per-thread ``message_inbox`` history.
+
+Every routed real-time message loads its thread's recent history from
+``message_inbox`` (``modules.pipeline._load_realtime_history``).  Chatty
+threads route a message every few seconds, so the same rows are read over and
+over.  :class:`ThreadHistoryCache` keeps a bounded LRU of recent messages per
+thread so that, once warm, a thread's history is served without a DB read.
+
+Coverage invariant
+------------------
+An entry is only ever *created* by :meth:`ThreadHistoryCache.record`, which
+the ingest paths call after committing a ``message_inbox`` row.  From then on
+every row written by this process for the thread is appended, so an entry
+knows every message at or after its ``covered_since`` instant.  A DB load
+(:meth:`ThreadHistoryCache.store`) for ``received_at >= covered_since``
+extends that coverage backwards; a load with no live entry is not cached,
+because rows written before the entry existed (including the message being
+routed) would be missing.
+
+:meth:`ThreadHistoryCache.lookup` answers only when the entry covers the whole
+requested window — the last ``max_time_window_minutes`` *and* the last
+``max_message_count`` messages before ``received_at`` — and otherwise returns
+``None`` so the caller falls back to the DB.  Entries expire ``ttl_s`` after
+creation so rows written by other processes (manual inserts, another replica)
+are picked up on the next load.
+
+Keys mirror the SQL filter in ``_load_realtime_history``: Telegram channels
+group message-scoped thread ids (``<chat_id>:<message_id>``) by chat; every
+other channel matches the thread identity exactly.  Inbound rows only reach
+entries of their own channel; outbound butler replies reach every entry for
+the thread.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+TELEGRAM_HISTORY_CHANNELS = frozenset({"telegram_bot", "telegram_user_client"})
+
+_TELEGRAM_CHAT_ID_RE = re.compile(r"^-?\d+$")
+_TELEGRAM_CHAT_MESSAGE_RE = re.compile(r"^(?P<chat_id>-?\d+):(?P<message_id>\d+)$")
+# Rows matched by the chat grouping: ``<chat_id>`` or ``<chat_id>:<anything>``.
+_TELEGRAM_ROW_CHAT_RE = re.compile(r"^(?P<chat_id>-?\d+)(?::|$)")
+
+DEFAULT_MAX_THREADS = 1024
+DEFAULT_MAX_MESSAGES_PER_THREAD = 256
+DEFAULT_TTL_S = 300.0
+
+# Trim targets; match ``modules.pipeline.HistoryConfig`` defaults.
+_DEFAULT_WINDOW = timedelta(minutes=15)
+_DEFAULT_COUNT = 30
+
+_ThreadKey = tuple[str, str]  # ("chat" | "thread", identity)
+_EntryKey = tuple[str, str, str]  # (*_ThreadKey, source_channel)
+
+
+def telegram_chat_id(source_thread_identity: str) -> str | None:
+    """Return the chat id a Telegram history lookup groups by, if any.
+
+    ``<chat_id>`` and ``<chat_id>:<message_id>`` thread identities group by
+    chat; anything else is matched exactly.
+    """
+    match = _TELEGRAM_CHAT_MESSAGE_RE.fullmatch(source_thread_identity)
+    if match is not None:
+        return match.group("chat_id")
+    if _TELEGRAM_CHAT_ID_RE.fullmatch(source_thread_identity):
+        return source_thread_identity
+    return None
+
+
+def _query_key(source_thread_identity: str, source_channel: str) -> _ThreadKey:
+    if source_channel in TELEGRAM_HISTORY_CHANNELS:
+        chat_id = telegram_chat_id(source_thread_identity)
+        if chat_id is not None:
+            return ("chat", chat_id)
+    return ("thread", source_thread_identity)
+
+
+def _row_keys(source_thread_identity: str) -> list[_ThreadKey]:
+    keys: list[_ThreadKey] = [("thread", source_thread_identity)]
+    match = _TELEGRAM_ROW_CHAT_RE.match(source_thread_identity)
+    if match is not None:
+        keys.append(("chat", match.group("chat_id")))
+    return keys
+
+
+def _dedupe_key(message: dict[str, Any]) -> tuple[Any, ...]:
+    return (message["received_at"], message["sender_id"], message["raw_content"])
+
+
+@dataclass
+class _Entry:
+    covered_since: datetime | None  # None: the thread's full history is known
+    created_at: float
+    messages: list[dict[str, Any]] = field(default_factory=list)
+
+
+class ThreadHistoryCache:
+    """Bounded LRU of recent per-thread history rows.
+
+    Args:
+        max_threads: Entries kept before the least recently used is evicted.
+        max_messages_per_thread: Hard cap on rows kept per entry.
+        ttl_s: Seconds after creation an entry is discarded.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        max_messages_per_thread: int = DEFAULT_MAX_MESSAGES_PER_THREAD,
+        ttl_s: float = DEFAULT_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_threads = max(1, max_threads)
+        self._max_messages = max(_DEFAULT_COUNT, max_messages_per_thread)
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[_EntryKey, _Entry] = OrderedDict()
+        self._by_thread: dict[_ThreadKey, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        *,
+        source_thread_identity: str | None,
+        source_channel: str | None,
+        received_at: datetime,
+        raw_content: str,
+        sender_id: str | None,
+        raw_metadata: Any = None,
+        direction: str = "inbound",
+    ) -> None:
+        """Append a just-committed ``message_inbox`` row to its thread entries.
+
+        Inbound rows also create the entry their channel's history lookups
+        will use, which starts the coverage window at *received_at*.
+        """
+        if not source_thread_identity:
+            return
+        message = {
+            "raw_content": raw_content,
+            "sender_id": sender_id,
+            "received_at": received_at,
+            "raw_metadata": raw_metadata,
+            "direction": direction,
+        }
+        if direction != "outbound" and source_channel:
+            key = (*_query_key(source_thread_identity, source_channel), source_channel)
+            if self._live_entry(key) is None:
+                self._put(key, _Entry(covered_since=received_at, created_at=self._clock()))
+
+        for thread_key in _row_keys(source_thread_identity):
+            for channel in tuple(self._by_thread.get(thread_key, ())):
+                if direction != "outbound" and channel != source_channel:
+                    continue
+                entry = self._live_entry((*thread_key, channel))
+                if entry is not None:
+                    self._merge(entry, [message])
+
+    def store(
+        self,
+        source_thread_identity: str,
+        received_at: datetime,
+        messages: list[dict[str, Any]],
+        *,
+        source_channel: str,
+        max_time_window_minutes: int,
+        max_message_count: int,
+    ) -> None:
+        """Merge a DB history load for *received_at* into the thread's live entry.
+
+        *messages* must be the full result of ``_load_realtime_history`` for
+        these arguments: every row in ``[min(window start, N-th newest),
+        received_at)``.
+        """
+        key = (*_query_key(source_thread_identity, source_channel), source_channel)
+        entry = self._live_entry(key)
+        if entry is None or entry.covered_since is None or entry.covered_since > received_at:
+            return
+        if len(messages) < max_message_count:
+            loaded_since: datetime | None = None
+        else:
+            loaded_since = min(
+                received_at - timedelta(minutes=max_time_window_minutes),
+                messages[-max_message_count]["received_at"],
+            )
+        if loaded_since is None or loaded_since < entry.covered_since:
+            entry.covered_since = loaded_since
+        self._merge(entry, messages)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def lookup(
+        self,
+        source_thread_identity: str,
+        received_at: datetime,
+        *,
+        source_channel: str,
+        max_time_window_minutes: int,
+        max_message_count: int,
+    ) -> list[dict[str, Any]] | None:
+        """Return the thread's history before *received_at*, or ``None`` on a miss.
+
+        The result matches ``_load_realtime_history`` for the same arguments:
+        the union of the time and count windows, oldest first.
+        """
+        key = (*_query_key(source_thread_identity, source_channel), source_channel)
+        entry = self._live_entry(key)
+        if entry is None:
+            return None
+        time_cutoff = received_at - timedelta(minutes=max_time_window_minutes)
+        before = [m for m in entry.messages if m["received_at"] < received_at]
+        if entry.covered_since is not None and (
+            entry.covered_since > time_cutoff or len(before) < max_message_count
+        ):
+            return None
+        self._entries.move_to_end(key)
+        since = time_cutoff
+        if len(before) >= max_message_count:
+            since = min(since, before[-max_message_count]["received_at"])
+        elif entry.covered_since is None:
+            return [dict(m) for m in before]
+        return [dict(m) for m in before if m["received_at"] >= since]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _live_entry(self, key: _EntryKey) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry.created_at > self._ttl_s:
+            self._drop(key)
+            return None
+        return entry
+
+    def _put(self, key: _EntryKey, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._by_thread.setdefault(key[:2], set()).add(key[2])
+        while len(self._entries) > self._max_threads:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: _EntryKey) -> None:
+        self._entries.pop(key, None)
+        channels = self._by_thread.get(key[:2])
+        if channels is not None:
+            channels.discard(key[2])
+            if not channels:
+                del self._by_thread[key[:2]]
+
+    def _merge(self, entry: _Entry, messages: list[dict[str, Any]]) -> None:
+        seen = {_dedupe_key(m) for m in entry.messages}
+        for message in messages:
+            key = _dedupe_key(message)
+            if key not in seen:
+                seen.add(key)
+                entry.messages.append(dict(message))
+        entry.messages.sort(key=lambda m: m["received_at"])
+        self._trim(entry)
+
+    def _trim(self, entry: _Entry) -> None:
+        # Keep what a lookup just after the newest message needs: the default
+        # time window and count window, capped at max_messages_per_thread.
+        # Coverage then starts at the oldest kept row.
+        messages = entry.messages
+        if not messages:
+            return
+        window_start = messages[-1]["received_at"] - _DEFAULT_WINDOW
+        keep_from = next(
+            (i for i, m in enumerate(messages) if m["received_at"] >= window_start),
+            len(messages),
+        )
+        keep_from = min(keep_from, max(0, len(messages) - _DEFAULT_COUNT))
+        keep_from = max(keep_from, len(messages) - self._max_messages)
+        if keep_from <= 0:
+            return
+        boundary = messages[keep_from]["received_at"]
+        entry.messages = [m for m in messages if m["received_at"] >= boundary]
+        entry.covered_since = boundary
+
+
+_THREAD_HISTORY_CACHE: ThreadHistoryCache | None = None
+
+
+def get_thread_history_cache() -> ThreadHistoryCache:
+    """Return the process-level thread history cache singleton."""
+    global _THREAD_HISTORY_CACHE
+    if _THREAD_HISTORY_CACHE is None:
+        _THREAD_HISTORY_CACHE = ThreadHistoryCache()
+    return _THREAD_HISTORY_CACHE
+
+
+def reset_thread_history_cache_for_tests() -> None:
+    """Test helper to drop the process-level cache."""
+    global _THREAD_HISTORY_CACHE
+    _THREAD_HISTORY_CACHE = None
@@ -0,0 +1,211 @@
+"""Hierarchical timing wheel — an in-memory index of "what is due when".
+
+A classic hierarchical timing wheel (Varghese & Lauck): level 0 holds one
+slot per ``resolution_s`` for the next ``level_sizes[0]`` ticks, level 1 one
+slot per level-0 rotation, and so on. Items further out than the top level
+covers sit in an overflow bucket that is re-placed on each top-level
+rotation. Advancing the wheel cascades higher-level slots down as their
+boundaries are crossed and returns exactly the keys whose due time has been
+reached, so the cost of an advance is proportional to the elapsed ticks plus
+the number of due items — not to the number of items scheduled.
+
+The wheel is a pure data structure: it performs no I/O and knows nothing
+about what its keys mean. :mod:`butlers.core.scheduler_wheel` builds the
+scheduler's per-daemon due index on top of it.
+
+Not thread-safe; drive it from a single asyncio task.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable, Iterator, Sequence
+from datetime import datetime
+
+# Default layout at 1s resolution: seconds, minutes, hours, then days
+# (~1.4 years) before items fall into the overflow bucket.
+DEFAULT_LEVEL_SIZES: tuple[int, ...] = (60, 60, 24, 512)
+
+# Location markers for items outside the wheel levels.
+_READY = -1
+_OVERFLOW = -2
+
+
+class HierarchicalTimingWheel[K: Hashable]:
+    """Hierarchical timing wheel keyed by arbitrary hashable keys.
+
+    Each key has at most one due time; scheduling an existing key moves it.
+
+    Usage::
+
+        wheel = HierarchicalTimingWheel(now=datetime.now(UTC))
+        wheel.schedule("task-1", due_at)
+        for key in wheel.advance(datetime.now(UTC)):
+            ...  # key is due
+    """
+
+    def __init__(
+        self,
+        *,
+        now: datetime,
+        resolution_s: float = 1.0,
+        level_sizes: Sequence[int] = DEFAULT_LEVEL_SIZES,
+    ) -> None:
+        """Create an empty wheel positioned at *now*.
+
+        Args:
+            now: Current time (timezone-aware).  The wheel never fires an item
+                before its due time; items due at or before the current
+                position are returned by the next :meth:`advance`.
+            resolution_s: Width of one level-0 slot in seconds.  Items fire
+                up to one resolution late, never early.
+            level_sizes: Slots per level, lowest level first.
+        """
+        if resolution_s <= 0:
+            raise ValueError(f"resolution_s must be positive, got {resolution_s}")
+        if not level_sizes or any(size < 2 for size in level_sizes):
+            raise ValueError(f"level_sizes must be non-empty and >= 2, got {level_sizes!r}")
+
+        self._resolution = resolution_s
+        self._sizes = tuple(level_sizes)
+        # _spans[i] = number of ticks covered by levels 0..i
+        self._spans = [math.prod(self._sizes[: i + 1]) for i in range(len(self._sizes))]
+        self._levels: list[list[dict[K, int]]] = [[{} for _ in range(n)] for n in self._sizes]
+        self._ready: dict[K, int] = {}
+        self._overflow: dict[K, int] = {}
+        self._location: dict[K, tuple[int, int]] = {}
+        self._current = self._floor_tick(now)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._location)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._location
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._location))
+
+    def due_tick(self, key: K) -> int | None:
+        """Return the scheduled tick of *key*, or ``None`` when absent."""
+        loc = self._location.get(key)
+        if loc is None:
+            return None
+        return self._bucket(loc)[key]
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def schedule(self, key: K, due_at: datetime) -> None:
+        """Schedule (or move) *key* to fire once *due_at* is reached."""
+        self.cancel(key)
+        self._insert(key, self._ceil_tick(due_at))
+
+    def cancel(self, key: K) -> bool:
+        """Remove *key*; return ``True`` when it was scheduled."""
+        loc = self._location.pop(key, None)
+        if loc is None:
+            return False
+        del self._bucket(loc)[key]
+        return True
+
+    def clear(self) -> None:
+        """Remove every scheduled key."""
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+        self._ready.clear()
+        self._overflow.clear()
+        self._location.clear()
+
+    def advance(self, now: datetime) -> list[K]:
+        """Move the wheel to *now* and return the keys that became due.
+
+        Returned keys are removed from the wheel and ordered by due time.
+        """
+        target = self._floor_tick(now)
+        if target > self._current:
+            if target - self._current > self._spans[min(1, len(self._spans) - 1)]:
+                # Long gap (e.g. host suspend): re-placing everything is O(n)
+                # and cheaper than stepping through every elapsed tick.
+                self._rebuild(target)
+            else:
+                while self._current < target:
+                    self._step()
+
+        if not self._ready:
+            return []
+        due = sorted(self._ready.items(), key=lambda item: item[1])
+        for key, _ in due:
+            del self._location[key]
+        self._ready.clear()
+        return [key for key, _ in due]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _floor_tick(self, when: datetime) -> int:
+        return math.floor(when.timestamp() / self._resolution)
+
+    def _ceil_tick(self, when: datetime) -> int:
+        return math.ceil(when.timestamp() / self._resolution)
+
+    def _bucket(self, loc: tuple[int, int]) -> dict[K, int]:
+        level, slot = loc
+        if level == _READY:
+            return self._ready
+        if level == _OVERFLOW:
+            return self._overflow
+        return self._levels[level][slot]
+
+    def _insert(self, key: K, due: int) -> None:
+        delta = due - self._current
+        if delta <= 0:
+            loc = (_READY, 0)
+        else:
+            for level, span in enumerate(self._spans):
+                if delta < span:
+                    unit = 1 if level == 0 else self._spans[level - 1]
+                    loc = (level, (due // unit) % self._sizes[level])
+                    break
+            else:
+                loc = (_OVERFLOW, 0)
+        self._bucket(loc)[key] = due
+        self._location[key] = loc
+
+    def _step(self) -> None:
+        """Advance one tick: cascade crossed boundaries top-down, then drain level 0."""
+        self._current += 1
+        current = self._current
+
+        if current % self._spans[-1] == 0 and self._overflow:
+            self._reinsert(self._overflow)
+
+        for level in range(len(self._sizes) - 1, 0, -1):
+            unit = self._spans[level - 1]
+            if current % unit == 0:
+                slot = self._levels[level][(current // unit) % self._sizes[level]]
+                if slot:
+                    self._reinsert(slot)
+
+        slot = self._levels[0][current % self._sizes[0]]
+        if slot:
+            self._reinsert(slot)
+
+    def _reinsert(self, bucket: dict[K, int]) -> None:
+        items = list(bucket.items())
+        bucket.clear()
+        for key, due in items:
+            self._insert(key, due)
+
+    def _rebuild(self, target: int) -> None:
+        items = [(key, self._bucket(loc)[key]) for key, loc in self._location.items()]
+        self.clear()
+        self._current = target
+        for key, due in items:
+            self._insert(key, due)
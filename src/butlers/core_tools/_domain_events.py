@@ -46,35 +46,62 @@ function in-process for every subscriber -- unlike
 ``_dispatch_receive_via_switchboard``'s existing self-delivery branch (keyed
 on the *event's publisher* being Switchboard), the sweep re-drives deliveries
 published by every butler, so it cannot rely on that identity check.
+
+Coalesced fan-out (core_207): ``publish_domain_events`` records a producer's
+burst with one multi-row insert and ``fan_out_events`` dispatches it --
+per event to ordinary subscribers, in chunks of up to ``batch_max_events``
+through one ``receive_domain_events`` call to subscribers that opted in.
+``DomainEventCoalescer`` is the streaming front end: it buffers single
+publishes for no longer than the shortest ``batch_max_latency_ms`` its
+subscribers declared and flushes them as one burst.  A batch member that
+fails -- the whole dispatch, or just its own entry in the subscriber's
+per-event results -- is dead-lettered as a retryable ``failed`` delivery
+tagged with its ``batch_id``, and the reconciliation sweep retries it
+individually through ``receive_domain_event``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
 from datetime import timedelta
 from typing import Annotated, Any
 
 from pydantic import Field
 
 from butlers.config import ButlerType
-from butlers.core.domain_event_wake import handle_receive_domain_event
+from butlers.core.domain_event_wake import (
+    MAX_BATCH_EVENTS,
+    handle_receive_domain_event,
+    handle_receive_domain_events,
+)
 from butlers.core.domain_events import (
+    claim_deliveries,
     claim_delivery,
     get_active_subscribers,
+    get_active_subscriptions,
     get_delivery_status,
     is_valid_event_type,
     list_subscriptions,
+    mark_deliveries_delivered,
+    mark_deliveries_failed,
     mark_delivery_conflict,
     mark_delivery_delivered,
     mark_delivery_failed,
     record_event,
+    record_events,
     remove_subscription,
     select_retryable_failed_deliveries,
     select_stale_pending_deliveries,
     upsert_subscription,
 )
-from butlers.core.metrics import record_domain_event_delivery_failed_permanent
+from butlers.core.metrics import (
+    record_domain_event_batch,
+    record_domain_event_delivery_failed_permanent,
+)
 from butlers.core.telemetry import tool_span
 from butlers.core_tools._base import ToolContext
 from butlers.core_tools._switchboard_route_dispatch import dispatch_via_switchboard_route
@@ -104,6 +131,14 @@ _MAX_DELIVERY_RETRY_ATTEMPTS = 5
 _SWEEP_BATCH_LIMIT = 200
 _RECONCILIATION_SWEEP_LOCK_KEY = "public.domain_event_deliveries:reconciliation_sweep"
 
+# DomainEventCoalescer defaults: how long a producer may hold a publish when
+# no subscriber declared a shorter window, and how large a burst it buffers
+# before flushing regardless.  Subscription batch settings are re-read at
+# most this often per event type.
+_COALESCE_MAX_LATENCY_S = 1.0
+_COALESCE_MAX_EVENTS = 500
+_COALESCE_SUBSCRIPTION_TTL_S = 30.0
+
 # route() preserves the old ``{"error": "<ExceptionType>: <message>"}``
 # envelope and current Switchboard versions add a literal boolean ``retryable``
 # classification while they still have the concrete exception hierarchy. Older
@@ -127,6 +162,7 @@ async def _dispatch_receive_via_switchboard(
     *,
     target_butler: str,
     args: dict[str, Any],
+    tool_name: str = "receive_domain_event",
 ) -> tuple[dict[str, Any] | None, str | None, bool]:
     """Dispatch one ``receive_domain_event`` call through Switchboard ``route()``.
 
@@ -141,14 +177,15 @@ async def _dispatch_receive_via_switchboard(
 
     Returns ``(data, error_text, retryable)``. ``error_text`` is ``None`` on
     a successful dispatch, and ``data`` is the *unwrapped* target-tool
-    payload in that case.
+    payload in that case.  The coalesced fan-out passes
+    ``tool_name="receive_domain_events"``.
     """
     return await dispatch_via_switchboard_route(
         client,
         pool,
         butler_name,
         target_butler=target_butler,
-        tool_name="receive_domain_event",
+        tool_name=tool_name,
         args=args,
         classify=_unwrap_route_result,
         route_purpose="fan-out dispatch",
@@ -461,6 +498,242 @@ async def fan_out_event(
     return {"event_id": event_id, "deliveries": outcomes}
 
 
+async def _dispatch_and_record_batch(
+    pool: Any,
+    switchboard_client: Any,
+    *,
+    subscriber_butler: str,
+    source_butler: str,
+    events: Sequence[Mapping[str, Any]],
+    max_attempts: int = _MAX_DELIVERY_RETRY_ATTEMPTS,
+) -> list[dict[str, Any]]:
+    """Claim, dispatch and settle one coalesced batch for one subscriber.
+
+    The batch form of :func:`_dispatch_and_record_delivery`: one
+    ``claim_deliveries`` statement, one ``receive_domain_events`` route
+    call, and one settle statement per outcome kind.  Members whose claim
+    is already terminal are reported without being re-sent.
+
+    A failed member is dead-lettered, not given up on: it is recorded as a
+    *retryable* ``failed`` delivery even when the route error itself is
+    classified permanent, because the batch transport is not the event's
+    last chance -- the reconciliation sweep retries it individually through
+    ``receive_domain_event``, whose own failures decide ``failed_permanent``.
+
+    Returns one outcome per event, in input order, shaped like
+    :func:`fan_out_event`'s deliveries plus ``event_id``; never raises past
+    the claim.
+    """
+    event_ids = [str(event["event_id"]) for event in events]
+    claimed = await claim_deliveries(
+        pool, event_ids=event_ids, subscriber_butler=subscriber_butler, batch_id=uuid.uuid4()
+    )
+    outcomes: dict[str, dict[str, Any]] = {}
+    pending: list[Mapping[str, Any]] = []
+    for event in events:
+        delivery = claimed[str(event["event_id"])]
+        if delivery["status"] in {"delivered", "failed_permanent"}:
+            outcomes[str(event["event_id"])] = {"status": delivery["status"]}
+        else:
+            pending.append(event)
+    if not pending:
+        return _ordered_batch_outcomes(event_ids, outcomes, subscriber_butler)
+
+    data, route_error, _retryable = await _dispatch_receive_via_switchboard(
+        switchboard_client,
+        pool,
+        source_butler,
+        target_butler=subscriber_butler,
+        args={
+            "events": [
+                {
+                    "event_id": str(event["event_id"]),
+                    "event_type": event["event_type"],
+                    "source_butler": source_butler,
+                    "payload": event.get("payload") or {},
+                }
+                for event in pending
+            ]
+        },
+        tool_name="receive_domain_events",
+    )
+
+    settlements: list[tuple[Any, str, str]] = []
+    failures: list[tuple[Any, str, bool]] = []
+    conflicts: list[str] = []
+    results = {
+        str(result.get("event_id")): result
+        for result in ((data or {}).get("results") or [])
+        if isinstance(result, dict)
+    }
+    for event in pending:
+        event_id = str(event["event_id"])
+        delivery_id = claimed[event_id]["id"]
+        result = results.get(event_id)
+        if route_error is not None:
+            failures.append((delivery_id, route_error, True))
+        elif result is None:
+            failures.append(
+                (delivery_id, "receive_domain_events returned no result for this event", True)
+            )
+        elif result.get("state") == "task_conflict":
+            conflicts.append(event_id)
+        elif result.get("status") == "ok" and result.get("task_id") and result.get("task_name"):
+            settlements.append((delivery_id, result["task_id"], result["task_name"]))
+        else:
+            error_text = str(result.get("error") or f"incomplete batch result: {result!r}")
+            failures.append((delivery_id, error_text, True))
+
+    if settlements:
+        delivered: dict[str, str | None] = {}
+        try:
+            delivered = await mark_deliveries_delivered(pool, settlements)
+        except Exception:
+            logger.warning(
+                "fan_out_events: failed to record %d batched deliveries for subscriber_butler=%s",
+                len(settlements),
+                subscriber_butler,
+                exc_info=True,
+            )
+        by_delivery = {str(claimed[event_id]["id"]): event_id for event_id in event_ids}
+        for delivery_id, _, _ in settlements:
+            status = delivered.get(str(delivery_id))
+            outcomes[by_delivery[str(delivery_id)]] = {"status": status or "failed"}
+
+    if failures:
+        failed: dict[str, str] = {}
+        try:
+            failed = await mark_deliveries_failed(pool, failures, max_attempts=max_attempts)
+        except Exception:
+            logger.warning(
+                "fan_out_events: failed to record %d dead-lettered batch members for "
+                "subscriber_butler=%s",
+                len(failures),
+                subscriber_butler,
+                exc_info=True,
+            )
+        by_delivery = {str(claimed[event_id]["id"]): event_id for event_id in event_ids}
+        for delivery_id, error_text, _ in failures:
+            status = failed.get(str(delivery_id))
+            if status == "failed_permanent":
+                _record_failed_permanent_delivery_metric(
+                    source_butler=source_butler,
+                    destination_butler=subscriber_butler,
+                    retryable=True,
+                )
+            outcome: dict[str, Any] = {"status": status or "failed", "error": error_text}
+            if status == "failed":
+                outcome["retryable"] = True
+            outcomes[by_delivery[str(delivery_id)]] = outcome
+
+    for event_id in conflicts:
+        resulting_status: str | None = None
+        try:
+            resulting_status = await mark_delivery_conflict(pool, claimed[event_id]["id"])
+        except Exception:
+            logger.warning(
+                "fan_out_events: failed to record delivery conflict for event_id=%s "
+                "subscriber_butler=%s",
+                event_id,
+                subscriber_butler,
+                exc_info=True,
+            )
+        outcomes[event_id] = {"status": resulting_status or "failed"}
+
+    try:
+        record_domain_event_batch(
+            source_butler=source_butler,
+            destination_butler=subscriber_butler,
+            size=len(pending),
+            dead_lettered=len(failures),
+        )
+    except Exception:
+        logger.warning("domain-event batch metric emission failed", exc_info=True)
+    if failures:
+        logger.info(
+            "fan_out_events: dead-lettered %d of %d batched events for subscriber_butler=%s",
+            len(failures),
+            len(pending),
+            subscriber_butler,
+        )
+    return _ordered_batch_outcomes(event_ids, outcomes, subscriber_butler)
+
+
+def _ordered_batch_outcomes(
+    event_ids: list[str],
+    outcomes: dict[str, dict[str, Any]],
+    subscriber_butler: str,
+) -> list[dict[str, Any]]:
+    return [
+        {"event_id": event_id, "subscriber_butler": subscriber_butler, **outcomes[event_id]}
+        for event_id in event_ids
+    ]
+
+
+async def fan_out_events(
+    pool: Any,
+    switchboard_client: Any,
+    *,
+    source_butler: str,
+    events: Sequence[Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Dispatch a recorded burst of events to every active subscriber.
+
+    *events* carry ``event_id``, ``event_type`` and ``payload``.  One
+    subscription read covers the whole burst.  A per-event subscriber gets
+    exactly what :func:`fan_out_event` would send it; a subscriber that
+    opted into batching gets its events of that type in chunks of at most
+    ``batch_max_events`` (and at most ``MAX_BATCH_EVENTS``) through
+    :func:`_dispatch_and_record_batch`.  As with :func:`fan_out_event`, the
+    publisher is never its own target and a dispatch failure is recorded,
+    never raised.
+
+    Returns ``{"deliveries": [...]}`` -- one entry per (event, subscriber)
+    pair, each carrying ``event_id``.
+    """
+    if not events:
+        return {"deliveries": []}
+    subscriptions = await get_active_subscriptions(pool, [event["event_type"] for event in events])
+    outcomes: list[dict[str, Any]] = []
+    for subscription in subscriptions:
+        subscriber_butler = subscription["subscriber_butler"]
+        if subscriber_butler == source_butler:
+            continue
+        matching = [event for event in events if event["event_type"] == subscription["event_type"]]
+        batch_size = subscription.get("batch_max_events")
+        if batch_size:
+            batch_size = min(batch_size, MAX_BATCH_EVENTS)
+            for start in range(0, len(matching), batch_size):
+                outcomes.extend(
+                    await _dispatch_and_record_batch(
+                        pool,
+                        switchboard_client,
+                        subscriber_butler=subscriber_butler,
+                        source_butler=source_butler,
+                        events=matching[start : start + batch_size],
+                    )
+                )
+            continue
+        for event in matching:
+            event_id = str(event["event_id"])
+            delivery = await claim_delivery(
+                pool, event_id=event_id, subscriber_butler=subscriber_butler
+            )
+            outcome = await _dispatch_and_record_delivery(
+                pool,
+                switchboard_client,
+                delivery=delivery,
+                subscriber_butler=subscriber_butler,
+                event_id=event_id,
+                event_type=event["event_type"],
+                source_butler=source_butler,
+                payload=event.get("payload") or {},
+            )
+            outcome.pop("_newly_permanently_failed", None)
+            outcomes.append({"event_id": event_id, **outcome})
+    return {"deliveries": outcomes}
+
+
 class _SwitchboardInProcessRouteClient:
     """Adapter so the sweep can reuse ``_dispatch_receive_via_switchboard``'s
     normal client-driven branch, unmodified, while running in-process.
@@ -727,6 +1000,190 @@ async def publish_domain_event(
     return {"status": "ok", "event_id": event_id, "deliveries": fanout["deliveries"]}
 
 
+async def publish_domain_events(
+    pool: Any,
+    switchboard_client: Any,
+    *,
+    source_butler: str,
+    events: Sequence[Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Record a burst of events in one insert and fan it out, coalescing where allowed.
+
+    The bulk counterpart of :func:`publish_domain_event` for producers that
+    already hold a burst (an import, a sync pass).  *events* carry
+    ``event_type`` and an optional ``payload``.  Every event type is
+    validated before anything is recorded, so the burst is published whole
+    or not at all.
+
+    Returns ``{"status": "ok", "event_ids": [...], "deliveries": [...]}``.
+    """
+    for event in events:
+        if not is_valid_event_type(event["event_type"]):
+            return _invalid_event_type_error(event["event_type"])
+    recorded = await _record_burst(pool, source_butler=source_butler, events=events)
+    return await _fan_out_burst(pool, switchboard_client, source_butler, recorded)
+
+
+async def _record_burst(
+    pool: Any, *, source_butler: str, events: Sequence[Mapping[str, Any]]
+) -> list[dict[str, Any]]:
+    """Record *events* with one insert; return them in ``fan_out_events`` shape."""
+    event_ids = await record_events(
+        pool,
+        [
+            {
+                "event_type": event["event_type"],
+                "source_butler": source_butler,
+                "payload": event.get("payload"),
+            }
+            for event in events
+        ],
+    )
+    return [
+        {"event_id": event_id, "event_type": event["event_type"], "payload": event.get("payload")}
+        for event_id, event in zip(event_ids, events, strict=True)
+    ]
+
+
+async def _fan_out_burst(
+    pool: Any, switchboard_client: Any, source_butler: str, recorded: list[dict[str, Any]]
+) -> dict[str, Any]:
+    fanout = await fan_out_events(
+        pool, switchboard_client, source_butler=source_butler, events=recorded
+    )
+    return {
+        "status": "ok",
+        "event_ids": [event["event_id"] for event in recorded],
+        "deliveries": fanout["deliveries"],
+    }
+
+
+class DomainEventCoalescer:
+    """Buffer one producer's publishes and flush them as coalesced bursts.
+
+    ``await coalescer.publish(event_type, payload)`` returns once the event
+    is buffered.  The buffer is flushed through :func:`publish_domain_events`
+    when it reaches *max_events*, or when the oldest buffered event has
+    waited as long as its subscribers allow: the shortest
+    ``batch_max_latency_ms`` declared by a batching subscriber of that type,
+    capped at *max_latency_s*.  An event type with a per-event subscriber
+    has no window at all -- that subscriber never agreed to wait -- so its
+    publishes flush immediately (still sharing the insert with anything
+    already buffered).
+
+    Buffered events are not durable until flushed.  Producers that must not
+    lose a publish on crash use :func:`publish_domain_event`, or ``await
+    flush()`` before acknowledging their own work; ``async with`` flushes on
+    exit.  A timer-driven flush that fails keeps its events buffered for
+    the next flush.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        switchboard_client: Any,
+        *,
+        source_butler: str,
+        max_latency_s: float = _COALESCE_MAX_LATENCY_S,
+        max_events: int = _COALESCE_MAX_EVENTS,
+    ) -> None:
+        self._pool = pool
+        self._switchboard_client = switchboard_client
+        self._source_butler = source_butler
+        self._max_latency_s = max_latency_s
+        self._max_events = max_events
+        self._buffer: list[dict[str, Any]] = []
+        self._deadline: float | None = None
+        self._timer: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        self._windows: dict[str, tuple[float, float]] = {}
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    async def __aenter__(self) -> DomainEventCoalescer:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.aclose()
+
+    async def _window_for(self, event_type: str) -> float:
+        now = time.monotonic()
+        cached = self._windows.get(event_type)
+        if cached is not None and now - cached[0] < _COALESCE_SUBSCRIPTION_TTL_S:
+            return cached[1]
+        window = self._max_latency_s
+        for subscription in await get_active_subscriptions(self._pool, [event_type]):
+            if subscription["subscriber_butler"] == self._source_butler:
+                continue
+            latency_ms = subscription.get("batch_max_latency_ms")
+            if not subscription.get("batch_max_events") or latency_ms is None:
+                window = 0.0
+                break
+            window = min(window, latency_ms / 1000)
+        self._windows[event_type] = (now, window)
+        return window
+
+    async def publish(self, event_type: str, payload: dict[str, Any] | None = None) -> None:
+        """Buffer one event; flush now if the buffer is full or the event cannot wait."""
+        if not is_valid_event_type(event_type):
+            raise ValueError(_invalid_event_type_error(event_type)["error"])
+        window = await self._window_for(event_type)
+        self._buffer.append({"event_type": event_type, "payload": payload})
+        if window <= 0 or len(self._buffer) >= self._max_events:
+            await self.flush()
+            return
+        deadline = time.monotonic() + window
+        if self._deadline is None or deadline < self._deadline:
+            self._deadline = deadline
+            self._arm_timer(window)
+
+    def _arm_timer(self, delay_s: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.create_task(self._flush_after(delay_s))
+
+    async def _flush_after(self, delay_s: float) -> None:
+        await asyncio.sleep(delay_s)
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception(
+                "DomainEventCoalescer: timed flush of %d events for source_butler=%s failed; "
+                "they stay buffered for the next flush",
+                len(self._buffer),
+                self._source_butler,
+            )
+
+    async def flush(self) -> dict[str, Any] | None:
+        """Publish everything buffered as one burst; ``None`` if the buffer was empty."""
+        async with self._flush_lock:
+            if self._timer is not None and self._timer is not asyncio.current_task():
+                self._timer.cancel()
+            self._timer = None
+            self._deadline = None
+            events, self._buffer = self._buffer, []
+            if not events:
+                return None
+            try:
+                recorded = await _record_burst(
+                    self._pool, source_butler=self._source_butler, events=events
+                )
+            except BaseException:
+                # Nothing was recorded: keep the burst for the next flush.
+                self._buffer[:0] = events
+                raise
+            return await _fan_out_burst(
+                self._pool, self._switchboard_client, self._source_butler, recorded
+            )
+
+    async def aclose(self) -> None:
+        """Flush what is buffered and stop the latency timer."""
+        await self.flush()
+
+
 async def _claim_and_record_event(
     pool: Any,
     *,
@@ -847,7 +1304,7 @@ async def publish_domain_event_once(
 
 
 def register_domain_event_tools(ctx: ToolContext, mcp: Any, _core_tool: Callable) -> None:
-    """Register domain-event-bus tools: publish/subscribe/unsubscribe/list/receive.
+    """Register domain-event-bus tools: publish/subscribe/unsubscribe/list/receive(+batch).
 
     Registered for every non-STAFFER butler (same gate as ``delegate_*``)
     since any domain butler may publish a standing event, subscribe to
@@ -905,12 +1362,37 @@ def register_domain_event_tools(ctx: ToolContext, mcp: Any, _core_tool: Callable
             str,
             Field(description="Namespaced event type to subscribe to, e.g. 'travel.trip_booked'."),
         ],
+        batch_max_events: Annotated[
+            int | None,
+            Field(
+                ge=2,
+                le=1000,
+                description=(
+                    "Opt into coalesced delivery: receive up to this many events of this type "
+                    "in one wake. Requires batch_max_latency_ms. Omit for one wake per event."
+                ),
+            ),
+        ] = None,
+        batch_max_latency_ms: Annotated[
+            int | None,
+            Field(
+                ge=0,
+                le=60000,
+                description=(
+                    "How long a publisher may hold an event to coalesce it with others. "
+                    "Requires batch_max_events."
+                ),
+            ),
+        ] = None,
     ) -> dict:
         """Stand up (or reactivate) a durable subscription to another butler's event type.
 
         Every future ``publish_event`` call for this ``event_type`` wakes
         this butler via a one-shot scheduled task (see
         ``receive_domain_event``) until you call ``unsubscribe_from_event``.
+        With ``batch_max_events``/``batch_max_latency_ms`` set, bursts of
+        this event type arrive coalesced through ``receive_domain_events``;
+        subscribing again without them switches back to one wake per event.
         """
         if not is_valid_event_type(event_type):
             return {
@@ -920,7 +1402,18 @@ def register_domain_event_tools(ctx: ToolContext, mcp: Any, _core_tool: Callable
                     "(lowercase, e.g. 'travel.trip_booked')."
                 ),
             }
-        row = await upsert_subscription(pool, subscriber_butler=butler_name, event_type=event_type)
+        if (batch_max_events is None) != (batch_max_latency_ms is None):
+            return {
+                "status": "error",
+                "error": "batch_max_events and batch_max_latency_ms must be set together.",
+            }
+        row = await upsert_subscription(
+            pool,
+            subscriber_butler=butler_name,
+            event_type=event_type,
+            batch_max_events=batch_max_events,
+            batch_max_latency_ms=batch_max_latency_ms,
+        )
         return {"status": "ok", "subscription": row}
 
     @_core_tool("domain_events")
@@ -972,3 +1465,28 @@ def register_domain_event_tools(ctx: ToolContext, mcp: Any, _core_tool: Callable
             payload=payload,
             subscriber_butler=butler_name,
         )
+
+    @_core_tool("domain_events")
+    @tool_span("receive_domain_events", butler_name=butler_name)
+    async def receive_domain_events(
+        events: Annotated[
+            list[dict[str, Any]],
+            Field(
+                description=(
+                    "Coalesced events, each with event_id, event_type, source_butler and payload."
+                )
+            ),
+        ],
+    ) -> dict:
+        """Receive a coalesced batch of fanned-out domain events via the Switchboard.
+
+        The batched form of ``receive_domain_event`` for subscriptions that
+        opted into coalesced delivery: schedules ONE one-shot task that
+        hands the next spawned session every event's fenced payload.
+        Returns a per-event result list so the publisher can dead-letter
+        only the events this batch could not carry. Never call this
+        directly.
+        """
+        return await handle_receive_domain_events(
+            pool, events=events, subscriber_butler=butler_name
+        )
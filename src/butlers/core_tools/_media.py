@@ -25,6 +25,7 @@ def register_media_tools(ctx: ToolContext, mcp: Any, _core_tool: Callable) -> No
         """Retrieve a media attachment for analysis.
 
         Returns base64-encoded blob data suitable for Claude vision/PDF input.
+        Large images are served downscaled and PDFs may be served as text.
 
         Parameters
         ----------
@@ -35,9 +36,11 @@ def register_media_tools(ctx: ToolContext, mcp: Any, _core_tool: Callable) -> No
         -------
         dict
             - storage_ref: The storage reference
-            - media_type: Inferred MIME type
-            - data_base64: Base64-encoded blob data
-            - size_bytes: Size of the blob in bytes
+            - media_type: MIME type of the served payload
+            - data_base64: Base64-encoded payload (absent for text variants)
+            - text: Extracted text (text variants only)
+            - size_bytes: Size of the served payload in bytes
+            - variant: "original" or the name of the derived variant
         """
         try:
             return await _get_attachment(daemon.blob_store, storage_ref)
@@ -0,0 +1,275 @@
+"""Process-local cache for :meth:`butlers.credential_store.CredentialStore.resolve`.
+
+``resolve()`` walks every credential layer (the local ``butler_secrets``
+table, then each fallback pool) on every call, and connectors and modules
+call it per request — token lookups on every outbound API call.  The values
+almost never change, so :class:`CredentialCache` memoises each layer's
+answer, *including* "not stored here", keyed by ``(layer pool, key)``.
+
+Freshness:
+
+- every write path in ``CredentialStore`` (``store``, ``store_shared``, the
+  compare-and-set writers and ``delete``) drops the key from this process's
+  cache and, in the same statement, sends a NOTIFY on
+  :data:`CREDENTIALS_CHANGED_CHANNEL` carrying the key and the new row
+  version (``updated_at`` in microseconds; ``null`` for a delete);
+- :func:`run_credential_cache_listener` applies those notifications in
+  processes that run it (daemons and the dashboard API), subscribed to the
+  process :mod:`butlers.notification_hub`; an entry already holding the
+  notified version survives;
+- a short TTL (``BUTLERS_CREDENTIAL_CACHE_TTL_S``, default 30 s, ``0``
+  disables caching) bounds staleness for processes without a listener —
+  the connectors — and for writes made outside ``CredentialStore``.
+
+Values live only in this process's memory.  Nothing here logs or exports a
+value: :meth:`CredentialCache.stats` and the lookup counter report counts
+and layer names only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+import asyncpg
+
+from butlers.core.metrics import record_credential_cache_lookup
+from butlers.notification_hub import (
+    Notification,
+    NotificationGap,
+    NotificationHub,
+    acquire_notification_hub,
+    consume_channel,
+    release_notification_hub,
+)
+
+logger = logging.getLogger(__name__)
+
+#: NOTIFY channel the ``CredentialStore`` write paths publish on.
+CREDENTIALS_CHANGED_CHANNEL = "butlers_credentials_changed"
+
+_ENV_TTL = "BUTLERS_CREDENTIAL_CACHE_TTL_S"
+_DEFAULT_TTL_S = 30.0
+_DEFAULT_MAXSIZE = 1024
+
+#: Reconnect timings of a private hub (``connect=`` injection, tests only).
+_RECONNECT_BACKOFF_S = 5.0
+_HEALTH_POLL_INTERVAL_S = 5.0
+
+
+def credential_cache_ttl_from_env() -> float:
+    """Return the configured cache TTL in seconds (``0`` disables the cache)."""
+    raw = os.environ.get(_ENV_TTL, "").strip()
+    if not raw:
+        return _DEFAULT_TTL_S
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; using %.0fs", _ENV_TTL, raw, _DEFAULT_TTL_S)
+        return _DEFAULT_TTL_S
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    value: str | None
+    version: int | None
+
+
+class CredentialCache:
+    """LRU + TTL cache of per-layer credential lookups.
+
+    Keys are ``(pool, secret_key)``: the pool object identifies the layer's
+    ``butler_secrets`` table, and holding it in the key means a closed pool's
+    identity can never be reused for another database while its entries
+    live.  ``generation`` increments on every invalidation so a lookup that
+    raced a write cannot re-insert the value the write replaced.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float | None = None,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_s = credential_cache_ttl_from_env() if ttl_s is None else ttl_s
+        self._maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[tuple[Any, str], _Entry] = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"CredentialCache(size={len(self._entries)}, ttl_s={self.ttl_s})"
+
+    def lookup(self, pool: Any, key: str, *, layer: str = "local") -> tuple[bool, str | None]:
+        """Return ``(found, value)``; ``(True, None)`` is a cached "not stored"."""
+        if self.ttl_s <= 0:
+            return False, None
+        entry = self._entries.get((pool, key))
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                del self._entries[(pool, key)]
+            self.misses += 1
+            record_credential_cache_lookup(layer=layer, outcome="miss")
+            return False, None
+        self._entries.move_to_end((pool, key))
+        if entry.value is None:
+            self.negative_hits += 1
+            record_credential_cache_lookup(layer=layer, outcome="negative_hit")
+        else:
+            self.hits += 1
+            record_credential_cache_lookup(layer=layer, outcome="hit")
+        return True, entry.value
+
+    def store(
+        self,
+        pool: Any,
+        key: str,
+        value: str | None,
+        *,
+        version: int | None,
+        generation: int,
+    ) -> None:
+        """Cache one layer's answer unless an invalidation ran since *generation*."""
+        if self.ttl_s <= 0 or generation != self.generation:
+            return
+        self._entries[(pool, key)] = _Entry(self._clock() + self.ttl_s, value, version)
+        self._entries.move_to_end((pool, key))
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str, *, keep_version: int | None = None) -> int:
+        """Drop every layer's entry for *key*, except those at *keep_version*."""
+        stale = [
+            cache_key
+            for cache_key, entry in self._entries.items()
+            if cache_key[1] == key and (keep_version is None or entry.version != keep_version)
+        ]
+        for cache_key in stale:
+            del self._entries[cache_key]
+        self.generation += 1
+        self.invalidations += 1
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def apply_notification(self, payload: str) -> None:
+        """Apply one :data:`CREDENTIALS_CHANGED_CHANNEL` payload."""
+        try:
+            message = json.loads(payload)
+            key = message["key"]
+            version = message.get("version")
+            if not isinstance(key, str) or not (version is None or isinstance(version, int)):
+                raise TypeError("unexpected payload shape")
+        except (TypeError, ValueError, KeyError, AttributeError):
+            logger.warning(
+                "credential_cache: malformed NOTIFY payload on %r; clearing cache",
+                CREDENTIALS_CHANGED_CHANNEL,
+            )
+            self.clear()
+            return
+        self.invalidate(key, keep_version=version)
+
+    def stats(self) -> dict[str, int]:
+        """Counters only — never keys or values."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+_CACHE = CredentialCache()
+
+
+def credential_cache() -> CredentialCache:
+    """Return the process-wide credential cache."""
+    return _CACHE
+
+
+async def run_credential_cache_listener(
+    connect: Callable[[], Awaitable[asyncpg.Connection]] | None = None,
+    *,
+    hub: NotificationHub | None = None,
+    cache: CredentialCache | None = None,
+    reconnect_backoff_s: float = _RECONNECT_BACKOFF_S,
+    health_poll_interval_s: float = _HEALTH_POLL_INTERVAL_S,
+) -> None:
+    """Background task: apply credential-change NOTIFYs to *cache*.
+
+    Subscribes to the process notification hub (or *hub*; ``connect`` runs
+    a private one, see :func:`butlers.notification_hub.consume_channel`).
+    The cache is cleared on every missed-notification gap — including the
+    first connect — because writes made while nobody listened were never
+    heard.
+    """
+    target = cache if cache is not None else _CACHE
+
+    def _handle(item: Notification | NotificationGap) -> None:
+        if isinstance(item, NotificationGap):
+            target.clear()
+        else:
+            target.apply_notification(item.payload)
+
+    await consume_channel(
+        CREDENTIALS_CHANGED_CHANNEL,
+        _handle,
+        hub=hub,
+        connect=connect,
+        reconnect_backoff_s=reconnect_backoff_s,
+        health_poll_interval_s=health_poll_interval_s,
+    )
+
+
+_listener_task: asyncio.Task | None = None
+_listener_refs = 0
+
+
+def acquire_credential_cache_listener(fallback_db_name: str = "butlers") -> None:
+    """Start the process listener if needed and take a reference on it.
+
+    The listener subscribes to the process notification hub, whose
+    connection is shared with every other LISTEN consumer in the process.
+    Pair with :func:`release_credential_cache_listener`.
+    """
+    global _listener_task, _listener_refs
+    _listener_refs += 1
+    acquire_notification_hub(fallback_db_name)
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(
+            run_credential_cache_listener(),
+            name="credential-cache-listener",
+        )
+
+
+async def release_credential_cache_listener() -> None:
+    """Drop a reference; the last release stops the listener."""
+    global _listener_task, _listener_refs
+    if not _listener_refs:
+        return
+    _listener_refs -= 1
+    if not _listener_refs and _listener_task is not None:
+        task, _listener_task = _listener_task, None
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await release_notification_hub()
@@ -54,12 +54,42 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from butlers.credential_cache import CREDENTIALS_CHANGED_CHANNEL, credential_cache
+
 if TYPE_CHECKING:
     import asyncpg
 
 logger = logging.getLogger(__name__)
 
 _TABLE = "butler_secrets"
+
+# Write statements wrap their INSERT/UPDATE/DELETE in a ``written`` CTE that
+# returns ``secret_key`` and ``updated_at`` and end with this SELECT, so the
+# cache-invalidation NOTIFY rides the same round trip and commits with the
+# write.  The payload carries the key and the new row version only — never
+# the value.  Status strings become ``SELECT <n>``; callers only read ``<n>``.
+_NOTIFY_WRITTEN_SQL = f"""
+SELECT pg_notify(
+    '{CREDENTIALS_CHANGED_CHANNEL}',
+    json_build_object(
+        'key', secret_key,
+        'version', (extract(epoch FROM updated_at) * 1000000)::bigint
+    )::text
+)
+FROM written
+"""
+
+# Row version as cached alongside each resolved value; same encoding as the
+# NOTIFY payload above.
+_VERSION_COLUMN_SQL = "(extract(epoch FROM updated_at) * 1000000)::bigint AS version"
+
+_DELETE_SQL = f"""
+WITH written AS (
+    DELETE FROM {_TABLE} WHERE secret_key = $1
+    RETURNING secret_key, NULL::timestamptz AS updated_at
+)
+{_NOTIFY_WRITTEN_SQL}
+"""
 _CODEX_CLI_AUTH_KEY = "cli-auth/codex"
 _CODEX_CLI_AUTH_CATEGORY = "cli-auth"
 _CODEX_CLI_AUTH_DESCRIPTION = "CLI auth token for Codex (OpenAI)"
@@ -519,6 +549,7 @@ class CredentialStore:
         async with pool.acquire() as conn:
             await conn.execute(
                 f"""
+                WITH written AS (
                 INSERT INTO {_TABLE}
                     (secret_key, secret_value, category, description,
                      is_sensitive, expires_at)
@@ -542,6 +573,9 @@ class CredentialStore:
                         WHEN {_TABLE}.secret_value IS DISTINCT FROM EXCLUDED.secret_value
                         THEN NULL ELSE {_TABLE}.last_test_message END,
                     updated_at   = now()
+                RETURNING secret_key, updated_at
+                )
+                {_NOTIFY_WRITTEN_SQL}
                 """,
                 key,
                 value,
@@ -550,6 +584,7 @@ class CredentialStore:
                 is_sensitive,
                 expires_at,
             )
+        credential_cache().invalidate(key)
 
     async def store_shared(
         self,
@@ -582,6 +617,7 @@ class CredentialStore:
         async with pool.acquire() as conn:
             await conn.execute(
                 f"""
+                WITH written AS (
                 INSERT INTO {_TABLE}
                     (secret_key, secret_value, category, description,
                      is_sensitive)
@@ -604,6 +640,9 @@ class CredentialStore:
                         WHEN {_TABLE}.secret_value IS DISTINCT FROM EXCLUDED.secret_value
                         THEN NULL ELSE {_TABLE}.last_test_message END,
                     updated_at   = now()
+                RETURNING secret_key, updated_at
+                )
+                {_NOTIFY_WRITTEN_SQL}
                 """,
                 key,
                 value,
@@ -611,6 +650,7 @@ class CredentialStore:
                 description,
                 is_sensitive,
             )
+        credential_cache().invalidate(key)
         logger.info(
             "Secret stored (shared): key=%r category=%r is_sensitive=%r",
             key,
@@ -664,10 +704,8 @@ class CredentialStore:
         """Delete ``cli-auth/codex`` only from the selected system-global authority."""
         pool = self.require_system_global_pool()
         async with pool.acquire() as conn:
-            status = await conn.execute(
-                f"DELETE FROM {_TABLE} WHERE secret_key = $1",
-                _CODEX_CLI_AUTH_KEY,
-            )
+            status = await conn.execute(_DELETE_SQL, _CODEX_CLI_AUTH_KEY)
+        credential_cache().invalidate(_CODEX_CLI_AUTH_KEY)
         deleted = status.endswith(" 1")
         logger.info("System-global Codex CLI auth deleted: deleted=%r", deleted)
         return deleted
@@ -695,10 +733,14 @@ class CredentialStore:
             if expected_value is None:
                 status = await conn.execute(
                     f"""
+                    WITH written AS (
                     INSERT INTO {_TABLE}
                         (secret_key, secret_value, category, description, is_sensitive)
                     VALUES ($1, $2, $3, $4, $5)
                     ON CONFLICT (secret_key) DO NOTHING
+                    RETURNING secret_key, updated_at
+                    )
+                    {_NOTIFY_WRITTEN_SQL}
                     """,
                     key,
                     value,
@@ -709,6 +751,7 @@ class CredentialStore:
             else:
                 status = await conn.execute(
                     f"""
+                    WITH written AS (
                     UPDATE {_TABLE}
                     SET secret_value = $2,
                         category = $3,
@@ -729,6 +772,9 @@ class CredentialStore:
                         updated_at = now()
                     WHERE secret_key = $1
                       AND secret_value = $6
+                    RETURNING secret_key, updated_at
+                    )
+                    {_NOTIFY_WRITTEN_SQL}
                     """,
                     key,
                     value,
@@ -739,6 +785,8 @@ class CredentialStore:
                 )
 
         stored = status.endswith(" 1")
+        if stored:
+            credential_cache().invalidate(key)
         return stored
 
     async def record_test_result(
@@ -946,9 +994,13 @@ class CredentialStore:
         -------
         str | None
             The resolved value, or ``None`` if not found in any source.
+
+        Each layer's answer (including "not stored here") is served from the
+        process-local :mod:`butlers.credential_cache` while fresh; see that
+        module for invalidation.  ``load()`` always reads the database.
         """
         # 1. Try local/fallback databases
-        value = await self.load(key)
+        value = await self._load_cached(key)
         if value is not None:
             return value
 
@@ -961,6 +1013,24 @@ class CredentialStore:
 
         return None
 
+    async def _load_cached(self, key: str) -> str | None:
+        """``load()`` through the credential cache, layer by layer."""
+        cache = credential_cache()
+        for source_name, pool in self._iter_lookup_pools():
+            found, value = cache.lookup(pool, key, layer=source_name)
+            if not found:
+                generation = cache.generation
+                row = await _safe_fetch_secret_row(
+                    pool, key, source_name=source_name, with_version=True
+                )
+                value = None if row is None else row["secret_value"]
+                version = None if row is None else _row_version(row)
+                cache.store(pool, key, value, version=version, generation=generation)
+            if value is not None:
+                logger.debug("Loaded secret %r from %s credential store", key, source_name)
+                return value
+        return None
+
     async def has(self, key: str) -> bool:
         """Return ``True`` if the key exists in the database.
 
@@ -997,11 +1067,9 @@ class CredentialStore:
             exist.
         """
         async with self.pool.acquire() as conn:
-            result = await conn.execute(
-                f"DELETE FROM {_TABLE} WHERE secret_key = $1",
-                key,
-            )
-        # asyncpg returns a string like "DELETE 1" or "DELETE 0"
+            result = await conn.execute(_DELETE_SQL, key)
+        credential_cache().invalidate(key)
+        # asyncpg returns a status string like "SELECT 1" or "SELECT 0"
         deleted = result.split()[-1] != "0" if result else False
         if deleted:
             logger.info("Secret deleted: key=%r", key)
@@ -1432,12 +1500,18 @@ async def _safe_fetch_secret_row(
     key: str,
     *,
     source_name: str,
+    with_version: bool = False,
 ) -> Any:
-    """Return ``secret_value`` row for *key* or ``None`` if not found."""
+    """Return ``secret_value`` row for *key* or ``None`` if not found.
+
+    ``with_version`` adds the ``version`` column the credential cache tags
+    entries with.
+    """
+    columns = f"secret_value, {_VERSION_COLUMN_SQL}" if with_version else "secret_value"
     try:
         async with _acquire_conn(pool) as conn:
             return await conn.fetchrow(
-                f"SELECT secret_value FROM {_TABLE} WHERE secret_key = $1",
+                f"SELECT {columns} FROM {_TABLE} WHERE secret_key = $1",
                 key,
             )
     except Exception as exc:
@@ -1452,6 +1526,15 @@ async def _safe_fetch_secret_row(
         raise
 
 
+def _row_version(row: Any) -> int | None:
+    """Return a fetched row's cache version, or ``None`` when it has none."""
+    try:
+        version = row["version"]
+    except (KeyError, IndexError):
+        return None
+    return version if isinstance(version, int) else None
+
+
 def _is_missing_table_error(exc: Exception) -> bool:
     """Return whether an exception indicates missing ``butler_secrets`` table."""
     if exc.__class__.__name__ == "UndefinedTableError":
@@ -157,6 +157,7 @@ UNIVERSAL_CORE_TOOL_NAMES: frozenset[str] = frozenset(
         "unsubscribe_from_event",
         "list_my_subscriptions",
         "receive_domain_event",
+        "receive_domain_events",
     }
 )
 
@@ -305,6 +306,7 @@ class ButlerDaemon:
         self._scheduler_loop_task: asyncio.Task | None = None
         self._route_inbox_recovery_task: asyncio.Task | None = None
         self._liveness_reporter_task: asyncio.Task | None = None
+        self._cache_listeners_acquired = False
         self.switchboard_client: MCPClient | None = None
         self._pipeline: MessagePipeline | None = None
         self._buffer: Any = None  # DurableBuffer instance (switchboard only)
@@ -748,6 +750,8 @@ class ButlerDaemon:
                 # on shutdown when the audit DB and main DB share the same connection).
                 return own_pool
             audit_db.set_schema(audit_db_schema)
+            # Draw on this butler's shared-pool slots, not the switchboard's.
+            audit_db.owner_butler = self.config.name
             audit_db.min_pool_size = 1
             audit_db.max_pool_size = 2
             await audit_db.connect()
@@ -1110,6 +1114,11 @@ class ButlerDaemon:
             completion_hooks=completion_hooks,
             get_eligibility_pool=lambda: daemon._audit_pool,
             default_timezone=default_timezone,
+            timing_wheel_resync_s=(
+                self.config.scheduler.timing_wheel_resync_seconds
+                if self.config.scheduler.timing_wheel
+                else None
+            ),
         )
 
     def _resolve_memory_module(self) -> Any | None:
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, unquote, urlparse
 
 import asyncpg
 
+from butlers import json_codec
+
+if TYPE_CHECKING:
+    from butlers.db_shared_pool import SharedPoolSettings
+    from butlers.db_statements import StatementSchema
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,18 +143,21 @@ def _jsonb_encoder(value: object) -> bytes:
     """Encode a Python object to the JSONB binary wire format.
 
     asyncpg's binary JSONB format requires a leading ``\\x01`` version byte
-    followed by the UTF-8-encoded JSON string.
+    followed by the UTF-8-encoded JSON string (see :mod:`butlers.json_codec`).
+    ``jsonb`` has no NaN/Infinity, so non-finite floats raise here on either
+    backend instead of being stored as ``null``.
     """
-    return b"\x01" + json.dumps(value).encode()
+    return b"\x01" + json_codec.dumps_bytes(value, allow_nan=False)
 
 
 def _jsonb_decoder(data: bytes) -> object:
     """Decode the JSONB binary wire format to a Python object.
 
     asyncpg delivers a ``bytes`` value whose first byte is the JSONB format
-    version (``\\x01``).  Strip it before passing to ``json.loads``.
+    version (``\\x01``).  Skip it through a memoryview so the payload is not
+    copied before parsing.
     """
-    return json.loads(data[1:])
+    return json_codec.loads(memoryview(data)[1:])
 
 
 async def register_jsonb_codec(conn: asyncpg.Connection) -> None:
@@ -394,6 +402,8 @@ class Database:
             self.strict_role_enforcement = strict_role_enforcement
         self.pool: asyncpg.Pool | None = None
         self._role_verified: bool = False
+        # Probed by the first new connection, reused by the rest of the pool.
+        self._statement_schema: StatementSchema | None = None
 
     @property
     def role_enforcement_disabled(self) -> bool:
@@ -447,9 +457,19 @@ class Database:
         The init callback runs once when a physical connection is established,
         making it the right place for per-connection type codec registration.
         Unlike setup (which runs on every pool acquire), init only fires when
-        the underlying TCP connection is created.
+        the underlying TCP connection is created.  It also pre-prepares the
+        registered hot-path statements (see :mod:`butlers.db_statements`).
         """
+        from butlers.db_statements import prepare_registered_statements, probe_statement_schema
+
         await register_jsonb_codec(conn)
+        if self._statement_schema is None:
+            self._statement_schema = await probe_statement_schema(conn)
+        await prepare_registered_statements(conn, self._statement_schema)
+
+    def invalidate_statement_schema(self) -> None:
+        """Re-probe the schema on the next new connection (call after migrating)."""
+        self._statement_schema = None
 
     async def provision(self) -> None:
         """Create the database if it doesn't exist.
@@ -505,6 +525,9 @@ class Database:
 
     async def connect(self) -> asyncpg.Pool:
         """Create and return a connection pool to the butler's database."""
+        from butlers.db_profiler import profiled_connection_class
+        from butlers.db_statements import statement_cache_size_from_env
+
         pool_kwargs: dict[str, Any] = {
             "host": self.host,
             "port": self.port,
@@ -514,6 +537,8 @@ class Database:
             "min_size": self.min_pool_size,
             "max_size": self.max_pool_size,
             "init": self._init_connection,
+            "connection_class": profiled_connection_class(),
+            "statement_cache_size": statement_cache_size_from_env(),
         }
         server_settings = self._server_settings()
         if server_settings is not None:
@@ -587,6 +612,13 @@ class Database:
                     self.db_name,
                 )
 
+        from butlers.db_shared_pool import shared_pool_settings_from_env
+
+        shared_settings = shared_pool_settings_from_env()
+        if shared_settings is not None:
+            self.pool = await self._lease_shared_pool(shared_settings)
+            return self.pool
+
         try:
             self.pool = await asyncpg.create_pool(**pool_kwargs)
         except Exception as exc:
@@ -599,8 +631,44 @@ class Database:
         logger.info("Connection pool created for: %s", self.db_name)
         return self.pool
 
+    async def _lease_shared_pool(self, settings: SharedPoolSettings) -> asyncpg.Pool:
+        """Lease the process-wide shared pool routed to this schema and role.
+
+        Fair-share slots are keyed by :attr:`owner_butler`, so set it before
+        :meth:`connect`.
+        """
+        from butlers.db_shared_pool import lease_shared_pool
+
+        connect_kwargs: dict[str, Any] = {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "database": self.db_name,
+        }
+        if self.ssl is not None:
+            connect_kwargs["ssl"] = self.ssl
+        role = self.role if self._role_verified else None
+        try:
+            lease = await lease_shared_pool(
+                connect_kwargs, settings, schema=self.schema, role=role, butler=self.owner_butler
+            )
+        except Exception as exc:
+            if not should_retry_with_ssl_disable(exc, self.ssl):
+                raise
+            connect_kwargs["ssl"] = "disable"
+            logger.info(
+                "Retrying shared PostgreSQL pool creation with ssl=disable after SSL upgrade loss"
+            )
+            lease = await lease_shared_pool(
+                connect_kwargs, settings, schema=self.schema, role=role, butler=self.owner_butler
+            )
+        logger.info("Shared connection pool leased for: %s (schema=%s)", self.db_name, self.schema)
+        return lease
+
     async def close(self) -> None:
         """Close the connection pool."""
+        self._statement_schema = None
         if self.pool:
             await self.pool.close()
             self.pool = None
@@ -0,0 +1,264 @@
+"""Opt-in per-operation database round-trip profiler.
+
+N+1 query patterns hide behind helper calls: a scheduler tick, a spawn, an
+ingest or a dashboard fan-out looks like one call at the call site but may
+issue dozens of round trips.  When ``BUTLERS_DB_PROFILE`` is truthy, pools
+created by :class:`butlers.db.Database`, the shared routed pool and
+:class:`butlers.api.db.DatabaseManager` use a connection class
+(:func:`profiled_connection_class`) that counts every ``execute*`` /
+``fetch*`` call, the rows it returned or touched, and its wall time against
+the *logical operation* active in the calling task.
+
+Operations are opened with :func:`profile_operation` (or the :func:`profiled`
+decorator) and bound through a context variable, so concurrent tasks spawned
+inside an operation (``asyncio.gather`` fan-outs) still count towards it.
+Operations nest: a query counts towards every enclosing operation.  When an
+operation ends its totals are
+
+- set as ``db.client.*`` attributes on the current span;
+- recorded in the ``butlers.db.operation_*`` histograms (label ``operation``);
+- compared with the query budget (``BUTLERS_DB_QUERY_BUDGET``, default
+  :data:`DEFAULT_QUERY_BUDGET`): an operation that exceeds it is logged at
+  WARNING, marked ``db.client.query_budget_exceeded`` on its span and counted
+  in ``butlers.db.query_budget_exceeded_total``.
+
+Query time is summed per query, so concurrent queries inside one operation
+can add up to more than its wall time.  Only completed queries are counted;
+queries issued outside any operation, and cursor iteration, are not.  With
+profiling disabled the pools use the plain connection classes and
+:func:`profiled` costs one environment lookup per call.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import functools
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, ParamSpec, TypeVar
+
+import asyncpg
+from opentelemetry import trace
+
+from butlers.core.metrics import record_db_operation_profile
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "BUTLERS_DB_PROFILE"
+QUERY_BUDGET_ENV = "BUTLERS_DB_QUERY_BUDGET"
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+
+#: Round trips one logical operation may issue before it is flagged.
+DEFAULT_QUERY_BUDGET = 50
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def profiling_enabled() -> bool:
+    """Return whether ``BUTLERS_DB_PROFILE`` opts in to query profiling."""
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in _TRUTHY_ENV_VALUES
+
+
+def query_budget_from_env() -> int:
+    """Return the per-operation query budget (``0`` disables the check)."""
+    raw = os.environ.get(QUERY_BUDGET_ENV, "").strip()
+    if not raw:
+        return DEFAULT_QUERY_BUDGET
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", QUERY_BUDGET_ENV, raw)
+        return DEFAULT_QUERY_BUDGET
+
+
+@dataclass
+class OperationProfile:
+    """Running totals for one logical operation."""
+
+    operation: str
+    budget: int
+    queries: int = 0
+    rows: int = 0
+    db_time_s: float = 0.0
+    parent: OperationProfile | None = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget > 0 and self.queries > self.budget
+
+    def span_attributes(self) -> dict[str, Any]:
+        return {
+            "db.client.operation": self.operation,
+            "db.client.query_count": self.queries,
+            "db.client.rows": self.rows,
+            "db.client.time_ms": round(self.db_time_s * 1000, 3),
+            "db.client.query_budget_exceeded": self.over_budget,
+        }
+
+
+_current_profile: contextvars.ContextVar[OperationProfile | None] = contextvars.ContextVar(
+    "butlers_db_profile", default=None
+)
+
+
+def current_profile() -> OperationProfile | None:
+    """Return the innermost active operation profile, if any."""
+    return _current_profile.get()
+
+
+def _record_query(rows: int, elapsed_s: float) -> None:
+    profile = _current_profile.get()
+    while profile is not None:
+        profile.queries += 1
+        profile.rows += rows
+        profile.db_time_s += elapsed_s
+        profile = profile.parent
+
+
+def annotate_span(span: trace.Span) -> None:
+    """Copy the current operation's running totals onto *span*.
+
+    For spans that end before the enclosing operation does (e.g. the spawner's
+    session span, which is closed inside ``Spawner._run``).
+    """
+    profile = _current_profile.get()
+    if profile is not None and span.is_recording():
+        span.set_attributes(profile.span_attributes())
+
+
+def _finish(profile: OperationProfile) -> None:
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes(profile.span_attributes())
+
+    record_db_operation_profile(
+        operation=profile.operation,
+        queries=profile.queries,
+        rows=profile.rows,
+        db_time_ms=profile.db_time_s * 1000,
+        over_budget=profile.over_budget,
+    )
+    if profile.over_budget:
+        logger.warning(
+            "DB query budget exceeded: %s issued %d queries (budget %d, %d rows, %.1f ms)",
+            profile.operation,
+            profile.queries,
+            profile.budget,
+            profile.rows,
+            profile.db_time_s * 1000,
+        )
+
+
+@contextlib.contextmanager
+def profile_operation(
+    operation: str, *, budget: int | None = None
+) -> Iterator[OperationProfile | None]:
+    """Count the queries issued inside the block as *operation*.
+
+    Yields the live :class:`OperationProfile`, or ``None`` when profiling is
+    disabled.  *operation* becomes a metric label and must have bounded
+    cardinality (a function or route name, never an id).  The yielded
+    profile's ``operation`` may be renamed before the block exits.
+    """
+    if not profiling_enabled():
+        yield None
+        return
+    profile = OperationProfile(
+        operation=operation,
+        budget=query_budget_from_env() if budget is None else budget,
+        parent=_current_profile.get(),
+    )
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+        try:
+            _finish(profile)
+        except Exception:
+            logger.debug("Failed to report DB profile for %s", operation, exc_info=True)
+
+
+def profiled(
+    operation: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorate a coroutine function so each call is profiled as *operation*."""
+
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not profiling_enabled():
+                return await fn(*args, **kwargs)
+            with profile_operation(operation):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _status_rows(status: Any) -> int:
+    """Rows affected according to a command tag such as ``"UPDATE 3"``."""
+    if isinstance(status, str):
+        _, _, count = status.rpartition(" ")
+        if count.isdigit():
+            return int(count)
+    return 0
+
+
+class _ProfiledConnectionMixin:
+    """Counts round trips of the public query methods against the active operation."""
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        start = time.perf_counter()
+        status = await super().execute(query, *args, **kwargs)  # type: ignore[misc]
+        _record_query(_status_rows(status), time.perf_counter() - start)
+        return status
+
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        await super().executemany(command, args, **kwargs)  # type: ignore[misc]
+        _record_query(0, time.perf_counter() - start)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> list:
+        start = time.perf_counter()
+        rows = await super().fetch(query, *args, **kwargs)  # type: ignore[misc]
+        _record_query(len(rows), time.perf_counter() - start)
+        return rows
+
+    async def fetchmany(self, query: str, args: Any, **kwargs: Any) -> list:
+        start = time.perf_counter()
+        rows = await super().fetchmany(query, args, **kwargs)  # type: ignore[misc]
+        _record_query(len(rows), time.perf_counter() - start)
+        return rows
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        row = await super().fetchrow(query, *args, **kwargs)  # type: ignore[misc]
+        _record_query(0 if row is None else 1, time.perf_counter() - start)
+        return row
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        value = await super().fetchval(query, *args, **kwargs)  # type: ignore[misc]
+        _record_query(0 if value is None else 1, time.perf_counter() - start)
+        return value
+
+
+@functools.cache
+def _profiled_subclass(base: type[asyncpg.Connection]) -> type[asyncpg.Connection]:
+    return type(f"Profiled{base.__name__.lstrip('_')}", (_ProfiledConnectionMixin, base), {})
+
+
+def profiled_connection_class(
+    base: type[asyncpg.Connection] = asyncpg.Connection,
+) -> type[asyncpg.Connection]:
+    """Return the pool ``connection_class`` for *base*: profiled when enabled."""
+    if not profiling_enabled():
+        return base
+    return _profiled_subclass(base)
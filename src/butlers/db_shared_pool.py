@@ -0,0 +1,432 @@
+"""Process-wide shared asyncpg pool with per-butler schema routing.
+
+``butlers up`` runs every butler daemon in one process against one PostgreSQL
+database with a schema per butler.  By default each :class:`~butlers.db.Database`
+opens its own pool (plus audit and credential pools), so the idle connection
+count grows with the number of butlers rather than with load.
+
+When ``BUTLERS_DB_SHARED_POOL`` is truthy (``butlers up --shared-db-pool``),
+:meth:`butlers.db.Database.connect` instead leases a :class:`ButlerPoolLease`
+from one :class:`SharedPool` per connection target.  A lease is an
+:class:`asyncpg.Pool` subclass — call sites that branch on
+``isinstance(pool, asyncpg.Pool)`` (transactions, probe caches) treat it as the
+real pool it stands in for — that overrides every method touching the
+pool's internals and routes every borrowed connection to the leasing butler:
+
+- Each physical connection remembers the ``(role, search_path)`` route last
+  applied to it, so re-acquiring for the same butler costs no ``SET`` round
+  trip.  Switching butlers costs one simple-query round trip.
+- asyncpg's release-time ``RESET ALL`` leaves ``ROLE`` alone but resets
+  ``search_path``; the connection appends the current route's
+  ``SET search_path`` to its reset query so the route survives release
+  without an extra round trip.
+- A per-butler semaphore caps how many connections one butler may hold, so a
+  busy butler cannot starve the others of the shared budget.  It is keyed by
+  butler name, not schema: every butler's audit lease routes to the
+  ``switchboard`` schema but still draws on its own butler's slots.
+
+The shared pool starts empty and closes idle connections after
+``BUTLERS_DB_SHARED_POOL_IDLE_SECONDS``, so the connection count follows load.
+Sizing: ``BUTLERS_DB_SHARED_POOL_MIN_SIZE`` / ``_MAX_SIZE`` (default 0 / 20)
+and ``BUTLERS_DB_SHARED_POOL_PER_BUTLER`` (default half of max size).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import asyncpg
+
+from butlers.db import pool_sizes_from_env, register_jsonb_codec, schema_search_path
+from butlers.db_profiler import profiled_connection_class
+from butlers.db_statements import statement_cache_size_from_env
+
+logger = logging.getLogger(__name__)
+
+SHARED_POOL_ENV = "BUTLERS_DB_SHARED_POOL"
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+_DEFAULT_MAX_SIZE = 20
+_DEFAULT_IDLE_SECONDS = 60.0
+_DEFAULT_ROUTE_KEY = "<default>"
+
+
+@dataclass(frozen=True)
+class SharedPoolSettings:
+    """Sizing for the process-wide shared pool."""
+
+    min_size: int = 0
+    max_size: int = _DEFAULT_MAX_SIZE
+    per_butler_limit: int = _DEFAULT_MAX_SIZE // 2
+    max_inactive_connection_lifetime: float = _DEFAULT_IDLE_SECONDS
+
+
+def shared_pool_settings_from_env() -> SharedPoolSettings | None:
+    """Return shared-pool settings when ``BUTLERS_DB_SHARED_POOL`` opts in, else ``None``."""
+    if os.environ.get(SHARED_POOL_ENV, "").strip().lower() not in _TRUTHY_ENV_VALUES:
+        return None
+    min_size, max_size = pool_sizes_from_env(
+        SHARED_POOL_ENV, default_min=0, default_max=_DEFAULT_MAX_SIZE
+    )
+    per_butler_limit = max(1, max_size // 2)
+    raw_limit = os.environ.get(f"{SHARED_POOL_ENV}_PER_BUTLER", "").strip()
+    if raw_limit:
+        try:
+            per_butler_limit = min(max(1, int(raw_limit)), max_size)
+        except ValueError:
+            logger.warning("Ignoring invalid %s_PER_BUTLER=%r", SHARED_POOL_ENV, raw_limit)
+    idle_seconds = _DEFAULT_IDLE_SECONDS
+    raw_idle = os.environ.get(f"{SHARED_POOL_ENV}_IDLE_SECONDS", "").strip()
+    if raw_idle:
+        try:
+            idle_seconds = max(0.0, float(raw_idle))
+        except ValueError:
+            logger.warning("Ignoring invalid %s_IDLE_SECONDS=%r", SHARED_POOL_ENV, raw_idle)
+    return SharedPoolSettings(
+        min_size=min_size,
+        max_size=max_size,
+        per_butler_limit=per_butler_limit,
+        max_inactive_connection_lifetime=idle_seconds,
+    )
+
+
+class _Route(NamedTuple):
+    role: str | None
+    search_path: str | None
+
+
+def _route_sql(route: _Route) -> str:
+    """Return the single simple-query batch that moves a connection onto *route*."""
+    if route.role is None:
+        role_sql = "RESET ROLE"
+    else:
+        role_sql = 'SET ROLE "' + route.role.replace('"', '""') + '"'
+    path_sql = (
+        "SET search_path TO DEFAULT"
+        if route.search_path is None
+        else f"SET search_path TO {route.search_path}"
+    )
+    return f"{role_sql}; {path_sql}"
+
+
+class _RoutedConnection(asyncpg.Connection):
+    """asyncpg connection that remembers the butler route applied to it."""
+
+    _butlers_route: _Route | None = None
+
+    def _set_butlers_route(self, route: _Route) -> None:
+        self._butlers_route = route
+
+    def get_reset_query(self) -> str:
+        # RESET ALL keeps ROLE but drops search_path; re-apply the current
+        # route's path in the same release-time batch.
+        query = super().get_reset_query()
+        route = self._butlers_route
+        if route is None or route.search_path is None:
+            return query
+        return f"{query}\nSET search_path TO {route.search_path};"
+
+
+class SharedPool:
+    """One asyncpg pool shared by every butler leasing the same connection target."""
+
+    def __init__(
+        self,
+        connect_kwargs: dict[str, Any],
+        settings: SharedPoolSettings,
+    ) -> None:
+        self._connect_kwargs = connect_kwargs
+        self.settings = settings
+        self._pool: asyncpg.Pool | None = None
+        self._open_lock = asyncio.Lock()
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._leases = 0
+        self.route_hits = 0
+        self.route_switches = 0
+
+    @property
+    def pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            raise RuntimeError("Shared database pool is not open")
+        return self._pool
+
+    async def _ensure_open(self) -> None:
+        async with self._open_lock:
+            if self._pool is not None:
+                return
+            self._pool = await asyncpg.create_pool(
+                **self._connect_kwargs,
+                min_size=self.settings.min_size,
+                max_size=self.settings.max_size,
+                max_inactive_connection_lifetime=self.settings.max_inactive_connection_lifetime,
+                init=register_jsonb_codec,
+                connection_class=profiled_connection_class(_RoutedConnection),
+                statement_cache_size=statement_cache_size_from_env(),
+            )
+            logger.info(
+                "Shared connection pool created for: %s (max=%d, per_butler=%d)",
+                self._connect_kwargs.get("database"),
+                self.settings.max_size,
+                self.settings.per_butler_limit,
+            )
+
+    def _slots_for(self, route_key: str) -> asyncio.Semaphore:
+        slots = self._slots.get(route_key)
+        if slots is None:
+            slots = asyncio.Semaphore(self.settings.per_butler_limit)
+            self._slots[route_key] = slots
+        return slots
+
+    async def _apply_route(self, connection: Any, route: _Route) -> None:
+        if connection._butlers_route == route:
+            self.route_hits += 1
+            return
+        await connection.execute(_route_sql(route))
+        connection._set_butlers_route(route)
+        self.route_switches += 1
+
+    async def _close_lease(self) -> None:
+        self._leases -= 1
+        if self._leases > 0:
+            return
+        for key, shared in list(_SHARED_POOLS.items()):
+            if shared is self:
+                del _SHARED_POOLS[key]
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+            logger.info(
+                "Shared connection pool closed for: %s", self._connect_kwargs.get("database")
+            )
+
+    def _terminate_lease(self) -> None:
+        """Synchronous :meth:`_close_lease` for ``terminate()``: no graceful close."""
+        self._leases -= 1
+        if self._leases > 0:
+            return
+        for key, shared in list(_SHARED_POOLS.items()):
+            if shared is self:
+                del _SHARED_POOLS[key]
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.terminate()
+
+    def stats(self) -> dict[str, int]:
+        """Return connection and routing counters for diagnostics and benchmarks."""
+        pool = self._pool
+        return {
+            "size": pool.get_size() if pool is not None else 0,
+            "idle": pool.get_idle_size() if pool is not None else 0,
+            "max_size": self.settings.max_size,
+            "leases": self._leases,
+            "route_hits": self.route_hits,
+            "route_switches": self.route_switches,
+        }
+
+
+class _LeaseAcquireContext:
+    """Awaitable / async-context result of :meth:`ButlerPoolLease.acquire`."""
+
+    __slots__ = ("_connection", "_lease", "_timeout")
+
+    def __init__(self, lease: ButlerPoolLease, timeout: float | None) -> None:
+        self._lease = lease
+        self._timeout = timeout
+        self._connection: Any = None
+
+    async def __aenter__(self) -> Any:
+        self._connection = await self._lease._acquire(self._timeout)
+        return self._connection
+
+    async def __aexit__(self, *_exc: object) -> None:
+        connection, self._connection = self._connection, None
+        await self._lease.release(connection)
+
+    def __await__(self) -> Any:
+        return self._lease._acquire(self._timeout).__await__()
+
+
+class ButlerPoolLease(asyncpg.Pool):
+    """One butler's view of a :class:`SharedPool`, routed to its schema and role.
+
+    Subclasses :class:`asyncpg.Pool` for ``isinstance`` checks only: the base
+    initializer never runs, so every base method that reads pool internals is
+    overridden below.  The inherited ``fetchmany`` / ``copy_*`` helpers go
+    through :meth:`acquire` and work unchanged.
+    """
+
+    def __init__(self, shared: SharedPool, route_key: str, route: _Route) -> None:
+        self._shared = shared
+        self._route_key = route_key
+        self._route = route
+        self._held: set[int] = set()
+        self._closed = False
+
+    @property
+    def shared(self) -> SharedPool:
+        return self._shared
+
+    def acquire(self, *, timeout: float | None = None) -> _LeaseAcquireContext:
+        """Borrow a connection routed to this butler (``await`` or ``async with``)."""
+        return _LeaseAcquireContext(self, timeout)
+
+    async def _acquire(self, timeout: float | None) -> Any:
+        if self._closed:
+            raise asyncpg.InterfaceError("pool is closed")
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        slots = self._shared._slots_for(self._route_key)
+        if deadline is None:
+            await slots.acquire()
+        else:
+            await asyncio.wait_for(slots.acquire(), timeout)
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            connection = await self._shared.pool.acquire(timeout=remaining)
+        except BaseException:
+            slots.release()
+            raise
+        try:
+            await self._shared._apply_route(connection, self._route)
+        except BaseException:
+            await self._shared.pool.release(connection)
+            slots.release()
+            raise
+        self._held.add(id(connection))
+        return connection
+
+    async def release(self, connection: Any, *, timeout: float | None = None) -> None:
+        """Return a borrowed connection to the shared pool."""
+        if id(connection) not in self._held:
+            raise asyncpg.InterfaceError(
+                f"ButlerPoolLease.release() received invalid connection: {connection!r}"
+            )
+        self._held.discard(id(connection))
+        try:
+            await self._shared.pool.release(connection, timeout=timeout)
+        finally:
+            self._shared._slots_for(self._route_key).release()
+
+    async def fetch(self, query: str, *args: Any, timeout: float | None = None) -> list[Any]:
+        async with self.acquire() as connection:
+            return await connection.fetch(query, *args, timeout=timeout)
+
+    async def fetchrow(self, query: str, *args: Any, timeout: float | None = None) -> Any:
+        async with self.acquire() as connection:
+            return await connection.fetchrow(query, *args, timeout=timeout)
+
+    async def fetchval(
+        self, query: str, *args: Any, column: int = 0, timeout: float | None = None
+    ) -> Any:
+        async with self.acquire() as connection:
+            return await connection.fetchval(query, *args, column=column, timeout=timeout)
+
+    async def execute(self, query: str, *args: Any, timeout: float | None = None) -> str:
+        async with self.acquire() as connection:
+            return await connection.execute(query, *args, timeout=timeout)
+
+    async def executemany(self, command: str, args: Any, *, timeout: float | None = None) -> None:
+        async with self.acquire() as connection:
+            await connection.executemany(command, args, timeout=timeout)
+
+    def is_closing(self) -> bool:
+        return self._closed
+
+    def get_size(self) -> int:
+        return self._shared.stats()["size"]
+
+    def get_max_size(self) -> int:
+        return self._shared.settings.per_butler_limit
+
+    def get_min_size(self) -> int:
+        return 0
+
+    def get_idle_size(self) -> int:
+        return self._shared.stats()["idle"]
+
+    def set_connect_args(self, dsn: str | None = None, **connect_kwargs: Any) -> None:
+        raise asyncpg.InterfaceError("connect args of a shared pool lease cannot be changed")
+
+    async def expire_connections(self) -> None:
+        """No-op: the shared pool's connections are not this lease's to expire."""
+
+    def terminate(self) -> None:
+        """Stop handing out connections; the shared pool stays up for other leases."""
+        if self._closed:
+            return
+        self._closed = True
+        self._shared._terminate_lease()
+
+    def _drop_statement_cache(self) -> None:
+        pool = self._shared._pool
+        if pool is not None:
+            pool._drop_statement_cache()
+
+    def _drop_type_cache(self) -> None:
+        pool = self._shared._pool
+        if pool is not None:
+            pool._drop_type_cache()
+
+    def __await__(self) -> Any:
+        return self._ready().__await__()
+
+    async def _ready(self) -> ButlerPoolLease:
+        return self
+
+    async def __aenter__(self) -> ButlerPoolLease:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f"<ButlerPoolLease route={self._route_key!r} closed={self._closed}>"
+
+    async def close(self) -> None:
+        """Drop this lease; the shared pool closes with its last lease."""
+        if self._closed:
+            return
+        self._closed = True
+        await self._shared._close_lease()
+
+
+_SHARED_POOLS: dict[tuple[Any, ...], SharedPool] = {}
+
+
+def _pool_key(connect_kwargs: dict[str, Any]) -> tuple[Any, ...]:
+    return tuple(
+        connect_kwargs.get(name) for name in ("host", "port", "user", "password", "database", "ssl")
+    )
+
+
+async def lease_shared_pool(
+    connect_kwargs: dict[str, Any],
+    settings: SharedPoolSettings,
+    *,
+    schema: str | None,
+    role: str | None,
+    butler: str | None = None,
+) -> ButlerPoolLease:
+    """Lease the process-wide pool for *connect_kwargs*, routed to *schema* and *role*.
+
+    *connect_kwargs* are plain :func:`asyncpg.create_pool` connection
+    arguments (host, port, user, password, database, ssl); sizing comes from
+    *settings* of the first lease.  *butler* names the fair-share slots the
+    lease draws on; without it the lease falls back to its schema.
+    """
+    key = _pool_key(connect_kwargs)
+    shared = _SHARED_POOLS.get(key)
+    if shared is None:
+        shared = SharedPool(dict(connect_kwargs), settings)
+        _SHARED_POOLS[key] = shared
+    shared._leases += 1
+    try:
+        await shared._ensure_open()
+    except BaseException:
+        await shared._close_lease()
+        raise
+    route = _Route(role=role, search_path=schema_search_path(schema))
+    return ButlerPoolLease(shared, butler or schema or _DEFAULT_ROUTE_KEY, route)
@@ -0,0 +1,184 @@
+"""Registry of hot-path SQL statements, pre-prepared on new pool connections.
+
+asyncpg keeps a per-connection LRU of prepared statements keyed by the exact
+query text.  A pool connection serves every code path of its butler, so
+hundreds of distinct statements compete for the cache (asyncpg's default
+holds 100), and a hot statement evicted by cold ones pays a fresh
+parse/analyse round trip — plus type introspection — on its next use.  SQL
+assembled from f-strings makes that worse when the text varies between calls.
+
+Hot paths instead declare their canonical parameterised statements here with
+:func:`register_statement` (variants enumerated up front, never formatted per
+call) and execute the returned text unchanged.  Dedicated pools then
+
+- size the cache with :func:`statement_cache_size_from_env`
+  (``BUTLERS_DB_STATEMENT_CACHE_SIZE``, default
+  :data:`DEFAULT_STATEMENT_CACHE_SIZE`; ``0`` disables statement caching and
+  pre-preparation), and
+- prepare every registered statement whose relations exist from the pool
+  ``init`` hook (:func:`prepare_registered_statements`), right after the
+  JSONB codec is registered, so the first call on a new connection is
+  already a cache hit.
+
+Statements whose text depends on optional columns register one variant per
+column combination and declare it with ``columns=``; only the variant the
+schema selects is prepared.  Which relations and columns exist is probed
+once per pool (:func:`probe_statement_schema`) and reused for every new
+connection until the pool's owner invalidates it after migrating.
+
+Statements registered after a connection was opened (modules imported
+later) are cached on first use as before.  The shared routed pool only sizes
+its cache: its ``init`` runs before a connection is routed to a butler's
+search path, so there is nothing schema-correct to prepare yet.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import textwrap
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_CACHE_SIZE_ENV = "BUTLERS_DB_STATEMENT_CACHE_SIZE"
+
+#: asyncpg's default is 100; registered statements alone take a share of it.
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+_PROBE_SCHEMA_SQL = """
+SELECT
+    ARRAY(SELECT r FROM unnest($1::text[]) AS r WHERE to_regclass(r) IS NOT NULL),
+    ARRAY(
+        SELECT c.rel || '.' || c.col
+        FROM unnest($2::text[], $3::text[]) AS c(rel, col)
+        JOIN pg_attribute AS a
+          ON a.attrelid = to_regclass(c.rel)
+         AND a.attname = c.col
+         AND a.attnum > 0
+         AND NOT a.attisdropped
+    )
+"""
+
+
+class RegisteredStatement(NamedTuple):
+    key: str
+    sql: str
+    relations: tuple[str, ...]
+    columns: tuple[tuple[str, bool], ...] = ()
+
+
+class StatementSchema(NamedTuple):
+    """Relations and ``relation.column`` names present on a pool's search path."""
+
+    relations: frozenset[str]
+    columns: frozenset[str]
+
+
+_REGISTRY: dict[str, RegisteredStatement] = {}
+
+
+def register_statement(
+    key: str,
+    sql: str,
+    *,
+    relations: tuple[str, ...],
+    columns: Mapping[str, bool] | None = None,
+) -> str:
+    """Register *sql* under *key* and return its canonical text.
+
+    *relations* are the tables the statement reads or writes; it is only
+    pre-prepared on connections whose search path resolves all of them.
+    *columns* maps ``relation.column`` names to whether this variant expects
+    the column to exist; a variant is only pre-prepared where every entry
+    matches.  Re-registering a key with different text raises
+    :class:`ValueError`.
+    """
+    canonical = textwrap.dedent(sql).strip()
+    existing = _REGISTRY.get(key)
+    if existing is not None and existing.sql != canonical:
+        raise ValueError(f"Statement {key!r} is already registered with different SQL")
+    _REGISTRY[key] = RegisteredStatement(
+        key, canonical, tuple(relations), tuple((columns or {}).items())
+    )
+    return canonical
+
+
+def registered_statements() -> list[RegisteredStatement]:
+    """Return the registered statements in registration order."""
+    return list(_REGISTRY.values())
+
+
+def statement_cache_size_from_env() -> int:
+    """Return the per-connection asyncpg statement cache size."""
+    raw = os.environ.get(STATEMENT_CACHE_SIZE_ENV, "").strip()
+    if not raw:
+        return DEFAULT_STATEMENT_CACHE_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", STATEMENT_CACHE_SIZE_ENV, raw)
+        return DEFAULT_STATEMENT_CACHE_SIZE
+
+
+async def probe_statement_schema(conn: Any) -> StatementSchema:
+    """Return which registered relations and columns *conn*'s search path has."""
+    statements = registered_statements()
+    relations = sorted({relation for stmt in statements for relation in stmt.relations})
+    columns = sorted({column for stmt in statements for column, _ in stmt.columns})
+    if not relations and not columns:
+        return StatementSchema(frozenset(), frozenset())
+    split = [column.rsplit(".", 1) for column in columns]
+    row = await conn.fetchrow(
+        _PROBE_SCHEMA_SQL,
+        relations,
+        [rel for rel, _ in split],
+        [col for _, col in split],
+    )
+    return StatementSchema(frozenset(row[0]), frozenset(row[1]))
+
+
+def _selected(stmt: RegisteredStatement, schema: StatementSchema) -> bool:
+    return schema.relations.issuperset(stmt.relations) and all(
+        (column in schema.columns) == expected for column, expected in stmt.columns
+    )
+
+
+async def prepare_registered_statements(conn: Any, schema: StatementSchema | None = None) -> int:
+    """Load the registered statements into *conn*'s statement cache.
+
+    Runs from a pool ``init`` hook.  *schema* is the pool's cached
+    :func:`probe_statement_schema` result; it is probed on *conn* when
+    omitted.  Statements whose relations are missing from the search path,
+    or whose declared columns do not match it, are skipped; one that still
+    fails to prepare is logged and skipped.  Returns the number of
+    statements prepared.
+
+    asyncpg has no public API to seed its statement cache (``prepare()``
+    returns a standalone statement), so this uses the same internal
+    ``_get_statement`` lookup that ``fetch``/``execute`` go through and does
+    nothing if it is unavailable.
+    """
+    statements = registered_statements()
+    get_statement = getattr(conn, "_get_statement", None)
+    if not statements or get_statement is None:
+        return 0
+    if statement_cache_size_from_env() <= 0:
+        return 0
+
+    if schema is None:
+        schema = await probe_statement_schema(conn)
+    prepared = 0
+    for stmt in statements:
+        if not _selected(stmt, schema):
+            continue
+        try:
+            await get_statement(stmt.sql, None)
+        except asyncpg.PostgresError as exc:
+            logger.debug("Skipping pre-prepare of %s: %s", stmt.key, exc)
+            continue
+        prepared += 1
+    return prepared
@@ -20,12 +20,13 @@ for the full wire contract, delivery semantics, and failure modes.
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 import asyncpg
 
+from butlers import json_codec
+
 logger = logging.getLogger(__name__)
 
 #: Postgres NOTIFY channel carrying the JSON-encoded fleet event envelope.
@@ -63,9 +64,9 @@ async def publish_fleet_event(
     """
     envelope = {"type": event_type, "data": data or {}}
     try:
-        payload = json.dumps(envelope, default=str)
+        payload = json_codec.dumps(envelope, default=str)
     except Exception:
-        # Broad catch (not just TypeError/ValueError): json.dumps's default=str
+        # Broad catch (not just TypeError/ValueError): the default=str
         # fallback calls str() on any non-serializable value, which itself can
         # raise arbitrary exceptions from a pathological __str__/__repr__.
         # This function must never raise regardless of *data*'s contents.
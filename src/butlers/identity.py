@@ -25,6 +25,8 @@ from uuid import UUID
 
 import asyncpg
 
+from butlers.identity_cache import channel_identity_cache
+
 # WhatsApp individual-chat JID suffix for s.whatsapp.net domain.
 _WHATSAPP_INDIVIDUAL_JID_SUFFIX = "@s.whatsapp.net"
 # Regex to extract the E.164-prefix phone number from a WhatsApp individual JID.
@@ -316,30 +318,28 @@ async def _resolve_entity_by_triple(
     """Query ``relationship.entity_facts`` for an active triple and join entity info.
 
     Returns a row with ``entity_id``, ``name`` (canonical_name), and ``roles``,
-    or ``None`` when not found or on DB error.
+    or ``None`` when not found.  DB errors propagate so callers can tell a
+    miss (cacheable) from a failed lookup (not cacheable).
     """
-    try:
-        return await pool.fetchrow(
-            """
-            SELECT ef.subject                     AS entity_id,
-                   e.canonical_name               AS name,
-                   COALESCE(e.roles, '{}')        AS roles
-            FROM   relationship.entity_facts ef
-            JOIN   public.entities e ON e.id = ef.subject
-            WHERE  ef.predicate    = $1
-              AND  ef.object       = $2
-              AND  ef.object_kind  = 'literal'
-              AND  ef.validity     = 'active'
-            LIMIT  1
-            """,
-            predicate,
-            object_value,
-        )
-    except Exception:  # noqa: BLE001
-        return None
+    return await pool.fetchrow(
+        """
+        SELECT ef.subject                     AS entity_id,
+               e.canonical_name               AS name,
+               COALESCE(e.roles, '{}')        AS roles
+        FROM   relationship.entity_facts ef
+        JOIN   public.entities e ON e.id = ef.subject
+        WHERE  ef.predicate    = $1
+          AND  ef.object       = $2
+          AND  ef.object_kind  = 'literal'
+          AND  ef.validity     = 'active'
+        LIMIT  1
+        """,
+        predicate,
+        object_value,
+    )
 
 
-async def _resolve_entity_by_phone_digits(
+async def _query_entity_by_phone_digits(
     pool: asyncpg.Pool,
     digits: str,
 ) -> asyncpg.Record | None:
@@ -350,40 +350,37 @@ async def _resolve_entity_by_phone_digits(
     (``"91153887"`` for ``"6591153887"``), hence the suffix match — bounded by
     :data:`_PHONE_SUFFIX_MIN_DIGITS` so short fragments cannot alias two people.
 
-    Returns ``None`` when not found, ambiguous, or on DB error.
+    Returns ``None`` when not found or ambiguous; DB errors propagate.
     """
     if len(digits) < _PHONE_SUFFIX_MIN_DIGITS:
         return None
-    try:
-        rows = await pool.fetch(
-            """
-            WITH stored AS (
-                SELECT ef.subject                              AS entity_id,
-                       regexp_replace(ef.object, '\\D', '', 'g') AS digits
-                FROM   relationship.entity_facts ef
-                WHERE  ef.predicate   = 'has-phone'
-                  AND  ef.object_kind = 'literal'
-                  AND  ef.validity    = 'active'
-            )
-            SELECT DISTINCT stored.entity_id         AS entity_id,
-                   e.canonical_name                  AS name,
-                   COALESCE(e.roles, '{}')           AS roles
-            FROM   stored
-            JOIN   public.entities e ON e.id = stored.entity_id
-            WHERE  length(stored.digits) >= $2
-              AND  abs(length(stored.digits) - length($1)) <= $3
-              AND  (
-                     stored.digits LIKE '%' || $1
-                  OR $1 LIKE '%' || stored.digits
-                   )
-            LIMIT  2
-            """,
-            digits,
-            _PHONE_SUFFIX_MIN_DIGITS,
-            _PHONE_SUFFIX_MAX_DELTA,
+    rows = await pool.fetch(
+        """
+        WITH stored AS (
+            SELECT ef.subject                              AS entity_id,
+                   regexp_replace(ef.object, '\\D', '', 'g') AS digits
+            FROM   relationship.entity_facts ef
+            WHERE  ef.predicate   = 'has-phone'
+              AND  ef.object_kind = 'literal'
+              AND  ef.validity    = 'active'
         )
-    except Exception:  # noqa: BLE001
-        return None
+        SELECT DISTINCT stored.entity_id         AS entity_id,
+               e.canonical_name                  AS name,
+               COALESCE(e.roles, '{}')           AS roles
+        FROM   stored
+        JOIN   public.entities e ON e.id = stored.entity_id
+        WHERE  length(stored.digits) >= $2
+          AND  abs(length(stored.digits) - length($1)) <= $3
+          AND  (
+                 stored.digits LIKE '%' || $1
+              OR $1 LIKE '%' || stored.digits
+               )
+        LIMIT  2
+        """,
+        digits,
+        _PHONE_SUFFIX_MIN_DIGITS,
+        _PHONE_SUFFIX_MAX_DELTA,
+    )
     # An ambiguous match is worse than none: silently attributing an
     # interaction to the wrong person corrupts the Dunbar ranking.
     if len(rows) != 1:
@@ -391,6 +388,37 @@ async def _resolve_entity_by_phone_digits(
     return rows[0]
 
 
+async def _resolve_entity_by_phone_digits(
+    pool: asyncpg.Pool,
+    digits: str,
+) -> asyncpg.Record | None:
+    """Fail-open :func:`_query_entity_by_phone_digits`: ``None`` on DB error."""
+    try:
+        return await _query_entity_by_phone_digits(pool, digits)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _row_to_contact(row: asyncpg.Record) -> ResolvedContact | None:
+    """Build a :class:`ResolvedContact` from an entity row; ``None`` on a bad id."""
+    entity_id = row["entity_id"]
+    if not isinstance(entity_id, UUID):
+        try:
+            entity_id = UUID(str(entity_id))
+        except (ValueError, AttributeError):
+            return None
+
+    raw_roles = row["roles"]
+    roles = [str(r) for r in raw_roles] if isinstance(raw_roles, (list, tuple)) else []
+
+    return ResolvedContact(
+        contact_id=None,  # entity_id is now the authoritative key (bead 7)
+        name=row["name"] or None,
+        roles=roles,
+        entity_id=entity_id,
+    )
+
+
 async def resolve_contact_by_channel(
     pool: asyncpg.Pool,
     channel_type: str,
@@ -406,6 +434,10 @@ async def resolve_contact_by_channel(
     (``relationship.entity_facts``) directly, using predicates ``has-handle``,
     ``has-email``, and ``has-phone``.
 
+    Results — including "no such entity" — are memoised in the process-local
+    :mod:`butlers.identity_cache` while its NOTIFY listener is connected; failed
+    lookups are never cached.
+
     Parameters
     ----------
     pool:
@@ -430,19 +462,44 @@ async def resolve_contact_by_channel(
     - This function is safe to call if the migration has not yet run —
       it returns ``None`` gracefully.
     """
+    cache = channel_identity_cache()
+    key = (channel_type, channel_value)
+    found, cached = cache.lookup(key)
+    if found:
+        return cached
+
+    generation = cache.generation
+    try:
+        contact = await _resolve_contact_uncached(pool, channel_type, channel_value)
+    except Exception:  # noqa: BLE001
+        logger.debug(
+            "resolve_contact_by_channel: DB query failed (table may not exist yet); returning None",
+            exc_info=True,
+        )
+        return None
+
+    candidates = _channel_candidates(channel_type, channel_value)
+    cache.store(
+        key,
+        contact,
+        candidates,
+        generation=generation,
+        digits_sensitive=any(p == _PHONE_DIGITS_PREDICATE for p, _ in candidates),
+    )
+    return contact
+
+
+async def _resolve_contact_uncached(
+    pool: asyncpg.Pool,
+    channel_type: str,
+    channel_value: str,
+) -> ResolvedContact | None:
+    """Walk the resolution fallback chain for one channel; DB errors propagate."""
     predicate = _CHANNEL_TYPE_TO_PREDICATE.get(channel_type)
     row: asyncpg.Record | None = None
 
     if predicate is not None:
-        try:
-            row = await _resolve_entity_by_triple(pool, predicate, channel_value)
-        except Exception:  # noqa: BLE001
-            logger.debug(
-                "resolve_contact_by_channel: DB query failed "
-                "(table may not exist yet); returning None",
-                exc_info=True,
-            )
-            return None
+        row = await _resolve_entity_by_triple(pool, predicate, channel_value)
 
     if row is None and channel_type in _TELEGRAM_PREFIX_CHANNEL_TYPES:
         # Telegram canonical-prefix fallback: handles are stored as telegram:<bare>
@@ -450,14 +507,7 @@ async def resolve_contact_by_channel(
         # telegram_send_message or an inbound telegram_bot sender resolves to its
         # triple.  (@-username variants are handled separately below.)
         telegram_value = _telegram_prefixed_value(channel_value)
-        try:
-            row = await _resolve_entity_by_triple(pool, "has-handle", telegram_value)
-        except Exception:  # noqa: BLE001
-            logger.debug(
-                "resolve_contact_by_channel: telegram prefix fallback query failed",
-                exc_info=True,
-            )
-            return None
+        row = await _resolve_entity_by_triple(pool, "has-handle", telegram_value)
 
     if row is None and channel_type in _TELEGRAM_USERNAME_CHANNEL_TYPES:
         # Telegram username normalization fallback (bu-c4f7f).
@@ -468,16 +518,7 @@ async def resolve_contact_by_channel(
         # The exact-match attempt above (first candidate) has already run; start
         # from the second candidate to avoid a redundant query.
         for candidate in _telegram_username_candidates(channel_value)[1:]:
-            try:
-                row = await _resolve_entity_by_triple(pool, "has-handle", candidate)
-            except Exception:  # noqa: BLE001
-                logger.debug(
-                    "resolve_contact_by_channel: telegram username variant query failed "
-                    "(candidate=%r); returning None",
-                    candidate,
-                    exc_info=True,
-                )
-                return None
+            row = await _resolve_entity_by_triple(pool, "has-handle", candidate)
             if row is not None:
                 logger.debug(
                     "resolve_contact_by_channel: telegram username normalised from %r to %r",
@@ -486,48 +527,22 @@ async def resolve_contact_by_channel(
                 )
                 break
 
-    if row is None:
+    if row is None and channel_type == "whatsapp_jid":
         # WhatsApp JID fallback: if no direct match, try phone-number cross-reference.
         # Extracts the E.164 phone prefix from "<number>@s.whatsapp.net" JIDs and
         # queries has-phone to link against entities from other providers
         # (e.g. Google Contacts) that share the same number.
-        if channel_type == "whatsapp_jid":
-            phone = _extract_whatsapp_jid_phone(channel_value)
-            if phone is not None:
-                try:
-                    row = await _resolve_entity_by_triple(pool, "has-phone", phone)
-                except Exception:  # noqa: BLE001
-                    logger.debug(
-                        "resolve_contact_by_channel: phone fallback query failed; returning None",
-                        exc_info=True,
-                    )
-                    return None
-                if row is None:
-                    # Exact equality misses the common stored formats
-                    # ("+65 9815 0802"); retry on digits alone.
-                    row = await _resolve_entity_by_phone_digits(pool, phone)
-        if row is None:
-            return None
-
-    entity_id = row["entity_id"]
-    if not isinstance(entity_id, UUID):
-        try:
-            entity_id = UUID(str(entity_id))
-        except (ValueError, AttributeError):
-            return None
-
-    raw_roles = row["roles"]
-    if isinstance(raw_roles, (list, tuple)):
-        roles = [str(r) for r in raw_roles]
-    else:
-        roles = []
+        phone = _extract_whatsapp_jid_phone(channel_value)
+        if phone is not None:
+            row = await _resolve_entity_by_triple(pool, "has-phone", phone)
+            if row is None:
+                # Exact equality misses the common stored formats
+                # ("+65 9815 0802"); retry on digits alone.
+                row = await _query_entity_by_phone_digits(pool, phone)
 
-    return ResolvedContact(
-        contact_id=None,  # entity_id is now the authoritative key (bead 7)
-        name=row["name"] or None,
-        roles=roles,
-        entity_id=entity_id,
-    )
+    if row is None:
+        return None
+    return _row_to_contact(row)
 
 
 def _channel_candidates(channel_type: str, channel_value: str) -> list[tuple[str, str]]:
@@ -589,16 +604,26 @@ async def resolve_contacts_by_channel_bulk(
         A dict mapping every input pair to its ``ResolvedContact`` (or
         ``None`` when unresolved). Fail-open: on DB error, all pairs map to
         ``None`` rather than raising.
+
+    Pairs already held by the :mod:`butlers.identity_cache` process cache
+    (shared with :func:`resolve_contact_by_channel`) are answered from it; only
+    the misses reach the database, and their results are cached in turn.
     """
     result: dict[tuple[str, str], ResolvedContact | None] = dict.fromkeys(channels)
     if not channels:
         return result
 
+    cache = channel_identity_cache()
+    generation = cache.generation
     candidates_by_pair: dict[tuple[str, str], list[tuple[str, str]]] = {}
     wanted_pairs: set[tuple[str, str]] = set()
-    for channel_type, channel_value in channels:
+    for channel_type, channel_value in result:
         if not channel_type or not channel_value:
             continue
+        found, cached = cache.lookup((channel_type, channel_value))
+        if found:
+            result[(channel_type, channel_value)] = cached
+            continue
         pair_candidates = _channel_candidates(channel_type, channel_value)
         if not pair_candidates:
             continue
@@ -661,8 +686,13 @@ async def resolve_contacts_by_channel_bulk(
             for candidate in pair_candidates
         )
     ]
+    failed_candidates: set[tuple[str, str]] = set()
     for digits in unresolved_digits:
-        digit_row = await _resolve_entity_by_phone_digits(pool, digits)
+        try:
+            digit_row = await _query_entity_by_phone_digits(pool, digits)
+        except Exception:  # noqa: BLE001
+            failed_candidates.add((_PHONE_DIGITS_PREDICATE, digits))
+            continue
         if digit_row is not None:
             match_by_candidate[(_PHONE_DIGITS_PREDICATE, digits)] = digit_row
 
@@ -671,21 +701,19 @@ async def resolve_contacts_by_channel_bulk(
             row = match_by_candidate.get(candidate)
             if row is None:
                 continue
-            entity_id = row["entity_id"]
-            if not isinstance(entity_id, UUID):
-                try:
-                    entity_id = UUID(str(entity_id))
-                except (ValueError, AttributeError):
-                    continue
-            raw_roles = row["roles"]
-            roles = [str(r) for r in raw_roles] if isinstance(raw_roles, (list, tuple)) else []
-            result[pair] = ResolvedContact(
-                contact_id=None,
-                name=row["name"] or None,
-                roles=roles,
-                entity_id=entity_id,
-            )
+            contact = _row_to_contact(row)
+            if contact is None:
+                continue
+            result[pair] = contact
             break
+        if failed_candidates.isdisjoint(pair_candidates):
+            cache.store(
+                pair,
+                result[pair],
+                pair_candidates,
+                generation=generation,
+                digits_sensitive=any(p == _PHONE_DIGITS_PREDICATE for p, _ in pair_candidates),
+            )
 
     return result
 
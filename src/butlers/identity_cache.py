@@ -0,0 +1,303 @@
+"""Process-local cache for channel → entity identity resolution.
+
+:func:`butlers.identity.resolve_contact_by_channel` runs on every inbound
+message, every outbound ``notify()`` and every approval-gate check, and
+:func:`butlers.identity.resolve_contacts_by_channel_bulk` runs on every
+ingestion timeline page.  Each call walks a fallback chain of up to seven
+``relationship.entity_facts`` lookups (plus an unindexable digits scan for
+WhatsApp phones) to answer a question whose answer almost never changes.
+
+:class:`ChannelIdentityCache` memoises the resolved contact — or the
+*absence* of one, which is the common case for unknown senders — per
+``(channel_type, channel_value)`` key.  Invalidation is push-based: the
+``rel_034`` / ``core_204`` triggers send a NOTIFY on
+:data:`IDENTITY_CHANGED_CHANNEL` whenever a ``has-handle`` / ``has-email`` /
+``has-phone`` / ``has-website`` fact changes or an entity's roles or
+canonical name change, and :func:`run_identity_cache_listener` applies each
+notification, received through the process :mod:`butlers.notification_hub`,
+to the process cache.
+
+The cache only serves reads while the LISTEN connection is up: it is
+activated (and cleared) when the listener connects and deactivated (and
+cleared) when the connection is lost, so a process that cannot hear
+invalidations never answers from a possibly stale cache.  A TTL bounds the
+life of every entry as a safety net for anything the triggers cannot see.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import UUID
+
+import asyncpg
+
+from butlers.notification_hub import (
+    Notification,
+    NotificationGap,
+    NotificationHub,
+    acquire_notification_hub,
+    consume_channel,
+    release_notification_hub,
+)
+
+if TYPE_CHECKING:
+    from butlers.identity import ResolvedContact
+
+logger = logging.getLogger(__name__)
+
+#: NOTIFY channel the identity triggers publish on (rel_034, core_204).
+IDENTITY_CHANGED_CHANNEL = "butlers_identity_changed"
+
+#: Predicate whose changes can alter any digits-normalised phone match.
+_PHONE_PREDICATE = "has-phone"
+
+_DEFAULT_MAXSIZE = 4096
+_DEFAULT_TTL_S = 600.0
+
+#: Reconnect timings of a private hub (``connect=`` injection, tests only).
+_RECONNECT_BACKOFF_S = 5.0
+_HEALTH_POLL_INTERVAL_S = 5.0
+
+ChannelKey = tuple[str, str]
+Candidate = tuple[str, str]
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    contact: ResolvedContact | None
+    candidates: frozenset[Candidate]
+    digits_sensitive: bool
+
+
+class ChannelIdentityCache:
+    """LRU + TTL cache of channel resolutions, including negative results.
+
+    Entries remember the ``(predicate, object)`` candidates their resolution
+    consulted, so a changed fact drops exactly the keys it could affect:
+
+    - any entry that consulted the changed ``(predicate, object)`` pair
+      (a new handle turns a cached miss into a hit, or pre-empts a fallback);
+    - any positive entry for one of the notified entity ids (roles, name,
+      a retracted handle or a deleted entity);
+    - for ``has-phone`` changes, every entry resolved through the digits
+      comparison, whose suffix match and ambiguity check depend on all phones.
+
+    A payload that cannot be parsed clears the cache.
+
+    ``generation`` increments on every invalidation; :meth:`store` drops a
+    result computed under an older generation so a lookup racing an
+    invalidation cannot re-insert the value the invalidation removed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        ttl_s: float = _DEFAULT_TTL_S,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[ChannelKey, _Entry] = OrderedDict()
+        self.active = False
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: ChannelKey) -> tuple[bool, ResolvedContact | None]:
+        """Return ``(found, contact)``; ``(True, None)`` is a cached negative."""
+        if not self.active:
+            return False, None
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry.contact
+
+    def store(
+        self,
+        key: ChannelKey,
+        contact: ResolvedContact | None,
+        candidates: Iterable[Candidate],
+        *,
+        generation: int,
+        digits_sensitive: bool = False,
+    ) -> None:
+        """Cache *contact* for *key* unless an invalidation ran since *generation*."""
+        if not self.active or generation != self.generation:
+            return
+        self._entries[key] = _Entry(
+            expires_at=self._clock() + self._ttl_s,
+            contact=contact,
+            candidates=frozenset(candidates),
+            digits_sensitive=digits_sensitive,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def activate(self) -> None:
+        self.clear()
+        self.active = True
+
+    def deactivate(self) -> None:
+        self.active = False
+        self.clear()
+
+    def invalidate(
+        self,
+        entity_ids: Iterable[UUID] = (),
+        facts: Iterable[Candidate] = (),
+    ) -> int:
+        """Drop every entry the given entity / fact changes could affect.
+
+        Returns the number of entries removed.
+        """
+        ids = set(entity_ids)
+        changed = set(facts)
+        phone_changed = any(predicate == _PHONE_PREDICATE for predicate, _ in changed)
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if (entry.contact is not None and entry.contact.entity_id in ids)
+            or not changed.isdisjoint(entry.candidates)
+            or (phone_changed and entry.digits_sensitive)
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.generation += 1
+        self.invalidations += 1
+        return len(stale)
+
+    def apply_notification(self, payload: str) -> None:
+        """Apply one :data:`IDENTITY_CHANGED_CHANNEL` payload."""
+        try:
+            message = json.loads(payload)
+            entity_ids = [UUID(str(value)) for value in message.get("entity_ids") or ()]
+            facts = [(str(p), str(o)) for p, o in message.get("facts") or ()]
+        except (TypeError, ValueError, AttributeError):
+            logger.warning(
+                "identity_cache: malformed NOTIFY payload on %r; clearing cache",
+                IDENTITY_CHANGED_CHANNEL,
+                exc_info=True,
+            )
+            self.clear()
+            return
+        self.invalidate(entity_ids, facts)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+_CACHE = ChannelIdentityCache()
+
+
+def channel_identity_cache() -> ChannelIdentityCache:
+    """Return the process-wide channel identity cache."""
+    return _CACHE
+
+
+async def run_identity_cache_listener(
+    connect: Callable[[], Awaitable[asyncpg.Connection]] | None = None,
+    *,
+    hub: NotificationHub | None = None,
+    cache: ChannelIdentityCache | None = None,
+    reconnect_backoff_s: float = _RECONNECT_BACKOFF_S,
+    health_poll_interval_s: float = _HEALTH_POLL_INTERVAL_S,
+) -> None:
+    """Background task: keep *cache* active while LISTEN is connected.
+
+    Subscribes to the process notification hub (or *hub*; ``connect`` runs
+    a private one, see :func:`butlers.notification_hub.consume_channel`).
+    The cache is activated only once the channel is LISTENed and
+    deactivated the moment the connection is lost, because invalidations
+    sent while nobody listens are gone for good; a queue-overflow gap
+    clears it.
+    """
+    target = cache if cache is not None else _CACHE
+
+    def _on_listening(listening: bool) -> None:
+        if listening:
+            target.activate()
+        else:
+            target.deactivate()
+
+    def _handle(item: Notification | NotificationGap) -> None:
+        if isinstance(item, NotificationGap):
+            target.clear()
+        else:
+            target.apply_notification(item.payload)
+
+    try:
+        await consume_channel(
+            IDENTITY_CHANGED_CHANNEL,
+            _handle,
+            hub=hub,
+            connect=connect,
+            on_listening=_on_listening,
+            reconnect_backoff_s=reconnect_backoff_s,
+            health_poll_interval_s=health_poll_interval_s,
+        )
+    finally:
+        target.deactivate()
+
+
+_listener_task: asyncio.Task | None = None
+_listener_refs = 0
+
+
+def acquire_identity_cache_listener(fallback_db_name: str = "butlers") -> None:
+    """Start the process listener if needed and take a reference on it.
+
+    ``butlers up`` runs several daemons in one process; they share one
+    cache, and the LISTEN connection of the process notification hub.  Pair with
+    :func:`release_identity_cache_listener`.
+    """
+    global _listener_task, _listener_refs
+    _listener_refs += 1
+    acquire_notification_hub(fallback_db_name)
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(
+            run_identity_cache_listener(),
+            name="identity-cache-listener",
+        )
+
+
+async def release_identity_cache_listener() -> None:
+    """Drop a reference; the last release stops the listener."""
+    global _listener_task, _listener_refs
+    if not _listener_refs:
+        return
+    _listener_refs -= 1
+    if not _listener_refs and _listener_task is not None:
+        task, _listener_task = _listener_task, None
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await release_notification_hub()
@@ -11,6 +11,11 @@ This module contains:
 * ``collect_briefing_contributions`` — the General butler's aggregation job
   that reads all specialist contributions via ``general.v_briefing_contributions``
   and writes a combined payload to ``briefing/combined/<YYYY-MM-DD>``.
+  Contributors are read concurrently, each under its own deadline and all
+  under a global budget, so one slow specialist schema cannot hold the digest
+  back; a contributor that misses its deadline (or errors) is represented by
+  its last good contribution from ``briefing/contributor_cache`` when that is
+  recent enough, and is flagged in ``stale_butlers``.
 
 Design reference: openspec/changes/cross-butler-daily-briefing/
 Tasks reference:   openspec/changes/cross-butler-daily-briefing/tasks.md (sections 2, 3, 5)
@@ -18,8 +23,10 @@ Tasks reference:   openspec/changes/cross-butler-daily-briefing/tasks.md (sectio
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from datetime import UTC, datetime, timedelta, timezone
 from datetime import date as date_cls
 from typing import Any, TypedDict
@@ -27,7 +34,7 @@ from typing import Any, TypedDict
 import asyncpg
 
 from butlers.config import ButlerType, list_butlers
-from butlers.core.state import state_delete, state_list, state_set
+from butlers.core.state import state_delete, state_get, state_list, state_set
 from butlers.core.tool_call_capture import get_current_switchboard_client
 from butlers.core_tools._delegation import dispatch_delegated_ask
 
@@ -53,6 +60,14 @@ CONTRIBUTION_KEY_PREFIX = "briefing/daily/"
 COMBINED_KEY_PREFIX = "briefing/combined/"
 CONTRIBUTION_RETENTION_DAYS = 7
 
+# Collection deadlines for ``collect_briefing_contributions``; both can be
+# overridden per run via ``job_args`` (``contributor_timeout_s``/``budget_s``).
+CONTRIBUTOR_TIMEOUT_S = 5.0
+COLLECTION_BUDGET_S = 15.0
+CONTRIBUTOR_CACHE_KEY = "briefing/contributor_cache"
+# A cached contribution older than this is not served in place of a late one.
+STALE_CONTRIBUTION_MAX_AGE = timedelta(hours=36)
+
 # --- Relationship -> Finance birthday-gift delegation seed (bu-27dxl.5.4) ---
 # Bounded, deterministic proof-of-loop producer: NOT part of the briefing
 # envelope/composer (see openspec cross-butler-briefing-contribution:
@@ -88,6 +103,15 @@ class BriefingContribution(TypedDict):
     summary: str
 
 
+class ContributorStatus(TypedDict):
+    """Per-contributor collection outcome recorded in the combined payload."""
+
+    # "fresh" | "missing" | "invalid" | "stale" | "timeout" | "error"
+    status: str
+    elapsed_ms: int
+    stale_from: str | None  # collected_at of the cached contribution served
+
+
 class CombinedBriefingPayload(TypedDict):
     """Aggregated payload written by the General butler's aggregation job."""
 
@@ -95,6 +119,9 @@ class CombinedBriefingPayload(TypedDict):
     generated_at: str  # ISO datetime with timezone
     contributions: list[BriefingContribution]
     missing_butlers: list[str]
+    stale_butlers: list[str]
+    contributors: dict[str, ContributorStatus]
+    collection_ms: int
 
 
 # ---------------------------------------------------------------------------
@@ -1394,6 +1421,95 @@ def _get_butler_typed_specialist_butlers() -> frozenset[str]:
     return frozenset(SPECIALIST_BUTLERS) & butler_typed_names
 
 
+async def _fetch_contributor_rows(
+    pool: asyncpg.Pool, butler: str, state_key: str
+) -> list[asyncpg.Record]:
+    """Read one contributor's rows from ``general.v_briefing_contributions``.
+
+    The view is a ``UNION ALL`` of one branch per specialist schema, each
+    tagged with a constant ``butler`` column, so filtering on ``butler`` lets
+    the planner skip every other schema's branch.
+    """
+    return await pool.fetch(
+        """
+        SELECT butler, key, value
+        FROM general.v_briefing_contributions
+        WHERE butler = $1 AND key = $2
+        """,
+        butler,
+        state_key,
+    )
+
+
+def _parse_contribution_row(
+    row: Any, *, source_butler: str, date_str: str
+) -> BriefingContribution | None:
+    """Validate one view row for *source_butler*; ``None`` (with a warning) if unusable."""
+    raw_value = row["value"]
+
+    # Decode JSON if returned as string
+    if isinstance(raw_value, str):
+        try:
+            raw_value = json.loads(raw_value)
+        except (json.JSONDecodeError, ValueError):
+            logger.warning(
+                "Briefing contribution from butler=%s has invalid JSON; skipping",
+                source_butler,
+            )
+            return None
+
+    # Validate the envelope
+    try:
+        contribution = validate_contribution(raw_value)
+    except ValueError as exc:
+        logger.warning(
+            "Briefing contribution from butler=%s failed validation; skipping: %s",
+            source_butler,
+            exc,
+        )
+        return None
+
+    # Cross-check: source column must match payload butler field
+    if contribution["butler"] != source_butler:
+        logger.warning(
+            "Briefing contribution butler mismatch: view source=%r, payload butler=%r; "
+            "skipping (possible data tampering or misconfiguration)",
+            source_butler,
+            contribution["butler"],
+        )
+        return None
+
+    # Cross-check: contribution date must match aggregation date
+    if contribution["date"] != date_str:
+        logger.warning(
+            "Briefing contribution date mismatch for butler=%s: payload date=%r, expected=%r; "
+            "skipping",
+            source_butler,
+            contribution["date"],
+            date_str,
+        )
+        return None
+
+    return contribution
+
+
+def _cached_contribution(
+    cache: dict[str, Any], butler: str, *, now: datetime
+) -> tuple[BriefingContribution, str] | None:
+    """Return *butler*'s cached ``(contribution, collected_at)`` if still servable."""
+    entry = cache.get(butler)
+    if not isinstance(entry, dict):
+        return None
+    try:
+        collected_at = datetime.fromisoformat(entry["collected_at"])
+        contribution = validate_contribution(entry["contribution"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if contribution["butler"] != butler or now - collected_at > STALE_CONTRIBUTION_MAX_AGE:
+        return None
+    return contribution, entry["collected_at"]
+
+
 async def collect_briefing_contributions(
     pool: asyncpg.Pool,
     job_args: dict[str, Any] | None,
@@ -1403,20 +1519,36 @@ async def collect_briefing_contributions(
     Steps:
     1. Determine today's date in SGT.
     2. Build the expected set of butler-typed specialist agents (excludes staffers).
-    3. Query ``general.v_briefing_contributions`` for today's date.
+    3. Read each contributor's row for today from ``general.v_briefing_contributions``
+       concurrently, each read bounded by ``contributor_timeout_s`` and the
+       whole collection by ``budget_s``; reads still running at the budget
+       are cancelled.
     4. Validate each contribution; log warnings for malformed entries.
-    5. Assemble combined payload with ``contributions`` and ``missing_butlers``.
-    6. Write to ``briefing/combined/<date>`` via state_set.
+    5. Serve a contributor that timed out or errored from its cached last good
+       contribution (``briefing/contributor_cache``) when it is younger than
+       ``STALE_CONTRIBUTION_MAX_AGE``; refresh the cache with today's fresh ones.
+    6. Assemble combined payload with ``contributions``, ``missing_butlers``,
+       ``stale_butlers`` and per-contributor status and timing.
+    7. Write to ``briefing/combined/<date>`` via state_set.
 
     Args:
         pool: asyncpg connection pool for the General butler's database.
-        job_args: Optional job arguments (currently unused; reserved for future use).
+        job_args: Optional job arguments: ``contributor_timeout_s`` (default
+            ``CONTRIBUTOR_TIMEOUT_S``) and ``budget_s`` (default
+            ``COLLECTION_BUDGET_S``).
 
     Returns:
         Summary dict with ``date``, ``contributions_count``, ``missing_count``,
-        ``missing_butlers``, and ``state_key``.
+        ``missing_butlers``, ``stale_count``, ``stale_butlers``,
+        ``collection_ms``, and ``state_key``.
+
+    Raises:
+        Exception: the first read error when every contributor's read failed
+            (the view is missing or its grants are broken).
     """
-    del job_args  # reserved for future parameterisation
+    args = job_args or {}
+    contributor_timeout_s = float(args.get("contributor_timeout_s", CONTRIBUTOR_TIMEOUT_S))
+    budget_s = float(args.get("budget_s", COLLECTION_BUDGET_S))
 
     date_str = today_sgt().isoformat()
     contribution_state_key = contribution_key(date_str)
@@ -1424,123 +1556,168 @@ async def collect_briefing_contributions(
     # ---------------------------------------------------------------------------
     # Determine expected contributors — butler-typed agents only (no staffers)
     # ---------------------------------------------------------------------------
-    expected_specialist_butlers = _get_butler_typed_specialist_butlers()
+    expected_specialist_butlers = sorted(_get_butler_typed_specialist_butlers())
 
     # ---------------------------------------------------------------------------
-    # Query the cross-schema view for today's contributions
+    # Read every contributor concurrently under its deadline and the budget
     # ---------------------------------------------------------------------------
-    try:
-        rows = await pool.fetch(
-            """
-            SELECT butler, key, value
-            FROM general.v_briefing_contributions
-            WHERE key = $1
-            """,
-            contribution_state_key,
-        )
-    except Exception:
-        logger.exception(
+    started = time.monotonic()
+
+    async def _timed_read(butler: str) -> tuple[str, Any, float]:
+        t0 = time.monotonic()
+        try:
+            rows = await asyncio.wait_for(
+                _fetch_contributor_rows(pool, butler, contribution_state_key),
+                timeout=contributor_timeout_s,
+            )
+        except TimeoutError as exc:
+            return "timeout", exc, time.monotonic() - t0
+        except Exception as exc:
+            return "error", exc, time.monotonic() - t0
+        return "ok", rows, time.monotonic() - t0
+
+    tasks = {asyncio.create_task(_timed_read(b)): b for b in expected_specialist_butlers}
+    pending: set[asyncio.Task[tuple[str, Any, float]]] = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=budget_s)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    outcomes: dict[str, tuple[str, Any, float]] = {}
+    for task, butler in tasks.items():
+        if task in pending:
+            outcomes[butler] = ("timeout", None, time.monotonic() - started)
+        else:
+            outcomes[butler] = task.result()
+
+    errors = [result for status, result, _ in outcomes.values() if status == "error"]
+    if errors and len(errors) == len(outcomes):
+        logger.error(
             "Failed to query general.v_briefing_contributions for date=%s; "
             "check that the view exists and SELECT grants are active",
             date_str,
+            exc_info=errors[0],
         )
-        raise
+        raise errors[0]
 
     # ---------------------------------------------------------------------------
     # Validate contributions; track which specialists are present
     # ---------------------------------------------------------------------------
     contributions: list[BriefingContribution] = []
-    seen_butlers: set[str] = set()
-
-    for row in rows:
-        source_butler: str = row["butler"]
-        raw_value = row["value"]
-
-        # Only aggregate contributions from butler-typed specialist agents
-        if source_butler not in expected_specialist_butlers:
-            logger.warning(
-                "Briefing contribution from unexpected butler=%s; "
-                "skipping (not a butler-typed specialist agent)",
-                source_butler,
-            )
-            continue
-
-        # Decode JSON if returned as string
-        if isinstance(raw_value, str):
-            try:
-                raw_value = json.loads(raw_value)
-            except (json.JSONDecodeError, ValueError):
+    contributors: dict[str, ContributorStatus] = {}
+    fresh: dict[str, BriefingContribution] = {}
+    late_butlers: list[str] = []
+
+    for butler, (status, result, elapsed_s) in outcomes.items():
+        elapsed_ms = int(elapsed_s * 1000)
+        if status != "ok":
+            if status == "error":
                 logger.warning(
-                    "Briefing contribution from butler=%s has invalid JSON; skipping",
-                    source_butler,
+                    "Briefing contribution read failed for butler=%s: %s", butler, result
                 )
-                continue
-
-        # Validate the envelope
-        try:
-            contribution = validate_contribution(raw_value)
-        except ValueError as exc:
-            logger.warning(
-                "Briefing contribution from butler=%s failed validation; skipping: %s",
-                source_butler,
-                exc,
+            else:
+                logger.warning(
+                    "Briefing contribution read for butler=%s missed its deadline after %d ms",
+                    butler,
+                    elapsed_ms,
+                )
+            contributors[butler] = ContributorStatus(
+                status=status, elapsed_ms=elapsed_ms, stale_from=None
             )
+            late_butlers.append(butler)
             continue
 
-        # Cross-check: source column must match payload butler field
-        if contribution["butler"] != source_butler:
-            logger.warning(
-                "Briefing contribution butler mismatch: view source=%r, payload butler=%r; "
-                "skipping (possible data tampering or misconfiguration)",
-                source_butler,
-                contribution["butler"],
-            )
-            continue
+        contribution = None
+        for row in result:
+            contribution = _parse_contribution_row(row, source_butler=butler, date_str=date_str)
+            if contribution is not None:
+                break
+        if contribution is None:
+            status = "invalid" if result else "missing"
+        else:
+            status = "fresh"
+            fresh[butler] = contribution
+            contributions.append(contribution)
+        contributors[butler] = ContributorStatus(
+            status=status, elapsed_ms=elapsed_ms, stale_from=None
+        )
 
-        # Cross-check: contribution date must match aggregation date
-        if contribution["date"] != date_str:
-            logger.warning(
-                "Briefing contribution date mismatch for butler=%s: payload date=%r, expected=%r; "
-                "skipping",
-                source_butler,
-                contribution["date"],
-                date_str,
-            )
+    # ---------------------------------------------------------------------------
+    # Serve late contributors from the cache; refresh it with today's reads
+    # ---------------------------------------------------------------------------
+    now = datetime.now(tz=UTC)
+    generated_at = now.isoformat()
+    stale_butlers: list[str] = []
+    try:
+        cache = await state_get(pool, CONTRIBUTOR_CACHE_KEY)
+    except Exception:
+        logger.warning("Briefing contributor cache unavailable", exc_info=True)
+        cache = None
+    if not isinstance(cache, dict):
+        cache = {}
+
+    for butler in late_butlers:
+        cached = _cached_contribution(cache, butler, now=now)
+        if cached is None:
             continue
-
-        seen_butlers.add(source_butler)
+        contribution, collected_at = cached
         contributions.append(contribution)
+        stale_butlers.append(butler)
+        contributors[butler]["status"] = "stale"
+        contributors[butler]["stale_from"] = collected_at
+
+    if fresh:
+        for butler, contribution in fresh.items():
+            cache[butler] = {"contribution": contribution, "collected_at": generated_at}
+        try:
+            await state_set(pool, CONTRIBUTOR_CACHE_KEY, cache)
+        except Exception:
+            logger.warning("Failed to refresh briefing contributor cache", exc_info=True)
 
     # Sort contributions by butler name for deterministic output
     contributions.sort(key=lambda c: c["butler"])
 
-    missing_butlers = sorted(expected_specialist_butlers - seen_butlers)
+    present = set(fresh) | set(stale_butlers)
+    missing_butlers = sorted(set(expected_specialist_butlers) - present)
+    collection_ms = int((time.monotonic() - started) * 1000)
 
     if missing_butlers:
         logger.info(
             "Daily briefing aggregation: missing contributions from %s",
             missing_butlers,
         )
+    if stale_butlers:
+        logger.info(
+            "Daily briefing aggregation: serving cached contributions for %s",
+            stale_butlers,
+        )
 
     # ---------------------------------------------------------------------------
     # Assemble and write combined payload
     # ---------------------------------------------------------------------------
-    generated_at = datetime.now(tz=UTC).isoformat()
     payload: CombinedBriefingPayload = CombinedBriefingPayload(
         date=date_str,
         generated_at=generated_at,
         contributions=contributions,
         missing_butlers=missing_butlers,
+        stale_butlers=stale_butlers,
+        contributors=contributors,
+        collection_ms=collection_ms,
     )
 
     state_key = combined_key(date_str)
     version = await state_set(pool, state_key, payload)
 
     logger.info(
-        "Daily briefing combined payload written: key=%s, contributions=%d, missing=%d, version=%d",
+        "Daily briefing combined payload written: key=%s, contributions=%d, missing=%d, "
+        "stale=%d, collection_ms=%d, version=%d",
         state_key,
         len(contributions),
         len(missing_butlers),
+        len(stale_butlers),
+        collection_ms,
         version,
     )
 
@@ -1549,6 +1726,9 @@ async def collect_briefing_contributions(
         "contributions_count": len(contributions),
         "missing_count": len(missing_butlers),
         "missing_butlers": missing_butlers,
+        "stale_count": len(stale_butlers),
+        "stale_butlers": stale_butlers,
+        "collection_ms": collection_ms,
         "state_key": state_key,
     }
 
@@ -1676,9 +1856,12 @@ async def run_lifestyle_briefing_contribution(
     }
 
 
-async def run_collect_briefing_contributions(*, pool: asyncpg.Pool) -> dict[str, Any]:
+async def run_collect_briefing_contributions(
+    *, pool: asyncpg.Pool, job_args: dict[str, Any] | None = None
+) -> dict[str, Any]:
     """Compat shim: daemon registry calls this keyword-only form.
 
-    Delegates to ``collect_briefing_contributions`` with ``job_args=None``.
+    Delegates to ``collect_briefing_contributions``, forwarding *job_args*
+    (collection deadline overrides).
     """
-    return await collect_briefing_contributions(pool, None)
+    return await collect_briefing_contributions(pool, job_args)
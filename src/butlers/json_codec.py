@@ -0,0 +1,171 @@
+"""Process-wide JSON serializer: orjson when installed, stdlib ``json`` otherwise.
+
+JSON encoding sits on the hottest paths in the stack: every JSONB value
+crossing the asyncpg codec (ingest envelopes, ``request_context``, session
+``tool_calls``, state values), every fleet-event NOTIFY payload and every
+dashboard SSE/WebSocket frame.  This module is the single place those paths
+serialize through, so the backend can be swapped without touching call sites.
+
+Backend selection happens once at import:
+
+- ``BUTLERS_JSON_BACKEND=orjson`` — use orjson (falls back to stdlib with a
+  warning if it is not installed);
+- ``BUTLERS_JSON_BACKEND=stdlib`` — always use :mod:`json`;
+- unset / ``auto`` — orjson if importable, else stdlib.
+
+Both backends emit the same bytes: compact separators (``,`` and ``:``) and
+UTF-8 output without ASCII escaping, which is orjson's only format, so the
+stdlib path is configured to match it.  Whatever orjson cannot serialize
+(integers wider than 64 bits, lone surrogates) is retried with the stdlib
+encoder, so the result or the error is the stdlib one.  datetimes and
+dataclasses are routed through *default* exactly as with stdlib rather than
+serialized natively.
+
+Non-finite floats are rejected with ``allow_nan=False`` (the JSONB codec
+always passes it): both backends raise the stdlib ``ValueError``.  With the
+default ``allow_nan=True`` they encode as ``null`` under orjson and as
+``NaN`` / ``Infinity`` under stdlib.
+
+``uuid.UUID`` values encode as their string form on both backends, which
+orjson does natively.  This is an intended change from plain ``json.dumps``,
+which raised ``TypeError`` for them, JSONB writes included.
+
+Remaining divergences, none of which reach PostgreSQL ``jsonb`` (which
+normalizes numerics on input):
+
+- float exponents are written ``1e16`` by orjson and ``1e+16`` by stdlib;
+- orjson natively encodes ``enum.Enum`` and NumPy values that stdlib would
+  hand to *default*.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "BUTLERS_JSON_BACKEND"
+
+# orjson is an optional dependency — every function has a stdlib fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_STDLIB_SEPARATORS = (",", ":")
+
+
+def _select_backend() -> str:
+    requested = os.environ.get(BACKEND_ENV, "").strip().lower() or "auto"
+    if requested not in {"auto", "orjson", "stdlib"}:
+        logger.warning("Ignoring invalid %s=%r", BACKEND_ENV, requested)
+        requested = "auto"
+    if requested == "stdlib":
+        return "stdlib"
+    if orjson is None:
+        if requested == "orjson":
+            logger.warning("%s=orjson but orjson is not installed; using stdlib", BACKEND_ENV)
+        return "stdlib"
+    return "orjson"
+
+
+BACKEND = _select_backend()
+
+
+def _uuid_default(default: Callable[[Any], Any] | None) -> Callable[[Any], Any]:
+    """Wrap *default* so stdlib encodes ``uuid.UUID`` as orjson does."""
+
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, uuid.UUID):
+            return str(obj)
+        if default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return default(obj)
+
+    return _default
+
+
+def _stdlib_dumps(
+    obj: Any, default: Callable[[Any], Any] | None = None, allow_nan: bool = True
+) -> str:
+    return json.dumps(
+        obj,
+        separators=_STDLIB_SEPARATORS,
+        ensure_ascii=False,
+        allow_nan=allow_nan,
+        default=_uuid_default(default),
+    )
+
+
+def _stdlib_dumps_bytes(
+    obj: Any, default: Callable[[Any], Any] | None = None, allow_nan: bool = True
+) -> bytes:
+    return _stdlib_dumps(obj, default, allow_nan).encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, list | tuple):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _orjson_dumps_bytes(
+        obj: Any, default: Callable[[Any], Any] | None = None, allow_nan: bool = True
+    ) -> bytes:
+        try:
+            encoded = orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return _stdlib_dumps_bytes(obj, default, allow_nan)
+        # orjson writes non-finite floats as null; only then is the scan paid.
+        if not allow_nan and b"null" in encoded and _has_non_finite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return encoded
+
+    def _orjson_loads(data: str | bytes | bytearray | memoryview) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Integers wider than 64 bits and NaN/Infinity tokens are valid for
+            # the stdlib decoder; genuinely malformed input raises from it too.
+            return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def dumps_bytes(
+    obj: Any, *, default: Callable[[Any], Any] | None = None, allow_nan: bool = True
+) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON bytes.
+
+    With ``allow_nan=False`` non-finite floats raise :class:`ValueError`.
+    """
+    if BACKEND == "orjson":
+        return _orjson_dumps_bytes(obj, default, allow_nan)
+    return _stdlib_dumps_bytes(obj, default, allow_nan)
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None, allow_nan: bool = True) -> str:
+    """Serialize *obj* to a compact JSON string."""
+    if BACKEND == "orjson":
+        return _orjson_dumps_bytes(obj, default, allow_nan).decode("utf-8")
+    return _stdlib_dumps(obj, default, allow_nan)
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Deserialize JSON text or UTF-8 bytes."""
+    if BACKEND == "orjson":
+        return _orjson_loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
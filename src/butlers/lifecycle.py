@@ -34,6 +34,10 @@ from butlers.core.scheduler import sync_schedules
 from butlers.core.skills import get_skills_dir
 from butlers.core.spawner import Spawner
 from butlers.core.telemetry import init_telemetry
+from butlers.credential_cache import (
+    acquire_credential_cache_listener,
+    release_credential_cache_listener,
+)
 from butlers.credentials import (
     detect_secrets,
     validate_credentials,
@@ -42,10 +46,18 @@ from butlers.credentials import (
 from butlers.daemon_utils import _flatten_config_for_secret_scan
 from butlers.db import Database
 from butlers.exceptions import RuntimeBinaryNotFoundError
+from butlers.identity_cache import (
+    acquire_identity_cache_listener,
+    release_identity_cache_listener,
+)
 from butlers.migrations import has_butler_chain, run_migrations
 from butlers.module_state import ModuleStartupStatus
 from butlers.owner_bootstrap import _ensure_owner_entity
-from butlers.storage import BlobStorageStartupError, S3BlobStore
+from butlers.storage import BlobStorageStartupError, DiskBlobCache, S3BlobStore
+from butlers.tools.attachment_derivatives import (
+    acquire_derivation_executor,
+    release_derivation_executor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -113,12 +125,15 @@ async def run_startup(daemon: Any) -> None:
 
     # 6. Provision database
     # If db was injected (e.g., for testing), skip provisioning
-    if daemon.db is None:
+    db_from_env = daemon.db is None
+    if db_from_env:
         daemon.db = Database.from_env(daemon.config.db_name)
         daemon.db.set_schema(daemon.config.db_schema)
         if daemon.config.db_schema:
             daemon.db.role = f"butler_{daemon.config.db_schema}_rw"
         await daemon.db.provision()
+        # Set before connect: a shared-pool lease keys its fair share by butler.
+        daemon.db.owner_butler = daemon.config.name
         pool = await daemon.db.connect()
     else:
         # Database already provisioned and connected externally
@@ -178,6 +193,10 @@ async def run_startup(daemon: Any) -> None:
                 )
                 logger.warning("Module '%s' disabled: migration failed: %s", mod.name, error_msg)
     daemon._cascade_module_failures()
+    # The pool connected before migrating; later connections prepare against
+    # the migrated schema.
+    if isinstance(daemon.db, Database):
+        daemon.db.invalidate_statement_schema()
 
     # 8b. Create layered CredentialStore and validate module credentials
     # (non-fatal per-module).
@@ -213,7 +232,8 @@ async def run_startup(daemon: Any) -> None:
 
     # 8c. Initialize S3-compatible blob storage.
     # All S3 parameters are resolved from CredentialStore (DB-only, no env
-    # fallback) — managed via the dashboard secrets UI at /secrets.
+    # fallback) — managed via the dashboard secrets UI at /secrets.  The local
+    # read-through cache is process configuration and comes from the env.
     s3_endpoint = await credential_store.resolve("BLOB_S3_ENDPOINT_URL", env_fallback=False)
     s3_bucket = await credential_store.resolve("BLOB_S3_BUCKET", env_fallback=False)
     s3_region = await credential_store.resolve("BLOB_S3_REGION", env_fallback=False)
@@ -234,6 +254,7 @@ async def run_startup(daemon: Any) -> None:
             access_key_id=s3_access_key,
             secret_access_key=s3_secret_key,
             region=s3_region or "us-east-1",
+            cache=DiskBlobCache.from_env(daemon.config.name),
         )
         try:
             await blob_store.startup_check()
@@ -246,6 +267,7 @@ async def run_startup(daemon: Any) -> None:
             daemon.blob_store = None
         else:
             daemon.blob_store = blob_store
+            acquire_derivation_executor()
 
     # 8c2. Restore CLI auth tokens from DB to filesystem (non-fatal).
     #      Ensures LLM runtime CLIs have their auth files (e.g. OpenCode's
@@ -359,6 +381,38 @@ async def run_startup(daemon: Any) -> None:
         default_timezone=default_timezone,
     )
 
+    # 10b. Sessions partition maintenance (core_202). Make sure this month's
+    #      and next month's partitions exist before the first session insert,
+    #      then register the nightly maintenance job as a DB-owned default for
+    #      butlers whose deterministic registry can dispatch it. Best-effort.
+    try:
+        from butlers.core.scheduler import ensure_module_default_schedule
+        from butlers.core.session_partitions import (
+            SESSIONS_PARTITION_JOB_CRON,
+            SESSIONS_PARTITION_JOB_NAME,
+            ensure_session_partitions,
+        )
+        from butlers.scheduled_jobs import get_deterministic_schedule_job_registry
+
+        await ensure_session_partitions(pool)
+        butler_jobs = get_deterministic_schedule_job_registry().get(daemon.config.name, {})
+        if SESSIONS_PARTITION_JOB_NAME in butler_jobs:
+            await ensure_module_default_schedule(
+                pool,
+                name=SESSIONS_PARTITION_JOB_NAME,
+                cron=SESSIONS_PARTITION_JOB_CRON,
+                job_name=SESSIONS_PARTITION_JOB_NAME,
+                owner_butler=daemon.config.name,
+                owner_schema=daemon.config.db_schema or "public",
+            )
+    except Exception:
+        logger.warning(
+            "sessions partition maintenance setup failed for butler=%s "
+            "(best-effort, startup continues)",
+            daemon.config.name,
+            exc_info=True,
+        )
+
     # 11. Call module on_startup (non-fatal per-module)
     started_modules: list[Any] = []
     for mod in daemon._modules:
@@ -502,6 +556,16 @@ async def run_startup(daemon: Any) -> None:
     # 17. Start liveness reporter (all butlers, including switchboard)
     daemon._liveness_reporter_task = asyncio.create_task(daemon._liveness_reporter_loop())
 
+    # 17b. Share the process-wide cache-invalidation listeners; both ride the
+    # one LISTEN connection of butlers.notification_hub.  The channel
+    # identity cache only serves reads while that connection is up, so
+    # daemons with an injected (test) database never activate it; the
+    # credential cache falls back to its TTL without one.
+    if db_from_env:
+        acquire_identity_cache_listener(daemon.db.db_name)
+        acquire_credential_cache_listener(daemon.db.db_name)
+        daemon._cache_listeners_acquired = True
+
     # Mark as accepting connections and record startup time
     daemon._accepting_connections = True
     daemon._started_at = time.monotonic()
@@ -557,6 +621,7 @@ async def run_shutdown(daemon: Any) -> None:
     4. Cancel switchboard heartbeat
     5. Close Switchboard MCP client
     5b. Cancel internal scheduler loop (wait for in-progress tick() to finish)
+    5e. Release the shared cache-invalidation listeners
     6. Module on_shutdown in reverse topological order
     7. Close DB pool
     """
@@ -646,6 +711,12 @@ async def run_shutdown(daemon: Any) -> None:
             pass
         daemon._liveness_reporter_task = None
 
+    # 5e. Release the shared cache-invalidation listeners
+    if daemon._cache_listeners_acquired:
+        daemon._cache_listeners_acquired = False
+        await release_identity_cache_listener()
+        await release_credential_cache_listener()
+
     # 6. Module shutdown in reverse topological order (active modules only)
     active_set = {m.name for m in daemon._active_modules}
     for mod in reversed(daemon._modules):
@@ -660,6 +731,9 @@ async def run_shutdown(daemon: Any) -> None:
     if daemon.blob_store is not None:
         await daemon.blob_store.close()
         daemon.blob_store = None
+        # Other butlers in this process may still be deriving; the pool stops
+        # with the last holder.
+        release_derivation_executor()
 
     # 6c. Detach the butler DB log handler before tearing down the pool so
     # in-flight fire-and-forget writes can finish and no new writes are
@@ -33,6 +33,7 @@ from butlers.core.permissions import CALENDAR_WRITE_PERMISSION, require_permissi
 from butlers.core.scheduler import schedule_create as _schedule_create
 from butlers.core.scheduler import schedule_delete as _schedule_delete
 from butlers.core.scheduler import schedule_update as _schedule_update
+from butlers.core.scheduler_wheel import KIND_CALENDAR_END, invalidate_scheduler_wheel
 from butlers.core.state import state_get as _state_get
 from butlers.core.state import state_set as _state_set
 from butlers.core.temporal.scheduling import (
@@ -7803,6 +7804,7 @@ class CalendarModule(Module):
             effective_source_butler,
             normalized_source_session_id,
         )
+        invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
         if row is None:
             raise RuntimeError("Projection upsert did not return calendar_events.id")
         return row["id"]
@@ -8007,6 +8009,7 @@ class CalendarModule(Module):
         )
         if row is None:
             return None
+        invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
 
         event_id: uuid.UUID = row["id"]
         await pool.execute(
@@ -8056,6 +8059,7 @@ class CalendarModule(Module):
                 """,
                 source_id,
             )
+        invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
 
         await pool.execute(
             """
@@ -10496,6 +10500,7 @@ class CalendarModule(Module):
         )
         if row is None:
             raise RuntimeError("Failed to insert reminder into calendar_events")
+        invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
 
         event_id: uuid.UUID = row["id"]
 
@@ -10594,118 +10599,124 @@ class CalendarModule(Module):
         if pool is None:
             raise RuntimeError("Database pool is not available")
 
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                row = await conn.fetchrow(
-                    """
-                    SELECT e.*
-                    FROM calendar_events e
-                    JOIN calendar_sources s ON s.id = e.source_id
-                    WHERE e.id = $1
-                      AND s.source_kind = $2
-                      AND e.source_butler = $3
-                    FOR UPDATE OF e
-                    """,
-                    reminder_id,
-                    SOURCE_KIND_INTERNAL_REMINDERS,
-                    self._resolve_effective_butler_name(),
-                )
-                if row is None:
-                    raise ValueError(f"Native reminder {reminder_id} not found")
-                existing = dict(row)
-
-                effective_start = start_at or existing["starts_at"]
-                effective_end = end_at or existing["ends_at"]
-                if effective_start.tzinfo is None:
-                    raise ValueError("start_at must be timezone-aware")
-                if effective_end.tzinfo is None:
-                    raise ValueError("end_at must be timezone-aware")
-                if effective_end <= effective_start:
-                    raise ValueError("end_at must be after start_at")
-
-                updates: list[str] = []
-                params: list[Any] = [reminder_id]
-                index = 2
-
-                def add(column: str, value: Any) -> None:
-                    nonlocal index
-                    updates.append(f"{column} = ${index}")
-                    params.append(value)
-                    index += 1
-
-                if title is not None:
-                    normalized_title = title.strip()
-                    if not normalized_title:
-                        raise ValueError("title must be a non-empty string")
-                    add("title", normalized_title)
-                if body is not None:
-                    add("body", _normalize_optional_text(body))
-                if start_at is not None:
-                    add("starts_at", start_at)
-                if end_at is not None:
-                    add("ends_at", end_at)
-                if timezone is not None:
-                    normalized_timezone = timezone.strip()
-                    _ensure_valid_timezone(normalized_timezone)
-                    add("timezone", normalized_timezone)
-
-                recurrence_changed = recurrence_rule is not None or until_at is not None
-                effective_rule = (
-                    _normalize_recurrence_rule(recurrence_rule)
-                    if recurrence_rule is not None
-                    else existing.get("recurrence_rule")
-                )
-                if until_at is not None:
-                    if effective_rule is None:
-                        raise ValueError(
-                            "until_at requires recurrence_rule for butler_reminder events"
-                        )
-                    effective_rule = _recurrence_lines_bound_until([effective_rule], until_at)[0]
-                if recurrence_changed:
-                    add("recurrence_rule", effective_rule)
-                if enabled is not None:
-                    add("status", "confirmed" if enabled else "cancelled")
-
-                if not updates:
-                    return existing
-
-                updated = await conn.fetchrow(
-                    f"""
-                    UPDATE calendar_events
-                    SET {", ".join(updates)}, updated_at = now()
-                    WHERE id = $1
-                    RETURNING *
-                    """,
-                    *params,
-                )
-                if updated is None:
-                    raise RuntimeError(f"Failed to update native reminder {reminder_id}")
-                result = dict(updated)
-
-                if start_at is not None or end_at is not None or recurrence_changed:
-                    await conn.execute(
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    row = await conn.fetchrow(
                         """
-                        DELETE FROM calendar_event_instances
-                        WHERE event_id = $1
-                          AND starts_at > now()
-                          AND status = 'confirmed'
-                          AND metadata->>'notified_at' IS NULL
+                        SELECT e.*
+                        FROM calendar_events e
+                        JOIN calendar_sources s ON s.id = e.source_id
+                        WHERE e.id = $1
+                          AND s.source_kind = $2
+                          AND e.source_butler = $3
+                        FOR UPDATE OF e
                         """,
                         reminder_id,
+                        SOURCE_KIND_INTERNAL_REMINDERS,
+                        self._resolve_effective_butler_name(),
                     )
-                    if result.get("recurrence_rule") and result.get("status") != "cancelled":
-                        await self._materialize_native_reminder_instances(
+                    if row is None:
+                        raise ValueError(f"Native reminder {reminder_id} not found")
+                    existing = dict(row)
+
+                    effective_start = start_at or existing["starts_at"]
+                    effective_end = end_at or existing["ends_at"]
+                    if effective_start.tzinfo is None:
+                        raise ValueError("start_at must be timezone-aware")
+                    if effective_end.tzinfo is None:
+                        raise ValueError("end_at must be timezone-aware")
+                    if effective_end <= effective_start:
+                        raise ValueError("end_at must be after start_at")
+
+                    updates: list[str] = []
+                    params: list[Any] = [reminder_id]
+                    index = 2
+
+                    def add(column: str, value: Any) -> None:
+                        nonlocal index
+                        updates.append(f"{column} = ${index}")
+                        params.append(value)
+                        index += 1
+
+                    if title is not None:
+                        normalized_title = title.strip()
+                        if not normalized_title:
+                            raise ValueError("title must be a non-empty string")
+                        add("title", normalized_title)
+                    if body is not None:
+                        add("body", _normalize_optional_text(body))
+                    if start_at is not None:
+                        add("starts_at", start_at)
+                    if end_at is not None:
+                        add("ends_at", end_at)
+                    if timezone is not None:
+                        normalized_timezone = timezone.strip()
+                        _ensure_valid_timezone(normalized_timezone)
+                        add("timezone", normalized_timezone)
+
+                    recurrence_changed = recurrence_rule is not None or until_at is not None
+                    effective_rule = (
+                        _normalize_recurrence_rule(recurrence_rule)
+                        if recurrence_rule is not None
+                        else existing.get("recurrence_rule")
+                    )
+                    if until_at is not None:
+                        if effective_rule is None:
+                            raise ValueError(
+                                "until_at requires recurrence_rule for butler_reminder events"
+                            )
+                        effective_rule = _recurrence_lines_bound_until([effective_rule], until_at)[
+                            0
+                        ]
+                    if recurrence_changed:
+                        add("recurrence_rule", effective_rule)
+                    if enabled is not None:
+                        add("status", "confirmed" if enabled else "cancelled")
+
+                    if not updates:
+                        return existing
+
+                    updated = await conn.fetchrow(
+                        f"""
+                        UPDATE calendar_events
+                        SET {", ".join(updates)}, updated_at = now()
+                        WHERE id = $1
+                        RETURNING *
+                        """,
+                        *params,
+                    )
+                    if updated is None:
+                        raise RuntimeError(f"Failed to update native reminder {reminder_id}")
+                    result = dict(updated)
+
+                    if start_at is not None or end_at is not None or recurrence_changed:
+                        await conn.execute(
+                            """
+                            DELETE FROM calendar_event_instances
+                            WHERE event_id = $1
+                              AND starts_at > now()
+                              AND status = 'confirmed'
+                              AND metadata->>'notified_at' IS NULL
+                            """,
                             reminder_id,
-                            result["source_id"],
-                            recurrence_rule=result["recurrence_rule"],
-                            starts_at=result["starts_at"],
-                            ends_at=result["ends_at"],
-                            timezone=result["timezone"],
-                            window_start=result["starts_at"],
-                            executor=conn,
                         )
+                        if result.get("recurrence_rule") and result.get("status") != "cancelled":
+                            await self._materialize_native_reminder_instances(
+                                reminder_id,
+                                result["source_id"],
+                                recurrence_rule=result["recurrence_rule"],
+                                starts_at=result["starts_at"],
+                                ends_at=result["ends_at"],
+                                timezone=result["timezone"],
+                                window_start=result["starts_at"],
+                                executor=conn,
+                            )
 
-                return result
+                    return result
+        finally:
+            # After commit, so a tick cannot reload the pre-write rows.
+            invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
 
     async def _delete_native_reminder_event(
         self,
@@ -10729,104 +10740,108 @@ class CalendarModule(Module):
         if scope == "series":
             await self._delete_native_reminder_provider_copy(reminder_id)
 
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                if scope == "series":
-                    row = await conn.fetchrow(
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    if scope == "series":
+                        row = await conn.fetchrow(
+                            """
+                            DELETE FROM calendar_events e
+                            USING calendar_sources s
+                            WHERE e.id = $1
+                              AND e.source_id = s.id
+                              AND s.source_kind = $2
+                              AND e.source_butler = $3
+                            RETURNING e.id
+                            """,
+                            reminder_id,
+                            SOURCE_KIND_INTERNAL_REMINDERS,
+                            self._resolve_effective_butler_name(),
+                        )
+                        return row is not None
+
+                    event = await conn.fetchrow(
                         """
-                        DELETE FROM calendar_events e
-                        USING calendar_sources s
+                        SELECT e.recurrence_rule
+                        FROM calendar_events e
+                        JOIN calendar_sources s ON s.id = e.source_id
                         WHERE e.id = $1
-                          AND e.source_id = s.id
                           AND s.source_kind = $2
                           AND e.source_butler = $3
-                        RETURNING e.id
+                        FOR UPDATE OF e
                         """,
                         reminder_id,
                         SOURCE_KIND_INTERNAL_REMINDERS,
                         self._resolve_effective_butler_name(),
                     )
-                    return row is not None
-
-                event = await conn.fetchrow(
-                    """
-                    SELECT e.recurrence_rule
-                    FROM calendar_events e
-                    JOIN calendar_sources s ON s.id = e.source_id
-                    WHERE e.id = $1
-                      AND s.source_kind = $2
-                      AND e.source_butler = $3
-                    FOR UPDATE OF e
-                    """,
-                    reminder_id,
-                    SOURCE_KIND_INTERNAL_REMINDERS,
-                    self._resolve_effective_butler_name(),
-                )
-                if event is None:
-                    return False
-                recurrence_rule = event["recurrence_rule"]
-                if not recurrence_rule:
-                    raise ValueError(
-                        "Occurrence-scoped deletion requires a recurring native reminder"
-                    )
-                occurrence_start = instance_start_at.astimezone(UTC)
-                occurrence_exists = await conn.fetchval(
-                    """
-                    SELECT EXISTS (
-                        SELECT 1
-                        FROM calendar_event_instances
-                        WHERE event_id = $1
-                          AND starts_at = $2
+                    if event is None:
+                        return False
+                    recurrence_rule = event["recurrence_rule"]
+                    if not recurrence_rule:
+                        raise ValueError(
+                            "Occurrence-scoped deletion requires a recurring native reminder"
+                        )
+                    occurrence_start = instance_start_at.astimezone(UTC)
+                    occurrence_exists = await conn.fetchval(
+                        """
+                        SELECT EXISTS (
+                            SELECT 1
+                            FROM calendar_event_instances
+                            WHERE event_id = $1
+                              AND starts_at = $2
+                        )
+                        """,
+                        reminder_id,
+                        occurrence_start,
                     )
-                    """,
-                    reminder_id,
-                    occurrence_start,
-                )
-                if not occurrence_exists:
-                    return False
+                    if not occurrence_exists:
+                        return False
 
-                if scope == "this":
-                    row = await conn.fetchrow(
+                    if scope == "this":
+                        row = await conn.fetchrow(
+                            """
+                            UPDATE calendar_event_instances
+                            SET status = 'cancelled',
+                                is_exception = true,
+                                updated_at = now()
+                            WHERE event_id = $1
+                              AND starts_at = $2
+                            RETURNING id
+                            """,
+                            reminder_id,
+                            occurrence_start,
+                        )
+                        return row is not None
+
+                    bounded_rule = _recurrence_lines_bound_until(
+                        [recurrence_rule],
+                        occurrence_start - timedelta(seconds=1),
+                    )[0]
+                    await conn.execute(
+                        """
+                        UPDATE calendar_events
+                        SET recurrence_rule = $2, updated_at = now()
+                        WHERE id = $1
+                        """,
+                        reminder_id,
+                        bounded_rule,
+                    )
+                    result = await conn.execute(
                         """
                         UPDATE calendar_event_instances
                         SET status = 'cancelled',
                             is_exception = true,
                             updated_at = now()
                         WHERE event_id = $1
-                          AND starts_at = $2
-                        RETURNING id
+                          AND starts_at >= $2
                         """,
                         reminder_id,
                         occurrence_start,
                     )
-                    return row is not None
-
-                bounded_rule = _recurrence_lines_bound_until(
-                    [recurrence_rule],
-                    occurrence_start - timedelta(seconds=1),
-                )[0]
-                await conn.execute(
-                    """
-                    UPDATE calendar_events
-                    SET recurrence_rule = $2, updated_at = now()
-                    WHERE id = $1
-                    """,
-                    reminder_id,
-                    bounded_rule,
-                )
-                result = await conn.execute(
-                    """
-                    UPDATE calendar_event_instances
-                    SET status = 'cancelled',
-                        is_exception = true,
-                        updated_at = now()
-                    WHERE event_id = $1
-                      AND starts_at >= $2
-                    """,
-                    reminder_id,
-                    occurrence_start,
-                )
-                return result != "UPDATE 0"
+                    return result != "UPDATE 0"
+        finally:
+            # After commit, so a tick cannot reload the pre-write rows.
+            invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
 
     async def _delete_native_reminder_provider_copy(self, reminder_id: uuid.UUID) -> None:
         """Delete a native reminder's durable provider mirror before local series deletion."""
@@ -10891,6 +10906,7 @@ class CalendarModule(Module):
         )
         if row is None:
             raise ValueError(f"Native reminder {reminder_id} not found")
+        invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
         return dict(row)
 
     async def _query_reminders(
@@ -11035,6 +11051,7 @@ class CalendarModule(Module):
                 """,
                 event_id,
             )
+            invalidate_scheduler_wheel(pool, KIND_CALENDAR_END)
             return {
                 "status": "dismissed",
                 "event_id": str(event_id),
@@ -0,0 +1,94 @@
+"""Index active facts in the shared dashboard search documents.
+
+Revision ID: mem_011
+Revises: mem_010
+
+``core_206`` builds ``public.search_documents``, the single index behind
+``GET /api/search``.  This attaches ``facts`` to it: a ``SECURITY DEFINER``
+row trigger upserts a ``fact`` document (title: the content, body: subject,
+predicate and content) for every active fact and removes it once the fact is
+retracted, superseded, faded or deleted.  Existing active facts are
+backfilled.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "mem_011"
+down_revision = "mem_010"
+branch_labels = None
+depends_on = None
+
+_TITLE_MAX_CHARS = 200
+_BODY_MAX_CHARS = 2000
+
+_UPSERT_CONFLICT = """
+    ON CONFLICT (doc_kind, source_schema, source_id) DO UPDATE
+    SET title      = EXCLUDED.title,
+        body       = EXCLUDED.body,
+        snippet    = EXCLUDED.snippet,
+        sort_at    = EXCLUDED.sort_at,
+        updated_at = now()
+"""
+
+
+def _values(row: str, schema: str) -> str:
+    return f"""
+        'fact',
+        {row}.id::text,
+        {schema},
+        left({row}.content, {_TITLE_MAX_CHARS}),
+        left(concat_ws(' ', {row}.subject, {row}.predicate, {row}.content), {_BODY_MAX_CHARS}),
+        concat_ws(' · ', {row}.subject, {row}.predicate),
+        {row}.created_at
+    """
+
+
+def upgrade() -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION facts_sync_search_document()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = pg_catalog, public
+        AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' OR NEW.validity <> 'active' THEN
+                DELETE FROM public.search_documents
+                 WHERE doc_kind = 'fact'
+                   AND source_schema = TG_TABLE_SCHEMA
+                   AND source_id = COALESCE(NEW.id, OLD.id)::text;
+                RETURN NULL;
+            END IF;
+            INSERT INTO public.search_documents
+                (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+            VALUES ({_values("NEW", "TG_TABLE_SCHEMA")})
+            {_UPSERT_CONFLICT};
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE OR REPLACE TRIGGER trg_facts_search_documents
+        AFTER INSERT OR UPDATE OF subject, predicate, content, validity OR DELETE ON facts
+        FOR EACH ROW
+        EXECUTE FUNCTION facts_sync_search_document()
+    """)
+    op.execute(f"""
+        INSERT INTO public.search_documents
+            (doc_kind, source_id, source_schema, title, body, snippet, sort_at)
+        SELECT {_values("f", "current_schema()")}
+          FROM facts f
+         WHERE f.validity = 'active'
+        {_UPSERT_CONFLICT}
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_facts_search_documents ON facts")
+    op.execute("DROP FUNCTION IF EXISTS facts_sync_search_document()")
+    op.execute(
+        "DELETE FROM public.search_documents"
+        " WHERE doc_kind = 'fact' AND source_schema = current_schema()"
+    )
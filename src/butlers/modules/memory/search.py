@@ -13,6 +13,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+from butlers.db_profiler import profiled
+from butlers.db_statements import register_statement
+
 if TYPE_CHECKING:
     from asyncpg import Pool
 
@@ -49,6 +52,81 @@ _TS_CONFIG = "english"
 _RRF_K = 60
 
 
+# ---------------------------------------------------------------------------
+# Canonical search statements
+# ---------------------------------------------------------------------------
+
+
+def _search_conditions(table: str, scoped: bool) -> list[str]:
+    """Return the WHERE conditions shared by semantic and keyword search.
+
+    Parameters are positional: ``$2`` is the tenant and, when *scoped*, ``$3``
+    is the scope (the limit follows).
+    """
+    # Tenant isolation filter — always applied.
+    conditions = ["tenant_id = $2"]
+
+    # Scope filtering: facts/rules use IN ('global', scope), episodes use butler = scope.
+    # Decision-memory facts deliberately use ``<butler>:decision:<key>`` so a
+    # stable property fact can be independently upserted for each decision
+    # pattern.  They are still own-butler context, so include that namespace
+    # whenever ordinary recall asks for the owning butler's scope.
+    if scoped and table == "facts":
+        conditions.append("(scope IN ('global', $3) OR scope LIKE $3 || ':decision:%')")
+    elif scoped and table in _SCOPED_TABLES:
+        conditions.append("scope IN ('global', $3)")
+    elif scoped and table in _BUTLER_TABLES:
+        conditions.append("butler = $3")
+
+    # Facts: return live rows — 'active' and 'fading' (fading facts are still
+    # valid, lower-confidence content; effective_confidence is a scoring
+    # weight, not a hard retrieval cutoff, so they must remain searchable).
+    if table == "facts":
+        conditions.append("validity IN ('active', 'fading')")
+
+    # Rules: exclude forgotten (metadata->>'forgotten' IS NOT TRUE).
+    if table == "rules":
+        conditions.append("(metadata->>'forgotten')::boolean IS NOT TRUE")
+    return conditions
+
+
+def _build_search_statements() -> tuple[dict[tuple[str, bool], str], dict[tuple[str, bool], str]]:
+    """Register every (table, scoped) variant of the search statements once."""
+    semantic: dict[tuple[str, bool], str] = {}
+    keyword: dict[tuple[str, bool], str] = {}
+    for table in sorted(_VALID_TABLES):
+        for scoped in (False, True):
+            where = " AND ".join(_search_conditions(table, scoped))
+            limit_param = "$4" if scoped else "$3"
+            variant = f"{table}.{'scoped' if scoped else 'unscoped'}"
+            semantic[table, scoped] = register_statement(
+                f"memory.semantic_search.{variant}",
+                f"""
+                SELECT *, 1 - (embedding <=> $1) AS similarity
+                FROM {table}
+                WHERE {where}
+                ORDER BY embedding <=> $1
+                LIMIT {limit_param}
+                """,
+                relations=(table,),
+            )
+            keyword[table, scoped] = register_statement(
+                f"memory.keyword_search.{variant}",
+                f"""
+                SELECT *, ts_rank(search_vector, plainto_tsquery('{_TS_CONFIG}', $1)) AS rank
+                FROM {table}
+                WHERE search_vector @@ plainto_tsquery('{_TS_CONFIG}', $1) AND {where}
+                ORDER BY rank DESC
+                LIMIT {limit_param}
+                """,
+                relations=(table,),
+            )
+    return semantic, keyword
+
+
+_SEMANTIC_SEARCH_SQL, _KEYWORD_SEARCH_SQL = _build_search_statements()
+
+
 # ---------------------------------------------------------------------------
 # Semantic search via pgvector
 # ---------------------------------------------------------------------------
@@ -85,57 +163,14 @@ async def semantic_search(
 
     embedding_str = str(query_embedding)
 
-    # Build WHERE clause -------------------------------------------------
-    conditions: list[str] = []
-    params: list = [embedding_str]
-    param_idx = 2  # $1 is the embedding
-
-    # Tenant isolation filter — always applied.
-    conditions.append(f"tenant_id = ${param_idx}")
-    params.append(tenant_id)
-    param_idx += 1
-
-    # Scope filtering: facts/rules use IN ('global', scope), episodes use butler = scope.
-    # Decision-memory facts deliberately use ``<butler>:decision:<key>`` so a
-    # stable property fact can be independently upserted for each decision
-    # pattern.  They are still own-butler context, so include that namespace
-    # whenever ordinary recall asks for the owning butler's scope.
-    if scope is not None and table in _SCOPED_TABLES:
-        if table == "facts":
-            conditions.append(
-                f"(scope IN ('global', ${param_idx}) OR scope LIKE ${param_idx} || ':decision:%')"
-            )
-        else:
-            conditions.append(f"scope IN ('global', ${param_idx})")
-        params.append(scope)
-        param_idx += 1
-    elif scope is not None and table in _BUTLER_TABLES:
-        conditions.append(f"butler = ${param_idx}")
+    # $1 is the embedding, $2 the tenant; the optional scope precedes the limit.
+    params: list = [embedding_str, tenant_id]
+    scoped = scope is not None and table in (_SCOPED_TABLES | _BUTLER_TABLES)
+    if scoped:
         params.append(scope)
-        param_idx += 1
-
-    # Facts: return live rows — 'active' and 'fading' (fading facts are still
-    # valid, lower-confidence content; effective_confidence is a scoring
-    # weight, not a hard retrieval cutoff, so they must remain searchable).
-    if table == "facts":
-        conditions.append("validity IN ('active', 'fading')")
-
-    # Rules: exclude forgotten (metadata->>'forgotten' IS NOT TRUE).
-    if table == "rules":
-        conditions.append("(metadata->>'forgotten')::boolean IS NOT TRUE")
-
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
-
-    sql = f"""
-        SELECT *, 1 - (embedding <=> $1) AS similarity
-        FROM {table}
-        {where}
-        ORDER BY embedding <=> $1
-        LIMIT ${param_idx}
-    """
     params.append(limit)
 
-    rows = await pool.fetch(sql, *params)
+    rows = await pool.fetch(_SEMANTIC_SEARCH_SQL[table, scoped], *params)
     return [dict(r) for r in rows]
 
 
@@ -180,51 +215,13 @@ async def keyword_search(
     if not cleaned_query:
         return []
 
-    # Build WHERE clause
-    conditions = [f"search_vector @@ plainto_tsquery('{_TS_CONFIG}', $1)"]
-    params: list = [cleaned_query]
-    param_idx = 2
-
-    # Tenant isolation filter — always applied.
-    conditions.append(f"tenant_id = ${param_idx}")
-    params.append(tenant_id)
-    param_idx += 1
-
-    # See semantic_search: decision-memory fact namespaces are part of the
-    # owning butler's normal recall surface.
-    if scope is not None and table in _SCOPED_TABLES:
-        if table == "facts":
-            conditions.append(
-                f"(scope IN ('global', ${param_idx}) OR scope LIKE ${param_idx} || ':decision:%')"
-            )
-        else:
-            conditions.append(f"scope IN ('global', ${param_idx})")
-        params.append(scope)
-        param_idx += 1
-    elif scope is not None and table in _BUTLER_TABLES:
-        conditions.append(f"butler = ${param_idx}")
+    params: list = [cleaned_query, tenant_id]
+    scoped = scope is not None and table in (_SCOPED_TABLES | _BUTLER_TABLES)
+    if scoped:
         params.append(scope)
-        param_idx += 1
-
-    # See semantic_search above: fading facts remain searchable.
-    if table == "facts":
-        conditions.append("validity IN ('active', 'fading')")
-
-    if table == "rules":
-        conditions.append("(metadata->>'forgotten')::boolean IS NOT TRUE")
-
-    where = " AND ".join(conditions)
-
-    sql = f"""
-        SELECT *, ts_rank(search_vector, plainto_tsquery('{_TS_CONFIG}', $1)) AS rank
-        FROM {table}
-        WHERE {where}
-        ORDER BY rank DESC
-        LIMIT ${param_idx}
-    """
     params.append(limit)
 
-    rows = await pool.fetch(sql, *params)
+    rows = await pool.fetch(_KEYWORD_SEARCH_SQL[table, scoped], *params)
     return [dict(r) for r in rows]
 
 
@@ -458,6 +455,7 @@ def effective_confidence(
 # ---------------------------------------------------------------------------
 
 
+@profiled("memory.recall")
 async def recall(
     pool: Pool,
     topic: str,
@@ -11,7 +11,6 @@ import hashlib
 import importlib.util
 import json
 import logging
-import math
 import re
 import uuid
 from datetime import UTC, datetime, timedelta
@@ -3028,7 +3027,218 @@ async def invert_to_anti_pattern(
 # ---------------------------------------------------------------------------
 
 
-async def run_decay_sweep(pool: Pool) -> dict:
+# Rows per primary-key range the decay sweep updates in one transaction; bounds
+# how many row locks a single sweep statement holds at once.
+DECAY_SWEEP_CHUNK_SIZE = 5000
+
+# Hardcoded fallback thresholds for a retention_class missing from memory_policies.
+_DEFAULT_FADING_THRESHOLD = 0.2
+_DEFAULT_EXPIRY_THRESHOLD = 0.05
+
+# Shared prefix of both sweep statements: every candidate row in one PK range
+# with its effective confidence classified against its class thresholds.
+# ``$1``/``$2`` bound the range, ``$3`` is the sweep's ``now``; ``{lower_op}``
+# is ``>=`` for the first range and ``>`` after it.  The formula mirrors the
+# docstring below: confidence * exp(-decay_rate * days since last confirmed).
+_DECAY_CLASSIFY_SQL = """
+    WITH candidates AS (
+        SELECT m.id,
+               COALESCE(m.metadata, '{{}}'::jsonb) AS metadata,
+               m.confidence * exp(
+                   -m.decay_rate
+                   * extract(epoch FROM ($3::timestamptz
+                                         - COALESCE(m.last_confirmed_at, m.created_at)))::float8
+                   / 86400.0
+               ) AS eff,
+               COALESCE(p.min_retrieval_confidence, {fading_default}) AS fading_threshold,
+               COALESCE(p.min_retrieval_confidence * 0.25, {expiry_default}) AS expiry_threshold,
+               COALESCE(p.archive_before_delete, false) AS archive_first,
+               CASE WHEN p.retention_class IS NULL THEN m.retention_class END AS unknown_class,
+               {extra_columns}
+        FROM {table} m
+        LEFT JOIN memory_policies p ON p.retention_class = COALESCE(m.retention_class, '')
+        WHERE m.id {lower_op} $1 AND m.id <= $2 AND m.decay_rate > 0.0 AND {candidate_filter}
+        FOR UPDATE OF m
+    ),
+    classified AS (
+        SELECT *,
+               CASE WHEN eff < expiry_threshold THEN 'expired'
+                    WHEN eff < fading_threshold THEN 'fading'
+                    ELSE 'active' END AS outcome
+        FROM candidates
+    )
+"""
+
+_FACT_DECAY_SWEEP_SQL = (
+    _DECAY_CLASSIFY_SQL.rstrip()
+    + """,
+    written AS (
+        UPDATE facts f
+        SET validity = c.outcome,
+            metadata = CASE
+                WHEN c.outcome = 'expired' AND c.archive_first
+                THEN (c.metadata - 'status')
+                     || jsonb_build_object('archived_at', $4::text, 'archived_content', true)
+                ELSE c.metadata - 'status'
+            END
+        FROM classified c
+        WHERE f.id = c.id
+          AND (c.outcome = 'expired' OR c.outcome <> c.validity OR c.has_status)
+        RETURNING f.id, c.outcome, c.archive_first
+    )
+    SELECT
+        (SELECT count(*) FROM classified) AS checked,
+        (SELECT count(*) FROM classified WHERE outcome = 'fading') AS fading,
+        (SELECT count(*) FROM written WHERE outcome = 'expired') AS expired,
+        (SELECT count(*) FROM written WHERE outcome = 'expired' AND archive_first) AS archived,
+        (SELECT count(*) FROM written WHERE outcome <> 'expired') AS decayed,
+        (SELECT COALESCE(array_agg(id), '{{}}') FROM written WHERE outcome = 'expired')
+            AS expired_ids,
+        (SELECT COALESCE(array_agg(DISTINCT unknown_class), '{{}}')
+         FROM classified WHERE unknown_class IS NOT NULL) AS unknown_classes
+"""
+)
+
+_RULE_DECAY_SWEEP_SQL = (
+    _DECAY_CLASSIFY_SQL.rstrip()
+    + """,
+    written AS (
+        UPDATE rules r
+        SET metadata = CASE c.outcome
+                WHEN 'expired' THEN c.metadata || '{{"forgotten": true}}'::jsonb
+                WHEN 'fading' THEN c.metadata || '{{"status": "fading"}}'::jsonb
+                ELSE c.metadata - 'status'
+            END
+        FROM classified c
+        WHERE r.id = c.id
+          AND (
+              c.outcome = 'expired'
+              OR (c.outcome = 'fading') <> c.is_fading
+          )
+        RETURNING r.id, c.outcome
+    )
+    SELECT
+        (SELECT count(*) FROM classified) AS checked,
+        (SELECT count(*) FROM classified WHERE outcome = 'fading') AS fading,
+        (SELECT count(*) FROM written WHERE outcome = 'expired') AS expired,
+        0 AS archived,
+        (SELECT count(*) FROM written WHERE outcome <> 'expired') AS decayed,
+        (SELECT COALESCE(array_agg(id), '{{}}') FROM written WHERE outcome = 'expired')
+            AS expired_ids,
+        (SELECT COALESCE(array_agg(DISTINCT unknown_class), '{{}}')
+         FROM classified WHERE unknown_class IS NOT NULL) AS unknown_classes
+"""
+)
+
+# Per-table shape of the sweep: which rows are candidates, and the extra
+# columns the write predicate needs to skip rows already in their target state.
+_DECAY_SWEEP_TABLES: dict[str, tuple[str, str, str]] = {
+    # validity IN ('active', 'fading') so already-fading facts are re-evaluated
+    # each run (able to recover to 'active' or progress to 'expired') instead of
+    # getting stuck the moment they first fade.
+    "facts": (
+        _FACT_DECAY_SWEEP_SQL,
+        "m.validity IN ('active', 'fading')",
+        "m.validity, m.metadata->>'status' IS NOT NULL AS has_status",
+    ),
+    "rules": (
+        _RULE_DECAY_SWEEP_SQL,
+        "m.maturity != 'anti_pattern' AND (m.metadata->>'forgotten')::boolean IS NOT TRUE",
+        "COALESCE(m.metadata->>'status' = 'fading', false) AS is_fading",
+    ),
+}
+
+
+async def _decay_sweep_table(
+    pool: Pool,
+    table: str,
+    *,
+    now: datetime,
+    chunk_size: int,
+) -> dict[str, Any]:
+    """Sweep one table in primary-key ranges of *chunk_size* rows.
+
+    Each range is classified and updated by a single ``UPDATE ... FROM``
+    statement in its own transaction, together with the catalog disownment of
+    the rows it expired, so locks are held for one range at a time.  A range
+    whose transaction fails is logged and left unchanged (fail-closed, exactly
+    like the old per-row path's skip), and the sweep moves on.
+    """
+    sweep_sql, candidate_filter, extra_columns = _DECAY_SWEEP_TABLES[table]
+    totals = {
+        "checked": 0,
+        "fading": 0,
+        "expired": 0,
+        "archived": 0,
+        "decayed": 0,
+    }
+    unknown_classes: set[str] = set()
+    lower: uuid.UUID | None = None
+
+    async with pool.acquire() as conn:
+        while True:
+            lower_op = ">" if lower is not None else ">="
+            lower_bound = lower if lower is not None else uuid.UUID(int=0)
+            upper = await conn.fetchval(
+                f"SELECT max(id) FROM (SELECT id FROM {table} WHERE id {lower_op} $1 "
+                "ORDER BY id LIMIT $2) AS chunk",
+                lower_bound,
+                chunk_size,
+            )
+            if upper is None:
+                break
+            sql = sweep_sql.format(
+                table=table,
+                lower_op=lower_op,
+                candidate_filter=candidate_filter,
+                extra_columns=extra_columns,
+                fading_default=_DEFAULT_FADING_THRESHOLD,
+                expiry_default=_DEFAULT_EXPIRY_THRESHOLD,
+            )
+            args: list[Any] = [lower_bound, upper, now]
+            if table == "facts":
+                args.append(now.isoformat())
+            try:
+                async with conn.transaction():
+                    row = await conn.fetchrow(sql, *args)
+                    # Same transaction as the expiry write — a crash here must
+                    # never leave the catalog serving an expired memory.
+                    await _cascade_catalog_disownment(
+                        conn, table, list(row["expired_ids"]), invalid_at=now
+                    )
+            except Exception:
+                logger.error(
+                    "run_decay_sweep: %s range (%s, %s] failed; leaving it unchanged "
+                    "so the rest of the sweep still runs",
+                    table,
+                    lower_bound,
+                    upper,
+                    exc_info=True,
+                )
+                lower = upper
+                continue
+            for key in totals:
+                totals[key] += row[key]
+            unknown_classes.update(row["unknown_classes"])
+            lower = upper
+
+    for retention_class in sorted(unknown_classes):
+        logger.warning(
+            "run_decay_sweep: retention_class %r not found in memory_policies; "
+            "using hardcoded defaults (fading=%.2f, expiry=%.2f)",
+            retention_class,
+            _DEFAULT_FADING_THRESHOLD,
+            _DEFAULT_EXPIRY_THRESHOLD,
+        )
+    return totals
+
+
+async def run_decay_sweep(
+    pool: Pool,
+    *,
+    chunk_size: int = DECAY_SWEEP_CHUNK_SIZE,
+    now: datetime | None = None,
+) -> dict:
     """Run a confidence decay sweep across all active (and previously-fading) facts
     and rules (excluding permanent ones with decay_rate=0.0).
 
@@ -3040,8 +3250,8 @@ async def run_decay_sweep(pool: Pool) -> dict:
        If the retention_class is not found in memory_policies, fall back to
        the hardcoded defaults (fading=0.2, expiry=0.05) and log a warning.
     3. If effective_confidence < expiry_threshold:
-         - For facts with archive_before_delete=true: archive first, then expire.
-           If archival fails, skip expiry (fail-closed).
+         - For facts with archive_before_delete=true: archive (stamp
+           metadata.archived_at/archived_content), then expire, in one write.
          - Otherwise: set validity='expired' (facts) or metadata.forgotten=true (rules)
     4. If expiry_threshold <= effective_confidence < fading_threshold:
          - Facts: set validity='fading' (the column readers query — see
@@ -3053,10 +3263,16 @@ async def run_decay_sweep(pool: Pool) -> dict:
        previously fading recovers — facts move back to validity='active'; rules
        clear metadata.status.
 
-    Because a fading fact's validity is no longer 'active', the source SELECT
-    below scans ``validity IN ('active', 'fading')`` so already-fading facts
-    keep getting re-evaluated on every run (otherwise they could never recover
-    to 'active' or progress to 'expired').
+    Because a fading fact's validity is no longer 'active', the sweep selects
+    ``validity IN ('active', 'fading')`` so already-fading facts keep getting
+    re-evaluated on every run (otherwise they could never recover to 'active'
+    or progress to 'expired').
+
+    The whole computation runs in SQL: each table is walked in primary-key
+    ranges of *chunk_size* rows, and each range is one set-based
+    ``UPDATE ... FROM`` (effective confidence, thresholds joined from
+    ``memory_policies``, new state) in its own short transaction.  Rows
+    already in their target state are not rewritten.
 
     Every expiry transition (facts -> 'expired', rules -> metadata.forgotten)
     also cascades a ``public.memory_catalog`` disownment (see
@@ -3065,209 +3281,41 @@ async def run_decay_sweep(pool: Pool) -> dict:
     catalog search. Fading transitions do NOT cascade — fading facts remain
     live for retrieval per the memory-retention-policy spec.
 
+    Args:
+        pool: asyncpg connection pool.
+        chunk_size: Rows per primary-key range (and so per transaction).
+        now: Reference time for the decay formula (default: current UTC time).
+
     Returns:
         dict with keys: facts_checked, rules_checked, facts_fading, rules_fading,
-        facts_expired, rules_expired
+        facts_expired, rules_expired, facts_archived (the archive-before-delete
+        subset of facts_expired), and per-outcome totals across facts and rules
+        that add up to the rows checked: ``decayed`` (rows rewritten to or out
+        of fading), ``archived`` (rows expired/forgotten this run) and
+        ``untouched`` (rows already in their target state).
     """
-    # Hardcoded fallback defaults (used when policy is missing for a class)
-    _DEFAULT_FADING_THRESHOLD = 0.2
-    _DEFAULT_EXPIRY_THRESHOLD = 0.05
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    now = now or datetime.now(UTC)
 
-    now = datetime.now(UTC)
-    stats = {
-        "facts_checked": 0,
-        "rules_checked": 0,
-        "facts_fading": 0,
-        "rules_fading": 0,
-        "facts_expired": 0,
-        "rules_expired": 0,
-    }
+    facts = await _decay_sweep_table(pool, "facts", now=now, chunk_size=chunk_size)
+    rules = await _decay_sweep_table(pool, "rules", now=now, chunk_size=chunk_size)
 
-    async with pool.acquire() as conn:
-        # Load all retention policies upfront to avoid per-row queries
-        policy_rows = await conn.fetch(
-            "SELECT retention_class, min_retrieval_confidence, archive_before_delete "
-            "FROM memory_policies"
-        )
-        policies: dict[str, dict] = {}
-        for row in policy_rows:
-            rc = row["retention_class"]
-            policies[rc] = {
-                "min_conf": row["min_retrieval_confidence"],
-                "archive_before_delete": row["archive_before_delete"],
-            }
-
-        def _get_thresholds(retention_class: str | None) -> tuple[float, float, bool]:
-            """Return (fading_threshold, expiry_threshold, archive_before_delete)."""
-            rc = retention_class or ""
-            if rc in policies:
-                min_conf = policies[rc]["min_conf"]
-                return min_conf, min_conf * 0.25, policies[rc]["archive_before_delete"]
-            logger.warning(
-                "run_decay_sweep: retention_class %r not found in memory_policies; "
-                "using hardcoded defaults (fading=%.2f, expiry=%.2f)",
-                rc,
-                _DEFAULT_FADING_THRESHOLD,
-                _DEFAULT_EXPIRY_THRESHOLD,
-            )
-            return _DEFAULT_FADING_THRESHOLD, _DEFAULT_EXPIRY_THRESHOLD, False
-
-        # ----- Process facts -----
-        # validity IN ('active', 'fading') so already-fading facts are
-        # re-evaluated each run (able to recover to 'active' or progress to
-        # 'expired') instead of getting stuck the moment they first fade.
-        facts = await conn.fetch(
-            "SELECT id, confidence, decay_rate, last_confirmed_at, created_at, "
-            "metadata, retention_class, validity "
-            "FROM facts WHERE validity IN ('active', 'fading') AND decay_rate > 0.0"
-        )
-
-        for fact in facts:
-            stats["facts_checked"] += 1
-            anchor = fact["last_confirmed_at"] or fact["created_at"]
-            days = (now - anchor).total_seconds() / 86400.0
-            eff = fact["confidence"] * math.exp(-fact["decay_rate"] * days)
-
-            metadata = fact["metadata"]
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-
-            fading_thresh, expiry_thresh, archive_first = _get_thresholds(
-                fact.get("retention_class")
-            )
-
-            if eff < expiry_thresh:
-                # Legacy metadata.status bookkeeping is superseded by the
-                # validity column — drop the stale key as part of the transition.
-                metadata.pop("status", None)
-                if archive_first:
-                    try:
-                        metadata["archived_at"] = now.isoformat()
-                        metadata["archived_content"] = True
-                        async with conn.transaction():
-                            await conn.execute(
-                                "UPDATE facts SET validity = 'expired', metadata = $1 "
-                                "WHERE id = $2",
-                                metadata,
-                                fact["id"],
-                            )
-                            # Same transaction as the expiry write — a crash here
-                            # must never leave the catalog serving an expired fact.
-                            await _cascade_catalog_disownment(
-                                conn, "facts", [fact["id"]], invalid_at=now
-                            )
-                    except Exception:
-                        logger.error(
-                            "run_decay_sweep: archival (or its catalog disownment "
-                            "cascade) failed for fact %s; skipping expiry "
-                            "(fail-closed for archive_before_delete class)",
-                            fact["id"],
-                        )
-                        continue
-                else:
-                    try:
-                        async with conn.transaction():
-                            await conn.execute(
-                                "UPDATE facts SET validity = 'expired', metadata = $1 "
-                                "WHERE id = $2",
-                                metadata,
-                                fact["id"],
-                            )
-                            await _cascade_catalog_disownment(
-                                conn, "facts", [fact["id"]], invalid_at=now
-                            )
-                    except Exception:
-                        logger.error(
-                            "run_decay_sweep: expiry (or its catalog disownment "
-                            "cascade) failed for fact %s; skipping this fact so "
-                            "the rest of the sweep still runs",
-                            fact["id"],
-                            exc_info=True,
-                        )
-                        continue
-                stats["facts_expired"] += 1
-            elif eff < fading_thresh:
-                had_stale_status = metadata.pop("status", None) is not None
-                if fact["validity"] != "fading" or had_stale_status:
-                    await conn.execute(
-                        "UPDATE facts SET validity = 'fading', metadata = $1 WHERE id = $2",
-                        metadata,
-                        fact["id"],
-                    )
-                stats["facts_fading"] += 1
-            else:
-                had_stale_status = metadata.pop("status", None) is not None
-                if fact["validity"] != "active" or had_stale_status:
-                    await conn.execute(
-                        "UPDATE facts SET validity = 'active', metadata = $1 WHERE id = $2",
-                        metadata,
-                        fact["id"],
-                    )
-
-        # ----- Process rules -----
-        rules = await conn.fetch(
-            "SELECT id, confidence, decay_rate, last_confirmed_at, created_at, "
-            "metadata, retention_class "
-            "FROM rules WHERE maturity != 'anti_pattern' AND decay_rate > 0.0 "
-            "AND (metadata->>'forgotten')::boolean IS NOT TRUE"
-        )
-
-        for rule in rules:
-            stats["rules_checked"] += 1
-            anchor = rule["last_confirmed_at"] or rule["created_at"]
-            days = (now - anchor).total_seconds() / 86400.0
-            eff = rule["confidence"] * math.exp(-rule["decay_rate"] * days)
-
-            metadata = rule["metadata"]
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-
-            fading_thresh, expiry_thresh, _archive_first = _get_thresholds(
-                rule.get("retention_class")
-            )
-
-            if eff < expiry_thresh:
-                metadata["forgotten"] = True
-                try:
-                    async with conn.transaction():
-                        await conn.execute(
-                            "UPDATE rules SET metadata = $1 WHERE id = $2",
-                            metadata,
-                            rule["id"],
-                        )
-                        # Same transaction as the forgotten-flag write — see the
-                        # matching fact-expiry cascade above.
-                        await _cascade_catalog_disownment(
-                            conn, "rules", [rule["id"]], invalid_at=now
-                        )
-                except Exception:
-                    logger.error(
-                        "run_decay_sweep: expiry (or its catalog disownment "
-                        "cascade) failed for rule %s; skipping this rule so "
-                        "the rest of the sweep still runs",
-                        rule["id"],
-                        exc_info=True,
-                    )
-                    continue
-                stats["rules_expired"] += 1
-            elif eff < fading_thresh:
-                metadata["status"] = "fading"
-                await conn.execute(
-                    "UPDATE rules SET metadata = $1 WHERE id = $2",
-                    metadata,
-                    rule["id"],
-                )
-                stats["rules_fading"] += 1
-            else:
-                if metadata.get("status") == "fading":
-                    del metadata["status"]
-                    await conn.execute(
-                        "UPDATE rules SET metadata = $1 WHERE id = $2",
-                        metadata,
-                        rule["id"],
-                    )
-
-    return stats
+    checked = facts["checked"] + rules["checked"]
+    decayed = facts["decayed"] + rules["decayed"]
+    archived = facts["expired"] + rules["expired"]
+    return {
+        "facts_checked": facts["checked"],
+        "rules_checked": rules["checked"],
+        "facts_fading": facts["fading"],
+        "rules_fading": rules["fading"],
+        "facts_expired": facts["expired"],
+        "rules_expired": rules["expired"],
+        "facts_archived": facts["archived"],
+        "decayed": decayed,
+        "archived": archived,
+        "untouched": checked - decayed - archived,
+    }
 
 
 async def purge_superseded_facts(pool: Pool, *, older_than_days: int = 7) -> dict:
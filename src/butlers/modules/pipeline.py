@@ -25,7 +25,13 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from butlers.core.model_routing import Complexity
 from butlers.core.routing_context import _routing_ctx_var
+from butlers.core.thread_history_cache import (
+    TELEGRAM_HISTORY_CHANNELS,
+    get_thread_history_cache,
+)
+from butlers.core.thread_history_cache import telegram_chat_id as _telegram_history_chat_id
 from butlers.core.utils import coerce_request_id as _coerce_request_id
+from butlers.db_statements import register_statement
 from butlers.modules.base import Module
 from butlers.tools.switchboard.routing.rule_demotion import maybe_create_demotion_suggestion
 from butlers.tools.switchboard.routing.telemetry import (
@@ -53,10 +59,22 @@ def _decomposition_empty_counter() -> metrics.Counter:
     )
 
 
+def _history_load_latency_histogram() -> metrics.Histogram:
+    """Histogram: per-message conversation-history load latency.
+
+    Labels: ``source_channel``, ``strategy`` and ``cache`` (``hit`` when the
+    in-process thread history cache answered, ``miss`` when the DB was read,
+    ``bypass`` for strategies the cache does not serve).
+    """
+    return metrics.get_meter(_PIPELINE_METER_NAME).create_histogram(
+        name="butlers.pipeline.history_load_latency_ms",
+        description="Conversation history load latency per routed message",
+        unit="ms",
+    )
+
+
 _ROUTE_TOOL_NAME_RE = re.compile(r"(?:^|[^a-z0-9])route_to_butler$", re.IGNORECASE)
 _FILE_BUG_REPORT_TOOL_NAME_RE = re.compile(r"(?:^|[^a-z0-9])file_bug_report$", re.IGNORECASE)
-_TELEGRAM_CHAT_ID_RE = re.compile(r"^-?\d+$")
-_TELEGRAM_CHAT_MESSAGE_RE = re.compile(r"^(?P<chat_id>-?\d+):(?P<message_id>\d+)$")
 
 # ---------------------------------------------------------------------------
 # Conversation History Loading
@@ -98,6 +116,58 @@ HISTORY_STRATEGY: dict[str, Literal["realtime", "email", "none"]] = {
 }
 
 
+_REALTIME_HISTORY_SQL = register_statement(
+    "pipeline.load_realtime_history",
+    """
+    WITH thread AS NOT MATERIALIZED (
+        SELECT
+            normalized_text AS raw_content,
+            request_context ->> 'source_sender_identity' AS sender_id,
+            received_at,
+            raw_payload -> 'metadata' AS raw_metadata,
+            COALESCE(direction, 'inbound') AS direction
+        FROM message_inbox
+        WHERE (
+                source_thread_identity = $1
+                OR (
+                    $4::text IS NOT NULL
+                    AND (
+                        source_thread_identity = $4
+                        OR (
+                            source_thread_identity ~>=~ ($4 || ':')
+                            AND source_thread_identity ~<~ ($4 || ';')
+                        )
+                    )
+                )
+            )
+            AND (
+                $5::text IS NULL
+                OR request_context ->> 'source_channel' = $5
+                OR direction = 'outbound'
+            )
+            AND received_at < $2
+    )
+    SELECT raw_content, sender_id, received_at, raw_metadata, direction
+    FROM thread
+    WHERE received_at >= LEAST(
+        $3,
+        COALESCE(
+            (
+                SELECT received_at
+                FROM thread
+                ORDER BY received_at DESC
+                OFFSET GREATEST($6::int - 1, 0)
+                LIMIT LEAST($6::int, 1)
+            ),
+            CASE WHEN $6::int > 0 THEN '-infinity'::timestamptz ELSE $3 END
+        )
+    )
+    ORDER BY received_at ASC
+    """,
+    relations=("message_inbox",),
+)
+
+
 async def _load_realtime_history(
     pool: Any,
     source_thread_identity: str,
@@ -115,112 +185,40 @@ async def _load_realtime_history(
     (whichever is more)
 
     Ordered chronologically (oldest first).
+
+    The union is every message in ``[min(received_at - N minutes, M-th
+    newest), received_at)``, fetched in one statement over the indexed
+    ``source_thread_identity`` column (sw_031).  Telegram message-scoped
+    thread ids (``<chat_id>:<message_id>``) are grouped by chat; the
+    ``~>=~``/``~<~`` pair is the ``<chat_id>:`` prefix match in a form the
+    ``text_pattern_ops`` index can serve under a generic plan.
     """
     time_cutoff = received_at - timedelta(minutes=max_time_window_minutes)
 
     telegram_chat_id: str | None = None
-    if source_channel in ("telegram_bot", "telegram_user_client"):
-        match = _TELEGRAM_CHAT_MESSAGE_RE.fullmatch(source_thread_identity)
-        if match is not None:
-            telegram_chat_id = match.group("chat_id")
-        elif _TELEGRAM_CHAT_ID_RE.fullmatch(source_thread_identity):
-            telegram_chat_id = source_thread_identity
+    if source_channel in TELEGRAM_HISTORY_CHANNELS:
+        telegram_chat_id = _telegram_history_chat_id(source_thread_identity)
 
     async with pool.acquire() as conn:
-        # Load time-based window
-        time_window_messages = await conn.fetch(
-            """
-            SELECT
-                normalized_text AS raw_content,
-                request_context ->> 'source_sender_identity' AS sender_id,
-                received_at,
-                raw_payload -> 'metadata' AS raw_metadata,
-                COALESCE(direction, 'inbound') AS direction
-            FROM message_inbox
-            WHERE (
-                    request_context ->> 'source_thread_identity' = $1
-                    OR (
-                        $4::text IS NOT NULL
-                        AND (
-                            request_context ->> 'source_thread_identity' = $4
-                            OR request_context ->> 'source_thread_identity' LIKE ($4 || ':%')
-                        )
-                    )
-                )
-                AND (
-                    $5::text IS NULL
-                    OR request_context ->> 'source_channel' = $5
-                    OR direction = 'outbound'
-                )
-                AND received_at >= $2
-                AND received_at < $3
-            ORDER BY received_at ASC
-            """,
-            source_thread_identity,
-            time_cutoff,
-            received_at,
-            telegram_chat_id,
-            source_channel,
-        )
-
-        # Load count-based window
-        count_window_messages = await conn.fetch(
-            """
-            SELECT
-                normalized_text AS raw_content,
-                request_context ->> 'source_sender_identity' AS sender_id,
-                received_at,
-                raw_payload -> 'metadata' AS raw_metadata,
-                COALESCE(direction, 'inbound') AS direction
-            FROM message_inbox
-            WHERE (
-                    request_context ->> 'source_thread_identity' = $1
-                    OR (
-                        $3::text IS NOT NULL
-                        AND (
-                            request_context ->> 'source_thread_identity' = $3
-                            OR request_context ->> 'source_thread_identity' LIKE ($3 || ':%')
-                        )
-                    )
-                )
-                AND (
-                    $4::text IS NULL
-                    OR request_context ->> 'source_channel' = $4
-                    OR direction = 'outbound'
-                )
-                AND received_at < $2
-            ORDER BY received_at DESC
-            LIMIT $5
-            """,
+        rows = await conn.fetch(
+            _REALTIME_HISTORY_SQL,
             source_thread_identity,
             received_at,
+            time_cutoff,
             telegram_chat_id,
             source_channel,
             max_message_count,
         )
 
-        # Union and deduplicate
-        seen_keys = set()
-        messages = []
-
-        for row in time_window_messages:
-            key = (row["received_at"], row["sender_id"], row["raw_content"])
-            if key not in seen_keys:
-                seen_keys.add(key)
-                messages.append(dict(row))
-
-        # Count window is DESC, so we need to reverse and add
-        for row in reversed(count_window_messages):
-            key = (row["received_at"], row["sender_id"], row["raw_content"])
-            if key not in seen_keys:
-                seen_keys.add(key)
-                # Insert in chronological order
-                messages.append(dict(row))
-
-        # Sort chronologically
-        messages.sort(key=lambda m: m["received_at"])
-
-        return messages
+    # Deduplicate identical rows (same timestamp, sender and text).
+    seen_keys = set()
+    messages = []
+    for row in rows:
+        key = (row["received_at"], row["sender_id"], row["raw_content"])
+        if key not in seen_keys:
+            seen_keys.add(key)
+            messages.append(dict(row))
+    return messages
 
 
 async def _load_email_history(
@@ -250,7 +248,7 @@ async def _load_email_history(
                 raw_payload -> 'metadata' AS raw_metadata,
                 COALESCE(direction, 'inbound') AS direction
             FROM message_inbox
-            WHERE request_context ->> 'source_thread_identity' = $1
+            WHERE source_thread_identity = $1
                 AND received_at < $2
             ORDER BY received_at ASC
             """,
@@ -349,17 +347,25 @@ async def _load_conversation_history(
         return ""
 
     config = HistoryConfig(strategy=strategy)
+    cache_outcome = "bypass"
+    started = time.perf_counter()
 
     try:
         if strategy == "realtime":
-            messages = await _load_realtime_history(
-                pool,
-                source_thread_identity,
-                received_at,
-                source_channel=source_channel,
-                max_time_window_minutes=config.max_time_window_minutes,
-                max_message_count=config.max_message_count,
-            )
+            cache = get_thread_history_cache()
+            window = {
+                "source_channel": source_channel,
+                "max_time_window_minutes": config.max_time_window_minutes,
+                "max_message_count": config.max_message_count,
+            }
+            messages = cache.lookup(source_thread_identity, received_at, **window)
+            cache_outcome = "hit"
+            if messages is None:
+                cache_outcome = "miss"
+                messages = await _load_realtime_history(
+                    pool, source_thread_identity, received_at, **window
+                )
+                cache.store(source_thread_identity, received_at, messages, **window)
         elif strategy == "email":
             messages = await _load_email_history(
                 pool,
@@ -382,6 +388,11 @@ async def _load_conversation_history(
             },
         )
         return ""
+    finally:
+        _history_load_latency_histogram().record(
+            (time.perf_counter() - started) * 1000,
+            {"source_channel": source_channel, "strategy": strategy, "cache": cache_outcome},
+        )
 
 
 @dataclass
@@ -1733,6 +1744,16 @@ class MessagePipeline:
                     request_id = row["request_id"]
                     decision = "accepted"
 
+        if decision == "accepted":
+            get_thread_history_cache().record(
+                source_thread_identity=request_context.get("source_thread_identity"),
+                source_channel=request_context.get("source_channel"),
+                received_at=received_at,
+                raw_content=message_text,
+                sender_id=request_context.get("source_sender_identity"),
+                raw_metadata=raw_payload.get("metadata"),
+            )
+
         logger.info(
             "Ingress dedupe decision",
             extra=self._log_fields(
@@ -0,0 +1,465 @@
+"""Process-wide multiplexer for Postgres LISTEN/NOTIFY.
+
+LISTEN registrations are connection-scoped, so every component that reacts to
+a NOTIFY channel used to hold a dedicated connection of its own — the
+fleet-events bridge, the channel identity cache and the credential cache each
+opened one, per process.  :class:`NotificationHub` owns a single dedicated
+connection instead and fans its notifications out to per-subscriber queues:
+
+- :meth:`NotificationHub.subscribe` returns a :class:`Subscription` whose
+  bounded queue yields :class:`Notification` items for one channel; the
+  channel is LISTENed on the hub connection while it has subscribers.
+- A full queue never blocks the connection: the newest notification is
+  dropped and the subscriber later reads a :class:`NotificationGap` with
+  ``reason="overflow"`` at the position of the loss.
+- :meth:`NotificationHub.run` reconnects with a fixed backoff whenever the
+  connection is lost.  NOTIFYs sent while nobody listens are gone for good,
+  so each subscription that was not listening reads a
+  :class:`NotificationGap` with ``reason="disconnected"`` once LISTEN is
+  active again (also on first connect, for subscriptions made before it).
+  ``on_listening`` callbacks fire synchronously on connect and disconnect
+  for consumers that must stop serving state the moment they go deaf.
+
+:func:`notification_hub` returns the process hub; daemons share its
+connection through :func:`acquire_notification_hub` /
+:func:`release_notification_hub`, and the dashboard API supervises
+:meth:`NotificationHub.run` as a lifespan loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+import asyncpg
+
+from butlers.core.metrics import (
+    record_notification_dropped,
+    record_notification_gap,
+    record_notification_queue_depth,
+    record_notification_subscribers,
+)
+from butlers.db import database_name_from_env, db_params_from_env, should_retry_with_ssl_disable
+
+logger = logging.getLogger(__name__)
+
+#: Notifications a subscription buffers before dropping new ones.
+DEFAULT_QUEUE_MAXSIZE = 1024
+
+#: How long to wait before reconnecting after the LISTEN connection drops
+#: (server restart, network blip) or a connect attempt fails.
+_RECONNECT_BACKOFF_S = 5.0
+
+#: How often to poll connection liveness while idle-listening.
+_HEALTH_POLL_INTERVAL_S = 5.0
+
+GAP_DISCONNECTED = "disconnected"
+GAP_OVERFLOW = "overflow"
+
+
+class Notification(NamedTuple):
+    """One NOTIFY delivered on a subscribed channel."""
+
+    channel: str
+    payload: str
+    pid: int = 0
+
+
+class NotificationGap(NamedTuple):
+    """Marks notifications lost before this point in a subscription's stream.
+
+    ``reason`` is ``"disconnected"`` (LISTEN was not active; the number lost
+    is unknown and ``dropped`` is 0) or ``"overflow"`` (``dropped``
+    notifications did not fit the queue).  Consumers that derive state from
+    the stream should resynchronise on a gap.
+    """
+
+    channel: str
+    reason: str
+    dropped: int
+
+
+class Subscription:
+    """A bounded stream of one channel's notifications.
+
+    Iterate it, or call :meth:`get`, to consume :class:`Notification` and
+    :class:`NotificationGap` items in order.  Only notifications count
+    towards ``maxsize``; consecutive gaps merge into one item.
+    """
+
+    def __init__(
+        self,
+        hub: NotificationHub,
+        channel: str,
+        maxsize: int,
+        on_listening: Callable[[bool], None] | None,
+    ) -> None:
+        self.channel = channel
+        self.maxsize = maxsize
+        self.delivered = 0
+        self.dropped = 0
+        self._hub = hub
+        self._on_listening = on_listening
+        self._items: deque[Notification | NotificationGap] = deque()
+        self._queued = 0
+        self._waiter: asyncio.Future[None] | None = None
+        self._listening = False
+        self._closed = False
+
+    @property
+    def listening(self) -> bool:
+        """Whether the channel is currently LISTENed on a live connection."""
+        return self._listening
+
+    def qsize(self) -> int:
+        """Notifications waiting to be consumed (gaps excluded)."""
+        return self._queued
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> Notification | NotificationGap:
+        return await self.get()
+
+    async def get(self) -> Notification | NotificationGap:
+        """Wait for and return the next item."""
+        while not self._items:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        item = self._items.popleft()
+        if isinstance(item, Notification):
+            self._queued -= 1
+            record_notification_queue_depth(channel=self.channel, delta=-1)
+        return item
+
+    async def close(self) -> None:
+        """Unsubscribe; the channel is UNLISTENed once nobody else uses it."""
+        await self._hub.unsubscribe(self)
+
+    def _offer(self, notification: Notification) -> None:
+        if self._queued >= self.maxsize:
+            self.dropped += 1
+            record_notification_dropped(channel=self.channel)
+            self._mark_gap(GAP_OVERFLOW, 1)
+            return
+        self._items.append(notification)
+        self._queued += 1
+        self.delivered += 1
+        record_notification_queue_depth(channel=self.channel, delta=1)
+        self._wake()
+
+    def _mark_gap(self, reason: str, dropped: int) -> None:
+        last = self._items[-1] if self._items else None
+        if isinstance(last, NotificationGap):
+            self._items[-1] = last._replace(dropped=last.dropped + dropped)
+            return
+        self._items.append(NotificationGap(self.channel, reason, dropped))
+        record_notification_gap(channel=self.channel, reason=reason)
+        self._wake()
+
+    def _set_listening(self, listening: bool, *, missed: bool = True) -> None:
+        if listening == self._listening:
+            return
+        self._listening = listening
+        if listening and missed:
+            self._mark_gap(GAP_DISCONNECTED, 0)
+        if self._on_listening is not None:
+            try:
+                self._on_listening(listening)
+            except Exception:
+                logger.warning(
+                    "notification_hub: on_listening callback failed for %r",
+                    self.channel,
+                    exc_info=True,
+                )
+
+    def _drain(self) -> None:
+        if self._queued:
+            record_notification_queue_depth(channel=self.channel, delta=-self._queued)
+        self._items.clear()
+        self._queued = 0
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+async def _connect_listener(fallback_db_name: str = "butlers") -> asyncpg.Connection:
+    """Open the hub's dedicated (non-pooled) LISTEN connection.
+
+    LISTEN/NOTIFY is database-scoped, not schema-scoped, so one connection
+    to the shared database hears every schema's notifications.  Uses the
+    same env-derived host/auth/SSL params as the daemon pools.
+    """
+    params = db_params_from_env()
+    connect_kwargs: dict[str, Any] = {
+        **params,
+        "database": database_name_from_env(fallback_db_name),
+    }
+    try:
+        return await asyncpg.connect(**connect_kwargs)
+    except Exception as exc:
+        if not should_retry_with_ssl_disable(exc, connect_kwargs.get("ssl")):
+            raise
+        logger.info("Retrying notification-hub LISTEN connection with ssl=disable")
+        return await asyncpg.connect(**{**connect_kwargs, "ssl": "disable"})
+
+
+class NotificationHub:
+    """One LISTEN connection multiplexed across channel subscriptions.
+
+    Parameters are injectable for testing: pass ``connect`` to target a
+    specific database instead of the process environment.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[asyncpg.Connection]] | None = None,
+        *,
+        fallback_db_name: str = "butlers",
+        queue_maxsize: int = DEFAULT_QUEUE_MAXSIZE,
+        reconnect_backoff_s: float = _RECONNECT_BACKOFF_S,
+        health_poll_interval_s: float = _HEALTH_POLL_INTERVAL_S,
+    ) -> None:
+        self.fallback_db_name = fallback_db_name
+        self.queue_maxsize = queue_maxsize
+        self.reconnect_backoff_s = reconnect_backoff_s
+        self.health_poll_interval_s = health_poll_interval_s
+        self.connects = 0
+        self._connect = connect
+        self._subscribers: dict[str, list[Subscription]] = {}
+        self._conn: asyncpg.Connection | None = None
+        self._channels: set[str] = set()
+        self._lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the hub currently holds a live LISTEN connection."""
+        return self._conn is not None
+
+    async def subscribe(
+        self,
+        channel: str,
+        *,
+        maxsize: int | None = None,
+        on_listening: Callable[[bool], None] | None = None,
+    ) -> Subscription:
+        """Subscribe to *channel*; LISTEN starts now if the hub is connected.
+
+        ``on_listening`` is called with ``True`` when the channel becomes
+        active on a connection and ``False`` when that connection is lost.
+        """
+        sub = Subscription(self, channel, maxsize or self.queue_maxsize, on_listening)
+        self._subscribers.setdefault(channel, []).append(sub)
+        record_notification_subscribers(channel=channel, delta=1)
+        async with self._lock:
+            conn = self._conn
+            if conn is not None and channel not in self._channels:
+                try:
+                    await conn.add_listener(channel, self._dispatch)
+                except Exception:
+                    # Drop the connection so run() re-registers every channel.
+                    logger.warning(
+                        "notification_hub: LISTEN %r failed; reconnecting", channel, exc_info=True
+                    )
+                    with contextlib.suppress(Exception):
+                        await conn.close()
+                    return sub
+                self._channels.add(channel)
+            if conn is not None and self._conn is conn:
+                sub._set_listening(True, missed=False)
+        return sub
+
+    async def unsubscribe(self, sub: Subscription) -> None:
+        """Remove *sub*; the last subscriber of a channel UNLISTENs it."""
+        if sub._closed:
+            return
+        sub._closed = True
+        subs = self._subscribers.get(sub.channel, [])
+        if sub in subs:
+            subs.remove(sub)
+            record_notification_subscribers(channel=sub.channel, delta=-1)
+        sub._drain()
+        if subs:
+            return
+        self._subscribers.pop(sub.channel, None)
+        async with self._lock:
+            conn = self._conn
+            if conn is None or sub.channel not in self._channels:
+                return
+            if sub.channel in self._subscribers:
+                return  # resubscribed while waiting for the lock
+            self._channels.discard(sub.channel)
+            with contextlib.suppress(Exception):
+                await conn.remove_listener(sub.channel, self._dispatch)
+
+    def stats(self) -> dict[str, Any]:
+        """Per-channel subscriber counts, queue depth and drops."""
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "channels": {
+                channel: {
+                    "subscribers": len(subs),
+                    "queued": sum(sub.qsize() for sub in subs),
+                    "dropped": sum(sub.dropped for sub in subs),
+                }
+                for channel, subs in self._subscribers.items()
+            },
+        }
+
+    def _dispatch(self, _conn: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        """asyncpg ``add_listener`` callback: fan one NOTIFY out to subscribers."""
+        notification = Notification(channel, payload, pid)
+        for sub in self._subscribers.get(channel, ()):
+            sub._offer(notification)
+
+    def _set_listening(self, listening: bool) -> None:
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                sub._set_listening(listening)
+
+    async def _open(self) -> asyncpg.Connection:
+        if self._connect is not None:
+            return await self._connect()
+        return await _connect_listener(self.fallback_db_name)
+
+    async def run(self) -> None:
+        """Hold the LISTEN connection until cancelled, reconnecting on loss.
+
+        A listener that permanently exits after one connection blip would
+        silently stop every subscriber, so every failure — including one
+        while registering channels — ends in a backoff and a reconnect.
+        """
+        while True:
+            conn: asyncpg.Connection | None = None
+            try:
+                conn = await self._open()
+                async with self._lock:
+                    channels: set[str] = set()
+                    for channel in list(self._subscribers):
+                        await conn.add_listener(channel, self._dispatch)
+                        channels.add(channel)
+                    self._conn, self._channels = conn, channels
+                self.connects += 1
+                self._set_listening(True)
+                logger.info(
+                    "notification_hub: LISTEN active on %d channel(s): %s",
+                    len(channels),
+                    ", ".join(sorted(channels)),
+                )
+                while not conn.is_closed():
+                    await asyncio.sleep(self.health_poll_interval_s)
+                logger.warning("notification_hub: LISTEN connection closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "notification_hub: LISTEN connection error; reconnecting", exc_info=True
+                )
+            finally:
+                self._conn, self._channels = None, set()
+                self._set_listening(False)
+                # Defensive on every step: a connection in an unexpected state
+                # can raise from is_closed() itself, and that must not end the
+                # reconnect loop.
+                with contextlib.suppress(Exception):
+                    if conn is not None and not conn.is_closed():
+                        await conn.close()
+
+            await asyncio.sleep(self.reconnect_backoff_s)
+
+
+async def consume_channel(
+    channel: str,
+    handle: Callable[[Notification | NotificationGap], None],
+    *,
+    hub: NotificationHub | None = None,
+    connect: Callable[[], Awaitable[asyncpg.Connection]] | None = None,
+    on_listening: Callable[[bool], None] | None = None,
+    reconnect_backoff_s: float = _RECONNECT_BACKOFF_S,
+    health_poll_interval_s: float = _HEALTH_POLL_INTERVAL_S,
+) -> None:
+    """Background task: feed every item of *channel* to *handle* until cancelled.
+
+    Subscribes to *hub*, or the process hub by default.  Passing ``connect``
+    instead runs a private hub on that connection for the task's lifetime,
+    which is how tests target a specific database.  A failing *handle* is
+    logged and the stream continues.
+    """
+    hub_task: asyncio.Task | None = None
+    if hub is None and connect is not None:
+        hub = NotificationHub(
+            connect,
+            reconnect_backoff_s=reconnect_backoff_s,
+            health_poll_interval_s=health_poll_interval_s,
+        )
+        hub_task = asyncio.create_task(hub.run(), name=f"notification-hub:{channel}")
+    source = hub if hub is not None else notification_hub()
+    sub = await source.subscribe(channel, on_listening=on_listening)
+    try:
+        async for item in sub:
+            try:
+                handle(item)
+            except Exception:
+                logger.warning(
+                    "notification_hub: handler for %r failed; continuing", channel, exc_info=True
+                )
+    finally:
+        await sub.close()
+        if hub_task is not None:
+            hub_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await hub_task
+
+
+_HUB = NotificationHub()
+
+
+def notification_hub() -> NotificationHub:
+    """Return the process-wide notification hub."""
+    return _HUB
+
+
+_hub_task: asyncio.Task | None = None
+_hub_refs = 0
+
+
+def acquire_notification_hub(fallback_db_name: str = "butlers") -> NotificationHub:
+    """Start the process hub connection if needed and take a reference on it.
+
+    ``butlers up`` runs several daemons in one process; they share one LISTEN
+    connection.  Pair with :func:`release_notification_hub`.
+    """
+    global _hub_task, _hub_refs
+    _hub_refs += 1
+    if _hub_task is None or _hub_task.done():
+        _HUB.fallback_db_name = fallback_db_name
+        _hub_task = asyncio.create_task(_HUB.run(), name="notification-hub")
+    return _HUB
+
+
+async def release_notification_hub() -> None:
+    """Drop a reference; the last release closes the hub connection."""
+    global _hub_task, _hub_refs
+    _hub_refs = max(0, _hub_refs - 1)
+    if _hub_refs or _hub_task is None:
+        return
+    task, _hub_task = _hub_task, None
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+def reset_notification_hub_for_tests() -> None:
+    """Test helper: replace the process hub with a fresh, unstarted one."""
+    global _HUB, _hub_task, _hub_refs
+    _HUB = NotificationHub()
+    _hub_task, _hub_refs = None, 0
@@ -1230,12 +1230,12 @@ async def _run_collect_briefing_contributions_job(
 
     Reads contributions from ``general.v_briefing_contributions`` for today's
     date, validates each envelope, and writes the combined payload to
-    ``briefing/combined/<YYYY-MM-DD>``.
+    ``briefing/combined/<YYYY-MM-DD>``.  ``job_args`` may override the
+    per-contributor deadline and the collection budget.
     """
-    del job_args
     from butlers.jobs.briefing import run_collect_briefing_contributions
 
-    return await run_collect_briefing_contributions(pool=pool)
+    return await run_collect_briefing_contributions(pool=pool, job_args=job_args)
 
 
 # ---------------------------------------------------------------------------
@@ -1810,6 +1810,30 @@ _RETENTION_PRUNER_JOB_HANDLERS: dict[str, _DeterministicScheduleJobHandler] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Sessions partition maintenance
+# ---------------------------------------------------------------------------
+
+
+async def _run_sessions_partition_maintenance_job(
+    pool: asyncpg.Pool,
+    job_args: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Create upcoming monthly ``sessions`` partitions and BRIN-compact cold ones.
+
+    Every butler owns a partitioned ``sessions`` table (core_202), so this
+    handler is registered for all of them.  See butlers.core.session_partitions.
+    """
+    from butlers.core.session_partitions import run_sessions_partition_maintenance
+
+    return await run_sessions_partition_maintenance(pool, job_args)
+
+
+_SESSIONS_PARTITION_JOB_HANDLERS: dict[str, _DeterministicScheduleJobHandler] = {
+    "sessions_partition_maintenance": _run_sessions_partition_maintenance_job,
+}
+
+
 # ---------------------------------------------------------------------------
 # Consolidated registry
 # ---------------------------------------------------------------------------
@@ -1835,6 +1859,7 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "filtered_events_partition_prune": _run_filtered_events_partition_prune_job,
             "insight_candidates_prune": _run_insight_candidates_prune_job,
             "secret_probe_log_prune": _run_secret_probe_log_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "health": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
@@ -1845,6 +1870,7 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "context_producer_sleep_window": _run_context_producer_sleep_window_job,
             # Per-butler session log pruner
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "finance": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
@@ -1856,6 +1882,7 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "monthly_finance_digest": _run_finance_monthly_finance_digest_job,
             "simplefin_sync": _run_finance_simplefin_sync_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "relationship": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
@@ -1872,6 +1899,7 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "email_identity_enrichment": _run_relationship_email_identity_enrichment_job,
             # contact_info_reconciler retired (bu-e2ja9 / core_115): table dropped.
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "travel": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
@@ -1883,10 +1911,12 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "destination_outlook": _run_travel_destination_outlook_job,
             "context_producer_travel": _run_context_producer_travel_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "messenger": {
             "calendar_prep_contribution": _run_messenger_calendar_prep_contribution_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "education": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
@@ -1894,6 +1924,7 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "mind_map_staleness_abandonment": _run_education_mind_map_staleness_job,
             "daily_briefing_contribution": _run_education_briefing_contribution_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "chronicler": {
             # Memory maintenance handlers (bu-93y4rt): the chronicler now enables
@@ -1941,17 +1972,20 @@ def _build_deterministic_schedule_job_registry() -> dict[
             "chronicler_routines_mine": _run_chronicler_routines_mine_job,
             "chronicler_rollup_daily": _run_chronicler_rollup_daily_job,
             "chronicler_narrate_daily": _run_chronicler_narrate_daily_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "home": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
             **_HOME_DETERMINISTIC_JOB_HANDLERS,
             "daily_briefing_contribution": _run_home_briefing_contribution_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "lifestyle": {
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
             "daily_briefing_contribution": _run_lifestyle_briefing_contribution_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "switchboard": {
             "eligibility_sweep": _run_switchboard_eligibility_sweep_job,
@@ -1966,12 +2000,14 @@ def _build_deterministic_schedule_job_registry() -> dict[
             ),
             **_MEMORY_MAINTENANCE_JOB_HANDLERS,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
         "qa": {
             "qa_patrol": _run_qa_patrol_job,
             "qa_pr_status_check": _run_qa_pr_status_check_job,
             "qa_evidence_cleanup": _run_qa_evidence_cleanup_job,
             "session_process_logs_prune": _run_session_process_logs_prune_job,
+            **_SESSIONS_PARTITION_JOB_HANDLERS,
         },
     }
 
@@ -1,5 +1,6 @@
 """Blob storage abstraction for media and file storage."""
 
+from butlers.storage.blob_cache import DiskBlobCache
 from butlers.storage.blobs import (
     BlobNotFoundError,
     BlobRef,
@@ -13,5 +14,6 @@ __all__ = [
     "BlobRef",
     "BlobStorageStartupError",
     "BlobStore",
+    "DiskBlobCache",
     "S3BlobStore",
 ]
@@ -0,0 +1,198 @@
+"""Bounded on-disk LRU cache in front of the S3 blob store.
+
+Content-addressed blobs never change once written, so a cached copy can be
+served without asking S3 whether it is still current — the only way an entry
+goes stale is deletion, which evicts it.  Entries are plain files named by
+content hash under one directory per butler; recency is tracked in memory
+and mirrored in file mtimes so the LRU order survives a restart.
+
+Configuration (environment):
+
+- ``BUTLERS_BLOB_CACHE_DIR`` — cache root (default ``~/.cache/butlers/blobs``)
+- ``BUTLERS_BLOB_CACHE_MAX_MB`` — size bound per butler (default 512; ``0``
+  disables the cache)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_ENV_DIR = "BUTLERS_BLOB_CACHE_DIR"
+_ENV_MAX_MB = "BUTLERS_BLOB_CACHE_MAX_MB"
+_DEFAULT_DIR = Path.home() / ".cache" / "butlers" / "blobs"
+_DEFAULT_MAX_MB = 512
+
+#: Suffix of in-flight downloads; ignored (and cleaned up) by the index scan.
+_PARTIAL_SUFFIX = ".partial"
+
+
+class DiskBlobCache:
+    """LRU cache of blob bodies stored as files under *directory*.
+
+    Entry names must be filesystem-safe (the store uses hex digests).  The
+    size bound is enforced per instance; all blocking file I/O runs in a
+    worker thread.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, namespace: str) -> DiskBlobCache | None:
+        """Build the cache for *namespace* (a butler name), or ``None`` if disabled."""
+        raw_max = os.environ.get(_ENV_MAX_MB, "").strip()
+        try:
+            max_mb = int(raw_max) if raw_max else _DEFAULT_MAX_MB
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", _ENV_MAX_MB, raw_max)
+            max_mb = _DEFAULT_MAX_MB
+        if max_mb <= 0:
+            return None
+        root = os.environ.get(_ENV_DIR, "").strip()
+        directory = (Path(root).expanduser() if root else _DEFAULT_DIR) / namespace
+        return cls(directory, max_mb * 1024 * 1024)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    async def read(self, name: str) -> bytes | None:
+        """Return the cached body for *name*, or ``None`` on a miss."""
+        return await asyncio.to_thread(self._read, name)
+
+    async def write(self, name: str, data: bytes) -> None:
+        """Cache *data* under *name* (no-op when larger than the bound)."""
+        if len(data) > self.max_bytes:
+            return
+        await asyncio.to_thread(self._write, name, data)
+
+    def partial_path(self, name: str) -> Path:
+        """Return a fresh temp path for streaming a download of *name*.
+
+        Pass it to :meth:`commit` when complete, or :meth:`abandon` on failure.
+        """
+        with self._lock:
+            # Index first: the initial scan discards stray partial files.
+            self._ensure_loaded()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / f"{name}.{uuid.uuid4().hex}{_PARTIAL_SUFFIX}"
+
+    async def commit(self, name: str, partial: Path) -> bytes:
+        """Install a completed download and return its body."""
+        return await asyncio.to_thread(self._commit, name, partial)
+
+    def abandon(self, partial: Path) -> None:
+        partial.unlink(missing_ok=True)
+
+    async def discard(self, name: str) -> None:
+        await asyncio.to_thread(self._discard, name)
+
+    # -- worker-thread helpers --------------------------------------------
+
+    def _path(self, name: str) -> Path:
+        return self.directory / name
+
+    def _ensure_loaded(self) -> None:
+        """Index files left by a previous process, oldest mtime first."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            files = list(self.directory.iterdir())
+        except FileNotFoundError:
+            return
+        found: list[tuple[float, str, int]] = []
+        for path in files:
+            if path.name.endswith(_PARTIAL_SUFFIX):
+                path.unlink(missing_ok=True)
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, path.name, stat.st_size))
+        for _mtime, name, size in sorted(found):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _read(self, name: str) -> bytes | None:
+        with self._lock:
+            self._ensure_loaded()
+            if name not in self._entries:
+                return None
+            path = self._path(name)
+            try:
+                data = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                self._forget(name)
+                return None
+            self._entries.move_to_end(name)
+            return data
+
+    def _write(self, name: str, data: bytes) -> None:
+        partial = self.partial_path(name)
+        try:
+            partial.write_bytes(data)
+        except OSError as exc:
+            logger.debug("blob cache: could not write %s: %s", name, exc)
+            self.abandon(partial)
+            return
+        self._install(name, partial, len(data))
+
+    def _commit(self, name: str, partial: Path) -> bytes:
+        data = partial.read_bytes()
+        if len(data) > self.max_bytes:
+            self.abandon(partial)
+        else:
+            self._install(name, partial, len(data))
+        return data
+
+    def _install(self, name: str, partial: Path, size: int) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            try:
+                os.replace(partial, self._path(name))
+            except OSError as exc:
+                logger.debug("blob cache: could not install %s: %s", name, exc)
+                self.abandon(partial)
+                return
+            self._forget(name)
+            self._entries[name] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _discard(self, name: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if name in self._entries:
+                self._path(name).unlink(missing_ok=True)
+                self._forget(name)
+
+    def _forget(self, name: str) -> None:
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            name, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._path(name).unlink(missing_ok=True)
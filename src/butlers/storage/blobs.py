@@ -1,22 +1,57 @@
 """Blob storage abstraction with S3-compatible backend.
 
 All blob I/O goes through an S3-compatible API (Garage, MinIO, AWS S3, etc.).
+
+Blob bodies are content-addressed: each distinct body is stored once under
+``_cas/sha256/{hh}/{sha256}`` no matter how many butlers or channels ingest
+it.  Every ``put()`` still returns its own storage_ref and records a
+zero-byte reference marker under ``_cas/refs/{sha256}/``; ``delete()`` drops
+that marker and removes the body only when no markers remain.  Refs written
+before content addressing (``{uuid}{ext}`` names) keep working unchanged.
+Derived variants of a body (downscaled images, extracted text) are stored
+under ``_cas/derived/{sha256}/{variant}`` and removed with it.
 """
 
+import hashlib
+import io
 import logging
 import mimetypes
+import re
 import uuid
 from datetime import UTC, datetime
 from typing import NamedTuple, Protocol
 
 import aioboto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
+from butlers.storage.blob_cache import DiskBlobCache
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_S3_REQUEST_TIMEOUT_S = 5.0
 
+#: Bodies above this size are uploaded with multipart and streamed to the
+#: local cache on download instead of being read in one response.
+DEFAULT_MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+#: S3 rejects multipart parts smaller than 5 MiB (except the last one).
+_MIN_MULTIPART_CHUNK_BYTES = 5 * 1024 * 1024
+
+#: Read size when streaming a large body to the cache.
+_STREAM_CHUNK_BYTES = 1024 * 1024
+
+_CAS_PREFIX = "_cas"
+
+#: Basename of a content-addressed ref: ``{sha256}-{ref_id}{ext}``.
+_CAS_NAME_RE = re.compile(r"^(?P<digest>[0-9a-f]{64})-(?P<ref_id>[0-9a-f]{32})(?:\.[^/]*)?$")
+
+#: Derivative variant names (see ``butlers.tools.attachment_derivatives``).
+_VARIANT_RE = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+
+_NOT_FOUND_CODES = ("404", "NoSuchKey")
+
 
 class BlobRef(NamedTuple):
     """Reference to a stored blob.
@@ -120,9 +155,13 @@ class BlobStorageStartupError(RuntimeError):
 class S3BlobStore:
     """S3-compatible blob store.
 
-    Keys are butler-prefixed and date-partitioned:
-    - Format: {butler_name}/{YYYY}/{MM}/{DD}/{uuid}{ext}
-    - Refs: 's3://{bucket}/{butler_name}/2026/02/16/abc123.jpg'
+    Refs are butler-prefixed and date-partitioned; the body they point to is
+    content-addressed and shared (see the module docstring):
+    - Format: {butler_name}/{YYYY}/{MM}/{DD}/{sha256}-{ref_id}{ext}
+    - Refs: 's3://{bucket}/{butler_name}/2026/02/16/9f86…08-1c2d…7e.jpg'
+
+    Reads go through *cache* when one is given; bodies are immutable, so a
+    cached copy is served without contacting S3.
 
     Args:
         bucket: S3 bucket name
@@ -131,6 +170,9 @@ class S3BlobStore:
         access_key_id: AWS access key ID (or None for default credential chain)
         secret_access_key: AWS secret access key (or None for default credential chain)
         region: AWS region name (default: 'us-east-1')
+        cache: Optional on-disk read-through cache
+        multipart_threshold_bytes: Size above which bodies use multipart
+            upload and streamed download
     """
 
     def __init__(
@@ -143,6 +185,8 @@ class S3BlobStore:
         secret_access_key: str | None = None,
         region: str = "us-east-1",
         request_timeout_s: float = DEFAULT_S3_REQUEST_TIMEOUT_S,
+        cache: DiskBlobCache | None = None,
+        multipart_threshold_bytes: int = DEFAULT_MULTIPART_THRESHOLD_BYTES,
     ):
         self.bucket = bucket
         self.butler_name = butler_name
@@ -164,6 +208,12 @@ class S3BlobStore:
             s3={"addressing_style": "path"},
         )
         self._client = None
+        self._cache = cache
+        self._multipart_threshold = multipart_threshold_bytes
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold_bytes,
+            multipart_chunksize=max(multipart_threshold_bytes, _MIN_MULTIPART_CHUNK_BYTES),
+        )
 
     def _s3_client(self):
         """Return an async context manager for an S3 client."""
@@ -172,19 +222,23 @@ class S3BlobStore:
             kwargs["endpoint_url"] = self.endpoint_url
         return self._session.client("s3", **kwargs)
 
-    def _generate_key(self, content_type: str, filename: str | None = None) -> str:
+    def _generate_key(
+        self, content_type: str, filename: str | None = None, *, digest: str | None = None
+    ) -> str:
         """Generate a butler-prefixed, date-partitioned key.
 
         Args:
             content_type: MIME type for extension hint
             filename: Optional filename for extension hint
+            digest: SHA-256 of the body; when given the key names the shared
+                content object as ``{digest}-{ref_id}``
 
         Returns:
             Key string like 'general/2026/02/16/abc123.jpg'
         """
         now = datetime.now(UTC)
         date_prefix = now.strftime("%Y/%m/%d")
-        unique_id = uuid.uuid4()
+        unique_id = f"{digest}-{uuid.uuid4().hex}" if digest else uuid.uuid4()
 
         ext = ""
         if filename:
@@ -222,42 +276,187 @@ class S3BlobStore:
             return full_key[len(self.bucket) + 1 :]
         return full_key
 
+    @staticmethod
+    def content_hash(storage_ref: str) -> str | None:
+        """Return the SHA-256 a content-addressed ref points at, else ``None``."""
+        match = _CAS_NAME_RE.match(storage_ref.rsplit("/", 1)[-1])
+        return match["digest"] if match else None
+
+    @staticmethod
+    def _content_key(digest: str) -> str:
+        return f"{_CAS_PREFIX}/sha256/{digest[:2]}/{digest}"
+
+    @staticmethod
+    def _marker_key(key: str) -> str | None:
+        """Return the reference-marker key for a content-addressed object key."""
+        match = _CAS_NAME_RE.match(key.rsplit("/", 1)[-1])
+        if match is None:
+            return None
+        return f"{_CAS_PREFIX}/refs/{match['digest']}/{match['ref_id']}"
+
+    def _body_location(self, key: str) -> tuple[str, str]:
+        """Return ``(object key holding the body, cache entry name)`` for a ref key."""
+        match = _CAS_NAME_RE.match(key.rsplit("/", 1)[-1])
+        if match is not None:
+            return self._content_key(match["digest"]), match["digest"]
+        # Legacy uuid-named object: immutable too, cached under a hash of its key.
+        return key, "k" + hashlib.sha256(key.encode()).hexdigest()
+
+    async def _head(self, s3, key: str) -> bool:
+        try:
+            await s3.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in _NOT_FOUND_CODES:
+                return False
+            raise
+        return True
+
     async def put(self, data: bytes, *, content_type: str, filename: str | None = None) -> str:
-        """Store blob in S3, return storage_ref string."""
-        key = self._generate_key(content_type, filename)
+        """Store blob in S3, return storage_ref string.
+
+        The body is uploaded only if no identical body is stored yet; the
+        returned ref is new either way.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        key = self._generate_key(content_type, filename, digest=digest)
+        content_key = self._content_key(digest)
         async with self._s3_client() as s3:
-            await s3.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=data,
-                ContentType=content_type,
-            )
+            # Marker first: a concurrent delete of another ref to this body
+            # then sees a live reference and leaves the body in place.
+            await s3.put_object(Bucket=self.bucket, Key=self._marker_key(key), Body=b"")
+            if not await self._head(s3, content_key):
+                await self._upload(s3, content_key, data, content_type)
+        if self._cache is not None:
+            await self._cache.write(digest, data)
         return BlobRef(scheme=self.scheme, key=f"{self.bucket}/{key}").to_ref()
 
+    async def _upload(self, s3, key: str, data: bytes, content_type: str) -> None:
+        if len(data) <= self._multipart_threshold:
+            await s3.put_object(Bucket=self.bucket, Key=key, Body=data, ContentType=content_type)
+            return
+        await s3.upload_fileobj(
+            io.BytesIO(data),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=self._transfer_config,
+        )
+
     async def get(self, storage_ref: str) -> bytes:
-        """Retrieve blob from S3 by storage_ref."""
+        """Retrieve blob by storage_ref, from the local cache when possible."""
         key = self._parse_ref(storage_ref)
+        body_key, cache_name = self._body_location(key)
+        if self._cache is not None:
+            cached = await self._cache.read(cache_name)
+            if cached is not None:
+                return cached
         async with self._s3_client() as s3:
             try:
-                response = await s3.get_object(Bucket=self.bucket, Key=key)
-                return await response["Body"].read()
+                response = await s3.get_object(Bucket=self.bucket, Key=body_key)
             except ClientError as e:
-                if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                if e.response["Error"]["Code"] in _NOT_FOUND_CODES:
                     raise BlobNotFoundError(storage_ref) from e
                 raise
+            body = response["Body"]
+            if self._cache is None:
+                return await body.read()
+            if response.get("ContentLength", 0) <= self._multipart_threshold:
+                data = await body.read()
+                await self._cache.write(cache_name, data)
+                return data
+            return await self._stream_to_cache(body, cache_name)
+
+    async def _stream_to_cache(self, body, cache_name: str) -> bytes:
+        """Copy a large response body to the cache in chunks, then load it once."""
+        assert self._cache is not None
+        partial = self._cache.partial_path(cache_name)
+        try:
+            with partial.open("wb") as fh:
+                while chunk := await body.read(_STREAM_CHUNK_BYTES):
+                    fh.write(chunk)
+        except BaseException:
+            self._cache.abandon(partial)
+            raise
+        return await self._cache.commit(cache_name, partial)
 
     async def delete(self, storage_ref: str) -> None:
-        """Delete blob from S3."""
+        """Delete blob from S3.
+
+        For content-addressed refs this drops the ref's marker and deletes the
+        shared body only when it was the last reference.
+        """
         key = self._parse_ref(storage_ref)
+        marker_key = self._marker_key(key)
+        body_key, cache_name = self._body_location(key)
         # S3 delete is idempotent — check existence first to match protocol
+        async with self._s3_client() as s3:
+            if not await self._head(s3, marker_key or key):
+                raise BlobNotFoundError(storage_ref)
+            if marker_key is None:
+                await s3.delete_object(Bucket=self.bucket, Key=key)
+            else:
+                await s3.delete_object(Bucket=self.bucket, Key=marker_key)
+                remaining = await s3.list_objects_v2(
+                    Bucket=self.bucket, Prefix=marker_key.rsplit("/", 1)[0] + "/", MaxKeys=1
+                )
+                if remaining.get("KeyCount", 0):
+                    return
+                await s3.delete_object(Bucket=self.bucket, Key=body_key)
+                # For content-addressed refs the cache name is the digest.
+                await self._delete_derivatives(s3, cache_name)
+        if self._cache is not None:
+            await self._cache.discard(cache_name)
+
+    @staticmethod
+    def _derivative_key(digest: str, variant: str) -> str:
+        if not _VARIANT_RE.match(variant):
+            raise ValueError(f"Invalid derivative variant name: {variant!r}")
+        return f"{_CAS_PREFIX}/derived/{digest}/{variant}"
+
+    async def get_derivative(self, digest: str, variant: str) -> bytes | None:
+        """Return the stored *variant* of the body with SHA-256 *digest*, if any.
+
+        Derivatives are deterministic functions of an immutable body, so they
+        are served from the local cache like bodies are.  An empty result is a
+        stored "the original is the best variant" answer.
+        """
+        key = self._derivative_key(digest, variant)
+        cache_name = "d" + hashlib.sha256(key.encode()).hexdigest()
+        if self._cache is not None:
+            cached = await self._cache.read(cache_name)
+            if cached is not None:
+                return cached
         async with self._s3_client() as s3:
             try:
-                await s3.head_object(Bucket=self.bucket, Key=key)
+                response = await s3.get_object(Bucket=self.bucket, Key=key)
             except ClientError as e:
-                if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
-                    raise BlobNotFoundError(storage_ref) from e
+                if e.response["Error"]["Code"] in _NOT_FOUND_CODES:
+                    return None
                 raise
-            await s3.delete_object(Bucket=self.bucket, Key=key)
+            data = await response["Body"].read()
+        if self._cache is not None:
+            await self._cache.write(cache_name, data)
+        return data
+
+    async def put_derivative(
+        self, digest: str, variant: str, data: bytes, *, content_type: str
+    ) -> None:
+        """Store *variant* of the body with SHA-256 *digest*.
+
+        Derivatives live beside the shared body and are deleted with it.
+        """
+        key = self._derivative_key(digest, variant)
+        async with self._s3_client() as s3:
+            await s3.put_object(Bucket=self.bucket, Key=key, Body=data, ContentType=content_type)
+        if self._cache is not None:
+            await self._cache.write("d" + hashlib.sha256(key.encode()).hexdigest(), data)
+
+    async def _delete_derivatives(self, s3, digest: str) -> None:
+        listing = await s3.list_objects_v2(
+            Bucket=self.bucket, Prefix=f"{_CAS_PREFIX}/derived/{digest}/"
+        )
+        for obj in listing.get("Contents", []):
+            await s3.delete_object(Bucket=self.bucket, Key=obj["Key"])
 
     async def exists(self, storage_ref: str) -> bool:
         """Check if blob exists in S3."""
@@ -267,8 +466,7 @@ class S3BlobStore:
             return False
         async with self._s3_client() as s3:
             try:
-                await s3.head_object(Bucket=self.bucket, Key=key)
-                return True
+                return await self._head(s3, self._marker_key(key) or key)
             except ClientError:
                 return False
 
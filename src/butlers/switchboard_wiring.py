@@ -24,7 +24,10 @@ from opentelemetry.context import Context as OtelContext
 
 from butlers.core.dashboard_turns import reconcile_route_recovery
 from butlers.core.route_inbox import (
+    RouteInboxClaim,
     RouteInboxLeaseLost,
+    RouteInboxRowRejected,
+    route_inbox_drain,
     route_inbox_mark_errored,
     route_inbox_mark_processed,
     route_inbox_processing_lease_heartbeat,
@@ -51,6 +54,14 @@ _STALE_SWITCHBOARD_CONNECTION_ERRORS = (
     anyio.ClosedResourceError,
     anyio.BrokenResourceError,
 )
+# Reclaimed dashboard rows settle from their durable turn without a runtime,
+# so startup recovery drains them in batches ahead of the per-row sweep.
+_RECLAIMED_DASHBOARD_TURN_MATCH = (
+    '$.request_context.source_channel == "dashboard"'
+    " && $.source_metadata.dashboard_message_id != null"
+)
+# Prior dashboard turn outcomes that prove its runtime stopped.
+_DASHBOARD_TERMINAL_OUTCOMES = frozenset({"cancelled", "finished"})
 
 
 def build_buffer_pipeline_inputs(ref: Any) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -332,6 +343,44 @@ def wire_pipelines(daemon: Any, pool: Any) -> None:
         )
 
 
+async def _dashboard_recovery_error(
+    pool: asyncpg.Pool,
+    *,
+    row_id: uuid.UUID,
+    request_id: uuid.UUID,
+    dashboard_turn_id: uuid.UUID,
+) -> str | None:
+    """Reconcile a reclaimed dashboard row's predecessor runtime.
+
+    Returns ``None`` when the prior turn is terminal and the row may be marked
+    processed, otherwise the error to record.  The row is never replayed.
+    """
+    try:
+        recovery_control = await reconcile_route_recovery(
+            pool,
+            message_id=dashboard_turn_id,
+            request_id=request_id,
+            route_inbox_id=row_id,
+        )
+    except Exception:
+        logger.exception(
+            "route_inbox recovery: could not reconcile dashboard predecessor id=%s",
+            row_id,
+        )
+        return "Could not reconcile the prior dashboard runtime before recovery."
+    if recovery_control.outcome in _DASHBOARD_TERMINAL_OUTCOMES:
+        return None
+    # A reclaimed dashboard row represents a predecessor runtime whose
+    # termination cannot be established by the route inbox alone.  Only a
+    # terminal prior turn can safely settle this row; every other present or
+    # future reconciliation result must fail closed rather than start a
+    # duplicate runtime.
+    return (
+        "Dashboard recovery could not prove the prior runtime stopped; "
+        f"automatic replay was suppressed ({recovery_control.outcome})."
+    )
+
+
 async def recover_route_inbox(daemon: Any, pool: asyncpg.Pool) -> None:
     """Recover eligible route-inbox rows under a fenced processing lease.
 
@@ -413,61 +462,35 @@ async def recover_route_inbox(daemon: Any, pool: asyncpg.Pool) -> None:
                     processing_claim_id,
                 ) as lease_lost:
                     if dashboard_turn_id is not None and recovery_from_processing:
-                        try:
-                            recovery_control = await reconcile_route_recovery(
-                                pool,
-                                message_id=dashboard_turn_id,
-                                request_id=parsed.request_context.request_id,
-                                route_inbox_id=row_id,
-                            )
-                        except Exception:
-                            logger.exception(
-                                "route_inbox recovery: could not reconcile dashboard "
-                                "predecessor id=%s",
-                                row_id,
-                            )
-                            if lease_lost.is_set():
-                                raise RouteInboxLeaseLost(
-                                    "route inbox processing lease was lost during "
-                                    "dashboard recovery reconciliation"
-                                )
-                            await route_inbox_mark_errored(
-                                pool,
-                                row_id,
-                                "Could not reconcile the prior dashboard runtime before recovery.",
-                                processing_claim_id=processing_claim_id,
-                            )
-                            return
+                        recovery_error = await _dashboard_recovery_error(
+                            pool,
+                            row_id=row_id,
+                            request_id=parsed.request_context.request_id,
+                            dashboard_turn_id=dashboard_turn_id,
+                        )
                         if lease_lost.is_set():
                             raise RouteInboxLeaseLost(
                                 "route inbox processing lease was lost during "
                                 "dashboard recovery reconciliation"
                             )
-                        if recovery_control.outcome in {"cancelled", "finished"}:
-                            if not await route_inbox_mark_processed(
+                        if recovery_error is not None:
+                            await route_inbox_mark_errored(
                                 pool,
                                 row_id,
-                                None,
+                                recovery_error,
                                 processing_claim_id=processing_claim_id,
-                            ):
-                                raise RouteInboxLeaseLost(
-                                    "route inbox processing lease was lost while marking "
-                                    "the recovered dashboard turn"
-                                )
+                            )
                             return
-                        # A reclaimed dashboard row represents a predecessor
-                        # runtime whose termination cannot be established by
-                        # the route inbox alone.  Only a terminal prior turn
-                        # can safely settle this row; every other present or
-                        # future reconciliation result must fail closed rather
-                        # than start a duplicate runtime.
-                        await route_inbox_mark_errored(
+                        if not await route_inbox_mark_processed(
                             pool,
                             row_id,
-                            "Dashboard recovery could not prove the prior runtime stopped; "
-                            f"automatic replay was suppressed ({recovery_control.outcome}).",
+                            None,
                             processing_claim_id=processing_claim_id,
-                        )
+                        ):
+                            raise RouteInboxLeaseLost(
+                                "route inbox processing lease was lost while marking "
+                                "the recovered dashboard turn"
+                            )
                         return
 
                     result = await route_inbox_wait_while_claimed(
@@ -542,6 +565,46 @@ async def recover_route_inbox(daemon: Any, pool: asyncpg.Pool) -> None:
                     processing_claim_id=processing_claim_id,
                 )
 
+    async def _settle_reclaimed_dashboard_turn(claim: RouteInboxClaim) -> None:
+        """Settle one reclaimed dashboard row from its prior turn's outcome."""
+        try:
+            parsed = parse_route_envelope(claim.route_envelope)
+        except Exception as exc:
+            raise RouteInboxRowRejected(f"Invalid envelope on recovery: {exc}") from exc
+        # The claim's envelope match guarantees a dashboard turn id.
+        dashboard_turn_id = (
+            parsed.source_metadata.dashboard_message_id if parsed.source_metadata else None
+        )
+        if dashboard_turn_id is None:
+            raise RouteInboxRowRejected("Invalid envelope on recovery: no dashboard turn")
+        recovery_error = await _dashboard_recovery_error(
+            pool,
+            row_id=claim.id,
+            request_id=parsed.request_context.request_id,
+            dashboard_turn_id=dashboard_turn_id,
+        )
+        if recovery_error is not None:
+            raise RouteInboxRowRejected(recovery_error)
+
+    try:
+        drained = await route_inbox_drain(
+            pool,
+            _settle_reclaimed_dashboard_turn,
+            include_accepted=False,
+            envelope_match=_RECLAIMED_DASHBOARD_TURN_MATCH,
+        )
+        if drained.batches:
+            logger.info(
+                "Butler %s: settled %d reclaimed dashboard route_inbox row(s) on startup",
+                daemon.config.name,
+                drained.processed + drained.errored,
+            )
+    except Exception:
+        logger.exception(
+            "Butler %s: reclaimed dashboard route_inbox drain failed on startup",
+            daemon.config.name,
+        )
+
     try:
         recovered = await route_inbox_recovery_sweep(
             pool,
@@ -0,0 +1,408 @@
+"""Load-test harness for the switchboard ingest → route → spawn path, LLM-free.
+
+Replays synthetic ``ingest.v1`` envelopes at a target arrival rate through the
+production components — ``ingest_v1`` → :class:`~butlers.core.buffer.DurableBuffer`
+→ :meth:`MessagePipeline.process <butlers.modules.pipeline.MessagePipeline.process>`
+→ classifier :meth:`Spawner.trigger <butlers.core.spawner.Spawner.trigger>` →
+route → target ``Spawner.trigger`` — with every runtime replaced by the
+scripted :class:`~butlers.core.runtimes.fake.FakeAdapter`.  Because no model
+is involved, the numbers it reports move only when the infrastructure does:
+
+- throughput (completed messages per second of wall time);
+- DurableBuffer queue depth (sampled max/mean);
+- p50/p95/p99 per stage: ``ingest``, ``queue_wait``, ``classify``,
+  ``route``, ``target`` and ``end_to_end`` (the classifier's tool calls run
+  inside its spawn, so ``classify`` encloses ``route``, which encloses
+  ``target``);
+- database round trips per message, counted with asyncpg query loggers
+  (:class:`RoundTripCounter`) and attributed through a context variable.
+
+Two simplifications keep the harness in one process.  The classifier's
+``route_to_butler`` tool is executed by the fake runtime's tool executor
+(:func:`route_executor`), which calls the target butler's spawner directly
+instead of going through the switchboard MCP server and the target daemon's
+``route.execute``.  The MCP hop itself is therefore not measured.
+
+Used by ``tests/benchmarks/test_switchboard_load.py``.  The envelope factories
+live in ``tests/e2e/envelopes.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import itertools
+import math
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from butlers.config import BufferConfig
+from butlers.core.buffer import POLICY_TIER_DEFAULT, DurableBuffer
+from butlers.core.mcp_urls import runtime_mcp_url
+
+#: Stages reported by :class:`LoadReport`, in pipeline order.
+STAGES = ("ingest", "queue_wait", "classify", "route", "target", "end_to_end")
+
+_QUEUE_SAMPLE_INTERVAL_S = 0.05
+
+_current_message: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "load_harness_message", default=None
+)
+
+#: ``ingest(envelope)`` → ``DurableBuffer.enqueue`` kwargs, or ``None`` if not enqueued.
+IngestFn = Callable[[dict[str, Any]], Awaitable[dict[str, Any] | None]]
+#: ``process(ref)`` — the buffer worker's per-message function.
+ProcessFn = Callable[[Any], Awaitable[None]]
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of *values* (``q`` in ``[0, 100]``)."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class RoundTripCounter:
+    """Count database round trips per message.
+
+    Attach to every connection of the pools under test (``init=counter.attach``,
+    or chained after the JSONB codec registration).  Queries issued while a
+    :meth:`scope` is active are attributed to that message; the rest are
+    counted as unattributed (e.g. buffer scanner sweeps).
+    """
+
+    def __init__(self) -> None:
+        self.per_message: dict[str, int] = {}
+        self.unattributed = 0
+
+    async def attach(self, conn: Any) -> None:
+        conn.add_query_logger(self._on_query)
+
+    def _on_query(self, _record: Any) -> None:
+        key = _current_message.get()
+        if key is None:
+            self.unattributed += 1
+        else:
+            self.per_message[key] = self.per_message.get(key, 0) + 1
+
+    @staticmethod
+    @contextlib.contextmanager
+    def scope(key: str) -> Iterator[None]:
+        token = _current_message.set(key)
+        try:
+            yield
+        finally:
+            _current_message.reset(token)
+
+
+@dataclass
+class LoadReport:
+    """Outcome of one :meth:`LoadHarness.run`."""
+
+    submitted: int
+    completed: int
+    failed: int
+    elapsed_s: float
+    stages_ms: dict[str, list[float]]
+    queue_depth_samples: list[int]
+    round_trips: list[int] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def stage_percentiles(self, stage: str) -> dict[str, float]:
+        samples = self.stages_ms.get(stage, [])
+        return {f"p{q}": percentile(samples, q) for q in (50, 95, 99)}
+
+    def format(self) -> str:
+        depth = self.queue_depth_samples or [0]
+        lines = [
+            f"messages: submitted={self.submitted} completed={self.completed} "
+            f"failed={self.failed} in {self.elapsed_s:.2f}s "
+            f"({self.throughput:.1f} msg/s)",
+            f"buffer queue depth: max={max(depth)} mean={statistics.fmean(depth):.1f}",
+        ]
+        if self.round_trips:
+            lines.append(
+                f"db round trips/message: mean={statistics.fmean(self.round_trips):.1f} "
+                f"p95={percentile([float(n) for n in self.round_trips], 95):.0f}"
+            )
+        lines.append(f"{'stage':<12}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for stage in STAGES:
+            samples = self.stages_ms.get(stage, [])
+            if not samples:
+                continue
+            pct = self.stage_percentiles(stage)
+            lines.append(
+                f"{stage:<12}{len(samples):>7}{pct['p50']:>10.1f}"
+                f"{pct['p95']:>10.1f}{pct['p99']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+class LoadHarness:
+    """Open-loop load generator around a real :class:`DurableBuffer`.
+
+    Parameters
+    ----------
+    ingest:
+        Persists one envelope and returns the buffer enqueue kwargs (see
+        :func:`switchboard_ingest`).
+    process:
+        The buffer's per-message function (see :func:`pipeline_process`).
+    buffer_config:
+        Buffer tuning; the scanner is disabled (``pool=None``) so every
+        message takes the hot path.
+    round_trips:
+        Optional counter already attached to the pools under test.
+    """
+
+    def __init__(
+        self,
+        *,
+        ingest: IngestFn,
+        process: ProcessFn,
+        buffer_config: BufferConfig | None = None,
+        round_trips: RoundTripCounter | None = None,
+    ) -> None:
+        self._ingest = ingest
+        self._process = process
+        self._round_trips = round_trips
+        self._buffer = DurableBuffer(
+            buffer_config or BufferConfig(), pool=None, process_fn=self._process_ref
+        )
+        self._stages: dict[str, list[float]] = {stage: [] for stage in STAGES}
+        self._started_at: dict[str, float] = {}
+        self._keys: dict[str, str] = {}
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._completed = 0
+        self._failed = 0
+        self._last_done = 0.0
+
+    @property
+    def buffer(self) -> DurableBuffer:
+        return self._buffer
+
+    def record(self, stage: str, duration_ms: float) -> None:
+        self._stages.setdefault(stage, []).append(duration_ms)
+
+    @contextlib.asynccontextmanager
+    async def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def timed(self, name: str, fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """Wrap *fn* so each call is recorded as stage *name*."""
+
+        async def _timed(*args: Any, **kwargs: Any) -> Any:
+            async with self.stage(name):
+                return await fn(*args, **kwargs)
+
+        return _timed
+
+    async def run(
+        self,
+        envelopes: Iterable[dict[str, Any]],
+        *,
+        rate_per_s: float,
+        poisson: bool = False,
+        seed: int = 0,
+        drain_timeout_s: float = 60.0,
+    ) -> LoadReport:
+        """Submit *envelopes* at *rate_per_s* and wait for every message to finish."""
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        rng = random.Random(seed)
+        depth_samples: list[int] = []
+        submitted = 0
+        self._idle.set()
+        await self._buffer.start()
+        sampler = asyncio.create_task(self._sample_queue(depth_samples))
+        submissions: list[asyncio.Task] = []
+        start = time.perf_counter()
+        self._last_done = start
+        try:
+            next_at = start
+            for index, envelope in zip(itertools.count(), envelopes, strict=False):
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                submissions.append(asyncio.create_task(self._submit(f"m{index}", envelope)))
+                submitted += 1
+                gap = rng.expovariate(rate_per_s) if poisson else 1 / rate_per_s
+                next_at += gap
+            await asyncio.gather(*submissions)
+            await asyncio.wait_for(self._idle.wait(), timeout=drain_timeout_s)
+        finally:
+            sampler.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sampler
+            await self._buffer.stop(drain_timeout_s=0)
+
+        return LoadReport(
+            submitted=submitted,
+            completed=self._completed,
+            failed=self._failed,
+            elapsed_s=self._last_done - start,
+            stages_ms={stage: list(samples) for stage, samples in self._stages.items()},
+            queue_depth_samples=depth_samples,
+            round_trips=(
+                list(self._round_trips.per_message.values())
+                if self._round_trips is not None
+                else []
+            ),
+        )
+
+    async def _submit(self, key: str, envelope: dict[str, Any]) -> None:
+        with RoundTripCounter.scope(key):
+            started = time.perf_counter()
+            try:
+                async with self.stage("ingest"):
+                    enqueue_kwargs = await self._ingest(envelope)
+            except Exception:
+                self._failed += 1
+                return
+            if enqueue_kwargs is None:
+                return
+            request_id = enqueue_kwargs["request_id"]
+            self._keys[request_id] = key
+            self._started_at[request_id] = started
+            self._pending += 1
+            self._idle.clear()
+            if not self._buffer.enqueue(**enqueue_kwargs):
+                # No scanner runs under the harness, so a rejected message is lost.
+                self._finish(request_id, ok=False)
+
+    async def _process_ref(self, ref: Any) -> None:
+        key = self._keys.get(ref.request_id, ref.request_id)
+        with RoundTripCounter.scope(key):
+            self.record(
+                "queue_wait",
+                (time.time() - ref.enqueued_at.timestamp()) * 1000,
+            )
+            ok = True
+            try:
+                await self._process(ref)
+            except Exception:
+                ok = False
+            self._finish(ref.request_id, ok=ok)
+
+    def _finish(self, request_id: str, *, ok: bool) -> None:
+        started = self._started_at.pop(request_id, None)
+        now = time.perf_counter()
+        if started is not None:
+            self.record("end_to_end", (now - started) * 1000)
+        if ok:
+            self._completed += 1
+        else:
+            self._failed += 1
+        self._last_done = now
+        self._pending -= 1
+        if self._pending <= 0:
+            self._idle.set()
+
+    async def _sample_queue(self, samples: list[int]) -> None:
+        while True:
+            samples.append(self._buffer.queue_depth)
+            await asyncio.sleep(_QUEUE_SAMPLE_INTERVAL_S)
+
+
+# ---------------------------------------------------------------------------
+# Production-component adapters
+# ---------------------------------------------------------------------------
+
+
+def switchboard_ingest(pool: Any) -> IngestFn:
+    """Ingest via ``ingest_v1`` and build enqueue kwargs as the ``ingest`` tool does."""
+    from butlers.tools.switchboard.ingestion.ingest import ingest_v1
+
+    async def _ingest(envelope: dict[str, Any]) -> dict[str, Any] | None:
+        result = await ingest_v1(pool, envelope)
+        payload = envelope.get("payload") or {}
+        text = payload.get("normalized_text", "")
+        attachments = payload.get("attachments")
+        if result.duplicate or not text:
+            return None
+        control = envelope.get("control") or {}
+        return {
+            "request_id": str(result.request_id),
+            "message_inbox_id": result.request_id,
+            "message_text": text,
+            "source": dict(envelope["source"]),
+            "event": dict(envelope["event"]),
+            "sender": dict(envelope["sender"]),
+            "triage_decision": result.triage_decision,
+            "triage_target": result.triage_target,
+            "attachments": list(attachments) if attachments else None,
+            "payload_type": control.get("payload_type"),
+            "policy_tier": control.get("policy_tier", POLICY_TIER_DEFAULT),
+        }
+
+    return _ingest
+
+
+def pipeline_process(pipeline: Any) -> ProcessFn:
+    """Run ``MessagePipeline.process`` the way the switchboard's buffer worker does."""
+    from butlers.switchboard_wiring import build_buffer_pipeline_inputs
+
+    async def _process(ref: Any) -> None:
+        _, tool_args = build_buffer_pipeline_inputs(ref)
+        result = await pipeline.process(
+            message_text=ref.message_text,
+            tool_name="bot_switchboard_handle_message",
+            tool_args=tool_args,
+            message_inbox_id=ref.message_inbox_id,
+        )
+        if result.classification_error or result.routing_error or result.failed_targets:
+            raise RuntimeError(result.classification_error or result.routing_error or "failed")
+
+    return _process
+
+
+def mark_mcp_warm(spawner: Any) -> None:
+    """Record *spawner*'s MCP endpoint as warmed.
+
+    Fake runtimes never connect to the butler's MCP server, and none runs
+    under the harness; without this every spawn would retry the pre-spawn
+    warmup against a closed port while holding the warmup lock.
+    """
+    url = spawner._normalize_mcp_warmup_url(runtime_mcp_url(spawner._config.port))
+    if url is not None:
+        spawner._warmed_mcp_urls.add(url)
+
+
+def route_executor(
+    harness: LoadHarness, targets: dict[str, Any]
+) -> Callable[[str, dict[str, Any]], Awaitable[Any]]:
+    """Tool executor for the classifier's fake runtime.
+
+    ``route_to_butler`` calls trigger the named target spawner (timed as
+    ``target`` inside ``route``); every other tool returns ``{"status": "ok"}``.
+    """
+
+    async def _execute(name: str, args: dict[str, Any]) -> Any:
+        if not name.endswith("route_to_butler"):
+            return {"status": "ok"}
+        async with harness.stage("route"):
+            spawner = targets.get(args.get("butler", ""))
+            if spawner is None:
+                return {"status": "error", "error": f"unknown butler {args.get('butler')!r}"}
+            async with harness.stage("target"):
+                result = await spawner.trigger(
+                    prompt=str(args.get("prompt", "")), trigger_source="route"
+                )
+        return {"status": "accepted" if result.success else "error"}
+
+    return _execute
@@ -0,0 +1,183 @@
+"""Model-appropriate derivatives of ingested attachments.
+
+``get_attachment`` used to ship every blob's raw bytes into the runtime's
+context, so a 4 MB phone photo cost as many tokens as its full resolution
+implied and anything over the size limit was unusable.  This module derives
+smaller variants that carry the same information for a model:
+
+- images: re-encoded JPEG with the longest edge capped at
+  :data:`IMAGE_MAX_EDGE_PX` (larger inputs are downscaled; the model
+  downsamples anything above that edge anyway);
+- PDFs: extracted text, when the optional ``pypdf`` package is installed.
+
+Derivation is CPU-bound (image decode/resize, PDF parsing), so it runs in a
+process pool off the event loop.  Results are cached in the blob store keyed
+by ``(source content hash, variant spec)`` — see
+:meth:`butlers.storage.blobs.S3BlobStore.get_derivative` — so each variant is
+computed once per distinct body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import io
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+#: Longest image edge served to runtimes.
+IMAGE_MAX_EDGE_PX = 1568
+
+#: JPEG quality for image variants.
+IMAGE_JPEG_QUALITY = 85
+
+#: Originals at or below this size are served as-is; deriving them rarely pays.
+DERIVE_MIN_SOURCE_BYTES = 512 * 1024
+
+#: Largest original the pipeline will fetch and derive from.
+MAX_DERIVATION_SOURCE_BYTES = 50 * 1024 * 1024
+
+#: Wall-clock budget for one derivation.
+DERIVATION_TIMEOUT_S = 30.0
+
+_DERIVABLE_IMAGE_TYPES = frozenset(
+    {"image/jpeg", "image/png", "image/webp", "image/bmp", "image/tiff"}
+)
+_PDF_TYPE = "application/pdf"
+
+_MAX_WORKERS = 2
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    """What to derive; :attr:`slug` names the cached result."""
+
+    kind: str  # "image" | "pdf_text"
+    media_type: str
+    max_edge_px: int = 0
+    quality: int = 0
+
+    @property
+    def slug(self) -> str:
+        if self.kind == "image":
+            return f"image-jpeg-{self.max_edge_px}-q{self.quality}"
+        return "pdf-text-v1"
+
+
+IMAGE_VARIANT = VariantSpec(
+    kind="image",
+    media_type="image/jpeg",
+    max_edge_px=IMAGE_MAX_EDGE_PX,
+    quality=IMAGE_JPEG_QUALITY,
+)
+PDF_TEXT_VARIANT = VariantSpec(kind="pdf_text", media_type="text/plain")
+
+
+def variant_for(media_type: str) -> VariantSpec | None:
+    """Return the variant to serve for *media_type*, or ``None`` for the original."""
+    if media_type in _DERIVABLE_IMAGE_TYPES:
+        return IMAGE_VARIANT
+    if media_type == _PDF_TYPE and importlib.util.find_spec("pypdf") is not None:
+        return PDF_TEXT_VARIANT
+    return None
+
+
+def derive(data: bytes, spec: VariantSpec) -> bytes | None:
+    """Produce *spec* from *data*; ``None`` when the original is the better answer.
+
+    Runs in a worker process; must stay a module-level function.
+    """
+    if spec.kind == "image":
+        return _derive_image(data, spec)
+    if spec.kind == "pdf_text":
+        return _derive_pdf_text(data)
+    raise ValueError(f"Unknown variant kind: {spec.kind!r}")
+
+
+def _derive_image(data: bytes, spec: VariantSpec) -> bytes | None:
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as img:
+        if getattr(img, "is_animated", False):
+            return None
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((spec.max_edge_px, spec.max_edge_px))
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        out = io.BytesIO()
+        img.save(out, format="JPEG", quality=spec.quality, optimize=True)
+    derived = out.getvalue()
+    return derived if len(derived) < len(data) else None
+
+
+def _derive_pdf_text(data: bytes) -> bytes | None:
+    try:
+        from pypdf import PdfReader  # optional; not in pyproject.toml
+    except ImportError:
+        return None
+
+    reader = PdfReader(io.BytesIO(data))
+    pages = [page.extract_text() or "" for page in reader.pages]
+    text = "\n\n".join(
+        f"--- page {number} ---\n{page.strip()}" for number, page in enumerate(pages, 1)
+    )
+    # Scanned PDFs have no text layer; the original is all the model can use.
+    if not any(page.strip() for page in pages):
+        return None
+    return text.encode("utf-8")
+
+
+_executor: ProcessPoolExecutor | None = None
+_executor_holders = 0
+
+
+def derivation_executor() -> ProcessPoolExecutor:
+    """Return the shared derivation process pool, creating it on first use.
+
+    Workers are spawned rather than forked: the daemon process runs an event
+    loop and several threads, which ``fork`` does not copy safely.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _executor
+
+
+def acquire_derivation_executor() -> None:
+    """Register a butler as a user of the shared pool (daemon startup).
+
+    The pool is process-global while ``butlers up`` runs several butlers in
+    one process, so it is only stopped when the last holder releases it.
+    """
+    global _executor_holders
+    _executor_holders += 1
+
+
+def release_derivation_executor() -> None:
+    """Drop a butler's hold on the shared pool; the last release stops it."""
+    global _executor_holders
+    _executor_holders = max(0, _executor_holders - 1)
+    if _executor_holders == 0:
+        shutdown_derivation_executor()
+
+
+def shutdown_derivation_executor() -> None:
+    """Stop the shared pool, cancelling queued derivations (last holder or tests)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def derive_in_executor(
+    data: bytes, spec: VariantSpec, executor: Executor | None = None
+) -> bytes | None:
+    """Run :func:`derive` off the event loop, bounded by :data:`DERIVATION_TIMEOUT_S`."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.wait_for(
+        loop.run_in_executor(executor or derivation_executor(), derive, data, spec),
+        timeout=DERIVATION_TIMEOUT_S,
+    )
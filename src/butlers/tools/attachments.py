@@ -1,7 +1,9 @@
 """Shared tool for serving media attachments to runtime instances.
 
 Provides get_attachment() for retrieving ingested blobs (images, PDFs, etc.)
-as base64-encoded data suitable for Claude vision/PDF input.
+as base64-encoded data suitable for Claude vision/PDF input.  Large images
+and PDFs are served as cached model-sized derivatives (see
+:mod:`butlers.tools.attachment_derivatives`) instead of the raw original.
 """
 
 from __future__ import annotations
@@ -9,9 +11,17 @@ from __future__ import annotations
 import base64
 import logging
 import mimetypes
+from concurrent.futures import Executor
 from typing import Any
 
 from butlers.storage import BlobNotFoundError, BlobRef, BlobStore
+from butlers.tools.attachment_derivatives import (
+    DERIVE_MIN_SOURCE_BYTES,
+    MAX_DERIVATION_SOURCE_BYTES,
+    VariantSpec,
+    derive_in_executor,
+    variant_for,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +29,33 @@ logger = logging.getLogger(__name__)
 MAX_ATTACHMENT_SIZE_BYTES = 5 * 1024 * 1024  # 5MB
 
 
-async def get_attachment(blob_store: BlobStore | None, storage_ref: str) -> dict[str, Any]:
+async def get_attachment(
+    blob_store: BlobStore | None,
+    storage_ref: str,
+    *,
+    executor: Executor | None = None,
+) -> dict[str, Any]:
     """Retrieve an ingested media attachment for analysis.
 
-    Returns base64-encoded data suitable for Claude vision/PDF input.
+    Returns base64-encoded data suitable for Claude vision/PDF input.  Images
+    and PDFs above :data:`DERIVE_MIN_SOURCE_BYTES` are served as a derivative
+    (downscaled JPEG, extracted text) when that is smaller than the original;
+    derivatives are cached in the blob store per content hash.
 
     Args:
         blob_store: The BlobStore instance to retrieve from
         storage_ref: Storage reference string (e.g., 's3://bucket/general/2026/02/16/abc123.jpg')
+        executor: Pool for derivation work (defaults to the shared process pool)
 
     Returns:
         Dictionary with:
         - storage_ref: The storage reference
-        - media_type: Inferred MIME type
-        - data_base64: Base64-encoded blob data
-        - size_bytes: Size of the blob in bytes
+        - media_type: MIME type of the served payload
+        - data_base64: Base64-encoded payload (absent for text variants)
+        - text: Extracted text (text variants only)
+        - size_bytes: Size of the served payload in bytes
+        - variant: ``"original"`` or the derivative's name
+        - original_media_type: MIME type of the stored blob (derivatives only)
 
     Raises:
         ValueError: If storage_ref is invalid or blob exceeds size limit
@@ -52,15 +74,55 @@ async def get_attachment(blob_store: BlobStore | None, storage_ref: str) -> dict
         logger.warning("Invalid storage_ref format: %s", storage_ref)
         raise ValueError(f"Invalid storage_ref format: {e}") from e
 
-    # Retrieve blob
+    # Infer media type from storage_ref key (file extension)
+    media_type = _infer_media_type(blob_ref.key)
+    spec = variant_for(media_type)
+
+    # Derivatives are cached per content hash; stores (or legacy refs) without
+    # one still get derivation, just not the cache.
+    content_hash = getattr(blob_store, "content_hash", None)
+    digest = content_hash(storage_ref) if content_hash is not None else None
+    cacheable = digest is not None and hasattr(blob_store, "get_derivative")
+
+    # Retrieve blob.  Its size decides whether a derivative can exist at all,
+    # so the derivative cache is only probed for originals in the derivation
+    # range: smaller ones would pay a guaranteed-miss lookup on every call.
     try:
         data = await blob_store.get(storage_ref)
     except BlobNotFoundError:
         logger.warning("Blob not found: %s", storage_ref)
         raise
 
-    # Check size limit
     size_bytes = len(data)
+    if not DERIVE_MIN_SOURCE_BYTES < size_bytes <= MAX_DERIVATION_SOURCE_BYTES:
+        spec = None
+
+    if spec is not None and cacheable:
+        cached = await blob_store.get_derivative(digest, spec.slug)
+        if cached:
+            return _derivative_result(storage_ref, media_type, spec, cached)
+        if cached is not None:
+            # Stored "original is best" answer.
+            spec = None
+
+    if spec is not None:
+        try:
+            derived = await derive_in_executor(data, spec, executor)
+        except Exception:
+            # Not cached: a timeout or a decoder bug should not pin the original.
+            logger.warning("Derivation failed for %s (%s)", storage_ref, spec.slug, exc_info=True)
+        else:
+            if cacheable:
+                try:
+                    await blob_store.put_derivative(
+                        digest, spec.slug, derived or b"", content_type=spec.media_type
+                    )
+                except Exception:
+                    logger.warning("Failed to cache derivative for %s", storage_ref, exc_info=True)
+            if derived:
+                return _derivative_result(storage_ref, media_type, spec, derived)
+
+    # Check size limit
     if size_bytes > MAX_ATTACHMENT_SIZE_BYTES:
         logger.warning(
             "Blob exceeds size limit: %s (%.2f MB > %.2f MB)",
@@ -73,9 +135,6 @@ async def get_attachment(blob_store: BlobStore | None, storage_ref: str) -> dict
             f"{MAX_ATTACHMENT_SIZE_BYTES / (1024 * 1024):.2f} MB"
         )
 
-    # Infer media type from storage_ref key (file extension)
-    media_type = _infer_media_type(blob_ref.key)
-
     # Base64 encode
     b64_data = base64.b64encode(data).decode("ascii")
 
@@ -91,7 +150,37 @@ async def get_attachment(blob_store: BlobStore | None, storage_ref: str) -> dict
         "media_type": media_type,
         "data_base64": b64_data,
         "size_bytes": size_bytes,
+        "variant": "original",
+    }
+
+
+def _derivative_result(
+    storage_ref: str, original_media_type: str, spec: VariantSpec, data: bytes
+) -> dict[str, Any]:
+    """Build the get_attachment payload for a derived variant."""
+    if len(data) > MAX_ATTACHMENT_SIZE_BYTES:
+        raise ValueError(
+            f"Attachment exceeds size limit: {len(data) / (1024 * 1024):.2f} MB > "
+            f"{MAX_ATTACHMENT_SIZE_BYTES / (1024 * 1024):.2f} MB"
+        )
+    logger.info(
+        "Retrieved attachment: %s (%.2f KB, %s)",
+        storage_ref,
+        len(data) / 1024,
+        spec.slug,
+    )
+    result: dict[str, Any] = {
+        "storage_ref": storage_ref,
+        "media_type": spec.media_type,
+        "size_bytes": len(data),
+        "variant": spec.slug,
+        "original_media_type": original_media_type,
     }
+    if spec.media_type.startswith("text/"):
+        result["text"] = data.decode("utf-8")
+    else:
+        result["data_base64"] = base64.b64encode(data).decode("ascii")
+    return result
 
 
 def _infer_media_type(key: str) -> str:
@@ -0,0 +1,93 @@
+"""Tests for the scripted FakeAdapter runtime used by the load-test harness."""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from butlers.core.runtimes.base import get_adapter
+from butlers.core.runtimes.fake import FakeAdapter, FakeTurn, LatencyDistribution
+
+pytestmark = pytest.mark.unit
+
+
+class TestLatencyDistribution:
+    def test_parse_specs(self):
+        assert LatencyDistribution.parse("constant:0.05") == LatencyDistribution("constant", 0.05)
+        assert LatencyDistribution.parse("uniform:0.02, 0.2") == LatencyDistribution(
+            "uniform", 0.02, 0.2
+        )
+        assert LatencyDistribution.parse("constant") == LatencyDistribution()
+
+    @pytest.mark.parametrize("spec", ["gamma:1", "uniform:1,2,3", "constant:-1"])
+    def test_parse_rejects_invalid(self, spec: str):
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse(spec)
+
+    def test_sampling_is_seeded_and_bounded(self):
+        dist = LatencyDistribution("uniform", 0.01, 0.02)
+        first = [dist.sample(random.Random(7)) for _ in range(3)]
+        second = [dist.sample(random.Random(7)) for _ in range(3)]
+        assert first == second
+        assert all(0.01 <= s <= 0.02 for s in first)
+
+    def test_lognormal_median(self):
+        dist = LatencyDistribution("lognormal", 0.5, 0.4)
+        rng = random.Random(1)
+        samples = sorted(dist.sample(rng) for _ in range(2001))
+        assert samples[1000] == pytest.approx(0.5, rel=0.1)
+
+
+class TestFakeAdapter:
+    def test_registered_as_fake(self):
+        assert get_adapter("fake") is FakeAdapter
+
+    async def test_default_turn(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("BUTLERS_FAKE_RUNTIME_LATENCY", raising=False)
+        adapter = FakeAdapter()
+        text, tool_calls, usage = await adapter.invoke("hello", "system", {}, {})
+        assert text == "ok"
+        assert tool_calls == []
+        assert usage is not None and usage["input_tokens"] == len("hellosystem") // 4
+        assert adapter.invocations == 1
+        assert adapter.last_process_info["runtime_type"] == "fake"
+
+    async def test_latency_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("BUTLERS_FAKE_RUNTIME_LATENCY", "constant:0.05")
+        adapter = FakeAdapter()
+        start = time.perf_counter()
+        await adapter.invoke("p", "s", {}, {})
+        assert time.perf_counter() - start >= 0.045
+
+    async def test_scripted_tool_calls_are_executed(self):
+        executed: list[tuple[str, dict]] = []
+
+        async def _executor(name: str, args: dict) -> dict:
+            executed.append((name, args))
+            return {"status": "accepted"}
+
+        def _script(prompt: str, _system: str) -> FakeTurn:
+            return FakeTurn(
+                text=None,
+                tool_calls=({"name": "route_to_butler", "input": {"butler": prompt}},),
+            )
+
+        adapter = FakeAdapter(script=_script, tool_executor=_executor)
+        _, tool_calls, _ = await adapter.invoke("health", "", {}, {})
+        _, second, _ = await adapter.invoke("finance", "", {}, {})
+
+        assert executed == [
+            ("route_to_butler", {"butler": "health"}),
+            ("route_to_butler", {"butler": "finance"}),
+        ]
+        assert tool_calls == [
+            {
+                "id": "fake-1",
+                "name": "route_to_butler",
+                "input": {"butler": "health"},
+                "result": {"status": "accepted"},
+            }
+        ]
+        assert second[0]["id"] == "fake-2"
@@ -29,12 +29,15 @@ from butlers.api.db import DatabaseManager
 
 pytestmark = pytest.mark.asyncio
 
-# The seven dashboard lifespan loops, independent of
+# The ten dashboard lifespan loops, independent of
 # EXTERNAL_DEADMAN_URL configuration.
 _ALWAYS_ON_LOOP_NAMES = {
     "secrets_lifecycle",
     "model_verify",
+    "notification_hub",
     "fleet_events_bridge",
+    "identity_cache_listener",
+    "credential_cache_listener",
     "settings_console_delta",
     "secrets_staleness",
     "migration_drift",
@@ -44,8 +47,9 @@ _EXTERNAL_DEADMAN_LOOP_NAME = "external_deadman"
 
 # The seven ``run_*_loop`` functions imported at module scope into
 # ``butlers.api.app`` -- patched directly there. ``run_fleet_events_listener``
-# is imported locally inside the lifespan function body, so it is patched at
-# its source module instead (see ``_install_common_mocks``).
+# and the cache-invalidation listeners are imported locally inside the
+# lifespan function body, so they are patched at their source modules instead
+# (see ``_install_common_mocks``).
 _MODULE_LEVEL_LOOP_FUNCS = [
     "run_secrets_lifecycle_loop",
     "run_model_verify_loop",
@@ -112,6 +116,28 @@ def _install_common_mocks(monkeypatch, *, call_counts: dict) -> None:
         bridge_mod, "run_fleet_events_listener", _make_forever("run_fleet_events_listener")
     )
 
+    import butlers.notification_hub as notification_hub_mod
+
+    fake_hub = MagicMock()
+    fake_hub.run = _make_forever("notification_hub.run")
+    monkeypatch.setattr(notification_hub_mod, "notification_hub", MagicMock(return_value=fake_hub))
+
+    import butlers.identity_cache as identity_cache_mod
+
+    monkeypatch.setattr(
+        identity_cache_mod,
+        "run_identity_cache_listener",
+        _make_forever("run_identity_cache_listener"),
+    )
+
+    import butlers.credential_cache as credential_cache_mod
+
+    monkeypatch.setattr(
+        credential_cache_mod,
+        "run_credential_cache_listener",
+        _make_forever("run_credential_cache_listener"),
+    )
+
 
 def _spy_on_supervisor(monkeypatch) -> list[tuple[str, asyncio.Task]]:
     """Wrap the real ``supervise_lifespan_loop`` so every call app.py makes
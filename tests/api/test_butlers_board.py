@@ -84,16 +84,6 @@ class _FakeButlerPool:
             if self.max_concurrent is None:
                 return None
             return {"max_concurrent": self.max_concurrent}
-        if "total_sessions" in sql:
-            if self.cost_query_fails:
-                raise RuntimeError("cost query failed")
-            return {
-                "total_sessions": 1,
-                "total_input_tokens": self.cost_input_tokens,
-                "total_output_tokens": self.cost_output_tokens,
-                "total_cached_input_tokens": 0,
-                "total_cache_creation_tokens": 0,
-            }
         raise AssertionError(f"unexpected fetchrow SQL: {sql}")
 
     async def fetchval(self, sql, *args):
@@ -110,20 +100,21 @@ class _FakeButlerPool:
             if self.hourly_query_fails:
                 raise RuntimeError("hourly activity query failed")
             return [{"sessions_count": c} for c in self.hourly_counts]
-        if "model" in sql and "input_tokens" in sql:
+        if "session_usage_hourly" in sql:
             if self.cost_query_fails:
                 raise RuntimeError("cost query failed")
+            total = {
+                "model": None,
+                "is_total": True,
+                "sessions": 1,
+                "input_tokens": self.cost_input_tokens,
+                "output_tokens": self.cost_output_tokens,
+                "cached_input_tokens": 0,
+                "cache_creation_tokens": 0,
+            }
             if self.cost_input_tokens == 0 and self.cost_output_tokens == 0:
-                return []
-            return [
-                {
-                    "model": self.cost_model,
-                    "input_tokens": self.cost_input_tokens,
-                    "output_tokens": self.cost_output_tokens,
-                    "cached_input_tokens": 0,
-                    "cache_creation_tokens": 0,
-                }
-            ]
+                return [total]
+            return [total, {**total, "model": self.cost_model, "is_total": False}]
         raise AssertionError(f"unexpected fetch SQL: {sql}")
 
 
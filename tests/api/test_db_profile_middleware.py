@@ -0,0 +1,49 @@
+"""Tests for DbProfileMiddleware — per-request DB round-trip reporting."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from butlers import db_profiler
+from butlers.api.middleware import DbProfileMiddleware
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeConnection:
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> list:
+        return [1, 2, 3]
+
+
+async def test_request_is_profiled_under_route_template(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BUTLERS_DB_PROFILE", "1")
+    recorded: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        db_profiler, "record_db_operation_profile", lambda **kwargs: recorded.append(kwargs)
+    )
+    conn = db_profiler._profiled_subclass(_FakeConnection)()
+
+    app = FastAPI()
+    app.add_middleware(DbProfileMiddleware)
+
+    @app.get("/api/things/{name}")
+    async def _things(name: str) -> dict:
+        rows = [await conn.fetch("SELECT") for _ in range(2)]
+        return {"name": name, "rows": sum(len(r) for r in rows)}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        resp = await client.get("/api/things/alpha")
+        health = await client.get("/health")
+
+    assert resp.status_code == 200
+    assert resp.headers["Server-Timing"].endswith('desc="2 queries"')
+    assert "Server-Timing" not in health.headers
+    assert [(r["operation"], r["queries"], r["rows"]) for r in recorded] == [
+        ("GET /api/things/{name}", 2, 6)
+    ]
@@ -0,0 +1,237 @@
+"""Tests for the search_v2 read model and the index path of ``GET /api/search``.
+
+Verifies:
+- ``prefix_tsquery`` / ``like_pattern`` build safe tsquery and LIKE inputs
+- cursors round-trip and are rejected for another query or when malformed
+- ``query_search_documents`` groups rows per kind and derives the next keyset
+- ``search_index_available`` caches only a positive probe
+- ``schema_owners`` refuses legacy pools without a schema
+- the endpoint serves from the index when installed, falls back to the
+  fan-out otherwise, and answers a bad cursor with 422
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from butlers.api.db import DatabaseManager
+from butlers.api.read_models.search_v2 import (
+    DOC_KINDS,
+    decode_search_cursor,
+    encode_search_cursor,
+    like_pattern,
+    prefix_tsquery,
+    query_search_documents,
+    reset_search_index_probe_for_tests,
+    schema_owners,
+    search_index_available,
+)
+from butlers.api.routers.search import _get_db_manager
+
+pytestmark = pytest.mark.unit
+
+_NOW = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _reset_probe() -> Iterator[None]:
+    reset_search_index_probe_for_tests()
+    yield
+    reset_search_index_probe_for_tests()
+
+
+def _doc(kind: str, schema: str, source_id: str, rank: float, **kw: object) -> dict:
+    return {
+        "doc_kind": kind,
+        "source_schema": schema,
+        "source_id": source_id,
+        "title": kw.get("title", f"{kind} {source_id}"),
+        "body": kw.get("body", ""),
+        "snippet": kw.get("snippet"),
+        "sort_at": _NOW,
+        "rank": rank,
+    }
+
+
+def _mock_db(schemas: dict[str, str | None], pool: AsyncMock) -> MagicMock:
+    db = MagicMock(spec=DatabaseManager)
+    db.butler_names = list(schemas)
+    db.pool = MagicMock(return_value=pool)
+    db.schema_for_butler = MagicMock(side_effect=lambda name: schemas[name])
+    db.memory_schema_for_butler = MagicMock(side_effect=lambda name: schemas[name])
+    return db
+
+
+# ---------------------------------------------------------------------------
+# Query inputs and cursors
+# ---------------------------------------------------------------------------
+
+
+def test_prefix_tsquery_and_like_pattern() -> None:
+    assert prefix_tsquery("Ali SMI") == "ali:* & smi:*"
+    assert prefix_tsquery("o'brien & co|x") == "o:* & brien:* & co:* & x:*"
+    assert prefix_tsquery("snake_case") == "snake:* & case:*"
+    assert prefix_tsquery("%%") is None
+    assert like_pattern("50%_Off\\") == "%50\\%\\_off\\\\%"
+
+
+def test_cursor_round_trip_and_rejection() -> None:
+    after = {"session": (0.25, "general", "abc"), "state": (1.5, "health", "key")}
+    cursor = encode_search_cursor("alice", after)
+
+    assert decode_search_cursor(cursor, "alice") == after
+    with pytest.raises(ValueError, match="different query"):
+        decode_search_cursor(cursor, "bob")
+    with pytest.raises(ValueError):
+        decode_search_cursor("not-a-cursor", "alice")
+    with pytest.raises(ValueError, match="unknown kinds"):
+        decode_search_cursor(encode_search_cursor("alice", {"nope": (0, "a", "b")}), "alice")
+
+
+# ---------------------------------------------------------------------------
+# query_search_documents
+# ---------------------------------------------------------------------------
+
+
+async def test_query_groups_rows_and_returns_keyset_for_full_kinds() -> None:
+    pool = AsyncMock()
+    pool.fetch = AsyncMock(
+        return_value=[
+            _doc("session", "general", "s1", 0.9),
+            _doc("session", "general", "s2", 0.5),
+            _doc("session", "health", "s3", 0.5),
+            _doc("fact", "general", "f1", 0.4),
+        ]
+    )
+
+    page = await query_search_documents(pool, "Alice", 2, ["general", "health"])
+
+    assert [d.source_id for d in page.rows["session"]] == ["s1", "s2"]
+    assert [d.source_id for d in page.rows["fact"]] == ["f1"]
+    assert page.after == {"session": (0.5, "general", "s2")}
+
+    args = pool.fetch.await_args.args
+    assert args[1:5] == ("alice", "alice:*", ["general", "health", "public"], "%alice%")
+    assert args[5] == list(DOC_KINDS)
+    assert args[6] == [None] * len(DOC_KINDS)
+    assert args[9] == 3
+
+
+async def test_query_after_cursor_only_requests_remaining_kinds() -> None:
+    pool = AsyncMock()
+    pool.fetch = AsyncMock(return_value=[_doc("session", "health", "s3", 0.5)])
+
+    page = await query_search_documents(
+        pool, "alice", 2, ["general"], after={"session": (0.5, "general", "s2")}
+    )
+
+    args = pool.fetch.await_args.args
+    assert args[5:9] == (["session"], [0.5], ["general"], ["s2"])
+    assert page.after == {}
+
+    pool.fetch.reset_mock()
+    empty = await query_search_documents(pool, "alice", 2, ["general"], after={})
+    assert empty.rows == {} and pool.fetch.await_count == 0
+
+
+# ---------------------------------------------------------------------------
+# Probe and schema attribution
+# ---------------------------------------------------------------------------
+
+
+async def test_index_probe_caches_only_positive_answers() -> None:
+    pool = AsyncMock()
+    pool.fetchval = AsyncMock(return_value=False)
+    assert await search_index_available(pool) is False
+
+    pool.fetchval = AsyncMock(return_value=True)
+    assert await search_index_available(pool) is True
+    pool.fetchval = AsyncMock(side_effect=RuntimeError("gone"))
+    assert await search_index_available(pool) is True
+    pool.fetchval.assert_not_awaited()
+
+
+def test_schema_owners_rejects_legacy_pools() -> None:
+    pool = AsyncMock()
+    assert schema_owners(_mock_db({"general": "general", "health": "health"}, pool)) == {
+        "general": "general",
+        "health": "health",
+    }
+    assert schema_owners(_mock_db({"general": "general", "legacy": None}, pool)) is None
+
+
+# ---------------------------------------------------------------------------
+# GET /api/search
+# ---------------------------------------------------------------------------
+
+
+async def _get(app: FastAPI, params: dict[str, str]) -> httpx.Response:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.get("/api/search", params=params)
+
+
+async def test_endpoint_serves_grouped_results_from_the_index(app: FastAPI) -> None:
+    pool = AsyncMock()
+    pool.fetchval = AsyncMock(return_value=True)
+    pool.fetch = AsyncMock(
+        return_value=[
+            _doc("contact", "public", "e1", 1.2, title="Alice", snippet="alice@example.com"),
+            _doc("session", "general", "s1", 0.8, body="please ping alice tomorrow"),
+            _doc("session", "general", "s2", 0.3),
+            _doc("state", "finance", "alice_budget", 0.7, body='{"limit": 10}'),
+            _doc("transaction", "finance", "t1", 0.6, title="Alice's Cafe", snippet="4.50 EUR"),
+        ]
+    )
+    db = _mock_db({"general": "general", "finance": "finance"}, pool)
+    app.dependency_overrides[_get_db_manager] = lambda: db
+
+    resp = await _get(app, {"q": "alice", "limit": "1"})
+
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["contacts"][0] == {
+        "id": "e1",
+        "butler": "relationship",
+        "type": "contact",
+        "title": "Alice",
+        "snippet": "alice@example.com",
+        "url": "/contacts/e1",
+    }
+    assert [r["id"] for r in data["sessions"]] == ["s1"]
+    assert data["sessions"][0]["snippet"] == "please ping alice tomorrow"
+    assert data["state"][0]["id"] == "finance:alice_budget"
+    assert data["transactions"][0]["url"] == "/butlers/finance"
+    assert decode_search_cursor(data["next_cursor"], "alice") == {"session": (0.8, "general", "s1")}
+    db.fan_out_with_status.assert_not_called()
+
+
+async def test_endpoint_falls_back_to_fan_out_without_the_index(app: FastAPI) -> None:
+    pool = AsyncMock()
+    pool.fetchval = AsyncMock(return_value=False)
+    pool.fetch = AsyncMock(return_value=[])
+    db = _mock_db({"general": "general"}, pool)
+    db.fan_out_with_status = AsyncMock(return_value=({"general": []}, []))
+    app.dependency_overrides[_get_db_manager] = lambda: db
+
+    resp = await _get(app, {"q": "alice"})
+
+    assert resp.status_code == 200
+    assert resp.json()["data"]["next_cursor"] is None
+    assert db.fan_out_with_status.await_count == 2
+
+
+async def test_endpoint_rejects_a_malformed_cursor(app: FastAPI) -> None:
+    db = _mock_db({"general": "general"}, AsyncMock())
+    app.dependency_overrides[_get_db_manager] = lambda: db
+
+    resp = await _get(app, {"q": "alice", "cursor": "garbage"})
+
+    assert resp.status_code == 422
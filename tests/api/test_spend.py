@@ -512,18 +512,17 @@ async def test_ledger_session_divergence_deadman_reports_material_day_butler_dri
     day = date(2026, 7, 11)
     session_pool = MagicMock()
     session_pool.fetch = AsyncMock(
-        side_effect=[
-            [
-                {
-                    "day": day,
-                    "sessions": 1,
-                    "input_tokens": 50,
-                    "output_tokens": 0,
-                    "cached_input_tokens": 0,
-                    "cache_creation_tokens": 0,
-                }
-            ],
-            [],
+        return_value=[
+            {
+                "day": day,
+                "model": None,
+                "is_day_total": True,
+                "sessions": 1,
+                "input_tokens": 50,
+                "output_tokens": 0,
+                "cached_input_tokens": 0,
+                "cache_creation_tokens": 0,
+            }
         ]
     )
     db = _mock_db({"travel": session_pool})
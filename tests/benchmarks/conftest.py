@@ -1,4 +1,7 @@
-"""Shared configuration for all Ollama model benchmark suites.
+"""Shared configuration for the benchmark suites.
+
+The Ollama model suites use the ``--model``/``--ollama-url`` options and the
+warmup below; the database benchmarks share :func:`bench_db`.
 
 NOT run in CI/CD. Run manually with --override-ini="addopts=" to bypass
 the default marker/ignore exclusions:
@@ -17,7 +20,11 @@ from __future__ import annotations
 
 import sys
 import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
+import asyncpg
 import httpx
 import pytest
 
@@ -59,6 +66,38 @@ def bench_timeout(request: pytest.FixtureRequest) -> float:
     return request.config.getoption("--bench-timeout")
 
 
+@pytest.fixture
+async def bench_db(postgres_container) -> AsyncIterator[tuple[dict[str, Any], str]]:
+    """Create an empty, uniquely named database for one database benchmark.
+
+    Yields ``(conn_kwargs, db_name)``.  ``conn_kwargs`` carries the
+    container's host, port and superuser credentials but no database, so a
+    benchmark can connect to its own database and to ``postgres`` alike.
+    The database is dropped on teardown.
+    """
+    conn_kwargs: dict[str, Any] = {
+        "host": postgres_container.get_container_host_ip(),
+        "port": int(postgres_container.get_exposed_port(5432)),
+        "user": postgres_container.username,
+        "password": postgres_container.password,
+    }
+    db_name = f"bench_{uuid.uuid4().hex[:10]}"
+    admin = await asyncpg.connect(**conn_kwargs, database="postgres")
+    try:
+        await admin.execute(f'CREATE DATABASE "{db_name}"')
+    finally:
+        await admin.close()
+    try:
+        yield conn_kwargs, db_name
+    finally:
+        admin = await asyncpg.connect(**conn_kwargs, database="postgres")
+        try:
+            # FORCE closes any connection a failed benchmark left open.
+            await admin.execute(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE)')
+        finally:
+            await admin.close()
+
+
 def _pull_model(base: str, model: str) -> bool:
     """Pull a model from the Ollama registry. Returns True on success."""
     sys.stderr.write(f"\n  pull: downloading {model} (this may take a few minutes) ... ")
@@ -0,0 +1,172 @@
+"""Microbenchmark: ActivityWatch window/AFK/web correlation over a 100k-event day.
+
+Builds a synthetic day of ``_WINDOW_EVENTS`` window-focus events (with runs
+of identical consecutive events), AFK status intervals and web-watcher tab
+events, then compares:
+
+- ``linear``   — the previous per-event scans: every window event walked all
+  AFK intervals and re-parsed every web event;
+- ``timeline`` — :class:`~butlers.connectors.activitywatch.AfkTimeline` and
+  :class:`~butlers.connectors.activitywatch.BrowserDomainTimeline`, parsed
+  once and queried with ``bisect`` in one time-ordered pass.
+
+The linear path is quadratic, so it is timed on the first ``_LINEAR_SAMPLE``
+window events and reported per event; both paths must agree on that sample.
+Also reports how many episodes (and therefore ``ingest`` calls) the day
+coalesces into.  Pure Python, no Docker; run with::
+
+    uv run pytest tests/benchmarks/test_activitywatch_correlation.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from butlers.connectors.activitywatch import (
+    AfkTimeline,
+    BrowserDomainTimeline,
+    WindowEpisode,
+    _normalize_browser_hostname,
+    _parse_aw_timestamp,
+    build_afk_intervals,
+    classify_app,
+    coalesce_window_episodes,
+)
+
+pytestmark = pytest.mark.perf
+
+_WINDOW_EVENTS = 100_000
+_AFK_EVENTS = 2_000
+_WEB_EVENTS = 20_000
+_LINEAR_SAMPLE = 200
+_DAY_START = datetime(2026, 10, 19, tzinfo=UTC)
+_APPS = ("Code", "iTerm2", "Google Chrome", "Slack", "Finder")
+
+
+def _synthetic_day(seed: int = 42) -> tuple[list[dict], list[dict], list[dict]]:
+    rng = random.Random(seed)
+    window_events: list[dict[str, Any]] = []
+    cursor = 0.0
+    app, title = "Code", "main.py"
+    for _ in range(_WINDOW_EVENTS):
+        if rng.random() < 0.3:  # 70% of events repeat the previous window
+            app, title = rng.choice(_APPS), f"title-{rng.randint(0, 50)}"
+        duration = rng.uniform(0.2, 1.5)
+        window_events.append(
+            {
+                "timestamp": (_DAY_START + timedelta(seconds=cursor)).isoformat(),
+                "duration": duration,
+                "data": {"app": app, "title": title},
+            }
+        )
+        cursor += duration + rng.choice((0.0, 0.0, 0.5, 8.0))
+    day_seconds = cursor
+
+    afk_events = []
+    afk_length = day_seconds / _AFK_EVENTS
+    for i in range(_AFK_EVENTS):
+        afk_events.append(
+            {
+                "timestamp": (_DAY_START + timedelta(seconds=i * afk_length)).isoformat(),
+                "duration": afk_length,
+                "data": {"status": "afk" if i % 5 == 0 else "not-afk"},
+            }
+        )
+
+    web_events = []
+    web_length = day_seconds / _WEB_EVENTS
+    for i in range(_WEB_EVENTS):
+        web_events.append(
+            {
+                "timestamp": (_DAY_START + timedelta(seconds=i * web_length)).isoformat(),
+                "duration": web_length,
+                "data": {"url": f"https://site-{i % 37}.example.test/page", "title": "tab"},
+            }
+        )
+    return window_events, afk_events, web_events
+
+
+def _linear_afk(intervals: list, ts: datetime) -> bool | None:
+    for start, end, status in intervals:
+        if start <= ts <= end:
+            return status == "afk"
+    return None
+
+
+def _linear_web(instant: datetime, web_events: list[dict]) -> str | None:
+    candidates = []
+    for event in web_events:
+        start = _parse_aw_timestamp(event["timestamp"]).astimezone(UTC)
+        duration = float(event.get("duration", 0.0))
+        domain = _normalize_browser_hostname(event["data"].get("url"))
+        if domain is None or duration <= 0:
+            continue
+        if start <= instant < start + timedelta(seconds=duration):
+            candidates.append((start, domain))
+    return max(candidates)[1] if candidates else None
+
+
+def _correlate(window_events, afk_timeline, web_timeline) -> list[WindowEpisode]:
+    singles = []
+    for event in window_events:
+        ts = _parse_aw_timestamp(event["timestamp"])
+        app = event["data"]["app"]
+        singles.append(
+            WindowEpisode(
+                ts=ts,
+                end=ts + timedelta(seconds=event["duration"]),
+                app=app,
+                window_title=event["data"]["title"],
+                is_afk=afk_timeline.status_at(ts),
+                browser_match=web_timeline.match(ts) if classify_app(app) == "browser" else None,
+                raw_event=event,
+            )
+        )
+    return singles
+
+
+def test_timeline_correlation_beats_linear_scan() -> None:
+    window_events, afk_events, web_events = _synthetic_day()
+    intervals = build_afk_intervals(afk_events)
+
+    started = time.perf_counter()
+    sample = window_events[:_LINEAR_SAMPLE]
+    linear = []
+    for event in sample:
+        ts = _parse_aw_timestamp(event["timestamp"])
+        browser = classify_app(event["data"]["app"]) == "browser"
+        linear.append(
+            (_linear_afk(intervals, ts), _linear_web(ts, web_events) if browser else None)
+        )
+    linear_per_event_ms = (time.perf_counter() - started) * 1000 / len(sample)
+
+    started = time.perf_counter()
+    afk_timeline = AfkTimeline(intervals)
+    web_timeline = BrowserDomainTimeline(web_events)
+    singles = _correlate(window_events, afk_timeline, web_timeline)
+    timeline_total_ms = (time.perf_counter() - started) * 1000
+    timeline_per_event_ms = timeline_total_ms / len(window_events)
+
+    episodes = coalesce_window_episodes(singles, max_gap_s=5.0)
+
+    print()
+    print(
+        f"  linear: {linear_per_event_ms:8.4f} ms/event "
+        f"(~{linear_per_event_ms * _WINDOW_EVENTS / 1000:7.1f} s extrapolated for the day)"
+    )
+    print(
+        f"timeline: {timeline_per_event_ms:8.4f} ms/event ({timeline_total_ms / 1000:7.2f} s total)"
+    )
+    print(f"episodes: {len(episodes)} ingest calls for {len(window_events)} window events")
+
+    assert [
+        (s.is_afk, s.browser_match.domain if s.browser_match else None)
+        for s in singles[:_LINEAR_SAMPLE]
+    ] == linear
+    assert timeline_per_event_ms < linear_per_event_ms
+    assert len(episodes) < len(window_events)
@@ -0,0 +1,193 @@
+"""Fan-out benchmark: per-event domain-event delivery vs coalesced batches.
+
+Publishes a burst of ``_EVENTS`` events of one type to ``_SUBSCRIBERS``
+subscribers, twice:
+
+- ``per-event`` — ``publish_domain_event`` once per event: one event insert,
+  then per subscriber one delivery claim, one ``route()`` call and one
+  outcome update;
+- ``coalesced`` — ``publish_domain_events`` with every subscription opted
+  into batches of ``_BATCH``: one multi-row event insert, then per
+  subscriber and batch one claim statement, one ``receive_domain_events``
+  call and one settle statement.
+
+The Switchboard is a stub that answers each ``route()`` call after
+``_ROUTE_LATENCY_S`` (a stand-in for the MCP hop) with a well-formed
+``task_created`` result, so the numbers are bus overhead only.  Both runs
+must end with every (event, subscriber) delivery ``delivered``, and the
+coalesced run must publish more events per second.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_domain_event_coalescing.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import asyncpg
+import pytest
+
+from butlers.core.domain_events import upsert_subscription
+from butlers.core_tools._domain_events import publish_domain_event, publish_domain_events
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_EVENTS = 1_000
+_SUBSCRIBERS = ("general", "health", "relationship")
+_BATCH = 100
+_ROUTE_LATENCY_S = 0.001
+
+# core_186 + core_190 + core_207, minus grants and seeds.
+_SCHEMA_SQL = """
+CREATE TABLE public.domain_events (
+    id             UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    event_type     TEXT NOT NULL,
+    source_butler  TEXT NOT NULL,
+    payload        JSONB NOT NULL DEFAULT '{}'::jsonb,
+    occurred_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE TABLE public.butler_subscriptions (
+    id                    UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    subscriber_butler     TEXT NOT NULL,
+    event_type            TEXT NOT NULL,
+    active                BOOLEAN NOT NULL DEFAULT true,
+    batch_max_events      INT,
+    batch_max_latency_ms  INT,
+    created_at            TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at            TIMESTAMPTZ NOT NULL DEFAULT now(),
+    UNIQUE (subscriber_butler, event_type)
+);
+CREATE TABLE public.domain_event_deliveries (
+    id                 UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    event_id           UUID NOT NULL REFERENCES public.domain_events(id),
+    subscriber_butler  TEXT NOT NULL,
+    status             TEXT NOT NULL DEFAULT 'pending',
+    task_id            UUID,
+    task_name          TEXT,
+    error_message      TEXT,
+    attempt_count      INT NOT NULL DEFAULT 0,
+    batch_id           UUID,
+    delivered_at       TIMESTAMPTZ,
+    created_at         TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at         TIMESTAMPTZ NOT NULL DEFAULT now(),
+    UNIQUE (event_id, subscriber_butler)
+);
+"""
+
+
+class _StubSwitchboard:
+    """Answer ``route()`` like a healthy subscriber would, after a fixed hop."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call_tool(self, tool_name: str, args: dict[str, Any]) -> Any:
+        assert tool_name == "route"
+        self.calls += 1
+        await asyncio.sleep(_ROUTE_LATENCY_S)
+        call_args = args["args"]
+        if args["tool_name"] == "receive_domain_events":
+            result = {
+                "status": "ok",
+                "results": [
+                    {
+                        "event_id": event["event_id"],
+                        "status": "ok",
+                        "state": "task_created",
+                        "task_id": str(uuid.uuid4()),
+                        "task_name": f"bench-batch-{self.calls}",
+                    }
+                    for event in call_args["events"]
+                ],
+            }
+        else:
+            result = {
+                "status": "ok",
+                "state": "task_created",
+                "task_id": str(uuid.uuid4()),
+                "task_name": f"bench-{call_args['event_id']}",
+            }
+        return SimpleNamespace(is_error=False, data={"result": result})
+
+
+@pytest.fixture
+async def bus_pool(bench_db):
+    conn_kwargs, db_name = bench_db
+    pool = await asyncpg.create_pool(**conn_kwargs, database=db_name, min_size=2, max_size=4)
+    await pool.execute(_SCHEMA_SQL)
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+async def _delivered(pool: asyncpg.Pool, event_type: str) -> int:
+    return await pool.fetchval(
+        """
+        SELECT count(*)
+        FROM public.domain_event_deliveries d
+        JOIN public.domain_events e ON e.id = d.event_id
+        WHERE e.event_type = $1 AND d.status = 'delivered'
+        """,
+        event_type,
+    )
+
+
+async def test_coalesced_fan_out_beats_per_event(bus_pool) -> None:
+    per_event_type, coalesced_type = "finance.bench_single", "finance.bench_batched"
+    for subscriber in _SUBSCRIBERS:
+        await upsert_subscription(bus_pool, subscriber_butler=subscriber, event_type=per_event_type)
+        await upsert_subscription(
+            bus_pool,
+            subscriber_butler=subscriber,
+            event_type=coalesced_type,
+            batch_max_events=_BATCH,
+            batch_max_latency_ms=1000,
+        )
+
+    single_client = _StubSwitchboard()
+    started = time.perf_counter()
+    for n in range(_EVENTS):
+        await publish_domain_event(
+            bus_pool,
+            single_client,
+            event_type=per_event_type,
+            source_butler="finance",
+            payload={"n": n},
+        )
+    single_rate = _EVENTS / (time.perf_counter() - started)
+
+    batch_client = _StubSwitchboard()
+    started = time.perf_counter()
+    result = await publish_domain_events(
+        bus_pool,
+        batch_client,
+        source_butler="finance",
+        events=[{"event_type": coalesced_type, "payload": {"n": n}} for n in range(_EVENTS)],
+    )
+    batched_rate = _EVENTS / (time.perf_counter() - started)
+
+    print(
+        f"\n  per-event: {single_rate:8.0f} events/s ({single_client.calls} route calls)"
+        f"\n  coalesced: {batched_rate:8.0f} events/s ({batch_client.calls} route calls)"
+        f"  ({batched_rate / single_rate:5.1f}x)"
+    )
+    assert result["status"] == "ok"
+    assert await _delivered(bus_pool, per_event_type) == _EVENTS * len(_SUBSCRIBERS)
+    assert await _delivered(bus_pool, coalesced_type) == _EVENTS * len(_SUBSCRIBERS)
+    assert batch_client.calls == len(_SUBSCRIBERS) * (_EVENTS // _BATCH)
+    assert batched_rate > single_rate
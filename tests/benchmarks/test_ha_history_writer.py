@@ -0,0 +1,170 @@
+"""Write-path benchmark: per-row INSERT vs batched COPY for HA history rows.
+
+Replays a burst of Home Assistant state changes into a monthly-partitioned
+``connectors.home_assistant_history`` (the core_205 layout) two ways:
+
+- ``insert`` — :func:`butlers.connectors.home_assistant.persist_ha_history`,
+  one ``INSERT`` round-trip per row (the previous write path);
+- ``copy``   — :class:`~butlers.connectors.home_assistant_history.HAHistoryWriter`
+  flushing ``_FLUSH_ROWS`` rows per ``copy_records_to_table``.
+
+It reports rows/sec and the p99 latency of one flush (one ``INSERT`` for the
+per-row path, one ``COPY`` for the writer), plus the per-row cost of that
+flush.  Gate: the writer sustains a higher row rate.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_ha_history_writer.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import shutil
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+import asyncpg
+import pytest
+
+from butlers.connectors.home_assistant import persist_ha_history
+from butlers.connectors.home_assistant_history import HAHistoryWriter
+from butlers.db import register_jsonb_codec
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_ROWS = 5_000
+_FLUSH_ROWS = 500
+_ENTITIES = 20
+
+_SCHEMA_SQL = """
+CREATE SCHEMA connectors;
+CREATE TABLE connectors.home_assistant_history (
+    id          UUID NOT NULL DEFAULT gen_random_uuid(),
+    entity_id   TEXT NOT NULL,
+    state       TEXT,
+    attributes  JSONB,
+    recorded_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (id, recorded_at)
+) PARTITION BY RANGE (recorded_at);
+CREATE INDEX ix_home_assistant_history_entity_recorded_at
+    ON connectors.home_assistant_history (entity_id, recorded_at DESC);
+CREATE INDEX ix_home_assistant_history_recorded_at_id
+    ON connectors.home_assistant_history (recorded_at ASC, id ASC);
+CREATE FUNCTION connectors.home_assistant_history_ensure_partition(reference_ts TIMESTAMPTZ)
+RETURNS TEXT LANGUAGE plpgsql AS $$
+DECLARE
+    month_start TIMESTAMPTZ := date_trunc('month', reference_ts AT TIME ZONE 'UTC')
+                               AT TIME ZONE 'UTC';
+    name        TEXT := 'home_assistant_history_' || to_char(month_start, 'YYYYMM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS connectors.%I PARTITION OF '
+        'connectors.home_assistant_history FOR VALUES FROM (%L) TO (%L)',
+        name, month_start, month_start + INTERVAL '1 month'
+    );
+    RETURN name;
+END;
+$$;
+SELECT connectors.home_assistant_history_ensure_partition(now());
+"""
+
+
+@dataclass
+class _RunResult:
+    mode: str
+    rows: int
+    elapsed_s: float = 0.0
+    flush_ms: list[float] = field(default_factory=list)
+    rows_per_flush: int = 1
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed_s
+
+    @property
+    def p99_ms(self) -> float:
+        return statistics.quantiles(self.flush_ms, n=100)[98]
+
+    def summary(self) -> str:
+        return (
+            f"{self.mode:>6}: {self.rows_per_sec:9.0f} rows/s  "
+            f"flush p99={self.p99_ms:7.3f}ms ({self.rows_per_flush} rows, "
+            f"{self.p99_ms / self.rows_per_flush:6.4f}ms/row)"
+        )
+
+
+def _rows(now: datetime) -> list[tuple[str, str, dict, datetime]]:
+    return [
+        (
+            f"sensor.bench_{i % _ENTITIES}",
+            f"{20 + (i % 50) / 10:.1f}",
+            {"unit_of_measurement": "°C", "friendly_name": f"Bench {i % _ENTITIES}"},
+            now + timedelta(milliseconds=i),
+        )
+        for i in range(_ROWS)
+    ]
+
+
+async def _run_insert(pool: asyncpg.Pool, rows: list) -> _RunResult:
+    result = _RunResult(mode="insert", rows=len(rows))
+    started = time.perf_counter()
+    for entity_id, state, attributes, recorded_at in rows:
+        t = time.perf_counter()
+        assert await persist_ha_history(
+            pool, entity_id=entity_id, state=state, attributes=attributes, recorded_at=recorded_at
+        )
+        result.flush_ms.append((time.perf_counter() - t) * 1000)
+    result.elapsed_s = time.perf_counter() - started
+    return result
+
+
+async def _run_copy(pool: asyncpg.Pool, rows: list) -> _RunResult:
+    result = _RunResult(mode="copy", rows=len(rows), rows_per_flush=_FLUSH_ROWS)
+    # flush_rows above the batch size so flush timing is measured explicitly.
+    writer = HAHistoryWriter(pool, endpoint_identity="bench", flush_rows=len(rows) + 1)
+    started = time.perf_counter()
+    for offset in range(0, len(rows), _FLUSH_ROWS):
+        for entity_id, state, attributes, recorded_at in rows[offset : offset + _FLUSH_ROWS]:
+            await writer.add(
+                entity_id=entity_id, state=state, attributes=attributes, recorded_at=recorded_at
+            )
+        t = time.perf_counter()
+        assert await writer.flush()
+        result.flush_ms.append((time.perf_counter() - t) * 1000)
+    result.elapsed_s = time.perf_counter() - started
+    return result
+
+
+@pytest.fixture
+async def bench_pool(bench_db):
+    conn_kwargs, db_name = bench_db
+    pool = await asyncpg.create_pool(
+        **conn_kwargs, database=db_name, min_size=1, max_size=2, init=register_jsonb_codec
+    )
+    await pool.execute(_SCHEMA_SQL)
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+async def test_copy_writer_outpaces_per_row_insert(bench_pool) -> None:
+    now = datetime.now(UTC)
+    insert = await _run_insert(bench_pool, _rows(now))
+    copy = await _run_copy(bench_pool, _rows(now + timedelta(seconds=10)))
+
+    print()
+    for run in (insert, copy):
+        print(run.summary())
+    assert await bench_pool.fetchval("SELECT count(*) FROM connectors.home_assistant_history") == (
+        2 * _ROWS
+    )
+    assert copy.rows_per_sec > insert.rows_per_sec
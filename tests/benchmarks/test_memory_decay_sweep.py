@@ -0,0 +1,114 @@
+"""Decay-sweep benchmark: set-based ``run_decay_sweep`` vs the row-at-a-time sweep.
+
+Seeds a migrated memory schema with ``_SIZES`` facts (a spread of retention
+classes, confidences and ages so every outcome occurs) and times
+:func:`butlers.modules.memory.storage.run_decay_sweep` over it.  At the
+smallest size the reference row-at-a-time sweep
+(``tests.modules.memory._test_helpers.rowwise_decay_sweep``) runs on an
+identical copy first; the set-based sweep must beat it.  The row-at-a-time
+sweep is not run at 1M facts — it takes far too long to be worth waiting for.
+
+Each run must account for every candidate exactly once
+(``decayed + archived + untouched == checked``) and leave ``validity`` counts
+consistent with its stats.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_memory_decay_sweep.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+from datetime import UTC, datetime
+
+import asyncpg
+import pytest
+
+from butlers.db import register_jsonb_codec
+from butlers.modules.memory.storage import run_decay_sweep
+from butlers.testing.migration import create_migrated_test_db, migration_db_name
+from tests.modules.memory._test_helpers import rowwise_decay_sweep
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_SIZES = (100_000, 1_000_000)
+_ROWWISE_MAX = 100_000
+
+# Deterministic spread: classes (incl. archive-before-delete ones), confidence
+# and decay rates, ages from hours to a year, some already fading.
+_SEED_SQL = """
+INSERT INTO facts (subject, predicate, content, confidence, decay_rate,
+                   last_confirmed_at, retention_class, validity, metadata)
+SELECT 'subject-' || g, 'predicate-' || (g % 97), 'content-' || g,
+       (ARRAY[1.0, 0.9, 0.5, 0.3, 0.1])[1 + g % 5],
+       (ARRAY[0.0, 0.002, 0.008, 0.1, 0.5])[1 + (g / 5) % 5],
+       $2::timestamptz - (g % 8760) * INTERVAL '1 hour',
+       (ARRAY['transient', 'episodic', 'operational', 'health_log', 'financial_log'])
+           [1 + (g / 25) % 5],
+       CASE WHEN g % 11 = 0 AND (g / 5) % 5 <> 0 THEN 'fading' ELSE 'active' END,
+       CASE WHEN g % 13 = 0 THEN '{"status": "fading"}'::jsonb ELSE '{}'::jsonb END
+FROM generate_series(1, $1) AS g
+"""
+
+
+async def _seeded_pool(postgres_container, size: int, now: datetime) -> asyncpg.Pool:
+    db_url = await asyncio.to_thread(
+        create_migrated_test_db, postgres_container, migration_db_name(), ["core", "memory"]
+    )
+    pool = await asyncpg.create_pool(dsn=db_url, min_size=1, max_size=2, init=register_jsonb_codec)
+    await pool.execute(_SEED_SQL, size, now)
+    await pool.execute("VACUUM ANALYZE facts")
+    return pool
+
+
+async def _assert_consistent(pool: asyncpg.Pool, stats: dict) -> None:
+    assert stats["decayed"] + stats["archived"] + stats["untouched"] == (
+        stats["facts_checked"] + stats["rules_checked"]
+    )
+    counts = dict(await pool.fetch("SELECT validity, count(*) FROM facts GROUP BY validity"))
+    assert counts.get("fading", 0) == stats["facts_fading"]
+    assert counts.get("expired", 0) == stats["facts_expired"]
+
+
+async def test_set_based_decay_sweep_scales(postgres_container) -> None:
+    now = datetime.now(UTC)
+    print()
+    for size in _SIZES:
+        rowwise_rate = None
+        if size <= _ROWWISE_MAX:
+            pool = await _seeded_pool(postgres_container, size, now)
+            try:
+                started = time.perf_counter()
+                await rowwise_decay_sweep(pool, now=now)
+                rowwise_rate = size / (time.perf_counter() - started)
+            finally:
+                await pool.close()
+
+        pool = await _seeded_pool(postgres_container, size, now)
+        try:
+            started = time.perf_counter()
+            stats = await run_decay_sweep(pool, now=now)
+            elapsed = time.perf_counter() - started
+            await _assert_consistent(pool, stats)
+        finally:
+            await pool.close()
+
+        set_rate = size / elapsed
+        line = (
+            f"  facts={size:>9,}: set-based {elapsed:7.2f}s ({set_rate:9.0f} facts/s)"
+            f"  decayed={stats['decayed']} archived={stats['archived']}"
+            f" untouched={stats['untouched']}"
+        )
+        if rowwise_rate is not None:
+            line += f"  row-wise {rowwise_rate:7.0f} facts/s ({set_rate / rowwise_rate:5.1f}x)"
+            assert set_rate > rowwise_rate
+        print(line)
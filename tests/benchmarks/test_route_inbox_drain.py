@@ -0,0 +1,117 @@
+"""Drain benchmark: one-row leases vs batched leases on a route_inbox backlog.
+
+Seeds ``_BACKLOG`` accepted ``route_inbox`` rows in a database migrated by the
+real core chain and drains them with
+:func:`butlers.core.route_inbox.route_inbox_drain` and 1, 4 and 16 concurrent
+workers, twice per worker count:
+
+- ``single`` — ``max_batch=1``: one claim and one settle round trip per row,
+  the cost of draining through per-row leases;
+- ``batched`` — adaptive batches of up to ``_MAX_BATCH`` rows
+  (``FOR UPDATE SKIP LOCKED`` claim, one settle statement per batch).
+
+The handler does no work, so the numbers are pure queue overhead.  Every run
+must settle each row exactly once with no lost leases (``SKIP LOCKED`` never
+hands one row to two workers), and batched draining must beat single-row
+draining at every worker count.  The single-row runs drain a tenth of the
+backlog to keep the benchmark short; throughput is compared in rows/s.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_route_inbox_drain.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+
+import asyncpg
+import pytest
+
+from butlers.core.route_inbox import RouteInboxClaim, route_inbox_drain
+from butlers.db import register_jsonb_codec
+from butlers.testing.migration import create_migrated_test_db, migration_db_name
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_BACKLOG = 50_000
+_SINGLE_BACKLOG = _BACKLOG // 10
+_MAX_BATCH = 200
+_WORKER_COUNTS = (1, 4, 16)
+
+_SEED_SQL = """
+INSERT INTO route_inbox (route_envelope, received_at)
+SELECT jsonb_build_object('schema_version', 'route.v1', 'input',
+                          jsonb_build_object('prompt', 'message ' || g)),
+       now() - INTERVAL '1 hour' + g * INTERVAL '1 millisecond'
+FROM generate_series(1, $1) AS g
+"""
+
+
+@pytest.fixture
+async def inbox_pool(postgres_container):
+    db_name = migration_db_name()
+    db_url = await asyncio.to_thread(create_migrated_test_db, postgres_container, db_name, ["core"])
+    pool = await asyncpg.create_pool(
+        db_url,
+        min_size=max(_WORKER_COUNTS),
+        max_size=max(_WORKER_COUNTS),
+        init=register_jsonb_codec,
+    )
+    try:
+        yield pool
+    finally:
+        await pool.close()
+        admin = await asyncpg.connect(
+            host=postgres_container.get_container_host_ip(),
+            port=int(postgres_container.get_exposed_port(5432)),
+            user=postgres_container.username,
+            password=postgres_container.password,
+            database="postgres",
+        )
+        try:
+            await admin.execute(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE)')
+        finally:
+            await admin.close()
+
+
+async def _drain(pool: asyncpg.Pool, rows: int, workers: int, max_batch: int) -> float:
+    await pool.execute("TRUNCATE route_inbox")
+    await pool.execute(_SEED_SQL, rows)
+    await pool.execute("VACUUM ANALYZE route_inbox")
+
+    async def _process(_claim: RouteInboxClaim) -> None:
+        return None
+
+    started = time.perf_counter()
+    stats = await route_inbox_drain(
+        pool, _process, workers=workers, max_batch=max_batch, min_age_s=0
+    )
+    elapsed = time.perf_counter() - started
+
+    assert (stats.processed, stats.errored, stats.lost) == (rows, 0, 0)
+    states = await pool.fetch(
+        "SELECT lifecycle_state, count(*) AS n FROM route_inbox GROUP BY lifecycle_state"
+    )
+    assert {row["lifecycle_state"]: row["n"] for row in states} == {"processed": rows}
+    return rows / elapsed
+
+
+async def test_batched_claims_drain_faster(inbox_pool) -> None:
+    print()
+    for workers in _WORKER_COUNTS:
+        single = await _drain(inbox_pool, _SINGLE_BACKLOG, workers, 1)
+        batched = await _drain(inbox_pool, _BACKLOG, workers, _MAX_BATCH)
+        print(
+            f"  workers={workers:>2}: single={single:9.0f} rows/s  "
+            f"batched={batched:9.0f} rows/s  ({batched / single:5.1f}x)"
+        )
+        assert batched > single
@@ -0,0 +1,257 @@
+"""Read-path benchmark: fan-out ILIKE search vs the unified search index.
+
+Seeds ``_BUTLERS`` butler schemas with sessions and state rows (plus shared
+entities), installs the core_206 triggers by replaying the migration's SQL,
+and lets the triggers fill ``public.search_documents``.  Then, for a series of
+keystroke-style queries, times:
+
+- ``fan-out`` — the ``search_v1`` path behind ``GET /api/search``: entity and
+  contact queries on one pool plus session and state ``ILIKE`` queries fanned
+  out to every butler pool;
+- ``unified`` — ``search_v2.query_search_documents``: one ranked statement
+  over the tsvector and trigram GIN indexes.
+
+Both paths must agree on how many session/state rows match the seeded needle
+term.  Runs at 10k documents by default; the 1M-document size (several
+minutes of seeding) is opt-in with ``SEARCH_BENCH_1M=1``, and only that size
+gates on the unified path being faster.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_search_index.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import statistics
+import time
+from pathlib import Path
+
+import asyncpg
+import pytest
+
+from butlers.api.db import DatabaseManager
+from butlers.api.read_models import search_v1
+from butlers.api.read_models.search_v2 import query_search_documents
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_BUTLERS = 8
+_ENTITIES = 500
+_LIMIT = 20
+_REPEATS = 5
+_NEEDLE = "quarterly"
+_QUERIES = ("q", "qu", "qua", "quar", "quarterly", "invoice", "alice smi", "zzz-nothing")
+
+_CORE_206 = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "core"
+    / "core_206_search_documents.py"
+)
+
+_PUBLIC_SQL = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE TABLE public.entities (
+    id             UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    canonical_name VARCHAR NOT NULL,
+    entity_type    VARCHAR NOT NULL DEFAULT 'other',
+    aliases        TEXT[] NOT NULL DEFAULT '{}',
+    metadata       JSONB DEFAULT '{}'::jsonb,
+    roles          TEXT[] NOT NULL DEFAULT '{}',
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+"""
+
+_BUTLER_SQL = """
+CREATE SCHEMA {schema};
+CREATE TABLE {schema}.sessions (
+    id             UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    prompt         TEXT NOT NULL,
+    trigger_source TEXT NOT NULL DEFAULT 'bench',
+    success        BOOLEAN,
+    result         TEXT,
+    duration_ms    INTEGER,
+    started_at     TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE TABLE {schema}.state (
+    key        TEXT PRIMARY KEY,
+    value      JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    version    INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE {schema}.calendar_events (
+    id          UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    title       TEXT NOT NULL,
+    description TEXT,
+    location    TEXT,
+    starts_at   TIMESTAMPTZ NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'confirmed'
+);
+"""
+
+# One word list drives every seeded text; ~1% of rows carry the needle.
+_SEED_SESSIONS_SQL = """
+WITH words AS (
+    SELECT ARRAY['weekly', 'invoice', 'reminder', 'groceries', 'flight', 'dentist',
+                 'budget', 'report', 'meeting', 'garden', 'alice', 'smith', 'renewal',
+                 'insurance', 'summary', 'travel'] AS w
+)
+INSERT INTO {schema}.sessions (prompt, result, started_at)
+SELECT
+    w[1 + (random() * 15)::int] || ' ' || w[1 + (random() * 15)::int]
+        || CASE WHEN random() < 0.01 THEN ' {needle}' ELSE '' END
+        || ' #' || g,
+    repeat(w[1 + (random() * 15)::int] || ' ', 20),
+    now() - g * INTERVAL '1 minute'
+FROM words, generate_series(1, $1) AS g
+"""
+
+_SEED_STATE_SQL = """
+INSERT INTO {schema}.state (key, value)
+SELECT 'bench.' || g || CASE WHEN random() < 0.01 THEN '.{needle}' ELSE '' END,
+       jsonb_build_object('note', md5(g::text))
+FROM generate_series(1, $1) AS g
+"""
+
+
+def _core_206_statements() -> list[str]:
+    """Collect the SQL core_206's ``upgrade()`` would run, in order."""
+    spec = importlib.util.spec_from_file_location("core_206_bench", _CORE_206)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    statements: list[str] = []
+    module.op = type("_Op", (), {"execute": staticmethod(statements.append)})
+    module.upgrade()
+    return statements
+
+
+def _p(values: list[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+async def _fan_out(db: DatabaseManager, pool: asyncpg.Pool, q: str) -> None:
+    pattern = f"%{q}%"
+    await search_v1.query_entity_search(pool, pattern, _LIMIT)
+    await search_v1.query_contact_search(pool, pattern, _LIMIT)
+    await search_v1.query_session_search(db, pattern, _LIMIT)
+    await search_v1.query_state_search(db, pattern, _LIMIT)
+
+
+async def _time(label: str, run) -> list[float]:
+    timings = []
+    for q in _QUERIES:
+        for _ in range(_REPEATS):
+            started = time.perf_counter()
+            await run(q)
+            timings.append((time.perf_counter() - started) * 1000)
+    print(f"  {label:>7}: p50={statistics.median(timings):8.2f}ms  p95={_p(timings, 95):8.2f}ms")
+    return timings
+
+
+@pytest.fixture
+async def bench_db(bench_db):
+    conn_kwargs, db_name = bench_db
+    db = DatabaseManager(
+        host=conn_kwargs["host"],
+        port=conn_kwargs["port"],
+        user=conn_kwargs["user"],
+        password=conn_kwargs["password"],
+    )
+    conn = await asyncpg.connect(**conn_kwargs, database=db_name)
+    try:
+        await conn.execute(_PUBLIC_SQL)
+        await conn.execute(
+            f"""
+            INSERT INTO public.entities (canonical_name, entity_type, aliases)
+            SELECT 'Entity ' || g || CASE WHEN g % 50 = 0 THEN ' {_NEEDLE}' ELSE '' END,
+                   CASE WHEN g % 2 = 0 THEN 'person' ELSE 'organization' END,
+                   ARRAY['alias-' || g]
+            FROM generate_series(1, $1) AS g
+            """,
+            _ENTITIES,
+        )
+        statements = _core_206_statements()
+        for i in range(_BUTLERS):
+            schema = f"bench_b{i}"
+            await conn.execute(_BUTLER_SQL.format(schema=schema))
+            await conn.execute(f"SET search_path TO {schema}, public")
+            for statement in statements:
+                await conn.execute(statement)
+            await db.add_butler(schema, db_name=db_name, db_schema=schema)
+    finally:
+        await conn.close()
+    try:
+        yield db, {**conn_kwargs, "database": db_name}
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize(
+    "documents",
+    [
+        10_000,
+        pytest.param(
+            1_000_000,
+            marks=pytest.mark.skipif(
+                os.environ.get("SEARCH_BENCH_1M") != "1",
+                reason="1M-document run is opt-in (SEARCH_BENCH_1M=1)",
+            ),
+        ),
+    ],
+)
+async def test_unified_index_vs_fan_out(bench_db, documents: int) -> None:
+    db, conn_kwargs = bench_db
+    per_butler = (documents - 2 * _ENTITIES) // _BUTLERS
+    sessions, states = per_butler * 9 // 10, per_butler // 10
+    conn = await asyncpg.connect(**conn_kwargs)
+    try:
+        await conn.execute("SELECT setseed(0.42)")
+        for name in db.butler_names:
+            await conn.execute(_SEED_SESSIONS_SQL.format(schema=name, needle=_NEEDLE), sessions)
+            await conn.execute(_SEED_STATE_SQL.format(schema=name, needle=_NEEDLE), states)
+        await conn.execute("VACUUM ANALYZE public.search_documents")
+        indexed = await conn.fetchval("SELECT count(*) FROM public.search_documents")
+        needle_indexed = await conn.fetchval(
+            "SELECT count(*) FROM public.search_documents"
+            " WHERE doc_kind IN ('session', 'state') AND search_text LIKE $1",
+            f"%{_NEEDLE}%",
+        )
+    finally:
+        await conn.close()
+
+    needle_scanned = 0
+    for name in db.butler_names:
+        needle_scanned += await db.pool(name).fetchval(
+            "SELECT (SELECT count(*) FROM sessions WHERE prompt ILIKE $1 OR result ILIKE $1)"
+            " + (SELECT count(*) FROM state WHERE key ILIKE $1 OR value::text ILIKE $1)",
+            f"%{_NEEDLE}%",
+        )
+
+    pool = db.pool(db.butler_names[0])
+    schemas = list(db.butler_names)
+
+    async def _unified(q: str) -> None:
+        await query_search_documents(pool, q, _LIMIT, schemas)
+
+    print(f"\n  {indexed} documents across {len(schemas)} butler schemas")
+    fan_out = await _time("fan-out", lambda q: _fan_out(db, pool, q))
+    unified = await _time("unified", _unified)
+
+    page = await query_search_documents(pool, _NEEDLE, _LIMIT, schemas)
+    assert page.rows.get("session"), "needle sessions should be found through the index"
+    assert needle_indexed == needle_scanned
+    if documents >= 1_000_000:
+        assert statistics.median(unified) < statistics.median(fan_out)
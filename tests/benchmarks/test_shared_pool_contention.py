@@ -0,0 +1,217 @@
+"""Contention benchmark: dedicated per-butler pools vs the shared routed pool.
+
+Simulates ``butlers up`` with eight butler schemas in one database.  Every
+butler runs concurrent workers issuing short queries against its own schema,
+once with one :class:`~butlers.db.Database` pool per butler (the default) and
+once with ``BUTLERS_DB_SHARED_POOL=1``.  For each mode the benchmark reports
+throughput, per-query P95, the peak number of server backends sampled from
+``pg_stat_activity``, and (shared mode) how many acquires needed a route
+``SET`` versus reused the connection's cached route.
+
+Gates:
+- the shared pool never opens more backends than its ``max_size``, and fewer
+  than the dedicated pools do for the same workload;
+- under a skewed load (one hot butler with more workers than the whole pool,
+  seven quiet ones) the quiet butlers' P95 is lower with the per-butler
+  fair-share cap than without it, i.e. the cap keeps the hot butler from
+  queueing the others behind its own backlog.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_shared_pool_contention.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import statistics
+import time
+from dataclasses import dataclass, field
+
+import asyncpg
+import pytest
+
+from butlers.db import Database
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_BUTLERS = [f"bench_b{i}" for i in range(8)]
+_QUERIES_PER_WORKER = 40
+_BALANCED_WORKERS = 6
+_HOT_WORKERS = 40
+_DEDICATED_MAX = 10
+_SHARED_MAX = 20
+_QUERY = "SELECT count(*) FROM work_items, pg_sleep(0.002)"
+
+
+@dataclass
+class _RunResult:
+    mode: str
+    elapsed_s: float
+    latencies_ms: dict[str, list[float]] = field(default_factory=dict)
+    peak_backends: int = 0
+    route_stats: dict[str, int] = field(default_factory=dict)
+
+    def p95(self, butlers: list[str] | None = None) -> float:
+        samples = [
+            ms
+            for name, values in self.latencies_ms.items()
+            for ms in values
+            if butlers is None or name in butlers
+        ]
+        return statistics.quantiles(samples, n=20)[18]
+
+    def summary(self) -> str:
+        total = sum(len(v) for v in self.latencies_ms.values())
+        return (
+            f"{self.mode:>9}: {total / self.elapsed_s:8.0f} q/s  "
+            f"p95={self.p95():6.1f}ms  peak_backends={self.peak_backends:3d}  "
+            f"routes={self.route_stats or '-'}"
+        )
+
+
+async def _prepare(conn_kwargs: dict, db_name: str) -> None:
+    conn = await asyncpg.connect(**conn_kwargs, database=db_name)
+    try:
+        for schema in _BUTLERS:
+            await conn.execute(
+                f"CREATE SCHEMA {schema}; "
+                f"CREATE TABLE {schema}.work_items (id int PRIMARY KEY); "
+                f"INSERT INTO {schema}.work_items SELECT generate_series(1, 100)"
+            )
+    finally:
+        await conn.close()
+
+
+async def _sample_backends(conn_kwargs: dict, db_name: str, stop: asyncio.Event) -> int:
+    conn = await asyncpg.connect(**conn_kwargs, database="postgres")
+    peak = 0
+    try:
+        while not stop.is_set():
+            count = await conn.fetchval(
+                "SELECT count(*) FROM pg_stat_activity WHERE datname = $1", db_name
+            )
+            peak = max(peak, int(count))
+            await asyncio.sleep(0.01)
+    finally:
+        await conn.close()
+    return peak
+
+
+async def _run_workload(
+    conn_kwargs: dict,
+    db_name: str,
+    *,
+    shared: bool,
+    workers: dict[str, int],
+    monkeypatch: pytest.MonkeyPatch,
+    per_butler: int = _SHARED_MAX // 2,
+) -> _RunResult:
+    if shared:
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL", "1")
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL_MAX_SIZE", str(_SHARED_MAX))
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL_PER_BUTLER", str(per_butler))
+    else:
+        monkeypatch.delenv("BUTLERS_DB_SHARED_POOL", raising=False)
+
+    databases = []
+    for schema in _BUTLERS:
+        db = Database(
+            db_name=db_name,
+            schema=schema,
+            host=conn_kwargs["host"],
+            port=conn_kwargs["port"],
+            user=conn_kwargs["user"],
+            password=conn_kwargs["password"],
+            min_pool_size=1,
+            max_pool_size=_DEDICATED_MAX,
+        )
+        await db.connect()
+        databases.append(db)
+
+    mode = f"shared/{per_butler}" if shared else "dedicated"
+    result = _RunResult(mode=mode, elapsed_s=0.0)
+
+    async def _worker(db: Database) -> None:
+        samples = result.latencies_ms.setdefault(db.schema or "", [])
+        for _ in range(_QUERIES_PER_WORKER):
+            started = time.perf_counter()
+            assert await db.pool.fetchval(_QUERY) == 100
+            samples.append((time.perf_counter() - started) * 1000)
+
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_backends(conn_kwargs, db_name, stop))
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(_worker(db) for db in databases for _ in range(workers[db.schema or ""]))
+        )
+    finally:
+        result.elapsed_s = time.perf_counter() - started
+        stop.set()
+        result.peak_backends = await sampler
+        if shared:
+            result.route_stats = dict(databases[0].pool.shared.stats())
+        for db in databases:
+            await db.close()
+    return result
+
+
+@pytest.fixture
+async def bench_db(bench_db) -> tuple[dict, str]:
+    await _prepare(*bench_db)
+    return bench_db
+
+
+async def test_shared_pool_bounds_backends_under_balanced_load(bench_db, monkeypatch) -> None:
+    conn_kwargs, db_name = bench_db
+    workers = dict.fromkeys(_BUTLERS, _BALANCED_WORKERS)
+
+    dedicated = await _run_workload(
+        conn_kwargs, db_name, shared=False, workers=workers, monkeypatch=monkeypatch
+    )
+    shared = await _run_workload(
+        conn_kwargs, db_name, shared=True, workers=workers, monkeypatch=monkeypatch
+    )
+
+    print()
+    print(dedicated.summary())
+    print(shared.summary())
+    # The sampler connects to "postgres", so only pool backends are counted.
+    assert shared.peak_backends <= _SHARED_MAX
+    assert shared.peak_backends < dedicated.peak_backends
+    assert shared.route_stats["route_hits"] > 0
+
+
+async def test_fair_share_protects_quiet_butlers_from_a_hot_one(bench_db, monkeypatch) -> None:
+    conn_kwargs, db_name = bench_db
+    hot, quiet = _BUTLERS[0], _BUTLERS[1:]
+    workers = {hot: _HOT_WORKERS, **dict.fromkeys(quiet, 1)}
+
+    dedicated = await _run_workload(
+        conn_kwargs, db_name, shared=False, workers=workers, monkeypatch=monkeypatch
+    )
+    uncapped = await _run_workload(
+        conn_kwargs,
+        db_name,
+        shared=True,
+        workers=workers,
+        monkeypatch=monkeypatch,
+        per_butler=_SHARED_MAX,
+    )
+    capped = await _run_workload(
+        conn_kwargs, db_name, shared=True, workers=workers, monkeypatch=monkeypatch
+    )
+
+    print()
+    for run in (dedicated, uncapped, capped):
+        print(run.summary())
+        print(f"{'':>11}quiet p95={run.p95(quiet):6.1f}ms")
+    assert capped.p95(quiet) < uncapped.p95(quiet)
@@ -0,0 +1,164 @@
+"""Plan-time benchmark: registered, pre-prepared statements vs asyncpg defaults.
+
+A butler pool connection serves every code path of its butler, so a hot
+statement shares asyncpg's per-connection statement cache with many cold
+ones.  This benchmark runs one hot, planner-heavy statement (a six-way join,
+registered with :func:`butlers.db_statements.register_statement`) interleaved
+with a churn of distinct cold statements, through a real
+:class:`~butlers.db.Database` pool in three modes:
+
+- ``uncached`` — ``BUTLERS_DB_STATEMENT_CACHE_SIZE=0``: every call parses and
+  plans;
+- ``default``  — asyncpg's stock cache of 100, smaller than the cold churn, so
+  the hot statement is evicted between uses;
+- ``tuned``    — the registry default, large enough to keep the hot statement
+  resident, plus pre-preparation from the pool ``init`` hook.
+
+It reports the hot statement's P50 and its first-call latency on a fresh
+connection.  Gates: the tuned mode's hot P50 beats both others, and its first
+call is no slower than the uncached mode's (the statement is already
+prepared when the connection is handed out).
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_statement_cache.py -v -s --override-ini="addopts="
+"""
+
+from __future__ import annotations
+
+import shutil
+import statistics
+import time
+from dataclasses import dataclass, field
+
+import asyncpg
+import pytest
+
+from butlers.db import Database
+from butlers.db_statements import DEFAULT_STATEMENT_CACHE_SIZE, register_statement
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_ROUNDS = 200
+_COLD_STATEMENTS = 150
+_ASYNCPG_DEFAULT_CACHE = 100
+
+_HOT_SQL = register_statement(
+    "bench.statement_cache.hot",
+    """
+    SELECT a.id, b.label, c.label, d.label, e.label, f.label
+    FROM bench_a a
+    JOIN bench_b b ON b.a_id = a.id
+    JOIN bench_c c ON c.b_id = b.id
+    JOIN bench_d d ON d.c_id = c.id
+    JOIN bench_e e ON e.d_id = d.id
+    JOIN bench_f f ON f.e_id = e.id
+    WHERE a.id = $1
+    """,
+    relations=("bench_a", "bench_b", "bench_c", "bench_d", "bench_e", "bench_f"),
+)
+
+
+@dataclass
+class _RunResult:
+    mode: str
+    first_call_ms: float = 0.0
+    hot_ms: list[float] = field(default_factory=list)
+
+    @property
+    def p50(self) -> float:
+        return statistics.median(self.hot_ms)
+
+    def summary(self) -> str:
+        return f"{self.mode:>9}: hot p50={self.p50:6.3f}ms  first call={self.first_call_ms:6.3f}ms"
+
+
+async def _prepare(conn_kwargs: dict, db_name: str) -> None:
+    conn = await asyncpg.connect(**conn_kwargs, database=db_name)
+    try:
+        await conn.execute(
+            "CREATE TABLE bench_a (id int PRIMARY KEY);"
+            "INSERT INTO bench_a SELECT generate_series(1, 1000);"
+        )
+        for parent, child in zip("abcde", "bcdef", strict=True):
+            await conn.execute(
+                f"CREATE TABLE bench_{child} (id int PRIMARY KEY, {parent}_id int, label text);"
+                f"CREATE INDEX ON bench_{child} ({parent}_id);"
+                f"INSERT INTO bench_{child} SELECT g, g, 'x' || g FROM generate_series(1, 1000) g;"
+            )
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+
+
+async def _run(
+    conn_kwargs: dict, db_name: str, *, mode: str, cache_size: int, monkeypatch
+) -> _RunResult:
+    monkeypatch.setenv("BUTLERS_DB_STATEMENT_CACHE_SIZE", str(cache_size))
+    db = Database(
+        db_name=db_name,
+        host=conn_kwargs["host"],
+        port=conn_kwargs["port"],
+        user=conn_kwargs["user"],
+        password=conn_kwargs["password"],
+        min_pool_size=1,
+        max_pool_size=1,
+    )
+    await db.connect()
+    result = _RunResult(mode=mode)
+    try:
+        async with db.pool.acquire() as conn:
+            started = time.perf_counter()
+            await conn.fetch(_HOT_SQL, 1)
+            result.first_call_ms = (time.perf_counter() - started) * 1000
+            for i in range(_ROUNDS):
+                for j in range(_COLD_STATEMENTS):
+                    await conn.fetchval(f"SELECT $1::int + {j}", i)
+                started = time.perf_counter()
+                await conn.fetch(_HOT_SQL, i % 1000 + 1)
+                result.hot_ms.append((time.perf_counter() - started) * 1000)
+    finally:
+        await db.close()
+    return result
+
+
+@pytest.fixture
+async def bench_db(bench_db) -> tuple[dict, str]:
+    await _prepare(*bench_db)
+    return bench_db
+
+
+async def test_registered_statements_skip_repeated_planning(bench_db, monkeypatch) -> None:
+    conn_kwargs, db_name = bench_db
+    assert DEFAULT_STATEMENT_CACHE_SIZE > _COLD_STATEMENTS
+
+    uncached = await _run(
+        conn_kwargs, db_name, mode="uncached", cache_size=0, monkeypatch=monkeypatch
+    )
+    default = await _run(
+        conn_kwargs,
+        db_name,
+        mode="default",
+        cache_size=_ASYNCPG_DEFAULT_CACHE,
+        monkeypatch=monkeypatch,
+    )
+    tuned = await _run(
+        conn_kwargs,
+        db_name,
+        mode="tuned",
+        cache_size=DEFAULT_STATEMENT_CACHE_SIZE,
+        monkeypatch=monkeypatch,
+    )
+
+    print()
+    for run in (uncached, default, tuned):
+        print(run.summary())
+    assert tuned.p50 < default.p50
+    assert tuned.p50 < uncached.p50
+    assert tuned.first_call_ms <= uncached.first_call_ms
@@ -0,0 +1,168 @@
+"""Load benchmark: switchboard ingest → buffer → classify → route → target spawn.
+
+Replays synthetic Telegram and email envelopes through the real ingest,
+DurableBuffer, MessagePipeline and Spawner code against a migrated
+core + switchboard database, with every LLM replaced by the scripted
+:class:`~butlers.core.runtimes.fake.FakeAdapter` (see
+:mod:`butlers.testing.load_harness`).  Prints throughput, buffer queue depth,
+per-stage p50/p95/p99 and database round trips per message, so infrastructure
+changes can be measured without model noise.
+
+Gates are deliberately loose (every message completes; round trips are
+counted): the numbers are for comparing runs, not for CI pass/fail.
+
+Requires Docker (testcontainers).  Not collected by default; run with::
+
+    uv run pytest tests/benchmarks/test_switchboard_load.py -v -s --override-ini="addopts="
+
+Tune with ``LOAD_MESSAGES`` / ``LOAD_RATE`` and ``BUTLERS_FAKE_RUNTIME_LATENCY``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import zlib
+from pathlib import Path
+
+import asyncpg
+import pytest
+
+from butlers.config import BufferConfig, ButlerConfig, RuntimeSeedConfig
+from butlers.core.runtimes.fake import FakeAdapter, FakeTurn, LatencyDistribution
+from butlers.core.spawner import Spawner
+from butlers.db import register_jsonb_codec, schema_search_path
+from butlers.modules.pipeline import MessagePipeline
+from butlers.testing.load_harness import (
+    LoadHarness,
+    RoundTripCounter,
+    mark_mcp_warm,
+    pipeline_process,
+    route_executor,
+    switchboard_ingest,
+)
+from butlers.testing.migration import create_migrated_test_db, migration_db_name
+from tests.e2e.envelopes import email_envelope, telegram_envelope
+
+docker_available = shutil.which("docker") is not None
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_MESSAGES = int(os.environ.get("LOAD_MESSAGES", "200"))
+_RATE_PER_S = float(os.environ.get("LOAD_RATE", "40"))
+_TARGETS = ("general", "health", "finance")
+
+
+@pytest.fixture
+async def load_pool(postgres_container):
+    counter = RoundTripCounter()
+    db_url = await asyncio.to_thread(
+        create_migrated_test_db,
+        postgres_container,
+        migration_db_name(),
+        ["core", "switchboard"],
+        {"switchboard": "switchboard"},
+    )
+
+    async def _init(conn: asyncpg.Connection) -> None:
+        await register_jsonb_codec(conn)
+        await counter.attach(conn)
+
+    pool = await asyncpg.create_pool(
+        db_url,
+        min_size=2,
+        max_size=10,
+        init=_init,
+        server_settings={"search_path": schema_search_path("switchboard")},
+    )
+    try:
+        for name in _TARGETS:
+            await pool.execute(
+                "INSERT INTO butler_registry (name, endpoint_url) VALUES ($1, $2) "
+                "ON CONFLICT DO NOTHING",
+                name,
+                f"http://localhost:0/{name}",
+            )
+        counter.per_message.clear()
+        counter.unattributed = 0
+        yield pool, counter
+    finally:
+        await pool.close()
+
+
+def _spawner(tmp_path: Path, name: str, adapter: FakeAdapter) -> Spawner:
+    config_dir = tmp_path / name
+    config_dir.mkdir()
+    config = ButlerConfig(
+        name=name, port=0, runtime_seed=RuntimeSeedConfig(max_concurrent_sessions=4)
+    )
+    spawner = Spawner(config=config, config_dir=config_dir, runtime=adapter)
+    mark_mcp_warm(spawner)
+    return spawner
+
+
+def _envelopes(count: int):
+    for i in range(count):
+        if i % 2:
+            yield telegram_envelope(1000 + i % 17, f"load message {i}: remind me to stretch")
+        else:
+            yield email_envelope(
+                f"sender{i % 13}@example.com", f"Load {i}", f"load message {i}: invoice due"
+            )
+
+
+async def test_switchboard_load_profile(load_pool, tmp_path: Path) -> None:
+    pool, counter = load_pool
+    latency = LatencyDistribution.parse(
+        os.environ.get("BUTLERS_FAKE_RUNTIME_LATENCY") or "lognormal:0.05,0.5"
+    )
+    targets = {
+        name: _spawner(tmp_path, name, FakeAdapter(latency=latency, seed=i))
+        for i, name in enumerate(_TARGETS)
+    }
+
+    def _classify(prompt: str, _system: str) -> FakeTurn:
+        target = _TARGETS[zlib.crc32(prompt.encode()) % len(_TARGETS)]
+        return FakeTurn(
+            text=None,
+            tool_calls=(
+                {"name": "route_to_butler", "input": {"butler": target, "prompt": "handle it"}},
+            ),
+        )
+
+    async def _process(ref) -> None:
+        await pipeline_process(pipeline)(ref)
+
+    harness = LoadHarness(
+        ingest=switchboard_ingest(pool),
+        process=_process,
+        buffer_config=BufferConfig(worker_count=4, queue_capacity=1000),
+        round_trips=counter,
+    )
+    classifier = _spawner(
+        tmp_path,
+        "switchboard",
+        FakeAdapter(
+            script=_classify,
+            latency=latency,
+            seed=99,
+            tool_executor=route_executor(harness, targets),
+        ),
+    )
+    pipeline = MessagePipeline(
+        switchboard_pool=pool,
+        dispatch_fn=harness.timed("classify", classifier.trigger),
+    )
+
+    report = await harness.run(_envelopes(_MESSAGES), rate_per_s=_RATE_PER_S, poisson=True)
+    print()
+    print(report.format())
+
+    assert report.completed + report.failed == _MESSAGES
+    assert report.completed > 0
+    assert report.round_trips, "query logger saw no attributed round trips"
@@ -0,0 +1,179 @@
+"""Unit tests for butlers.credential_cache and the cached CredentialStore.resolve().
+
+All tests mock the asyncpg pool — no real database required.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from butlers import credential_cache as credential_cache_mod
+from butlers.credential_cache import (
+    CREDENTIALS_CHANGED_CHANNEL,
+    CredentialCache,
+    credential_cache_ttl_from_env,
+)
+from butlers.credential_store import CredentialStore
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_pool(values: dict[str, tuple[str, int]] | None = None) -> MagicMock:
+    """Pool whose ``butler_secrets`` holds ``{key: (value, version)}``."""
+    rows = values if values is not None else {}
+
+    async def _fetchrow(sql: str, key: str):
+        if key not in rows:
+            return None
+        value, version = rows[key]
+        return {"secret_value": value, "version": version}
+
+    conn = AsyncMock()
+    conn.fetchrow = AsyncMock(side_effect=_fetchrow)
+    conn.execute.return_value = "SELECT 1"
+    cm = AsyncMock()
+    cm.__aenter__ = AsyncMock(return_value=conn)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = cm
+    pool._conn = conn
+    return pool
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> CredentialCache:
+    fresh = CredentialCache(ttl_s=30.0)
+    monkeypatch.setattr(credential_cache_mod, "_CACHE", fresh)
+    return fresh
+
+
+def test_ttl_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BUTLERS_CREDENTIAL_CACHE_TTL_S", raising=False)
+    assert credential_cache_ttl_from_env() == 30.0
+    monkeypatch.setenv("BUTLERS_CREDENTIAL_CACHE_TTL_S", "0")
+    assert credential_cache_ttl_from_env() == 0.0
+    monkeypatch.setenv("BUTLERS_CREDENTIAL_CACHE_TTL_S", "soon")
+    assert credential_cache_ttl_from_env() == 30.0
+
+
+class TestCredentialCache:
+    def test_expires_and_reports_counts_only(self) -> None:
+        clock = _Clock()
+        cache = CredentialCache(ttl_s=5.0, clock=clock)
+        pool = object()
+        cache.store(pool, "TOKEN", "s3cret-value", version=1, generation=cache.generation)
+        cache.store(pool, "MISSING", None, version=None, generation=cache.generation)
+
+        assert cache.lookup(pool, "TOKEN") == (True, "s3cret-value")
+        assert cache.lookup(pool, "MISSING") == (True, None)
+        clock.now = 5.0
+        assert cache.lookup(pool, "TOKEN") == (False, None)
+
+        assert cache.stats() == {
+            "size": 1,
+            "hits": 1,
+            "negative_hits": 1,
+            "misses": 1,
+            "invalidations": 0,
+        }
+        assert "s3cret-value" not in repr(cache)
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        cache = CredentialCache(ttl_s=0)
+        cache.store(object(), "K", "v", version=1, generation=cache.generation)
+
+        assert len(cache) == 0
+
+    def test_notification_keeps_entries_at_the_notified_version(self) -> None:
+        cache = CredentialCache(ttl_s=30.0)
+        local, shared = object(), object()
+        cache.store(local, "K", None, version=None, generation=cache.generation)
+        cache.store(shared, "K", "new", version=7, generation=cache.generation)
+        cache.store(shared, "OTHER", "x", version=1, generation=cache.generation)
+
+        cache.apply_notification(json.dumps({"key": "K", "version": 7}))
+
+        assert cache.lookup(local, "K") == (False, None)
+        assert cache.lookup(shared, "K") == (True, "new")
+
+        cache.apply_notification(json.dumps({"key": "K", "version": None}))
+        assert cache.lookup(shared, "K") == (False, None)
+
+        cache.apply_notification("{}")
+        assert len(cache) == 0
+
+    def test_store_after_invalidation_is_dropped(self) -> None:
+        cache = CredentialCache(ttl_s=30.0)
+        generation = cache.generation
+        cache.invalidate("K")
+
+        cache.store(object(), "K", "stale", version=1, generation=generation)
+
+        assert len(cache) == 0
+
+
+async def test_resolve_caches_every_layer_including_misses(cache: CredentialCache) -> None:
+    local = _make_pool()
+    shared = _make_pool({"TOKEN": ("from-shared", 1)})
+
+    for _ in range(3):
+        store = CredentialStore(local, fallback_pools=[shared])
+        assert await store.resolve("TOKEN") == "from-shared"
+
+    assert local._conn.fetchrow.await_count == 1
+    assert shared._conn.fetchrow.await_count == 1
+    assert "AS version" in shared._conn.fetchrow.await_args.args[0]
+    assert cache.stats()["hits"] == 2 and cache.stats()["negative_hits"] == 2
+
+
+async def test_load_bypasses_the_cache(cache: CredentialCache) -> None:
+    pool = _make_pool({"K": ("v", 1)})
+    store = CredentialStore(pool)
+
+    await store.resolve("K")
+    assert await store.load("K") == "v"
+
+    assert pool._conn.fetchrow.await_count == 2
+
+
+async def test_writes_invalidate_locally_and_notify(cache: CredentialCache) -> None:
+    pool = _make_pool()
+    store = CredentialStore(pool)
+    assert await store.resolve("K") is None
+
+    await store.store("K", "fresh")
+
+    sql = pool._conn.execute.await_args.args[0]
+    notify = sql.split("SELECT pg_notify")[1]
+    assert f"'{CREDENTIALS_CHANGED_CHANNEL}'" in notify
+    assert "secret_value" not in notify
+    assert len(cache) == 0
+
+    pool._conn.fetchrow.side_effect = None
+    pool._conn.fetchrow.return_value = {"secret_value": "fresh", "version": 2}
+    assert await store.resolve("K") == "fresh"
+
+    assert await store.delete("K") is True
+    assert "DELETE FROM butler_secrets" in pool._conn.execute.await_args.args[0]
+    assert len(cache) == 0
+
+
+async def test_db_errors_are_not_cached(cache: CredentialCache) -> None:
+    pool = _make_pool()
+    pool._conn.fetchrow.side_effect = ConnectionError("db down")
+
+    with pytest.raises(ConnectionError):
+        await CredentialStore(pool).resolve("K")
+
+    assert len(cache) == 0
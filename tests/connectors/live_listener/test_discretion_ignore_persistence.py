@@ -244,6 +244,7 @@ async def test_stop_flushes_filtered_event_buffers() -> None:
     buffer = _mock_buffer()
     connector = _bare_connector(db_pool=object(), buffer=buffer)
     connector._pipeline_tasks = {}
+    connector._vad_task = None
     connector._transcription_clients = {}
     connector._heartbeat = None
     connector._mcp_client = AsyncMock()
@@ -257,6 +258,7 @@ async def test_stop_skips_flush_without_db_pool() -> None:
     buffer = _mock_buffer()
     connector = _bare_connector(db_pool=None, buffer=buffer)
     connector._pipeline_tasks = {}
+    connector._vad_task = None
     connector._transcription_clients = {}
     connector._heartbeat = None
     connector._mcp_client = AsyncMock()
@@ -274,6 +276,7 @@ async def test_stop_continues_after_flush_error() -> None:
     buffer.flush.side_effect = RuntimeError("db unreachable")
     connector = _bare_connector(db_pool=object(), buffer=buffer)
     connector._pipeline_tasks = {}
+    connector._vad_task = None
     connector._transcription_clients = {}
     connector._heartbeat = None
     connector._mcp_client = AsyncMock()
@@ -0,0 +1,207 @@
+"""Zero-copy ring buffer and batched multi-mic VAD scoring.
+
+The ONNX session is replaced by a fake that mirrors Silero's batched I/O
+shapes (``input`` (B, 480), ``h``/``c`` (2, B, 64)) so the tests exercise the
+gather/scatter of per-mic LSTM state without onnxruntime or a model file.
+"""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from butlers.connectors.live_listener.audio import RingBuffer  # noqa: E402
+from butlers.connectors.live_listener.vad import (  # noqa: E402
+    FRAME_SAMPLES,
+    SAMPLE_RATE,
+    BatchedSileroVad,
+    BatchedVadDriver,
+    VadConfig,
+    VadStateMachine,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeSession:
+    """Scores a frame as its peak amplitude; each call bumps every row's h by 1."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def run(self, _outputs, inputs):
+        audio = inputs["input"]
+        assert audio.dtype == np.float32
+        assert audio.shape[1] == FRAME_SAMPLES
+        assert inputs["h"].shape == (2, audio.shape[0], 64)
+        self.calls.append(audio.shape[0])
+        probs = np.abs(audio).max(axis=1, keepdims=True)
+        return probs, inputs["h"] + 1.0, inputs["c"]
+
+
+def _loaded_model() -> tuple[BatchedSileroVad, _FakeSession]:
+    model = BatchedSileroVad(model_path="unused.onnx")
+    session = _FakeSession()
+    model._session = session
+    model._sr_tensor = np.array([SAMPLE_RATE], dtype=np.int64)
+    return model, session
+
+
+def _frame(amplitude: float) -> bytes:
+    value = int(amplitude * 32767)
+    return struct.pack(f"<{FRAME_SAMPLES}h", *([value] * FRAME_SAMPLES))
+
+
+class TestRingBuffer:
+    def test_read_view_is_a_reused_scratch_frame_not_the_storage(self) -> None:
+        ring = RingBuffer(capacity_frames=4)
+        ring.write(_frame(0.5))
+
+        view = ring.read_view()
+
+        assert isinstance(view, memoryview)
+        assert bytes(view) == _frame(0.5)
+        storage = np.frombuffer(ring._buf, dtype=np.uint8)
+        assert not np.shares_memory(np.frombuffer(view, dtype=np.uint8), storage)
+        assert ring.read_view() is None
+
+        ring.write(_frame(0.6))
+        assert ring.read_view() is view  # no per-frame allocation
+
+    def test_read_view_survives_the_producer_lapping_a_full_ring(self) -> None:
+        ring = RingBuffer(capacity_frames=2)
+        ring.write(_frame(0.1))
+        ring.write(_frame(0.2))
+
+        view = ring.read_view()
+        # Full ring: the slot just read is the producer's next write target.
+        ring.write(_frame(0.3))
+        ring.write(_frame(0.4))
+
+        assert bytes(view) == _frame(0.1)
+
+    def test_overwrite_drops_oldest_frame(self) -> None:
+        ring = RingBuffer(capacity_frames=2)
+        for amp in (0.1, 0.2, 0.3):
+            ring.write(_frame(amp))
+
+        assert ring.available == 2
+        assert bytes(ring.read_view()) == _frame(0.2)
+        assert ring.read() == _frame(0.3)
+
+
+class TestBatchedSileroVad:
+    def test_one_onnx_call_for_all_mics_with_independent_state(self) -> None:
+        model, session = _loaded_model()
+        kitchen, office = model.slot("kitchen"), model.slot("office")
+
+        probs = model.score_batch([kitchen, office], [_frame(0.9), _frame(0.1)])
+
+        assert session.calls == [2]
+        assert probs == pytest.approx([0.9, 0.1], abs=1e-3)
+
+        model.score_batch([kitchen], [_frame(0.9)])
+        assert float(kitchen._h[0, 0, 0]) == 2.0
+        assert float(office._h[0, 0, 0]) == 1.0
+
+        office.reset_state()
+        model.score_batch([office], [_frame(0.1)])
+        assert float(office._h[0, 0, 0]) == 1.0
+
+    def test_matches_single_frame_scoring(self) -> None:
+        model, _ = _loaded_model()
+        slot = model.slot("kitchen")
+        frame = _frame(0.42)
+
+        batched = model.score_batch([slot, model.slot("office")], [frame, _frame(0.0)])[0]
+
+        assert slot.score(frame) == pytest.approx(batched)
+
+    def test_wrong_size_frame_scores_zero_without_joining_batch(self) -> None:
+        model, session = _loaded_model()
+
+        probs = model.score_batch([model.slot("a"), model.slot("b")], [b"\x00" * 10, _frame(0.8)])
+
+        assert probs[0] == 0.0
+        assert probs[1] == pytest.approx(0.8, abs=1e-3)
+        assert session.calls == [1]
+
+    def test_unloaded_model_scores_silence(self) -> None:
+        model = BatchedSileroVad(model_path=None)
+        model.load()
+        assert model.score_batch([model.slot("a")], [_frame(1.0)]) == [0.0]
+
+
+class TestVadStateMachineSegments:
+    def test_emitted_segment_is_memoryview_over_owned_buffer(self) -> None:
+        model, _ = _loaded_model()
+        config = VadConfig(onset_frames=1, offset_frames=1, min_segment_ms=60)
+        machine = VadStateMachine(config, model.slot("kitchen"), mic_name="kitchen")
+
+        frames = [_frame(0.9), _frame(0.8), _frame(0.7), _frame(0.0)]
+        segments = []
+        for frame in frames:
+            segments.extend(machine.process_frame(frame, offset_ts=1.0))
+
+        assert len(segments) == 1
+        audio = segments[0].audio_bytes
+        assert isinstance(audio, memoryview)
+        assert bytes(audio) == b"".join(frames)
+        assert segments[0].duration_ms == 4 * 30
+
+        # The next segment gets a fresh buffer: the emitted one is not reused.
+        for frame in frames:
+            machine.process_frame(frame, offset_ts=2.0)
+        assert bytes(audio) == b"".join(frames)
+
+    def test_precomputed_probability_skips_model(self) -> None:
+        model, session = _loaded_model()
+        config = VadConfig(onset_frames=1)
+        machine = VadStateMachine(config, model.slot("kitchen"), mic_name="kitchen")
+
+        machine.process_frame(_frame(0.0), offset_ts=1.0, prob=0.99)
+
+        assert machine.is_speaking
+        assert session.calls == []
+
+
+class TestBatchedVadDriver:
+    def test_tick_batches_one_frame_per_mic(self) -> None:
+        model, session = _loaded_model()
+        driver = BatchedVadDriver(model)
+        rings = {name: RingBuffer(capacity_frames=8) for name in ("kitchen", "office", "den")}
+        results: dict[str, list[float]] = {name: [] for name in rings}
+        config = VadConfig(onset_frames=1, offset_frames=1, min_segment_ms=30)
+
+        for name, ring in rings.items():
+            driver.add_source(
+                name,
+                config,
+                ring.read_view,
+                lambda segs, elapsed, name=name: results[name].append(len(segs)),
+            )
+
+        rings["kitchen"].write(_frame(0.9))
+        rings["kitchen"].write(_frame(0.0))
+        rings["office"].write(_frame(0.9))
+
+        assert driver.tick(offset_ts=1.0) == 2
+        assert driver.tick(offset_ts=1.03) == 1
+        assert driver.tick(offset_ts=1.06) == 0
+        assert session.calls == [2, 1]
+        assert results == {"kitchen": [0, 1], "office": [0], "den": []}
+
+    def test_removed_source_is_not_polled(self) -> None:
+        model, session = _loaded_model()
+        driver = BatchedVadDriver(model)
+        ring = RingBuffer(capacity_frames=4)
+        driver.add_source("kitchen", VadConfig(), ring.read_view, lambda segs, elapsed: None)
+        driver.remove_source("kitchen")
+        ring.write(_frame(0.5))
+
+        assert driver.tick() == 0
+        assert driver.mic_names == []
+        assert session.calls == []
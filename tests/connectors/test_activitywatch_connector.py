@@ -7,7 +7,8 @@ Verifies:
 - window titles are NEVER present anywhere in the built envelope (privacy)
 - Idempotency key determinism
 - Config parsing: required env vars, defaults
-- AFK interval matching (lookup_afk_status)
+- AFK interval matching (lookup_afk_status / AfkTimeline)
+- Window-episode coalescing before ingest
 - Bucket discovery (find_bucket_id)
 
 [bu-whhll.6]
@@ -16,6 +17,7 @@ Verifies:
 from __future__ import annotations
 
 import json
+import random
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -26,9 +28,13 @@ from butlers.connectors.activitywatch import (
     ActivityWatchConnectorConfig,
     ActivityWatchRetention,
     ActivityWatchRetentionConfig,
+    AfkTimeline,
+    BrowserDomainTimeline,
+    WindowEpisode,
     build_activity_envelope,
     build_afk_intervals,
     classify_app,
+    coalesce_window_episodes,
     find_bucket_id,
     lookup_afk_status,
     match_browser_domain,
@@ -412,6 +418,197 @@ def test_match_browser_domain_treats_naive_activitywatch_timestamp_as_utc() -> N
     assert match.domain == "utc-naive.example.test"
 
 
+def test_afk_timeline_agrees_with_linear_scan_on_overlapping_intervals() -> None:
+    """Bisect lookups return the earliest-starting covering interval, like a scan."""
+    rng = random.Random(7)
+    base = datetime(2026, 7, 5, 9, 0, tzinfo=UTC)
+    intervals = build_afk_intervals(
+        [
+            {
+                "timestamp": (base + timedelta(seconds=rng.randint(0, 3600))).isoformat(),
+                "duration": rng.choice([0, 5, 60, 900]),
+                "data": {"status": rng.choice(["afk", "not-afk"])},
+            }
+            for _ in range(200)
+        ]
+    )
+    timeline = AfkTimeline(intervals)
+
+    def _linear(ts: datetime) -> bool | None:
+        for start, end, status in intervals:
+            if start <= ts <= end:
+                return status == "afk"
+        return None
+
+    for offset in range(-60, 4600, 7):
+        ts = base + timedelta(seconds=offset)
+        assert timeline.status_at(ts) == _linear(ts)
+
+
+def test_browser_domain_timeline_agrees_with_match_semantics() -> None:
+    """Latest start wins, ties break by hostname, boundaries are half-open."""
+    rng = random.Random(11)
+    web_events = [
+        _web_event(
+            timestamp=(_TS + timedelta(seconds=rng.randint(0, 600))).isoformat(),
+            duration=rng.choice([0, 10, 30, 120]),
+            url=f"https://{rng.choice('abc')}.example.test/path",
+        )
+        for _ in range(150)
+    ]
+    timeline = BrowserDomainTimeline(web_events)
+
+    for offset in range(-10, 800, 3):
+        instant = _TS + timedelta(seconds=offset)
+        candidates = [
+            (datetime.fromisoformat(e["timestamp"]), e["data"]["url"].split("/")[2], e)
+            for e in web_events
+            if e["duration"] > 0
+            and datetime.fromisoformat(e["timestamp"])
+            <= instant
+            < datetime.fromisoformat(e["timestamp"]) + timedelta(seconds=e["duration"])
+        ]
+        match = timeline.match(instant)
+        if not candidates:
+            assert match is None
+            continue
+        _, domain, raw_event = max(candidates, key=lambda c: (c[0], c[1]))
+        assert match is not None
+        assert (match.domain, match.raw_event) == (domain, raw_event)
+
+
+def _episode(offset_s: float, duration_s: float, *, app: str = "Code", **kwargs) -> WindowEpisode:
+    ts = _TS + timedelta(seconds=offset_s)
+    return WindowEpisode(
+        ts=ts,
+        end=ts + timedelta(seconds=duration_s),
+        app=app,
+        window_title=kwargs.get("title", "main.py"),
+        is_afk=kwargs.get("is_afk", False),
+        browser_match=None,
+        raw_event={"timestamp": ts.isoformat(), "duration": duration_s},
+    )
+
+
+def test_coalesce_window_episodes_merges_identical_runs_within_gap() -> None:
+    episodes = coalesce_window_episodes(
+        [
+            _episode(0, 10),
+            _episode(11, 10),  # 1s gap: same episode
+            _episode(30, 5),  # 9s gap: new episode
+            _episode(35, 5, title="other.py"),  # different title
+            _episode(40, 5, title="other.py", is_afk=True),  # different AFK status
+        ],
+        max_gap_s=5.0,
+    )
+
+    assert [(e.ts - _TS).total_seconds() for e in episodes] == [0, 30, 35, 40]
+    first = episodes[0]
+    assert first.event_count == 2
+    assert first.duration_seconds == 21
+    assert first.evidence_event()["coalesced_event_count"] == 2
+    assert episodes[1].evidence_event() is episodes[1].raw_event
+
+
+@pytest.mark.asyncio
+async def test_poll_submits_one_episode_and_checkpoints_its_start() -> None:
+    """Identical consecutive events become one ingest; the checkpoint stays at
+    the episode start so the next poll rebuilds the same (growing) episode."""
+    connector = ActivityWatchConnector(
+        ActivityWatchConnectorConfig(
+            switchboard_mcp_url="http://localhost:41100/sse",
+            machine_id=_MACHINE_ID,
+        )
+    )
+    connector._http_client = MagicMock()
+    connector._last_checkpoint_ts = _TS - timedelta(seconds=1)
+    connector._process_window_event = AsyncMock()  # type: ignore[method-assign]
+    connector._save_checkpoint = AsyncMock()  # type: ignore[method-assign]
+
+    window_events = [
+        {
+            "timestamp": (_TS + timedelta(seconds=offset)).isoformat(),
+            "duration": 10,
+            "data": {"app": "Code", "title": "main.py"},
+        }
+        for offset in (0, 11, 22)
+    ]
+
+    with (
+        patch(
+            "butlers.connectors.activitywatch.fetch_buckets",
+            new=AsyncMock(return_value={_BUCKET_ID: {"type": "currentwindow"}}),
+        ),
+        patch(
+            "butlers.connectors.activitywatch.fetch_events",
+            new=AsyncMock(return_value=window_events),
+        ),
+    ):
+        await connector._execute_poll_cycle()
+
+    connector._process_window_event.assert_awaited_once()
+    kwargs = connector._process_window_event.await_args.kwargs
+    assert kwargs["ts"] == _TS
+    assert kwargs["duration_seconds"] == 32
+    assert kwargs["raw_event"]["coalesced_event_count"] == 3
+    connector._save_checkpoint.assert_awaited_once_with(_TS)
+
+
+@pytest.mark.asyncio
+async def test_poll_holds_open_episode_until_a_later_event_closes_it() -> None:
+    """A still-growing trailing episode is not ingested (its key would dedupe
+    every longer version away); it is sent whole once another event closes it."""
+    connector = ActivityWatchConnector(
+        ActivityWatchConnectorConfig(
+            switchboard_mcp_url="http://localhost:41100/sse",
+            machine_id=_MACHINE_ID,
+        )
+    )
+    connector._http_client = MagicMock()
+    connector._process_window_event = AsyncMock()  # type: ignore[method-assign]
+
+    async def _save(ts: datetime) -> None:
+        connector._last_checkpoint_ts = ts
+
+    connector._save_checkpoint = AsyncMock(side_effect=_save)  # type: ignore[method-assign]
+    start = datetime.now(UTC) - timedelta(seconds=60)
+    connector._last_checkpoint_ts = start - timedelta(seconds=1)
+
+    def _event(offset_s: float, duration_s: float, title: str = "main.py") -> dict:
+        return {
+            "timestamp": (start + timedelta(seconds=offset_s)).isoformat(),
+            "duration": duration_s,
+            "data": {"app": "Code", "title": title},
+        }
+
+    async def _poll(window_events: list[dict]) -> None:
+        with (
+            patch(
+                "butlers.connectors.activitywatch.fetch_buckets",
+                new=AsyncMock(return_value={_BUCKET_ID: {"type": "currentwindow"}}),
+            ),
+            patch(
+                "butlers.connectors.activitywatch.fetch_events",
+                new=AsyncMock(return_value=window_events),
+            ),
+        ):
+            await connector._execute_poll_cycle()
+
+    # Poll 1: the focused window's event still ends "now" — nothing is sent.
+    await _poll([_event(0, 60)])
+    connector._process_window_event.assert_not_awaited()
+    assert connector._last_checkpoint_ts == start
+
+    # Poll 2: the same episode grew, then focus moved to another title.
+    await _poll([_event(0, 90), _event(90, 30, title="other.py")])
+    connector._process_window_event.assert_awaited_once()
+    kwargs = connector._process_window_event.await_args.kwargs
+    assert kwargs["ts"] == start
+    assert kwargs["duration_seconds"] == 90
+    # The new, still-open episode is held back in turn.
+    assert connector._last_checkpoint_ts == start + timedelta(seconds=90)
+
+
 @pytest.mark.asyncio
 async def test_poll_passes_only_safe_domain_and_sensitive_web_event_to_persistence() -> None:
     """Web enrichment is connector-local: the ingest envelope stays coarse."""
@@ -3,6 +3,7 @@
 Verifies:
 - record() accumulates events in buffer
 - flush() clears buffer after writing
+- concurrent flushes write disjoint batches
 - flush failure is non-fatal and never publishes a fleet event
 - reason_label helpers return non-empty strings
 
@@ -11,6 +12,7 @@ Verifies:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -197,6 +199,46 @@ async def test_flush_db_error_is_non_fatal() -> None:
     assert len(buf) == 0
 
 
+async def test_concurrent_flushes_write_disjoint_batches_and_keep_late_records() -> None:
+    """Interleaved flushes of one shared buffer neither duplicate nor drop rows."""
+    buf = _make_buffer()
+    _record_one(buf)
+    _record_one(buf)
+
+    written: list[int] = []
+    release_first = asyncio.Event()
+    partition_calls = 0
+
+    async def ensure_partition(*_args: object) -> None:
+        nonlocal partition_calls
+        partition_calls += 1
+        if partition_calls == 1:
+            await release_first.wait()
+
+    async def write(_sql: str, rows: list) -> None:
+        written.append(len(rows))
+
+    mock_conn = AsyncMock()
+    mock_conn.executemany.side_effect = write
+    mock_pool = MagicMock()
+    mock_pool.execute = AsyncMock(side_effect=ensure_partition)
+    mock_ctx = AsyncMock()
+    mock_ctx.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    mock_pool.acquire.return_value = mock_ctx
+
+    with patch("butlers.fleet_events.publish_fleet_event", new=AsyncMock()):
+        first = asyncio.create_task(buf.flush(pool=mock_pool))
+        await asyncio.sleep(0)  # first flush is parked on the partition DDL
+        _record_one(buf)  # another chat records while it is in flight
+        await buf.flush(pool=mock_pool)
+        release_first.set()
+        await first
+
+    assert sorted(written) == [1, 2]
+    assert len(buf) == 0
+
+
 @pytest.mark.parametrize(
     "make_label",
     [
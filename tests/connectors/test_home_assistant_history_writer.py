@@ -0,0 +1,240 @@
+"""HAHistoryWriter — COPY batching, checkpoint deferral and downsampling."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from butlers.connectors import home_assistant_checkpoint as ha_checkpoint
+from butlers.connectors.home_assistant import (
+    HAConnector,
+    HAConnectorConfig,
+    _make_event_dispatcher,
+)
+from butlers.connectors.home_assistant_filter import HAFilterPersistence
+from butlers.connectors.home_assistant_history import HAHistoryWriter, downsample_ha_history
+from butlers.connectors.home_assistant_pipeline import HAFilterPipeline, HAFilterPipelineConfig
+from butlers.connectors.home_assistant_wellness import WellnessClassifier
+
+pytestmark = pytest.mark.unit
+
+_ENDPOINT = "home_assistant:homeassistant.test:8123"
+_T0 = datetime(2026, 10, 19, 8, 0, tzinfo=UTC)
+
+
+class _FakeConn:
+    def __init__(self, pool: _FakePool) -> None:
+        self._pool = pool
+
+    async def copy_records_to_table(self, table: str, **kwargs: Any) -> str:
+        if self._pool.fail_copy:
+            raise ConnectionError("connection reset")
+        records = list(kwargs["records"])
+        self._pool.copies.append((table, kwargs["schema_name"], kwargs["columns"], records))
+        return f"COPY {len(records)}"
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.fail_copy = False
+        self.copies: list[tuple[str, str, tuple[str, ...], list[tuple[Any, ...]]]] = []
+        self.executed: list[tuple[Any, ...]] = []
+
+    async def execute(self, query: str, *args: Any) -> str:
+        self.executed.append((query, *args))
+        return "SELECT 1"
+
+    def acquire(self) -> Any:
+        pool = self
+
+        class _Ctx:
+            async def __aenter__(self) -> _FakeConn:
+                return _FakeConn(pool)
+
+            async def __aexit__(self, *exc: object) -> bool:
+                return False
+
+        return _Ctx()
+
+
+@pytest.fixture
+def saved(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, ...]]:
+    calls: list[tuple[Any, ...]] = []
+
+    async def _fake_save(_pool, eid, ts, entity, transport):  # type: ignore[no-untyped-def]
+        calls.append((eid, ts, entity, transport))
+
+    monkeypatch.setattr(ha_checkpoint, "save_ha_checkpoint", _fake_save)
+    return calls
+
+
+async def test_flush_copies_rows_then_saves_latest_checkpoint(saved: list) -> None:
+    pool = _FakePool()
+    writer = HAHistoryWriter(pool, endpoint_identity=_ENDPOINT, flush_rows=100)
+
+    await writer.add(entity_id="person.a", state="home", attributes=None, recorded_at=_T0)
+    writer.note_checkpoint(_T0, "person.a", "websocket")
+    later = _T0 + timedelta(seconds=5)
+    await writer.add(entity_id="person.b", state="not_home", attributes={"x": 1}, recorded_at=later)
+    writer.note_checkpoint(later, "person.b", "websocket")
+    assert pool.copies == [] and saved == []
+
+    assert await writer.flush() is True
+
+    ((table, schema, columns, records),) = pool.copies
+    assert (table, schema) == ("home_assistant_history", "connectors")
+    assert columns == ("entity_id", "state", "attributes", "recorded_at")
+    assert [r[0] for r in records] == ["person.a", "person.b"]
+    assert saved == [(_ENDPOINT, later, "person.b", "websocket")]
+    assert len(writer) == 0
+
+
+async def test_partitions_are_ensured_once_per_month(saved: list) -> None:
+    pool = _FakePool()
+    writer = HAHistoryWriter(pool, endpoint_identity=_ENDPOINT)
+    next_month = datetime(2026, 11, 1, 0, 0, 1, tzinfo=UTC)
+
+    for ts in (_T0, _T0 + timedelta(days=1), next_month):
+        await writer.add(entity_id="person.a", state="home", attributes=None, recorded_at=ts)
+    await writer.flush()
+    await writer.add(entity_id="person.a", state="away", attributes=None, recorded_at=_T0)
+    await writer.flush()
+
+    months = [args[1] for args in pool.executed]
+    assert months == [
+        datetime(2026, 10, 1, tzinfo=UTC),
+        datetime(2026, 11, 1, tzinfo=UTC),
+    ]
+
+
+async def test_reaching_flush_rows_flushes_inline(saved: list) -> None:
+    pool = _FakePool()
+    writer = HAHistoryWriter(pool, endpoint_identity=_ENDPOINT, flush_rows=3)
+
+    for i in range(7):
+        await writer.add(
+            entity_id="person.a", state=str(i), attributes=None, recorded_at=_T0 + timedelta(i)
+        )
+
+    assert [len(c[3]) for c in pool.copies] == [3, 3]
+    assert len(writer) == 1
+
+
+async def test_failed_copy_keeps_rows_and_holds_checkpoint(saved: list) -> None:
+    pool = _FakePool()
+    writer = HAHistoryWriter(pool, endpoint_identity=_ENDPOINT)
+    await writer.add(entity_id="person.a", state="home", attributes=None, recorded_at=_T0)
+    writer.note_checkpoint(_T0, "person.a", "websocket")
+
+    pool.fail_copy = True
+    assert await writer.flush() is False
+    assert len(writer) == 1
+    assert saved == []
+
+    pool.fail_copy = False
+    later = _T0 + timedelta(minutes=1)
+    await writer.add(entity_id="person.a", state="not_home", attributes=None, recorded_at=later)
+    writer.note_checkpoint(later, "person.a", "rest_fallback")
+    assert await writer.flush() is True
+
+    assert [r[1] for r in pool.copies[0][3]] == ["home", "not_home"]
+    assert saved == [(_ENDPOINT, later, "person.a", "rest_fallback")]
+
+
+async def test_full_buffer_blocks_add_until_a_flush_succeeds(saved: list) -> None:
+    pool = _FakePool()
+    pool.fail_copy = True
+    writer = HAHistoryWriter(
+        pool, endpoint_identity=_ENDPOINT, flush_rows=2, flush_interval_s=0.01, max_buffered_rows=4
+    )
+
+    for i in range(3):
+        await writer.add(
+            entity_id="person.a",
+            state=str(i),
+            attributes=None,
+            recorded_at=_T0 + timedelta(seconds=i),
+        )
+        writer.note_checkpoint(_T0 + timedelta(seconds=i), "person.a", "websocket")
+
+    blocked = asyncio.create_task(
+        writer.add(
+            entity_id="person.a", state="3", attributes=None, recorded_at=_T0 + timedelta(seconds=3)
+        )
+    )
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+    assert [r[1] for r in writer._rows] == ["0", "1", "2", "3"]
+    assert saved == []
+
+    pool.fail_copy = False
+    await asyncio.wait_for(blocked, timeout=1)
+
+    # Every row reached the table; the checkpoint never skipped a dropped one.
+    assert [r[1] for c in pool.copies for r in c[3]] == ["0", "1", "2", "3"]
+    assert saved == [(_ENDPOINT, _T0 + timedelta(seconds=2), "person.a", "websocket")]
+    assert len(writer) == 0
+
+
+async def test_downsample_returns_bucket_count_from_command_tag() -> None:
+    pool = MagicMock()
+    pool.execute = AsyncMock(return_value="INSERT 0 42")
+
+    assert await downsample_ha_history(pool, older_than_days=30) == 42
+
+    _sql, cutoff, pattern = pool.execute.call_args.args
+    assert datetime.now(UTC) - cutoff >= timedelta(days=30)
+    assert pattern.startswith("^")
+
+
+async def test_dispatcher_defers_checkpoint_to_history_writer(saved: list) -> None:
+    config = HAConnectorConfig(switchboard_mcp_url="http://switchboard.test/mcp")
+    connector = HAConnector(config=config)
+    connector._set_endpoint_identity("http://homeassistant.test:8123")
+    connector._mcp_client = MagicMock()
+    connector._mcp_client.call_tool = AsyncMock(return_value={"status": "accepted"})
+    connector._starting = False
+    pool = _FakePool()
+    writer = HAHistoryWriter(pool, endpoint_identity=connector._endpoint_identity)
+
+    dispatch = _make_event_dispatcher(
+        connector=connector,
+        config=config,
+        db_pool=pool,
+        pipeline=HAFilterPipeline(
+            config=HAFilterPipelineConfig(domain_allowlist=config.domain_allowlist),
+            evaluator=None,
+            metrics=connector._ha_metrics,
+        ),
+        wellness_classifier=WellnessClassifier(),
+        endpoint_identity=connector._endpoint_identity,
+        resume_ts=None,
+        ha_filter_persistence=HAFilterPersistence(
+            endpoint_identity=connector._endpoint_identity, db_pool=None, submit_fn=AsyncMock()
+        ),
+        history_writer=writer,
+    )
+    await dispatch(
+        "state_changed",
+        {
+            "event_type": "state_changed",
+            "time_fired": "2026-10-19T08:00:00.000000+00:00",
+            "data": {
+                "entity_id": "person.tzeusy",
+                "old_state": {"state": "not_home", "attributes": {}},
+                "new_state": {"state": "home", "attributes": {"friendly_name": "Tze"}},
+            },
+        },
+    )
+
+    assert len(writer) == 1
+    assert saved == [], "checkpoint must wait until the history row is durable"
+
+    await writer.flush()
+
+    assert pool.copies[0][3][0][:2] == ("person.tzeusy", "home")
+    assert [s[2] for s in saved] == ["person.tzeusy"]
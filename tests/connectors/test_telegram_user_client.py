@@ -15,8 +15,10 @@ import asyncio
 import json
 import socket
 import time
+from collections import deque
 from contextlib import suppress
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -1033,3 +1035,172 @@ async def test_live_path_dm_never_bypasses_via_group_size(
     dispatcher.call.assert_awaited_once()
     connector._submit_to_ingest.assert_not_called()
     connector._filtered_event_buffer.record.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Flush pipeline: per-chat history ring, batched reply-tos, FloodWait backoff,
+# bounded flush concurrency
+# ---------------------------------------------------------------------------
+
+
+def _dated_message(msg_id: int, chat_id: int, minutes_ago: float, **kwargs) -> MagicMock:
+    msg = _make_message(msg_id=msg_id, chat_id=chat_id, **kwargs)
+    msg.date = datetime(2026, 10, 19, 12, 0, tzinfo=UTC) - timedelta(minutes=minutes_ago)
+    msg.reply_to_msg_id = None
+    return msg
+
+
+def _ring_connector(
+    connector: TelegramUserClientConnector, chat_id: int, ring: list[MagicMock]
+) -> MagicMock:
+    """Give *connector* a chat ring, a fake Telethon client and recording metrics."""
+    from butlers.connectors.telegram_user_client import ChatBuffer
+
+    connector._chat_buffers[str(chat_id)] = ChatBuffer(recent=deque(ring, maxlen=200))
+    connector._telegram_client = MagicMock()
+    connector._telegram_client.get_messages = AsyncMock(return_value=[])
+    connector._metrics = MagicMock()
+    return connector._telegram_client
+
+
+async def test_buffered_messages_feed_ring_and_follow_edits_and_deletes(
+    connector: TelegramUserClientConnector,
+) -> None:
+    """The ring keeps buffered messages across flushes and tracks edits/deletions."""
+    first = _dated_message(1, 300, 10, text="first")
+    second = _dated_message(2, 300, 5, text="second")
+    await connector._buffer_message(first)
+    await connector._buffer_message(second)
+    buf = connector._chat_buffers["300"]
+    buf.messages.clear()  # a flush empties the buffer, never the ring
+
+    edited = _dated_message(1, 300, 10, text="first (edited)")
+    connector._remember_edit(edited)
+    connector._forget_deleted(None, [2])
+
+    assert list(buf.recent) == [edited]
+
+
+async def test_history_served_from_ring_without_api_call(
+    connector: TelegramUserClientConnector,
+) -> None:
+    """A ring covering history_max messages before the window skips get_messages."""
+    connector._config = replace(connector._config, history_max_messages=3)
+    older = [_dated_message(i, 310, 120 - i) for i in range(1, 6)]
+    new = _dated_message(10, 310, 0)
+    client = _ring_connector(connector, 310, [*older, new])
+
+    context = await connector._fetch_conversation_history("310", [new])
+
+    client.get_messages.assert_not_called()
+    assert [m.id for m in context] == [3, 4, 5, 10]
+    connector._metrics.record_source_api_calls_avoided.assert_called_once_with(
+        "get_messages", "history_ring"
+    )
+
+
+async def test_short_ring_falls_back_to_api(connector: TelegramUserClientConnector) -> None:
+    """A ring holding fewer than history_max older messages still calls the API."""
+    older = _dated_message(1, 320, 120)
+    new = _dated_message(10, 320, 0)
+    client = _ring_connector(connector, 320, [older, new])
+    client.get_messages.return_value = [older, _dated_message(0, 320, 200)]
+
+    context = await connector._fetch_conversation_history("320", [new])
+
+    client.get_messages.assert_awaited_once()
+    assert [m.id for m in context] == [0, 1, 10]
+    connector._metrics.record_source_api_call.assert_called_once_with("get_messages", "success")
+
+
+async def test_reply_tos_use_ring_then_one_batched_call(
+    connector: TelegramUserClientConnector,
+) -> None:
+    """Reply-tos found in the ring are not fetched; the rest share one get_messages call."""
+    in_ring = _dated_message(5, 330, 60)
+    client = _ring_connector(connector, 330, [in_ring])
+    replies = []
+    for msg_id, reply_to in ((20, 5), (21, 7), (22, 8), (23, 9)):
+        msg = _dated_message(msg_id, 330, 0)
+        msg.reply_to_msg_id = reply_to
+        replies.append(msg)
+    client.get_messages.return_value = [
+        _dated_message(7, 330, 90),
+        None,
+        _dated_message(9, 330, 80),
+    ]
+
+    context = await connector._resolve_reply_tos("330", replies, list(replies))
+
+    client.get_messages.assert_awaited_once_with("330", ids=[7, 8, 9])
+    assert [m.id for m in context] == [5, 7, 9, 20, 21, 22, 23]
+    connector._metrics.record_source_api_calls_avoided.assert_any_call(
+        "get_messages", "reply_ring", 1
+    )
+    connector._metrics.record_source_api_calls_avoided.assert_any_call(
+        "get_messages", "reply_batched", 2
+    )
+
+
+async def test_flood_wait_pauses_lookups_until_it_elapses(
+    connector: TelegramUserClientConnector,
+) -> None:
+    """After a FloodWaitError, history and reply-to lookups make no API calls."""
+    from telethon.errors import FloodWaitError
+
+    older = _dated_message(1, 340, 120)
+    new = _dated_message(10, 340, 0)
+    new.reply_to_msg_id = 3
+    client = _ring_connector(connector, 340, [older, new])
+    client.get_messages.side_effect = FloodWaitError(request=None, capture=30)
+
+    context = await connector._fetch_conversation_history("340", [new])
+    assert [m.id for m in context] == [1, 10]  # partial ring, fail-open
+    assert connector._flood_wait_active()
+    connector._metrics.record_source_api_call.assert_called_once_with(
+        "get_messages", "rate_limited"
+    )
+
+    client.get_messages.reset_mock()
+    await connector._fetch_conversation_history("340", [new])
+    await connector._resolve_reply_tos("340", [new], [new])
+    client.get_messages.assert_not_called()
+
+    connector._flood_wait_until = time.monotonic() - 1
+    client.get_messages.side_effect = None
+    await connector._fetch_conversation_history("340", [new])
+    client.get_messages.assert_awaited_once()
+
+
+async def test_scan_flushes_due_chats_with_bounded_concurrency(
+    connector: TelegramUserClientConnector,
+) -> None:
+    """Due chats flush concurrently, never more than flush_concurrency at once."""
+    from butlers.connectors.telegram_user_client import ChatBuffer
+
+    connector._config = replace(connector._config, flush_concurrency=2)
+    connector._flush_slots = asyncio.Semaphore(2)
+    connector._metrics = MagicMock()
+    for n in range(6):
+        connector._chat_buffers[str(400 + n)] = ChatBuffer(
+            messages=[_make_message(msg_id=n + 1, chat_id=400 + n)], last_flush_ts=0.0
+        )
+
+    in_flight = peak = 0
+    flushed: list[str] = []
+
+    async def _fake_run(chat_id: str) -> bool:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        flushed.append(chat_id)
+        return True
+
+    connector._run_chat_flush = _fake_run  # type: ignore[method-assign]
+    await connector._scan_and_flush(flush_interval_s=1)
+
+    assert sorted(flushed) == [str(400 + n) for n in range(6)]
+    assert peak == 2
+    assert connector._metrics.record_flush_latency.call_count == 6
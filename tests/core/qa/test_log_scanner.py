@@ -12,6 +12,7 @@ Covers:
 - Finding aggregation: occurrence_count, first_seen, last_seen
 - Performance caps: max_entries_per_scan, max_findings_per_scan emit WARNING
 - New caps: max_total_lines, max_scan_seconds — partial results + telemetry
+- Incremental tailing: level pre-filter, window bootstrap, rotation, deferred reads
 """
 
 from __future__ import annotations
@@ -673,12 +674,10 @@ async def test_benign_volume_does_not_starve_errors(tmp_path):
     """Entry budget is NOT consumed by benign INFO lines; real errors are still found.
 
     The error line is written at the TOP of the file (oldest position) and
-    benign INFO lines follow it.  _read_file_tail() reads from the END of the
-    file, so benign lines are encountered before the error.  With the old
-    fixed-budget approach, 5 INFO entries would exhaust the budget and the
-    error at the top would never be reached.  With the new candidate-only
-    budget, INFO lines do not count against max_entries_per_scan, so the error
-    is always found.
+    benign INFO lines follow it.  With the old fixed-budget approach, 5 INFO
+    entries would exhaust the budget and the error would never be reached.
+    With the candidate-only budget, INFO lines do not count against
+    max_entries_per_scan, so the error is always found.
     """
     now = datetime.now(UTC)
     # All benign lines within the 30-minute lookback window (ts varies between
@@ -703,8 +702,6 @@ async def test_benign_volume_does_not_starve_errors(tmp_path):
         ts=now - timedelta(seconds=101),
     )
     # Error at TOP (beginning of file), benign lines at BOTTOM (end of file).
-    # _read_file_tail reads from the end, so benign lines are processed before
-    # the error — exercising that they do not consume the candidate budget.
     _write(tmp_path / "butlers" / "finance.log", [error_line] + benign_lines)
 
     # With a budget of 5, the old code would be exhausted by INFO lines before
@@ -1125,3 +1122,84 @@ async def test_discover_skips_codex_cli_timeout_log_with_session_records(tmp_pat
     ).discover(lookback_minutes=15)
 
     assert findings == []
+
+
+@pytest.mark.asyncio
+async def test_incremental_tail_reads_only_new_error_lines(tmp_path):
+    """Later scans decode only appended lines that pass the level pre-filter."""
+    now = datetime.now(UTC)
+    log_file = tmp_path / "butlers" / "finance.log"
+    _write(
+        log_file,
+        [_line(level="info", event=f"ok {i}", ts=now) for i in range(50)]
+        + [_line(event="DB down", exception="ConnectionError", ts=now)],
+    )
+    source = LogScannerSource(log_root=tmp_path)
+    assert len(await source.discover(lookback_minutes=15)) == 1
+
+    with log_file.open("a") as fh:
+        fh.write(_line(level="info", event="ok again", ts=now) + "\n")
+        fh.write(_line(event="DB down", exception="ConnectionError", ts=now) + "\n")
+        fh.write(_line(event="Disk full", exception="OSError", ts=now))  # no newline yet
+
+    with patch(
+        "butlers.core.qa.sources.log_scanner._parse_log_line", wraps=_parse_log_line
+    ) as parse:
+        findings = await source.discover(lookback_minutes=15)
+
+    assert parse.call_count == 1
+    assert [f.occurrence_count for f in findings] == [2]
+
+    with log_file.open("a") as fh:
+        fh.write("\n")
+    findings = await source.discover(lookback_minutes=15)
+    assert sorted(f.exception_type for f in findings) == ["ConnectionError", "OSError"]
+
+
+@pytest.mark.asyncio
+async def test_first_scan_starts_near_the_lookback_window(tmp_path, monkeypatch):
+    """A file seen for the first time is not decoded from its beginning."""
+    monkeypatch.setattr("butlers.core.qa.sources.log_scanner._TAIL_CHUNK_SIZE", 512)
+    now = datetime.now(UTC)
+    old = [_line(event=f"old {i}", ts=now - timedelta(hours=2)) for i in range(200)]
+    _write(tmp_path / "butlers" / "finance.log", old + [_line(event="fresh", ts=now)])
+
+    with patch(
+        "butlers.core.qa.sources.log_scanner._parse_log_line", wraps=_parse_log_line
+    ) as parse:
+        findings = await LogScannerSource(log_root=tmp_path).discover(lookback_minutes=15)
+
+    assert [f.event_summary for f in findings] == ["fresh"]
+    assert parse.call_count < 10
+
+
+@pytest.mark.asyncio
+async def test_rotation_restarts_at_offset_zero_and_keeps_window(tmp_path):
+    """A new inode at the same path is read from the start; earlier findings remain."""
+    now = datetime.now(UTC)
+    log_file = tmp_path / "butlers" / "finance.log"
+    _write(log_file, [_line(event="before rotation", exception="ErrA", ts=now)])
+    source = LogScannerSource(log_root=tmp_path)
+    await source.discover(lookback_minutes=15)
+
+    log_file.rename(log_file.with_name("finance.log.2026-10-12"))
+    _write(log_file, [_line(event="after rotation", exception="ErrB", ts=now)])
+    findings = await source.discover(lookback_minutes=15)
+
+    assert sorted(f.exception_type for f in findings) == ["ErrA", "ErrB"]
+
+
+@pytest.mark.asyncio
+async def test_line_cap_defers_unread_lines_to_the_next_scan(tmp_path):
+    """Lines past max_total_lines are read by later scans rather than dropped."""
+    now = datetime.now(UTC)
+    lines = [
+        _line(event=f"E{i}", exception=f"Er{i}", ts=now, logger_name=f"m{i}") for i in range(10)
+    ]
+    _write(tmp_path / "butlers" / "f.log", lines)
+
+    source = LogScannerSource(log_root=tmp_path, max_total_lines=4)
+    counts = [len(await source.discover(lookback_minutes=15)) for _ in range(3)]
+
+    assert counts == [4, 8, 10]
+    assert source.last_truncated_reason == "max_total_lines"
@@ -4,6 +4,7 @@ import boto3
 import pytest
 from moto.server import ThreadedMotoServer
 
+from butlers.storage.blob_cache import DiskBlobCache
 from butlers.storage.blobs import BlobNotFoundError, BlobRef, S3BlobStore
 
 pytestmark = pytest.mark.unit
@@ -48,6 +49,21 @@ def blob_store(moto_s3_server):
     )
 
 
+def _raw_client(endpoint: str):
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint,
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    )
+
+
+def _content_keys(endpoint: str, digest: str) -> list[str]:
+    listing = _raw_client(endpoint).list_objects_v2(Bucket=TEST_BUCKET, Prefix="_cas/sha256/")
+    return [o["Key"] for o in listing.get("Contents", []) if o["Key"].endswith(digest)]
+
+
 def test_s3_blob_store_configures_explicit_network_timeouts(moto_s3_server):
     """S3 startup checks should fail fast when the endpoint does not answer."""
     store = S3BlobStore(
@@ -149,3 +165,113 @@ async def test_s3_blob_store_binary_and_startup(blob_store, moto_s3_server):
     )
     with pytest.raises(RuntimeError, match="does not exist"):
         await bad_store.startup_check()
+
+
+async def test_identical_bodies_are_stored_once_and_reference_counted(blob_store, moto_s3_server):
+    """Duplicate puts share one body; it is removed only with its last reference."""
+    data = b"forwarded-meme" * 100
+    ref_a = await blob_store.put(data, content_type="image/png", filename="meme.png")
+    ref_b = await blob_store.put(data, content_type="image/png")
+
+    digest = S3BlobStore.content_hash(ref_a)
+    assert digest is not None and digest == S3BlobStore.content_hash(ref_b)
+    assert ref_a != ref_b
+    assert len(_content_keys(moto_s3_server, digest)) == 1
+
+    await blob_store.delete(ref_a)
+    assert await blob_store.exists(ref_a) is False
+    assert await blob_store.get(ref_b) == data
+
+    await blob_store.delete(ref_b)
+    assert _content_keys(moto_s3_server, digest) == []
+    with pytest.raises(BlobNotFoundError):
+        await blob_store.delete(ref_b)
+
+
+async def test_legacy_uuid_refs_still_resolve(blob_store, moto_s3_server):
+    key = f"{TEST_BUTLER}/2026/01/01/0f8fad5b-d9cb-469f-a165-70867728950e.txt"
+    _raw_client(moto_s3_server).put_object(Bucket=TEST_BUCKET, Key=key, Body=b"legacy")
+    ref = f"s3://{TEST_BUCKET}/{key}"
+
+    assert S3BlobStore.content_hash(ref) is None
+    assert await blob_store.exists(ref) is True
+    assert await blob_store.get(ref) == b"legacy"
+    await blob_store.delete(ref)
+    assert await blob_store.exists(ref) is False
+
+
+async def test_reads_are_served_from_the_disk_cache(moto_s3_server, tmp_path):
+    store = S3BlobStore(
+        bucket=TEST_BUCKET,
+        butler_name=TEST_BUTLER,
+        endpoint_url=moto_s3_server,
+        access_key_id="testing",
+        secret_access_key="testing",
+        cache=DiskBlobCache(tmp_path, max_bytes=1024 * 1024),
+    )
+    ref = await store.put(b"cached body", content_type="text/plain")
+    digest = S3BlobStore.content_hash(ref)
+
+    # Remove the body behind the store's back: the cached copy still serves.
+    (content_key,) = _content_keys(moto_s3_server, digest)
+    _raw_client(moto_s3_server).delete_object(Bucket=TEST_BUCKET, Key=content_key)
+    assert await store.get(ref) == b"cached body"
+
+    await store.delete(ref)
+    assert not (tmp_path / digest).exists()
+
+
+async def test_large_bodies_use_multipart_and_stream_into_the_cache(moto_s3_server, tmp_path):
+    threshold = 5 * 1024 * 1024
+    store = S3BlobStore(
+        bucket=TEST_BUCKET,
+        butler_name=TEST_BUTLER,
+        endpoint_url=moto_s3_server,
+        access_key_id="testing",
+        secret_access_key="testing",
+        request_timeout_s=30.0,
+        multipart_threshold_bytes=threshold,
+        cache=DiskBlobCache(tmp_path, max_bytes=64 * 1024 * 1024),
+    )
+    data = bytes(range(256)) * (threshold // 256 + 4096)
+    ref = await store.put(data, content_type="application/pdf", filename="scan.pdf")
+    digest = S3BlobStore.content_hash(ref)
+
+    (content_key,) = _content_keys(moto_s3_server, digest)
+    head = _raw_client(moto_s3_server).head_object(Bucket=TEST_BUCKET, Key=content_key)
+    assert head["ETag"].strip('"').endswith("-2")
+    assert head["ContentType"] == "application/pdf"
+
+    await store._cache.discard(digest)
+    assert await store.get(ref) == data
+    assert (tmp_path / digest).stat().st_size == len(data)
+    assert not list(tmp_path.glob("*.partial"))
+
+
+async def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskBlobCache(tmp_path, max_bytes=10)
+    await cache.write("a", b"aaaa")
+    await cache.write("b", b"bbbb")
+    assert await cache.read("a") == b"aaaa"
+    await cache.write("c", b"cccc")
+    await cache.write("huge", b"x" * 11)
+
+    assert await cache.read("b") is None
+    assert await cache.read("huge") is None
+    assert cache.total_bytes == 8
+
+    # A new instance rebuilds the index from the files on disk.
+    reopened = DiskBlobCache(tmp_path, max_bytes=10)
+    assert await reopened.read("c") == b"cccc"
+    assert len(reopened) == 2
+
+
+def test_disk_cache_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("BUTLERS_BLOB_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("BUTLERS_BLOB_CACHE_MAX_MB", "2")
+    cache = DiskBlobCache.from_env("general")
+    assert cache is not None
+    assert cache.directory == tmp_path / "general" and cache.max_bytes == 2 * 1024 * 1024
+
+    monkeypatch.setenv("BUTLERS_BLOB_CACHE_MAX_MB", "0")
+    assert DiskBlobCache.from_env("general") is None
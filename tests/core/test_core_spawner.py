@@ -798,7 +798,9 @@ class TestSpawnerInvocation:
         # Pre-invoke failure (before runtime invocation) → reset not called
         adapter2 = MockAdapter()
         spawner2 = Spawner(config=config, config_dir=config_dir, runtime=adapter2)
-        with patch("butlers.core.spawner.read_system_prompt", side_effect=RuntimeError("boom")):
+        with patch(
+            "butlers.core.spawner_artifacts.read_system_prompt", side_effect=RuntimeError("boom")
+        ):
             result2 = await spawner2.trigger("hi", "tick")
         assert result2.success is False and "RuntimeError: boom" in result2.error
         assert adapter2.calls == [] and adapter2.reset_calls == 0
@@ -0,0 +1,136 @@
+"""Tests for butlers.db_profiler — per-operation DB round-trip profiling."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import asyncpg
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+from butlers import db_profiler
+from butlers.db_profiler import (
+    current_profile,
+    profile_operation,
+    profiled,
+    profiled_connection_class,
+    query_budget_from_env,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeConnection:
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> str:
+        return "UPDATE 3"
+
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> None:
+        return None
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> list:
+        return [1, 2]
+
+    async def fetchmany(self, query: str, args: Any, **kwargs: Any) -> list:
+        return [1]
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return None
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return 7
+
+
+@pytest.fixture
+def recorded(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    monkeypatch.setenv("BUTLERS_DB_PROFILE", "1")
+    monkeypatch.delenv("BUTLERS_DB_QUERY_BUDGET", raising=False)
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        db_profiler, "record_db_operation_profile", lambda **kwargs: calls.append(kwargs)
+    )
+    return calls
+
+
+def _connection() -> Any:
+    return db_profiler._profiled_subclass(_FakeConnection)()
+
+
+def test_disabled_by_default(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("BUTLERS_DB_PROFILE", raising=False)
+    assert profiled_connection_class() is asyncpg.Connection
+    with profile_operation("op") as profile:
+        assert profile is None
+        assert current_profile() is None
+
+
+def test_connection_class_when_enabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BUTLERS_DB_PROFILE", "true")
+    cls = profiled_connection_class()
+    assert issubclass(cls, asyncpg.Connection)
+    assert profiled_connection_class() is cls
+
+
+def test_query_budget_from_env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BUTLERS_DB_QUERY_BUDGET", "12")
+    assert query_budget_from_env() == 12
+    monkeypatch.setenv("BUTLERS_DB_QUERY_BUDGET", "lots")
+    assert query_budget_from_env() == db_profiler.DEFAULT_QUERY_BUDGET
+
+
+async def test_counts_queries_rows_and_time(recorded):
+    conn = _connection()
+    await conn.execute("SELECT 1")  # outside any operation: not counted
+
+    with profile_operation("op") as profile:
+        await conn.execute("UPDATE t SET x = 1")
+        await conn.executemany("INSERT INTO t VALUES ($1)", [(1,), (2,)])
+        await conn.fetch("SELECT")
+        await conn.fetchmany("SELECT", [(1,)])
+        await conn.fetchrow("SELECT")
+        await conn.fetchval("SELECT")
+
+    assert profile is not None
+    assert (profile.queries, profile.rows) == (6, 3 + 2 + 1 + 1)
+    assert profile.db_time_s >= 0
+    assert recorded == [
+        {
+            "operation": "op",
+            "queries": 6,
+            "rows": 7,
+            "db_time_ms": profile.db_time_s * 1000,
+            "over_budget": False,
+        }
+    ]
+
+
+async def test_nested_and_concurrent_queries_count_towards_every_operation(recorded):
+    conn = _connection()
+
+    @profiled("inner")
+    async def _inner() -> None:
+        await asyncio.gather(conn.fetch("a"), conn.fetch("b"))
+
+    with profile_operation("outer") as outer:
+        await conn.fetchval("x")
+        await _inner()
+
+    assert outer is not None and outer.queries == 3
+    assert [(c["operation"], c["queries"]) for c in recorded] == [("inner", 2), ("outer", 3)]
+
+
+async def test_over_budget_is_flagged(recorded, caplog: pytest.LogCaptureFixture):
+    conn = _connection()
+    tracer = TracerProvider().get_tracer(__name__)
+
+    with caplog.at_level(logging.WARNING, logger="butlers.db_profiler"):
+        with tracer.start_as_current_span("request") as span:
+            with profile_operation("chatty", budget=2):
+                for _ in range(3):
+                    await conn.fetchrow("SELECT")
+
+    assert recorded[0]["over_budget"] is True
+    assert "chatty issued 3 queries (budget 2" in caplog.text
+    assert span.attributes["db.client.query_count"] == 3
+    assert span.attributes["db.client.query_budget_exceeded"] is True
@@ -0,0 +1,241 @@
+"""Tests for butlers.db_shared_pool — process-wide pool with per-butler routing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import asyncpg
+import pytest
+
+from butlers import db_shared_pool
+from butlers.db import Database
+from butlers.db_shared_pool import (
+    SharedPoolSettings,
+    _Route,
+    _route_sql,
+    lease_shared_pool,
+    shared_pool_settings_from_env,
+)
+
+pytestmark = pytest.mark.unit
+
+_KW = {"host": "db", "port": 5432, "user": "u", "password": "p", "database": "butlers"}
+
+
+class _FakeConnection:
+    """Stands in for a pooled proxy over a ``_RoutedConnection``."""
+
+    def __init__(self) -> None:
+        self._butlers_route: _Route | None = None
+        self.executed: list[str] = []
+        self.fetched: list[str] = []
+
+    def _set_butlers_route(self, route: _Route) -> None:
+        self._butlers_route = route
+
+    async def execute(self, query: str, *args: Any, timeout: float | None = None) -> str:
+        self.executed.append(query)
+        return "SET"
+
+    async def fetchval(self, query: str, *args: Any, **_kwargs: Any) -> Any:
+        self.fetched.append(query)
+        return self._butlers_route
+
+    async def fetchrow(self, query: str, *args: Any, **_kwargs: Any) -> Any:
+        self.fetched.append(query)
+        return None
+
+
+class _FakeInnerPool:
+    def __init__(self, size: int) -> None:
+        self.connections = [_FakeConnection() for _ in range(size)]
+        self._free: asyncio.Queue[_FakeConnection] = asyncio.Queue()
+        for connection in self.connections:
+            self._free.put_nowait(connection)
+        self.closed = False
+
+    async def acquire(self, *, timeout: float | None = None) -> _FakeConnection:
+        return await asyncio.wait_for(self._free.get(), timeout)
+
+    async def release(self, connection: _FakeConnection, *, timeout: float | None = None) -> None:
+        self._free.put_nowait(connection)
+
+    def get_size(self) -> int:
+        return len(self.connections)
+
+    def get_idle_size(self) -> int:
+        return self._free.qsize()
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def terminate(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def inner_pools(monkeypatch: pytest.MonkeyPatch) -> list[_FakeInnerPool]:
+    created: list[_FakeInnerPool] = []
+
+    async def _create_pool(**kwargs: Any) -> _FakeInnerPool:
+        assert kwargs["connection_class"] is db_shared_pool._RoutedConnection
+        pool = _FakeInnerPool(kwargs["max_size"])
+        created.append(pool)
+        return pool
+
+    monkeypatch.setattr(db_shared_pool.asyncpg, "create_pool", _create_pool)
+    monkeypatch.setattr(db_shared_pool, "_SHARED_POOLS", {})
+    return created
+
+
+class TestSettingsFromEnv:
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("BUTLERS_DB_SHARED_POOL", raising=False)
+
+        assert shared_pool_settings_from_env() is None
+
+    def test_opt_in_with_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL", "true")
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL_MAX_SIZE", "12")
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL_PER_BUTLER", "40")
+        monkeypatch.setenv("BUTLERS_DB_SHARED_POOL_IDLE_SECONDS", "bogus")
+
+        settings = shared_pool_settings_from_env()
+
+        assert settings == SharedPoolSettings(
+            min_size=0, max_size=12, per_butler_limit=12, max_inactive_connection_lifetime=60.0
+        )
+
+
+def test_route_sql_quotes_role_and_resets_defaults() -> None:
+    assert _route_sql(_Route("butler_a_rw", "a,public")) == (
+        'SET ROLE "butler_a_rw"; SET search_path TO a,public'
+    )
+    assert _route_sql(_Route(None, None)) == "RESET ROLE; SET search_path TO DEFAULT"
+
+
+class TestLeaseRouting:
+    async def test_leases_share_one_pool_and_skip_redundant_sets(self, inner_pools) -> None:
+        settings = SharedPoolSettings(max_size=1, per_butler_limit=1)
+        alpha = await lease_shared_pool(_KW, settings, schema="alpha", role="butler_alpha_rw")
+        beta = await lease_shared_pool(_KW, settings, schema="beta", role=None)
+
+        assert alpha.shared is beta.shared and len(inner_pools) == 1
+        (connection,) = inner_pools[0].connections
+
+        assert await alpha.fetchval("SELECT 1") == _Route("butler_alpha_rw", "alpha,public")
+        assert await alpha.fetchval("SELECT 1") == _Route("butler_alpha_rw", "alpha,public")
+        assert await beta.fetchval("SELECT 1") == _Route(None, "beta,public")
+
+        assert len(connection.executed) == 2
+        assert alpha.shared.stats()["route_hits"] == 1
+
+    async def test_fair_share_caps_one_butler_not_the_others(self, inner_pools) -> None:
+        settings = SharedPoolSettings(max_size=3, per_butler_limit=1)
+        busy = await lease_shared_pool(_KW, settings, schema="busy", role=None)
+        quiet = await lease_shared_pool(_KW, settings, schema="quiet", role=None)
+
+        held = await busy.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await busy.acquire(timeout=0.05)
+        async with quiet.acquire() as connection:
+            assert connection is not held
+        await busy.release(held)
+
+        async with busy.acquire():
+            pass
+
+    async def test_fair_share_is_keyed_by_butler_not_schema(self, inner_pools) -> None:
+        settings = SharedPoolSettings(max_size=4, per_butler_limit=1)
+        health_audit = await lease_shared_pool(
+            _KW, settings, schema="switchboard", role=None, butler="health"
+        )
+        finance_audit = await lease_shared_pool(
+            _KW, settings, schema="switchboard", role=None, butler="finance"
+        )
+        health = await lease_shared_pool(_KW, settings, schema="health", role=None, butler="health")
+
+        held = await health_audit.acquire()
+        async with finance_audit.acquire():
+            pass
+        with pytest.raises(asyncio.TimeoutError):
+            await health.acquire(timeout=0.05)
+        await health_audit.release(held)
+
+    async def test_release_rejects_foreign_connection(self, inner_pools) -> None:
+        lease = await lease_shared_pool(_KW, SharedPoolSettings(), schema="alpha", role=None)
+
+        with pytest.raises(asyncpg.InterfaceError):
+            await lease.release(_FakeConnection())
+
+    async def test_last_lease_closes_shared_pool(self, inner_pools) -> None:
+        settings = SharedPoolSettings()
+        alpha = await lease_shared_pool(_KW, settings, schema="alpha", role=None)
+        beta = await lease_shared_pool(_KW, settings, schema="beta", role=None)
+
+        await alpha.close()
+        await alpha.close()
+        assert not inner_pools[0].closed
+
+        await beta.close()
+        assert inner_pools[0].closed
+        assert db_shared_pool._SHARED_POOLS == {}
+        with pytest.raises(asyncpg.InterfaceError):
+            await beta.fetch("SELECT 1")
+
+
+class TestLeaseIsAnAsyncpgPool:
+    """Call sites branch on ``isinstance(pool, asyncpg.Pool)``; a lease must take
+    the pool branch, not the bare-connection one."""
+
+    async def test_lease_passes_pool_checks_without_pool_internals(self, inner_pools) -> None:
+        lease = await lease_shared_pool(_KW, SharedPoolSettings(), schema="alpha", role=None)
+
+        assert isinstance(lease, asyncpg.Pool)
+        assert await lease is lease
+        assert lease.get_min_size() == 0
+        assert lease.get_idle_size() == inner_pools[0].get_idle_size()
+        assert "alpha" in repr(lease)
+
+        lease.terminate()
+        assert lease.is_closing()
+        assert inner_pools[0].closed
+        assert db_shared_pool._SHARED_POOLS == {}
+
+    async def test_finance_probe_cache_applies_to_a_lease(self, inner_pools) -> None:
+        import butlers.tools.finance.transactions as transactions
+
+        lease = await lease_shared_pool(_KW, SharedPoolSettings(), schema="finance", role=None)
+        try:
+            assert await transactions._has_table(lease, "transactions")
+            assert await transactions._has_table(lease, "transactions")
+        finally:
+            transactions._table_existence_cache.pop(lease, None)
+
+        probes = [q for c in inner_pools[0].connections for q in c.fetched]
+        assert len(probes) == 1
+
+    async def test_owner_entity_lookup_acquires_from_a_lease(self, inner_pools) -> None:
+        from butlers.chronicler.adapters._owner_entity import resolve_owner_entity_id
+
+        lease = await lease_shared_pool(_KW, SharedPoolSettings(), schema="alpha", role=None)
+
+        assert await resolve_owner_entity_id(lease) is None
+        assert inner_pools[0].get_idle_size() == inner_pools[0].get_size()
+
+
+async def test_database_connect_leases_shared_pool_when_enabled(
+    inner_pools, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BUTLERS_DB_SHARED_POOL", "1")
+    db = Database(db_name="butlers", schema="health", host="db", user="u", password="p")
+    db.owner_butler = "health"
+
+    pool = await db.connect()
+
+    assert db.pool is pool
+    assert pool._route_key == "health"
+    assert await pool.fetchval("SELECT 1") == _Route(None, "health,public")
+    await db.close()
+    assert inner_pools[0].closed
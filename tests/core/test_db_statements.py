@@ -0,0 +1,214 @@
+"""Tests for butlers.db_statements — hot-path statement registry and pre-preparation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import asyncpg
+import pytest
+
+from butlers import db_statements
+from butlers.db_statements import (
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    StatementSchema,
+    prepare_registered_statements,
+    probe_statement_schema,
+    register_statement,
+    registered_statements,
+    statement_cache_size_from_env,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(db_statements, "_REGISTRY", {})
+    monkeypatch.delenv(db_statements.STATEMENT_CACHE_SIZE_ENV, raising=False)
+
+
+class _FakeConnection:
+    """*present* holds relation names and ``relation.column`` names."""
+
+    def __init__(self, present: set[str], failing: set[str] | None = None) -> None:
+        self.present = present
+        self.failing = failing or set()
+        self.prepared: list[str] = []
+        self.probes = 0
+
+    async def fetchrow(
+        self, query: str, relations: list[str], column_relations: list[str], columns: list[str]
+    ) -> tuple[list[str], list[str]]:
+        self.probes += 1
+        qualified = [f"{rel}.{col}" for rel, col in zip(column_relations, columns, strict=True)]
+        return (
+            [r for r in relations if r in self.present],
+            [c for c in qualified if c in self.present],
+        )
+
+    async def _get_statement(self, query: str, timeout: Any) -> object:
+        if query in self.failing:
+            raise asyncpg.UndefinedColumnError("column does not exist")
+        self.prepared.append(query)
+        return object()
+
+
+def test_register_statement_returns_dedented_canonical_text() -> None:
+    sql = register_statement(
+        "t.select",
+        """
+        SELECT id
+        FROM items
+        WHERE id = $1
+        """,
+        relations=("items",),
+    )
+
+    assert sql == "SELECT id\nFROM items\nWHERE id = $1"
+    assert [s.key for s in registered_statements()] == ["t.select"]
+
+
+def test_reregistering_same_text_is_idempotent() -> None:
+    first = register_statement("t.select", "SELECT 1", relations=())
+    second = register_statement("t.select", "  SELECT 1\n", relations=())
+
+    assert first == second
+    assert len(registered_statements()) == 1
+
+
+def test_reregistering_different_text_raises() -> None:
+    register_statement("t.select", "SELECT 1", relations=())
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_statement("t.select", "SELECT 2", relations=())
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, DEFAULT_STATEMENT_CACHE_SIZE),
+        ("", DEFAULT_STATEMENT_CACHE_SIZE),
+        ("512", 512),
+        ("0", 0),
+        ("-5", 0),
+        ("lots", DEFAULT_STATEMENT_CACHE_SIZE),
+    ],
+)
+def test_statement_cache_size_from_env(
+    monkeypatch: pytest.MonkeyPatch, raw: str | None, expected: int
+) -> None:
+    if raw is not None:
+        monkeypatch.setenv(db_statements.STATEMENT_CACHE_SIZE_ENV, raw)
+
+    assert statement_cache_size_from_env() == expected
+
+
+async def test_prepare_skips_statements_with_missing_relations() -> None:
+    inbox = register_statement("t.inbox", "SELECT * FROM route_inbox", relations=("route_inbox",))
+    register_statement("t.facts", "SELECT * FROM facts", relations=("facts",))
+    lock = register_statement("t.lock", "SELECT pg_advisory_xact_lock($1)", relations=())
+    conn = _FakeConnection(present={"route_inbox"})
+
+    assert await prepare_registered_statements(conn) == 2
+    assert conn.prepared == [inbox, lock]
+
+
+async def test_prepare_logs_and_skips_statements_that_fail() -> None:
+    old = register_statement("t.old", "SELECT until_at FROM tasks", relations=("tasks",))
+    new = register_statement("t.new", "SELECT id FROM tasks", relations=("tasks",))
+    conn = _FakeConnection(present={"tasks"}, failing={old})
+
+    assert await prepare_registered_statements(conn) == 1
+    assert conn.prepared == [new]
+
+
+async def test_prepare_is_a_noop_when_statement_cache_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register_statement("t.select", "SELECT id FROM tasks", relations=("tasks",))
+    monkeypatch.setenv(db_statements.STATEMENT_CACHE_SIZE_ENV, "0")
+    conn = _FakeConnection(present={"tasks"})
+
+    assert await prepare_registered_statements(conn) == 0
+    assert conn.prepared == []
+
+
+async def test_prepare_is_a_noop_without_statement_cache_hook() -> None:
+    register_statement("t.select", "SELECT id FROM tasks", relations=("tasks",))
+
+    class _Bare:
+        async def fetchval(self, *args: Any) -> list[str]:
+            raise AssertionError("should not query")
+
+    assert await prepare_registered_statements(_Bare()) == 0
+
+
+async def test_prepare_selects_the_variant_matching_the_schema_columns() -> None:
+    variants = {
+        has_until: register_statement(
+            f"t.due.{int(has_until)}",
+            "SELECT id, until_at FROM tasks" if has_until else "SELECT id FROM tasks",
+            relations=("tasks",),
+            columns={"tasks.until_at": has_until},
+        )
+        for has_until in (False, True)
+    }
+
+    legacy = _FakeConnection(present={"tasks"})
+    assert await prepare_registered_statements(legacy) == 1
+    assert legacy.prepared == [variants[False]]
+
+    current = _FakeConnection(present={"tasks", "tasks.until_at"})
+    assert await prepare_registered_statements(current) == 1
+    assert current.prepared == [variants[True]]
+
+
+async def test_probe_splits_qualified_column_names() -> None:
+    register_statement(
+        "t.history",
+        "SELECT entity_id FROM connectors.history",
+        relations=("connectors.history",),
+        columns={"connectors.history.entity_id": True},
+    )
+    conn = _FakeConnection(present={"connectors.history", "connectors.history.entity_id"})
+
+    schema = await probe_statement_schema(conn)
+
+    assert schema == StatementSchema(
+        frozenset({"connectors.history"}), frozenset({"connectors.history.entity_id"})
+    )
+
+
+async def test_prepare_reuses_a_probed_schema() -> None:
+    sql = register_statement("t.select", "SELECT id FROM tasks", relations=("tasks",))
+    schema = await probe_statement_schema(_FakeConnection(present={"tasks"}))
+    conn = _FakeConnection(present=set())
+
+    assert await prepare_registered_statements(conn, schema) == 1
+    assert conn.prepared == [sql] and conn.probes == 0
+
+
+async def test_database_probes_once_per_pool_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from butlers import db as db_module
+
+    async def _no_codec(conn: Any) -> None:
+        return None
+
+    monkeypatch.setattr(db_module, "register_jsonb_codec", _no_codec)
+    sql = register_statement("t.select", "SELECT id FROM tasks", relations=("tasks",))
+    database = db_module.Database(db_name="bench")
+    before_migrations = _FakeConnection(present=set())
+    await database._init_connection(before_migrations)
+    sibling = _FakeConnection(present={"tasks"})
+    await database._init_connection(sibling)
+
+    assert (before_migrations.probes, sibling.probes) == (1, 0)
+    assert sibling.prepared == []
+
+    database.invalidate_statement_schema()
+    migrated = _FakeConnection(present={"tasks"})
+    await database._init_connection(migrated)
+
+    assert migrated.probes == 1 and migrated.prepared == [sql]
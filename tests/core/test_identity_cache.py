@@ -0,0 +1,230 @@
+"""Tests for butlers.identity_cache — cached channel-identity resolution.
+
+Covers:
+- ChannelIdentityCache: LRU/TTL, negatives, inactive pass-through, the
+  generation guard, and the targeted invalidation rules
+- resolve_contact_by_channel / resolve_contacts_by_channel_bulk sharing the
+  cache, and DB errors never being cached
+- run_identity_cache_listener activating the cache only while LISTEN is up
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from butlers import identity_cache
+from butlers.identity import (
+    ResolvedContact,
+    resolve_contact_by_channel,
+    resolve_contacts_by_channel_bulk,
+)
+from butlers.identity_cache import (
+    IDENTITY_CHANGED_CHANNEL,
+    ChannelIdentityCache,
+    run_identity_cache_listener,
+)
+
+pytestmark = pytest.mark.unit
+
+_ALICE = uuid.uuid4()
+_BOB = uuid.uuid4()
+
+
+def _contact(entity_id: uuid.UUID, name: str = "Alice") -> ResolvedContact:
+    return ResolvedContact(contact_id=None, name=name, roles=[], entity_id=entity_id)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ChannelIdentityCache:
+    """A fresh, active process cache (as if the listener were connected)."""
+    fresh = ChannelIdentityCache()
+    fresh.activate()
+    monkeypatch.setattr(identity_cache, "_CACHE", fresh)
+    return fresh
+
+
+def _store(cache: ChannelIdentityCache, key, contact, candidates, **kwargs: Any) -> None:
+    cache.store(key, contact, candidates, generation=cache.generation, **kwargs)
+
+
+class TestChannelIdentityCache:
+    def test_inactive_cache_never_hits(self) -> None:
+        cache = ChannelIdentityCache()
+        _store(cache, ("email", "a@x"), _contact(_ALICE), [("has-email", "a@x")])
+
+        assert cache.lookup(("email", "a@x")) == (False, None)
+        assert len(cache) == 0
+
+    def test_holds_negatives_and_expires_entries(self) -> None:
+        clock = _Clock()
+        cache = ChannelIdentityCache(ttl_s=10.0, clock=clock)
+        cache.activate()
+        _store(cache, ("email", "nobody@x"), None, [("has-email", "nobody@x")])
+
+        assert cache.lookup(("email", "nobody@x")) == (True, None)
+        clock.now = 10.0
+        assert cache.lookup(("email", "nobody@x")) == (False, None)
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ChannelIdentityCache(maxsize=2)
+        cache.activate()
+        _store(cache, ("email", "a"), None, [])
+        _store(cache, ("email", "b"), None, [])
+        cache.lookup(("email", "a"))
+        _store(cache, ("email", "c"), None, [])
+
+        assert cache.lookup(("email", "b")) == (False, None)
+        assert cache.lookup(("email", "a")) == (True, None)
+
+    def test_store_after_invalidation_is_dropped(self) -> None:
+        cache = ChannelIdentityCache()
+        cache.activate()
+        generation = cache.generation
+        cache.invalidate([_ALICE])
+
+        cache.store(("email", "a@x"), _contact(_ALICE), [], generation=generation)
+
+        assert len(cache) == 0
+
+    def test_invalidation_is_targeted(self) -> None:
+        cache = ChannelIdentityCache()
+        cache.activate()
+        _store(cache, ("email", "a@x"), _contact(_ALICE), [("has-email", "a@x")])
+        _store(cache, ("email", "b@x"), _contact(_BOB, "Bob"), [("has-email", "b@x")])
+        _store(cache, ("email", "new@x"), None, [("has-email", "new@x")])
+        _store(cache, ("email", "other@x"), None, [("has-email", "other@x")])
+        _store(
+            cache,
+            ("whatsapp_jid", "6591153887@s.whatsapp.net"),
+            None,
+            [("has-phone", "6591153887"), ("phone_digits", "6591153887")],
+            digits_sensitive=True,
+        )
+
+        removed = cache.invalidate([_ALICE], [("has-email", "new@x")])
+
+        assert removed == 2
+        assert cache.lookup(("email", "b@x")) == (True, _contact(_BOB, "Bob"))
+        assert cache.lookup(("email", "other@x")) == (True, None)
+        assert cache.lookup(("whatsapp_jid", "6591153887@s.whatsapp.net")) == (True, None)
+
+        cache.invalidate([], [("has-phone", "+65 9999 0000")])
+        assert cache.lookup(("whatsapp_jid", "6591153887@s.whatsapp.net")) == (False, None)
+
+    def test_notification_payloads(self) -> None:
+        cache = ChannelIdentityCache()
+        cache.activate()
+        _store(cache, ("email", "a@x"), _contact(_ALICE), [("has-email", "a@x")])
+        _store(cache, ("email", "b@x"), _contact(_BOB, "Bob"), [("has-email", "b@x")])
+
+        cache.apply_notification(json.dumps({"entity_ids": [str(_ALICE)]}))
+        assert cache.lookup(("email", "a@x")) == (False, None)
+        assert cache.lookup(("email", "b@x"))[0] is True
+
+        cache.apply_notification("not json")
+        assert len(cache) == 0
+
+
+async def test_single_and_bulk_resolution_share_the_cache(cache: ChannelIdentityCache) -> None:
+    pool = AsyncMock()
+    pool.fetchrow = AsyncMock(
+        side_effect=[{"entity_id": _ALICE, "name": "Alice", "roles": ["owner"]}, None]
+    )
+    pool.fetch = AsyncMock(return_value=[])
+
+    first = await resolve_contact_by_channel(pool, "email", "alice@example.com")
+    assert await resolve_contact_by_channel(pool, "email", "alice@example.com") == first
+    assert await resolve_contact_by_channel(pool, "email", "nobody@example.com") is None
+    assert await resolve_contact_by_channel(pool, "email", "nobody@example.com") is None
+    assert pool.fetchrow.await_count == 2
+
+    result = await resolve_contacts_by_channel_bulk(
+        pool,
+        [("email", "alice@example.com"), ("email", "nobody@example.com"), ("email", "c@x")],
+    )
+
+    assert result[("email", "alice@example.com")] == first
+    assert result[("email", "nobody@example.com")] is None
+    (call,) = pool.fetch.await_args_list
+    assert call.args[1:] == (["has-email"], ["c@x"])
+    assert cache.lookup(("email", "c@x")) == (True, None)
+
+
+async def test_db_errors_are_not_cached(cache: ChannelIdentityCache) -> None:
+    pool = AsyncMock()
+    pool.fetchrow = AsyncMock(side_effect=RuntimeError("permission denied"))
+    pool.fetch = AsyncMock(side_effect=RuntimeError("permission denied"))
+
+    assert await resolve_contact_by_channel(pool, "email", "a@x") is None
+    assert await resolve_contacts_by_channel_bulk(pool, [("email", "b@x")]) == {
+        ("email", "b@x"): None
+    }
+
+    assert len(cache) == 0
+
+
+class _FakeListenConnection:
+    def __init__(self) -> None:
+        self.callbacks: dict[str, Any] = {}
+        self.closed = False
+
+    async def add_listener(self, channel: str, callback: Any) -> None:
+        self.callbacks[channel] = callback
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def _eventually(predicate: Any) -> None:
+    async with asyncio.timeout(1):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+async def test_listener_activates_cache_only_while_connected() -> None:
+    cache = ChannelIdentityCache()
+    conn = _FakeListenConnection()
+    connected = asyncio.Event()
+
+    async def _connect() -> _FakeListenConnection:
+        connected.set()
+        return conn
+
+    task = asyncio.create_task(
+        run_identity_cache_listener(
+            _connect, cache=cache, reconnect_backoff_s=60, health_poll_interval_s=0.01
+        )
+    )
+    await connected.wait()
+    await _eventually(lambda: cache.active)
+
+    _store(cache, ("email", "a@x"), _contact(_ALICE), [("has-email", "a@x")])
+    conn.callbacks[IDENTITY_CHANGED_CHANNEL](
+        conn, 1, IDENTITY_CHANGED_CHANNEL, json.dumps({"facts": [["has-email", "a@x"]]})
+    )
+    await _eventually(lambda: len(cache) == 0)
+
+    conn.closed = True
+    await _eventually(lambda: not cache.active)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
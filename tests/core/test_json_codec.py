@@ -0,0 +1,145 @@
+"""Tests for butlers.json_codec — orjson/stdlib byte-for-byte compatibility."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from butlers import json_codec
+from butlers.db import _jsonb_decoder, _jsonb_encoder
+
+pytestmark = pytest.mark.unit
+
+orjson = pytest.importorskip("orjson")
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
+_CORPUS: list[Any] = [
+    None,
+    True,
+    0,
+    -17,
+    2**63 - 1,
+    -(2**63),
+    0.5,
+    -1234.25,
+    "",
+    "plain ascii",
+    'quotes " and \\ backslashes',
+    "control \n\t\r\x00\x1f chars",
+    "unicode café — ☃ 🤖 中文",
+    "line\u2028and paragraph\u2029separators",
+    [],
+    {},
+    [1, "two", None, [3.5, {"four": 4}]],
+    {"z": 1, "a": 2, "m": {"nested": [True, False]}},
+    {1: "int key", False: "bool key", None: "none key", 2.5: "float key"},
+    ("tuple", "encodes", "as", "array"),
+    {
+        "request_id": "0192f7a4-0000-7000-8000-000000000000",
+        "source": {"channel": "telegram", "provider": "telegram", "endpoint_identity": "bot"},
+        "event": {"external_event_id": "42", "observed_at": "2026-10-19T00:00:00Z"},
+        "payload": {"raw": {"text": "Remind me to call Mum 📞", "entities": []}},
+        "tool_calls": [{"name": "memory_store_fact", "input": {"confidence": 0.875}}],
+    },
+]
+
+
+@pytest.mark.parametrize("value", _CORPUS, ids=lambda v: repr(v)[:40])
+def test_backends_emit_identical_bytes(value: Any) -> None:
+    assert json_codec._orjson_dumps_bytes(value) == json_codec._stdlib_dumps_bytes(value)
+
+
+@pytest.mark.parametrize("value", _CORPUS, ids=lambda v: repr(v)[:40])
+def test_backends_decode_identically(value: Any) -> None:
+    encoded = json_codec._stdlib_dumps_bytes(value)
+
+    assert json_codec._orjson_loads(encoded) == json.loads(encoded)
+    assert json_codec._orjson_loads(memoryview(encoded)) == json.loads(encoded)
+
+
+def test_default_receives_datetimes_and_dataclasses_like_stdlib() -> None:
+    value = {"at": datetime(2026, 10, 19, 8, 30, tzinfo=UTC), "point": _Point(1, 2)}
+
+    assert json_codec._orjson_dumps_bytes(value, default=str) == (
+        json_codec._stdlib_dumps_bytes(value, default=str)
+    )
+
+
+def test_uuid_encodes_like_stdlib_default_str() -> None:
+    value = {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")}
+
+    assert json_codec._orjson_dumps_bytes(value) == (
+        json_codec._stdlib_dumps_bytes(value, default=str)
+    )
+
+
+def test_integers_wider_than_64_bits_fall_back_to_stdlib() -> None:
+    value = {"big": 2**70, "neg": -(2**70)}
+    encoded = json_codec._orjson_dumps_bytes(value)
+
+    assert encoded == json_codec._stdlib_dumps_bytes(value)
+    assert json_codec._orjson_loads(encoded) == value
+
+
+def test_unserializable_value_raises_type_error_on_both_backends() -> None:
+    with pytest.raises(TypeError):
+        json_codec._orjson_dumps_bytes({"obj": object()})
+    with pytest.raises(TypeError):
+        json_codec._stdlib_dumps_bytes({"obj": object()})
+
+
+def test_malformed_input_raises_json_decode_error() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json_codec._orjson_loads(b"{not json")
+
+
+def test_public_helpers_agree_with_each_other() -> None:
+    value = _CORPUS[-1]
+
+    assert json_codec.dumps(value).encode() == json_codec.dumps_bytes(value)
+    assert json_codec.loads(json_codec.dumps_bytes(value)) == value
+    assert json_codec.loads(json_codec.dumps(value)) == value
+
+
+def test_jsonb_codec_round_trips_through_version_byte() -> None:
+    value = {"text": "héllo", "n": [1, 2, 3]}
+    wire = _jsonb_encoder(value)
+
+    assert wire[:1] == b"\x01"
+    assert wire[1:] == json_codec.dumps_bytes(value)
+    assert _jsonb_decoder(wire) == value
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+def test_jsonb_encoder_rejects_non_finite_floats_on_both_backends(value: float) -> None:
+    payload = {"reading": [1.0, value]}
+
+    with pytest.raises(ValueError, match="Out of range float"):
+        json_codec._orjson_dumps_bytes(payload, allow_nan=False)
+    with pytest.raises(ValueError, match="Out of range float"):
+        json_codec._stdlib_dumps_bytes(payload, allow_nan=False)
+    with pytest.raises(ValueError):
+        _jsonb_encoder(payload)
+    # A genuine null is not mistaken for a coerced NaN.
+    assert json_codec._orjson_dumps_bytes({"x": None}, allow_nan=False) == b'{"x":null}'
+
+
+def test_uuid_is_stored_as_its_string_on_both_backends() -> None:
+    """Intended change: JSONB writes of a UUID used to raise TypeError."""
+    row_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+    expected = b'{"id":"12345678-1234-5678-1234-567812345678"}'
+    assert json_codec._orjson_dumps_bytes({"id": row_id}) == expected
+    assert json_codec._stdlib_dumps_bytes({"id": row_id}) == expected
+    assert _jsonb_decoder(_jsonb_encoder({"id": row_id})) == {"id": str(row_id)}
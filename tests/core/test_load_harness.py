@@ -0,0 +1,135 @@
+"""Tests for the switchboard load-test harness (no database).
+
+Ingest is stubbed; the buffer, spawners and fake runtimes are real, so these
+exercise the same timing and completion bookkeeping the DB-backed benchmark
+in ``tests/benchmarks/test_switchboard_load.py`` relies on.
+"""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from butlers.config import BufferConfig, ButlerConfig, RuntimeSeedConfig
+from butlers.core.runtimes.fake import FakeAdapter, FakeTurn, LatencyDistribution
+from butlers.core.spawner import Spawner
+from butlers.testing.load_harness import (
+    STAGES,
+    LoadHarness,
+    RoundTripCounter,
+    mark_mcp_warm,
+    percentile,
+    route_executor,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _spawner(tmp_path: Path, name: str, adapter: FakeAdapter, sessions: int = 4) -> Spawner:
+    config_dir = tmp_path / name
+    config_dir.mkdir()
+    config = ButlerConfig(
+        name=name,
+        port=0,
+        runtime_seed=RuntimeSeedConfig(max_concurrent_sessions=sessions),
+    )
+    return Spawner(config=config, config_dir=config_dir, runtime=adapter)
+
+
+async def _stub_ingest(envelope: dict[str, Any]) -> dict[str, Any] | None:
+    text = envelope["text"]
+    if not text:
+        return None
+    request_id = str(uuid.uuid4())
+    return {
+        "request_id": request_id,
+        "message_inbox_id": request_id,
+        "message_text": text,
+        "source": {},
+        "event": {},
+        "sender": {},
+    }
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_round_trip_counter_attributes_by_scope():
+    counter = RoundTripCounter()
+    counter._on_query(None)
+    with RoundTripCounter.scope("m0"):
+        counter._on_query(None)
+        counter._on_query(None)
+    assert counter.per_message == {"m0": 2}
+    assert counter.unattributed == 1
+
+
+async def test_run_reports_every_stage(tmp_path: Path):
+    latency = LatencyDistribution("uniform", 0.001, 0.005)
+    target = _spawner(tmp_path, "health", FakeAdapter(latency=latency, seed=1))
+    harness: LoadHarness
+
+    def _classify_script(prompt: str, _system: str) -> FakeTurn:
+        return FakeTurn(
+            text=None,
+            tool_calls=(
+                {"name": "route_to_butler", "input": {"butler": "health", "prompt": prompt}},
+            ),
+        )
+
+    async def _process(ref: Any) -> None:
+        result = await harness.timed("classify", classifier.trigger)(
+            prompt=ref.message_text, trigger_source="classification"
+        )
+        assert result.success
+        assert result.tool_calls[0]["result"] == {"status": "accepted"}
+
+    harness = LoadHarness(
+        ingest=_stub_ingest,
+        process=_process,
+        buffer_config=BufferConfig(worker_count=2),
+    )
+    classifier = _spawner(
+        tmp_path,
+        "switchboard",
+        FakeAdapter(
+            script=_classify_script,
+            latency=latency,
+            tool_executor=route_executor(harness, {"health": target}),
+        ),
+    )
+    mark_mcp_warm(classifier)
+    mark_mcp_warm(target)
+
+    envelopes = [{"text": f"message {i}"} for i in range(20)] + [{"text": ""}]
+    report = await harness.run(envelopes, rate_per_s=500, poisson=True, seed=3)
+
+    assert report.submitted == 21
+    assert report.completed == 20
+    assert report.failed == 0
+    assert report.throughput > 0
+    for stage in STAGES:
+        assert len(report.stages_ms[stage]) == (21 if stage == "ingest" else 20), stage
+    pct = report.stage_percentiles("classify")
+    assert pct["p50"] <= pct["p95"] <= pct["p99"]
+    assert "end_to_end" in report.format()
+
+
+async def test_processing_failures_are_counted(tmp_path: Path):
+    async def _process(_ref: Any) -> None:
+        raise RuntimeError("boom")
+
+    harness = LoadHarness(ingest=_stub_ingest, process=_process)
+    report = await harness.run([{"text": "a"}, {"text": "b"}], rate_per_s=1000)
+
+    assert report.completed == 0
+    assert report.failed == 2
+    assert len(report.stages_ms["end_to_end"]) == 2
@@ -0,0 +1,232 @@
+"""Tests for butlers.notification_hub — the process LISTEN multiplexer.
+
+Covers, with fake connections (no Docker/Postgres):
+- one connection registers each subscribed channel once and fans a NOTIFY
+  out to every subscriber of that channel
+- a full subscription queue drops the newest notifications and reports one
+  merged overflow gap at the position of the loss
+- a lost connection deactivates subscriptions, and the reconnect re-LISTENs
+  every channel and reports a disconnected gap
+- the last unsubscribe UNLISTENs its channel
+- acquire/release share one process hub task
+The real single-connection fan-out is covered in
+tests/integration/test_notification_hub_postgres.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from butlers import notification_hub as hub_mod
+from butlers.notification_hub import (
+    Notification,
+    NotificationGap,
+    NotificationHub,
+    acquire_notification_hub,
+    consume_channel,
+    release_notification_hub,
+    reset_notification_hub_for_tests,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _reset_hub() -> Iterator[None]:
+    reset_notification_hub_for_tests()
+    yield
+    reset_notification_hub_for_tests()
+
+
+class _FakeListenConnection:
+    def __init__(self) -> None:
+        self.callbacks: dict[str, Any] = {}
+        self.removed: list[str] = []
+        self.closed = False
+
+    async def add_listener(self, channel: str, callback: Any) -> None:
+        self.callbacks[channel] = callback
+
+    async def remove_listener(self, channel: str, callback: Any) -> None:
+        self.callbacks.pop(channel, None)
+        self.removed.append(channel)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def notify(self, channel: str, payload: str) -> None:
+        self.callbacks[channel](self, 42, channel, payload)
+
+
+async def _eventually(predicate: Any) -> None:
+    async with asyncio.timeout(1):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+def _hub(connections: list[_FakeListenConnection], **kwargs: Any) -> NotificationHub:
+    async def _connect() -> _FakeListenConnection:
+        conn = _FakeListenConnection()
+        connections.append(conn)
+        return conn
+
+    return NotificationHub(
+        _connect, reconnect_backoff_s=0.01, health_poll_interval_s=0.01, **kwargs
+    )
+
+
+async def _run(hub: NotificationHub) -> asyncio.Task:
+    task = asyncio.create_task(hub.run())
+    await _eventually(lambda: hub.connected)
+    return task
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_one_connection_fans_out_to_every_subscriber() -> None:
+    connections: list[_FakeListenConnection] = []
+    hub = _hub(connections)
+    early = await hub.subscribe("alpha")
+    task = await _run(hub)
+    try:
+        late = [await hub.subscribe("alpha") for _ in range(3)]
+        other = await hub.subscribe("beta")
+
+        connections[0].notify("alpha", "one")
+
+        # A subscription made before the first connect could have missed
+        # notifications; later ones start listening with a clean stream.
+        assert await early.get() == NotificationGap("alpha", "disconnected", 0)
+        assert await early.get() == Notification("alpha", "one", 42)
+        for sub in late:
+            assert sub.listening
+            assert await sub.get() == Notification("alpha", "one", 42)
+        assert other.qsize() == 0
+        assert len(connections) == 1
+        assert sorted(connections[0].callbacks) == ["alpha", "beta"]
+        assert hub.stats()["channels"]["alpha"] == {"subscribers": 4, "queued": 0, "dropped": 0}
+    finally:
+        await _stop(task)
+
+
+async def test_full_queue_drops_newest_and_reports_one_overflow_gap() -> None:
+    connections: list[_FakeListenConnection] = []
+    hub = _hub(connections)
+    task = await _run(hub)
+    try:
+        sub = await hub.subscribe("alpha", maxsize=2)
+        for i in range(5):
+            connections[0].notify("alpha", str(i))
+
+        assert sub.dropped == 3
+        assert hub.stats()["channels"]["alpha"]["queued"] == 2
+        items = [await sub.get() for _ in range(3)]
+        assert [getattr(i, "payload", None) for i in items[:2]] == ["0", "1"]
+        assert items[2] == NotificationGap("alpha", "overflow", 3)
+
+        connections[0].notify("alpha", "5")
+        assert await sub.get() == Notification("alpha", "5", 42)
+    finally:
+        await _stop(task)
+
+
+async def test_reconnect_reports_a_gap_and_relistens_every_channel() -> None:
+    connections: list[_FakeListenConnection] = []
+    hub = _hub(connections)
+    states: list[bool] = []
+    task = await _run(hub)
+    try:
+        sub = await hub.subscribe("alpha", on_listening=states.append)
+        await hub.subscribe("beta")
+        connections[0].notify("alpha", "before")
+
+        connections[0].closed = True
+        await _eventually(lambda: len(connections) == 2 and hub.connected)
+        connections[1].notify("alpha", "after")
+
+        assert states == [True, False, True]
+        assert sorted(connections[1].callbacks) == ["alpha", "beta"]
+        assert [await sub.get() for _ in range(3)] == [
+            Notification("alpha", "before", 42),
+            NotificationGap("alpha", "disconnected", 0),
+            Notification("alpha", "after", 42),
+        ]
+    finally:
+        await _stop(task)
+
+
+async def test_last_unsubscribe_unlistens_the_channel() -> None:
+    connections: list[_FakeListenConnection] = []
+    hub = _hub(connections)
+    task = await _run(hub)
+    try:
+        first = await hub.subscribe("alpha")
+        second = await hub.subscribe("alpha")
+        connections[0].notify("alpha", "queued")
+
+        await first.close()
+        assert connections[0].removed == []
+        await second.close()
+
+        assert connections[0].removed == ["alpha"]
+        assert hub.stats()["channels"] == {}
+    finally:
+        await _stop(task)
+
+
+async def test_consume_channel_keeps_going_after_a_handler_error() -> None:
+    connections: list[_FakeListenConnection] = []
+    hub = _hub(connections)
+    seen: list[str] = []
+
+    def _handle(item: Notification | NotificationGap) -> None:
+        if isinstance(item, Notification):
+            if item.payload == "bad":
+                raise RuntimeError("boom")
+            seen.append(item.payload)
+
+    task = await _run(hub)
+    consumer = asyncio.create_task(consume_channel("alpha", _handle, hub=hub))
+    try:
+        await _eventually(lambda: "alpha" in connections[0].callbacks)
+        connections[0].notify("alpha", "bad")
+        connections[0].notify("alpha", "good")
+        await _eventually(lambda: seen == ["good"])
+    finally:
+        await _stop(consumer)
+        await _stop(task)
+    assert hub.stats()["channels"] == {}
+
+
+async def test_acquire_and_release_share_the_process_hub(monkeypatch) -> None:
+    connections: list[_FakeListenConnection] = []
+
+    async def _connect(_fallback_db_name: str) -> _FakeListenConnection:
+        conn = _FakeListenConnection()
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(hub_mod, "_connect_listener", _connect)
+
+    hub = acquire_notification_hub("general")
+    assert acquire_notification_hub("health") is hub
+    await _eventually(lambda: hub.connected)
+
+    await release_notification_hub()
+    assert hub.connected
+    await release_notification_hub()
+
+    assert not hub.connected
+    assert len(connections) == 1
+    assert hub.fallback_db_name == "general"
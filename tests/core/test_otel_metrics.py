@@ -159,6 +159,11 @@ def test_init_metrics_and_all_instruments(monkeypatch: pytest.MonkeyPatch) -> No
         assert data2["butlers.spawner.queued_triggers"][0].value == 1
         assert data2["butlers.spawner.session_duration_ms"][0].sum == 1234
 
+        m.record_spawn_setup_duration(87, trigger_source="schedule:daily-digest")
+        setup_points = _collect_metrics(reader)["butlers.spawner.setup_duration_ms"]
+        assert setup_points[0].sum == 87
+        assert setup_points[0].attributes["trigger_source"] == "schedule"
+
         # buffer: queue_depth, enqueue_total (hot/cold), backpressure, scanner_recovered, latency
         m.buffer_queue_depth_inc()
         m.buffer_queue_depth_inc()
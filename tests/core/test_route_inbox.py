@@ -17,10 +17,15 @@ from butlers.core.route_inbox import (
     STATE_PROCESSED,
     STATE_PROCESSING,
     RouteInboxLeaseLost,
+    route_inbox_claim_batch,
+    route_inbox_claim_batch_size,
+    route_inbox_drain,
     route_inbox_insert,
     route_inbox_insert_on_connection,
     route_inbox_mark_errored,
+    route_inbox_mark_errored_batch,
     route_inbox_mark_processed,
+    route_inbox_mark_processed_batch,
     route_inbox_mark_processing,
     route_inbox_processing_lease_heartbeat,
     route_inbox_recovery_sweep,
@@ -419,3 +424,168 @@ async def test_scan_and_recovery_sweep() -> None:
     skipped_dispatch = AsyncMock()
     assert await route_inbox_recovery_sweep(pool2, dispatch_fn=skipped_dispatch) == 0
     skipped_dispatch.assert_not_awaited()
+
+
+def _claim_row(state: str = STATE_ACCEPTED, backlog: int = 1) -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "received_at": datetime.now(UTC),
+        "route_envelope": _sample_envelope(),
+        "processing_claim_id": uuid.uuid4(),
+        "previous_state": state,
+        "backlog": backlog,
+    }
+
+
+def test_claim_batch_size_splits_the_backlog_between_workers() -> None:
+    assert route_inbox_claim_batch_size(0, 4) == 1
+    assert route_inbox_claim_batch_size(10, 4) == 3
+    assert route_inbox_claim_batch_size(50_000, 4, max_batch=100) == 100
+    assert route_inbox_claim_batch_size(7, 0) == 7
+
+
+async def test_claim_batch_leases_rows_in_one_statement() -> None:
+    pool, conn = _make_pool()
+    rows = [_claim_row(backlog=40), _claim_row(STATE_PROCESSING, backlog=40)]
+    conn.fetch = AsyncMock(return_value=rows)
+
+    batch = await route_inbox_claim_batch(pool, 2, min_age_s=0, stale_after_s=30)
+
+    query, *args = conn.fetch.await_args.args
+    assert "FOR UPDATE SKIP LOCKED" in query and "RETURNING" in query
+    assert args == [STATE_PROCESSING, STATE_ACCEPTED, 0, 30, 2, 20, True, None]
+    assert [c.id for c in batch.claims] == [row["id"] for row in rows]
+    assert [c.recovery_from_processing for c in batch.claims] == [False, True]
+    assert batch.claims[0].route_envelope["schema_version"] == "route.v1"
+    assert batch.backlog == 40
+
+    conn.fetch = AsyncMock(return_value=[])
+    empty = await route_inbox_claim_batch(pool, 5)
+    assert empty.claims == [] and empty.backlog == 0
+
+    await route_inbox_claim_batch(
+        pool, 5, include_accepted=False, envelope_match='$.source == "dashboard"'
+    )
+    assert conn.fetch.await_args.args[-2:] == (False, '$.source == "dashboard"')
+
+
+async def test_batch_settlement_is_fenced_per_claim() -> None:
+    pool, conn = _make_pool()
+    owned, lost = uuid.uuid4(), uuid.uuid4()
+    claim_a, claim_b, session = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    conn.fetch = AsyncMock(return_value=[{"id": owned}])
+
+    settled = await route_inbox_mark_processed_batch(
+        pool, [(owned, claim_a, session), (lost, claim_b, None)]
+    )
+
+    query, *args = conn.fetch.await_args.args
+    assert "processing_claim_id = s.claim_id" in query
+    assert args == [
+        STATE_PROCESSED,
+        [owned, lost],
+        [claim_a, claim_b],
+        [session, None],
+        STATE_PROCESSING,
+    ]
+    assert settled == {owned}
+
+    conn.fetch = AsyncMock(return_value=[{"id": lost}])
+    assert await route_inbox_mark_errored_batch(pool, [(lost, claim_b, "boom")]) == {lost}
+    assert conn.fetch.await_args.args[4] == ["boom"]
+
+    conn.fetch.reset_mock()
+    assert await route_inbox_mark_processed_batch(pool, []) == set()
+    conn.fetch.assert_not_awaited()
+
+
+async def test_drain_settles_batches_and_resizes_from_the_backlog(monkeypatch) -> None:
+    backlog = [_claim_row(backlog=5) for _ in range(5)]
+    claim_sizes: list[int] = []
+
+    async def fake_claim(_pool: Any, n: int, **_kwargs: Any) -> Any:
+        claim_sizes.append(n)
+        rows = [backlog.pop(0) for _ in range(min(n, len(backlog)))]
+        remaining = len(rows) + len(backlog)
+        return route_inbox_module.RouteInboxClaimBatch(
+            claims=[
+                route_inbox_module.RouteInboxClaim(
+                    id=row["id"],
+                    received_at=row["received_at"],
+                    route_envelope=row["route_envelope"],
+                    processing_claim_id=row["processing_claim_id"],
+                    recovery_from_processing=False,
+                )
+                for row in rows
+            ],
+            backlog=remaining,
+        )
+
+    processed_batches: list[list] = []
+    errored_batches: list[list] = []
+
+    async def fake_processed(_pool: Any, settlements: Any) -> set:
+        processed_batches.append(list(settlements))
+        return {row_id for row_id, _, _ in settlements}
+
+    async def fake_errored(_pool: Any, failures: Any) -> set:
+        errored_batches.append(list(failures))
+        return {row_id for row_id, _, _ in failures}
+
+    monkeypatch.setattr(route_inbox_module, "route_inbox_claim_batch", fake_claim)
+    monkeypatch.setattr(route_inbox_module, "route_inbox_mark_processed_batch", fake_processed)
+    monkeypatch.setattr(route_inbox_module, "route_inbox_mark_errored_batch", fake_errored)
+    failing = backlog[1]["id"]
+
+    async def process(claim: Any) -> uuid.UUID | None:
+        if claim.id == failing:
+            raise ValueError("bad envelope")
+        return None
+
+    stats = await route_inbox_drain(AsyncMock(), process, max_batch=2)
+
+    assert (stats.processed, stats.errored, stats.lost, stats.batches) == (4, 1, 0, 3)
+    assert claim_sizes == [2, 2, 1, 1]
+    assert [len(batch) for batch in processed_batches] == [1, 2, 1]
+    assert errored_batches[0] == [(failing, errored_batches[0][0][1], "ValueError: bad envelope")]
+
+
+async def test_drain_records_rejections_verbatim(monkeypatch) -> None:
+    row = _claim_row(STATE_PROCESSING, backlog=1)
+    claim_kwargs: list[dict[str, Any]] = []
+
+    async def fake_claim(_pool: Any, n: int, **kwargs: Any) -> Any:
+        claim_kwargs.append(kwargs)
+        claims = []
+        if len(claim_kwargs) == 1:
+            claims.append(
+                route_inbox_module.RouteInboxClaim(
+                    id=row["id"],
+                    received_at=row["received_at"],
+                    route_envelope=row["route_envelope"],
+                    processing_claim_id=row["processing_claim_id"],
+                    recovery_from_processing=True,
+                )
+            )
+        return route_inbox_module.RouteInboxClaimBatch(claims=claims, backlog=len(claims))
+
+    errored = AsyncMock(return_value={row["id"]})
+    monkeypatch.setattr(route_inbox_module, "route_inbox_claim_batch", fake_claim)
+    monkeypatch.setattr(
+        route_inbox_module, "route_inbox_mark_processed_batch", AsyncMock(return_value=set())
+    )
+    monkeypatch.setattr(route_inbox_module, "route_inbox_mark_errored_batch", errored)
+
+    async def process(_claim: Any) -> None:
+        raise route_inbox_module.RouteInboxRowRejected("replay suppressed")
+
+    stats = await route_inbox_drain(
+        AsyncMock(), process, include_accepted=False, envelope_match="$.x == 1"
+    )
+
+    assert (stats.errored, stats.batches) == (1, 1)
+    assert errored.await_args.args[1] == [
+        (row["id"], row["processing_claim_id"], "replay suppressed")
+    ]
+    assert claim_kwargs[0]["include_accepted"] is False
+    assert claim_kwargs[0]["envelope_match"] == "$.x == 1"
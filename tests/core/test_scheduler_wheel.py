@@ -0,0 +1,164 @@
+"""Tests for butlers.core.scheduler_wheel — the scheduler's in-memory due index.
+
+The pool is a fake that answers the schema probes and per-kind load queries
+by matching on SQL text and counts every call, so the tests can assert how
+many queries a sync or an idle tick issues without a database.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from butlers.core.scheduler import tick
+from butlers.core.scheduler_wheel import (
+    DEADLINE_COLUMNS,
+    KIND_CALENDAR_END,
+    KIND_CHAIN,
+    KIND_CRON,
+    KIND_DEFERRED,
+    SchedulerWheel,
+    invalidate_scheduler_wheel,
+    next_utc_midnight,
+    register_scheduler_wheel,
+    unregister_scheduler_wheel,
+)
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.cron_rows: list[dict[str, Any]] = []
+        self.deferred_rows: list[dict[str, Any]] = []
+
+    async def fetch(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        self.calls.append(sql)
+        if "information_schema.columns" in sql:
+            return [{"column_name": name} for name in args[1]]
+        if "FROM scheduled_tasks" in sql and "next_run_at" in sql:
+            return self.cron_rows
+        if "FROM deferred_notifications" in sql:
+            return self.deferred_rows
+        return []
+
+    async def fetchval(self, sql: str, *args: Any) -> Any:
+        self.calls.append(sql)
+        return True
+
+    async def execute(self, sql: str, *args: Any) -> str:
+        self.calls.append(sql)
+        return "UPDATE 0"
+
+
+async def _loaded(pool: _FakePool) -> SchedulerWheel:
+    wheel = SchedulerWheel()
+    await wheel.sync(pool, NOW)
+    return wheel
+
+
+class TestSchedulerWheel:
+    async def test_full_sync_probes_schema_and_indexes_rows(self) -> None:
+        pool = _FakePool()
+        due_id, later_id = uuid.uuid4(), uuid.uuid4()
+        pool.cron_rows = [
+            {"id": due_id, "next_run_at": NOW - timedelta(seconds=5)},
+            {"id": later_id, "next_run_at": NOW + timedelta(hours=1)},
+        ]
+
+        wheel = await _loaded(pool)
+
+        assert wheel.loaded
+        assert wheel.deadline_columns_ready
+        assert DEADLINE_COLUMNS <= wheel.scheduled_task_columns
+        assert wheel.take_due(NOW).cron == [due_id]
+        assert wheel.take_due(NOW + timedelta(hours=1)).cron == [later_id]
+
+    async def test_clean_sync_issues_no_queries(self) -> None:
+        pool = _FakePool()
+        wheel = await _loaded(pool)
+        pool.calls.clear()
+
+        await wheel.sync(pool, NOW + timedelta(seconds=60))
+
+        assert pool.calls == []
+
+    async def test_invalidate_reloads_only_the_dirty_kind(self) -> None:
+        pool = _FakePool()
+        wheel = await _loaded(pool)
+        pool.calls.clear()
+        notif_id = uuid.uuid4()
+        pool.deferred_rows = [{"id": notif_id, "deliver_at": NOW + timedelta(minutes=5)}]
+
+        register_scheduler_wheel(pool, wheel)
+        try:
+            invalidate_scheduler_wheel(pool, KIND_DEFERRED)
+        finally:
+            unregister_scheduler_wheel(pool)
+        await wheel.sync(pool, NOW)
+
+        assert len(pool.calls) == 1
+        assert "deferred_notifications" in pool.calls[0]
+        assert wheel.take_due(NOW + timedelta(minutes=5)).deferred == [notif_id]
+
+    async def test_chain_invalidation_requests_chain_pass(self) -> None:
+        wheel = await _loaded(_FakePool())
+        wheel.chain_pass_done()
+
+        wheel.invalidate(KIND_CHAIN)
+
+        assert wheel.chains_pending
+
+    def test_invalidate_without_registered_wheel_is_noop(self) -> None:
+        invalidate_scheduler_wheel(object(), KIND_CRON)
+
+    async def test_write_through_another_pool_invalidates_every_wheel(self) -> None:
+        pool_a, pool_b = _FakePool(), _FakePool()
+        wheel_a, wheel_b = await _loaded(pool_a), await _loaded(pool_b)
+        wheel_a.chain_pass_done()
+        wheel_b.chain_pass_done()
+
+        register_scheduler_wheel(pool_a, wheel_a)
+        register_scheduler_wheel(pool_b, wheel_b)
+        try:
+            invalidate_scheduler_wheel(pool_a, KIND_DEFERRED)
+            assert (wheel_a._dirty, wheel_b._dirty) == ({KIND_DEFERRED}, set())
+
+            invalidate_scheduler_wheel(object(), KIND_CALENDAR_END)
+        finally:
+            unregister_scheduler_wheel(pool_a)
+            unregister_scheduler_wheel(pool_b)
+
+        assert KIND_CALENDAR_END in wheel_a._dirty and KIND_CALENDAR_END in wheel_b._dirty
+        assert wheel_a.chains_pending and wheel_b.chains_pending
+
+    def test_next_utc_midnight(self) -> None:
+        assert next_utc_midnight(NOW) == datetime(2026, 3, 2, tzinfo=UTC)
+        assert next_utc_midnight(datetime(2026, 3, 2, tzinfo=UTC)) == datetime(
+            2026, 3, 3, tzinfo=UTC
+        )
+
+
+class TestWheelDrivenTick:
+    async def test_idle_tick_issues_no_queries(self) -> None:
+        pool = _FakePool()
+        now = datetime.now(UTC)
+        pool.cron_rows = [{"id": uuid.uuid4(), "next_run_at": now + timedelta(hours=1)}]
+        wheel = SchedulerWheel()
+        await wheel.sync(pool, now)
+        wheel.chain_pass_done()
+        pool.calls.clear()
+        dispatch_fn = AsyncMock()
+
+        dispatched = await tick(pool, dispatch_fn, wheel=wheel)
+
+        assert dispatched == 0
+        assert pool.calls == []
+        dispatch_fn.assert_not_awaited()
@@ -0,0 +1,192 @@
+"""Tests for monthly ``sessions`` partition maintenance (core_202).
+
+Unit tests against a fake pool: the partition helpers, the deterministic
+maintenance job, the ``session_create`` missing-partition retry, and a
+structural check of the migration module itself.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from butlers.core.session_partitions import (
+    compact_session_partitions,
+    ensure_session_partitions,
+    run_sessions_partition_maintenance,
+)
+from butlers.core.sessions import (
+    schedule_costs,
+    session_complete,
+    session_create,
+    session_set_healing_fingerprint,
+    top_sessions,
+)
+from butlers.scheduled_jobs import get_deterministic_schedule_job_registry
+
+pytestmark = pytest.mark.unit
+
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "core"
+    / "core_202_sessions_monthly_partitions.py"
+)
+
+
+class _FakePool:
+    def __init__(self, *, migrated: bool = True, insert_results: list[Any] | None = None) -> None:
+        self.migrated = migrated
+        self.insert_results = list(insert_results or [])
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def fetchval(self, sql: str, *args: Any) -> Any:
+        self.calls.append((sql, args))
+        if "to_regprocedure" in sql:
+            return self.migrated
+        if "sessions_ensure_partition" in sql:
+            return "sessions_202610"
+        if "sessions_compact_partitions" in sql:
+            return 3
+        if "INSERT INTO sessions" in sql:
+            return self.insert_results.pop(0)
+        if "UPDATE sessions" in sql:
+            return args[0]
+        return None
+
+    async def fetch(self, sql: str, *args: Any) -> list[Any]:
+        self.calls.append((sql, args))
+        return []
+
+    async def execute(self, sql: str, *args: Any) -> str:
+        self.calls.append((sql, args))
+        return "SELECT 1"
+
+    def sql_containing(self, needle: str) -> list[str]:
+        return [sql for sql, _ in self.calls if needle in sql]
+
+
+class TestPartitionHelpers:
+    async def test_helpers_are_noops_before_migration(self) -> None:
+        pool = _FakePool(migrated=False)
+
+        assert await ensure_session_partitions(pool) is None
+        assert await compact_session_partitions(pool) == 0
+        assert pool.sql_containing("sessions_ensure_partition(COALESCE") == []
+
+    async def test_compact_rejects_empty_hot_window(self) -> None:
+        with pytest.raises(ValueError):
+            await compact_session_partitions(_FakePool(), hot_months=0)
+
+
+class TestMaintenanceJob:
+    async def test_job_ensures_then_compacts(self) -> None:
+        pool = _FakePool()
+
+        result = await run_sessions_partition_maintenance(pool, {"hot_months": 3})
+
+        assert result == {"current_partition": "sessions_202610", "compacted": 3, "hot_months": 3}
+        compact_sql = pool.sql_containing("SELECT sessions_compact_partitions")
+        assert len(compact_sql) == 1
+
+    async def test_job_skips_unpartitioned_schema(self) -> None:
+        result = await run_sessions_partition_maintenance(_FakePool(migrated=False), None)
+
+        assert result["skipped"] is True
+
+    def test_job_registered_for_every_butler(self) -> None:
+        registry = get_deterministic_schedule_job_registry()
+
+        missing = [
+            name for name, jobs in registry.items() if "sessions_partition_maintenance" not in jobs
+        ]
+        assert missing == []
+
+
+class TestPartitionKeyedUpdates:
+    async def test_complete_and_fingerprint_prune_to_the_created_partition(self) -> None:
+        expected_id = uuid.uuid4()
+        pool = _FakePool(insert_results=[expected_id])
+
+        session_id = await session_create(
+            pool, prompt="p", trigger_source="tick", request_id=str(uuid.uuid4())
+        )
+        (insert_args,) = [args for sql, args in pool.calls if "INSERT INTO sessions" in sql]
+        started_at = insert_args[-1]
+        assert isinstance(started_at, datetime)
+
+        await session_complete(pool, session_id, "ok", [], 10, True)
+        await session_set_healing_fingerprint(pool, session_id, "f" * 64)
+
+        updates = [(sql, args) for sql, args in pool.calls if "UPDATE sessions" in sql]
+        assert len(updates) == 2
+        for sql, args in updates:
+            assert "AND started_at = $" in sql
+            assert args[-1] == started_at
+
+    async def test_unknown_session_falls_back_to_id_only_update(self) -> None:
+        pool = _FakePool()
+
+        await session_set_healing_fingerprint(pool, uuid.uuid4(), "f" * 64)
+
+        (sql,) = pool.sql_containing("UPDATE sessions")
+        assert "started_at" not in sql
+
+
+class TestPrunableRangePredicates:
+    async def test_optional_ranges_avoid_is_null_or(self) -> None:
+        # "$n IS NULL OR started_at >= $n" defeats partition pruning; the
+        # COALESCE form keeps a plain range on the partition key.
+        pool = _FakePool()
+
+        await top_sessions(pool, from_date="2026-10-01", to_date="2026-10-31")
+        await schedule_costs(pool)
+
+        for sql, _ in pool.calls:
+            assert "IS NULL OR" not in sql
+            assert "COALESCE($" in sql
+
+
+class TestMigrationModule:
+    def test_revision_chain_and_layout(self) -> None:
+        spec = importlib.util.spec_from_file_location("core_202", _MIGRATION_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        assert module.revision == "core_202"
+        assert module.down_revision == "core_201"
+        upgrade_sql = module._swap_sessions_sql("general", to_partitioned=True)
+        assert "PARTITION BY RANGE (started_at)" in upgrade_sql
+        assert "PRIMARY KEY (id, started_at)" in upgrade_sql
+        ensure_sql = module._ensure_partition_function("general")
+        assert "SECURITY DEFINER" in ensure_sql
+        assert "toast_tuple_target" in ensure_sql
+        assert "USING brin" in module._compact_partitions_function("general")
+
+    def test_default_partition_and_fk_replacement(self) -> None:
+        spec = importlib.util.spec_from_file_location("core_202", _MIGRATION_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        upgrade_sql = module._swap_sessions_sql("general", to_partitioned=True)
+        assert "PARTITION OF %I.sessions DEFAULT" in upgrade_sql
+        # Rows caught by the default partition move out when their month appears.
+        ensure_sql = module._ensure_partition_function("general")
+        assert "DETACH PARTITION" in ensure_sql and "ATTACH PARTITION" in ensure_sql
+        # Every dropped inbound FK gets both halves of its replacement.
+        release_sql = module._release_references_function("general")
+        check_sql = module._reference_check_function("general")
+        assert "foreign_key_violation" in release_sql and "foreign_key_violation" in check_sql
+        assert "FOR KEY SHARE" in check_sql
+        for table, constraint, column, _cascade in module._INBOUND_FKS:
+            assert f"'{constraint}'" in release_sql
+            trigger_sql = module._create_reference_trigger_sql(table, constraint, column)
+            assert f"sessions_reference_check('{column}')" in trigger_sql
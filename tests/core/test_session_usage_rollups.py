@@ -0,0 +1,245 @@
+"""Reconciliation tests for the hourly usage rollups (core_203).
+
+``session_usage_hourly`` and ``public.token_usage_hourly`` are maintained by
+row triggers on ``sessions`` and ``public.token_usage_ledger``.  These tests
+drive a mixed workload of inserts, completions, re-labels and deletes through
+the real triggers and assert that both the rollup tables and every reader
+built on them equal the raw aggregation of the source rows.
+"""
+
+from __future__ import annotations
+
+import random
+import shutil
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from butlers.core.session_partitions import ensure_session_partitions
+from butlers.core.sessions import (
+    schedule_costs,
+    session_complete,
+    session_create,
+    sessions_daily,
+    sessions_summary,
+)
+from butlers.testing.migration import create_migrated_test_pool
+
+docker_available = shutil.which("docker") is not None
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+    pytest.mark.asyncio(loop_scope="session"),
+]
+
+_RAW_SESSION_BUCKETS_SQL = """
+SELECT date_trunc('hour', started_at, 'UTC') AS bucket_start, trigger_source,
+       COALESCE(model, '') AS model, COUNT(*) AS sessions,
+       COALESCE(SUM(input_tokens), 0) AS input_tokens,
+       COALESCE(SUM(output_tokens), 0) AS output_tokens,
+       COALESCE(SUM(cached_input_tokens), 0) AS cached_input_tokens,
+       COALESCE(SUM(cache_creation_tokens), 0) AS cache_creation_tokens
+FROM sessions
+GROUP BY 1, 2, 3
+ORDER BY 1, 2, 3
+"""
+
+_ROLLUP_SESSION_BUCKETS_SQL = """
+SELECT bucket_start, trigger_source, model, sessions, input_tokens, output_tokens,
+       cached_input_tokens, cache_creation_tokens
+FROM session_usage_hourly
+WHERE sessions <> 0
+ORDER BY 1, 2, 3
+"""
+
+_RAW_LEDGER_BUCKETS_SQL = """
+SELECT date_trunc('hour', recorded_at, 'UTC') AS bucket_start, butler_name,
+       COALESCE(purpose, 'unknown') AS purpose, catalog_entry_id, COUNT(*) AS calls,
+       SUM(input_tokens) AS input_tokens, SUM(output_tokens) AS output_tokens,
+       SUM(cached_input_tokens) AS cached_input_tokens,
+       SUM(cache_creation_tokens) AS cache_creation_tokens
+FROM public.token_usage_ledger
+GROUP BY 1, 2, 3, 4
+ORDER BY 1, 2, 3, 4
+"""
+
+_ROLLUP_LEDGER_BUCKETS_SQL = """
+SELECT bucket_start, butler_name, purpose, catalog_entry_id, calls, input_tokens,
+       output_tokens, cached_input_tokens, cache_creation_tokens
+FROM public.token_usage_hourly
+WHERE calls <> 0
+ORDER BY 1, 2, 3, 4
+"""
+
+
+def _rows(records) -> list[tuple]:
+    return [tuple(int(v) if isinstance(v, int) else v for v in r.values()) for r in records]
+
+
+@pytest.fixture
+async def rollup_pool(postgres_container):
+    """Create a canonically bootstrapped core database and return its pool."""
+    p = await create_migrated_test_pool(postgres_container, chains=["core"])
+    try:
+        yield p
+    finally:
+        await p.close()
+
+
+async def _assert_session_rollup_reconciles(pool) -> None:
+    raw = _rows(await pool.fetch(_RAW_SESSION_BUCKETS_SQL))
+    rollup = _rows(await pool.fetch(_ROLLUP_SESSION_BUCKETS_SQL))
+    assert rollup == raw
+
+
+async def _seed_sessions(pool, rng: random.Random) -> list[uuid.UUID]:
+    now = datetime.now(UTC)
+    await ensure_session_partitions(pool, now - timedelta(days=40))
+    await pool.execute(
+        "INSERT INTO scheduled_tasks (name, cron, prompt) VALUES ($1, '0 3 * * *', 'p') "
+        "ON CONFLICT DO NOTHING",
+        "nightly",
+    )
+    ids: list[uuid.UUID] = []
+    for i in range(150):
+        session_id = await pool.fetchval(
+            """
+            INSERT INTO sessions (prompt, trigger_source, model, request_id, started_at)
+            VALUES ('p', $1, $2, $3, $4)
+            RETURNING id
+            """,
+            rng.choice(["tick", "route", "schedule:nightly"]),
+            rng.choice(["model-a", "model-b", None, ""]),
+            str(uuid.uuid4()),
+            now - timedelta(minutes=rng.randrange(0, 35 * 24 * 60), seconds=30),
+        )
+        ids.append(session_id)
+        if i % 4:
+            await session_complete(
+                pool,
+                session_id,
+                "done",
+                [],
+                10,
+                True,
+                input_tokens=rng.choice([None, rng.randrange(1, 5000)]),
+                output_tokens=rng.randrange(0, 800),
+                cached_input_tokens=rng.choice([None, rng.randrange(0, 9000)]),
+                cache_creation_tokens=rng.randrange(0, 300),
+            )
+    return ids
+
+
+class TestSessionUsageRollup:
+    async def test_rollup_equals_raw_after_mixed_writes(self, rollup_pool):
+        rng = random.Random(203)
+        ids = await _seed_sessions(rollup_pool, rng)
+        live = await session_create(
+            rollup_pool, prompt="p", trigger_source="tick", request_id=str(uuid.uuid4())
+        )
+        await rollup_pool.execute("UPDATE sessions SET model = 'model-c' WHERE id = $1", live)
+        await rollup_pool.execute("DELETE FROM sessions WHERE id = ANY($1::uuid[])", ids[:20])
+        await rollup_pool.execute(
+            "UPDATE sessions SET healing_fingerprint = 'fp' WHERE id = ANY($1::uuid[])", ids[20:40]
+        )
+
+        await _assert_session_rollup_reconciles(rollup_pool)
+
+    async def test_readers_equal_raw_aggregation(self, rollup_pool):
+        await _seed_sessions(rollup_pool, random.Random(7))
+
+        for period, since_sql in (
+            ("today", "date_trunc('day', now(), 'UTC')"),
+            ("7d", "now() - interval '7 days'"),
+            ("30d", "now() - interval '30 days'"),
+        ):
+            summary = await sessions_summary(rollup_pool, period)
+            raw = await rollup_pool.fetchrow(
+                f"""
+                SELECT COUNT(*) AS n, COALESCE(SUM(input_tokens), 0) AS i,
+                       COALESCE(SUM(cached_input_tokens), 0) AS c
+                FROM sessions WHERE started_at >= {since_sql}
+                """
+            )
+            # Rolling windows are cut on Python's clock; seeded rows sit 30s
+            # off any whole-minute boundary, so the drift between reads is moot.
+            assert summary["total_sessions"] == raw["n"], period
+            assert summary["total_input_tokens"] == raw["i"], period
+            assert summary["total_cached_input_tokens"] == raw["c"], period
+
+        today = datetime.now(UTC).date()
+        daily = await sessions_daily(rollup_pool, today - timedelta(days=35), today)
+        raw_days = await rollup_pool.fetch(
+            """
+            SELECT (started_at AT TIME ZONE 'UTC')::date AS day, COUNT(*) AS n,
+                   COALESCE(SUM(output_tokens), 0) AS o
+            FROM sessions GROUP BY 1 ORDER BY 1
+            """
+        )
+        assert [(d["date"], d["sessions"], d["output_tokens"]) for d in daily["days"]] == [
+            (r["day"].isoformat(), r["n"], r["o"]) for r in raw_days
+        ]
+
+        costs = await schedule_costs(rollup_pool)
+        nightly_runs = sum(r["total_runs"] for r in costs["schedules"] if r["name"] == "nightly")
+        raw_runs = await rollup_pool.fetchval(
+            "SELECT COUNT(*) FROM sessions WHERE trigger_source = 'schedule:nightly'"
+        )
+        assert nightly_runs == raw_runs
+
+    async def test_truncate_clears_rollup(self, rollup_pool):
+        await _seed_sessions(rollup_pool, random.Random(1))
+
+        await rollup_pool.execute("TRUNCATE sessions CASCADE")
+
+        assert await rollup_pool.fetchval("SELECT COUNT(*) FROM session_usage_hourly") == 0
+
+
+class TestTokenUsageRollup:
+    async def test_ledger_rollup_equals_raw(self, rollup_pool):
+        rng = random.Random(42)
+        entries = [
+            await rollup_pool.fetchval(
+                """
+                INSERT INTO public.model_catalog
+                    (alias, runtime_type, model_id, complexity_tier, enabled, priority)
+                VALUES ($1, 'claude', $2, 'workhorse', true, 0)
+                RETURNING id
+                """,
+                f"rollup-{uuid.uuid4().hex[:8]}",
+                model_id,
+            )
+            for model_id in ("rollup-a", "rollup-b")
+        ]
+        now = datetime.now(UTC)
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        for _ in range(120):
+            await rollup_pool.execute(
+                """
+                INSERT INTO public.token_usage_ledger
+                    (catalog_entry_id, butler_name, session_id, input_tokens, output_tokens,
+                     cached_input_tokens, cache_creation_tokens, purpose, recorded_at)
+                VALUES ($1, $2, NULL, $3, $4, $5, $6, $7, $8)
+                """,
+                rng.choice(entries),
+                rng.choice(["general", "health"]),
+                rng.randrange(0, 4000),
+                rng.randrange(0, 900),
+                rng.randrange(0, 9000),
+                rng.randrange(0, 200),
+                rng.choice(["route", "schedule", None]),
+                month_start + (now - month_start) * rng.random(),
+            )
+
+        assert _rows(await rollup_pool.fetch(_ROLLUP_LEDGER_BUCKETS_SQL)) == _rows(
+            await rollup_pool.fetch(_RAW_LEDGER_BUCKETS_SQL)
+        )
+
+        # Deleting a catalog entry cascades to its ledger rows, and the
+        # cascade's row triggers take them back out of the rollup.
+        await rollup_pool.execute("DELETE FROM public.model_catalog WHERE id = $1", entries[0])
+
+        assert _rows(await rollup_pool.fetch(_ROLLUP_LEDGER_BUCKETS_SQL)) == _rows(
+            await rollup_pool.fetch(_RAW_LEDGER_BUCKETS_SQL)
+        )
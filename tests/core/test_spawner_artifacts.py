@@ -0,0 +1,81 @@
+"""Tests for the Spawner's system-prompt artifact cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from butlers.core.skills import read_system_prompt
+from butlers.core.spawner_artifacts import SystemPromptArtifacts
+
+pytestmark = pytest.mark.unit
+
+
+def _age(*paths: Path) -> None:
+    """Backdate *paths* so the cache trusts their signatures."""
+    past = time.time() - 60
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+@pytest.fixture
+def roster(tmp_path: Path) -> Path:
+    config_dir = tmp_path / "mail"
+    config_dir.mkdir()
+    (tmp_path / "shared").mkdir()
+    (config_dir / "CLAUDE.md").write_text("You handle mail.\n@AGENTS.md\n")
+    (config_dir / "AGENTS.md").write_text("Agent notes v1")
+    _age(config_dir / "CLAUDE.md", config_dir / "AGENTS.md")
+    return config_dir
+
+
+def test_reuses_prompt_until_a_source_changes(roster: Path) -> None:
+    cache = SystemPromptArtifacts()
+
+    first = cache.get(roster, "mail")
+    assert first.prompt == read_system_prompt(roster, "mail")
+    assert cache.get(roster, "mail") is first
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    (roster / "AGENTS.md").write_text("Agent notes v2")
+    _age(roster / "AGENTS.md")
+
+    rebuilt = cache.get(roster, "mail")
+    assert "Agent notes v2" in rebuilt.prompt
+    assert rebuilt.digest != first.digest
+
+
+def test_new_shared_snippet_invalidates(roster: Path) -> None:
+    cache = SystemPromptArtifacts()
+    cache.get(roster, "mail")
+
+    snippet = roster.parent / "shared" / "MCP_LOGGING.md"
+    snippet.write_text("Log every tool call.")
+    _age(snippet)
+
+    assert cache.get(roster, "mail").prompt.endswith("Log every tool call.")
+
+
+def test_db_override_is_keyed_separately(roster: Path) -> None:
+    cache = SystemPromptArtifacts()
+
+    on_disk = cache.get(roster, "mail")
+    override = cache.get(roster, "mail", db_override="Dashboard prompt")
+
+    assert override.prompt.startswith("Dashboard prompt")
+    assert cache.get(roster, "mail") is on_disk
+    assert len(cache) == 2
+
+
+def test_recently_modified_sources_are_not_trusted(roster: Path) -> None:
+    cache = SystemPromptArtifacts()
+    (roster / "AGENTS.md").write_text("fresh")
+
+    first = cache.get(roster, "mail")
+
+    assert not first.settled
+    assert cache.get(roster, "mail") is not first
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,124 @@
+"""ThreadHistoryCache — coverage rules, Telegram grouping, eviction and expiry."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from butlers.core.thread_history_cache import ThreadHistoryCache
+
+pytestmark = pytest.mark.unit
+
+_T0 = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+_WINDOW = {"max_time_window_minutes": 15, "max_message_count": 3}
+
+
+def _msg(text: str, at: datetime, *, direction: str = "inbound") -> dict[str, Any]:
+    return {
+        "raw_content": text,
+        "sender_id": "user",
+        "received_at": at,
+        "raw_metadata": None,
+        "direction": direction,
+    }
+
+
+def _record(cache: ThreadHistoryCache, thread: str, text: str, at: datetime, **kw: Any) -> None:
+    cache.record(
+        source_thread_identity=thread,
+        source_channel=kw.pop("channel", "slack"),
+        received_at=at,
+        raw_content=text,
+        sender_id=kw.pop("sender", "user"),
+        **kw,
+    )
+
+
+def test_lookup_misses_until_a_db_load_extends_coverage() -> None:
+    cache = ThreadHistoryCache()
+    now = _T0 + timedelta(hours=1)
+    _record(cache, "t1", "current", now)
+
+    assert cache.lookup("t1", now, source_channel="slack", **_WINDOW) is None
+
+    loaded = [_msg("a", now - timedelta(minutes=40)), _msg("b", now - timedelta(minutes=2))]
+    cache.store("t1", now, loaded, source_channel="slack", **_WINDOW)
+
+    # Fewer rows than max_message_count: the whole thread is now known.
+    later = now + timedelta(seconds=30)
+    _record(cache, "t1", "next", later)
+    history = cache.lookup("t1", later, source_channel="slack", **_WINDOW)
+    assert [m["raw_content"] for m in history] == ["a", "b", "current"]
+
+
+def test_lookup_returns_union_of_time_and_count_windows() -> None:
+    cache = ThreadHistoryCache()
+    now = _T0 + timedelta(hours=2)
+    _record(cache, "t1", "current", now)
+    loaded = [
+        _msg("old-1", now - timedelta(minutes=90)),
+        _msg("old-2", now - timedelta(minutes=60)),
+        _msg("old-3", now - timedelta(minutes=30)),
+    ]
+    cache.store("t1", now, loaded, source_channel="slack", **_WINDOW)
+
+    later = now + timedelta(minutes=1)
+    history = cache.lookup("t1", later, source_channel="slack", **_WINDOW)
+    # Count window (last 3) reaches back past the 15-minute time window.
+    assert [m["raw_content"] for m in history] == ["old-2", "old-3", "current"]
+
+
+def test_store_without_live_entry_is_not_cached() -> None:
+    cache = ThreadHistoryCache()
+    cache.store(
+        "t1", _T0, [_msg("a", _T0 - timedelta(minutes=1))], source_channel="slack", **_WINDOW
+    )
+
+    assert len(cache) == 0
+    assert cache.lookup("t1", _T0, source_channel="slack", **_WINDOW) is None
+
+
+def test_telegram_groups_message_scoped_threads_and_outbound_replies() -> None:
+    cache = ThreadHistoryCache()
+    now = _T0
+    _record(cache, "-1001:10", "question", now, channel="telegram_bot")
+    cache.store("-1001:10", now, [], source_channel="telegram_bot", **_WINDOW)
+
+    _record(cache, "-1001:11", "reply", now + timedelta(seconds=5), direction="outbound")
+    _record(cache, "-1001:12", "other channel", now + timedelta(seconds=6), channel="slack")
+    _record(cache, "-2002:1", "other chat", now + timedelta(seconds=7), channel="telegram_bot")
+
+    history = cache.lookup(
+        "-1001:13", now + timedelta(seconds=10), source_channel="telegram_bot", **_WINDOW
+    )
+    assert [m["raw_content"] for m in history] == ["question", "reply"]
+    assert history[1]["direction"] == "outbound"
+
+
+def test_lru_eviction_and_ttl_expiry() -> None:
+    clock = [0.0]
+    cache = ThreadHistoryCache(max_threads=2, ttl_s=60.0, clock=lambda: clock[0])
+    for thread in ("t1", "t2", "t3"):
+        _record(cache, thread, "hi", _T0)
+        cache.store(thread, _T0, [], source_channel="slack", **_WINDOW)
+
+    assert len(cache) == 2
+    assert cache.lookup("t1", _T0 + timedelta(seconds=1), source_channel="slack", **_WINDOW) is None
+    assert cache.lookup("t3", _T0 + timedelta(seconds=1), source_channel="slack", **_WINDOW)
+
+    clock[0] = 61.0
+    assert cache.lookup("t3", _T0 + timedelta(seconds=1), source_channel="slack", **_WINDOW) is None
+
+
+def test_trimmed_entry_still_answers_for_new_messages() -> None:
+    cache = ThreadHistoryCache(max_messages_per_thread=30)
+    _record(cache, "t1", "m0", _T0)
+    cache.store("t1", _T0, [], source_channel="slack", **_WINDOW)
+    for i in range(1, 100):
+        _record(cache, "t1", f"m{i}", _T0 + timedelta(minutes=i))
+
+    at = _T0 + timedelta(minutes=100)
+    history = cache.lookup("t1", at, source_channel="slack", **_WINDOW)
+    assert [m["raw_content"] for m in history] == [f"m{i}" for i in range(85, 100)]
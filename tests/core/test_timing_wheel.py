@@ -0,0 +1,103 @@
+"""Tests for butlers.core.timing_wheel — hierarchical timing wheel."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from butlers.core.timing_wheel import HierarchicalTimingWheel
+
+pytestmark = pytest.mark.unit
+
+T0 = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def _at(seconds: float) -> datetime:
+    return T0 + timedelta(seconds=seconds)
+
+
+class TestHierarchicalTimingWheel:
+    def test_fires_at_due_time_not_before(self) -> None:
+        wheel: HierarchicalTimingWheel[str] = HierarchicalTimingWheel(now=T0)
+        wheel.schedule("a", _at(90))
+
+        assert wheel.advance(_at(89)) == []
+        assert wheel.advance(_at(90)) == ["a"]
+        assert len(wheel) == 0
+
+    def test_past_due_items_fire_on_next_advance(self) -> None:
+        wheel: HierarchicalTimingWheel[str] = HierarchicalTimingWheel(now=T0)
+        wheel.schedule("late", _at(-30))
+
+        assert wheel.advance(T0) == ["late"]
+
+    def test_returns_keys_in_due_order(self) -> None:
+        wheel: HierarchicalTimingWheel[str] = HierarchicalTimingWheel(now=T0)
+        wheel.schedule("c", _at(3))
+        wheel.schedule("a", _at(1))
+        wheel.schedule("b", _at(2))
+
+        assert wheel.advance(_at(10)) == ["a", "b", "c"]
+
+    def test_reschedule_moves_and_cancel_removes(self) -> None:
+        wheel: HierarchicalTimingWheel[str] = HierarchicalTimingWheel(now=T0)
+        wheel.schedule("a", _at(5))
+        wheel.schedule("a", _at(7200))
+        wheel.schedule("b", _at(5))
+
+        assert wheel.cancel("b") is True
+        assert wheel.cancel("b") is False
+        assert wheel.advance(_at(60)) == []
+        assert "a" in wheel
+        assert wheel.advance(_at(7200)) == ["a"]
+
+    def test_overflow_items_beyond_top_level(self) -> None:
+        wheel: HierarchicalTimingWheel[str] = HierarchicalTimingWheel(now=T0, level_sizes=(4, 4))
+        wheel.schedule("far", _at(100))
+
+        assert wheel.advance(_at(99)) == []
+        assert wheel.advance(_at(100)) == ["far"]
+
+    def test_long_gap_rebuild_keeps_future_items(self) -> None:
+        wheel: HierarchicalTimingWheel[str] = HierarchicalTimingWheel(now=T0)
+        wheel.schedule("soon", _at(10))
+        wheel.schedule("tomorrow", _at(86400 + 5))
+
+        # A multi-hour jump (host suspend) takes the rebuild path.
+        assert wheel.advance(_at(86400)) == ["soon"]
+        assert wheel.advance(_at(86404)) == []
+        assert wheel.advance(_at(86405)) == ["tomorrow"]
+
+    def test_rejects_invalid_layout(self) -> None:
+        with pytest.raises(ValueError):
+            HierarchicalTimingWheel(now=T0, resolution_s=0)
+        with pytest.raises(ValueError):
+            HierarchicalTimingWheel(now=T0, level_sizes=(60, 1))
+
+    def test_matches_brute_force_model(self) -> None:
+        rng = random.Random(1234)
+        wheel: HierarchicalTimingWheel[int] = HierarchicalTimingWheel(now=T0, level_sizes=(8, 8, 4))
+        model: dict[int, int] = {}
+        clock = 0
+
+        for step in range(3000):
+            op = rng.random()
+            if op < 0.45:
+                key = rng.randrange(200)
+                due = clock + rng.choice([rng.randrange(-3, 10), rng.randrange(400)])
+                wheel.schedule(key, _at(due))
+                model[key] = max(due, clock)
+            elif op < 0.55 and model:
+                key = rng.choice(list(model))
+                assert wheel.cancel(key)
+                del model[key]
+            else:
+                clock += rng.choice([1, 1, 2, 7, 33, 90])
+                fired = wheel.advance(_at(clock))
+                expected = {k for k, due in model.items() if due <= clock}
+                assert set(fired) == expected, f"step {step}"
+                for key in fired:
+                    del model[key]
+            assert len(wheel) == len(model)
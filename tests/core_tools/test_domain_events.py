@@ -113,7 +113,7 @@ def test_staffer_gets_no_domain_event_tools():
     assert registered == {}
 
 
-def test_all_five_tools_registered():
+def test_all_domain_event_tools_registered():
     registered = _register()
     assert set(registered) == {
         "publish_event",
@@ -121,6 +121,7 @@ def test_all_five_tools_registered():
         "unsubscribe_from_event",
         "list_my_subscriptions",
         "receive_domain_event",
+        "receive_domain_events",
     }
 
 
@@ -165,8 +166,37 @@ class TestSubscribeUnsubscribeList:
         assert upsert_mock.await_args.kwargs == {
             "subscriber_butler": "finance",
             "event_type": "travel.trip_booked",
+            "batch_max_events": None,
+            "batch_max_latency_ms": None,
         }
 
+    async def test_subscribe_with_batching_passes_both_settings(self, monkeypatch):
+        registered = _register(butler_name="finance")
+        upsert_mock = AsyncMock(return_value={"subscriber_butler": "finance", "active": True})
+        monkeypatch.setattr(_domain_events, "upsert_subscription", upsert_mock)
+
+        result = await registered["subscribe_to_event"](
+            event_type="finance.transaction_imported",
+            batch_max_events=50,
+            batch_max_latency_ms=2000,
+        )
+
+        assert result["status"] == "ok"
+        assert upsert_mock.await_args.kwargs["batch_max_events"] == 50
+        assert upsert_mock.await_args.kwargs["batch_max_latency_ms"] == 2000
+
+    async def test_subscribe_rejects_half_configured_batching(self, monkeypatch):
+        registered = _register(butler_name="finance")
+        upsert_mock = AsyncMock()
+        monkeypatch.setattr(_domain_events, "upsert_subscription", upsert_mock)
+
+        result = await registered["subscribe_to_event"](
+            event_type="finance.transaction_imported", batch_max_events=50
+        )
+
+        assert result["status"] == "error"
+        upsert_mock.assert_not_awaited()
+
     async def test_unsubscribe_removes(self, monkeypatch):
         registered = _register(butler_name="finance")
         remove_mock = AsyncMock(return_value=True)
@@ -187,6 +217,24 @@ class TestSubscribeUnsubscribeList:
         assert list_mock.await_args.kwargs == {"subscriber_butler": "finance"}
 
 
+class TestReceiveDomainEvents:
+    async def test_delegates_to_batch_handler(self, monkeypatch):
+        registered = _register(butler_name="general")
+        handler_mock = AsyncMock(return_value={"status": "ok", "results": []})
+        monkeypatch.setattr(_domain_events, "handle_receive_domain_events", handler_mock)
+        events = [
+            {"event_id": "e1", "event_type": "finance.x", "source_butler": "finance", "payload": {}}
+        ]
+
+        result = await registered["receive_domain_events"](events=events)
+
+        assert result == {"status": "ok", "results": []}
+        assert handler_mock.await_args.kwargs == {
+            "events": events,
+            "subscriber_butler": "general",
+        }
+
+
 class TestReceiveDomainEvent:
     async def test_delegates_to_handler(self, monkeypatch):
         registered = _register(butler_name="finance")
@@ -1076,6 +1124,267 @@ class TestFanOutEvent:
         )
 
 
+def _batch_events(n: int, event_type: str = "finance.transaction_imported") -> list[dict]:
+    return [
+        {"event_id": str(uuid.uuid4()), "event_type": event_type, "payload": {"n": i}}
+        for i in range(n)
+    ]
+
+
+def _claimed(events: list[dict], status: str = "pending") -> dict[str, dict]:
+    return {e["event_id"]: {"id": f"d-{e['event_id']}", "status": status} for e in events}
+
+
+class TestFanOutEvents:
+    async def test_batching_subscriber_gets_chunked_coalesced_dispatches(self, monkeypatch):
+        events = _batch_events(5)
+        monkeypatch.setattr(
+            _domain_events,
+            "get_active_subscriptions",
+            AsyncMock(
+                return_value=[
+                    {
+                        "event_type": "finance.transaction_imported",
+                        "subscriber_butler": "general",
+                        "batch_max_events": 3,
+                        "batch_max_latency_ms": 1000,
+                    }
+                ]
+            ),
+        )
+        claim_mock = AsyncMock(
+            side_effect=lambda _pool, **kw: _claimed(
+                [e for e in events if e["event_id"] in kw["event_ids"]]
+            )
+        )
+        monkeypatch.setattr(_domain_events, "claim_deliveries", claim_mock)
+
+        async def _dispatch(_client, _pool, _butler, *, target_butler, args, tool_name):
+            assert tool_name == "receive_domain_events"
+            return (
+                {
+                    "status": "ok",
+                    "results": [
+                        {
+                            "event_id": e["event_id"],
+                            "status": "ok",
+                            "state": "task_created",
+                            "task_id": str(uuid.uuid4()),
+                            "task_name": "batch-task",
+                        }
+                        for e in args["events"]
+                    ],
+                },
+                None,
+                False,
+            )
+
+        dispatch_mock = AsyncMock(side_effect=_dispatch)
+        monkeypatch.setattr(_domain_events, "_dispatch_receive_via_switchboard", dispatch_mock)
+        delivered_mock = AsyncMock(
+            side_effect=lambda _pool, settlements: {str(d): "delivered" for d, _, _ in settlements}
+        )
+        monkeypatch.setattr(_domain_events, "mark_deliveries_delivered", delivered_mock)
+        monkeypatch.setattr(_domain_events, "record_domain_event_batch", Mock())
+
+        result = await _domain_events.fan_out_events(
+            AsyncMock(), None, source_butler="finance", events=events
+        )
+
+        assert [len(c.kwargs["args"]["events"]) for c in dispatch_mock.await_args_list] == [3, 2]
+        assert delivered_mock.await_count == 2
+        assert [d["event_id"] for d in result["deliveries"]] == [e["event_id"] for e in events]
+        assert {d["status"] for d in result["deliveries"]} == {"delivered"}
+
+    async def test_partial_batch_failure_dead_letters_only_the_failed_members(self, monkeypatch):
+        events = _batch_events(3)
+        monkeypatch.setattr(
+            _domain_events,
+            "claim_deliveries",
+            AsyncMock(return_value=_claimed(events)),
+        )
+        results = [
+            {
+                "event_id": events[0]["event_id"],
+                "status": "ok",
+                "state": "task_created",
+                "task_id": str(uuid.uuid4()),
+                "task_name": "batch-task",
+            },
+            {
+                "event_id": events[1]["event_id"],
+                "status": "error",
+                "error": "batch payload budget exhausted",
+            },
+        ]
+        monkeypatch.setattr(
+            _domain_events,
+            "_dispatch_receive_via_switchboard",
+            AsyncMock(return_value=({"status": "ok", "results": results}, None, False)),
+        )
+        delivered_mock = AsyncMock(
+            side_effect=lambda _pool, settlements: {str(d): "delivered" for d, _, _ in settlements}
+        )
+        failed_mock = AsyncMock(
+            side_effect=lambda _pool, failures, **_kw: {str(d): "failed" for d, _, _ in failures}
+        )
+        metric_mock = Mock()
+        monkeypatch.setattr(_domain_events, "mark_deliveries_delivered", delivered_mock)
+        monkeypatch.setattr(_domain_events, "mark_deliveries_failed", failed_mock)
+        monkeypatch.setattr(_domain_events, "record_domain_event_batch", metric_mock)
+
+        outcomes = await _domain_events._dispatch_and_record_batch(
+            AsyncMock(),
+            None,
+            subscriber_butler="general",
+            source_butler="finance",
+            events=events,
+        )
+
+        assert [o["status"] for o in outcomes] == ["delivered", "failed", "failed"]
+        assert outcomes[1] == {
+            "event_id": events[1]["event_id"],
+            "subscriber_butler": "general",
+            "status": "failed",
+            "error": "batch payload budget exhausted",
+            "retryable": True,
+        }
+        failures = failed_mock.await_args.args[1]
+        assert [f[0] for f in failures] == [f"d-{e['event_id']}" for e in events[1:]]
+        assert all(retryable for _, _, retryable in failures)
+        assert metric_mock.call_args.kwargs == {
+            "source_butler": "finance",
+            "destination_butler": "general",
+            "size": 3,
+            "dead_lettered": 2,
+        }
+
+    async def test_route_failure_dead_letters_the_whole_batch_as_retryable(self, monkeypatch):
+        events = _batch_events(2)
+        monkeypatch.setattr(
+            _domain_events, "claim_deliveries", AsyncMock(return_value=_claimed(events))
+        )
+        monkeypatch.setattr(
+            _domain_events,
+            "_dispatch_receive_via_switchboard",
+            AsyncMock(
+                return_value=(None, "RuntimeError: Unknown tool: receive_domain_events", False)
+            ),
+        )
+        failed_mock = AsyncMock(return_value={})
+        monkeypatch.setattr(_domain_events, "mark_deliveries_failed", failed_mock)
+        monkeypatch.setattr(_domain_events, "record_domain_event_batch", Mock())
+
+        await _domain_events._dispatch_and_record_batch(
+            AsyncMock(),
+            None,
+            subscriber_butler="general",
+            source_butler="finance",
+            events=events,
+        )
+
+        # A subscriber without the batch tool still gets each event through the
+        # sweep's per-event retry, so the batch failure must stay retryable.
+        assert [retryable for _, _, retryable in failed_mock.await_args.args[1]] == [True, True]
+
+    async def test_terminal_claims_are_not_resent(self, monkeypatch):
+        events = _batch_events(2)
+        monkeypatch.setattr(
+            _domain_events,
+            "claim_deliveries",
+            AsyncMock(return_value=_claimed(events, status="delivered")),
+        )
+        dispatch_mock = AsyncMock()
+        monkeypatch.setattr(_domain_events, "_dispatch_receive_via_switchboard", dispatch_mock)
+
+        outcomes = await _domain_events._dispatch_and_record_batch(
+            AsyncMock(),
+            None,
+            subscriber_butler="general",
+            source_butler="finance",
+            events=events,
+        )
+
+        dispatch_mock.assert_not_awaited()
+        assert [o["status"] for o in outcomes] == ["delivered", "delivered"]
+
+
+class TestDomainEventCoalescer:
+    def _subscriptions(self, monkeypatch, rows: list[dict]) -> AsyncMock:
+        mock = AsyncMock(return_value=rows)
+        monkeypatch.setattr(_domain_events, "get_active_subscriptions", mock)
+        return mock
+
+    async def test_flushes_one_burst_within_the_subscriber_window(self, monkeypatch):
+        self._subscriptions(
+            monkeypatch,
+            [{"subscriber_butler": "general", "batch_max_events": 50, "batch_max_latency_ms": 20}],
+        )
+        record_mock = AsyncMock(
+            side_effect=lambda _pool, events: [str(uuid.uuid4()) for _ in events]
+        )
+        fan_out_mock = AsyncMock(return_value={"deliveries": []})
+        monkeypatch.setattr(_domain_events, "record_events", record_mock)
+        monkeypatch.setattr(_domain_events, "fan_out_events", fan_out_mock)
+
+        coalescer = _domain_events.DomainEventCoalescer(
+            AsyncMock(), None, source_butler="finance", max_latency_s=5.0
+        )
+        for i in range(10):
+            await coalescer.publish("finance.transaction_imported", {"n": i})
+        assert coalescer.buffered == 10
+        record_mock.assert_not_awaited()
+
+        async with asyncio.timeout(1):
+            while coalescer.buffered:
+                await asyncio.sleep(0.005)
+            while not fan_out_mock.await_count:
+                await asyncio.sleep(0.005)
+
+        record_mock.assert_awaited_once()
+        assert len(record_mock.await_args.args[1]) == 10
+        assert len(fan_out_mock.await_args.kwargs["events"]) == 10
+
+    async def test_per_event_subscriber_is_never_held(self, monkeypatch):
+        self._subscriptions(
+            monkeypatch,
+            [
+                {
+                    "subscriber_butler": "general",
+                    "batch_max_events": None,
+                    "batch_max_latency_ms": None,
+                }
+            ],
+        )
+        record_mock = AsyncMock(return_value=["event-1"])
+        monkeypatch.setattr(_domain_events, "record_events", record_mock)
+        monkeypatch.setattr(
+            _domain_events, "fan_out_events", AsyncMock(return_value={"deliveries": []})
+        )
+
+        coalescer = _domain_events.DomainEventCoalescer(AsyncMock(), None, source_butler="finance")
+        await coalescer.publish("finance.transaction_imported", {"n": 1})
+
+        assert coalescer.buffered == 0
+        record_mock.assert_awaited_once()
+
+    async def test_failed_record_keeps_the_burst_buffered(self, monkeypatch):
+        self._subscriptions(monkeypatch, [])
+        monkeypatch.setattr(
+            _domain_events, "record_events", AsyncMock(side_effect=ConnectionError("db down"))
+        )
+
+        coalescer = _domain_events.DomainEventCoalescer(
+            AsyncMock(), None, source_butler="finance", max_latency_s=60
+        )
+        await coalescer.publish("finance.transaction_imported", {"n": 1})
+        await coalescer.publish("finance.transaction_imported", {"n": 2})
+        with pytest.raises(ConnectionError):
+            await coalescer.aclose()
+
+        assert coalescer.buffered == 2
+
+
 class TestIsRetryableRouteErrorText:
     """route()'s except-block stamps every failure as f"{type(exc).__name__}:
     {exc}" -- these prefixes are the transient ones; everything else
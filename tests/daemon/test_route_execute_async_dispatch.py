@@ -478,6 +478,95 @@ async def test_dashboard_processing_recovery_never_replays_a_predecessor(
     processed.assert_not_awaited()
 
 
+@pytest.mark.parametrize(
+    ("outcome", "error"),
+    [
+        ("finished", None),
+        (
+            "ambiguous",
+            "Dashboard recovery could not prove the prior runtime stopped; "
+            "automatic replay was suppressed (ambiguous).",
+        ),
+    ],
+)
+async def test_reclaimed_dashboard_turns_settle_through_the_batch_drain(
+    outcome: str, error: str | None
+) -> None:
+    """Reclaimed dashboard rows settle in batches ahead of the per-row replay sweep."""
+    from types import SimpleNamespace
+
+    from butlers.core.route_inbox import RouteInboxClaim, RouteInboxDrainStats
+    from butlers.switchboard_wiring import recover_route_inbox
+
+    pool = AsyncMock()
+    message_id = uuid.uuid4()
+    trigger = _make_trigger_mock()
+    daemon = SimpleNamespace(
+        config=SimpleNamespace(name="health"),
+        spawner=SimpleNamespace(trigger=trigger),
+    )
+    claim = RouteInboxClaim(
+        id=uuid.uuid4(),
+        received_at=None,
+        route_envelope={
+            "schema_version": "route.v1",
+            "request_context": _route_request_context(source_channel="dashboard"),
+            "input": {"prompt": "Record this fact."},
+            "source_metadata": {
+                "channel": "dashboard",
+                "identity": "dashboard:owner",
+                "tool_name": "ingest",
+                "dashboard_message_id": str(message_id),
+            },
+        },
+        processing_claim_id=uuid.uuid4(),
+        recovery_from_processing=True,
+    )
+    request_id = uuid.UUID(_route_request_context(source_channel="dashboard")["request_id"])
+    outcomes: list[str | None] = []
+
+    async def _drain_once(_pool, process_fn, **kwargs):
+        assert kwargs["include_accepted"] is False
+        assert "dashboard_message_id" in kwargs["envelope_match"]
+        try:
+            await process_fn(claim)
+        except Exception as exc:
+            outcomes.append(str(exc))
+        else:
+            outcomes.append(None)
+        return RouteInboxDrainStats(batches=1)
+
+    with (
+        patch("butlers.switchboard_wiring.route_inbox_drain", _drain_once),
+        patch(
+            "butlers.switchboard_wiring.route_inbox_recovery_sweep",
+            new_callable=AsyncMock,
+            return_value=0,
+        ) as sweep,
+        patch(
+            "butlers.switchboard_wiring.reconcile_route_recovery",
+            new_callable=AsyncMock,
+            return_value=_dashboard_turn_result(
+                outcome,
+                message_id=message_id,
+                request_id=request_id,
+                inbox_id=claim.id,
+            ),
+        ) as reconcile,
+    ):
+        await recover_route_inbox(daemon, pool)
+
+    reconcile.assert_awaited_once_with(
+        pool,
+        message_id=message_id,
+        request_id=request_id,
+        route_inbox_id=claim.id,
+    )
+    assert outcomes == [error]
+    sweep.assert_awaited_once()
+    trigger.assert_not_awaited()
+
+
 async def test_dashboard_accepted_recovery_replays_before_runtime_handoff() -> None:
     """A dashboard row accepted before dispatch may safely resume its original runtime."""
     from types import SimpleNamespace
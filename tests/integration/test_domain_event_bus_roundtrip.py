@@ -22,6 +22,9 @@ for those):
 - Reconciliation-sweep mutual exclusion: overlapping sweep invocations do
   not double-progress one retryable delivery toward its terminal attempt
   limit.
+- Coalesced fan-out (core_207): a batching subscriber receives a burst as
+  one wake task, and a member with a conflicting per-event task is split
+  out of the batch without failing the rest.
 """
 
 from __future__ import annotations
@@ -36,7 +39,11 @@ from typing import Any
 import asyncpg
 import pytest
 
-from butlers.core.domain_event_wake import handle_receive_domain_event, task_name_for
+from butlers.core.domain_event_wake import (
+    handle_receive_domain_event,
+    handle_receive_domain_events,
+    task_name_for,
+)
 from butlers.core.domain_events import (
     claim_delivery,
     get_active_subscribers,
@@ -49,6 +56,7 @@ from butlers.core.domain_events import (
 from butlers.core_tools._domain_events import (
     fan_out_event,
     publish_domain_event,
+    publish_domain_events,
     run_domain_event_reconciliation_sweep,
 )
 from butlers.db import register_jsonb_codec
@@ -112,6 +120,25 @@ class _ReceivingClient:
         return SimpleNamespace(is_error=False, data={"result": result})
 
 
+class _BatchReceivingClient:
+    """Route ``receive_domain_events`` calls into the real batch handler."""
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        self._pool = pool
+        self.batch_sizes: list[int] = []
+
+    async def call_tool(self, tool_name: str, args: dict[str, Any]) -> Any:
+        from types import SimpleNamespace
+
+        assert tool_name == "route"
+        assert args["tool_name"] == "receive_domain_events"
+        self.batch_sizes.append(len(args["args"]["events"]))
+        result = await handle_receive_domain_events(
+            self._pool, events=args["args"]["events"], subscriber_butler=args["target_butler"]
+        )
+        return SimpleNamespace(is_error=False, data={"result": result})
+
+
 class _IncompleteSuccessClient:
     """Simulate a target tool that claims success without delivery provenance."""
 
@@ -1439,3 +1466,80 @@ async def test_list_recent_deliveries_orders_most_recent_first(pool: asyncpg.Poo
     event_ids = [row["event_id"] for row in rows[:2]]
     assert str(event_ids[0]) == second["event_id"]
     assert str(event_ids[1]) == first["event_id"]
+
+
+# ---------------------------------------------------------------------------
+# Coalesced fan-out (core_207)
+# ---------------------------------------------------------------------------
+
+
+async def test_batching_subscriber_receives_a_burst_as_one_wake(pool: asyncpg.Pool) -> None:
+    event_type = f"finance.import_{uuid.uuid4().hex[:8]}"
+    await upsert_subscription(
+        pool,
+        subscriber_butler="general",
+        event_type=event_type,
+        batch_max_events=10,
+        batch_max_latency_ms=500,
+    )
+    client = _BatchReceivingClient(pool)
+
+    result = await publish_domain_events(
+        pool,
+        client,
+        source_butler="finance",
+        events=[{"event_type": event_type, "payload": {"n": n}} for n in range(12)],
+    )
+
+    assert result["status"] == "ok"
+    assert client.batch_sizes == [10, 2]
+    assert {d["status"] for d in result["deliveries"]} == {"delivered"}
+    rows = await pool.fetch(
+        "SELECT task_name, batch_id FROM public.domain_event_deliveries WHERE event_id = ANY($1)",
+        [uuid.UUID(event_id) for event_id in result["event_ids"]],
+    )
+    assert len(rows) == 12
+    assert len({row["task_name"] for row in rows}) == 2
+    assert len({row["batch_id"] for row in rows}) == 2
+    payloads = await pool.fetch(
+        "SELECT payload FROM public.domain_events WHERE id = ANY($1)",
+        [uuid.UUID(event_id) for event_id in result["event_ids"]],
+    )
+    assert sorted(row["payload"]["n"] for row in payloads) == list(range(12))
+
+
+async def test_batch_member_with_conflicting_task_is_split_out(pool: asyncpg.Pool) -> None:
+    event_type = f"finance.import_{uuid.uuid4().hex[:8]}"
+    await upsert_subscription(
+        pool,
+        subscriber_butler="general",
+        event_type=event_type,
+        batch_max_events=10,
+        batch_max_latency_ms=500,
+    )
+    event_ids = [str(uuid.uuid4()) for _ in range(3)]
+    await pool.execute(
+        """
+        INSERT INTO scheduled_tasks (name, cron, dispatch_mode, prompt, source, enabled)
+        VALUES ($1, '* * * * *', 'prompt', 'an unrelated hand-crafted task', 'db', true)
+        """,
+        task_name_for(event_ids[1], "general"),
+    )
+
+    result = await handle_receive_domain_events(
+        pool,
+        events=[
+            {
+                "event_id": event_id,
+                "event_type": event_type,
+                "source_butler": "finance",
+                "payload": {},
+            }
+            for event_id in event_ids
+        ],
+        subscriber_butler="general",
+    )
+
+    states = [r["state"] for r in result["results"]]
+    assert states == ["task_created", "task_conflict", "task_created"]
+    assert result["results"][0]["task_id"] == result["results"][2]["task_id"]
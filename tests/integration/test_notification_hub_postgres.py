@@ -0,0 +1,120 @@
+"""NotificationHub against a real Postgres: one connection, many subscribers.
+
+Starts a hub on a testcontainer database, subscribes ``_SUBSCRIBERS``
+consumers spread over three channels, publishes with ``pg_notify`` from a
+separate connection, and asserts that:
+
+- every subscriber of a channel receives every notification, in order;
+- exactly one backend of the database is LISTENing on behalf of all of them
+  (``application_name`` tags the hub connection);
+- a backend terminated under the hub is replaced by a single new connection
+  that LISTENs every channel again, and subscribers read a disconnected gap
+  before the notifications sent after the reconnect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import shutil
+
+import asyncpg
+import pytest
+
+from butlers.notification_hub import Notification, NotificationGap, NotificationHub
+
+docker_available = shutil.which("docker") is not None
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.skipif(not docker_available, reason="Docker not available"),
+]
+
+_APP_NAME = "notification-hub-test"
+_CHANNELS = ("hub_test_a", "hub_test_b", "hub_test_c")
+_SUBSCRIBERS = 30
+_MESSAGES = 25
+
+
+@pytest.fixture
+def conn_kwargs(postgres_container) -> dict:
+    return {
+        "host": postgres_container.get_container_host_ip(),
+        "port": int(postgres_container.get_exposed_port(5432)),
+        "user": postgres_container.username,
+        "password": postgres_container.password,
+        "database": postgres_container.dbname,
+    }
+
+
+async def _wait_until(predicate, *, timeout_s: float = 10.0) -> None:
+    async with asyncio.timeout(timeout_s):
+        while not predicate():
+            await asyncio.sleep(0.02)
+
+
+async def _hub_backends(publisher: asyncpg.Connection) -> list[int]:
+    rows = await publisher.fetch(
+        "SELECT pid FROM pg_stat_activity"
+        " WHERE datname = current_database() AND application_name = $1",
+        _APP_NAME,
+    )
+    return [row["pid"] for row in rows]
+
+
+async def _drain(sub, count: int) -> list:
+    async with asyncio.timeout(10):
+        return [await sub.get() for _ in range(count)]
+
+
+async def test_one_connection_serves_every_subscriber(conn_kwargs) -> None:
+    connects = 0
+
+    async def _connect() -> asyncpg.Connection:
+        nonlocal connects
+        connects += 1
+        return await asyncpg.connect(**conn_kwargs, server_settings={"application_name": _APP_NAME})
+
+    hub = NotificationHub(_connect, reconnect_backoff_s=0.05, health_poll_interval_s=0.05)
+    subs = [await hub.subscribe(_CHANNELS[i % len(_CHANNELS)]) for i in range(_SUBSCRIBERS)]
+    hub_task = asyncio.create_task(hub.run())
+    publisher = await asyncpg.connect(**conn_kwargs)
+    try:
+        await _wait_until(lambda: hub.connected)
+        for sub in subs:
+            assert await sub.get() == NotificationGap(sub.channel, "disconnected", 0)
+
+        for n in range(_MESSAGES):
+            for channel in _CHANNELS:
+                await publisher.execute("SELECT pg_notify($1, $2)", channel, f"{channel}:{n}")
+
+        for sub in subs:
+            items = await _drain(sub, _MESSAGES)
+            assert [item.payload for item in items] == [
+                f"{sub.channel}:{n}" for n in range(_MESSAGES)
+            ]
+        assert connects == 1
+        assert len(await _hub_backends(publisher)) == 1
+        stats = hub.stats()["channels"]
+        assert sum(channel["subscribers"] for channel in stats.values()) == _SUBSCRIBERS
+        assert all(channel["dropped"] == 0 for channel in stats.values())
+
+        # Kill the hub's backend: the hub reconnects once and re-LISTENs.
+        [pid] = await _hub_backends(publisher)
+        await publisher.execute("SELECT pg_terminate_backend($1)", pid)
+        await _wait_until(lambda: connects == 2 and hub.connected)
+        for channel in _CHANNELS:
+            await publisher.execute("SELECT pg_notify($1, 'after')", channel)
+
+        publisher_pid = publisher.get_server_pid()
+        for sub in subs:
+            assert await _drain(sub, 2) == [
+                NotificationGap(sub.channel, "disconnected", 0),
+                Notification(sub.channel, "after", publisher_pid),
+            ]
+        assert len(await _hub_backends(publisher)) == 1
+    finally:
+        await publisher.close()
+        hub_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await hub_task
@@ -6,15 +6,19 @@ and _get_butler_typed_specialist_butlers. No real database required.
 
 from __future__ import annotations
 
+import asyncio
 import json
-from datetime import date
+import time
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import asyncpg
 import pytest
 
 from butlers.config import ButlerConfig, ButlerType
 from butlers.jobs.briefing import (
+    CONTRIBUTOR_CACHE_KEY,
     SPECIALIST_BUTLERS,
     _get_butler_typed_specialist_butlers,
     collect_briefing_contributions,
@@ -82,6 +86,34 @@ def _make_view_row(butler: str, contribution: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _make_view_pool(
+    rows: list[dict[str, Any]],
+    *,
+    latency_s: dict[str, float] | None = None,
+    cache: dict[str, Any] | None = None,
+) -> MagicMock:
+    """Pool whose per-contributor view reads return that butler's rows after a delay.
+
+    ``pool.in_flight["peak"]`` records how many reads were outstanding at once.
+    """
+    pool = _make_pool()
+    in_flight = {"now": 0, "peak": 0}
+
+    async def _fetch(_sql: str, butler: str, key: str) -> list[dict[str, Any]]:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            await asyncio.sleep((latency_s or {}).get(butler, 0.0))
+        finally:
+            in_flight["now"] -= 1
+        return [r for r in rows if r["butler"] == butler and r["key"] == key]
+
+    pool.fetch = AsyncMock(side_effect=_fetch)
+    pool.fetchval = AsyncMock(return_value=cache)
+    pool.in_flight = in_flight
+    return pool
+
+
 def _make_mock_config(name: str, agent_type: ButlerType) -> MagicMock:
     cfg = MagicMock(spec=ButlerConfig)
     cfg.name = name
@@ -189,7 +221,7 @@ async def test_collect_briefing_contributions_counts():
     rows = [
         _make_view_row(b, _make_contribution(butler=b, date=date_str)) for b in SPECIALIST_BUTLERS
     ]
-    pool = _make_pool(fetch_rows=rows)
+    pool = _make_view_pool(rows)
     with (
         patch("butlers.jobs.briefing.today_sgt", return_value=_DATE_2026_03_25),
         patch("butlers.jobs.briefing.state_set", new_callable=AsyncMock, return_value=1),
@@ -202,7 +234,7 @@ async def test_collect_briefing_contributions_counts():
     present = ["health", "finance", "relationship"]
     missing = sorted(set(SPECIALIST_BUTLERS) - set(present))
     rows2 = [_make_view_row(b, _make_contribution(butler=b, date=date_str)) for b in present]
-    pool2 = _make_pool(fetch_rows=rows2)
+    pool2 = _make_view_pool(rows2)
     with (
         patch("butlers.jobs.briefing.today_sgt", return_value=_DATE_2026_03_25),
         patch("butlers.jobs.briefing.state_set", new_callable=AsyncMock, return_value=1),
@@ -224,7 +256,7 @@ async def test_collect_briefing_contributions_malformed_skipped():
         },
         _make_view_row("education", _make_contribution(butler="education", date=date_str)),
     ]
-    pool = _make_pool(fetch_rows=rows)
+    pool = _make_view_pool(rows)
     with (
         patch("butlers.jobs.briefing.today_sgt", return_value=_DATE_2026_03_25),
         patch("butlers.jobs.briefing.state_set", new_callable=AsyncMock, return_value=1),
@@ -244,6 +276,140 @@ async def test_collect_briefing_contributions_db_error_propagates():
             await collect_briefing_contributions(pool, None)
 
 
+# ---------------------------------------------------------------------------
+# collect_briefing_contributions — concurrent, deadline-bounded collection
+# ---------------------------------------------------------------------------
+
+_MIXED_LATENCY_S = {
+    "education": 0.05,
+    "finance": 0.10,
+    "health": 0.20,
+    "home": 0.15,
+    "lifestyle": 0.30,
+    "relationship": 0.02,
+    "travel": 0.25,
+}
+# Latency of a contributor that never answers in time.  Deadline tests only
+# assert wall-clock well below it, so a loaded runner cannot make them flake.
+_STALLED_S = 10.0
+
+
+def _all_view_rows(date_str: str = _DATE_STR_2026_03_25) -> list[dict[str, Any]]:
+    return [
+        _make_view_row(b, _make_contribution(butler=b, date=date_str)) for b in SPECIALIST_BUTLERS
+    ]
+
+
+async def _collect(pool: MagicMock, job_args: dict[str, Any] | None) -> tuple[dict, AsyncMock]:
+    state_set = AsyncMock(return_value=1)
+    with (
+        patch("butlers.jobs.briefing.today_sgt", return_value=_DATE_2026_03_25),
+        patch("butlers.jobs.briefing.state_set", state_set),
+        patch(
+            "butlers.jobs.briefing._get_butler_typed_specialist_butlers",
+            return_value=frozenset(SPECIALIST_BUTLERS),
+        ),
+    ):
+        result = await collect_briefing_contributions(pool, job_args)
+    return result, state_set
+
+
+def _written(state_set: AsyncMock, key: str) -> Any:
+    return next(c.args[2] for c in state_set.await_args_list if c.args[1] == key)
+
+
+async def test_collect_briefing_contributions_reads_contributors_concurrently():
+    """Every contributor read is in flight at once, so none waits behind another."""
+    pool = _make_view_pool(_all_view_rows(), latency_s=_MIXED_LATENCY_S)
+
+    result, state_set = await _collect(pool, {"contributor_timeout_s": 5.0, "budget_s": 10.0})
+
+    assert pool.in_flight["peak"] == len(SPECIALIST_BUTLERS)
+    assert result["contributions_count"] == len(SPECIALIST_BUTLERS)
+    assert result["stale_count"] == 0
+    payload = _written(state_set, combined_key(_DATE_STR_2026_03_25))
+    assert {b: s["status"] for b, s in payload["contributors"].items()} == dict.fromkeys(
+        SPECIALIST_BUTLERS, "fresh"
+    )
+    contributors = payload["contributors"]
+    assert contributors["lifestyle"]["elapsed_ms"] >= contributors["relationship"]["elapsed_ms"]
+    # Today's fresh contributions refresh the cache for later fallbacks.
+    cache = _written(state_set, CONTRIBUTOR_CACHE_KEY)
+    assert sorted(cache) == sorted(SPECIALIST_BUTLERS)
+
+
+async def test_collect_briefing_contributions_serves_cached_contribution_past_deadline():
+    """A contributor past its deadline is served stale from cache; a stale-expired one is missing."""
+    yesterday = "2026-03-24"
+    now = datetime.now(tz=UTC)
+    cache = {
+        "travel": {
+            "contribution": _make_contribution(butler="travel", date=yesterday),
+            "collected_at": (now - timedelta(hours=20)).isoformat(),
+        },
+        "home": {
+            "contribution": _make_contribution(butler="home", date="2026-03-20"),
+            "collected_at": (now - timedelta(days=5)).isoformat(),
+        },
+    }
+    latency = dict(_MIXED_LATENCY_S, travel=_STALLED_S, home=_STALLED_S)
+    pool = _make_view_pool(_all_view_rows(), latency_s=latency, cache=cache)
+
+    started = time.monotonic()
+    result, state_set = await _collect(pool, {"contributor_timeout_s": 0.4, "budget_s": 5.0})
+    elapsed = time.monotonic() - started
+
+    # Bounded by the per-contributor deadline, not by the stalled reads.
+    assert elapsed < _STALLED_S / 2
+    assert result["stale_butlers"] == ["travel"]
+    assert result["missing_butlers"] == ["home"]
+    assert result["contributions_count"] == len(SPECIALIST_BUTLERS) - 1
+    payload = _written(state_set, combined_key(_DATE_STR_2026_03_25))
+    travel = next(c for c in payload["contributions"] if c["butler"] == "travel")
+    assert travel["date"] == yesterday
+    assert payload["contributors"]["travel"]["status"] == "stale"
+    assert payload["contributors"]["travel"]["stale_from"] == cache["travel"]["collected_at"]
+    assert payload["contributors"]["home"]["status"] == "timeout"
+    # The late contributor's cache entry is kept, not overwritten.
+    assert _written(state_set, CONTRIBUTOR_CACHE_KEY)["travel"] == cache["travel"]
+
+
+async def test_collect_briefing_contributions_global_budget_cancels_pending_reads():
+    """Reads still running when the budget runs out are cancelled and reported as timeouts."""
+    latency = dict(_MIXED_LATENCY_S, finance=_STALLED_S)
+    pool = _make_view_pool(_all_view_rows(), latency_s=latency)
+
+    started = time.monotonic()
+    result, state_set = await _collect(pool, {"contributor_timeout_s": 30.0, "budget_s": 0.5})
+    elapsed = time.monotonic() - started
+
+    # Bounded by the global budget, not by the stalled read.
+    assert elapsed < _STALLED_S / 2
+    assert result["missing_butlers"] == ["finance"]
+    payload = _written(state_set, combined_key(_DATE_STR_2026_03_25))
+    assert payload["contributors"]["finance"]["status"] == "timeout"
+    assert payload["collection_ms"] >= 500
+
+
+async def test_collect_briefing_contributions_partial_read_error_is_not_fatal():
+    """One contributor's read error only marks that contributor; the digest is still written."""
+    rows = _all_view_rows()
+    view_pool = _make_view_pool(rows)
+    read = view_pool.fetch.side_effect
+
+    async def _fetch(sql: str, butler: str, key: str) -> list[dict[str, Any]]:
+        if butler == "health":
+            raise asyncpg.InsufficientPrivilegeError("permission denied for schema health")
+        return await read(sql, butler, key)
+
+    view_pool.fetch = AsyncMock(side_effect=_fetch)
+    result, state_set = await _collect(view_pool, None)
+
+    assert result["missing_butlers"] == ["health"]
+    payload = _written(state_set, combined_key(_DATE_STR_2026_03_25))
+    assert payload["contributors"]["health"]["status"] == "error"
+
+
 async def test_run_finance_briefing_contribution_avoids_ambiguous_bound_datetime_subtraction():
     """Anomaly SQL must not rely on `$2 - $1`, which triggers asyncpg operator ambiguity."""
 
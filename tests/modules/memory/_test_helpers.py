@@ -1,8 +1,18 @@
 """Test helpers for memory module tests."""
 
+import json
+import logging
+import math
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
+from asyncpg import Pool
+
+from butlers.modules.memory.storage import _cascade_catalog_disownment
+
+logger = logging.getLogger(__name__)
+
 # Base path to memory module source files
 MEMORY_MODULE_PATH = (
     Path(__file__).resolve().parent.parent.parent.parent / "src" / "butlers" / "modules" / "memory"
@@ -38,3 +48,209 @@ def make_embedding_engine_mock(model_name: str = "all-MiniLM-L6-v2") -> MagicMoc
     engine.embed.return_value = [0.0] * 384
     engine.embed_batch.side_effect = lambda texts: [[0.0] * 384 for _ in texts]
     return engine
+
+
+async def rowwise_decay_sweep(pool: Pool, *, now: datetime) -> dict:
+    """Row-at-a-time decay sweep — the implementation ``run_decay_sweep`` replaced.
+
+    Kept verbatim (apart from the injectable *now*) as the reference oracle for
+    the set-based sweep's equivalence test and benchmark; not production code.
+    """
+    # Hardcoded fallback defaults (used when policy is missing for a class)
+    _DEFAULT_FADING_THRESHOLD = 0.2
+    _DEFAULT_EXPIRY_THRESHOLD = 0.05
+
+    stats = {
+        "facts_checked": 0,
+        "rules_checked": 0,
+        "facts_fading": 0,
+        "rules_fading": 0,
+        "facts_expired": 0,
+        "rules_expired": 0,
+    }
+
+    async with pool.acquire() as conn:
+        # Load all retention policies upfront to avoid per-row queries
+        policy_rows = await conn.fetch(
+            "SELECT retention_class, min_retrieval_confidence, archive_before_delete "
+            "FROM memory_policies"
+        )
+        policies: dict[str, dict] = {}
+        for row in policy_rows:
+            rc = row["retention_class"]
+            policies[rc] = {
+                "min_conf": row["min_retrieval_confidence"],
+                "archive_before_delete": row["archive_before_delete"],
+            }
+
+        def _get_thresholds(retention_class: str | None) -> tuple[float, float, bool]:
+            """Return (fading_threshold, expiry_threshold, archive_before_delete)."""
+            rc = retention_class or ""
+            if rc in policies:
+                min_conf = policies[rc]["min_conf"]
+                return min_conf, min_conf * 0.25, policies[rc]["archive_before_delete"]
+            logger.warning(
+                "rowwise_decay_sweep: retention_class %r not found in memory_policies; "
+                "using hardcoded defaults (fading=%.2f, expiry=%.2f)",
+                rc,
+                _DEFAULT_FADING_THRESHOLD,
+                _DEFAULT_EXPIRY_THRESHOLD,
+            )
+            return _DEFAULT_FADING_THRESHOLD, _DEFAULT_EXPIRY_THRESHOLD, False
+
+        # ----- Process facts -----
+        # validity IN ('active', 'fading') so already-fading facts are
+        # re-evaluated each run (able to recover to 'active' or progress to
+        # 'expired') instead of getting stuck the moment they first fade.
+        facts = await conn.fetch(
+            "SELECT id, confidence, decay_rate, last_confirmed_at, created_at, "
+            "metadata, retention_class, validity "
+            "FROM facts WHERE validity IN ('active', 'fading') AND decay_rate > 0.0"
+        )
+
+        for fact in facts:
+            stats["facts_checked"] += 1
+            anchor = fact["last_confirmed_at"] or fact["created_at"]
+            days = (now - anchor).total_seconds() / 86400.0
+            eff = fact["confidence"] * math.exp(-fact["decay_rate"] * days)
+
+            metadata = fact["metadata"]
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+
+            fading_thresh, expiry_thresh, archive_first = _get_thresholds(
+                fact.get("retention_class")
+            )
+
+            if eff < expiry_thresh:
+                # Legacy metadata.status bookkeeping is superseded by the
+                # validity column — drop the stale key as part of the transition.
+                metadata.pop("status", None)
+                if archive_first:
+                    try:
+                        metadata["archived_at"] = now.isoformat()
+                        metadata["archived_content"] = True
+                        async with conn.transaction():
+                            await conn.execute(
+                                "UPDATE facts SET validity = 'expired', metadata = $1 "
+                                "WHERE id = $2",
+                                metadata,
+                                fact["id"],
+                            )
+                            # Same transaction as the expiry write — a crash here
+                            # must never leave the catalog serving an expired fact.
+                            await _cascade_catalog_disownment(
+                                conn, "facts", [fact["id"]], invalid_at=now
+                            )
+                    except Exception:
+                        logger.error(
+                            "rowwise_decay_sweep: archival (or its catalog disownment "
+                            "cascade) failed for fact %s; skipping expiry "
+                            "(fail-closed for archive_before_delete class)",
+                            fact["id"],
+                        )
+                        continue
+                else:
+                    try:
+                        async with conn.transaction():
+                            await conn.execute(
+                                "UPDATE facts SET validity = 'expired', metadata = $1 "
+                                "WHERE id = $2",
+                                metadata,
+                                fact["id"],
+                            )
+                            await _cascade_catalog_disownment(
+                                conn, "facts", [fact["id"]], invalid_at=now
+                            )
+                    except Exception:
+                        logger.error(
+                            "rowwise_decay_sweep: expiry (or its catalog disownment "
+                            "cascade) failed for fact %s; skipping this fact so "
+                            "the rest of the sweep still runs",
+                            fact["id"],
+                            exc_info=True,
+                        )
+                        continue
+                stats["facts_expired"] += 1
+            elif eff < fading_thresh:
+                had_stale_status = metadata.pop("status", None) is not None
+                if fact["validity"] != "fading" or had_stale_status:
+                    await conn.execute(
+                        "UPDATE facts SET validity = 'fading', metadata = $1 WHERE id = $2",
+                        metadata,
+                        fact["id"],
+                    )
+                stats["facts_fading"] += 1
+            else:
+                had_stale_status = metadata.pop("status", None) is not None
+                if fact["validity"] != "active" or had_stale_status:
+                    await conn.execute(
+                        "UPDATE facts SET validity = 'active', metadata = $1 WHERE id = $2",
+                        metadata,
+                        fact["id"],
+                    )
+
+        # ----- Process rules -----
+        rules = await conn.fetch(
+            "SELECT id, confidence, decay_rate, last_confirmed_at, created_at, "
+            "metadata, retention_class "
+            "FROM rules WHERE maturity != 'anti_pattern' AND decay_rate > 0.0 "
+            "AND (metadata->>'forgotten')::boolean IS NOT TRUE"
+        )
+
+        for rule in rules:
+            stats["rules_checked"] += 1
+            anchor = rule["last_confirmed_at"] or rule["created_at"]
+            days = (now - anchor).total_seconds() / 86400.0
+            eff = rule["confidence"] * math.exp(-rule["decay_rate"] * days)
+
+            metadata = rule["metadata"]
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+
+            fading_thresh, expiry_thresh, _archive_first = _get_thresholds(
+                rule.get("retention_class")
+            )
+
+            if eff < expiry_thresh:
+                metadata["forgotten"] = True
+                try:
+                    async with conn.transaction():
+                        await conn.execute(
+                            "UPDATE rules SET metadata = $1 WHERE id = $2",
+                            metadata,
+                            rule["id"],
+                        )
+                        # Same transaction as the forgotten-flag write — see the
+                        # matching fact-expiry cascade above.
+                        await _cascade_catalog_disownment(
+                            conn, "rules", [rule["id"]], invalid_at=now
+                        )
+                except Exception:
+                    logger.error(
+                        "rowwise_decay_sweep: expiry (or its catalog disownment "
+                        "cascade) failed for rule %s; skipping this rule so "
+                        "the rest of the sweep still runs",
+                        rule["id"],
+                        exc_info=True,
+                    )
+                    continue
+                stats["rules_expired"] += 1
+            elif eff < fading_thresh:
+                metadata["status"] = "fading"
+                await conn.execute(
+                    "UPDATE rules SET metadata = $1 WHERE id = $2",
+                    metadata,
+                    rule["id"],
+                )
+                stats["rules_fading"] += 1
+            else:
+                if metadata.get("status") == "fading":
+                    del metadata["status"]
+                    await conn.execute(
+                        "UPDATE rules SET metadata = $1 WHERE id = $2",
+                        metadata,
+                        rule["id"],
+                    )
+
+    return stats
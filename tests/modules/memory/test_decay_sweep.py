@@ -0,0 +1,150 @@
+"""Equivalence of the set-based ``run_decay_sweep`` with the row-at-a-time sweep.
+
+Seeds two identical migrated databases with a deterministic mix of facts and
+rules — every retention class plus one unknown to ``memory_policies``, healthy
+/ fading / expiring confidence, already-fading rows that recover or progress,
+legacy ``metadata.status`` keys, anti-pattern and forgotten rules, permanent
+(``decay_rate = 0``) rows — then runs the reference
+``rowwise_decay_sweep`` on one and ``run_decay_sweep`` (with a small
+``chunk_size`` so many primary-key ranges are crossed) on the other against
+the same ``now``, and asserts the resulting rows and the shared stats match.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import shutil
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import asyncpg
+import pytest
+
+from butlers.db import register_jsonb_codec
+from butlers.modules.memory.storage import run_decay_sweep
+from butlers.testing.migration import create_migrated_test_db, migration_db_name
+from tests.modules.memory._test_helpers import rowwise_decay_sweep
+
+docker_available = shutil.which("docker") is not None
+
+_NOW = datetime(2026, 10, 19, 3, 15, tzinfo=UTC)
+_FACTS = 2_000
+_RULES = 500
+_CHUNK = 97
+_CLASSES = (
+    "transient",
+    "episodic",
+    "operational",
+    "health_log",
+    "financial_log",
+    "rule",
+    "not_a_policy_class",
+)
+
+
+def _metadata(rng: random.Random) -> dict[str, Any]:
+    metadata: dict[str, Any] = {"source": "seed"}
+    roll = rng.random()
+    if roll < 0.15:
+        metadata["status"] = "fading"
+    elif roll < 0.2:
+        metadata["status"] = "legacy"
+    return metadata
+
+
+def _seed_rows(seed: int = 20261019) -> tuple[list[tuple], list[tuple]]:
+    rng = random.Random(seed)
+    facts = [
+        (
+            uuid.UUID(int=rng.getrandbits(128), version=4),
+            f"subject-{n}",
+            f"predicate-{n}",
+            f"content-{n}",
+            rng.choice((1.0, 0.9, 0.5, 0.3, 0.1)),
+            rng.choice((0.0, 0.002, 0.008, 0.1, 0.5, 2.0)),
+            _NOW - timedelta(days=rng.uniform(0, 400)),
+            rng.choice(_CLASSES),
+            rng.choice(("active", "active", "fading", "expired", "superseded")),
+            _metadata(rng),
+        )
+        for n in range(_FACTS)
+    ]
+    rules = []
+    for n in range(_RULES):
+        metadata = _metadata(rng)
+        if rng.random() < 0.05:
+            metadata["forgotten"] = True
+        rules.append(
+            (
+                uuid.UUID(int=rng.getrandbits(128), version=4),
+                f"rule-{n}",
+                rng.choice(("candidate", "established", "anti_pattern")),
+                rng.choice((0.9, 0.5, 0.3)),
+                rng.choice((0.0, 0.01, 0.5, 2.0)),
+                _NOW - timedelta(days=rng.uniform(0, 400)),
+                rng.choice(("rule", "not_a_policy_class")),
+                metadata,
+            )
+        )
+    return facts, rules
+
+
+async def _seeded_pool(postgres_container, facts: list[tuple], rules: list[tuple]):
+    db_url = await asyncio.to_thread(
+        create_migrated_test_db, postgres_container, migration_db_name(), ["core", "memory"]
+    )
+    pool = await asyncpg.create_pool(dsn=db_url, min_size=1, max_size=2, init=register_jsonb_codec)
+    await pool.executemany(
+        "INSERT INTO facts (id, subject, predicate, content, confidence, decay_rate, "
+        "last_confirmed_at, retention_class, validity, metadata) "
+        "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)",
+        facts,
+    )
+    await pool.executemany(
+        "INSERT INTO rules (id, content, maturity, confidence, decay_rate, "
+        "last_confirmed_at, retention_class, metadata) "
+        "VALUES ($1, $2, $3, $4, $5, $6, $7, $8)",
+        rules,
+    )
+    return pool
+
+
+async def _snapshot(pool: asyncpg.Pool) -> tuple[list, list]:
+    facts = await pool.fetch("SELECT id, validity, metadata FROM facts ORDER BY id")
+    rules = await pool.fetch("SELECT id, metadata FROM rules ORDER BY id")
+    return [tuple(r) for r in facts], [tuple(r) for r in rules]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.skipif(not docker_available, reason="Docker not available")
+@pytest.mark.integration
+async def test_set_based_sweep_matches_rowwise_sweep(postgres_container) -> None:
+    facts, rules = _seed_rows()
+    reference = await _seeded_pool(postgres_container, facts, rules)
+    candidate = await _seeded_pool(postgres_container, facts, rules)
+    try:
+        expected_stats = await rowwise_decay_sweep(reference, now=_NOW)
+        stats = await run_decay_sweep(candidate, chunk_size=_CHUNK, now=_NOW)
+
+        assert {k: stats[k] for k in expected_stats} == expected_stats
+        assert expected_stats["facts_expired"] > 0 and expected_stats["facts_fading"] > 0
+        assert stats["facts_archived"] > 0
+        assert stats["decayed"] + stats["archived"] + stats["untouched"] == (
+            stats["facts_checked"] + stats["rules_checked"]
+        )
+        assert await _snapshot(candidate) == await _snapshot(reference)
+
+        # A second pass finds every row already in its target state.
+        again = await run_decay_sweep(candidate, chunk_size=_CHUNK, now=_NOW)
+        assert (again["decayed"], again["archived"]) == (0, 0)
+    finally:
+        await reference.close()
+        await candidate.close()
+
+
+@pytest.mark.unit
+async def test_run_decay_sweep_rejects_non_positive_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        await run_decay_sweep(object(), chunk_size=0)  # type: ignore[arg-type]
@@ -672,11 +672,14 @@ class TestReminderDismiss:
         pool = _make_pool(fetchrow_result=row)
         mcp, mod = await _make_module(pool=pool)
 
-        result = await mcp.tools["reminder_dismiss"](event_id=str(_EVENT_ID))
+        with patch("butlers.modules.calendar.invalidate_scheduler_wheel") as invalidate:
+            result = await mcp.tools["reminder_dismiss"](event_id=str(_EVENT_ID))
 
         assert result["status"] == "dismissed"
         assert result["recurrence"] == "one_time"
         pool.execute.assert_called_once()
+        # The scheduler wheel reloads calendar ends instead of waiting for a resync.
+        invalidate.assert_called_once_with(pool, "calendar_end")
 
     async def test_already_cancelled_one_time_is_noop(self):
         row = _dismiss_event_row(recurrence_rule=None, status="cancelled")
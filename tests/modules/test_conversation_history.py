@@ -6,7 +6,7 @@ Covers:
 - HistoryConfig dataclass defaults
 - HISTORY_STRATEGY includes expected keys
 - _format_history_context: non-empty result
-- _load_conversation_history: dispatcher returns list
+- _load_conversation_history: dispatcher returns list; warm thread cache skips the DB
 
 [bu-7sd7a]
 """
@@ -95,3 +95,38 @@ class TestLoadConversationHistory:
             received_at=datetime.now(UTC),
         )
         assert isinstance(result, str)
+
+    async def test_realtime_history_served_from_warm_thread_cache(self, monkeypatch):
+        """A warm thread is answered from the in-process cache without a DB read."""
+        from datetime import UTC, datetime, timedelta
+
+        from butlers.core.thread_history_cache import ThreadHistoryCache
+        from butlers.modules import pipeline as pipeline_module
+
+        cache = ThreadHistoryCache()
+        monkeypatch.setattr(pipeline_module, "get_thread_history_cache", lambda: cache)
+        now = datetime(2026, 10, 19, 9, 0, tzinfo=UTC)
+        # Ingest records the message being routed; the thread has no older rows.
+        cache.record(
+            source_thread_identity="42:7",
+            source_channel="telegram_bot",
+            received_at=now,
+            raw_content="first message",
+            sender_id="user1",
+        )
+
+        pool = MagicMock()
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[])
+        pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        first = await _load_conversation_history(pool, "telegram_bot", "42:7", now)
+        assert conn.fetch.await_count == 1
+        assert first == ""
+
+        second = await _load_conversation_history(
+            pool, "telegram_bot", "42:8", now + timedelta(seconds=5)
+        )
+        assert conn.fetch.await_count == 1
+        assert "first message" in second
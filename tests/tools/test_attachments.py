@@ -1,12 +1,18 @@
 """Tests for the get_attachment shared tool."""
 
 import base64
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import pytest
 from moto.server import ThreadedMotoServer
+from PIL import Image
 
 from butlers.storage import BlobNotFoundError, S3BlobStore
+from butlers.tools import attachment_derivatives
+from butlers.tools.attachment_derivatives import IMAGE_MAX_EDGE_PX, IMAGE_VARIANT
 from butlers.tools.attachments import MAX_ATTACHMENT_SIZE_BYTES, get_attachment
 
 TEST_BUCKET = "test-butlers-blobs"
@@ -85,3 +91,105 @@ async def test_get_attachment_reports_blob_store_unavailable():
     """A degraded S3 startup should produce an actionable attachment error."""
     with pytest.raises(ValueError, match="Blob storage is not configured or currently unavailable"):
         await get_attachment(None, "s3://test-butlers-blobs/testbutler/2026/01/01/file.jpg")
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Thread pool standing in for the process pool; counts derivations."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def _noise_png(edge: int) -> bytes:
+    """Incompressible PNG, so its size scales with the pixel count."""
+    img = Image.frombytes("RGB", (edge, edge), os.urandom(edge * edge * 3))
+    out = io.BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
+
+
+async def test_large_image_is_served_as_cached_downscaled_jpeg(blob_store):
+    """An over-limit photo becomes servable; the variant is derived once per body."""
+    data = _noise_png(IMAGE_MAX_EDGE_PX + 232)
+    assert len(data) > MAX_ATTACHMENT_SIZE_BYTES
+    storage_ref = await blob_store.put(data, content_type="image/png", filename="photo.png")
+
+    with _CountingExecutor() as executor:
+        result = await get_attachment(blob_store, storage_ref, executor=executor)
+        again = await get_attachment(blob_store, storage_ref, executor=executor)
+
+    assert result["variant"] == IMAGE_VARIANT.slug
+    assert result["media_type"] == "image/jpeg"
+    assert result["original_media_type"] == "image/png"
+    derived = base64.b64decode(result["data_base64"])
+    assert len(derived) == result["size_bytes"] < len(data)
+    with Image.open(io.BytesIO(derived)) as img:
+        assert max(img.size) == IMAGE_MAX_EDGE_PX
+    assert again == result
+    assert executor.submitted == 1
+
+    # The derivative goes away with the body.
+    digest = blob_store.content_hash(storage_ref)
+    await blob_store.delete(storage_ref)
+    assert await blob_store.get_derivative(digest, IMAGE_VARIANT.slug) is None
+
+
+async def test_derivation_failure_serves_the_original(blob_store, monkeypatch):
+    """A failing decoder falls back to the original and caches nothing."""
+
+    def _boom(data, spec):
+        raise OSError("cannot identify image file")
+
+    monkeypatch.setattr(attachment_derivatives, "derive", _boom)
+    data = _noise_png(700)
+    storage_ref = await blob_store.put(data, content_type="image/png", filename="scan.png")
+
+    with _CountingExecutor() as executor:
+        result = await get_attachment(blob_store, storage_ref, executor=executor)
+
+    assert result["variant"] == "original"
+    assert base64.b64decode(result["data_base64"]) == data
+    digest = blob_store.content_hash(storage_ref)
+    assert await blob_store.get_derivative(digest, IMAGE_VARIANT.slug) is None
+
+
+async def test_small_image_never_probes_the_derivative_cache(blob_store, monkeypatch):
+    """Blobs below the derivation threshold skip the guaranteed-miss cache lookup."""
+    probes = []
+
+    async def _get_derivative(digest, slug):
+        probes.append((digest, slug))
+        return None
+
+    monkeypatch.setattr(blob_store, "get_derivative", _get_derivative)
+    data = _noise_png(16)
+    storage_ref = await blob_store.put(data, content_type="image/png", filename="icon.png")
+
+    with _CountingExecutor() as executor:
+        result = await get_attachment(blob_store, storage_ref, executor=executor)
+
+    assert result["variant"] == "original"
+    assert probes == []
+    assert executor.submitted == 0
+
+
+def test_derivation_executor_survives_until_the_last_holder_releases(monkeypatch):
+    """One butler shutting down must not cancel another butler's derivations."""
+    stopped = []
+    monkeypatch.setattr(attachment_derivatives, "_executor_holders", 0)
+    monkeypatch.setattr(
+        attachment_derivatives, "shutdown_derivation_executor", lambda: stopped.append(True)
+    )
+
+    attachment_derivatives.acquire_derivation_executor()
+    attachment_derivatives.acquire_derivation_executor()
+    attachment_derivatives.release_derivation_executor()
+    assert stopped == []
+
+    attachment_derivatives.release_derivation_executor()
+    assert stopped == [True]